@@ -1,45 +1,107 @@
+import asyncio
 import datetime
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from fastapi import FastAPI
-import numpy as np
-import random
 from dotenv import load_dotenv
 
-random.seed(0)
 load_dotenv()
 
 from model.demand.index import build_settlement_demand
+from model.services import client
 from model.services.renewable_ninja import get_pv_output
 from model.services.utilities import comparable_date
 from model.hydro.index import get_hydro
 
+# number of worker processes simulating the demand, 0 simulates it on a thread of the process
+API_CPU_WORKERS = int(os.getenv("API_CPU_WORKERS", min(os.cpu_count() or 1, 4)))
+
 app = FastAPI()
 
 
+@functools.cache
+def cpu_executor():
+    """Pool of the CPU bound stages, worker processes so that they do not hold the GIL of the event loop.
+
+    Falls back to threads where processes cannot be created, e.g. serverless runtimes without /dev/shm,
+    and runs on a single thread with API_CPU_WORKERS=0, e.g. to profile the handler in one process.
+    The workers are started by a fork server rather than forked from the handler, whose I/O threads may
+    hold locks, and do not inherit its HTTP session.
+    """
+    if API_CPU_WORKERS == 0:
+        return ThreadPoolExecutor(max_workers=1)
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    try:
+        return ProcessPoolExecutor(
+            max_workers=API_CPU_WORKERS,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+    except (OSError, NotImplementedError):
+        return ThreadPoolExecutor(max_workers=API_CPU_WORKERS)
+
+
 @app.get("/api/data")
-def run(
+async def run(
     lat: float,
     lon: float,
     households: int,
     num_days: int,
     start_date: str = datetime.datetime.now().strftime("%Y-%m-%d"),
+    seed: int = 0,
+    smooth_hydro: bool = False,
+    hydro_stations: int = 1,
+    demand_engine: str = "batch",
 ):
-    unit_hydro = get_hydro(lon, lat, start_date, num_days)
-    demand = build_settlement_demand(
-        num_households=households,
-        date_start=start_date,
-        num_days=num_days,
-        lat=lat,
-        lon=lon,
-    )
     # use last years pv output for our forecast
     pv_start_date = comparable_date(start_date)
     date_start_dt = datetime.datetime.strptime(start_date, "%Y-%m-%d")
     pv_end_date = comparable_date(
         (date_start_dt + datetime.timedelta(days=num_days - 1)).strftime("%Y-%m-%d")
     )
-    unit_pv = np.array(get_pv_output(pv_start_date, pv_end_date, lat, lon))
+
+    # the stages are independent: the pv output is pulled on the I/O threads while the demand pulls
+    # the cooling demand and is simulated in a worker process, and the hydro is looked up on the default
+    # executor of the loop, leaving the I/O threads to the downloads
+    loop = asyncio.get_running_loop()
+    unit_hydro, demand, unit_pv = await asyncio.gather(
+        loop.run_in_executor(
+            None,
+            functools.partial(
+                get_hydro,
+                lon,
+                lat,
+                start_date,
+                num_days,
+                smooth=smooth_hydro,
+                nearest_stations=hydro_stations,
+            ),
+        ),
+        loop.run_in_executor(
+            cpu_executor(),
+            functools.partial(
+                build_settlement_demand,
+                num_households=households,
+                date_start=start_date,
+                num_days=num_days,
+                lat=lat,
+                lon=lon,
+                engine=demand_engine,
+                random_seed=seed,
+                cache=True,
+            ),
+        ),
+        loop.run_in_executor(
+            client.executor, get_pv_output, pv_start_date, pv_end_date, lat, lon
+        ),
+    )
     return {
         "E_load": list(demand),
-        "E_PV": list(unit_pv),
-        "E_Hydro": list(unit_hydro),
+        "E_PV": unit_pv.tolist(),
+        "E_Hydro": unit_hydro.tolist(),
     }
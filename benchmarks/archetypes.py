@@ -0,0 +1,45 @@
+"""Benchmark of the household archetypes of build_settlement_demand.
+
+Times the construction of the settlement (Users, appliances and UseCase initialization) and the
+simulation of one day, with one User per household and with one User per archetype.
+
+Example usage:
+    python -m benchmarks.archetypes
+"""
+import time
+
+import numpy as np
+
+from model.demand.index import build_households, sample_appliances
+from model.demand.ramp_slim import UseCase
+
+
+def benchmark(num_households, archetypes, random_seed=0):
+    appliances = sample_appliances(num_households, np.random.default_rng(random_seed))
+    start = time.perf_counter()
+    households = build_households(appliances, 1, archetypes=archetypes)
+    settlement = UseCase(
+        users=households, date_start="2024-01-01", random_seed=random_seed
+    )
+    settlement.initialize(num_days=1)
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    settlement.generate_daily_load_profiles()
+    simulation = time.perf_counter() - start
+    return len(households), setup, simulation
+
+
+if __name__ == "__main__":
+    results = []
+    for num_households in (100, 1_000, 10_000):
+        for archetypes in (False, True):
+            results.append(
+                (num_households, archetypes, *benchmark(num_households, archetypes))
+            )
+    print(
+        f"{'households':>10}{'archetypes':>12}{'users':>8}{'setup (s)':>12}{'simulation (s)':>16}"
+    )
+    for num_households, archetypes, users, setup, simulation in results:
+        print(
+            f"{num_households:>10}{str(archetypes):>12}{users:>8}{setup:>12.3f}{simulation:>16.3f}"
+        )
@@ -0,0 +1,77 @@
+"""Offline stand-in for the renewables.ninja API used by the benchmarks.
+
+The responses follow the JSON layout of the real `pv` and `demand` endpoints (hourly records with a
+`local_time` for PV, daily records keyed by date for demand) with deterministic synthetic values, so
+that the parsing code of model.services.renewable_ninja is exercised without a token or network.
+The data is synthetic rather than recorded, see benchmarks/README.md for benchmarking with recorded
+responses.
+
+Example usage:
+    from unittest import mock
+    from benchmarks.fixtures import fake_get
+
+    with mock.patch("model.services.client.session.get", fake_get):
+        ...
+"""
+from datetime import datetime, timedelta
+import math
+
+# Myanmar Standard Time, used to build the local_time of the records
+LOCAL_OFFSET = timedelta(hours=6, minutes=30)
+EPOCH = datetime(1970, 1, 1)
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return {"data": self._data, "metadata": {"synthetic": True}}
+
+    def raise_for_status(self):
+        pass
+
+
+def pv_records(date_from, date_to):
+    """Hourly unit PV output between two dates (included), keyed by UTC timestamp in milliseconds"""
+    records = {}
+    current = datetime.strptime(date_from, "%Y-%m-%d")
+    end = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+    while current < end:
+        local = current + LOCAL_OFFSET
+        hour = local.hour + local.minute / 60
+        electricity = max(0.0, math.sin(math.pi * (hour - 6) / 12)) * 0.8
+        timestamp = int((current - EPOCH).total_seconds() * 1000)
+        records[str(timestamp)] = {
+            "local_time": local.strftime("%Y-%m-%d %H:%M"),
+            "electricity": round(electricity, 3),
+        }
+        current += timedelta(hours=1)
+    return records
+
+
+def demand_records(date_from, date_to):
+    """Daily heating and cooling demand between two dates (included), keyed by date"""
+    records = {}
+    current = datetime.strptime(date_from, "%Y-%m-%d")
+    end = datetime.strptime(date_to, "%Y-%m-%d")
+    while current <= end:
+        day_of_year = current.timetuple().tm_yday
+        cooling = 0.6 + 0.5 * math.sin(2 * math.pi * (day_of_year - 80) / 365)
+        records[current.strftime("%Y-%m-%d")] = {
+            "total_demand": round(cooling, 3),
+            "heating_demand": 0.0,
+            "cooling_demand": round(cooling, 3),
+        }
+        current += timedelta(days=1)
+    return records
+
+
+def fake_get(url, params=None, headers=None, **kwargs):
+    """Drop-in replacement of the session get of model.services.client for the renewables.ninja endpoints"""
+    if url.endswith("/pv"):
+        return FakeResponse(pv_records(params["date_from"], params["date_to"]))
+    if url.endswith("/demand"):
+        return FakeResponse(demand_records(params["date_from"], params["date_to"]))
+    raise ValueError(f"No fixture for {url}")
@@ -0,0 +1,86 @@
+"""Micro-benchmark of the switch-on sampling of ramp_slim.Appliance.
+
+Compares the FreeSpots interval structure with the previous implementation, which listed every
+candidate switch-on minute of the free spots for each switch-on event.
+
+Example usage:
+    python -m benchmarks.free_spots
+"""
+import random
+import time
+
+from model.demand.ramp_slim import FreeSpots
+
+
+def legacy_switch_on_events(windows, func_cycle, duration):
+    """Place switch-on events until no free spot is left, listing every candidate minute at each event"""
+    free_spots = [slice(w[0], w[1], None) for w in windows if w[0] != w[1]]
+    events = []
+    while True:
+        indexes_choice = []
+        for s in free_spots:
+            if s.stop - s.start >= func_cycle:
+                indexes_choice += [*range(s.start, s.stop - func_cycle + 1)]
+        n_choices = len(indexes_choice)
+        if n_choices == 0:
+            return events
+        switch_on = indexes_choice[random.randint(0, n_choices - 1)]
+        spot_idx = None
+        for i, fs in enumerate(free_spots):
+            if fs.start <= switch_on <= fs.stop - func_cycle:
+                spot_idx = i
+                break
+        first = switch_on
+        last = min(switch_on + duration, free_spots[spot_idx].stop) - 1
+        events.append((first, last))
+
+        spot_to_split = free_spots.pop(spot_idx)
+        if first == spot_to_split.start:
+            free_spots.insert(spot_idx, slice(last + 1, spot_to_split.stop, None))
+        else:
+            free_spots.insert(spot_idx, slice(last + 1, spot_to_split.stop, None))
+            free_spots.insert(spot_idx, slice(spot_to_split.start, first, None))
+
+
+def free_spots_switch_on_events(windows, func_cycle, duration):
+    """Place switch-on events until no free spot is left, sampling them from a FreeSpots instance"""
+    free_spots = FreeSpots(windows, func_cycle=func_cycle)
+    events = []
+    while True:
+        n_choices = free_spots.n_choices
+        if n_choices == 0:
+            return events
+        switch_on, spot_stop = free_spots.switch_on(random.randint(0, n_choices - 1))
+        first = switch_on
+        last = min(switch_on + duration, spot_stop) - 1
+        events.append((first, last))
+        free_spots.remove(first, last)
+
+
+def benchmark(func, windows, func_cycle, duration, repeat):
+    random.seed(0)
+    start = time.perf_counter()
+    events = [func(windows, func_cycle, duration) for _ in range(repeat)]
+    return time.perf_counter() - start, events
+
+
+if __name__ == "__main__":
+    cases = {
+        "lighting": ([[300, 420], [1080, 1320]], 30, 45),
+        "refrigerator": ([[0, 1440]], 60, 60),
+        "short cycles": ([[0, 720], [900, 1440]], 5, 10),
+    }
+    repeat = 200
+    print(f"{'case':<15}{'legacy (ms)':>14}{'free spots (ms)':>18}{'speedup':>10}")
+    for name, (windows, func_cycle, duration) in cases.items():
+        legacy_time, legacy_events = benchmark(
+            legacy_switch_on_events, windows, func_cycle, duration, repeat
+        )
+        new_time, new_events = benchmark(
+            free_spots_switch_on_events, windows, func_cycle, duration, repeat
+        )
+        # both implementations consume the random stream identically
+        assert legacy_events == new_events, f"switch-on events differ for {name}"
+        print(
+            f"{name:<15}{legacy_time * 1000 / repeat:>14.3f}{new_time * 1000 / repeat:>18.3f}{legacy_time / new_time:>10.1f}"
+        )
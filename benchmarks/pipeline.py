@@ -0,0 +1,198 @@
+"""Benchmark suite of the demand, hydro and PV pipeline.
+
+Times build_settlement_demand, UseCase.generate_daily_load_profiles, get_hydro and the full
+/api/data handler over a grid of households and days, and measures their peak memory with
+tracemalloc in a second run. The renewables.ninja calls are served offline by benchmarks.fixtures
+and the demand and response caches are emptied before each run, so results only depend on the code.
+The handler simulates the demand on a thread (API_CPU_WORKERS=0) instead of its process pool, so
+its timings do not include the overhead of the worker processes.
+Set RENEWABLES_NINJA_MODE=replay to serve recorded responses instead (see model/services/replay.py),
+RENEWABLES_NINJA_REPLAY_LATENCY then adds the round-trip of the API to the measurements.
+
+Results are written as JSON so that two commits can be compared:
+    python -m benchmarks.pipeline --output before.json
+    git checkout <other commit>
+    python -m benchmarks.pipeline --output after.json --compare before.json
+
+Example usage:
+    python -m benchmarks.pipeline --households 10 100 1000 --days 1 30 365
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from unittest import mock
+
+# the caches are read at import, keep them out of the measurements
+os.environ["DEMAND_CACHE_DIR"] = tempfile.mkdtemp(prefix="benchmark-demand-cache-")
+os.environ["RENEWABLES_NINJA_CACHE_DIR"] = tempfile.mkdtemp(
+    prefix="benchmark-renewables-ninja-cache-"
+)
+# simulate the demand of the handler on a thread rather than a worker process, so that tracemalloc
+# sees its allocations and the patched session serves its requests whatever the start method
+os.environ["API_CPU_WORKERS"] = "0"
+
+import numpy as np
+
+from benchmarks.fixtures import fake_get
+from model.demand.cache import evict
+from model.services import cache as response_cache
+from model.demand.index import build_households, build_settlement_demand
+from model.demand.index import sample_appliances
+from model.demand.ramp_slim import UseCase
+from model.hydro.index import get_hydro
+
+# Sagaing region, river flow data covers comparable dates from 2020 to 2023
+LAT = 21.98
+LON = 96.1
+START_DATE = "2023-06-01"
+
+
+def bench_settlement_demand(households, days):
+    response_cache.evict(max_bytes=0)
+    build_settlement_demand(
+        num_households=households,
+        date_start=START_DATE,
+        num_days=days,
+        lat=LAT,
+        lon=LON,
+        random_seed=0,
+    )
+
+
+def bench_usecase(households, days):
+    appliances = sample_appliances(households, np.random.default_rng(0))
+    settlement = UseCase(
+        users=build_households(appliances, 1), date_start=START_DATE, random_seed=0
+    )
+    settlement.initialize(num_days=days)
+    settlement.generate_daily_load_profiles(resolution=60)
+
+
+def bench_hydro(households, days):
+    get_hydro(LON, LAT, START_DATE, days)
+
+
+def bench_api(households, days):
+    from api.index import run
+
+    # the handler caches the demand and the responses, start each run from empty caches
+    evict(max_bytes=0)
+    response_cache.evict(max_bytes=0)
+    asyncio.run(
+        run(
+            lat=LAT,
+            lon=LON,
+            households=households,
+            num_days=days,
+            start_date=START_DATE,
+        )
+    )
+
+
+BENCHMARKS = {
+    "build_settlement_demand": bench_settlement_demand,
+    "usecase": bench_usecase,
+    "get_hydro": bench_hydro,
+    "api": bench_api,
+}
+
+
+def measure(func, households, days):
+    """Time a benchmark, then run it again under tracemalloc to measure its peak memory"""
+    start = time.perf_counter()
+    func(households, days)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    func(households, days)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak_memory
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print the ratio of the timings to the ones of a previous run"""
+    with open(baseline_path) as f:
+        baseline = {
+            (r["benchmark"], r["households"], r["days"]): r
+            for r in json.load(f)["results"]
+        }
+    print(f"\ncompared to {baseline_path}")
+    for r in results:
+        previous = baseline.get((r["benchmark"], r["households"], r["days"]))
+        if previous is not None:
+            print(
+                f"{r['benchmark']:<25}{r['households']:>8}{r['days']:>6}"
+                f"{r['seconds'] / previous['seconds']:>10.2f}x time"
+                f"{r['peak_memory_bytes'] / max(previous['peak_memory_bytes'], 1):>10.2f}x memory"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    parser.add_argument("--households", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--days", nargs="+", type=int, default=[1, 30])
+    parser.add_argument("--output", help="path of the JSON results")
+    parser.add_argument("--compare", help="path of previous JSON results")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'benchmark':<25}{'households':>11}{'days':>6}{'time (s)':>10}{'peak (MiB)':>12}")
+    with mock.patch("model.services.client.session.get", fake_get):
+        for name in args.benchmarks:
+            for households in args.households:
+                for days in args.days:
+                    seconds, peak_memory = measure(BENCHMARKS[name], households, days)
+                    results.append(
+                        {
+                            "benchmark": name,
+                            "households": households,
+                            "days": days,
+                            "seconds": seconds,
+                            "peak_memory_bytes": peak_memory,
+                        }
+                    )
+                    print(
+                        f"{name:<25}{households:>11}{days:>6}{seconds:>10.3f}{peak_memory / 2**20:>12.2f}"
+                    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "commit": git_commit(),
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Content-addressed on-disk cache of generated settlement demand.
+
+Each demand series is stored as a .npy file named after the hash of everything it depends on, so a
+request with the same inputs is served by reading a single file. The cache is bounded in size: the
+least recently used files are evicted first, reading a file refreshes its modification time.
+
+Notes:
+-   The cache directory and its maximum size can be set with the DEMAND_CACHE_DIR and
+    DEMAND_CACHE_MAX_BYTES environment variables.
+-   Bump DEMAND_ENGINE_VERSION whenever a change to the demand model or to its inputs alters its
+    output, which invalidates every cached series.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from model.services.utilities import evict_least_recently_used, write_atomic
+
+DEMAND_ENGINE_VERSION = 2
+
+DEMAND_CACHE_DIR = os.getenv(
+    "DEMAND_CACHE_DIR", os.path.join(tempfile.gettempdir(), "microgrid-demand-cache")
+)
+DEMAND_CACHE_MAX_BYTES = int(os.getenv("DEMAND_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+def demand_cache_key(**inputs):
+    """Hashes the inputs of a demand simulation.
+
+    Args:
+        **inputs: JSON serializable inputs, numpy values are converted to lists
+
+    Returns:
+        str: hexadecimal digest identifying the inputs
+    """
+    inputs["engine_version"] = DEMAND_ENGINE_VERSION
+    serialized = json.dumps(
+        inputs,
+        sort_keys=True,
+        default=lambda value: np.asarray(value).tolist(),
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def load_demand(key, cache_dir=DEMAND_CACHE_DIR):
+    """Reads a cached demand series.
+
+    Args:
+        key (str): cache key, see demand_cache_key
+        cache_dir (str): directory of the cache
+
+    Returns:
+        np.array: the demand, or None if it is not cached
+    """
+    path = os.path.join(cache_dir, f"{key}.npy")
+    try:
+        demand = np.load(path)
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+    # mark the file as recently used for the eviction
+    os.utime(path)
+    return demand
+
+
+def save_demand(
+    key, demand, cache_dir=DEMAND_CACHE_DIR, max_bytes=DEMAND_CACHE_MAX_BYTES
+):
+    """Writes a demand series to the cache and evicts the least recently used ones above max_bytes.
+
+    Args:
+        key (str): cache key, see demand_cache_key
+        demand (np.array): demand series
+        cache_dir (str): directory of the cache
+        max_bytes (int): maximum size of the cache
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    write_atomic(os.path.join(cache_dir, f"{key}.npy"), lambda f: np.save(f, demand))
+    evict(cache_dir, max_bytes)
+
+
+def evict(cache_dir=DEMAND_CACHE_DIR, max_bytes=DEMAND_CACHE_MAX_BYTES):
+    """Removes the least recently used cached series until the cache fits in max_bytes.
+
+    Args:
+        cache_dir (str): directory of the cache
+        max_bytes (int): maximum size of the cache
+    """
+    evict_least_recently_used(cache_dir, max_bytes, ".npy")
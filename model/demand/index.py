@@ -44,11 +44,14 @@ Appliance notes:
 """
 
 from datetime import datetime, timedelta
+from collections import Counter
 import numpy as np
 from model.demand.ramp_slim import User, UseCase
-import random
+from model.demand.ramp_batch import BatchUseCase
 from model.services.utilities import comparable_date
 from model.demand.definitions import appliance_usage
+from model.demand.cache import demand_cache_key, load_demand, save_demand
+from model.services import renewable_ninja
 from model.services.renewable_ninja import get_heating_demand
 
 appliance_aliases = {
@@ -76,17 +79,160 @@ appliance_occurrences = {
 }
 
 
+def sample_appliances(num_households, rng):
+    """Samples the set of appliances owned by each household from their occurrences.
+
+    Args:
+        num_households (int): number of households of the settlement
+        rng (np.random.Generator): random number generator
+
+    Returns:
+        list: appliance names owned by each household
+    """
+    owned = rng.random((num_households, len(appliance_occurrences))) < np.array(
+        list(appliance_occurrences.values())
+    )
+    return [
+        [appliance for appliance, own in zip(appliance_occurrences, household) if own]
+        for household in owned
+    ]
+
+
+def build_households(appliances, seasonality, archetypes=True):
+    """Builds the Users of a settlement with their sampled appliances.
+
+    Args:
+        appliances (list): appliance names owned by each household
+        seasonality (float or np.array): scaling of the seasonal appliances' power,
+            either for a single day or one value per simulated day
+        archetypes (bool): group the households owning the same set of appliances into
+            a single User with num_users set to their count, instead of one User per household
+
+    Returns:
+        list: households
+    """
+    if archetypes:
+        groups = Counter(tuple(household) for household in appliances)
+        households = [
+            User(
+                user_name=f"archetype #{i}",
+                num_users=count,
+            )
+            for i, count in enumerate(groups.values())
+        ]
+        appliances = list(groups)
+    else:
+        households = [
+            User(
+                user_name=f"household #{i}",
+                num_users=1,
+            )
+            for i in range(len(appliances))
+        ]
+    for i, household in enumerate(households):
+        for appliance in appliances[i]:
+            seasonal = appliance_seasonality.get(appliance, False)
+            aliases = appliance_aliases.get(appliance, [appliance])
+            for alias in aliases:
+                definition = appliance_usage[alias]
+                if seasonal:
+                    definition = dict(definition)
+                    definition["power"] = definition["power"] * seasonality
+                household.add_appliance(name=appliance, **definition)
+    return households
+
+
 def build_settlement_demand(
-    num_households: int, date_start: str, num_days: int, lat: int, lon: int
+    num_households: int,
+    date_start: str,
+    num_days: int,
+    lat: int,
+    lon: int,
+    engine: str = "ramp",
+    multi_day: bool = True,
+    random_seed: int = None,
+    archetypes: bool = True,
+    cache: bool = False,
 ):
-    appliances = [
-        [
-            appliance
-            for appliance, occurrence in appliance_occurrences.items()
-            if random.random() < occurrence
-        ]
-        for _ in range(num_households)
-    ]
+    """Generates the hourly electricity demand of a settlement in kW.
+
+    Args:
+        num_households (int): number of households of the settlement
+        date_start (str): start date in YYYY-MM-DD format
+        num_days (int): number of simulated days
+        lat (float): latitude
+        lon (float): longitude
+        engine (str): "ramp" to simulate with the per-object UseCase (reference) or
+            "batch" to simulate all households and days at once with BatchUseCase
+        multi_day (bool): with the "ramp" engine, build the settlement once and simulate
+            all days with a single UseCase instead of one UseCase per day
+        random_seed (int): seed of the random streams of the household sampling and of
+            the simulation, the same seed reproduces the same demand
+        archetypes (bool): with the "ramp" engine, simulate one User per distinct set of
+            appliances (archetype) with num_users set to its number of households
+        cache (bool): read and store the demand in the on-disk demand cache, only
+            used when a random_seed is given as the demand is otherwise not reproducible
+
+    Returns:
+        np.array: hourly demand
+    """
+    inputs = dict(
+        num_households=num_households,
+        date_start=date_start,
+        num_days=num_days,
+        lat=lat,
+        lon=lon,
+        engine=engine,
+        multi_day=multi_day,
+        random_seed=random_seed,
+        archetypes=archetypes,
+    )
+    if not cache or random_seed is None:
+        return simulate_settlement_demand(**inputs)
+
+    key = demand_cache_key(
+        appliance_usage=appliance_usage,
+        appliance_aliases=appliance_aliases,
+        appliance_seasonality=appliance_seasonality,
+        appliance_occurrences=appliance_occurrences,
+        # the cooling demand driving the seasonality depends on where the weather data comes from
+        cooling_snap_to_grid=renewable_ninja.SNAP_TO_GRID,
+        cooling_replayed=renewable_ninja.replay.RENEWABLES_NINJA_MODE == "replay",
+        **inputs,
+    )
+    demand = load_demand(key)
+    if demand is None:
+        demand = simulate_settlement_demand(**inputs)
+        save_demand(key, demand)
+    return demand
+
+
+def simulate_settlement_demand(
+    num_households: int,
+    date_start: str,
+    num_days: int,
+    lat: int,
+    lon: int,
+    engine: str = "ramp",
+    multi_day: bool = True,
+    random_seed: int = None,
+    archetypes: bool = True,
+):
+    """Simulates the hourly electricity demand of a settlement in kW without caching.
+
+    Args:
+        see build_settlement_demand
+
+    Returns:
+        np.array: hourly demand
+    """
+    if engine not in ("ramp", "batch"):
+        raise ValueError(f"Unknown demand engine '{engine}', expected 'ramp' or 'batch'")
+    # independent random streams for the household sampling and for each simulation
+    household_seed, simulation_seed = np.random.SeedSequence(random_seed).spawn(2)
+    appliances = sample_appliances(
+        num_households, np.random.default_rng(household_seed)
+    )
     daily = []
     date_start_dt = datetime.strptime(date_start, "%Y-%m-%d")
     dates = [
@@ -97,31 +243,49 @@ def build_settlement_demand(
     start_comparable_date = comparable_date(date_start)
     end_comparable_date = comparable_date(dates[-1])
     cooling = get_heating_demand(start_comparable_date, end_comparable_date, lat, lon)
+    if len(cooling["time"]) != num_days:
+        raise ValueError(
+            f"Expected {num_days} days of cooling demand from {start_comparable_date}, got {len(cooling['time'])}"
+        )
+    # daily scaling of the seasonal appliances' power
+    seasonality = np.minimum(cooling["cooling_demand"], 1)
 
-    for date in dates:
-        households = [
-            User(
-                user_name=f"household #{i}",
-                num_users=1,
-            )
-            for i in range(num_households)
-        ]
-        comparable = comparable_date(date)
-        cooling_demand = cooling[comparable]["cooling_demand"]
-
-        for i, household in enumerate(households):
-            for appliance in appliances[i]:
-                seasonal = appliance_seasonality.get(appliance, False)
-                aliases = appliance_aliases.get(appliance, [appliance])
-                for alias in aliases:
-                    definition = appliance_usage[alias]
-                    if seasonal:
-                        definition = dict(definition)
-                        definition["power"] *= min(cooling_demand, 1)
-                    household.add_appliance(name=appliance, **definition)
-
-        settlement = UseCase(users=households, date_start=date)
+    if engine == "batch":
+        specification = []
+        for appliance in appliance_occurrences:
+            owners = sum(appliance in household for household in appliances)
+            if owners == 0:
+                continue
+            for alias in appliance_aliases.get(appliance, [appliance]):
+                definition = dict(appliance_usage[alias], name=alias, num_users=owners)
+                if appliance_seasonality.get(appliance, False):
+                    definition["power"] = definition["power"] * seasonality
+                specification.append(definition)
+        settlement = BatchUseCase(
+            appliances=specification,
+            date_start=date_start,
+            num_days=num_days,
+            random_seed=simulation_seed,
+        )
+        demand = settlement.generate_daily_load_profiles(resolution=60)
+        return demand / 1000
+
+    if multi_day:
+        settlement = UseCase(
+            users=build_households(appliances, seasonality, archetypes),
+            date_start=date_start,
+            random_seed=simulation_seed,
+        )
+        settlement.initialize(num_days=num_days)
+        demand = settlement.generate_daily_load_profiles(resolution=60)
+        return demand / 1000
+
+    day_seeds = simulation_seed.spawn(num_days)
+    for day_idx, date in enumerate(dates):
+        households = build_households(appliances, seasonality[day_idx], archetypes)
+        settlement = UseCase(
+            users=households, date_start=date, random_seed=day_seeds[day_idx]
+        )
         settlement.initialize(num_days=1)
-        demand = settlement.generate_daily_load_profiles()
-        daily.append(demand.reshape(24, 60).sum(axis=1) / 60)
+        daily.append(settlement.generate_daily_load_profiles(resolution=60))
     return np.concatenate(daily) / 1000
@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized counterpart of the UseCase, User and Appliance classes of ramp_slim.
+Instead of simulating one appliance of one user for one day at a time, a BatchUseCase takes a table
+of appliance specifications and simulates every (user, day) instance of an appliance at once as
+2-D NumPy arrays of shape (instances, 1440).
+The per-object engine in ramp_slim remains the reference implementation, this engine reproduces its
+statistics (windows, random total time of use, switch-on events and coincidence) but not its exact
+random draws.
+"""
+import numpy as np
+import datetime
+
+from typing import List, Union
+
+from model.demand.ramp_slim import (
+    check_resolution,
+    generate_date_range,
+    get_day_type,
+    switch_on_parameters,
+)
+
+# default values of the appliance specification, same as the defaults of ramp_slim.Appliance
+APPLIANCE_DEFAULTS = {
+    "name": "",
+    "number": 1,
+    "power": 0,
+    "num_windows": 1,
+    "func_time": 0,
+    "time_fraction_random_variability": 0,
+    "func_cycle": 1,
+    "fixed": "no",
+    "fixed_cycle": 0,
+    "continuous_duty_cycle": 1,
+    "occasional_use": 1,
+    "flat": "no",
+    "thermal_p_var": 0,
+    "pref_index": 0,
+    "wd_we_type": 2,
+    "window_1": None,
+    "window_2": None,
+    "window_3": None,
+    "random_var_w": 0,
+    "num_users": 1,
+}
+
+
+def parse_appliance_specification(spec: dict) -> dict:
+    """Fill an appliance specification with the default values and check it can be simulated in batch
+
+    Parameters
+    ----------
+    spec: dict
+        appliance definition with the keywords of ramp_slim.User.add_appliance (as found in
+        model.demand.definitions.appliance_usage) and an extra 'num_users' keyword giving the
+        number of users owning the appliance
+
+    Returns
+    -------
+    dict
+        the completed specification, with windows as numpy arrays
+    """
+    unknown = set(spec) - set(APPLIANCE_DEFAULTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown appliance parameters for the batch engine: {sorted(unknown)}"
+        )
+    app = dict(APPLIANCE_DEFAULTS)
+    app.update(spec)
+
+    if app["fixed_cycle"] != 0 or app["pref_index"] != 0:
+        raise ValueError(
+            f"The appliance '{app['name']}' uses duty cycles or user preferences, which are not supported by the batch engine. Please use ramp_slim.UseCase instead"
+        )
+
+    if app["window_1"] is None:
+        app["window_1"] = [0, 1440]
+    for i in (2, 3):
+        if app[f"window_{i}"] is None:
+            if app["num_windows"] >= i:
+                raise ValueError(
+                    f"Windows {i} is not provided although {app['num_windows']} windows were declared"
+                )
+            app[f"window_{i}"] = [0, 0]
+
+    windows = np.array([app[f"window_{i}"] for i in (1, 2, 3)], dtype=int)
+    window_time = np.diff(windows[: app["num_windows"]], axis=1).sum()
+    if window_time < app["func_time"]:
+        raise ValueError(
+            f"The sum of all windows time intervals for the appliance '{app['name']}' is smaller than the time the appliance is supposed to be on ({window_time} < {app['func_time']}). Please check your input file for typos."
+        )
+    app["windows"] = windows
+    # maximum range of time each window can be enlarged or shortened, see ramp_slim.Appliance.windows
+    app["random_var"] = (app["random_var_w"] * np.diff(windows, axis=1)[:, 0]).astype(
+        int
+    )
+    return app
+
+
+def merge_windows(rand_windows: np.array):
+    """Merge the randomised windows of use of each instance into disjoint intervals sorted by time
+
+    Parameters
+    ----------
+    rand_windows: np.array
+        randomised windows of shape (instances, 3, 2), a window whose start is not before its end is empty
+
+    Returns
+    -------
+    tuple of np.array
+        starts and ends of shape (instances, 3) of the merged intervals, followed by empty intervals
+    """
+    size = len(rand_windows)
+    rows = np.arange(size)
+    starts = rand_windows[:, :, 0].copy()
+    stops = rand_windows[:, :, 1].copy()
+    empty = starts >= stops
+    # empty windows are sorted after the others
+    starts[empty] = stops[empty] = 1440
+    order = np.argsort(starts, axis=1, kind="stable")
+    starts = np.take_along_axis(starts, order, axis=1)
+    stops = np.take_along_axis(stops, order, axis=1)
+
+    merged_start = np.zeros((size, 3), dtype=int)
+    merged_stop = np.zeros((size, 3), dtype=int)
+    count = np.zeros(size, dtype=int)
+    current_start, current_stop = starts[:, 0], stops[:, 0]
+    for w in (1, 2):
+        start, stop = starts[:, w], stops[:, w]
+        # overlapping or adjacent windows form a single run of minutes
+        overlap = start <= current_stop
+        separate = ~overlap & (start < stop)
+        merged_start[rows[separate], count[separate]] = current_start[separate]
+        merged_stop[rows[separate], count[separate]] = current_stop[separate]
+        count += separate
+        current_start = np.where(separate, start, current_start)
+        current_stop = np.where(
+            separate, stop, np.where(overlap, np.maximum(current_stop, stop), current_stop)
+        )
+    merged_start[rows, count] = current_start
+    merged_stop[rows, count] = current_stop
+    return merged_start, merged_stop
+
+
+def paint_intervals(size, rows, starts, stops, values):
+    """Build the load profiles of instances made of disjoint intervals of constant power
+
+    Parameters
+    ----------
+    size: int
+        number of instances
+    rows: np.array
+        instance of each interval
+    starts, stops: np.array
+        first minute and minute after the last one of each interval, intervals of an instance do not overlap
+    values: np.array
+        power of each interval
+
+    Returns
+    -------
+    np.array
+        load profiles of shape (instances, 1440), zero outside the intervals
+    """
+    non_empty = starts < stops
+    rows, starts, stops = rows[non_empty], starts[non_empty], stops[non_empty]
+    values = np.concatenate(([0], values[non_empty]))
+    # each minute gets the number of the interval covering it with a single cumulative sum, as intervals
+    # of an instance neither overlap nor share their starts or stops
+    number = np.arange(1, len(rows) + 1, dtype=np.int32)
+    interval_number = np.zeros((size, 1441), dtype=np.int32)
+    interval_number[rows, starts] = number
+    interval_number[rows, stops] -= number
+    interval_number = np.cumsum(interval_number[:, :1440], axis=1, dtype=np.int32)
+    return values[interval_number]
+
+
+class BatchUseCase:
+    def __init__(
+        self,
+        appliances: List[dict],
+        date_start: str = None,
+        num_days: int = 1,
+        peak_enlarge: float = 0.15,
+        random_seed: Union[int, np.random.SeedSequence] = None,
+        chunk_size: int = 4096,
+    ):
+        """Creates a BatchUseCase instance simulating a table of appliance specifications
+
+        Parameters
+        ----------
+        appliances: list of dict
+            appliance specifications, see parse_appliance_specification. The 'power' of an appliance can
+            either be a number or an array with one value per simulated day
+        date_start: str, optional
+            start date of the daily profiles generated by the BatchUseCase instance
+        num_days: int, optional
+            number of days for which to generate profiles, by default 1
+        peak_enlarge: float, optional
+            percentage random enlargement or reduction of peak time range length, see ramp_slim.UseCase.calc_peak_time_range
+        random_seed: Union[int, np.random.SeedSequence], optional
+            specify seed for the random number generator to exactly reproduce results
+        chunk_size: int, optional
+            maximum number of (user, day) instances simulated together, bounds the memory usage
+        """
+        self.appliances = [parse_appliance_specification(app) for app in appliances]
+        self.date_start = (
+            datetime.datetime.fromisoformat(date_start)
+            if isinstance(date_start, str)
+            else date_start
+        )
+        self.num_days = num_days
+        self.peak_enlarge = peak_enlarge
+        self.chunk_size = chunk_size
+        self.rng = np.random.default_rng(random_seed)
+
+        if self.date_start is not None:
+            self.days = generate_date_range(
+                start_date=self.date_start, num_days=self.num_days
+            )
+        else:
+            self.days = generate_date_range(num_days=self.num_days)
+        self.day_types = np.array([get_day_type(day) for day in self.days])
+
+        for app in self.appliances:
+            power = np.asarray(app["power"], dtype=float)
+            if power.ndim == 0:
+                power = np.full(self.num_days, float(power))
+            elif len(power) < self.num_days:
+                raise ValueError(
+                    f"Wrong number of values for appliance '{app['name']}''s power: {len(power)}. Number of values should at least match the total number of days: {self.num_days}. Alternatively the power of the appliance can be set to a constant value."
+                )
+            app["power"] = power[: self.num_days]
+
+        self.peak_time_range = self.calc_peak_time_range()
+
+    @property
+    def maximum_profile(self) -> np.array:
+        """Aggregate the theoretical maximal profiles of all appliances, see ramp_slim.User.maximum_profile"""
+        tot_max_profile = np.zeros(1440)
+        for app in self.appliances:
+            window_mask = np.zeros(1440)
+            for window in app["windows"]:
+                window_mask[window[0] : window[1]] = 0.001
+            tot_max_profile += (
+                window_mask * np.mean(app["power"]) * app["number"] * app["num_users"]
+            )
+        return tot_max_profile
+
+    def calc_peak_time_range(self):
+        """Calculate the peak time range, see ramp_slim.UseCase.calc_peak_time_range"""
+        tot_max_profile = self.maximum_profile
+        peak_window = np.squeeze(
+            np.argwhere(tot_max_profile == np.amax(tot_max_profile))
+        )
+        peak_time = round(
+            self.rng.normal(
+                loc=round(np.average(peak_window)),
+                scale=1 / 3 * (peak_window[-1] - peak_window[0]),
+            )
+        )
+        rand_peak_enlarge = max(
+            round(
+                abs(
+                    peak_time
+                    - self.rng.normal(
+                        loc=peak_time, scale=self.peak_enlarge * abs(peak_time)
+                    )
+                )
+            ),
+            1,
+        )
+        return np.arange(peak_time - rand_peak_enlarge, peak_time + rand_peak_enlarge)
+
+    def calc_coincident_switch_on(self, app, inside_peak_window):
+        """Vectorized ramp_slim.Appliance.calc_coincident_switch_on
+
+        Parameters
+        ----------
+        app: dict
+            parsed appliance specification
+        inside_peak_window: np.array of bool
+            whether each switch-on event falls within the peak time range
+
+        Returns
+        -------
+        np.array
+            number of the 'n' appliances switched on simultaneously for each switch-on event
+        """
+        s_peak, mu_peak, op_factor = switch_on_parameters()
+        number = app["number"]
+        size = len(inside_peak_window)
+        if app["fixed"] != "no":
+            return np.full(size, number)
+        # eq. 4 of [1] within the peak time range
+        peak = np.ceil(
+            self.rng.normal(
+                loc=number * mu_peak, scale=s_peak * number * mu_peak, size=size
+            )
+        )
+        peak = np.minimum(number, np.maximum(1, peak))
+        # eq. 3 of [1] off-peak
+        prob = self.rng.uniform(0, (number - op_factor) / number, size=size)
+        off_peak = np.minimum(np.floor(prob * number) + 1, number)
+        return np.where(inside_peak_window, peak, off_peak)
+
+    def rand_total_time_of_use(self, app, rand_windows):
+        """Vectorized ramp_slim.Appliance.rand_total_time_of_use
+
+        Parameters
+        ----------
+        app: dict
+            parsed appliance specification
+        rand_windows: np.array
+            randomised windows of shape (instances, 3, 2)
+
+        Returns
+        -------
+        np.array
+            randomised total time of use of each instance
+        """
+        size = len(rand_windows)
+        var = app["time_fraction_random_variability"]
+        func_time = app["func_time"]
+        random_var_t = self.rng.uniform(1 - var, 1 + var, size=size)
+        upper = (func_time * random_var_t).astype(int)
+        rand_time = np.round(
+            func_time + (upper - func_time) * self.rng.random(size)
+        ).astype(int)
+        rand_time = np.maximum(rand_time, app["func_cycle"])
+
+        total_time = np.diff(rand_windows, axis=2)[:, :, 0].sum(axis=1)
+        rand_time = np.where(
+            rand_time > 0.99 * total_time, (0.99 * total_time).astype(int), rand_time
+        )
+        if np.any(rand_time < app["func_cycle"]):
+            raise ValueError(
+                f"The func_cycle you choose for appliance {app['name']} might be too large to fit in the available time for appliance usage, please either reduce func_cycle or increase the windows of use of the appliance"
+            )
+        return rand_time
+
+    def generate_load_profiles(self, app, day_idx):
+        """Generate the load profiles of an appliance for a batch of (user, day) instances
+
+        Run steps 2a and 2b and repeat steps 2c - 2e of [1] for all instances at once, each repetition
+        places one switch-on event in every instance which has not yet reached its total time of use
+
+        [1] F. Lombardi, S. Balderrama, S. Quoilin, E. Colombo,
+            Generating high-resolution multi-energy load profiles for remote areas with an open-source stochastic model,
+            Energy, 2019, https://doi.org/10.1016/j.energy.2019.04.097.
+
+        Parameters
+        ----------
+        app: dict
+            parsed appliance specification
+        day_idx: np.array
+            index of the simulated day of each instance
+
+        Returns
+        -------
+        np.array
+            load profiles of shape (instances, 1440)
+        """
+        size = len(day_idx)
+        load = np.zeros((size, 1440))
+
+        # skip the instances for which the appliance is not used, see ramp_slim.Appliance.generate_load_profile
+        used = self.rng.random(size) <= app["occasional_use"]
+        if app["wd_we_type"] != 2:
+            used &= self.day_types[day_idx] == app["wd_we_type"]
+        if app["func_time"] == 0:
+            used[:] = False
+        used = np.flatnonzero(used)
+        if used.size == 0:
+            return load
+        day_idx = day_idx[used]
+        size = used.size
+
+        # recalculate windows start and ending times randomly, shape (instances, 3, 2)
+        low = app["windows"] - app["random_var"][:, None]
+        high = app["windows"] + app["random_var"][:, None] + 1
+        rand_windows = self.rng.integers(low, high, size=(size, 3, 2))
+        rand_windows[:, :, 0] = np.maximum(rand_windows[:, :, 0], 0)
+        rand_windows[:, :, 1] = np.minimum(rand_windows[:, :, 1], 1440)
+
+        # step 2a of [1]
+        rand_time = self.rand_total_time_of_use(app, rand_windows)
+
+        # step 2b of [1], free spots of each instance as intervals [spot_start, spot_stop) sorted by time,
+        # see ramp_slim.Appliance.free_spots. Every switch-on event splits the spot it falls in, which keeps
+        # the cost of a step independent of the 1440 minutes
+        spot_start, spot_stop = merge_windows(rand_windows)
+        power = app["power"][day_idx]
+        if app["flat"] == "yes":
+            load[used] = paint_intervals(
+                size,
+                np.repeat(np.arange(size), 3),
+                spot_start.ravel(),
+                spot_stop.ravel(),
+                np.repeat(power * app["number"], 3),
+            )
+            return load
+
+        # steps 2c-2e repeated until the sum of the durations of all the switch-on events equals rand_time
+        func_cycle = app["func_cycle"]
+        tot_time = np.zeros(size, dtype=int)
+        events = []
+        running = np.flatnonzero(rand_time != 0)
+        while running.size > 0:
+            # a switch-on is possible where func_cycle consecutive minutes are free
+            starts = spot_start[running]
+            stops = spot_stop[running]
+            n_spot_choices = np.maximum(stops - starts - func_cycle + 1, 0)
+            choices_cumsum = np.cumsum(n_spot_choices, axis=1)
+            n_choices = choices_cumsum[:, -1]
+            has_choice = n_choices > 0
+            running = running[has_choice]
+            if running.size == 0:
+                break
+            starts = starts[has_choice]
+            stops = stops[has_choice]
+            n_spot_choices = n_spot_choices[has_choice]
+            choices_cumsum = choices_cumsum[has_choice]
+            n_choices = n_choices[has_choice]
+            rows = np.arange(running.size)
+
+            # step 2c of [1], identifies a random switch on time within the available functioning windows
+            choice = (self.rng.random(running.size) * n_choices).astype(int)
+            spot = np.argmax(choices_cumsum > choice[:, None], axis=1)
+            switch_on = starts[rows, spot] + choice - (
+                choices_cumsum[rows, spot] - n_spot_choices[rows, spot]
+            )
+            # end of the free spot in which the switch-on event falls
+            stop = stops[rows, spot]
+
+            largest_duration = np.minimum(rand_time[running], stop - switch_on)
+            duration = np.where(
+                largest_duration > func_cycle,
+                (
+                    func_cycle
+                    + (largest_duration - func_cycle) * self.rng.random(running.size)
+                ).astype(int),
+                func_cycle,
+            )
+
+            # the total functioning time is reached, a correction is applied to avoid overflow of indexes
+            duration = np.minimum(duration, rand_time[running] - tot_time[running])
+            tot_time[running] += duration
+            switch_off = switch_on + duration
+
+            inside_peak_window = ~(
+                (switch_off - 1 < self.peak_time_range[0])
+                | (switch_on > self.peak_time_range[-1])
+            )
+            coincidence = self.calc_coincident_switch_on(app, inside_peak_window)
+            # step 2d and 2e of [1], randomises also the App Power if thermal_p_var is on
+            var = app["thermal_p_var"]
+            event_power = (
+                coincidence
+                * power[running]
+                * self.rng.uniform(1 - var, 1 + var, size=running.size)
+            )
+            events.append((running, switch_on, switch_off, event_power))
+
+            # the spot is split into the free time before and after the event, the later spots are shifted
+            # into a new column, which stays an empty spot for the other instances
+            spot_start = np.pad(spot_start, ((0, 0), (0, 1)))
+            spot_stop = np.pad(spot_stop, ((0, 0), (0, 1)))
+            columns = np.arange(spot_start.shape[1])
+            source = np.where(columns <= spot[:, None], columns, columns - 1)
+            new_start = spot_start[running[:, None], source]
+            new_stop = spot_stop[running[:, None], source]
+            new_stop[rows, spot] = switch_on
+            new_start[rows, spot + 1] = switch_off
+            spot_start[running] = new_start
+            spot_stop[running] = new_stop
+
+            running = running[tot_time[running] < rand_time[running]]
+
+        # the remaining free spots draw the standby power of the windows, the events overwrite it
+        rows, switch_on, switch_off, event_power = (
+            map(np.concatenate, zip(*events)) if events else [np.zeros(0, dtype=int)] * 4
+        )
+        load[used] = paint_intervals(
+            size,
+            np.concatenate((np.repeat(np.arange(size), spot_start.shape[1]), rows)),
+            np.concatenate((spot_start.ravel(), switch_on)),
+            np.concatenate((spot_stop.ravel(), switch_off)),
+            np.concatenate((np.full(spot_start.size, 0.001), event_power)),
+        )
+        return load
+
+    def generate_daily_load_profiles(self, flat=True, resolution=1):
+        """Generate the aggregated daily profiles of all appliances over all users and days
+
+        Parameters
+        ----------
+        flat: boolean, optional
+            flatten the daily profiles into a 1 dimensional array via reshaping
+        resolution: int {1, 5, 15, 60}, optional
+            duration of the time steps of the profiles in minutes, each chunk of instances is averaged
+            over these time steps before being aggregated, by default 1
+
+        Returns
+        -------
+        daily_profiles: numpy array
+            of shape (num_days, 1440 / resolution), or flattened if flat is True
+        """
+        check_resolution(resolution)
+        daily_profiles = np.zeros((self.num_days, 1440 // resolution))
+        for app in self.appliances:
+            num_instances = app["num_users"] * self.num_days
+            # instances are sorted by day so that the loads of a chunk can be summed per day
+            for start in range(0, num_instances, self.chunk_size):
+                stop = min(start + self.chunk_size, num_instances)
+                day_idx = np.arange(start, stop) // app["num_users"]
+                load = self.generate_load_profiles(app, day_idx)
+                load = load.reshape(len(load), -1, resolution).mean(axis=2)
+                days, first = np.unique(day_idx, return_index=True)
+                daily_profiles[days] += np.add.reduceat(load, first, axis=0)
+
+        if flat is True:
+            return daily_profiles.flatten()
+        return daily_profiles
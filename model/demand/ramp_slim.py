@@ -6,21 +6,85 @@ Within the Appliance class, some other functions are created to define windows o
 if needed, specific duty cycles
 """
 import numpy as np
-import random
 import math
 import datetime
+import os
+import bisect
+import itertools
 
 
 from typing import List, Union, Iterable
+from concurrent.futures import ProcessPoolExecutor
 
+# UseCase instance shared with the worker processes of UseCase.generate_daily_load_profiles_parallel
+_worker_usecase = None
 
-def single_appliance_daily_load_profile(args):
+
+def single_appliance_daily_load_profile(args, resolution=1):
     app, args = args
-    app.generate_load_profile(*args, power=app.power[args[0]])
+    app.generate_load_profile(*args, power=app.power[args[0]], resolution=resolution)
 
     return args[0], app.daily_use
 
 
+def init_parallel_worker(usecase):
+    """Store the UseCase instance in the worker process so that work units only carry indexes"""
+    global _worker_usecase
+    _worker_usecase = usecase
+
+
+def parallel_daily_load_profiles(args):
+    """Generate the load profiles of a chunk of work units within a worker process
+
+    Parameters
+    ----------
+    args: tuple
+        granularity ("user" or "appliance"), resolution of the profiles in minutes, list of (user index or tuple
+        of appliance indexes of a single user, day index) work units and the seed sequence of the random number
+        generator of each work unit
+
+    Returns
+    -------
+    dict
+        load profile of the chunk summed per day index
+    """
+    granularity, resolution, units, seeds = args
+    usecase = _worker_usecase
+    daily_loads = {}
+    for (idx, day_idx), seed in zip(units, seeds):
+        # each work unit has its own random stream, results do not depend on the scheduling of the units
+        usecase.rng = np.random.default_rng(seed)
+        day_type = get_day_type(usecase.days[day_idx])
+        if granularity == "user":
+            load = usecase.users[idx].generate_aggregated_load_profile(
+                day_idx, usecase.peak_time_range, day_type, resolution=resolution
+            )
+        else:
+            # the appliances of a work unit belong to the same user, which draws its preference of the day
+            # before they are simulated as in User.generate_single_load_profile
+            usecase.appliances[idx[0]].user.draw_daily_preference()
+            load = 0
+            for app_idx in idx:
+                _, app_load = single_appliance_daily_load_profile(
+                    (usecase.appliances[app_idx], (day_idx, usecase.peak_time_range, day_type)),
+                    resolution=resolution,
+                )
+                load = load + app_load
+        if day_idx in daily_loads:
+            daily_loads[day_idx] = daily_loads[day_idx] + load
+        else:
+            daily_loads[day_idx] = load.copy()
+    return daily_loads
+
+
+def check_resolution(resolution):
+    """Check that the resolution (minutes) of a daily profile divides a day into whole time steps"""
+    if not isinstance(resolution, int) or resolution < 1 or 1440 % resolution != 0:
+        raise ValueError(
+            f"The resolution must be a number of minutes dividing 1440 such as 1, 5, 15 or 60, not {resolution}"
+        )
+
+
 def get_day_type(day):
     """Given a datetime object return 0 for weekdays or 1 for weekends"""
 
@@ -68,7 +132,7 @@ def switch_on_parameters():
     return mu_peak, s_peak, op_factor
 
 
-def random_variation(var, norm=1):
+def random_variation(var, norm=1, rng=None):
     """Pick a random variable within a uniform distribution of range [1-var, 1+var]
 
     Parameters
@@ -77,15 +141,19 @@ def random_variation(var, norm=1):
         sets the range of the uniform distribution around one
     norm: float
         multiplication factor of the random variable, default = 1
+    rng: numpy.random.Generator, optional
+        random number generator to draw from, by default a freshly seeded one
 
     Returns
     -------
     random number close to norm
     """
-    return norm * random.uniform((1 - var), (1 + var))
+    if rng is None:
+        rng = np.random.default_rng()
+    return norm * rng.uniform(min(1 - var, 1 + var), max(1 - var, 1 + var))
 
 
-def duty_cycle(var, t1, p1, t2, p2):
+def duty_cycle(var, t1, p1, t2, p2, rng=None):
     """Assign a two period duty cycle
 
     concatenate an array where values equal p1 for a time (t1 +- random variation)
@@ -103,6 +171,8 @@ def duty_cycle(var, t1, p1, t2, p2):
         time interval of the second part of the duty cycle in minutes
     p2: int
         power of the second part of the duty cycle in Watt
+    rng: numpy.random.Generator, optional
+        random number generator to draw from, see random_variation
 
     Returns
     -------
@@ -111,8 +181,8 @@ def duty_cycle(var, t1, p1, t2, p2):
     """
     return np.concatenate(
         (
-            np.ones(int(random_variation(var=-var, norm=t1))) * p1,
-            np.ones(int(random_variation(var=-var, norm=t2))) * p2,
+            np.ones(int(random_variation(var=-var, norm=t1, rng=rng))) * p1,
+            np.ones(int(random_variation(var=-var, norm=t2, rng=rng))) * p2,
         )
     )
 
@@ -131,7 +201,7 @@ def range_within_window(range_low, range_high, window):
     )
 
 
-def random_choice(var, t1, p1, t2, p2):
+def random_choice(var, t1, p1, t2, p2, rng=None):
     """Chooses one of two duty cycles randomly
 
     The choice is between a normal duty cycle and a reversed duty cycle (where t1 is swapped with t2 and p1 with p2)
@@ -148,16 +218,67 @@ def random_choice(var, t1, p1, t2, p2):
         time interval of the second part of the duty cycle in minutes
     p2: int
         power of the second part of the duty cycle in Watt
+    rng: numpy.random.Generator, optional
+        random number generator to draw from, by default a freshly seeded one
 
     Returns
     -------
     A duty cycle, see function duty_cycle
     """
-    return random.choice(
-        [
-            duty_cycle(var, t1=t1, p1=p1, t2=t2, p2=p2),
-            duty_cycle(var, t1=t2, p1=p2, t2=t1, p2=p1),
-        ]
+    if rng is None:
+        rng = np.random.default_rng()
+    cycles = [
+        duty_cycle(var, t1=t1, p1=p1, t2=t2, p2=p2, rng=rng),
+        duty_cycle(var, t1=t2, p1=p2, t2=t1, p2=p1, rng=rng),
+    ]
+    return cycles[rng.integers(len(cycles))]
+
+
+def minutes_per_time_step(ranges, resolution=1):
+    """Count the minutes of the given ranges falling within each time step of a daily profile
+
+    Parameters
+    ----------
+    ranges: Iterable
+        non overlapping [start, stop) time ranges in minutes
+    resolution: int, optional
+        duration of the time steps of the profile in minutes, by default 1
+
+    Returns
+    -------
+    np.array
+        number of minutes of the ranges within each of the 1440 / resolution time steps
+    """
+    edges = np.arange(0, 1441, resolution)
+    minutes = np.zeros(len(edges) - 1)
+    for start, stop in ranges:
+        minutes += np.clip(
+            np.minimum(edges[1:], stop) - np.maximum(edges[:-1], start), 0, None
+        )
+    return minutes
+
+
+def add_to_profile(profile, indexes, values, resolution=1):
+    """Add power values given per minute to a daily profile, averaging them over its time steps
+
+    Parameters
+    ----------
+    profile: np.array
+        daily profile with time steps of resolution minutes, updated in place
+    indexes: np.array
+        time indexes (minutes) of the values
+    values: Union[float, np.array]
+        power values, repeated as in numpy.put if shorter than the indexes
+    resolution: int, optional
+        duration of the time steps of the profile in minutes, by default 1
+    """
+    profile += (
+        np.bincount(
+            np.asarray(indexes) // resolution,
+            weights=np.resize(values, len(indexes)),
+            minlength=len(profile),
+        )
+        / resolution
     )
 
 
@@ -176,17 +297,27 @@ def generate_date_range(start_date=None, end_date=None, num_days=1):
 
 
 def generate_datetime_index(start, end, freq="min"):
-    datetime_index = []
-    current_time = start
-    delta = (
-        datetime.timedelta(minutes=1) if freq == "min" else datetime.timedelta(hours=1)
-    )  # Modify if needed for other frequencies
+    """Generate a numpy datetime64 index from start to end (included)
 
-    while current_time <= end:
-        datetime_index.append(current_time)
-        current_time += delta
+    Parameters
+    ----------
+    start: datetime.datetime
+        first time step of the index
+    end: datetime.datetime
+        last time step of the index
+    freq: Union[str, int], optional
+        "min", "h" or the number of minutes between two time steps, by default "min"
 
-    return datetime_index
+    Returns
+    -------
+    np.array
+        time steps of dtype datetime64[m]
+    """
+    minutes = {"min": 1, "h": 60}.get(freq, freq)
+    step = np.timedelta64(minutes, "m")
+    return np.arange(
+        np.datetime64(start, "m"), np.datetime64(end, "m") + step, step
+    )
 
 
 APPLIANCE_ATTRIBUTES = (
@@ -257,6 +388,74 @@ DUTY_CYCLE_PARAMETERS = (
 )
 
 
+class FreeSpots:
+    def __init__(self, windows: Iterable, func_cycle: int = 1):
+        """Sorted time ranges of the day still available for the switch-on events of an Appliance instance
+
+        Each range [start, stop) offers stop - start - func_cycle + 1 eligible switch-on times, the prefix sums of
+        these counts allow to pick the n-th eligible switch-on time with a binary search instead of listing all of them
+
+        Parameters
+        ----------
+        windows: Iterable
+            the [start, stop) functioning windows of the appliance, empty windows are ignored
+        func_cycle: int, optional
+            minimum time (minutes) the appliance is kept on after a switch-on event, by default 1
+        """
+        self.func_cycle = func_cycle
+        spots = sorted((int(w[0]), int(w[1])) for w in windows if w[0] < w[1])
+        self.starts = [spot[0] for spot in spots]
+        self.stops = [spot[1] for spot in spots]
+        self.cum_choices = []
+        self.update_choices(0)
+
+    def __iter__(self):
+        return (slice(start, stop, None) for start, stop in zip(self.starts, self.stops))
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def n_choices(self) -> int:
+        """Number of eligible switch-on times"""
+        return self.cum_choices[-1] if self.cum_choices else 0
+
+    def update_choices(self, spot_idx: int):
+        """Recompute the prefix sums of the eligible switch-on times from the given spot onwards"""
+        previous = self.cum_choices[spot_idx - 1] if spot_idx > 0 else 0
+        choices = itertools.accumulate(
+            (
+                max(stop - start - self.func_cycle + 1, 0)
+                for start, stop in zip(self.starts[spot_idx:], self.stops[spot_idx:])
+            ),
+            initial=previous,
+        )
+        self.cum_choices[spot_idx:] = list(choices)[1:]
+
+    def switch_on(self, choice: int):
+        """Return the choice-th eligible switch-on time and the end of the range it falls in
+
+        Parameters
+        ----------
+        choice: int[0, n_choices - 1]
+            index of the switch-on time among all the eligible switch-on times
+        """
+        spot_idx = bisect.bisect_right(self.cum_choices, choice)
+        previous = self.cum_choices[spot_idx - 1] if spot_idx > 0 else 0
+        return self.starts[spot_idx] + choice - previous, self.stops[spot_idx]
+
+    def remove(self, first: int, last: int):
+        """Remove the time indexes from first to last (included) from the available ranges"""
+        spot_idx = bisect.bisect_right(self.starts, first) - 1
+        if spot_idx < 0 or last >= self.stops[spot_idx]:
+            return
+        start, stop = self.starts[spot_idx], self.stops[spot_idx]
+        new_spots = [(s, e) for s, e in ((start, first), (last + 1, stop)) if s < e]
+        self.starts[spot_idx : spot_idx + 1] = [spot[0] for spot in new_spots]
+        self.stops[spot_idx : spot_idx + 1] = [spot[1] for spot in new_spots]
+        self.update_choices(spot_idx)
+
+
 class UseCase:
     def __init__(
         self,
@@ -266,7 +465,9 @@ class UseCase:
         date_end: str = None,
         parallel_processing: bool = False,
         peak_enlarge: float = 0.15,
-        random_seed: int = None,
+        random_seed: Union[int, np.random.SeedSequence] = None,
+        max_parallel_processes: int = None,
+        parallel_granularity: str = "user",
     ):
         """Creates a UseCase instance for gathering a list of User instances which own Appliance instances
 
@@ -284,8 +485,14 @@ class UseCase:
             if set True, the profiles will be generated in parallel rather than sequencially
         peak_enlarge: float, optional
             percentage random enlargement or reduction of peak time range length, used in UseCase.calc_peak_time_range
-        random_seed: int, optional
-            specify seed for the random number generator to exactly reproduce results
+        random_seed: Union[int, np.random.SeedSequence], optional
+            specify seed for the random number generator to exactly reproduce results, the UseCase instance draws
+            from its own numpy.random.Generator shared with its users and their appliances
+        max_parallel_processes: int, optional
+            number of worker processes used if parallel_processing is True, by default the number of CPUs
+        parallel_granularity: str {"user", "appliance"}, optional
+            work unit of the parallel processing, either one User instance or one Appliance instance of one
+            of the users for one day, by default "user"
 
         """
         self.name = name
@@ -300,6 +507,8 @@ class UseCase:
             else date_end
         )
         self.parallel_processing = parallel_processing
+        self.max_parallel_processes = max_parallel_processes
+        self.parallel_granularity = parallel_granularity
         self._peak_enlarge = peak_enlarge
         self.peak_time_range = None
         self.days = None
@@ -307,6 +516,12 @@ class UseCase:
         self.__datetimeindex = None
         self.daily_profiles = None
         self.random_seed = random_seed
+        self.seed_sequence = (
+            random_seed
+            if isinstance(random_seed, np.random.SeedSequence)
+            else np.random.SeedSequence(random_seed)
+        )
+        self.rng = np.random.default_rng(self.seed_sequence)
 
         self.appliances = []
         self.users = []
@@ -318,10 +533,6 @@ class UseCase:
         if self.date_start is not None and self.date_end is not None:
             self.initialize()
 
-        # Set global random seed if it is specified
-        if self.random_seed:
-            random.seed(self.random_seed)
-
     @property
     def date_start(self):
         """Start date of the daily profiles generated by the UseCase instance"""
@@ -391,10 +602,7 @@ class UseCase:
 
     def collect_appliances_from_users(self):
         """Gather all appliances from a UseCase instance users into self.appliances attribute"""
-        appliances = []
-        for user in self.users:
-            appliances = appliances + user.App_list
-        self.appliances = appliances
+        self.appliances = [app for user in self.users for app in user.App_list]
 
     @property
     def num_days(self):
@@ -405,11 +613,29 @@ class UseCase:
 
     @property
     def datetimeindex(self):
-        """Return the datetimeindex of the UseCase and call UseCase.initialize() if it was not set"""
+        """Return the minute datetimeindex of the UseCase, computed on first access, and call UseCase.initialize() if it was not set"""
         if self.__datetimeindex is None:
-            self.initialize()
+            self.__datetimeindex = self.generate_datetimeindex()
         return self.__datetimeindex
 
+    def generate_datetimeindex(self, resolution: int = 1):
+        """Generate the numpy datetime64 index of the time steps of the profiles of the UseCase
+
+        Parameters
+        ----------
+        resolution: int, optional
+            duration of the time steps in minutes, see UseCase.generate_daily_load_profiles, by default 1
+        """
+        if self.days is None:
+            self.initialize()
+        return generate_datetime_index(
+            start=self.days[0],
+            end=self.days[-1]
+            + datetime.timedelta(days=1)
+            - datetime.timedelta(minutes=resolution),
+            freq=resolution,
+        )
+
     def initialize(
         self, num_days: int = None, peak_enlarge: float = None, force: bool = False
     ):
@@ -442,6 +668,7 @@ class UseCase:
                     f"The usecase '{self.name}' is already initialized but argument `force=True` was provided, reinitializing..."
                 )
                 self.days = None
+                self.__datetimeindex = None
 
             if num_days is not None:
                 self.__num_days = num_days
@@ -512,18 +739,15 @@ class UseCase:
                 self.peak_enlarge = peak_enlarge
             else:
                 self.peak_time_range = self.calc_peak_time_range()
-            # format datetimeindex in minutes
-            self.__datetimeindex = generate_datetime_index(
-                start=self.days[0],
-                end=self.days[-1] + datetime.timedelta(days=1) - datetime.timedelta(minutes=1),
-            )
+            # the datetimeindex in minutes is computed on first access, see UseCase.datetimeindex
+            self.__datetimeindex = None
 
     @property
     def is_initialized(self):
         answer = False
         if (
             self.__num_days is not None
-            and self.__datetimeindex is not None
+            and self.days is not None
             and self.peak_time_range is not None
         ):
             answer = True
@@ -569,9 +793,9 @@ class UseCase:
         )
         # Within the peak_window, randomly calculate the peak_time using a gaussian distribution
         peak_time = round(
-            random.normalvariate(
-                mu=round(np.average(peak_window)),
-                sigma=1 / 3 * (peak_window[-1] - peak_window[0]),
+            self.rng.normal(
+                loc=round(np.average(peak_window)),
+                scale=1 / 3 * (peak_window[-1] - peak_window[0]),
             )
         )
         # Rand_peak_enlarge is rounded to be at least 1 -> if rounded to 0 peak_time_range would be empty
@@ -579,7 +803,9 @@ class UseCase:
             round(
                 math.fabs(
                     peak_time
-                    - random.gauss(mu=peak_time, sigma=peak_enlarge * peak_time)
+                    - self.rng.normal(
+                        loc=peak_time, scale=abs(peak_enlarge * peak_time)
+                    )
                 )
             ),
             1,
@@ -588,7 +814,7 @@ class UseCase:
         return np.arange(peak_time - rand_peak_enlarge, peak_time + rand_peak_enlarge)
 
     def generate_daily_load_profiles(
-        self, days=None, flat=True, cases=None, verbose=False
+        self, days=None, flat=True, cases=None, verbose=False, resolution=1
     ):
         """
         Iterate over the days and generate a daily profile for each of the days
@@ -603,6 +829,9 @@ class UseCase:
             a list of label of the different cases. This is used if one would like to compare several independent runs
             of a ramp UseCase instance, in that case the method returns a ramp.Plot object
         verbose: boolean, optional
+        resolution: int {1, 5, 15, 60}, optional
+            duration of the time steps of the profiles in minutes, the energy of the switch-on events is directly
+            accumulated into these time steps as average power, by default 1
 
         Returns
         -------
@@ -615,19 +844,25 @@ class UseCase:
                 raise ValueError(
                     "You must provide days either with start and end date and run initialize() method of UseCase instance or as an argument of 'generate_daily_load_profiles'"
                 )
+        check_resolution(resolution)
         if self.parallel_processing is True:
-            daily_profiles = self.generate_daily_load_profiles_parallel(flat=False)
+            daily_profiles = self.generate_daily_load_profiles_parallel(
+                flat=False, resolution=resolution
+            )
         else:
-            daily_profiles = np.zeros((self.num_days, 1440))
+            daily_profiles = np.zeros((self.num_days, 1440 // resolution))
             for day_idx, day in enumerate(self.days):
                 # initialise an empty daily profile (or profile load)
                 # that will be filled with the sum of the daily profiles of each User instance
-                usecase_load = np.zeros(1440)
+                usecase_load = np.zeros(1440 // resolution)
                 # for each User instance generate a load profile, iterating through all user of this instance and
                 # all appliances they own, corresponds to step 2. of [1], p.7
                 for user in self.users:
                     user.generate_aggregated_load_profile(
-                        day_idx, self.peak_time_range, get_day_type(day)
+                        day_idx,
+                        self.peak_time_range,
+                        get_day_type(day),
+                        resolution=resolution,
                     )
                     # aggregate the user load to the usecase load
                     usecase_load = usecase_load + user.load
@@ -638,7 +873,101 @@ class UseCase:
                     print("Day", day_idx + 1, "/", self.num_days, "completed")
 
         if flat is True:
-            answer = daily_profiles.reshape(1, self.num_days * 1440).squeeze()
+            answer = daily_profiles.flatten()
+        else:
+            answer = daily_profiles
+        return answer
+
+    def generate_daily_load_profiles_parallel(
+        self,
+        flat=True,
+        granularity=None,
+        max_parallel_processes=None,
+        chunk_size=None,
+        resolution=1,
+    ):
+        """
+        Generate a daily profile for each of the days by spreading the work over a pool of processes
+
+        Parameters
+        ----------
+        flat: boolean, optional
+            flatten the daily profiles into a 1 dimensional array via reshaping
+        granularity: str {"user", "appliance"}, optional
+            work unit sent to the worker processes, (User instance, day) or (Appliance instance, day) where
+            each Appliance instance is repeated for each of the num_users of its User, by default self.parallel_granularity.
+            The Appliance instances of a User with a user_preference that have a pref_index are kept in the same work
+            unit for each of its num_users, so that they share the preference drawn for the day
+        max_parallel_processes: int, optional
+            number of worker processes, by default self.max_parallel_processes or the number of CPUs
+        chunk_size: int, optional
+            number of work units processed by a worker at once, by default the work units are split into
+            four chunks per worker process
+        resolution: int {1, 5, 15, 60}, optional
+            duration of the time steps of the profiles in minutes, by default 1
+
+        Returns
+        -------
+        daily_profiles: numpy array
+
+        Notes
+        ------
+        Each work unit draws from its own random stream spawned from UseCase.seed_sequence, so that results are
+        reproducible whatever the number of processes and the chunk size
+        """
+        if granularity is None:
+            granularity = self.parallel_granularity
+        if granularity not in ("user", "appliance"):
+            raise ValueError(
+                f"granularity must be either 'user' or 'appliance', not '{granularity}'"
+            )
+        if max_parallel_processes is None:
+            max_parallel_processes = self.max_parallel_processes or os.cpu_count()
+
+        if granularity == "user":
+            owners = range(len(self.users))
+        else:
+            owners = []
+            for user in self.users:
+                indexes = [
+                    idx for idx, app in enumerate(self.appliances) if app.user is user
+                ]
+                preferred = tuple(
+                    idx for idx in indexes if self.appliances[idx].pref_index != 0
+                )
+                user_units = [(idx,) for idx in indexes if idx not in preferred]
+                if preferred and user.user_preference != 0:
+                    user_units.append(preferred)
+                else:
+                    user_units += [(idx,) for idx in preferred]
+                owners += user_units * user.num_users
+        units = [(idx, day_idx) for day_idx in range(self.num_days) for idx in owners]
+        seeds = self.seed_sequence.spawn(len(units))
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(units) / (4 * max_parallel_processes)))
+        chunks = [
+            (
+                granularity,
+                resolution,
+                units[i : i + chunk_size],
+                seeds[i : i + chunk_size],
+            )
+            for i in range(0, len(units), chunk_size)
+        ]
+
+        check_resolution(resolution)
+        daily_profiles = np.zeros((self.num_days, 1440 // resolution))
+        with ProcessPoolExecutor(
+            max_workers=max_parallel_processes,
+            initializer=init_parallel_worker,
+            initargs=(self,),
+        ) as executor:
+            for daily_loads in executor.map(parallel_daily_load_profiles, chunks):
+                for day_idx, load in daily_loads.items():
+                    daily_profiles[day_idx, :] += load
+
+        if flat is True:
+            answer = daily_profiles.flatten()
         else:
             answer = daily_profiles
         return answer
@@ -651,6 +980,7 @@ class User:
         num_users: int = 1,
         user_preference: int = 0,
         usecase=None,
+        rng: np.random.Generator = None,
     ):
         """Creates a User instance (User Category)
 
@@ -662,6 +992,8 @@ class User:
             number of users within the resprective user-type, by default 1
         user_preference : int {0,1,2,3}, optional
             Related to cooking behaviour, how many types of meal a user wants a day (number of user preferences has to be defined here and will be further specified with pref_index parameter), by default 0
+        rng : numpy.random.Generator, optional
+            random number generator of the user and its appliances, by default the one of its UseCase instance
         """
         # TODO check type of Usecase
         self.usecase = usecase
@@ -669,6 +1001,7 @@ class User:
         self.num_users = num_users
         self.user_preference = user_preference
         self.rand_daily_pref = 0
+        self._rng = rng
         self.load = None
         self.App_list = (
             []
@@ -814,6 +1147,20 @@ appliances: no appliances assigned to the user.
             )  # this stacks the specific App curve in an overall curve comprising all the Apps within a User class
         return np.transpose(np.sum(user_max_profile, axis=0)) * self.num_users
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random number generator of the user, injected or inherited from its UseCase instance"""
+        if self._rng is not None:
+            return self._rng
+        if self.usecase is not None:
+            return self.usecase.rng
+        # logging warning
+        print(
+            f"The user {self.user_name} is not bounded to a UseCase instance nor given a random number generator, a default one has been created for it"
+        )
+        self._rng = np.random.default_rng()
+        return self._rng
+
     @property
     def num_days(self):
         answer = 366
@@ -905,7 +1252,11 @@ appliances: no appliances assigned to the user.
         )
 
     def generate_single_load_profile(
-        self, prof_i: int = 0, peak_time_range: np.array = None, day_type: int = 0
+        self,
+        prof_i: int = 0,
+        peak_time_range: np.array = None,
+        day_type: int = 0,
+        resolution: int = 1,
     ):
         """Generates a load profile for a single user taking all its appliances into consideration
 
@@ -920,6 +1271,9 @@ appliances: no appliances assigned to the user.
         day_type: int[0,1]
             type of the ith profile. 0 for a week day or 1 for a weekend day
 
+        resolution: int {1, 5, 15, 60}
+            duration of the time steps of the load profile in minutes
+
         Returns
         --------
         np.array
@@ -936,17 +1290,19 @@ appliances: no appliances assigned to the user.
                 self.usecase.peak_time_range = self.usecase.calc_peak_time_range()
             peak_time_range = self.usecase.peak_time_range
 
-        single_load = np.zeros(1440)
+        single_load = np.zeros(1440 // resolution)
 
-        self.rand_daily_pref = (
-            0 if self.user_preference == 0 else random.randint(1, self.user_preference)
-        )
+        self.draw_daily_preference()
 
         for (
             App
         ) in self.App_list:  # iterates for all the App types in the given User class
             App.generate_load_profile(
-                prof_i, peak_time_range, day_type, power=App.power[prof_i]
+                prof_i,
+                peak_time_range,
+                day_type,
+                power=App.power[prof_i],
+                resolution=resolution,
             )
 
             single_load = (
@@ -954,8 +1310,16 @@ appliances: no appliances assigned to the user.
             )  # adds the Appliance load profile to the single User load profile
         return single_load
 
+    def draw_daily_preference(self):
+        """Draws the preference of the user for the day, its appliances with another pref_index are not used"""
+        self.rand_daily_pref = (
+            0
+            if self.user_preference == 0
+            else self.rng.integers(1, self.user_preference, endpoint=True)
+        )
+
     def generate_aggregated_load_profile(
-        self, prof_i=0, peak_time_range=None, day_type=0
+        self, prof_i=0, peak_time_range=None, day_type=0, resolution=1
     ):
         """Generates an aggregated load profile from single load profile of each user
 
@@ -969,6 +1333,8 @@ appliances: no appliances assigned to the user.
             randomised peak time range calculated using calc_peak_time_range function
         day_type: int[0,1]
             type of the ith profile. 0 for a week day or 1 for a weekend day
+        resolution: int {1, 5, 15, 60}
+            duration of the time steps of the load profile in minutes
 
         Returns
         --------
@@ -980,11 +1346,13 @@ appliances: no appliances assigned to the user.
         Each single load profile has its own separate randomisation
         """
 
-        self.load = np.zeros(1440)  # initialise empty load for User instance
+        self.load = np.zeros(
+            1440 // resolution
+        )  # initialise empty load for User instance
         for _ in range(self.num_users):
             # iterates for every single user within a User class.
             self.load = self.load + self.generate_single_load_profile(
-                prof_i, peak_time_range, day_type
+                prof_i, peak_time_range, day_type, resolution
             )
 
         return self.load
@@ -1092,8 +1460,12 @@ class Appliance:
 
         self.__constant_power = False
 
-        power = power * np.ones(self.user.num_days + 1)
-        self.__constant_power = True
+        if np.ndim(power) == 0:
+            power = power * np.ones(self.user.num_days + 1)
+            self.__constant_power = True
+        else:
+            # variant daily power, indexed by the ith profile (day) in generate_load_profile
+            power = np.asarray(power, dtype=float)
 
         self.power = power
 
@@ -1106,6 +1478,7 @@ class Appliance:
         self.random_var_2 = 0
         self.random_var_3 = 0
         self.daily_use = np.zeros(1440)
+        self.resolution = 1
         self.free_spots = None
 
         # attributes used for specific fixed and random cycles
@@ -1141,6 +1514,11 @@ class Appliance:
         # if it is 0, then no switch on events happen within any duty cycle windows
         self.current_duty_cycle_id = 0
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random number generator of the appliance, the one of its user"""
+        return self.user.rng
+
     def check_power_values(self, num_days):
         if len(self.power) < num_days:
             if self.__constant_power is True:
@@ -1171,10 +1549,13 @@ class Appliance:
         answer = np.array([])
         for attribute in APPLIANCE_ATTRIBUTES:
             if hasattr(self, attribute) and hasattr(other_appliance, attribute):
-                answer = np.append(
-                    answer,
-                    [getattr(self, attribute) == getattr(other_appliance, attribute)],
-                )
+                mine = getattr(self, attribute)
+                theirs = getattr(other_appliance, attribute)
+                # array attributes such as a variant daily power might differ in length
+                if isinstance(mine, np.ndarray) or isinstance(theirs, np.ndarray):
+                    answer = np.append(answer, [np.array_equal(mine, theirs)])
+                else:
+                    answer = np.append(answer, [mine == theirs])
             elif (
                 hasattr(self, attribute) is False
                 and hasattr(other_appliance, attribute) is False
@@ -1302,44 +1683,44 @@ class Appliance:
         """
         if self.fixed_cycle >= 1:
             p_11 = random_variation(
-                var=self.thermal_p_var, norm=self.p_11
+                var=self.thermal_p_var, rng=self.rng, norm=self.p_11
             )  # randomly variates the power of thermal apps, otherwise variability is 0
             p_12 = random_variation(
-                var=self.thermal_p_var, norm=self.p_12
+                var=self.thermal_p_var, rng=self.rng, norm=self.p_12
             )  # randomly variates the power of thermal apps, otherwise variability is 0
             self.random_cycle1 = duty_cycle(
-                var=self.r_c1, t1=self.t_11, p1=p_11, t2=self.t_12, p2=p_12
+                var=self.r_c1, t1=self.t_11, p1=p_11, t2=self.t_12, p2=p_12, rng=self.rng
             )  # randomise also the fixed cycle
             self.random_cycle2 = self.random_cycle1
             self.random_cycle3 = self.random_cycle1
             if self.fixed_cycle >= 2:
                 p_21 = random_variation(
-                    var=self.thermal_p_var, norm=self.p_21
+                    var=self.thermal_p_var, rng=self.rng, norm=self.p_21
                 )  # randomly variates the power of thermal apps, otherwise variability is 0
                 p_22 = random_variation(
-                    var=self.thermal_p_var, norm=self.p_22
+                    var=self.thermal_p_var, rng=self.rng, norm=self.p_22
                 )  # randomly variates the power of thermal apps, otherwise variability is 0
                 self.random_cycle2 = duty_cycle(
-                    var=self.r_c2, t1=self.t_21, p1=p_21, t2=self.t_22, p2=p_22
+                    var=self.r_c2, t1=self.t_21, p1=p_21, t2=self.t_22, p2=p_22, rng=self.rng
                 )  # randomise also the fixed cycle
 
                 if self.fixed_cycle >= 3:
                     p_31 = random_variation(
-                        var=self.thermal_p_var, norm=self.p_31
+                        var=self.thermal_p_var, rng=self.rng, norm=self.p_31
                     )  # randomly variates the power of thermal apps, otherwise variability is 0
                     p_32 = random_variation(
-                        var=self.thermal_p_var, norm=self.p_32
+                        var=self.thermal_p_var, rng=self.rng, norm=self.p_32
                     )  # randomly variates the power of thermal apps, otherwise variability is 0
                     self.random_cycle1 = random_choice(
-                        self.r_c1, t1=self.t_11, p1=p_11, t2=self.t_12, p2=p_12
+                        self.r_c1, t1=self.t_11, p1=p_11, t2=self.t_12, p2=p_12, rng=self.rng
                     )
 
                     self.random_cycle2 = random_choice(
-                        self.r_c2, t1=self.t_21, p1=p_21, t2=self.t_22, p2=p_22
+                        self.r_c2, t1=self.t_21, p1=p_21, t2=self.t_22, p2=p_22, rng=self.rng
                     )
 
                     self.random_cycle3 = random_choice(
-                        self.r_c3, t1=self.t_31, p1=p_31, t2=self.t_32, p2=p_32
+                        self.r_c3, t1=self.t_31, p1=p_31, t2=self.t_32, p2=p_32, rng=self.rng
                     )
 
     def update_available_time_for_switch_on_events(self, indexes):
@@ -1354,34 +1735,7 @@ class Appliance:
         ------
         nothing but can modify self.free_spots
         """
-        # identify which of the unallocated time ranges contain the switch-on event
-        spot_idx = None
-        for i, fs in enumerate(self.free_spots):
-            if indexes[0] >= fs.start and indexes[-1] <= fs.stop:
-                spot_idx = i
-                break
-        if spot_idx is not None:
-            spot_to_split = self.free_spots.pop(spot_idx)
-
-            if indexes[0] == spot_to_split.start and indexes[-1] == spot_to_split.stop:
-                pass  # nothing to do as the whole range should be removed, which is already the case from line above
-            elif indexes[0] == spot_to_split.start:
-                # reinsert a range going from end of indexes up to the end of picked range
-                self.free_spots.insert(
-                    spot_idx, slice(indexes[-1] + 1, spot_to_split.stop, None)
-                )
-            elif indexes[-1] == spot_to_split.stop:
-                # reinsert a range going from beginning of picked range up to the beginning of indexes
-                self.free_spots.insert(
-                    spot_idx, slice(spot_to_split.start, indexes[0], None)
-                )
-            else:
-                # split the range into 2 smaller ranges
-                new_spot1 = slice(spot_to_split.start, indexes[0], None)
-                new_spot2 = slice(indexes[-1] + 1, spot_to_split.stop, None)
-
-                self.free_spots.insert(spot_idx, new_spot2)
-                self.free_spots.insert(spot_idx, new_spot1)
+        self.free_spots.remove(indexes[0], indexes[-1])
 
     def update_daily_use(self, coincidence, power, indexes):
         """Update the daily use depending on existence of duty cycles of the Appliance instance
@@ -1400,22 +1754,29 @@ class Appliance:
             # the proper duty cycle was selected in self.rand_switch_on_window()
             # now setting the corresponding power values in the indexes range
             if self.current_duty_cycle_id == 1:
-                np.put(self.daily_use, indexes, (self.random_cycle1 * coincidence))
+                values = self.random_cycle1 * coincidence
             elif self.current_duty_cycle_id == 2:
-                np.put(self.daily_use, indexes, (self.random_cycle2 * coincidence))
+                values = self.random_cycle2 * coincidence
             elif self.current_duty_cycle_id == 3:
-                np.put(self.daily_use, indexes, (self.random_cycle3 * coincidence))
+                values = self.random_cycle3 * coincidence
             else:
+                values = None
                 print(
                     f"The app {self.name} has duty cycle option on, however the switch on event fell outside the provided duty cycle windows"
                 )
 
         else:  # if no duty cycles are specified, a regular switch_on event is modelled
             # randomises also the App Power if thermal_p_var is on
-            np.put(
+            values = random_variation(
+                var=self.thermal_p_var, norm=coincidence * power, rng=self.rng
+            )
+        if values is not None:
+            # the switch-on event replaces the infinitesimal values of the functioning windows
+            add_to_profile(
                 self.daily_use,
                 indexes,
-                (random_variation(var=self.thermal_p_var, norm=coincidence * power)),
+                values - 0.001,
+                self.resolution,
             )
         # updates the time ranges remaining for switch on events, excluding the current switch_on event
         self.update_available_time_for_switch_on_events(indexes)
@@ -1424,8 +1785,12 @@ class Appliance:
         _window = self.__getattribute__(f"window_{window_idx}")
         _random_var = self.__getattribute__(f"random_var_{window_idx}")
         rand_window = [
-            random.randint(_window[0] - _random_var, _window[0] + _random_var),
-            random.randint(_window[1] - _random_var, _window[1] + _random_var),
+            self.rng.integers(
+                _window[0] - _random_var, _window[0] + _random_var, endpoint=True
+            ),
+            self.rng.integers(
+                _window[1] - _random_var, _window[1] + _random_var, endpoint=True
+            ),
         ]
         if rand_window[0] < window_range_limits[0]:
             rand_window[0] = window_range_limits[0]
@@ -1444,7 +1809,10 @@ class Appliance:
             It assumes the appliance is always switched-on with maximum power and
             numerosity during all of its potential windows of use
         """
-        return self.daily_use * np.mean(self.power) * self.number
+        window_use = np.zeros(1440)
+        for window in (self.window_1, self.window_2, self.window_3):
+            window_use[window[0] : window[1]] = 0.001
+        return window_use * np.mean(self.power) * self.number
 
     def specific_cycle(self, cycle_num, **kwargs):
         """assigining specific duty cycle for the appliance (maximum of three cycles can be assigned)
@@ -1640,12 +2008,13 @@ class Appliance:
     ) -> int:
         """Randomised total time of use of the Appliance instance"""
 
-        random_var_t = random_variation(var=self.time_fraction_random_variability)
-
-        rand_time = round(
-            random.uniform(self.func_time, int(self.func_time * random_var_t))
+        random_var_t = random_variation(
+            var=self.time_fraction_random_variability, rng=self.rng
         )
 
+        rand_time_bounds = sorted((self.func_time, int(self.func_time * random_var_t)))
+        rand_time = round(self.rng.uniform(*rand_time_bounds))
+
         if rand_time < self.func_cycle:
             rand_time = self.func_cycle
 
@@ -1676,38 +2045,27 @@ class Appliance:
             Energy, 2019, https://doi.org/10.1016/j.energy.2019.04.097.
         """
 
-        indexes_choice = []
-        for s in self.free_spots:
-            if s.stop - s.start >= self.func_cycle:
-                indexes_choice += [
-                    *range(s.start, s.stop - self.func_cycle + 1)
-                ]  # this will be fast with cython
-        n_choices = len(indexes_choice)
+        n_choices = self.free_spots.n_choices
         if n_choices > 0:
             # Identifies a random switch on time within the available functioning windows
             # step 2c of [1]
-            switch_on = indexes_choice[random.randint(0, n_choices - 1)]
-            spot_idx = None
-            for i, fs in enumerate(self.free_spots):
-                if fs.start <= switch_on <= fs.stop - self.func_cycle:
-                    spot_idx = i
-                    break
-
-            largest_duration = min(
-                rand_time, self.free_spots[spot_idx].stop - switch_on
+            switch_on, spot_stop = self.free_spots.switch_on(
+                self.rng.integers(n_choices)
             )
 
+            largest_duration = min(rand_time, spot_stop - switch_on)
+
             if largest_duration > self.func_cycle:
                 indexes = np.arange(
                     switch_on,
                     switch_on
-                    + (int(random.uniform(self.func_cycle, largest_duration))),
+                    + (int(self.rng.uniform(self.func_cycle, largest_duration))),
                 )  # TODO randint
             elif largest_duration == self.func_cycle:
                 indexes = np.arange(switch_on, switch_on + largest_duration)
             else:
                 print("func time", self.func_cycle)
-                print("max window", self.free_spots[spot_idx].stop)
+                print("max window", spot_stop)
                 print("rand_time", rand_time)
                 print("upper_limit", largest_duration)
                 raise ValueError(
@@ -1775,9 +2133,9 @@ class Appliance:
                 max(
                     1,
                     math.ceil(
-                        random.gauss(
-                            mu=(self.number * mu_peak),
-                            sigma=(s_peak * self.number * mu_peak),
+                        self.rng.normal(
+                            loc=(self.number * mu_peak),
+                            scale=(s_peak * self.number * mu_peak),
                         )
                     ),
                 ),
@@ -1786,7 +2144,7 @@ class Appliance:
         elif inside_peak_window is False and self.fixed == "no":
             # calculates probability of coincident switch_ons off-peak
             # eq. 3 of [1]
-            prob = random.uniform(0, (self.number - op_factor) / self.number)
+            prob = self.rng.uniform(0, (self.number - op_factor) / self.number)
 
             # randomly selects how many appliances are on at the same time
             array = np.arange(0, self.number) / self.number
@@ -1801,22 +2159,28 @@ class Appliance:
             coincidence = self.number
         return coincidence
 
-    def generate_load_profile(self, prof_i, peak_time_range, day_type, power):
+    def generate_load_profile(
+        self, prof_i, peak_time_range, day_type, power, resolution=1
+    ):
         """Generate load profile of the Appliance instance by updating its daily_use attribute
 
         Run steps 2a and 2b and repeat steps 2c - 2e of [1] until the sum of the durations of
         all the switch-on events equals the randomised total time of use of the Appliance
 
+        The daily_use attribute has time steps of resolution minutes, holding the average power of the
+        appliance over each time step
+
         [1] F. Lombardi, S. Balderrama, S. Quoilin, E. Colombo,
             Generating high-resolution multi-energy load profiles for remote areas with an open-source stochastic model,
             Energy, 2019, https://doi.org/10.1016/j.energy.2019.04.097.
         """
         # initialises variables for the cycle
-        self.daily_use = np.zeros(1440)
+        self.resolution = resolution
+        self.daily_use = np.zeros(1440 // resolution)
 
         # skip this appliance in any of the following applies
         if (
-            random.uniform(0, 1) > self.occasional_use
+            self.rng.uniform(0, 1) > self.occasional_use
             # evaluates if daily preference coincides with the randomised daily preference number
             or (self.pref_index != 0 and self.user.rand_daily_pref != self.pref_index)
             # checks if the app is allowed in the given yearly behaviour pattern
@@ -1845,28 +2209,26 @@ class Appliance:
             # for "flat" appliances the algorithm stops right after filling the newly
             # created windows without applying any further stochasticity
             total_power_value = self.power[prof_i] * self.number
-            for rand_window in rand_windows:
-                self.daily_use[rand_window[0] : rand_window[1]] = np.full(
-                    np.diff(rand_window), total_power_value
-                )
+            self.daily_use = (
+                total_power_value
+                * minutes_per_time_step(rand_windows, resolution)
+                / resolution
+            )
             # single_load = single_load + self.daily_use
             return
         else:
             # "non-flat" appliances a mask is applied on the newly defined windows and
             # the algorithm goes further on
-            for rand_window in rand_windows:
-                self.daily_use[rand_window[0] : rand_window[1]] = np.full(
-                    np.diff(rand_window), 0.001
-                )
+            self.daily_use = (
+                0.001 * minutes_per_time_step(rand_windows, resolution) / resolution
+            )
 
         # calculates randomised cycles taking the random variability in the duty cycle duration
         self.assign_random_cycles()
 
         # steps 2c-2e repeated until the sum of the durations of all the switch-on events equals rand_time
 
-        self.free_spots = [
-            slice(rw[0], rw[1], None) for rw in rand_windows if rw[0] != rw[1]
-        ]
+        self.free_spots = FreeSpots(rand_windows, func_cycle=self.func_cycle)
 
         tot_time = 0
         while tot_time <= rand_time and rand_time != 0:
@@ -1,8 +1,15 @@
-import datetime
-import math
-from datetime import timedelta
-from model.services.utilities import comparable_date
-from model.hydro.river_flow import river_flow
+import functools
+import json
+import os
+import warnings
+import numpy as np
+from model.services.utilities import comparable_date, write_atomic
+
+# partitioned river flow data, add observations with model/hydro/ingest_river_flow.py
+RIVER_FLOW_DIR = os.path.join(os.path.dirname(__file__), "river_flow")
+
+# statistics of the day-of-year climatology, pXX is the XXth percentile
+CLIMATOLOGY_STATISTICS = ("mean", "p10", "p50", "p90")
 
 river_stations = [
     {
@@ -49,54 +56,395 @@ river_stations = [
     },
 ]
 
+def day_of_year_slot(dates):
+    """Position of dates in a leap year, so that a day keeps the same slot in every year.
+
+    Args:
+        dates (np.array): datetime64[D] dates
+
+    Returns:
+        np.array: slots between 0 and 365, February 29 is 59
+    """
+    years = dates.astype("datetime64[Y]")
+    day_of_year = (dates - years.astype("datetime64[D]")).astype(int)
+    year = years.astype(int) + 1970
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return day_of_year + (~leap & (day_of_year >= 59))
+
+
+class RiverFlowStore:
+    """Normalized daily river flow of each station, partitioned by station and year.
+
+    Every partition is a .npy file of 366 day-of-year slots (see day_of_year_slot), NaN where there
+    is no record, listed in a manifest. Only the partitions covering a requested window are read, they
+    are memory-mapped. Days without records are filled from a day-of-year climatology of the station,
+    stored next to the manifest.
+
+    The store is append-only: ingest writes the partitions of new years, rewrites the partitions
+    receiving new days and never modifies recorded days.
+    """
+
+    def __init__(self, directory=RIVER_FLOW_DIR):
+        self.directory = directory
+        self.partitions = {}
+        manifest_path = os.path.join(directory, "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if tuple(manifest["climatology"]) != CLIMATOLOGY_STATISTICS:
+                raise ValueError(
+                    f"Climatology statistics {manifest['climatology']} differ from {CLIMATOLOGY_STATISTICS}, ingest the river flow data again"
+                )
+            self.years = {s: set(y) for s, y in manifest["partitions"].items()}
+            self.climatology = np.load(
+                os.path.join(directory, "climatology.npy"), mmap_mode="r"
+            )
+        else:
+            self.years = {}
+            self.climatology = np.empty((0, 366, len(CLIMATOLOGY_STATISTICS)))
+        self.station_index = {station: i for i, station in enumerate(self.years)}
+
+    def partition_path(self, station_number, year):
+        return os.path.join(self.directory, station_number, f"{year}.npy")
+
+    def partition(self, station_number, year):
+        """Reads the flows of a station for a year.
+
+        Args:
+            station_number (str): station number
+            year (int): year
+
+        Returns:
+            np.array: flows of the 366 day-of-year slots, NaN where there is no record
+        """
+        if year not in self.years.get(station_number, ()):
+            return np.full(366, np.nan)
+        if (station_number, year) not in self.partitions:
+            self.partitions[station_number, year] = np.load(
+                self.partition_path(station_number, year), mmap_mode="r"
+            )
+        return self.partitions[station_number, year]
+
+    def flows_by_year(self, station_numbers, years):
+        """Reads the partitions of stations for years.
+
+        Args:
+            station_numbers (list): station numbers
+            years (list): years
+
+        Returns:
+            np.array: flows of shape (number of stations, number of years, 366)
+        """
+        return np.array(
+            [[self.partition(s, year) for year in years] for s in station_numbers]
+        ).reshape(len(station_numbers), len(years), 366)
+
+    def record_years(self):
+        """Returns the years covered by the records of any station, in order"""
+        return sorted(set().union(*self.years.values()))
+
+    def compute_climatology(self):
+        """Computes the day-of-year climatology of every station.
+
+        Returns:
+            np.array: statistics of shape (number of stations, 366, len(CLIMATOLOGY_STATISTICS)),
+                in the order of CLIMATOLOGY_STATISTICS
+        """
+        by_year = self.flows_by_year(list(self.years), self.record_years())
+        percentiles = [int(s[1:]) for s in CLIMATOLOGY_STATISTICS if s != "mean"]
+        with warnings.catch_warnings():
+            # slots without any record stay NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(by_year, axis=1)
+            quantiles = np.nanpercentile(by_year, percentiles, axis=1)
+        return np.stack([mean, *quantiles], axis=-1)
+
+    def ingest(self, records):
+        """Appends daily observations to the store, the days already recorded are left unchanged.
+
+        Args:
+            records (list): dicts with the Station_Number, date (YYYY-MM-DD) and norm of a day
+
+        Returns:
+            int: number of days added
+        """
+        dates = np.array([r["date"] for r in records], dtype="datetime64[D]")
+        years = dates.astype("datetime64[Y]").astype(int) + 1970
+        slots = day_of_year_slot(dates)
+        norms = np.array([float(r["norm"]) for r in records])
+        stations = np.array([r["Station_Number"] for r in records])
+
+        added = 0
+        for station_number, year in sorted(set(zip(stations.tolist(), years.tolist()))):
+            selected = (stations == station_number) & (years == year)
+            flows = np.array(self.partition(station_number, year))
+            new = selected & np.isnan(flows[slots])
+            if not new.any():
+                continue
+            flows[slots[new]] = norms[new]
+            added += np.count_nonzero(new)
+            path = self.partition_path(station_number, year)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, lambda f: np.save(f, flows))
+            self.partitions.pop((station_number, year), None)
+            self.years.setdefault(station_number, set()).add(year)
+        if not added:
+            return added
+
+        self.station_index = {station: i for i, station in enumerate(self.years)}
+        self.climatology = self.compute_climatology()
+        write_atomic(
+            os.path.join(self.directory, "climatology.npy"),
+            lambda f: np.save(f, self.climatology),
+        )
+        manifest = {
+            "partitions": {s: sorted(y) for s, y in self.years.items()},
+            "climatology": list(CLIMATOLOGY_STATISTICS),
+        }
+        write_atomic(
+            os.path.join(self.directory, "manifest.json"),
+            lambda f: f.write(json.dumps(manifest, indent=2).encode()),
+        )
+        return added
+
+    def get(self, station_number, start_date, number_of_days, statistic="mean"):
+        """Returns the normalized flow of a station for consecutive days.
+
+        Args:
+            station_number (str): station number
+            start_date (str): first day in YYYY-MM-DD format
+            number_of_days (int): number of days
+            statistic (str): climatology statistic used for the days without records
+
+        Returns:
+            np.array: daily normalized flow
+        """
+        return self.get_stations([station_number], start_date, number_of_days, statistic)[0]
+
+    def get_stations(self, station_numbers, start_date, number_of_days, statistic="mean"):
+        """Returns the normalized flow of several stations for consecutive days.
+
+        Args:
+            station_numbers (list): station numbers
+            start_date (str): first day in YYYY-MM-DD format
+            number_of_days (int): number of days
+            statistic (str): climatology statistic used for the days without records, one of
+                CLIMATOLOGY_STATISTICS
+
+        Returns:
+            np.array: daily normalized flow, of shape (number of stations, number_of_days)
+        """
+        dates = np.datetime64(start_date, "D") + np.arange(number_of_days)
+        years = dates.astype("datetime64[Y]").astype(int) + 1970
+        by_year = self.flows_by_year(station_numbers, range(years[0], years[-1] + 1))
+        flows = by_year[:, years - years[0], day_of_year_slot(dates)]
+        return self.fill_missing(flows, station_numbers, dates, statistic)
+
+    def sample_stations(
+        self, station_numbers, start_date, number_of_days, rng, statistic="mean"
+    ):
+        """Returns the normalized flow of several stations for consecutive days, taken from a random
+        year of the records. Every station uses the same years and the following years of the
+        records for windows spanning several years, wrapping around after the last one.
+
+        Args:
+            station_numbers (list): station numbers
+            start_date (str): first day in YYYY-MM-DD format
+            number_of_days (int): number of days
+            rng (np.random.Generator): generator drawing the year
+            statistic (str): climatology statistic used for the days without records, one of
+                CLIMATOLOGY_STATISTICS
+
+        Returns:
+            np.array: daily normalized flow, of shape (number of stations, number_of_days)
+        """
+        dates = np.datetime64(start_date, "D") + np.arange(number_of_days)
+        years = dates.astype("datetime64[Y]").astype(int)
+        record_years = np.arange(self.record_years()[0], self.record_years()[-1] + 1)
+        sampled = (rng.integers(len(record_years)) + years - years[0]) % len(record_years)
+        # only read the sampled years
+        used, positions = np.unique(sampled, return_inverse=True)
+        by_year = self.flows_by_year(station_numbers, record_years[used].tolist())
+        flows = by_year[:, positions, day_of_year_slot(dates)]
+        return self.fill_missing(flows, station_numbers, dates, statistic)
+
+    def fill_missing(self, flows, station_numbers, dates, statistic):
+        """Replaces the missing flows by a statistic of the climatology of their day of year"""
+        if statistic not in CLIMATOLOGY_STATISTICS:
+            raise ValueError(
+                f"statistic must be one of {CLIMATOLOGY_STATISTICS}, got {statistic}"
+            )
+        missing = np.isnan(flows)
+        if missing.any():
+            rows = [self.station_index[s] for s in station_numbers]
+            climatology = self.climatology[
+                rows, :, CLIMATOLOGY_STATISTICS.index(statistic)
+            ]
+            flows = np.where(missing, climatology[:, day_of_year_slot(dates)], flows)
+        return flows
+
+
+@functools.cache
+def river_flow_store():
+    """Opens the river flow data on the first hydro request, so that importing the module stays cheap"""
+    return RiverFlowStore()
+
+
 def calculate_distance(lat1, lon1, lat2, lon2):
+    """Haversine distance in km, the coordinates can be scalars or broadcastable arrays"""
     R = 6371  # Radius of the Earth in km
-    d_lat = math.radians(lat2 - lat1)
-    d_lon = math.radians(lon2 - lon1)
+    lat1, lon1, lat2, lon2 = np.radians(lat1), np.radians(lon1), np.radians(lat2), np.radians(lon2)
     a = (
-        math.sin(d_lat / 2) * math.sin(d_lat / 2) +
-        math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
-        math.sin(d_lon / 2) * math.sin(d_lon / 2)
+        np.sin((lat2 - lat1) / 2) ** 2 +
+        np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
     return R * c
 
 
+class StationIndex:
+    """Coordinates of the river stations as arrays, to find the closest ones of many locations at once."""
+
+    def __init__(self, stations):
+        self.station_numbers = np.array([s["Station_Number"] for s in stations])
+        self.latitudes = np.array([s["Latitude"] for s in stations])
+        self.longitudes = np.array([s["Longitude"] for s in stations])
+
+    def distances(self, latitudes, longitudes):
+        """Computes the distance from locations to every station.
+
+        Args:
+            latitudes (float or np.array): latitudes of the locations
+            longitudes (float or np.array): longitudes of the locations
+
+        Returns:
+            np.array: distances in km, of shape (*locations shape, number of stations)
+        """
+        return calculate_distance(
+            np.asarray(latitudes, dtype=float)[..., np.newaxis],
+            np.asarray(longitudes, dtype=float)[..., np.newaxis],
+            self.latitudes,
+            self.longitudes,
+        )
+
+    def nearest(self, latitudes, longitudes):
+        """Finds the closest station of locations, the first listed one on ties.
+
+        Args:
+            latitudes (float or np.array): latitudes of the locations
+            longitudes (float or np.array): longitudes of the locations
+
+        Returns:
+            tuple: position of the closest stations in the index and their distances in km
+        """
+        distances = self.distances(latitudes, longitudes)
+        closest = np.argmin(distances, axis=-1)
+        return closest, np.take_along_axis(distances, closest[..., np.newaxis], -1)[..., 0]
+
+    def weights(self, latitudes, longitudes, k=1, power=2):
+        """Inverse-distance weights of the k closest stations of locations.
+
+        Args:
+            latitudes (float or np.array): latitudes of the locations
+            longitudes (float or np.array): longitudes of the locations
+            k (int): number of stations blended, k=1 selects the closest station
+            power (float): exponent of the inverse distance
+
+        Returns:
+            np.array: weights summing to 1, of shape (*locations shape, number of stations), a
+                location on a station only takes that station
+        """
+        if not 1 <= k <= len(self.station_numbers):
+            raise ValueError(
+                f"k must be between 1 and {len(self.station_numbers)}, got {k}"
+            )
+        distances = self.distances(latitudes, longitudes)
+        # stable sort so that ties keep the first listed station, as nearest does
+        nearest = np.argsort(distances, axis=-1, kind="stable")[..., :k]
+        nearest_distances = np.take_along_axis(distances, nearest, -1)
+        with np.errstate(divide="ignore"):
+            inverse = nearest_distances ** -float(power)
+        on_station = np.isinf(inverse).any(axis=-1, keepdims=True)
+        inverse = np.where(on_station, np.isinf(inverse), inverse)
+        weights = np.zeros_like(distances)
+        np.put_along_axis(
+            weights, nearest, inverse / inverse.sum(axis=-1, keepdims=True), -1
+        )
+        return weights
+
+
+station_index = StationIndex(river_stations)
+
+
 # Function to get Z-Scores for the closest station
-def get_hydro(longitude, latitude, start_date, number_of_days):
-    # Find the closest station
-    closest_station = river_stations[0]
-    min_distance = calculate_distance(
-        latitude, longitude, closest_station["Latitude"], closest_station["Longitude"]
-    )
+def get_hydro(
+    longitude,
+    latitude,
+    start_date,
+    number_of_days,
+    smooth=False,
+    nearest_stations=1,
+    statistic="mean",
+    rng=None,
+):
+    """Hourly normalized river flow of the closest stations, taken from the comparable dates of last year.
+
+    Args:
+        longitude (float or np.array): longitude of the locations
+        latitude (float or np.array): latitude of the locations
+        start_date (str): first day in YYYY-MM-DD format
+        number_of_days (int): number of days
+        smooth (bool): linearly interpolate between the daily means, placed at noon, instead of
+            holding each daily value for 24 hours
+        nearest_stations (int): number of closest stations blended with inverse-distance weights,
+            1 takes the flow of the closest station
+        statistic (str): statistic of the day-of-year climatology used for the days without
+            records, one of CLIMATOLOGY_STATISTICS
+        rng (np.random.Generator): if given, the flow is taken from a random year of the records
+            instead of last year, for Monte Carlo runs
 
-    for station in river_stations[1:]:
-        distance = calculate_distance(
-            latitude, longitude, station["Latitude"], station["Longitude"]
+    Returns:
+        np.array: hourly normalized flow, of shape (*locations shape, 24 * number_of_days)
+    """
+    # Weights of the closest stations, only the stations used by a location are read
+    weights = station_index.weights(latitude, longitude, k=nearest_stations)
+    used = np.flatnonzero(weights.reshape(-1, weights.shape[-1]).any(axis=0))
+    weights = weights[..., used]
+
+    # Get Z-Scores for the stations, the comparable dates of consecutive days are consecutive
+    station_numbers = station_index.station_numbers[used].tolist()
+    if rng is None:
+        flows = river_flow_store().get_stations(
+            station_numbers, comparable_date(start_date), number_of_days, statistic
         )
-        if distance < min_distance:
-            closest_station = station
-            min_distance = distance
-
-    # Get Z-Scores for the closest station
-    station_number = closest_station["Station_Number"]
-    station_flow_data = [
-        data for data in river_flow if data["Station_Number"] == station_number
-    ]
-
-    # Generate the Z-Scores for each day
-    results = []
-    current_date = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-
-    for _ in range(number_of_days):
-        date = current_date.strftime("%Y-%m-%d")
-        comparable = comparable_date(date)
-        flow_data = next(
-            (data for data in station_flow_data if data["date"] == comparable), None
+    else:
+        flows = river_flow_store().sample_stations(
+            station_numbers, start_date, number_of_days, rng, statistic
         )
-        results.append(flow_data["norm"])
 
-        # Move to the next day
-        current_date += timedelta(days=1)
+    # Blend the stations of every location at once, a missing day of a blended station stays missing
+    missing = np.isnan(flows)
+    results = weights @ np.where(missing, 0, flows)
+    results[((weights > 0) @ missing) > 0] = np.nan
+
+    return expand_hourly(results, smooth)
+
+
+def expand_hourly(daily, smooth=False):
+    """Expands daily values to hourly values.
+
+    Args:
+        daily (np.array): daily values along the last axis
+        smooth (bool): linearly interpolate between the daily values, placed at the middle of their
+            day, the first and last half days hold the first and last values
 
-    return [rr for r in results for rr in [r] * 24]
+    Returns:
+        np.array: hourly values, the last axis is 24 times longer
+    """
+    if not smooth or daily.shape[-1] < 2:
+        return np.repeat(daily, 24, axis=-1)
+    number_of_days = daily.shape[-1]
+    position = np.clip((np.arange(24 * number_of_days) - 11.5) / 24, 0, number_of_days - 1)
+    previous = np.minimum(position.astype(int), number_of_days - 2)
+    fraction = position - previous
+    return daily[..., previous] * (1 - fraction) + daily[..., previous + 1] * fraction
@@ -0,0 +1,39 @@
+"""Appends daily river flow observations to the partitioned store read by model.hydro.index.
+
+The source is a CSV file with the Station_Number, date (YYYY-MM-DD) and norm columns, one row per
+station and day. The observations are written to one .npy partition per station and year, the days
+already recorded are left unchanged, then the manifest and the day-of-year climatology of the store
+are updated. Ingesting a new year only writes the partitions of that year.
+
+Example usage:
+    python -m model.hydro.ingest_river_flow model/hydro/river_flow.csv
+"""
+import argparse
+import csv
+
+from model.hydro.index import RIVER_FLOW_DIR, RiverFlowStore
+
+
+def read_records(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("source", help="CSV file of the river flow observations")
+    parser.add_argument(
+        "--store", default=RIVER_FLOW_DIR, help="directory of the partitioned store"
+    )
+    args = parser.parse_args()
+
+    records = read_records(args.source)
+    store = RiverFlowStore(args.store)
+    added = store.ingest(records)
+    print(
+        f"{added} of {len(records)} observations added, {len(store.station_index)} stations, years {store.record_years()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
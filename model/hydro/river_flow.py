@@ -1,10229 +0,0 @@
-river_flow = [
-    {"Station_Number": "2260100", "norm": 0.0096244737, "date": "2020-01-01"},
-    {"Station_Number": "2260100", "norm": 0.0094526081, "date": "2020-01-02"},
-    {"Station_Number": "2260100", "norm": 0.0093666753, "date": "2020-01-03"},
-    {"Station_Number": "2260100", "norm": 0.0093666753, "date": "2020-01-04"},
-    {"Station_Number": "2260100", "norm": 0.0092807425, "date": "2020-01-05"},
-    {"Station_Number": "2260100", "norm": 0.0095385409, "date": "2020-01-06"},
-    {"Station_Number": "2260100", "norm": 0.0103119361, "date": "2020-01-07"},
-    {"Station_Number": "2260100", "norm": 0.0099682049, "date": "2020-01-08"},
-    {"Station_Number": "2260100", "norm": 0.0097963393, "date": "2020-01-09"},
-    {"Station_Number": "2260100", "norm": 0.0097104065, "date": "2020-01-10"},
-    {"Station_Number": "2260100", "norm": 0.0095385409, "date": "2020-01-11"},
-    {"Station_Number": "2260100", "norm": 0.0093666753, "date": "2020-01-12"},
-    {"Station_Number": "2260100", "norm": 0.0092807425, "date": "2020-01-13"},
-    {"Station_Number": "2260100", "norm": 0.0086792129, "date": "2020-01-14"},
-    {"Station_Number": "2260100", "norm": 0.0084214145, "date": "2020-01-15"},
-    {"Station_Number": "2260100", "norm": 0.0079058177, "date": "2020-01-16"},
-    {"Station_Number": "2260100", "norm": 0.0074761536, "date": "2020-01-17"},
-    {"Station_Number": "2260100", "norm": 0.0072183552, "date": "2020-01-18"},
-    {"Station_Number": "2260100", "norm": 0.006874624, "date": "2020-01-19"},
-    {"Station_Number": "2260100", "norm": 0.0067886912, "date": "2020-01-20"},
-    {"Station_Number": "2260100", "norm": 0.0066168256, "date": "2020-01-21"},
-    {"Station_Number": "2260100", "norm": 0.00644496, "date": "2020-01-22"},
-    {"Station_Number": "2260100", "norm": 0.0062730944, "date": "2020-01-23"},
-    {"Station_Number": "2260100", "norm": 0.0062730944, "date": "2020-01-24"},
-    {"Station_Number": "2260100", "norm": 0.0061012288, "date": "2020-01-25"},
-    {"Station_Number": "2260100", "norm": 0.0061012288, "date": "2020-01-26"},
-    {"Station_Number": "2260100", "norm": 0.0059293632, "date": "2020-01-27"},
-    {"Station_Number": "2260100", "norm": 0.0059293632, "date": "2020-01-28"},
-    {"Station_Number": "2260100", "norm": 0.0058434304, "date": "2020-01-29"},
-    {"Station_Number": "2260100", "norm": 0.0057574976, "date": "2020-01-30"},
-    {"Station_Number": "2260100", "norm": 0.0057574976, "date": "2020-01-31"},
-    {"Station_Number": "2260100", "norm": 0.005585632, "date": "2020-02-01"},
-    {"Station_Number": "2260100", "norm": 0.0054996992, "date": "2020-02-02"},
-    {"Station_Number": "2260100", "norm": 0.0053278336, "date": "2020-02-03"},
-    {"Station_Number": "2260100", "norm": 0.0052419008, "date": "2020-02-04"},
-    {"Station_Number": "2260100", "norm": 0.005155968, "date": "2020-02-05"},
-    {"Station_Number": "2260100", "norm": 0.0050700352, "date": "2020-02-06"},
-    {"Station_Number": "2260100", "norm": 0.0050700352, "date": "2020-02-07"},
-    {"Station_Number": "2260100", "norm": 0.0049841024, "date": "2020-02-08"},
-    {"Station_Number": "2260100", "norm": 0.0049841024, "date": "2020-02-09"},
-    {"Station_Number": "2260100", "norm": 0.0048981696, "date": "2020-02-10"},
-    {"Station_Number": "2260100", "norm": 0.0048981696, "date": "2020-02-11"},
-    {"Station_Number": "2260100", "norm": 0.004726304, "date": "2020-02-12"},
-    {"Station_Number": "2260100", "norm": 0.004726304, "date": "2020-02-13"},
-    {"Station_Number": "2260100", "norm": 0.0046403712, "date": "2020-02-14"},
-    {"Station_Number": "2260100", "norm": 0.0045544384, "date": "2020-02-15"},
-    {"Station_Number": "2260100", "norm": 0.0044685056, "date": "2020-02-16"},
-    {"Station_Number": "2260100", "norm": 0.0044685056, "date": "2020-02-17"},
-    {"Station_Number": "2260100", "norm": 0.00429664, "date": "2020-02-18"},
-    {"Station_Number": "2260100", "norm": 0.0042107072, "date": "2020-02-19"},
-    {"Station_Number": "2260100", "norm": 0.0042107072, "date": "2020-02-20"},
-    {"Station_Number": "2260100", "norm": 0.0041247744, "date": "2020-02-21"},
-    {"Station_Number": "2260100", "norm": 0.0041247744, "date": "2020-02-22"},
-    {"Station_Number": "2260100", "norm": 0.0040388416, "date": "2020-02-23"},
-    {"Station_Number": "2260100", "norm": 0.0040388416, "date": "2020-02-24"},
-    {"Station_Number": "2260100", "norm": 0.0039529088, "date": "2020-02-25"},
-    {"Station_Number": "2260100", "norm": 0.0039529088, "date": "2020-02-26"},
-    {"Station_Number": "2260100", "norm": 0.0039529088, "date": "2020-02-27"},
-    {"Station_Number": "2260100", "norm": 0.0041247744, "date": "2020-02-28"},
-    {"Station_Number": "2260100", "norm": 0.0043825728, "date": "2020-02-29"},
-    {"Station_Number": "2260100", "norm": 0.0043825728, "date": "2020-03-01"},
-    {"Station_Number": "2260100", "norm": 0.0043825728, "date": "2020-03-02"},
-    {"Station_Number": "2260100", "norm": 0.0046403712, "date": "2020-03-03"},
-    {"Station_Number": "2260100", "norm": 0.0048981696, "date": "2020-03-04"},
-    {"Station_Number": "2260100", "norm": 0.004726304, "date": "2020-03-05"},
-    {"Station_Number": "2260100", "norm": 0.0045544384, "date": "2020-03-06"},
-    {"Station_Number": "2260100", "norm": 0.0044685056, "date": "2020-03-07"},
-    {"Station_Number": "2260100", "norm": 0.0043825728, "date": "2020-03-08"},
-    {"Station_Number": "2260100", "norm": 0.0043825728, "date": "2020-03-09"},
-    {"Station_Number": "2260100", "norm": 0.00429664, "date": "2020-03-10"},
-    {"Station_Number": "2260100", "norm": 0.0041247744, "date": "2020-03-11"},
-    {"Station_Number": "2260100", "norm": 0.0040388416, "date": "2020-03-12"},
-    {"Station_Number": "2260100", "norm": 0.0039529088, "date": "2020-03-13"},
-    {"Station_Number": "2260100", "norm": 0.003866976, "date": "2020-03-14"},
-    {"Station_Number": "2260100", "norm": 0.0036951104, "date": "2020-03-15"},
-    {"Station_Number": "2260100", "norm": 0.0036091776, "date": "2020-03-16"},
-    {"Station_Number": "2260100", "norm": 0.0035232448, "date": "2020-03-17"},
-    {"Station_Number": "2260100", "norm": 0.0033513792, "date": "2020-03-18"},
-    {"Station_Number": "2260100", "norm": 0.0032654464, "date": "2020-03-19"},
-    {"Station_Number": "2260100", "norm": 0.0030935808, "date": "2020-03-20"},
-    {"Station_Number": "2260100", "norm": 0.0028357824, "date": "2020-03-21"},
-    {"Station_Number": "2260100", "norm": 0.0026639168, "date": "2020-03-22"},
-    {"Station_Number": "2260100", "norm": 0.0024920512, "date": "2020-03-23"},
-    {"Station_Number": "2260100", "norm": 0.0023201856, "date": "2020-03-24"},
-    {"Station_Number": "2260100", "norm": 0.00214832, "date": "2020-03-25"},
-    {"Station_Number": "2260100", "norm": 0.0019764544, "date": "2020-03-26"},
-    {"Station_Number": "2260100", "norm": 0.0018905216, "date": "2020-03-27"},
-    {"Station_Number": "2260100", "norm": 0.0018045888, "date": "2020-03-28"},
-    {"Station_Number": "2260100", "norm": 0.0018905216, "date": "2020-03-29"},
-    {"Station_Number": "2260100", "norm": 0.0020623872, "date": "2020-03-30"},
-    {"Station_Number": "2260100", "norm": 0.0019764544, "date": "2020-03-31"},
-    {"Station_Number": "2260100", "norm": 0.0018905216, "date": "2020-04-01"},
-    {"Station_Number": "2260100", "norm": 0.001718656, "date": "2020-04-02"},
-    {"Station_Number": "2260100", "norm": 0.0016327232, "date": "2020-04-03"},
-    {"Station_Number": "2260100", "norm": 0.0015467904, "date": "2020-04-04"},
-    {"Station_Number": "2260100", "norm": 0.0014608576, "date": "2020-04-05"},
-    {"Station_Number": "2260100", "norm": 0.0013749248, "date": "2020-04-06"},
-    {"Station_Number": "2260100", "norm": 0.0012030592, "date": "2020-04-07"},
-    {"Station_Number": "2260100", "norm": 0.0011171264, "date": "2020-04-08"},
-    {"Station_Number": "2260100", "norm": 0.0011171264, "date": "2020-04-09"},
-    {"Station_Number": "2260100", "norm": 0.001288992, "date": "2020-04-10"},
-    {"Station_Number": "2260100", "norm": 0.0013749248, "date": "2020-04-11"},
-    {"Station_Number": "2260100", "norm": 0.0015467904, "date": "2020-04-12"},
-    {"Station_Number": "2260100", "norm": 0.0019764544, "date": "2020-04-13"},
-    {"Station_Number": "2260100", "norm": 0.0020623872, "date": "2020-04-14"},
-    {"Station_Number": "2260100", "norm": 0.00214832, "date": "2020-04-15"},
-    {"Station_Number": "2260100", "norm": 0.0023201856, "date": "2020-04-16"},
-    {"Station_Number": "2260100", "norm": 0.00214832, "date": "2020-04-17"},
-    {"Station_Number": "2260100", "norm": 0.0023201856, "date": "2020-04-18"},
-    {"Station_Number": "2260100", "norm": 0.0024920512, "date": "2020-04-19"},
-    {"Station_Number": "2260100", "norm": 0.0027498496, "date": "2020-04-20"},
-    {"Station_Number": "2260100", "norm": 0.0032654464, "date": "2020-04-21"},
-    {"Station_Number": "2260100", "norm": 0.0036951104, "date": "2020-04-22"},
-    {"Station_Number": "2260100", "norm": 0.0042107072, "date": "2020-04-23"},
-    {"Station_Number": "2260100", "norm": 0.0075620864, "date": "2020-04-24"},
-    {"Station_Number": "2260100", "norm": 0.0091948097, "date": "2020-04-25"},
-    {"Station_Number": "2260100", "norm": 0.0091088769, "date": "2020-04-26"},
-    {"Station_Number": "2260100", "norm": 0.0095385409, "date": "2020-04-27"},
-    {"Station_Number": "2260100", "norm": 0.0109134657, "date": "2020-04-28"},
-    {"Station_Number": "2260100", "norm": 0.0110853313, "date": "2020-04-29"},
-    {"Station_Number": "2260100", "norm": 0.0096244737, "date": "2020-04-30"},
-    {"Station_Number": "2260100", "norm": 0.0099682049, "date": "2020-05-01"},
-    {"Station_Number": "2260100", "norm": 0.0098822721, "date": "2020-05-02"},
-    {"Station_Number": "2260100", "norm": 0.0097104065, "date": "2020-05-03"},
-    {"Station_Number": "2260100", "norm": 0.0094526081, "date": "2020-05-04"},
-    {"Station_Number": "2260100", "norm": 0.0093666753, "date": "2020-05-05"},
-    {"Station_Number": "2260100", "norm": 0.0088510785, "date": "2020-05-06"},
-    {"Station_Number": "2260100", "norm": 0.0073902208, "date": "2020-05-07"},
-    {"Station_Number": "2260100", "norm": 0.0076480192, "date": "2020-05-08"},
-    {"Station_Number": "2260100", "norm": 0.0092807425, "date": "2020-05-09"},
-    {"Station_Number": "2260100", "norm": 0.0082495489, "date": "2020-05-10"},
-    {"Station_Number": "2260100", "norm": 0.0074761536, "date": "2020-05-11"},
-    {"Station_Number": "2260100", "norm": 0.0071324224, "date": "2020-05-12"},
-    {"Station_Number": "2260100", "norm": 0.0065308928, "date": "2020-05-13"},
-    {"Station_Number": "2260100", "norm": 0.0061012288, "date": "2020-05-14"},
-    {"Station_Number": "2260100", "norm": 0.0061871616, "date": "2020-05-15"},
-    {"Station_Number": "2260100", "norm": 0.0096244737, "date": "2020-05-16"},
-    {"Station_Number": "2260100", "norm": 0.0109993985, "date": "2020-05-17"},
-    {"Station_Number": "2260100", "norm": 0.0109993985, "date": "2020-05-18"},
-    {"Station_Number": "2260100", "norm": 0.0103978689, "date": "2020-05-19"},
-    {"Station_Number": "2260100", "norm": 0.0097963393, "date": "2020-05-20"},
-    {"Station_Number": "2260100", "norm": 0.0095385409, "date": "2020-05-21"},
-    {"Station_Number": "2260100", "norm": 0.0110853313, "date": "2020-05-22"},
-    {"Station_Number": "2260100", "norm": 0.0184755521, "date": "2020-05-23"},
-    {"Station_Number": "2260100", "norm": 0.0379822978, "date": "2020-05-24"},
-    {"Station_Number": "2260100", "norm": 0.0476927043, "date": "2020-05-25"},
-    {"Station_Number": "2260100", "norm": 0.0349746498, "date": "2020-05-26"},
-    {"Station_Number": "2260100", "norm": 0.0621294148, "date": "2020-05-27"},
-    {"Station_Number": "2260100", "norm": 0.1248603592, "date": "2020-05-28"},
-    {"Station_Number": "2260100", "norm": 0.1052676807, "date": "2020-05-29"},
-    {"Station_Number": "2260100", "norm": 0.0840422789, "date": "2020-05-30"},
-    {"Station_Number": "2260100", "norm": 0.0717538885, "date": "2020-05-31"},
-    {"Station_Number": "2260100", "norm": 0.0580046404, "date": "2020-06-01"},
-    {"Station_Number": "2260100", "norm": 0.0543095299, "date": "2020-06-02"},
-    {"Station_Number": "2260100", "norm": 0.0513878147, "date": "2020-06-03"},
-    {"Station_Number": "2260100", "norm": 0.056028186, "date": "2020-06-04"},
-    {"Station_Number": "2260100", "norm": 0.0614419524, "date": "2020-06-05"},
-    {"Station_Number": "2260100", "norm": 0.0880811206, "date": "2020-06-06"},
-    {"Station_Number": "2260100", "norm": 0.0769098565, "date": "2020-06-07"},
-    {"Station_Number": "2260100", "norm": 0.0938386182, "date": "2020-06-08"},
-    {"Station_Number": "2260100", "norm": 0.0971040646, "date": "2020-06-09"},
-    {"Station_Number": "2260100", "norm": 0.0842141445, "date": "2020-06-10"},
-    {"Station_Number": "2260100", "norm": 0.094354215, "date": "2020-06-11"},
-    {"Station_Number": "2260100", "norm": 0.1081034631, "date": "2020-06-12"},
-    {"Station_Number": "2260100", "norm": 0.1270086792, "date": "2020-06-13"},
-    {"Station_Number": "2260100", "norm": 0.1367190857, "date": "2020-06-14"},
-    {"Station_Number": "2260100", "norm": 0.1285554696, "date": "2020-06-15"},
-    {"Station_Number": "2260100", "norm": 0.1656784395, "date": "2020-06-16"},
-    {"Station_Number": "2260100", "norm": 0.2423304976, "date": "2020-06-17"},
-    {"Station_Number": "2260100", "norm": 0.3070378964, "date": "2020-06-18"},
-    {"Station_Number": "2260100", "norm": 0.3798229784, "date": "2020-06-19"},
-    {"Station_Number": "2260100", "norm": 0.3766434648, "date": "2020-06-20"},
-    {"Station_Number": "2260100", "norm": 0.4313826588, "date": "2020-06-21"},
-    {"Station_Number": "2260100", "norm": 0.55753201, "date": "2020-06-22"},
-    {"Station_Number": "2260100", "norm": 0.524791613, "date": "2020-06-23"},
-    {"Station_Number": "2260100", "norm": 0.473489731, "date": "2020-06-24"},
-    {"Station_Number": "2260100", "norm": 0.4560453725, "date": "2020-06-25"},
-    {"Station_Number": "2260100", "norm": 0.4348199708, "date": "2020-06-26"},
-    {"Station_Number": "2260100", "norm": 0.3666752599, "date": "2020-06-27"},
-    {"Station_Number": "2260100", "norm": 0.3405516886, "date": "2020-06-28"},
-    {"Station_Number": "2260100", "norm": 0.3611755607, "date": "2020-06-29"},
-    {"Station_Number": "2260100", "norm": 0.3460513878, "date": "2020-06-30"},
-    {"Station_Number": "2260100", "norm": 0.3336770645, "date": "2020-07-01"},
-    {"Station_Number": "2260100", "norm": 0.3048036436, "date": "2020-07-02"},
-    {"Station_Number": "2260100", "norm": 0.2764458194, "date": "2020-07-03"},
-    {"Station_Number": "2260100", "norm": 0.2583999313, "date": "2020-07-04"},
-    {"Station_Number": "2260100", "norm": 0.2855546962, "date": "2020-07-05"},
-    {"Station_Number": "2260100", "norm": 0.4316404572, "date": "2020-07-06"},
-    {"Station_Number": "2260100", "norm": 0.5033084128, "date": "2020-07-07"},
-    {"Station_Number": "2260100", "norm": 0.5711953253, "date": "2020-07-08"},
-    {"Station_Number": "2260100", "norm": 0.6494801066, "date": "2020-07-09"},
-    {"Station_Number": "2260100", "norm": 0.6926183724, "date": "2020-07-10"},
-    {"Station_Number": "2260100", "norm": 0.6702758443, "date": "2020-07-11"},
-    {"Station_Number": "2260100", "norm": 0.6631434218, "date": "2020-07-12"},
-    {"Station_Number": "2260100", "norm": 0.6956260205, "date": "2020-07-13"},
-    {"Station_Number": "2260100", "norm": 0.7585288305, "date": "2020-07-14"},
-    {"Station_Number": "2260100", "norm": 0.8288218613, "date": "2020-07-15"},
-    {"Station_Number": "2260100", "norm": 0.8081979892, "date": "2020-07-16"},
-    {"Station_Number": "2260100", "norm": 0.7934175475, "date": "2020-07-17"},
-    {"Station_Number": "2260100", "norm": 0.7319755951, "date": "2020-07-18"},
-    {"Station_Number": "2260100", "norm": 0.7059379565, "date": "2020-07-19"},
-    {"Station_Number": "2260100", "norm": 0.7267336943, "date": "2020-07-20"},
-    {"Station_Number": "2260100", "norm": 0.8157600756, "date": "2020-07-21"},
-    {"Station_Number": "2260100", "norm": 0.9003179514, "date": "2020-07-22"},
-    {"Station_Number": "2260100", "norm": 0.8868265017, "date": "2020-07-23"},
-    {"Station_Number": "2260100", "norm": 0.8782332216, "date": "2020-07-24"},
-    {"Station_Number": "2260100", "norm": 0.8258142133, "date": "2020-07-25"},
-    {"Station_Number": "2260100", "norm": 0.7669502449, "date": "2020-07-26"},
-    {"Station_Number": "2260100", "norm": 0.7026725101, "date": "2020-07-27"},
-    {"Station_Number": "2260100", "norm": 0.6107244135, "date": "2020-07-28"},
-    {"Station_Number": "2260100", "norm": 0.5196356449, "date": "2020-07-29"},
-    {"Station_Number": "2260100", "norm": 0.4436710492, "date": "2020-07-30"},
-    {"Station_Number": "2260100", "norm": 0.4044856922, "date": "2020-07-31"},
-    {"Station_Number": "2260100", "norm": 0.3497464982, "date": "2020-08-01"},
-    {"Station_Number": "2260100", "norm": 0.3035146515, "date": "2020-08-02"},
-    {"Station_Number": "2260100", "norm": 0.2566812752, "date": "2020-08-03"},
-    {"Station_Number": "2260100", "norm": 0.2394947151, "date": "2020-08-04"},
-    {"Station_Number": "2260100", "norm": 0.2260032654, "date": "2020-08-05"},
-    {"Station_Number": "2260100", "norm": 0.221448827, "date": "2020-08-06"},
-    {"Station_Number": "2260100", "norm": 0.2382057231, "date": "2020-08-07"},
-    {"Station_Number": "2260100", "norm": 0.2543610896, "date": "2020-08-08"},
-    {"Station_Number": "2260100", "norm": 0.3065222996, "date": "2020-08-09"},
-    {"Station_Number": "2260100", "norm": 0.4422961244, "date": "2020-08-10"},
-    {"Station_Number": "2260100", "norm": 0.5548680932, "date": "2020-08-11"},
-    {"Station_Number": "2260100", "norm": 0.5918191974, "date": "2020-08-12"},
-    {"Station_Number": "2260100", "norm": 0.6586749162, "date": "2020-08-13"},
-    {"Station_Number": "2260100", "norm": 0.7128125806, "date": "2020-08-14"},
-    {"Station_Number": "2260100", "norm": 0.7557789808, "date": "2020-08-15"},
-    {"Station_Number": "2260100", "norm": 0.7643722609, "date": "2020-08-16"},
-    {"Station_Number": "2260100", "norm": 0.8090573172, "date": "2020-08-17"},
-    {"Station_Number": "2260100", "norm": 0.9254962619, "date": "2020-08-18"},
-    {"Station_Number": "2260100", "norm": 1.0, "date": "2020-08-19"},
-    {"Station_Number": "2260100", "norm": 0.9338317436, "date": "2020-08-20"},
-    {"Station_Number": "2260100", "norm": 0.8547735671, "date": "2020-08-21"},
-    {"Station_Number": "2260100", "norm": 0.7739967346, "date": "2020-08-22"},
-    {"Station_Number": "2260100", "norm": 0.6717367019, "date": "2020-08-23"},
-    {"Station_Number": "2260100", "norm": 0.5551258916, "date": "2020-08-24"},
-    {"Station_Number": "2260100", "norm": 0.466615107, "date": "2020-08-25"},
-    {"Station_Number": "2260100", "norm": 0.3981266649, "date": "2020-08-26"},
-    {"Station_Number": "2260100", "norm": 0.3482856406, "date": "2020-08-27"},
-    {"Station_Number": "2260100", "norm": 0.3385752342, "date": "2020-08-28"},
-    {"Station_Number": "2260100", "norm": 0.3242244565, "date": "2020-08-29"},
-    {"Station_Number": "2260100", "norm": 0.2999054739, "date": "2020-08-30"},
-    {"Station_Number": "2260100", "norm": 0.2764458194, "date": "2020-08-31"},
-    {"Station_Number": "2260100", "norm": 0.2794534674, "date": "2020-09-01"},
-    {"Station_Number": "2260100", "norm": 0.2810002578, "date": "2020-09-02"},
-    {"Station_Number": "2260100", "norm": 0.2606341841, "date": "2020-09-03"},
-    {"Station_Number": "2260100", "norm": 0.2365729999, "date": "2020-09-04"},
-    {"Station_Number": "2260100", "norm": 0.213285211, "date": "2020-09-05"},
-    {"Station_Number": "2260100", "norm": 0.2004812237, "date": "2020-09-06"},
-    {"Station_Number": "2260100", "norm": 0.1978173069, "date": "2020-09-07"},
-    {"Station_Number": "2260100", "norm": 0.1923176076, "date": "2020-09-08"},
-    {"Station_Number": "2260100", "norm": 0.1858726476, "date": "2020-09-09"},
-    {"Station_Number": "2260100", "norm": 0.1798573516, "date": "2020-09-10"},
-    {"Station_Number": "2260100", "norm": 0.2300421071, "date": "2020-09-11"},
-    {"Station_Number": "2260100", "norm": 0.3078112916, "date": "2020-09-12"},
-    {"Station_Number": "2260100", "norm": 0.3400360918, "date": "2020-09-13"},
-    {"Station_Number": "2260100", "norm": 0.3658159319, "date": "2020-09-14"},
-    {"Station_Number": "2260100", "norm": 0.4232190427, "date": "2020-09-15"},
-    {"Station_Number": "2260100", "norm": 0.4520065309, "date": "2020-09-16"},
-    {"Station_Number": "2260100", "norm": 0.4305233308, "date": "2020-09-17"},
-    {"Station_Number": "2260100", "norm": 0.3875569305, "date": "2020-09-18"},
-    {"Station_Number": "2260100", "norm": 0.3396923606, "date": "2020-09-19"},
-    {"Station_Number": "2260100", "norm": 0.2904528659, "date": "2020-09-20"},
-    {"Station_Number": "2260100", "norm": 0.2515253072, "date": "2020-09-21"},
-    {"Station_Number": "2260100", "norm": 0.2584858641, "date": "2020-09-22"},
-    {"Station_Number": "2260100", "norm": 0.3546446679, "date": "2020-09-23"},
-    {"Station_Number": "2260100", "norm": 0.5106986337, "date": "2020-09-24"},
-    {"Station_Number": "2260100", "norm": 0.5738592421, "date": "2020-09-25"},
-    {"Station_Number": "2260100", "norm": 0.6389103721, "date": "2020-09-26"},
-    {"Station_Number": "2260100", "norm": 0.6744006187, "date": "2020-09-27"},
-    {"Station_Number": "2260100", "norm": 0.712640715, "date": "2020-09-28"},
-    {"Station_Number": "2260100", "norm": 0.7050786285, "date": "2020-09-29"},
-    {"Station_Number": "2260100", "norm": 0.6801581164, "date": "2020-09-30"},
-    {"Station_Number": "2260100", "norm": 0.6416602217, "date": "2020-10-01"},
-    {"Station_Number": "2260100", "norm": 0.5720546533, "date": "2020-10-02"},
-    {"Station_Number": "2260100", "norm": 0.4849187935, "date": "2020-10-03"},
-    {"Station_Number": "2260100", "norm": 0.3903927129, "date": "2020-10-04"},
-    {"Station_Number": "2260100", "norm": 0.3480278422, "date": "2020-10-05"},
-    {"Station_Number": "2260100", "norm": 0.376987196, "date": "2020-10-06"},
-    {"Station_Number": "2260100", "norm": 0.4972931168, "date": "2020-10-07"},
-    {"Station_Number": "2260100", "norm": 0.4574202973, "date": "2020-10-08"},
-    {"Station_Number": "2260100", "norm": 0.382143164, "date": "2020-10-09"},
-    {"Station_Number": "2260100", "norm": 0.3271461717, "date": "2020-10-10"},
-    {"Station_Number": "2260100", "norm": 0.2859843602, "date": "2020-10-11"},
-    {"Station_Number": "2260100", "norm": 0.256337544, "date": "2020-10-12"},
-    {"Station_Number": "2260100", "norm": 0.2309873679, "date": "2020-10-13"},
-    {"Station_Number": "2260100", "norm": 0.2120821518, "date": "2020-10-14"},
-    {"Station_Number": "2260100", "norm": 0.1863023116, "date": "2020-10-15"},
-    {"Station_Number": "2260100", "norm": 0.1755607115, "date": "2020-10-16"},
-    {"Station_Number": "2260100", "norm": 0.1681704907, "date": "2020-10-17"},
-    {"Station_Number": "2260100", "norm": 0.1570851594, "date": "2020-10-18"},
-    {"Station_Number": "2260100", "norm": 0.155108705, "date": "2020-10-19"},
-    {"Station_Number": "2260100", "norm": 0.1750451147, "date": "2020-10-20"},
-    {"Station_Number": "2260100", "norm": 0.2122540174, "date": "2020-10-21"},
-    {"Station_Number": "2260100", "norm": 0.374409212, "date": "2020-10-22"},
-    {"Station_Number": "2260100", "norm": 0.465755779, "date": "2020-10-23"},
-    {"Station_Number": "2260100", "norm": 0.5044255392, "date": "2020-10-24"},
-    {"Station_Number": "2260100", "norm": 0.5742889061, "date": "2020-10-25"},
-    {"Station_Number": "2260100", "norm": 0.5826243877, "date": "2020-10-26"},
-    {"Station_Number": "2260100", "norm": 0.5407751139, "date": "2020-10-27"},
-    {"Station_Number": "2260100", "norm": 0.463177795, "date": "2020-10-28"},
-    {"Station_Number": "2260100", "norm": 0.3626364183, "date": "2020-10-29"},
-    {"Station_Number": "2260100", "norm": 0.2773910802, "date": "2020-10-30"},
-    {"Station_Number": "2260100", "norm": 0.2302999055, "date": "2020-10-31"},
-    {"Station_Number": "2260100", "norm": 0.247744264, "date": "2020-11-01"},
-    {"Station_Number": "2260100", "norm": 0.2930308499, "date": "2020-11-02"},
-    {"Station_Number": "2260100", "norm": 0.3254275157, "date": "2020-11-03"},
-    {"Station_Number": "2260100", "norm": 0.3039443155, "date": "2020-11-04"},
-    {"Station_Number": "2260100", "norm": 0.2648448913, "date": "2020-11-05"},
-    {"Station_Number": "2260100", "norm": 0.2291827791, "date": "2020-11-06"},
-    {"Station_Number": "2260100", "norm": 0.2142304718, "date": "2020-11-07"},
-    {"Station_Number": "2260100", "norm": 0.1929191372, "date": "2020-11-08"},
-    {"Station_Number": "2260100", "norm": 0.1703188107, "date": "2020-11-09"},
-    {"Station_Number": "2260100", "norm": 0.155108705, "date": "2020-11-10"},
-    {"Station_Number": "2260100", "norm": 0.1494371402, "date": "2020-11-11"},
-    {"Station_Number": "2260100", "norm": 0.1460857609, "date": "2020-11-12"},
-    {"Station_Number": "2260100", "norm": 0.1359456905, "date": "2020-11-13"},
-    {"Station_Number": "2260100", "norm": 0.1248603592, "date": "2020-11-14"},
-    {"Station_Number": "2260100", "norm": 0.1144624903, "date": "2020-11-15"},
-    {"Station_Number": "2260100", "norm": 0.1062988743, "date": "2020-11-16"},
-    {"Station_Number": "2260100", "norm": 0.1028615623, "date": "2020-11-17"},
-    {"Station_Number": "2260100", "norm": 0.101228839, "date": "2020-11-18"},
-    {"Station_Number": "2260100", "norm": 0.099510183, "date": "2020-11-19"},
-    {"Station_Number": "2260100", "norm": 0.0989945862, "date": "2020-11-20"},
-    {"Station_Number": "2260100", "norm": 0.0975337286, "date": "2020-11-21"},
-    {"Station_Number": "2260100", "norm": 0.094783879, "date": "2020-11-22"},
-    {"Station_Number": "2260100", "norm": 0.091346567, "date": "2020-11-23"},
-    {"Station_Number": "2260100", "norm": 0.0889404486, "date": "2020-11-24"},
-    {"Station_Number": "2260100", "norm": 0.086620263, "date": "2020-11-25"},
-    {"Station_Number": "2260100", "norm": 0.0824954885, "date": "2020-11-26"},
-    {"Station_Number": "2260100", "norm": 0.0797456389, "date": "2020-11-27"},
-    {"Station_Number": "2260100", "norm": 0.0766520581, "date": "2020-11-28"},
-    {"Station_Number": "2260100", "norm": 0.0734725445, "date": "2020-11-29"},
-    {"Station_Number": "2260100", "norm": 0.0707226949, "date": "2020-11-30"},
-    {"Station_Number": "2260100", "norm": 0.066769786, "date": "2020-12-01"},
-    {"Station_Number": "2260100", "norm": 0.0627309444, "date": "2020-12-02"},
-    {"Station_Number": "2260100", "norm": 0.059895162, "date": "2020-12-03"},
-    {"Station_Number": "2260100", "norm": 0.0556844548, "date": "2020-12-04"},
-    {"Station_Number": "2260100", "norm": 0.0519893443, "date": "2020-12-05"},
-    {"Station_Number": "2260100", "norm": 0.0500988227, "date": "2020-12-06"},
-    {"Station_Number": "2260100", "norm": 0.0489816963, "date": "2020-12-07"},
-    {"Station_Number": "2260100", "norm": 0.0487238979, "date": "2020-12-08"},
-    {"Station_Number": "2260100", "norm": 0.0476927043, "date": "2020-12-09"},
-    {"Station_Number": "2260100", "norm": 0.0470052419, "date": "2020-12-10"},
-    {"Station_Number": "2260100", "norm": 0.0464037123, "date": "2020-12-11"},
-    {"Station_Number": "2260100", "norm": 0.0458021827, "date": "2020-12-12"},
-    {"Station_Number": "2260100", "norm": 0.0451147203, "date": "2020-12-13"},
-    {"Station_Number": "2260100", "norm": 0.0442553923, "date": "2020-12-14"},
-    {"Station_Number": "2260100", "norm": 0.0438257283, "date": "2020-12-15"},
-    {"Station_Number": "2260100", "norm": 0.0432241987, "date": "2020-12-16"},
-    {"Station_Number": "2260100", "norm": 0.0416774083, "date": "2020-12-17"},
-    {"Station_Number": "2260100", "norm": 0.0395290883, "date": "2020-12-18"},
-    {"Station_Number": "2260100", "norm": 0.0384978946, "date": "2020-12-19"},
-    {"Station_Number": "2260100", "norm": 0.0373807682, "date": "2020-12-20"},
-    {"Station_Number": "2260100", "norm": 0.0365214402, "date": "2020-12-21"},
-    {"Station_Number": "2260100", "norm": 0.0354902466, "date": "2020-12-22"},
-    {"Station_Number": "2260100", "norm": 0.0348027842, "date": "2020-12-23"},
-    {"Station_Number": "2260100", "norm": 0.0343731202, "date": "2020-12-24"},
-    {"Station_Number": "2260100", "norm": 0.0339434562, "date": "2020-12-25"},
-    {"Station_Number": "2260100", "norm": 0.0335137922, "date": "2020-12-26"},
-    {"Station_Number": "2260100", "norm": 0.0330841282, "date": "2020-12-27"},
-    {"Station_Number": "2260100", "norm": 0.0323966658, "date": "2020-12-28"},
-    {"Station_Number": "2260100", "norm": 0.0305061442, "date": "2020-12-29"},
-    {"Station_Number": "2260100", "norm": 0.0300764802, "date": "2020-12-30"},
-    {"Station_Number": "2260100", "norm": 0.0296468162, "date": "2020-12-31"},
-    {"Station_Number": "2260100", "norm": 0.0354010356, "date": "2021-01-01"},
-    {"Station_Number": "2260100", "norm": 0.0348726619, "date": "2021-01-02"},
-    {"Station_Number": "2260100", "norm": 0.0341329388, "date": "2021-01-03"},
-    {"Station_Number": "2260100", "norm": 0.0330761915, "date": "2021-01-04"},
-    {"Station_Number": "2260100", "norm": 0.0322307936, "date": "2021-01-05"},
-    {"Station_Number": "2260100", "norm": 0.0309626968, "date": "2021-01-06"},
-    {"Station_Number": "2260100", "norm": 0.0295889253, "date": "2021-01-07"},
-    {"Station_Number": "2260100", "norm": 0.028532178, "date": "2021-01-08"},
-    {"Station_Number": "2260100", "norm": 0.0266300328, "date": "2021-01-09"},
-    {"Station_Number": "2260100", "norm": 0.0248335623, "date": "2021-01-10"},
-    {"Station_Number": "2260100", "norm": 0.0230370918, "date": "2021-01-11"},
-    {"Station_Number": "2260100", "norm": 0.0216633203, "date": "2021-01-12"},
-    {"Station_Number": "2260100", "norm": 0.0209235972, "date": "2021-01-13"},
-    {"Station_Number": "2260100", "norm": 0.0200781993, "date": "2021-01-14"},
-    {"Station_Number": "2260100", "norm": 0.019021452, "date": "2021-01-15"},
-    {"Station_Number": "2260100", "norm": 0.0184930783, "date": "2021-01-16"},
-    {"Station_Number": "2260100", "norm": 0.0179647046, "date": "2021-01-17"},
-    {"Station_Number": "2260100", "norm": 0.017436331, "date": "2021-01-18"},
-    {"Station_Number": "2260100", "norm": 0.017436331, "date": "2021-01-19"},
-    {"Station_Number": "2260100", "norm": 0.0169079573, "date": "2021-01-20"},
-    {"Station_Number": "2260100", "norm": 0.0163795836, "date": "2021-01-21"},
-    {"Station_Number": "2260100", "norm": 0.0163795836, "date": "2021-01-22"},
-    {"Station_Number": "2260100", "norm": 0.0160625594, "date": "2021-01-23"},
-    {"Station_Number": "2260100", "norm": 0.0184930783, "date": "2021-01-24"},
-    {"Station_Number": "2260100", "norm": 0.019021452, "date": "2021-01-25"},
-    {"Station_Number": "2260100", "norm": 0.0182817288, "date": "2021-01-26"},
-    {"Station_Number": "2260100", "norm": 0.0171193068, "date": "2021-01-27"},
-    {"Station_Number": "2260100", "norm": 0.0156398605, "date": "2021-01-28"},
-    {"Station_Number": "2260100", "norm": 0.0153228363, "date": "2021-01-29"},
-    {"Station_Number": "2260100", "norm": 0.0150058121, "date": "2021-01-30"},
-    {"Station_Number": "2260100", "norm": 0.0145831132, "date": "2021-01-31"},
-    {"Station_Number": "2260100", "norm": 0.0143717637, "date": "2021-02-01"},
-    {"Station_Number": "2260100", "norm": 0.0140547395, "date": "2021-02-02"},
-    {"Station_Number": "2260100", "norm": 0.01384339, "date": "2021-02-03"},
-    {"Station_Number": "2260100", "norm": 0.0137377153, "date": "2021-02-04"},
-    {"Station_Number": "2260100", "norm": 0.0137377153, "date": "2021-02-05"},
-    {"Station_Number": "2260100", "norm": 0.0136320406, "date": "2021-02-06"},
-    {"Station_Number": "2260100", "norm": 0.0135263658, "date": "2021-02-07"},
-    {"Station_Number": "2260100", "norm": 0.0134206911, "date": "2021-02-08"},
-    {"Station_Number": "2260100", "norm": 0.0134206911, "date": "2021-02-09"},
-    {"Station_Number": "2260100", "norm": 0.0133150164, "date": "2021-02-10"},
-    {"Station_Number": "2260100", "norm": 0.0132093416, "date": "2021-02-11"},
-    {"Station_Number": "2260100", "norm": 0.0131036669, "date": "2021-02-12"},
-    {"Station_Number": "2260100", "norm": 0.0129979922, "date": "2021-02-13"},
-    {"Station_Number": "2260100", "norm": 0.0127866427, "date": "2021-02-14"},
-    {"Station_Number": "2260100", "norm": 0.0125752932, "date": "2021-02-15"},
-    {"Station_Number": "2260100", "norm": 0.0125752932, "date": "2021-02-16"},
-    {"Station_Number": "2260100", "norm": 0.0124696185, "date": "2021-02-17"},
-    {"Station_Number": "2260100", "norm": 0.0124696185, "date": "2021-02-18"},
-    {"Station_Number": "2260100", "norm": 0.0123639438, "date": "2021-02-19"},
-    {"Station_Number": "2260100", "norm": 0.0123639438, "date": "2021-02-20"},
-    {"Station_Number": "2260100", "norm": 0.0123639438, "date": "2021-02-21"},
-    {"Station_Number": "2260100", "norm": 0.012258269, "date": "2021-02-22"},
-    {"Station_Number": "2260100", "norm": 0.012258269, "date": "2021-02-23"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-02-24"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-02-25"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-02-26"},
-    {"Station_Number": "2260100", "norm": 0.0120469196, "date": "2021-02-27"},
-    {"Station_Number": "2260100", "norm": 0.0120469196, "date": "2021-02-28"},
-    {"Station_Number": "2260100", "norm": 0.0120469196, "date": "2021-03-01"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-03-02"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-03-03"},
-    {"Station_Number": "2260100", "norm": 0.0118355701, "date": "2021-03-04"},
-    {"Station_Number": "2260100", "norm": 0.0118355701, "date": "2021-03-05"},
-    {"Station_Number": "2260100", "norm": 0.0118355701, "date": "2021-03-06"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-03-07"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-03-08"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-03-09"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-03-10"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-03-11"},
-    {"Station_Number": "2260100", "norm": 0.0125752932, "date": "2021-03-12"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-03-13"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-03-14"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-03-15"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-03-16"},
-    {"Station_Number": "2260100", "norm": 0.0118355701, "date": "2021-03-17"},
-    {"Station_Number": "2260100", "norm": 0.0118355701, "date": "2021-03-18"},
-    {"Station_Number": "2260100", "norm": 0.0117298954, "date": "2021-03-19"},
-    {"Station_Number": "2260100", "norm": 0.0117298954, "date": "2021-03-20"},
-    {"Station_Number": "2260100", "norm": 0.0116242206, "date": "2021-03-21"},
-    {"Station_Number": "2260100", "norm": 0.0116242206, "date": "2021-03-22"},
-    {"Station_Number": "2260100", "norm": 0.0116242206, "date": "2021-03-23"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-03-24"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-03-25"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-03-26"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-03-27"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-03-28"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-03-29"},
-    {"Station_Number": "2260100", "norm": 0.0112015217, "date": "2021-03-30"},
-    {"Station_Number": "2260100", "norm": 0.0112015217, "date": "2021-03-31"},
-    {"Station_Number": "2260100", "norm": 0.0108844975, "date": "2021-04-01"},
-    {"Station_Number": "2260100", "norm": 0.0109901722, "date": "2021-04-02"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-04-03"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-04-04"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-04-05"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-04-06"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-04-07"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-04-08"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-04-09"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-04-10"},
-    {"Station_Number": "2260100", "norm": 0.0112015217, "date": "2021-04-11"},
-    {"Station_Number": "2260100", "norm": 0.0112015217, "date": "2021-04-12"},
-    {"Station_Number": "2260100", "norm": 0.0108844975, "date": "2021-04-13"},
-    {"Station_Number": "2260100", "norm": 0.0108844975, "date": "2021-04-14"},
-    {"Station_Number": "2260100", "norm": 0.0106731481, "date": "2021-04-15"},
-    {"Station_Number": "2260100", "norm": 0.0106731481, "date": "2021-04-16"},
-    {"Station_Number": "2260100", "norm": 0.0104617986, "date": "2021-04-17"},
-    {"Station_Number": "2260100", "norm": 0.0104617986, "date": "2021-04-18"},
-    {"Station_Number": "2260100", "norm": 0.0101447744, "date": "2021-04-19"},
-    {"Station_Number": "2260100", "norm": 0.0105674733, "date": "2021-04-20"},
-    {"Station_Number": "2260100", "norm": 0.0112015217, "date": "2021-04-21"},
-    {"Station_Number": "2260100", "norm": 0.0113071964, "date": "2021-04-22"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-04-23"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-04-24"},
-    {"Station_Number": "2260100", "norm": 0.011095847, "date": "2021-04-25"},
-    {"Station_Number": "2260100", "norm": 0.0101447744, "date": "2021-04-26"},
-    {"Station_Number": "2260100", "norm": 0.0098277502, "date": "2021-04-27"},
-    {"Station_Number": "2260100", "norm": 0.009510726, "date": "2021-04-28"},
-    {"Station_Number": "2260100", "norm": 0.0089823523, "date": "2021-04-29"},
-    {"Station_Number": "2260100", "norm": 0.0083483039, "date": "2021-04-30"},
-    {"Station_Number": "2260100", "norm": 0.0076085808, "date": "2021-05-01"},
-    {"Station_Number": "2260100", "norm": 0.0072915566, "date": "2021-05-02"},
-    {"Station_Number": "2260100", "norm": 0.0068688577, "date": "2021-05-03"},
-    {"Station_Number": "2260100", "norm": 0.0067631829, "date": "2021-05-04"},
-    {"Station_Number": "2260100", "norm": 0.0075029061, "date": "2021-05-05"},
-    {"Station_Number": "2260100", "norm": 0.0107788228, "date": "2021-05-06"},
-    {"Station_Number": "2260100", "norm": 0.0114128712, "date": "2021-05-07"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-05-08"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-05-09"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-05-10"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-05-11"},
-    {"Station_Number": "2260100", "norm": 0.0118355701, "date": "2021-05-12"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-05-13"},
-    {"Station_Number": "2260100", "norm": 0.0120469196, "date": "2021-05-14"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-05-15"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-05-16"},
-    {"Station_Number": "2260100", "norm": 0.0117298954, "date": "2021-05-17"},
-    {"Station_Number": "2260100", "norm": 0.0116242206, "date": "2021-05-18"},
-    {"Station_Number": "2260100", "norm": 0.0116242206, "date": "2021-05-19"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-05-20"},
-    {"Station_Number": "2260100", "norm": 0.0115185459, "date": "2021-05-21"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-05-22"},
-    {"Station_Number": "2260100", "norm": 0.0283208285, "date": "2021-05-23"},
-    {"Station_Number": "2260100", "norm": 0.0367748071, "date": "2021-05-24"},
-    {"Station_Number": "2260100", "norm": 0.0332875409, "date": "2021-05-25"},
-    {"Station_Number": "2260100", "norm": 0.022191694, "date": "2021-05-26"},
-    {"Station_Number": "2260100", "norm": 0.0293775758, "date": "2021-05-27"},
-    {"Station_Number": "2260100", "norm": 0.0303286484, "date": "2021-05-28"},
-    {"Station_Number": "2260100", "norm": 0.0313853958, "date": "2021-05-29"},
-    {"Station_Number": "2260100", "norm": 0.0283208285, "date": "2021-05-30"},
-    {"Station_Number": "2260100", "norm": 0.030117299, "date": "2021-05-31"},
-    {"Station_Number": "2260100", "norm": 0.0235654655, "date": "2021-06-01"},
-    {"Station_Number": "2260100", "norm": 0.0208179224, "date": "2021-06-02"},
-    {"Station_Number": "2260100", "norm": 0.0246222128, "date": "2021-06-03"},
-    {"Station_Number": "2260100", "norm": 0.0327591673, "date": "2021-06-04"},
-    {"Station_Number": "2260100", "norm": 0.0235654655, "date": "2021-06-05"},
-    {"Station_Number": "2260100", "norm": 0.022191694, "date": "2021-06-06"},
-    {"Station_Number": "2260100", "norm": 0.017436331, "date": "2021-06-07"},
-    {"Station_Number": "2260100", "norm": 0.0153228363, "date": "2021-06-08"},
-    {"Station_Number": "2260100", "norm": 0.0145831132, "date": "2021-06-09"},
-    {"Station_Number": "2260100", "norm": 0.017436331, "date": "2021-06-10"},
-    {"Station_Number": "2260100", "norm": 0.019021452, "date": "2021-06-11"},
-    {"Station_Number": "2260100", "norm": 0.0338159146, "date": "2021-06-12"},
-    {"Station_Number": "2260100", "norm": 0.0345556377, "date": "2021-06-13"},
-    {"Station_Number": "2260100", "norm": 0.0272640812, "date": "2021-06-14"},
-    {"Station_Number": "2260100", "norm": 0.0415301701, "date": "2021-06-15"},
-    {"Station_Number": "2260100", "norm": 0.0552678854, "date": "2021-06-16"},
-    {"Station_Number": "2260100", "norm": 0.1133889887, "date": "2021-06-17"},
-    {"Station_Number": "2260100", "norm": 0.1212089189, "date": "2021-06-18"},
-    {"Station_Number": "2260100", "norm": 0.101764768, "date": "2021-06-19"},
-    {"Station_Number": "2260100", "norm": 0.1263869809, "date": "2021-06-20"},
-    {"Station_Number": "2260100", "norm": 0.1659093311, "date": "2021-06-21"},
-    {"Station_Number": "2260100", "norm": 0.1725668393, "date": "2021-06-22"},
-    {"Station_Number": "2260100", "norm": 0.2456937546, "date": "2021-06-23"},
-    {"Station_Number": "2260100", "norm": 0.2890203952, "date": "2021-06-24"},
-    {"Station_Number": "2260100", "norm": 0.2221282891, "date": "2021-06-25"},
-    {"Station_Number": "2260100", "norm": 0.186515904, "date": "2021-06-26"},
-    {"Station_Number": "2260100", "norm": 0.1844024094, "date": "2021-06-27"},
-    {"Station_Number": "2260100", "norm": 0.1677058015, "date": "2021-06-28"},
-    {"Station_Number": "2260100", "norm": 0.1645355595, "date": "2021-06-29"},
-    {"Station_Number": "2260100", "norm": 0.1650639332, "date": "2021-06-30"},
-    {"Station_Number": "2260100", "norm": 0.205960055, "date": "2021-07-01"},
-    {"Station_Number": "2260100", "norm": 0.367536722, "date": "2021-07-02"},
-    {"Station_Number": "2260100", "norm": 0.522772905, "date": "2021-07-03"},
-    {"Station_Number": "2260100", "norm": 0.5547923491, "date": "2021-07-04"},
-    {"Station_Number": "2260100", "norm": 0.4927612808, "date": "2021-07-05"},
-    {"Station_Number": "2260100", "norm": 0.3980767199, "date": "2021-07-06"},
-    {"Station_Number": "2260100", "norm": 0.3670083483, "date": "2021-07-07"},
-    {"Station_Number": "2260100", "norm": 0.3288597696, "date": "2021-07-08"},
-    {"Station_Number": "2260100", "norm": 0.3022297369, "date": "2021-07-09"},
-    {"Station_Number": "2260100", "norm": 0.2622846877, "date": "2021-07-10"},
-    {"Station_Number": "2260100", "norm": 0.2295255204, "date": "2021-07-11"},
-    {"Station_Number": "2260100", "norm": 0.2074395012, "date": "2021-07-12"},
-    {"Station_Number": "2260100", "norm": 0.1900031702, "date": "2021-07-13"},
-    {"Station_Number": "2260100", "norm": 0.1828172884, "date": "2021-07-14"},
-    {"Station_Number": "2260100", "norm": 0.197611751, "date": "2021-07-15"},
-    {"Station_Number": "2260100", "norm": 0.1854591567, "date": "2021-07-16"},
-    {"Station_Number": "2260100", "norm": 0.1957096058, "date": "2021-07-17"},
-    {"Station_Number": "2260100", "norm": 0.2163161788, "date": "2021-07-18"},
-    {"Station_Number": "2260100", "norm": 0.2351262813, "date": "2021-07-19"},
-    {"Station_Number": "2260100", "norm": 0.2365000528, "date": "2021-07-20"},
-    {"Station_Number": "2260100", "norm": 0.2042692592, "date": "2021-07-21"},
-    {"Station_Number": "2260100", "norm": 0.2046919582, "date": "2021-07-22"},
-    {"Station_Number": "2260100", "norm": 0.1826059389, "date": "2021-07-23"},
-    {"Station_Number": "2260100", "norm": 0.1640071859, "date": "2021-07-24"},
-    {"Station_Number": "2260100", "norm": 0.1913769418, "date": "2021-07-25"},
-    {"Station_Number": "2260100", "norm": 0.232484413, "date": "2021-07-26"},
-    {"Station_Number": "2260100", "norm": 0.2586917468, "date": "2021-07-27"},
-    {"Station_Number": "2260100", "norm": 0.2612279404, "date": "2021-07-28"},
-    {"Station_Number": "2260100", "norm": 0.2317446898, "date": "2021-07-29"},
-    {"Station_Number": "2260100", "norm": 0.2586917468, "date": "2021-07-30"},
-    {"Station_Number": "2260100", "norm": 0.2723237874, "date": "2021-07-31"},
-    {"Station_Number": "2260100", "norm": 0.3180809468, "date": "2021-08-01"},
-    {"Station_Number": "2260100", "norm": 0.334249181, "date": "2021-08-02"},
-    {"Station_Number": "2260100", "norm": 0.283948008, "date": "2021-08-03"},
-    {"Station_Number": "2260100", "norm": 0.2244531333, "date": "2021-08-04"},
-    {"Station_Number": "2260100", "norm": 0.1891577724, "date": "2021-08-05"},
-    {"Station_Number": "2260100", "norm": 0.1844024094, "date": "2021-08-06"},
-    {"Station_Number": "2260100", "norm": 0.1875726514, "date": "2021-08-07"},
-    {"Station_Number": "2260100", "norm": 0.2194864208, "date": "2021-08-08"},
-    {"Station_Number": "2260100", "norm": 0.2282574237, "date": "2021-08-09"},
-    {"Station_Number": "2260100", "norm": 0.2319560393, "date": "2021-08-10"},
-    {"Station_Number": "2260100", "norm": 0.2312163162, "date": "2021-08-11"},
-    {"Station_Number": "2260100", "norm": 0.295043855, "date": "2021-08-12"},
-    {"Station_Number": "2260100", "norm": 0.3664799746, "date": "2021-08-13"},
-    {"Station_Number": "2260100", "norm": 0.4244954031, "date": "2021-08-14"},
-    {"Station_Number": "2260100", "norm": 0.4263975483, "date": "2021-08-15"},
-    {"Station_Number": "2260100", "norm": 0.4832505548, "date": "2021-08-16"},
-    {"Station_Number": "2260100", "norm": 0.547712142, "date": "2021-08-17"},
-    {"Station_Number": "2260100", "norm": 0.7661418155, "date": "2021-08-18"},
-    {"Station_Number": "2260100", "norm": 0.8804818768, "date": "2021-08-19"},
-    {"Station_Number": "2260100", "norm": 0.9410334989, "date": "2021-08-20"},
-    {"Station_Number": "2260100", "norm": 1.0, "date": "2021-08-21"},
-    {"Station_Number": "2260100", "norm": 0.960794674, "date": "2021-08-22"},
-    {"Station_Number": "2260100", "norm": 0.8741413928, "date": "2021-08-23"},
-    {"Station_Number": "2260100", "norm": 0.7518757265, "date": "2021-08-24"},
-    {"Station_Number": "2260100", "norm": 0.640388883, "date": "2021-08-25"},
-    {"Station_Number": "2260100", "norm": 0.5999154602, "date": "2021-08-26"},
-    {"Station_Number": "2260100", "norm": 0.7492338582, "date": "2021-08-27"},
-    {"Station_Number": "2260100", "norm": 0.7883335095, "date": "2021-08-28"},
-    {"Station_Number": "2260100", "norm": 0.7120363521, "date": "2021-08-29"},
-    {"Station_Number": "2260100", "norm": 0.6079467399, "date": "2021-08-30"},
-    {"Station_Number": "2260100", "norm": 0.4864207968, "date": "2021-08-31"},
-    {"Station_Number": "2260100", "norm": 0.3978653704, "date": "2021-09-01"},
-    {"Station_Number": "2260100", "norm": 0.3603508401, "date": "2021-09-02"},
-    {"Station_Number": "2260100", "norm": 0.3307619148, "date": "2021-09-03"},
-    {"Station_Number": "2260100", "norm": 0.3019127127, "date": "2021-09-04"},
-    {"Station_Number": "2260100", "norm": 0.2671457255, "date": "2021-09-05"},
-    {"Station_Number": "2260100", "norm": 0.2472788756, "date": "2021-09-06"},
-    {"Station_Number": "2260100", "norm": 0.2469618514, "date": "2021-09-07"},
-    {"Station_Number": "2260100", "norm": 0.2354433055, "date": "2021-09-08"},
-    {"Station_Number": "2260100", "norm": 0.2113494663, "date": "2021-09-09"},
-    {"Station_Number": "2260100", "norm": 0.1981401247, "date": "2021-09-10"},
-    {"Station_Number": "2260100", "norm": 0.1904258692, "date": "2021-09-11"},
-    {"Station_Number": "2260100", "norm": 0.1822889147, "date": "2021-09-12"},
-    {"Station_Number": "2260100", "norm": 0.1632674627, "date": "2021-09-13"},
-    {"Station_Number": "2260100", "norm": 0.1495297474, "date": "2021-09-14"},
-    {"Station_Number": "2260100", "norm": 0.1400190215, "date": "2021-09-15"},
-    {"Station_Number": "2260100", "norm": 0.1373771531, "date": "2021-09-16"},
-    {"Station_Number": "2260100", "norm": 0.1336785375, "date": "2021-09-17"},
-    {"Station_Number": "2260100", "norm": 0.146148156, "date": "2021-09-18"},
-    {"Station_Number": "2260100", "norm": 0.1375885026, "date": "2021-09-19"},
-    {"Station_Number": "2260100", "norm": 0.1632674627, "date": "2021-09-20"},
-    {"Station_Number": "2260100", "norm": 0.1729895382, "date": "2021-09-21"},
-    {"Station_Number": "2260100", "norm": 0.174257635, "date": "2021-09-22"},
-    {"Station_Number": "2260100", "norm": 0.1446687097, "date": "2021-09-23"},
-    {"Station_Number": "2260100", "norm": 0.1338898869, "date": "2021-09-24"},
-    {"Station_Number": "2260100", "norm": 0.1268096798, "date": "2021-09-25"},
-    {"Station_Number": "2260100", "norm": 0.1203635211, "date": "2021-09-26"},
-    {"Station_Number": "2260100", "norm": 0.1139173624, "date": "2021-09-27"},
-    {"Station_Number": "2260100", "norm": 0.1090563246, "date": "2021-09-28"},
-    {"Station_Number": "2260100", "norm": 0.0982775018, "date": "2021-09-29"},
-    {"Station_Number": "2260100", "norm": 0.094261862, "date": "2021-09-30"},
-    {"Station_Number": "2260100", "norm": 0.0905632463, "date": "2021-10-01"},
-    {"Station_Number": "2260100", "norm": 0.0880270527, "date": "2021-10-02"},
-    {"Station_Number": "2260100", "norm": 0.0838000634, "date": "2021-10-03"},
-    {"Station_Number": "2260100", "norm": 0.1008136954, "date": "2021-10-04"},
-    {"Station_Number": "2260100", "norm": 0.1218429673, "date": "2021-10-05"},
-    {"Station_Number": "2260100", "norm": 0.1167705802, "date": "2021-10-06"},
-    {"Station_Number": "2260100", "norm": 0.0995455986, "date": "2021-10-07"},
-    {"Station_Number": "2260100", "norm": 0.0824262919, "date": "2021-10-08"},
-    {"Station_Number": "2260100", "norm": 0.0773539047, "date": "2021-10-09"},
-    {"Station_Number": "2260100", "norm": 0.0721758428, "date": "2021-10-10"},
-    {"Station_Number": "2260100", "norm": 0.0681602029, "date": "2021-10-11"},
-    {"Station_Number": "2260100", "norm": 0.0652013104, "date": "2021-10-12"},
-    {"Station_Number": "2260100", "norm": 0.0637218641, "date": "2021-10-13"},
-    {"Station_Number": "2260100", "norm": 0.0618197189, "date": "2021-10-14"},
-    {"Station_Number": "2260100", "norm": 0.0605516221, "date": "2021-10-15"},
-    {"Station_Number": "2260100", "norm": 0.0655183346, "date": "2021-10-16"},
-    {"Station_Number": "2260100", "norm": 0.0644615872, "date": "2021-10-17"},
-    {"Station_Number": "2260100", "norm": 0.0681602029, "date": "2021-10-18"},
-    {"Station_Number": "2260100", "norm": 0.076825531, "date": "2021-10-19"},
-    {"Station_Number": "2260100", "norm": 0.0681602029, "date": "2021-10-20"},
-    {"Station_Number": "2260100", "norm": 0.1209975695, "date": "2021-10-21"},
-    {"Station_Number": "2260100", "norm": 0.1597801966, "date": "2021-10-22"},
-    {"Station_Number": "2260100", "norm": 0.1889464229, "date": "2021-10-23"},
-    {"Station_Number": "2260100", "norm": 0.1816548663, "date": "2021-10-24"},
-    {"Station_Number": "2260100", "norm": 0.1515375674, "date": "2021-10-25"},
-    {"Station_Number": "2260100", "norm": 0.1219486421, "date": "2021-10-26"},
-    {"Station_Number": "2260100", "norm": 0.0964810314, "date": "2021-10-27"},
-    {"Station_Number": "2260100", "norm": 0.0745006869, "date": "2021-10-28"},
-    {"Station_Number": "2260100", "norm": 0.064144563, "date": "2021-10-29"},
-    {"Station_Number": "2260100", "norm": 0.0599175737, "date": "2021-10-30"},
-    {"Station_Number": "2260100", "norm": 0.0588608264, "date": "2021-10-31"},
-    {"Station_Number": "2260100", "norm": 0.0568530064, "date": "2021-11-01"},
-    {"Station_Number": "2260100", "norm": 0.0554792349, "date": "2021-11-02"},
-    {"Station_Number": "2260100", "norm": 0.0544224876, "date": "2021-11-03"},
-    {"Station_Number": "2260100", "norm": 0.0530487161, "date": "2021-11-04"},
-    {"Station_Number": "2260100", "norm": 0.0468139068, "date": "2021-11-05"},
-    {"Station_Number": "2260100", "norm": 0.0441720385, "date": "2021-11-06"},
-    {"Station_Number": "2260100", "norm": 0.0419528691, "date": "2021-11-07"},
-    {"Station_Number": "2260100", "norm": 0.0398393744, "date": "2021-11-08"},
-    {"Station_Number": "2260100", "norm": 0.0380429039, "date": "2021-11-09"},
-    {"Station_Number": "2260100", "norm": 0.0378315545, "date": "2021-11-10"},
-    {"Station_Number": "2260100", "norm": 0.0371975061, "date": "2021-11-11"},
-    {"Station_Number": "2260100", "norm": 0.0284265032, "date": "2021-11-12"},
-    {"Station_Number": "2260100", "norm": 0.0329705167, "date": "2021-11-13"},
-    {"Station_Number": "2260100", "norm": 0.03170242, "date": "2021-11-14"},
-    {"Station_Number": "2260100", "norm": 0.0304343232, "date": "2021-11-15"},
-    {"Station_Number": "2260100", "norm": 0.0293775758, "date": "2021-11-16"},
-    {"Station_Number": "2260100", "norm": 0.0272640812, "date": "2021-11-17"},
-    {"Station_Number": "2260100", "norm": 0.0261016591, "date": "2021-11-18"},
-    {"Station_Number": "2260100", "norm": 0.0251505865, "date": "2021-11-19"},
-    {"Station_Number": "2260100", "norm": 0.0243051886, "date": "2021-11-20"},
-    {"Station_Number": "2260100", "norm": 0.023776815, "date": "2021-11-21"},
-    {"Station_Number": "2260100", "norm": 0.0227200676, "date": "2021-11-22"},
-    {"Station_Number": "2260100", "norm": 0.0218746698, "date": "2021-11-23"},
-    {"Station_Number": "2260100", "norm": 0.0203952235, "date": "2021-11-24"},
-    {"Station_Number": "2260100", "norm": 0.0192328014, "date": "2021-11-25"},
-    {"Station_Number": "2260100", "norm": 0.0179647046, "date": "2021-11-26"},
-    {"Station_Number": "2260100", "norm": 0.017436331, "date": "2021-11-27"},
-    {"Station_Number": "2260100", "norm": 0.0166966078, "date": "2021-11-28"},
-    {"Station_Number": "2260100", "norm": 0.0157455352, "date": "2021-11-29"},
-    {"Station_Number": "2260100", "norm": 0.0155341858, "date": "2021-11-30"},
-    {"Station_Number": "2260100", "norm": 0.0152171616, "date": "2021-12-01"},
-    {"Station_Number": "2260100", "norm": 0.0147944626, "date": "2021-12-02"},
-    {"Station_Number": "2260100", "norm": 0.0144774384, "date": "2021-12-03"},
-    {"Station_Number": "2260100", "norm": 0.0140547395, "date": "2021-12-04"},
-    {"Station_Number": "2260100", "norm": 0.01384339, "date": "2021-12-05"},
-    {"Station_Number": "2260100", "norm": 0.0136320406, "date": "2021-12-06"},
-    {"Station_Number": "2260100", "norm": 0.0135263658, "date": "2021-12-07"},
-    {"Station_Number": "2260100", "norm": 0.0135263658, "date": "2021-12-08"},
-    {"Station_Number": "2260100", "norm": 0.0134206911, "date": "2021-12-09"},
-    {"Station_Number": "2260100", "norm": 0.0134206911, "date": "2021-12-10"},
-    {"Station_Number": "2260100", "norm": 0.0134206911, "date": "2021-12-11"},
-    {"Station_Number": "2260100", "norm": 0.0134206911, "date": "2021-12-12"},
-    {"Station_Number": "2260100", "norm": 0.0134206911, "date": "2021-12-13"},
-    {"Station_Number": "2260100", "norm": 0.0133150164, "date": "2021-12-14"},
-    {"Station_Number": "2260100", "norm": 0.0133150164, "date": "2021-12-15"},
-    {"Station_Number": "2260100", "norm": 0.0133150164, "date": "2021-12-16"},
-    {"Station_Number": "2260100", "norm": 0.0133150164, "date": "2021-12-17"},
-    {"Station_Number": "2260100", "norm": 0.0132093416, "date": "2021-12-18"},
-    {"Station_Number": "2260100", "norm": 0.0129979922, "date": "2021-12-19"},
-    {"Station_Number": "2260100", "norm": 0.0128923174, "date": "2021-12-20"},
-    {"Station_Number": "2260100", "norm": 0.012680968, "date": "2021-12-21"},
-    {"Station_Number": "2260100", "norm": 0.0124696185, "date": "2021-12-22"},
-    {"Station_Number": "2260100", "norm": 0.0123639438, "date": "2021-12-23"},
-    {"Station_Number": "2260100", "norm": 0.0121525943, "date": "2021-12-24"},
-    {"Station_Number": "2260100", "norm": 0.0120469196, "date": "2021-12-25"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-12-26"},
-    {"Station_Number": "2260100", "norm": 0.0119412448, "date": "2021-12-27"},
-    {"Station_Number": "2260100", "norm": 0.0118355701, "date": "2021-12-28"},
-    {"Station_Number": "2260100", "norm": 0.0117298954, "date": "2021-12-29"},
-    {"Station_Number": "2260100", "norm": 0.0116242206, "date": "2021-12-30"},
-    {"Station_Number": "2260100", "norm": 0.0116242206, "date": "2021-12-31"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-01-01"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-01-02"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-01-03"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-01-04"},
-    {"Station_Number": "2260100", "norm": 0.0158056491, "date": "2022-01-05"},
-    {"Station_Number": "2260100", "norm": 0.0158056491, "date": "2022-01-06"},
-    {"Station_Number": "2260100", "norm": 0.0155129519, "date": "2022-01-07"},
-    {"Station_Number": "2260100", "norm": 0.015073906, "date": "2022-01-08"},
-    {"Station_Number": "2260100", "norm": 0.0147812088, "date": "2022-01-09"},
-    {"Station_Number": "2260100", "norm": 0.0147812088, "date": "2022-01-10"},
-    {"Station_Number": "2260100", "norm": 0.0144885116, "date": "2022-01-11"},
-    {"Station_Number": "2260100", "norm": 0.014342163, "date": "2022-01-12"},
-    {"Station_Number": "2260100", "norm": 0.0140494658, "date": "2022-01-13"},
-    {"Station_Number": "2260100", "norm": 0.0137567686, "date": "2022-01-14"},
-    {"Station_Number": "2260100", "norm": 0.0140494658, "date": "2022-01-15"},
-    {"Station_Number": "2260100", "norm": 0.0146348602, "date": "2022-01-16"},
-    {"Station_Number": "2260100", "norm": 0.0149275574, "date": "2022-01-17"},
-    {"Station_Number": "2260100", "norm": 0.0149275574, "date": "2022-01-18"},
-    {"Station_Number": "2260100", "norm": 0.0146348602, "date": "2022-01-19"},
-    {"Station_Number": "2260100", "norm": 0.0140494658, "date": "2022-01-20"},
-    {"Station_Number": "2260100", "norm": 0.0139031172, "date": "2022-01-21"},
-    {"Station_Number": "2260100", "norm": 0.0137567686, "date": "2022-01-22"},
-    {"Station_Number": "2260100", "norm": 0.0134640714, "date": "2022-01-23"},
-    {"Station_Number": "2260100", "norm": 0.0134640714, "date": "2022-01-24"},
-    {"Station_Number": "2260100", "norm": 0.0131713742, "date": "2022-01-25"},
-    {"Station_Number": "2260100", "norm": 0.012878677, "date": "2022-01-26"},
-    {"Station_Number": "2260100", "norm": 0.0134640714, "date": "2022-01-27"},
-    {"Station_Number": "2260100", "norm": 0.0131713742, "date": "2022-01-28"},
-    {"Station_Number": "2260100", "norm": 0.012878677, "date": "2022-01-29"},
-    {"Station_Number": "2260100", "norm": 0.0127323284, "date": "2022-01-30"},
-    {"Station_Number": "2260100", "norm": 0.0124396312, "date": "2022-01-31"},
-    {"Station_Number": "2260100", "norm": 0.0124396312, "date": "2022-02-01"},
-    {"Station_Number": "2260100", "norm": 0.012146934, "date": "2022-02-02"},
-    {"Station_Number": "2260100", "norm": 0.012146934, "date": "2022-02-03"},
-    {"Station_Number": "2260100", "norm": 0.0118542368, "date": "2022-02-04"},
-    {"Station_Number": "2260100", "norm": 0.0118542368, "date": "2022-02-05"},
-    {"Station_Number": "2260100", "norm": 0.0130250256, "date": "2022-02-06"},
-    {"Station_Number": "2260100", "norm": 0.0146348602, "date": "2022-02-07"},
-    {"Station_Number": "2260100", "norm": 0.0146348602, "date": "2022-02-08"},
-    {"Station_Number": "2260100", "norm": 0.0137567686, "date": "2022-02-09"},
-    {"Station_Number": "2260100", "norm": 0.0134640714, "date": "2022-02-10"},
-    {"Station_Number": "2260100", "norm": 0.0130250256, "date": "2022-02-11"},
-    {"Station_Number": "2260100", "norm": 0.0117078882, "date": "2022-02-12"},
-    {"Station_Number": "2260100", "norm": 0.0108297966, "date": "2022-02-13"},
-    {"Station_Number": "2260100", "norm": 0.0095126592, "date": "2022-02-14"},
-    {"Station_Number": "2260100", "norm": 0.0090736133, "date": "2022-02-15"},
-    {"Station_Number": "2260100", "norm": 0.0089272647, "date": "2022-02-16"},
-    {"Station_Number": "2260100", "norm": 0.0087809161, "date": "2022-02-17"},
-    {"Station_Number": "2260100", "norm": 0.0086345675, "date": "2022-02-18"},
-    {"Station_Number": "2260100", "norm": 0.0084882189, "date": "2022-02-19"},
-    {"Station_Number": "2260100", "norm": 0.0081955217, "date": "2022-02-20"},
-    {"Station_Number": "2260100", "norm": 0.0080491731, "date": "2022-02-21"},
-    {"Station_Number": "2260100", "norm": 0.0079028245, "date": "2022-02-22"},
-    {"Station_Number": "2260100", "norm": 0.0077564759, "date": "2022-02-23"},
-    {"Station_Number": "2260100", "norm": 0.0076101273, "date": "2022-02-24"},
-    {"Station_Number": "2260100", "norm": 0.0079028245, "date": "2022-02-25"},
-    {"Station_Number": "2260100", "norm": 0.0077564759, "date": "2022-02-26"},
-    {"Station_Number": "2260100", "norm": 0.0076101273, "date": "2022-02-27"},
-    {"Station_Number": "2260100", "norm": 0.0074637787, "date": "2022-02-28"},
-    {"Station_Number": "2260100", "norm": 0.0073174301, "date": "2022-03-01"},
-    {"Station_Number": "2260100", "norm": 0.0073174301, "date": "2022-03-02"},
-    {"Station_Number": "2260100", "norm": 0.0071710815, "date": "2022-03-03"},
-    {"Station_Number": "2260100", "norm": 0.0070247329, "date": "2022-03-04"},
-    {"Station_Number": "2260100", "norm": 0.0070247329, "date": "2022-03-05"},
-    {"Station_Number": "2260100", "norm": 0.0068783843, "date": "2022-03-06"},
-    {"Station_Number": "2260100", "norm": 0.0067320357, "date": "2022-03-07"},
-    {"Station_Number": "2260100", "norm": 0.0065856871, "date": "2022-03-08"},
-    {"Station_Number": "2260100", "norm": 0.0065856871, "date": "2022-03-09"},
-    {"Station_Number": "2260100", "norm": 0.0064393385, "date": "2022-03-10"},
-    {"Station_Number": "2260100", "norm": 0.0064393385, "date": "2022-03-11"},
-    {"Station_Number": "2260100", "norm": 0.0062929899, "date": "2022-03-12"},
-    {"Station_Number": "2260100", "norm": 0.0061466413, "date": "2022-03-13"},
-    {"Station_Number": "2260100", "norm": 0.0061466413, "date": "2022-03-14"},
-    {"Station_Number": "2260100", "norm": 0.0060002927, "date": "2022-03-15"},
-    {"Station_Number": "2260100", "norm": 0.0058539441, "date": "2022-03-16"},
-    {"Station_Number": "2260100", "norm": 0.0057075955, "date": "2022-03-17"},
-    {"Station_Number": "2260100", "norm": 0.0057075955, "date": "2022-03-18"},
-    {"Station_Number": "2260100", "norm": 0.0055612469, "date": "2022-03-19"},
-    {"Station_Number": "2260100", "norm": 0.0054148983, "date": "2022-03-20"},
-    {"Station_Number": "2260100", "norm": 0.0054148983, "date": "2022-03-21"},
-    {"Station_Number": "2260100", "norm": 0.0052685497, "date": "2022-03-22"},
-    {"Station_Number": "2260100", "norm": 0.0052685497, "date": "2022-03-23"},
-    {"Station_Number": "2260100", "norm": 0.0051222011, "date": "2022-03-24"},
-    {"Station_Number": "2260100", "norm": 0.0054148983, "date": "2022-03-25"},
-    {"Station_Number": "2260100", "norm": 0.0057075955, "date": "2022-03-26"},
-    {"Station_Number": "2260100", "norm": 0.0054148983, "date": "2022-03-27"},
-    {"Station_Number": "2260100", "norm": 0.0052685497, "date": "2022-03-28"},
-    {"Station_Number": "2260100", "norm": 0.0052685497, "date": "2022-03-29"},
-    {"Station_Number": "2260100", "norm": 0.0051222011, "date": "2022-03-30"},
-    {"Station_Number": "2260100", "norm": 0.0051222011, "date": "2022-03-31"},
-    {"Station_Number": "2260100", "norm": 0.0049758525, "date": "2022-04-01"},
-    {"Station_Number": "2260100", "norm": 0.0049758525, "date": "2022-04-02"},
-    {"Station_Number": "2260100", "norm": 0.0048295039, "date": "2022-04-03"},
-    {"Station_Number": "2260100", "norm": 0.0048295039, "date": "2022-04-04"},
-    {"Station_Number": "2260100", "norm": 0.0060002927, "date": "2022-04-05"},
-    {"Station_Number": "2260100", "norm": 0.0084882189, "date": "2022-04-06"},
-    {"Station_Number": "2260100", "norm": 0.0206351529, "date": "2022-04-07"},
-    {"Station_Number": "2260100", "norm": 0.0200497585, "date": "2022-04-08"},
-    {"Station_Number": "2260100", "norm": 0.0266354456, "date": "2022-04-09"},
-    {"Station_Number": "2260100", "norm": 0.0199034099, "date": "2022-04-10"},
-    {"Station_Number": "2260100", "norm": 0.0184399239, "date": "2022-04-11"},
-    {"Station_Number": "2260100", "norm": 0.0197570613, "date": "2022-04-12"},
-    {"Station_Number": "2260100", "norm": 0.0187326211, "date": "2022-04-13"},
-    {"Station_Number": "2260100", "norm": 0.0172691351, "date": "2022-04-14"},
-    {"Station_Number": "2260100", "norm": 0.0169764379, "date": "2022-04-15"},
-    {"Station_Number": "2260100", "norm": 0.0771257134, "date": "2022-04-16"},
-    {"Station_Number": "2260100", "norm": 0.0831260061, "date": "2022-04-17"},
-    {"Station_Number": "2260100", "norm": 0.0436118835, "date": "2022-04-18"},
-    {"Station_Number": "2260100", "norm": 0.0218059418, "date": "2022-04-19"},
-    {"Station_Number": "2260100", "norm": 0.0355627104, "date": "2022-04-20"},
-    {"Station_Number": "2260100", "norm": 0.0468315528, "date": "2022-04-21"},
-    {"Station_Number": "2260100", "norm": 0.0611737158, "date": "2022-04-22"},
-    {"Station_Number": "2260100", "norm": 0.0351236646, "date": "2022-04-23"},
-    {"Station_Number": "2260100", "norm": 0.0207815015, "date": "2022-04-24"},
-    {"Station_Number": "2260100", "norm": 0.0185862725, "date": "2022-04-25"},
-    {"Station_Number": "2260100", "norm": 0.025757354, "date": "2022-04-26"},
-    {"Station_Number": "2260100", "norm": 0.0206351529, "date": "2022-04-27"},
-    {"Station_Number": "2260100", "norm": 0.0185862725, "date": "2022-04-28"},
-    {"Station_Number": "2260100", "norm": 0.0182935753, "date": "2022-04-29"},
-    {"Station_Number": "2260100", "norm": 0.0181472267, "date": "2022-04-30"},
-    {"Station_Number": "2260100", "norm": 0.0185862725, "date": "2022-05-01"},
-    {"Station_Number": "2260100", "norm": 0.0172691351, "date": "2022-05-02"},
-    {"Station_Number": "2260100", "norm": 0.0168300893, "date": "2022-05-03"},
-    {"Station_Number": "2260100", "norm": 0.0267817942, "date": "2022-05-04"},
-    {"Station_Number": "2260100", "norm": 0.1059563881, "date": "2022-05-05"},
-    {"Station_Number": "2260100", "norm": 0.1239572662, "date": "2022-05-06"},
-    {"Station_Number": "2260100", "norm": 0.0844431436, "date": "2022-05-07"},
-    {"Station_Number": "2260100", "norm": 0.0585394409, "date": "2022-05-08"},
-    {"Station_Number": "2260100", "norm": 0.0427337919, "date": "2022-05-09"},
-    {"Station_Number": "2260100", "norm": 0.0336601785, "date": "2022-05-10"},
-    {"Station_Number": "2260100", "norm": 0.0292697205, "date": "2022-05-11"},
-    {"Station_Number": "2260100", "norm": 0.0348309674, "date": "2022-05-12"},
-    {"Station_Number": "2260100", "norm": 0.0611737158, "date": "2022-05-13"},
-    {"Station_Number": "2260100", "norm": 0.0856139324, "date": "2022-05-14"},
-    {"Station_Number": "2260100", "norm": 0.1400556125, "date": "2022-05-15"},
-    {"Station_Number": "2260100", "norm": 0.248792624, "date": "2022-05-16"},
-    {"Station_Number": "2260100", "norm": 0.2872823065, "date": "2022-05-17"},
-    {"Station_Number": "2260100", "norm": 0.2850870774, "date": "2022-05-18"},
-    {"Station_Number": "2260100", "norm": 0.2607932094, "date": "2022-05-19"},
-    {"Station_Number": "2260100", "norm": 0.2514268989, "date": "2022-05-20"},
-    {"Station_Number": "2260100", "norm": 0.2378164789, "date": "2022-05-21"},
-    {"Station_Number": "2260100", "norm": 0.1807405239, "date": "2022-05-22"},
-    {"Station_Number": "2260100", "norm": 0.1549831699, "date": "2022-05-23"},
-    {"Station_Number": "2260100", "norm": 0.13507976, "date": "2022-05-24"},
-    {"Station_Number": "2260100", "norm": 0.1151763501, "date": "2022-05-25"},
-    {"Station_Number": "2260100", "norm": 0.0911751793, "date": "2022-05-26"},
-    {"Station_Number": "2260100", "norm": 0.0936631055, "date": "2022-05-27"},
-    {"Station_Number": "2260100", "norm": 0.0987853066, "date": "2022-05-28"},
-    {"Station_Number": "2260100", "norm": 0.0936631055, "date": "2022-05-29"},
-    {"Station_Number": "2260100", "norm": 0.0904434363, "date": "2022-05-30"},
-    {"Station_Number": "2260100", "norm": 0.0787355481, "date": "2022-05-31"},
-    {"Station_Number": "2260100", "norm": 0.0595638812, "date": "2022-06-01"},
-    {"Station_Number": "2260100", "norm": 0.0617591102, "date": "2022-06-02"},
-    {"Station_Number": "2260100", "norm": 0.0933704083, "date": "2022-06-03"},
-    {"Station_Number": "2260100", "norm": 0.1519098493, "date": "2022-06-04"},
-    {"Station_Number": "2260100", "norm": 0.1745938826, "date": "2022-06-05"},
-    {"Station_Number": "2260100", "norm": 0.2268403337, "date": "2022-06-06"},
-    {"Station_Number": "2260100", "norm": 0.19581443, "date": "2022-06-07"},
-    {"Station_Number": "2260100", "norm": 0.2381091761, "date": "2022-06-08"},
-    {"Station_Number": "2260100", "norm": 0.319478999, "date": "2022-06-09"},
-    {"Station_Number": "2260100", "norm": 0.4541197132, "date": "2022-06-10"},
-    {"Station_Number": "2260100", "norm": 0.5202692814, "date": "2022-06-11"},
-    {"Station_Number": "2260100", "norm": 0.5605151471, "date": "2022-06-12"},
-    {"Station_Number": "2260100", "norm": 0.616127616, "date": "2022-06-13"},
-    {"Station_Number": "2260100", "norm": 0.5483682131, "date": "2022-06-14"},
-    {"Station_Number": "2260100", "norm": 0.5360749305, "date": "2022-06-15"},
-    {"Station_Number": "2260100", "norm": 0.6478852627, "date": "2022-06-16"},
-    {"Station_Number": "2260100", "norm": 0.7781355188, "date": "2022-06-17"},
-    {"Station_Number": "2260100", "norm": 0.8316991073, "date": "2022-06-18"},
-    {"Station_Number": "2260100", "norm": 0.8590662959, "date": "2022-06-19"},
-    {"Station_Number": "2260100", "norm": 0.8726767159, "date": "2022-06-20"},
-    {"Station_Number": "2260100", "norm": 0.863456754, "date": "2022-06-21"},
-    {"Station_Number": "2260100", "norm": 0.8287721352, "date": "2022-06-22"},
-    {"Station_Number": "2260100", "norm": 0.7834040685, "date": "2022-06-23"},
-    {"Station_Number": "2260100", "norm": 0.8331625933, "date": "2022-06-24"},
-    {"Station_Number": "2260100", "norm": 0.8688716523, "date": "2022-06-25"},
-    {"Station_Number": "2260100", "norm": 0.9405824674, "date": "2022-06-26"},
-    {"Station_Number": "2260100", "norm": 0.997073028, "date": "2022-06-27"},
-    {"Station_Number": "2260100", "norm": 1.0, "date": "2022-06-28"},
-    {"Station_Number": "2260100", "norm": 0.9688277477, "date": "2022-06-29"},
-    {"Station_Number": "2260100", "norm": 0.9593150885, "date": "2022-06-30"},
-    {"Station_Number": "2260100", "norm": 0.9209717547, "date": "2022-07-01"},
-    {"Station_Number": "2260100", "norm": 0.8590662959, "date": "2022-07-02"},
-    {"Station_Number": "2260100", "norm": 0.7493048441, "date": "2022-07-03"},
-    {"Station_Number": "2260100", "norm": 0.6044197278, "date": "2022-07-04"},
-    {"Station_Number": "2260100", "norm": 0.5477828187, "date": "2022-07-05"},
-    {"Station_Number": "2260100", "norm": 0.4965608078, "date": "2022-07-06"},
-    {"Station_Number": "2260100", "norm": 0.4153373335, "date": "2022-07-07"},
-    {"Station_Number": "2260100", "norm": 0.5630030733, "date": "2022-07-08"},
-    {"Station_Number": "2260100", "norm": 0.49319479, "date": "2022-07-09"},
-    {"Station_Number": "2260100", "norm": 0.3275281721, "date": "2022-07-10"},
-    {"Station_Number": "2260100", "norm": 0.3134787063, "date": "2022-07-11"},
-    {"Station_Number": "2260100", "norm": 0.2843553344, "date": "2022-07-12"},
-    {"Station_Number": "2260100", "norm": 0.2675252451, "date": "2022-07-13"},
-    {"Station_Number": "2260100", "norm": 0.2499634128, "date": "2022-07-14"},
-    {"Station_Number": "2260100", "norm": 0.2285965169, "date": "2022-07-15"},
-    {"Station_Number": "2260100", "norm": 0.2111810332, "date": "2022-07-16"},
-    {"Station_Number": "2260100", "norm": 0.1912776233, "date": "2022-07-17"},
-    {"Station_Number": "2260100", "norm": 0.2290355627, "date": "2022-07-18"},
-    {"Station_Number": "2260100", "norm": 0.2900629299, "date": "2022-07-19"},
-    {"Station_Number": "2260100", "norm": 0.3734816333, "date": "2022-07-20"},
-    {"Station_Number": "2260100", "norm": 0.3197716962, "date": "2022-07-21"},
-    {"Station_Number": "2260100", "norm": 0.3976291526, "date": "2022-07-22"},
-    {"Station_Number": "2260100", "norm": 0.4877798917, "date": "2022-07-23"},
-    {"Station_Number": "2260100", "norm": 0.5268549685, "date": "2022-07-24"},
-    {"Station_Number": "2260100", "norm": 0.5224645105, "date": "2022-07-25"},
-    {"Station_Number": "2260100", "norm": 0.4971462023, "date": "2022-07-26"},
-    {"Station_Number": "2260100", "norm": 0.4738767745, "date": "2022-07-27"},
-    {"Station_Number": "2260100", "norm": 0.4503146495, "date": "2022-07-28"},
-    {"Station_Number": "2260100", "norm": 0.4361188351, "date": "2022-07-29"},
-    {"Station_Number": "2260100", "norm": 0.4005561247, "date": "2022-07-30"},
-    {"Station_Number": "2260100", "norm": 0.3955802722, "date": "2022-07-31"},
-    {"Station_Number": "2260100", "norm": 0.3758232109, "date": "2022-08-01"},
-    {"Station_Number": "2260100", "norm": 0.355188058, "date": "2022-08-02"},
-    {"Station_Number": "2260100", "norm": 0.3267964291, "date": "2022-08-03"},
-    {"Station_Number": "2260100", "norm": 0.3431874726, "date": "2022-08-04"},
-    {"Station_Number": "2260100", "norm": 0.3159666325, "date": "2022-08-05"},
-    {"Station_Number": "2260100", "norm": 0.2978194058, "date": "2022-08-06"},
-    {"Station_Number": "2260100", "norm": 0.3256256403, "date": "2022-08-07"},
-    {"Station_Number": "2260100", "norm": 0.2880140495, "date": "2022-08-08"},
-    {"Station_Number": "2260100", "norm": 0.2585979804, "date": "2022-08-09"},
-    {"Station_Number": "2260100", "norm": 0.2648909703, "date": "2022-08-10"},
-    {"Station_Number": "2260100", "norm": 0.3068930192, "date": "2022-08-11"},
-    {"Station_Number": "2260100", "norm": 0.2806966193, "date": "2022-08-12"},
-    {"Station_Number": "2260100", "norm": 0.2550856139, "date": "2022-08-13"},
-    {"Station_Number": "2260100", "norm": 0.2922581589, "date": "2022-08-14"},
-    {"Station_Number": "2260100", "norm": 0.334552905, "date": "2022-08-15"},
-    {"Station_Number": "2260100", "norm": 0.3414312893, "date": "2022-08-16"},
-    {"Station_Number": "2260100", "norm": 0.2989901946, "date": "2022-08-17"},
-    {"Station_Number": "2260100", "norm": 0.2597687692, "date": "2022-08-18"},
-    {"Station_Number": "2260100", "norm": 0.2528903849, "date": "2022-08-19"},
-    {"Station_Number": "2260100", "norm": 0.2492316698, "date": "2022-08-20"},
-    {"Station_Number": "2260100", "norm": 0.2426459827, "date": "2022-08-21"},
-    {"Station_Number": "2260100", "norm": 0.2231816186, "date": "2022-08-22"},
-    {"Station_Number": "2260100", "norm": 0.2133762623, "date": "2022-08-23"},
-    {"Station_Number": "2260100", "norm": 0.2799648763, "date": "2022-08-24"},
-    {"Station_Number": "2260100", "norm": 0.3039660471, "date": "2022-08-25"},
-    {"Station_Number": "2260100", "norm": 0.2632811357, "date": "2022-08-26"},
-    {"Station_Number": "2260100", "norm": 0.272354749, "date": "2022-08-27"},
-    {"Station_Number": "2260100", "norm": 0.2751353725, "date": "2022-08-28"},
-    {"Station_Number": "2260100", "norm": 0.3793355773, "date": "2022-08-29"},
-    {"Station_Number": "2260100", "norm": 0.4292404508, "date": "2022-08-30"},
-    {"Station_Number": "2260100", "norm": 0.4270452217, "date": "2022-08-31"},
-    {"Station_Number": "2260100", "norm": 0.4141665447, "date": "2022-09-01"},
-    {"Station_Number": "2260100", "norm": 0.3546026635, "date": "2022-09-02"},
-    {"Station_Number": "2260100", "norm": 0.3333821162, "date": "2022-09-03"},
-    {"Station_Number": "2260100", "norm": 0.4031903995, "date": "2022-09-04"},
-    {"Station_Number": "2260100", "norm": 0.5429533148, "date": "2022-09-05"},
-    {"Station_Number": "2260100", "norm": 0.7951119567, "date": "2022-09-06"},
-    {"Station_Number": "2260100", "norm": 0.7708180887, "date": "2022-09-07"},
-    {"Station_Number": "2260100", "norm": 0.6515439778, "date": "2022-09-08"},
-    {"Station_Number": "2260100", "norm": 0.5250987853, "date": "2022-09-09"},
-    {"Station_Number": "2260100", "norm": 0.4488511635, "date": "2022-09-10"},
-    {"Station_Number": "2260100", "norm": 0.4116786185, "date": "2022-09-11"},
-    {"Station_Number": "2260100", "norm": 0.3765549539, "date": "2022-09-12"},
-    {"Station_Number": "2260100", "norm": 0.3341138592, "date": "2022-09-13"},
-    {"Station_Number": "2260100", "norm": 0.3063076248, "date": "2022-09-14"},
-    {"Station_Number": "2260100", "norm": 0.3158202839, "date": "2022-09-15"},
-    {"Station_Number": "2260100", "norm": 0.3329430704, "date": "2022-09-16"},
-    {"Station_Number": "2260100", "norm": 0.3121615689, "date": "2022-09-17"},
-    {"Station_Number": "2260100", "norm": 0.2970876628, "date": "2022-09-18"},
-    {"Station_Number": "2260100", "norm": 0.29738036, "date": "2022-09-19"},
-    {"Station_Number": "2260100", "norm": 0.2710376116, "date": "2022-09-20"},
-    {"Station_Number": "2260100", "norm": 0.3405531977, "date": "2022-09-21"},
-    {"Station_Number": "2260100", "norm": 0.3589931216, "date": "2022-09-22"},
-    {"Station_Number": "2260100", "norm": 0.3765549539, "date": "2022-09-23"},
-    {"Station_Number": "2260100", "norm": 0.3793355773, "date": "2022-09-24"},
-    {"Station_Number": "2260100", "norm": 0.4507536953, "date": "2022-09-25"},
-    {"Station_Number": "2260100", "norm": 0.4298258452, "date": "2022-09-26"},
-    {"Station_Number": "2260100", "norm": 0.3753841651, "date": "2022-09-27"},
-    {"Station_Number": "2260100", "norm": 0.3288453095, "date": "2022-09-28"},
-    {"Station_Number": "2260100", "norm": 0.2653300161, "date": "2022-09-29"},
-    {"Station_Number": "2260100", "norm": 0.2364993414, "date": "2022-09-30"},
-    {"Station_Number": "2260100", "norm": 0.2211327382, "date": "2022-10-01"},
-    {"Station_Number": "2260100", "norm": 0.1924484121, "date": "2022-10-02"},
-    {"Station_Number": "2260100", "norm": 0.186594468, "date": "2022-10-03"},
-    {"Station_Number": "2260100", "norm": 0.1892287429, "date": "2022-10-04"},
-    {"Station_Number": "2260100", "norm": 0.1788379921, "date": "2022-10-05"},
-    {"Station_Number": "2260100", "norm": 0.2082540612, "date": "2022-10-06"},
-    {"Station_Number": "2260100", "norm": 0.2129372164, "date": "2022-10-07"},
-    {"Station_Number": "2260100", "norm": 0.1978633104, "date": "2022-10-08"},
-    {"Station_Number": "2260100", "norm": 0.1887896971, "date": "2022-10-09"},
-    {"Station_Number": "2260100", "norm": 0.1887896971, "date": "2022-10-10"},
-    {"Station_Number": "2260100", "norm": 0.2919654617, "date": "2022-10-11"},
-    {"Station_Number": "2260100", "norm": 0.3370408313, "date": "2022-10-12"},
-    {"Station_Number": "2260100", "norm": 0.384604127, "date": "2022-10-13"},
-    {"Station_Number": "2260100", "norm": 0.3819698522, "date": "2022-10-14"},
-    {"Station_Number": "2260100", "norm": 0.3783111371, "date": "2022-10-15"},
-    {"Station_Number": "2260100", "norm": 0.3386506659, "date": "2022-10-16"},
-    {"Station_Number": "2260100", "norm": 0.3008927265, "date": "2022-10-17"},
-    {"Station_Number": "2260100", "norm": 0.2678179423, "date": "2022-10-18"},
-    {"Station_Number": "2260100", "norm": 0.2653300161, "date": "2022-10-19"},
-    {"Station_Number": "2260100", "norm": 0.2114737304, "date": "2022-10-20"},
-    {"Station_Number": "2260100", "norm": 0.195082687, "date": "2022-10-21"},
-    {"Station_Number": "2260100", "norm": 0.1804478267, "date": "2022-10-22"},
-    {"Station_Number": "2260100", "norm": 0.1643494805, "date": "2022-10-23"},
-    {"Station_Number": "2260100", "norm": 0.1599590224, "date": "2022-10-24"},
-    {"Station_Number": "2260100", "norm": 0.2770379043, "date": "2022-10-25"},
-    {"Station_Number": "2260100", "norm": 0.4770964437, "date": "2022-10-26"},
-    {"Station_Number": "2260100", "norm": 0.4394848529, "date": "2022-10-27"},
-    {"Station_Number": "2260100", "norm": 0.3851895214, "date": "2022-10-28"},
-    {"Station_Number": "2260100", "norm": 0.2703058686, "date": "2022-10-29"},
-    {"Station_Number": "2260100", "norm": 0.1977169618, "date": "2022-10-30"},
-    {"Station_Number": "2260100", "norm": 0.1489828772, "date": "2022-10-31"},
-    {"Station_Number": "2260100", "norm": 0.1204448998, "date": "2022-11-01"},
-    {"Station_Number": "2260100", "norm": 0.1094687546, "date": "2022-11-02"},
-    {"Station_Number": "2260100", "norm": 0.1039075077, "date": "2022-11-03"},
-    {"Station_Number": "2260100", "norm": 0.1005414898, "date": "2022-11-04"},
-    {"Station_Number": "2260100", "norm": 0.0970291234, "date": "2022-11-05"},
-    {"Station_Number": "2260100", "norm": 0.0958583346, "date": "2022-11-06"},
-    {"Station_Number": "2260100", "norm": 0.0951265915, "date": "2022-11-07"},
-    {"Station_Number": "2260100", "norm": 0.0936631055, "date": "2022-11-08"},
-    {"Station_Number": "2260100", "norm": 0.0919069223, "date": "2022-11-09"},
-    {"Station_Number": "2260100", "norm": 0.0878091614, "date": "2022-11-10"},
-    {"Station_Number": "2260100", "norm": 0.0831260061, "date": "2022-11-11"},
-    {"Station_Number": "2260100", "norm": 0.0780038051, "date": "2022-11-12"},
-    {"Station_Number": "2260100", "norm": 0.0727352554, "date": "2022-11-13"},
-    {"Station_Number": "2260100", "norm": 0.0683447973, "date": "2022-11-14"},
-    {"Station_Number": "2260100", "norm": 0.0658568711, "date": "2022-11-15"},
-    {"Station_Number": "2260100", "norm": 0.064393385, "date": "2022-11-16"},
-    {"Station_Number": "2260100", "norm": 0.0619054588, "date": "2022-11-17"},
-    {"Station_Number": "2260100", "norm": 0.0604419728, "date": "2022-11-18"},
-    {"Station_Number": "2260100", "norm": 0.059271184, "date": "2022-11-19"},
-    {"Station_Number": "2260100", "norm": 0.0588321382, "date": "2022-11-20"},
-    {"Station_Number": "2260100", "norm": 0.0578076979, "date": "2022-11-21"},
-    {"Station_Number": "2260100", "norm": 0.0567832577, "date": "2022-11-22"},
-    {"Station_Number": "2260100", "norm": 0.0560515147, "date": "2022-11-23"},
-    {"Station_Number": "2260100", "norm": 0.0553197717, "date": "2022-11-24"},
-    {"Station_Number": "2260100", "norm": 0.0545880287, "date": "2022-11-25"},
-    {"Station_Number": "2260100", "norm": 0.0537099371, "date": "2022-11-26"},
-    {"Station_Number": "2260100", "norm": 0.0529781941, "date": "2022-11-27"},
-    {"Station_Number": "2260100", "norm": 0.0523927996, "date": "2022-11-28"},
-    {"Station_Number": "2260100", "norm": 0.051514708, "date": "2022-11-29"},
-    {"Station_Number": "2260100", "norm": 0.0494658276, "date": "2022-11-30"},
-    {"Station_Number": "2260100", "norm": 0.0472705986, "date": "2022-12-01"},
-    {"Station_Number": "2260100", "norm": 0.0441972779, "date": "2022-12-02"},
-    {"Station_Number": "2260100", "norm": 0.0414166545, "date": "2022-12-03"},
-    {"Station_Number": "2260100", "norm": 0.0390750768, "date": "2022-12-04"},
-    {"Station_Number": "2260100", "norm": 0.0362944534, "date": "2022-12-05"},
-    {"Station_Number": "2260100", "norm": 0.0339528758, "date": "2022-12-06"},
-    {"Station_Number": "2260100", "norm": 0.0311722523, "date": "2022-12-07"},
-    {"Station_Number": "2260100", "norm": 0.0280989317, "date": "2022-12-08"},
-    {"Station_Number": "2260100", "norm": 0.0245865652, "date": "2022-12-09"},
-    {"Station_Number": "2260100", "norm": 0.022098639, "date": "2022-12-10"},
-    {"Station_Number": "2260100", "norm": 0.0213668959, "date": "2022-12-11"},
-    {"Station_Number": "2260100", "norm": 0.0207815015, "date": "2022-12-12"},
-    {"Station_Number": "2260100", "norm": 0.0201961071, "date": "2022-12-13"},
-    {"Station_Number": "2260100", "norm": 0.0196107127, "date": "2022-12-14"},
-    {"Station_Number": "2260100", "norm": 0.0191716669, "date": "2022-12-15"},
-    {"Station_Number": "2260100", "norm": 0.0188789697, "date": "2022-12-16"},
-    {"Station_Number": "2260100", "norm": 0.0185862725, "date": "2022-12-17"},
-    {"Station_Number": "2260100", "norm": 0.0184399239, "date": "2022-12-18"},
-    {"Station_Number": "2260100", "norm": 0.0178545295, "date": "2022-12-19"},
-    {"Station_Number": "2260100", "norm": 0.0172691351, "date": "2022-12-20"},
-    {"Station_Number": "2260100", "norm": 0.0168300893, "date": "2022-12-21"},
-    {"Station_Number": "2260100", "norm": 0.0165373921, "date": "2022-12-22"},
-    {"Station_Number": "2260100", "norm": 0.0163910435, "date": "2022-12-23"},
-    {"Station_Number": "2260100", "norm": 0.0160983463, "date": "2022-12-24"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-12-25"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-12-26"},
-    {"Station_Number": "2260100", "norm": 0.0158056491, "date": "2022-12-27"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-12-28"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-12-29"},
-    {"Station_Number": "2260100", "norm": 0.0159519977, "date": "2022-12-30"},
-    {"Station_Number": "2260100", "norm": 0.0156593005, "date": "2022-12-31"},
-    {"Station_Number": "2260100", "norm": 0.0093928537, "date": "2023-01-01"},
-    {"Station_Number": "2260100", "norm": 0.0085213518, "date": "2023-01-02"},
-    {"Station_Number": "2260100", "norm": 0.0077466835, "date": "2023-01-03"},
-    {"Station_Number": "2260100", "norm": 0.0071656822, "date": "2023-01-04"},
-    {"Station_Number": "2260100", "norm": 0.0065846809, "date": "2023-01-05"},
-    {"Station_Number": "2260100", "norm": 0.0061973468, "date": "2023-01-06"},
-    {"Station_Number": "2260100", "norm": 0.0060036797, "date": "2023-01-07"},
-    {"Station_Number": "2260100", "norm": 0.005713179, "date": "2023-01-08"},
-    {"Station_Number": "2260100", "norm": 0.0053258449, "date": "2023-01-09"},
-    {"Station_Number": "2260100", "norm": 0.0051321778, "date": "2023-01-10"},
-    {"Station_Number": "2260100", "norm": 0.0049385107, "date": "2023-01-11"},
-    {"Station_Number": "2260100", "norm": 0.0047448436, "date": "2023-01-12"},
-    {"Station_Number": "2260100", "norm": 0.0045511765, "date": "2023-01-13"},
-    {"Station_Number": "2260100", "norm": 0.0042606759, "date": "2023-01-14"},
-    {"Station_Number": "2260100", "norm": 0.0040670088, "date": "2023-01-15"},
-    {"Station_Number": "2260100", "norm": 0.0037765082, "date": "2023-01-16"},
-    {"Station_Number": "2260100", "norm": 0.0035828411, "date": "2023-01-17"},
-    {"Station_Number": "2260100", "norm": 0.003389174, "date": "2023-01-18"},
-    {"Station_Number": "2260100", "norm": 0.0032923405, "date": "2023-01-19"},
-    {"Station_Number": "2260100", "norm": 0.0030986734, "date": "2023-01-20"},
-    {"Station_Number": "2260100", "norm": 0.0030018398, "date": "2023-01-21"},
-    {"Station_Number": "2260100", "norm": 0.0028081728, "date": "2023-01-22"},
-    {"Station_Number": "2260100", "norm": 0.0027113392, "date": "2023-01-23"},
-    {"Station_Number": "2260100", "norm": 0.0026145057, "date": "2023-01-24"},
-    {"Station_Number": "2260100", "norm": 0.0025176721, "date": "2023-01-25"},
-    {"Station_Number": "2260100", "norm": 0.0024208386, "date": "2023-01-26"},
-    {"Station_Number": "2260100", "norm": 0.0022271715, "date": "2023-01-27"},
-    {"Station_Number": "2260100", "norm": 0.0021303379, "date": "2023-01-28"},
-    {"Station_Number": "2260100", "norm": 0.0019366709, "date": "2023-01-29"},
-    {"Station_Number": "2260100", "norm": 0.0017430038, "date": "2023-01-30"},
-    {"Station_Number": "2260100", "norm": 0.0014525031, "date": "2023-01-31"},
-    {"Station_Number": "2260100", "norm": 0.0011620025, "date": "2023-02-01"},
-    {"Station_Number": "2260100", "norm": 0.0008715019, "date": "2023-02-02"},
-    {"Station_Number": "2260100", "norm": 0.0004841677, "date": "2023-02-03"},
-    {"Station_Number": "2260100", "norm": 0.0000968335, "date": "2023-02-04"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-05"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-06"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-07"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-08"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-09"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-10"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-11"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-12"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-13"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-14"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-15"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-16"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-17"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-18"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-19"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-20"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-21"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-22"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-23"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-24"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-25"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-02-26"},
-    {"Station_Number": "2260100", "norm": 0.0015493367, "date": "2023-02-27"},
-    {"Station_Number": "2260100", "norm": 0.0017430038, "date": "2023-02-28"},
-    {"Station_Number": "2260100", "norm": 0.0004841677, "date": "2023-03-01"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-02"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-03"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-04"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-05"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-06"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-07"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-08"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-09"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-10"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-11"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-12"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-13"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-14"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-15"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-16"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-17"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-18"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-19"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-20"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-21"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-22"},
-    {"Station_Number": "2260100", "norm": 0.0011620025, "date": "2023-03-23"},
-    {"Station_Number": "2260100", "norm": 0.0047448436, "date": "2023-03-24"},
-    {"Station_Number": "2260100", "norm": 0.0031955069, "date": "2023-03-25"},
-    {"Station_Number": "2260100", "norm": 0.0039701753, "date": "2023-03-26"},
-    {"Station_Number": "2260100", "norm": 0.0037765082, "date": "2023-03-27"},
-    {"Station_Number": "2260100", "norm": 0.0025176721, "date": "2023-03-28"},
-    {"Station_Number": "2260100", "norm": 0.0009683354, "date": "2023-03-29"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-30"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-03-31"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-01"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-02"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-03"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-04"},
-    {"Station_Number": "2260100", "norm": 0.0003873342, "date": "2023-04-05"},
-    {"Station_Number": "2260100", "norm": 0.0053258449, "date": "2023-04-06"},
-    {"Station_Number": "2260100", "norm": 0.0058100126, "date": "2023-04-07"},
-    {"Station_Number": "2260100", "norm": 0.0072625157, "date": "2023-04-08"},
-    {"Station_Number": "2260100", "norm": 0.0105548562, "date": "2023-04-09"},
-    {"Station_Number": "2260100", "norm": 0.0064878474, "date": "2023-04-10"},
-    {"Station_Number": "2260100", "norm": 0.0007746683, "date": "2023-04-11"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-12"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-13"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-14"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-15"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-16"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-17"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-18"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-19"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-20"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-21"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-22"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-23"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-24"},
-    {"Station_Number": "2260100", "norm": 0.0038733417, "date": "2023-04-25"},
-    {"Station_Number": "2260100", "norm": 0.004454343, "date": "2023-04-26"},
-    {"Station_Number": "2260100", "norm": 0.0032923405, "date": "2023-04-27"},
-    {"Station_Number": "2260100", "norm": 0.0005810013, "date": "2023-04-28"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-29"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-04-30"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-01"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-02"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-03"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-04"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-05"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-06"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-07"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-08"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-09"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-10"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-11"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-12"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-13"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-05-14"},
-    {"Station_Number": "2260100", "norm": 0.0008715019, "date": "2023-05-15"},
-    {"Station_Number": "2260100", "norm": 0.008908686, "date": "2023-05-16"},
-    {"Station_Number": "2260100", "norm": 0.005713179, "date": "2023-05-17"},
-    {"Station_Number": "2260100", "norm": 0.0098770214, "date": "2023-05-18"},
-    {"Station_Number": "2260100", "norm": 0.0109421904, "date": "2023-05-19"},
-    {"Station_Number": "2260100", "norm": 0.0108453568, "date": "2023-05-20"},
-    {"Station_Number": "2260100", "norm": 0.0094896872, "date": "2023-05-21"},
-    {"Station_Number": "2260100", "norm": 0.0075530164, "date": "2023-05-22"},
-    {"Station_Number": "2260100", "norm": 0.0068751816, "date": "2023-05-23"},
-    {"Station_Number": "2260100", "norm": 0.0065846809, "date": "2023-05-24"},
-    {"Station_Number": "2260100", "norm": 0.0048416772, "date": "2023-05-25"},
-    {"Station_Number": "2260100", "norm": 0.0043575094, "date": "2023-05-26"},
-    {"Station_Number": "2260100", "norm": 0.0038733417, "date": "2023-05-27"},
-    {"Station_Number": "2260100", "norm": 0.0041638424, "date": "2023-05-28"},
-    {"Station_Number": "2260100", "norm": 0.005713179, "date": "2023-05-29"},
-    {"Station_Number": "2260100", "norm": 0.0043575094, "date": "2023-05-30"},
-    {"Station_Number": "2260100", "norm": 0.002324005, "date": "2023-05-31"},
-    {"Station_Number": "2260100", "norm": 0.0003873342, "date": "2023-06-01"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-02"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-03"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-04"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-05"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-06"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-07"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-08"},
-    {"Station_Number": "2260100", "norm": 0.0, "date": "2023-06-09"},
-    {"Station_Number": "2260100", "norm": 0.0058100126, "date": "2023-06-10"},
-    {"Station_Number": "2260100", "norm": 0.008908686, "date": "2023-06-11"},
-    {"Station_Number": "2260100", "norm": 0.0231432168, "date": "2023-06-12"},
-    {"Station_Number": "2260100", "norm": 0.1159097511, "date": "2023-06-13"},
-    {"Station_Number": "2260100", "norm": 0.1715890384, "date": "2023-06-14"},
-    {"Station_Number": "2260100", "norm": 0.2909847971, "date": "2023-06-15"},
-    {"Station_Number": "2260100", "norm": 0.2817856105, "date": "2023-06-16"},
-    {"Station_Number": "2260100", "norm": 0.2388883509, "date": "2023-06-17"},
-    {"Station_Number": "2260100", "norm": 0.2075142829, "date": "2023-06-18"},
-    {"Station_Number": "2260100", "norm": 0.2017042704, "date": "2023-06-19"},
-    {"Station_Number": "2260100", "norm": 0.1664568607, "date": "2023-06-20"},
-    {"Station_Number": "2260100", "norm": 0.1274329428, "date": "2023-06-21"},
-    {"Station_Number": "2260100", "norm": 0.1166844195, "date": "2023-06-22"},
-    {"Station_Number": "2260100", "norm": 0.2577708918, "date": "2023-06-23"},
-    {"Station_Number": "2260100", "norm": 0.2611600658, "date": "2023-06-24"},
-    {"Station_Number": "2260100", "norm": 0.233368839, "date": "2023-06-25"},
-    {"Station_Number": "2260100", "norm": 0.2051902779, "date": "2023-06-26"},
-    {"Station_Number": "2260100", "norm": 0.1792388884, "date": "2023-06-27"},
-    {"Station_Number": "2260100", "norm": 0.1520286627, "date": "2023-06-28"},
-    {"Station_Number": "2260100", "norm": 0.1946354217, "date": "2023-06-29"},
-    {"Station_Number": "2260100", "norm": 0.2083857848, "date": "2023-06-30"},
-    {"Station_Number": "2260100", "norm": 0.1801103902, "date": "2023-07-01"},
-    {"Station_Number": "2260100", "norm": 0.1658758594, "date": "2023-07-02"},
-    {"Station_Number": "2260100", "norm": 0.1535779994, "date": "2023-07-03"},
-    {"Station_Number": "2260100", "norm": 0.170620703, "date": "2023-07-04"},
-    {"Station_Number": "2260100", "norm": 0.2001549337, "date": "2023-07-05"},
-    {"Station_Number": "2260100", "norm": 0.269390917, "date": "2023-07-06"},
-    {"Station_Number": "2260100", "norm": 0.4408831219, "date": "2023-07-07"},
-    {"Station_Number": "2260100", "norm": 0.5548562022, "date": "2023-07-08"},
-    {"Station_Number": "2260100", "norm": 0.5977534618, "date": "2023-07-09"},
-    {"Station_Number": "2260100", "norm": 0.6344533746, "date": "2023-07-10"},
-    {"Station_Number": "2260100", "norm": 0.6574997579, "date": "2023-07-11"},
-    {"Station_Number": "2260100", "norm": 0.7062070301, "date": "2023-07-12"},
-    {"Station_Number": "2260100", "norm": 0.8708240535, "date": "2023-07-13"},
-    {"Station_Number": "2260100", "norm": 0.9623317517, "date": "2023-07-14"},
-    {"Station_Number": "2260100", "norm": 0.9392853685, "date": "2023-07-15"},
-    {"Station_Number": "2260100", "norm": 0.9513895613, "date": "2023-07-16"},
-    {"Station_Number": "2260100", "norm": 1.0, "date": "2023-07-17"},
-    {"Station_Number": "2260100", "norm": 0.9399632033, "date": "2023-07-18"},
-    {"Station_Number": "2260100", "norm": 0.8245376198, "date": "2023-07-19"},
-    {"Station_Number": "2260100", "norm": 0.6916819986, "date": "2023-07-20"},
-    {"Station_Number": "2260100", "norm": 0.5076982667, "date": "2023-07-21"},
-    {"Station_Number": "2260100", "norm": 0.3553791033, "date": "2023-07-22"},
-    {"Station_Number": "2260100", "norm": 0.2665827443, "date": "2023-07-23"},
-    {"Station_Number": "2260100", "norm": 0.2614505665, "date": "2023-07-24"},
-    {"Station_Number": "2260100", "norm": 0.2714244214, "date": "2023-07-25"},
-    {"Station_Number": "2260100", "norm": 0.2680352474, "date": "2023-07-26"},
-    {"Station_Number": "2260100", "norm": 0.2481843711, "date": "2023-07-27"},
-    {"Station_Number": "2260100", "norm": 0.2495400407, "date": "2023-07-28"},
-    {"Station_Number": "2260100", "norm": 0.2382105161, "date": "2023-07-29"},
-    {"Station_Number": "2260100", "norm": 0.2259126561, "date": "2023-07-30"},
-    {"Station_Number": "2260100", "norm": 0.2224266486, "date": "2023-07-31"},
-    {"Station_Number": "2260100", "norm": 0.2181659727, "date": "2023-08-01"},
-    {"Station_Number": "2260100", "norm": 0.2138084633, "date": "2023-08-02"},
-    {"Station_Number": "2260100", "norm": 0.2306574998, "date": "2023-08-03"},
-    {"Station_Number": "2260100", "norm": 0.2975694781, "date": "2023-08-04"},
-    {"Station_Number": "2260100", "norm": 0.4408831219, "date": "2023-08-05"},
-    {"Station_Number": "2260100", "norm": 0.5255156386, "date": "2023-08-06"},
-    {"Station_Number": "2260100", "norm": 0.658758594, "date": "2023-08-07"},
-    {"Station_Number": "2260100", "norm": 0.7477486201, "date": "2023-08-08"},
-    {"Station_Number": "2260100", "norm": 0.704754527, "date": "2023-08-09"},
-    {"Station_Number": "2260100", "norm": 0.7269294083, "date": "2023-08-10"},
-    {"Station_Number": "2260100", "norm": 0.7841580323, "date": "2023-08-11"},
-    {"Station_Number": "2260100", "norm": 0.8308318001, "date": "2023-08-12"},
-    {"Station_Number": "2260100", "norm": 0.9078144669, "date": "2023-08-13"},
-    {"Station_Number": "2260100", "norm": 0.8639488719, "date": "2023-08-14"},
-    {"Station_Number": "2260100", "norm": 0.7875472064, "date": "2023-08-15"},
-    {"Station_Number": "2260100", "norm": 0.7221845647, "date": "2023-08-16"},
-    {"Station_Number": "2260100", "norm": 0.6282560279, "date": "2023-08-17"},
-    {"Station_Number": "2260100", "norm": 0.5255156386, "date": "2023-08-18"},
-    {"Station_Number": "2260100", "norm": 0.4166747361, "date": "2023-08-19"},
-    {"Station_Number": "2260100", "norm": 0.3924663503, "date": "2023-08-20"},
-    {"Station_Number": "2260100", "norm": 0.4044737097, "date": "2023-08-21"},
-    {"Station_Number": "2260100", "norm": 0.3847196669, "date": "2023-08-22"},
-    {"Station_Number": "2260100", "norm": 0.4757431974, "date": "2023-08-23"},
-    {"Station_Number": "2260100", "norm": 0.5393628353, "date": "2023-08-24"},
-    {"Station_Number": "2260100", "norm": 0.5958167909, "date": "2023-08-25"},
-    {"Station_Number": "2260100", "norm": 0.5919434492, "date": "2023-08-26"},
-    {"Station_Number": "2260100", "norm": 0.667860947, "date": "2023-08-27"},
-    {"Station_Number": "2260100", "norm": 0.865401375, "date": "2023-08-28"},
-    {"Station_Number": "2260100", "norm": 0.9576837416, "date": "2023-08-29"},
-    {"Station_Number": "2260100", "norm": 0.9240825022, "date": "2023-08-30"},
-    {"Station_Number": "2260100", "norm": 0.8795390723, "date": "2023-08-31"},
-    {"Station_Number": "2260100", "norm": 0.781253026, "date": "2023-09-01"},
-    {"Station_Number": "2260100", "norm": 0.6179916723, "date": "2023-09-02"},
-    {"Station_Number": "2260100", "norm": 0.4495981408, "date": "2023-09-03"},
-    {"Station_Number": "2260100", "norm": 0.3268132081, "date": "2023-09-04"},
-    {"Station_Number": "2260100", "norm": 0.2764597657, "date": "2023-09-05"},
-    {"Station_Number": "2260100", "norm": 0.2462477002, "date": "2023-09-06"},
-    {"Station_Number": "2260100", "norm": 0.2220393144, "date": "2023-09-07"},
-    {"Station_Number": "2260100", "norm": 0.20305994, "date": "2023-09-08"},
-    {"Station_Number": "2260100", "norm": 0.1895032439, "date": "2023-09-09"},
-    {"Station_Number": "2260100", "norm": 0.177399051, "date": "2023-09-10"},
-    {"Station_Number": "2260100", "norm": 0.1677156967, "date": "2023-09-11"},
-    {"Station_Number": "2260100", "norm": 0.1558051709, "date": "2023-09-12"},
-    {"Station_Number": "2260100", "norm": 0.1619056841, "date": "2023-09-13"},
-    {"Station_Number": "2260100", "norm": 0.1856299022, "date": "2023-09-14"},
-    {"Station_Number": "2260100", "norm": 0.174009877, "date": "2023-09-15"},
-    {"Station_Number": "2260100", "norm": 0.1634550208, "date": "2023-09-16"},
-    {"Station_Number": "2260100", "norm": 0.1518349956, "date": "2023-09-17"},
-    {"Station_Number": "2260100", "norm": 0.1435073109, "date": "2023-09-18"},
-    {"Station_Number": "2260100", "norm": 0.1423453084, "date": "2023-09-19"},
-    {"Station_Number": "2260100", "norm": 0.1394403021, "date": "2023-09-20"},
-    {"Station_Number": "2260100", "norm": 0.1550305026, "date": "2023-09-21"},
-    {"Station_Number": "2260100", "norm": 0.2153577999, "date": "2023-09-22"},
-    {"Station_Number": "2260100", "norm": 0.2063522804, "date": "2023-09-23"},
-    {"Station_Number": "2260100", "norm": 0.2154546335, "date": "2023-09-24"},
-    {"Station_Number": "2260100", "norm": 0.2198121429, "date": "2023-09-25"},
-    {"Station_Number": "2260100", "norm": 0.2145831316, "date": "2023-09-26"},
-    {"Station_Number": "2260100", "norm": 0.1789483877, "date": "2023-09-27"},
-    {"Station_Number": "2260100", "norm": 0.1636486879, "date": "2023-09-28"},
-    {"Station_Number": "2260100", "norm": 0.1500919919, "date": "2023-09-29"},
-    {"Station_Number": "2260100", "norm": 0.142635809, "date": "2023-09-30"},
-    {"Station_Number": "2260100", "norm": 0.1331461218, "date": "2023-10-01"},
-    {"Station_Number": "2260100", "norm": 0.1289822795, "date": "2023-10-02"},
-    {"Station_Number": "2260100", "norm": 0.1247216036, "date": "2023-10-03"},
-    {"Station_Number": "2260100", "norm": 0.1226880992, "date": "2023-10-04"},
-    {"Station_Number": "2260100", "norm": 0.1311126174, "date": "2023-10-05"},
-    {"Station_Number": "2260100", "norm": 0.1382782996, "date": "2023-10-06"},
-    {"Station_Number": "2260100", "norm": 0.1543526678, "date": "2023-10-07"},
-    {"Station_Number": "2260100", "norm": 0.1559020045, "date": "2023-10-08"},
-    {"Station_Number": "2260100", "norm": 0.1483489881, "date": "2023-10-09"},
-    {"Station_Number": "2260100", "norm": 0.1493173235, "date": "2023-10-10"},
-    {"Station_Number": "2260100", "norm": 0.1539653336, "date": "2023-10-11"},
-    {"Station_Number": "2260100", "norm": 0.1528033311, "date": "2023-10-12"},
-    {"Station_Number": "2260100", "norm": 0.1520286627, "date": "2023-10-13"},
-    {"Station_Number": "2260100", "norm": 0.1546431684, "date": "2023-10-14"},
-    {"Station_Number": "2260100", "norm": 0.1503824925, "date": "2023-10-15"},
-    {"Station_Number": "2260100", "norm": 0.1336302895, "date": "2023-10-16"},
-    {"Station_Number": "2260100", "norm": 0.1205577612, "date": "2023-10-17"},
-    {"Station_Number": "2260100", "norm": 0.1052580614, "date": "2023-10-18"},
-    {"Station_Number": "2260100", "norm": 0.0968335431, "date": "2023-10-19"},
-    {"Station_Number": "2260100", "norm": 0.0905393628, "date": "2023-10-20"},
-    {"Station_Number": "2260100", "norm": 0.0871501888, "date": "2023-10-21"},
-    {"Station_Number": "2260100", "norm": 0.0823085117, "date": "2023-10-22"},
-    {"Station_Number": "2260100", "norm": 0.0774668345, "date": "2023-10-23"},
-    {"Station_Number": "2260100", "norm": 0.0742713276, "date": "2023-10-24"},
-    {"Station_Number": "2260100", "norm": 0.0719473226, "date": "2023-10-25"},
-    {"Station_Number": "2260100", "norm": 0.0711726542, "date": "2023-10-26"},
-    {"Station_Number": "2260100", "norm": 0.0726251574, "date": "2023-10-27"},
-    {"Station_Number": "2260100", "norm": 0.0937348698, "date": "2023-10-28"},
-    {"Station_Number": "2260100", "norm": 0.0876343565, "date": "2023-10-29"},
-    {"Station_Number": "2260100", "norm": 0.0697201511, "date": "2023-10-30"},
-    {"Station_Number": "2260100", "norm": 0.0619734676, "date": "2023-10-31"},
-    {"Station_Number": "2260100", "norm": 0.0576159582, "date": "2023-11-01"},
-    {"Station_Number": "2260100", "norm": 0.0540331171, "date": "2023-11-02"},
-    {"Station_Number": "2260100", "norm": 0.0518059456, "date": "2023-11-03"},
-    {"Station_Number": "2260100", "norm": 0.0501597753, "date": "2023-11-04"},
-    {"Station_Number": "2260100", "norm": 0.0491914399, "date": "2023-11-05"},
-    {"Station_Number": "2260100", "norm": 0.0481262709, "date": "2023-11-06"},
-    {"Station_Number": "2260100", "norm": 0.0467706013, "date": "2023-11-07"},
-    {"Station_Number": "2260100", "norm": 0.0453180982, "date": "2023-11-08"},
-    {"Station_Number": "2260100", "norm": 0.0440592621, "date": "2023-11-09"},
-    {"Station_Number": "2260100", "norm": 0.0428972596, "date": "2023-11-10"},
-    {"Station_Number": "2260100", "norm": 0.0421225913, "date": "2023-11-11"},
-    {"Station_Number": "2260100", "norm": 0.0403795875, "date": "2023-11-12"},
-    {"Station_Number": "2260100", "norm": 0.0390239179, "date": "2023-11-13"},
-    {"Station_Number": "2260100", "norm": 0.0377650818, "date": "2023-11-14"},
-    {"Station_Number": "2260100", "norm": 0.037087247, "date": "2023-11-15"},
-    {"Station_Number": "2260100", "norm": 0.036022078, "date": "2023-11-16"},
-    {"Station_Number": "2260100", "norm": 0.0353442432, "date": "2023-11-17"},
-    {"Station_Number": "2260100", "norm": 0.0448339305, "date": "2023-11-18"},
-    {"Station_Number": "2260100", "norm": 0.0522901133, "date": "2023-11-19"},
-    {"Station_Number": "2260100", "norm": 0.0389270843, "date": "2023-11-20"},
-    {"Station_Number": "2260100", "norm": 0.0288563959, "date": "2023-11-21"},
-    {"Station_Number": "2260100", "norm": 0.025854556, "date": "2023-11-22"},
-    {"Station_Number": "2260100", "norm": 0.0244988864, "date": "2023-11-23"},
-    {"Station_Number": "2260100", "norm": 0.0222717149, "date": "2023-11-24"},
-    {"Station_Number": "2260100", "norm": 0.0206255447, "date": "2023-11-25"},
-    {"Station_Number": "2260100", "norm": 0.0186888738, "date": "2023-11-26"},
-    {"Station_Number": "2260100", "norm": 0.01694587, "date": "2023-11-27"},
-    {"Station_Number": "2260100", "norm": 0.0159775346, "date": "2023-11-28"},
-    {"Station_Number": "2260100", "norm": 0.0152996998, "date": "2023-11-29"},
-    {"Station_Number": "2260100", "norm": 0.0143313644, "date": "2023-11-30"},
-    {"Station_Number": "2260100", "norm": 0.0140408638, "date": "2023-12-01"},
-    {"Station_Number": "2260100", "norm": 0.0137503631, "date": "2023-12-02"},
-    {"Station_Number": "2260100", "norm": 0.0134598625, "date": "2023-12-03"},
-    {"Station_Number": "2260100", "norm": 0.0130725283, "date": "2023-12-04"},
-    {"Station_Number": "2260100", "norm": 0.0127820277, "date": "2023-12-05"},
-    {"Station_Number": "2260100", "norm": 0.0125883606, "date": "2023-12-06"},
-    {"Station_Number": "2260100", "norm": 0.0125883606, "date": "2023-12-07"},
-    {"Station_Number": "2260100", "norm": 0.0128788612, "date": "2023-12-08"},
-    {"Station_Number": "2260100", "norm": 0.0143313644, "date": "2023-12-09"},
-    {"Station_Number": "2260100", "norm": 0.0139440302, "date": "2023-12-10"},
-    {"Station_Number": "2260100", "norm": 0.0137503631, "date": "2023-12-11"},
-    {"Station_Number": "2260100", "norm": 0.013556696, "date": "2023-12-12"},
-    {"Station_Number": "2260100", "norm": 0.0134598625, "date": "2023-12-13"},
-    {"Station_Number": "2260100", "norm": 0.013363029, "date": "2023-12-14"},
-    {"Station_Number": "2260100", "norm": 0.0130725283, "date": "2023-12-15"},
-    {"Station_Number": "2260100", "norm": 0.0126851942, "date": "2023-12-16"},
-    {"Station_Number": "2260100", "norm": 0.0124915271, "date": "2023-12-17"},
-    {"Station_Number": "2260100", "norm": 0.01229786, "date": "2023-12-18"},
-    {"Station_Number": "2260100", "norm": 0.0121041929, "date": "2023-12-19"},
-    {"Station_Number": "2260100", "norm": 0.0117168587, "date": "2023-12-20"},
-    {"Station_Number": "2260100", "norm": 0.0113295245, "date": "2023-12-21"},
-    {"Station_Number": "2260100", "norm": 0.0111358575, "date": "2023-12-22"},
-    {"Station_Number": "2260100", "norm": 0.0110390239, "date": "2023-12-23"},
-    {"Station_Number": "2260100", "norm": 0.0109421904, "date": "2023-12-24"},
-    {"Station_Number": "2260100", "norm": 0.0108453568, "date": "2023-12-25"},
-    {"Station_Number": "2260100", "norm": 0.0107485233, "date": "2023-12-26"},
-    {"Station_Number": "2260100", "norm": 0.0106516897, "date": "2023-12-27"},
-    {"Station_Number": "2260100", "norm": 0.0106516897, "date": "2023-12-28"},
-    {"Station_Number": "2260100", "norm": 0.0105548562, "date": "2023-12-29"},
-    {"Station_Number": "2260100", "norm": 0.0105548562, "date": "2023-12-30"},
-    {"Station_Number": "2260100", "norm": 0.0105548562, "date": "2023-12-31"},
-    {"Station_Number": "2260110", "norm": 0.0263574603, "date": "2020-01-01"},
-    {"Station_Number": "2260110", "norm": 0.0261531389, "date": "2020-01-02"},
-    {"Station_Number": "2260110", "norm": 0.0258977371, "date": "2020-01-03"},
-    {"Station_Number": "2260110", "norm": 0.0261531389, "date": "2020-01-04"},
-    {"Station_Number": "2260110", "norm": 0.0262042192, "date": "2020-01-05"},
-    {"Station_Number": "2260110", "norm": 0.0268171834, "date": "2020-01-06"},
-    {"Station_Number": "2260110", "norm": 0.0277877101, "date": "2020-01-07"},
-    {"Station_Number": "2260110", "norm": 0.0282985136, "date": "2020-01-08"},
-    {"Station_Number": "2260110", "norm": 0.0288093171, "date": "2020-01-09"},
-    {"Station_Number": "2260110", "norm": 0.0297287633, "date": "2020-01-10"},
-    {"Station_Number": "2260110", "norm": 0.0304438882, "date": "2020-01-11"},
-    {"Station_Number": "2260110", "norm": 0.0301884865, "date": "2020-01-12"},
-    {"Station_Number": "2260110", "norm": 0.0288603974, "date": "2020-01-13"},
-    {"Station_Number": "2260110", "norm": 0.0272769066, "date": "2020-01-14"},
-    {"Station_Number": "2260110", "norm": 0.0258466568, "date": "2020-01-15"},
-    {"Station_Number": "2260110", "norm": 0.0243653267, "date": "2020-01-16"},
-    {"Station_Number": "2260110", "norm": 0.0233437197, "date": "2020-01-17"},
-    {"Station_Number": "2260110", "norm": 0.0224242734, "date": "2020-01-18"},
-    {"Station_Number": "2260110", "norm": 0.0217602288, "date": "2020-01-19"},
-    {"Station_Number": "2260110", "norm": 0.0209940236, "date": "2020-01-20"},
-    {"Station_Number": "2260110", "norm": 0.0204832201, "date": "2020-01-21"},
-    {"Station_Number": "2260110", "norm": 0.0200745773, "date": "2020-01-22"},
-    {"Station_Number": "2260110", "norm": 0.0198191756, "date": "2020-01-23"},
-    {"Station_Number": "2260110", "norm": 0.0195637738, "date": "2020-01-24"},
-    {"Station_Number": "2260110", "norm": 0.0192062114, "date": "2020-01-25"},
-    {"Station_Number": "2260110", "norm": 0.0188997293, "date": "2020-01-26"},
-    {"Station_Number": "2260110", "norm": 0.0185932472, "date": "2020-01-27"},
-    {"Station_Number": "2260110", "norm": 0.0183889258, "date": "2020-01-28"},
-    {"Station_Number": "2260110", "norm": 0.0182356847, "date": "2020-01-29"},
-    {"Station_Number": "2260110", "norm": 0.0181846044, "date": "2020-01-30"},
-    {"Station_Number": "2260110", "norm": 0.0180824437, "date": "2020-01-31"},
-    {"Station_Number": "2260110", "norm": 0.0178270419, "date": "2020-02-01"},
-    {"Station_Number": "2260110", "norm": 0.0175205598, "date": "2020-02-02"},
-    {"Station_Number": "2260110", "norm": 0.0173673188, "date": "2020-02-03"},
-    {"Station_Number": "2260110", "norm": 0.0171629974, "date": "2020-02-04"},
-    {"Station_Number": "2260110", "norm": 0.0168565153, "date": "2020-02-05"},
-    {"Station_Number": "2260110", "norm": 0.0166521939, "date": "2020-02-06"},
-    {"Station_Number": "2260110", "norm": 0.0164989529, "date": "2020-02-07"},
-    {"Station_Number": "2260110", "norm": 0.0164989529, "date": "2020-02-08"},
-    {"Station_Number": "2260110", "norm": 0.0164989529, "date": "2020-02-09"},
-    {"Station_Number": "2260110", "norm": 0.0164989529, "date": "2020-02-10"},
-    {"Station_Number": "2260110", "norm": 0.0163457118, "date": "2020-02-11"},
-    {"Station_Number": "2260110", "norm": 0.0163457118, "date": "2020-02-12"},
-    {"Station_Number": "2260110", "norm": 0.0161413904, "date": "2020-02-13"},
-    {"Station_Number": "2260110", "norm": 0.0160392297, "date": "2020-02-14"},
-    {"Station_Number": "2260110", "norm": 0.015937069, "date": "2020-02-15"},
-    {"Station_Number": "2260110", "norm": 0.0156816673, "date": "2020-02-16"},
-    {"Station_Number": "2260110", "norm": 0.0154773459, "date": "2020-02-17"},
-    {"Station_Number": "2260110", "norm": 0.0153751852, "date": "2020-02-18"},
-    {"Station_Number": "2260110", "norm": 0.0151708638, "date": "2020-02-19"},
-    {"Station_Number": "2260110", "norm": 0.0151197834, "date": "2020-02-20"},
-    {"Station_Number": "2260110", "norm": 0.014915462, "date": "2020-02-21"},
-    {"Station_Number": "2260110", "norm": 0.014762221, "date": "2020-02-22"},
-    {"Station_Number": "2260110", "norm": 0.0146089799, "date": "2020-02-23"},
-    {"Station_Number": "2260110", "norm": 0.0144046585, "date": "2020-02-24"},
-    {"Station_Number": "2260110", "norm": 0.0142514175, "date": "2020-02-25"},
-    {"Station_Number": "2260110", "norm": 0.0140470961, "date": "2020-02-26"},
-    {"Station_Number": "2260110", "norm": 0.0140470961, "date": "2020-02-27"},
-    {"Station_Number": "2260110", "norm": 0.0143024978, "date": "2020-02-28"},
-    {"Station_Number": "2260110", "norm": 0.0144046585, "date": "2020-02-29"},
-    {"Station_Number": "2260110", "norm": 0.0146600603, "date": "2020-03-01"},
-    {"Station_Number": "2260110", "norm": 0.0153241048, "date": "2020-03-02"},
-    {"Station_Number": "2260110", "norm": 0.0160392297, "date": "2020-03-03"},
-    {"Station_Number": "2260110", "norm": 0.0165500332, "date": "2020-03-04"},
-    {"Station_Number": "2260110", "norm": 0.0168054349, "date": "2020-03-05"},
-    {"Station_Number": "2260110", "norm": 0.0164989529, "date": "2020-03-06"},
-    {"Station_Number": "2260110", "norm": 0.0159881494, "date": "2020-03-07"},
-    {"Station_Number": "2260110", "norm": 0.0155795066, "date": "2020-03-08"},
-    {"Station_Number": "2260110", "norm": 0.0152730245, "date": "2020-03-09"},
-    {"Station_Number": "2260110", "norm": 0.0151197834, "date": "2020-03-10"},
-    {"Station_Number": "2260110", "norm": 0.014915462, "date": "2020-03-11"},
-    {"Station_Number": "2260110", "norm": 0.014762221, "date": "2020-03-12"},
-    {"Station_Number": "2260110", "norm": 0.0147111406, "date": "2020-03-13"},
-    {"Station_Number": "2260110", "norm": 0.0144557389, "date": "2020-03-14"},
-    {"Station_Number": "2260110", "norm": 0.0142003371, "date": "2020-03-15"},
-    {"Station_Number": "2260110", "norm": 0.0138427747, "date": "2020-03-16"},
-    {"Station_Number": "2260110", "norm": 0.0134852122, "date": "2020-03-17"},
-    {"Station_Number": "2260110", "norm": 0.0129744087, "date": "2020-03-18"},
-    {"Station_Number": "2260110", "norm": 0.0126168463, "date": "2020-03-19"},
-    {"Station_Number": "2260110", "norm": 0.0122082035, "date": "2020-03-20"},
-    {"Station_Number": "2260110", "norm": 0.0119528018, "date": "2020-03-21"},
-    {"Station_Number": "2260110", "norm": 0.0116974, "date": "2020-03-22"},
-    {"Station_Number": "2260110", "norm": 0.0114419983, "date": "2020-03-23"},
-    {"Station_Number": "2260110", "norm": 0.0111865965, "date": "2020-03-24"},
-    {"Station_Number": "2260110", "norm": 0.0109311948, "date": "2020-03-25"},
-    {"Station_Number": "2260110", "norm": 0.0107268734, "date": "2020-03-26"},
-    {"Station_Number": "2260110", "norm": 0.0106247127, "date": "2020-03-27"},
-    {"Station_Number": "2260110", "norm": 0.0104714716, "date": "2020-03-28"},
-    {"Station_Number": "2260110", "norm": 0.0104714716, "date": "2020-03-29"},
-    {"Station_Number": "2260110", "norm": 0.0103693109, "date": "2020-03-30"},
-    {"Station_Number": "2260110", "norm": 0.0102160699, "date": "2020-03-31"},
-    {"Station_Number": "2260110", "norm": 0.0101139092, "date": "2020-04-01"},
-    {"Station_Number": "2260110", "norm": 0.0099095878, "date": "2020-04-02"},
-    {"Station_Number": "2260110", "norm": 0.009654186, "date": "2020-04-03"},
-    {"Station_Number": "2260110", "norm": 0.0094498646, "date": "2020-04-04"},
-    {"Station_Number": "2260110", "norm": 0.0092966236, "date": "2020-04-05"},
-    {"Station_Number": "2260110", "norm": 0.0089901415, "date": "2020-04-06"},
-    {"Station_Number": "2260110", "norm": 0.0087858201, "date": "2020-04-07"},
-    {"Station_Number": "2260110", "norm": 0.0086836594, "date": "2020-04-08"},
-    {"Station_Number": "2260110", "norm": 0.0085304183, "date": "2020-04-09"},
-    {"Station_Number": "2260110", "norm": 0.0083771773, "date": "2020-04-10"},
-    {"Station_Number": "2260110", "norm": 0.0082750166, "date": "2020-04-11"},
-    {"Station_Number": "2260110", "norm": 0.0081217756, "date": "2020-04-12"},
-    {"Station_Number": "2260110", "norm": 0.0080196149, "date": "2020-04-13"},
-    {"Station_Number": "2260110", "norm": 0.0080196149, "date": "2020-04-14"},
-    {"Station_Number": "2260110", "norm": 0.0081217756, "date": "2020-04-15"},
-    {"Station_Number": "2260110", "norm": 0.0081217756, "date": "2020-04-16"},
-    {"Station_Number": "2260110", "norm": 0.008326097, "date": "2020-04-17"},
-    {"Station_Number": "2260110", "norm": 0.0087347397, "date": "2020-04-18"},
-    {"Station_Number": "2260110", "norm": 0.0087858201, "date": "2020-04-19"},
-    {"Station_Number": "2260110", "norm": 0.0087858201, "date": "2020-04-20"},
-    {"Station_Number": "2260110", "norm": 0.0086836594, "date": "2020-04-21"},
-    {"Station_Number": "2260110", "norm": 0.0086836594, "date": "2020-04-22"},
-    {"Station_Number": "2260110", "norm": 0.0087858201, "date": "2020-04-23"},
-    {"Station_Number": "2260110", "norm": 0.0089901415, "date": "2020-04-24"},
-    {"Station_Number": "2260110", "norm": 0.0096031057, "date": "2020-04-25"},
-    {"Station_Number": "2260110", "norm": 0.0102671502, "date": "2020-04-26"},
-    {"Station_Number": "2260110", "norm": 0.0114419983, "date": "2020-04-27"},
-    {"Station_Number": "2260110", "norm": 0.0135362926, "date": "2020-04-28"},
-    {"Station_Number": "2260110", "norm": 0.0161413904, "date": "2020-04-29"},
-    {"Station_Number": "2260110", "norm": 0.017980283, "date": "2020-04-30"},
-    {"Station_Number": "2260110", "norm": 0.0186954079, "date": "2020-05-01"},
-    {"Station_Number": "2260110", "norm": 0.0214537467, "date": "2020-05-02"},
-    {"Station_Number": "2260110", "norm": 0.0252847729, "date": "2020-05-03"},
-    {"Station_Number": "2260110", "norm": 0.0265107013, "date": "2020-05-04"},
-    {"Station_Number": "2260110", "norm": 0.025438014, "date": "2020-05-05"},
-    {"Station_Number": "2260110", "norm": 0.0240588446, "date": "2020-05-06"},
-    {"Station_Number": "2260110", "norm": 0.0238034428, "date": "2020-05-07"},
-    {"Station_Number": "2260110", "norm": 0.0234969607, "date": "2020-05-08"},
-    {"Station_Number": "2260110", "norm": 0.0225775144, "date": "2020-05-09"},
-    {"Station_Number": "2260110", "norm": 0.0209940236, "date": "2020-05-10"},
-    {"Station_Number": "2260110", "norm": 0.0199213363, "date": "2020-05-11"},
-    {"Station_Number": "2260110", "norm": 0.0187975686, "date": "2020-05-12"},
-    {"Station_Number": "2260110", "norm": 0.017111917, "date": "2020-05-13"},
-    {"Station_Number": "2260110", "norm": 0.0156816673, "date": "2020-05-14"},
-    {"Station_Number": "2260110", "norm": 0.0152219441, "date": "2020-05-15"},
-    {"Station_Number": "2260110", "norm": 0.0148643817, "date": "2020-05-16"},
-    {"Station_Number": "2260110", "norm": 0.0145578996, "date": "2020-05-17"},
-    {"Station_Number": "2260110", "norm": 0.013893855, "date": "2020-05-18"},
-    {"Station_Number": "2260110", "norm": 0.0133319712, "date": "2020-05-19"},
-    {"Station_Number": "2260110", "norm": 0.0151708638, "date": "2020-05-20"},
-    {"Station_Number": "2260110", "norm": 0.0204832201, "date": "2020-05-21"},
-    {"Station_Number": "2260110", "norm": 0.0224753537, "date": "2020-05-22"},
-    {"Station_Number": "2260110", "norm": 0.0231904786, "date": "2020-05-23"},
-    {"Station_Number": "2260110", "norm": 0.0237523625, "date": "2020-05-24"},
-    {"Station_Number": "2260110", "norm": 0.0261531389, "date": "2020-05-25"},
-    {"Station_Number": "2260110", "norm": 0.0291668795, "date": "2020-05-26"},
-    {"Station_Number": "2260110", "norm": 0.0333043878, "date": "2020-05-27"},
-    {"Station_Number": "2260110", "norm": 0.0433672166, "date": "2020-05-28"},
-    {"Station_Number": "2260110", "norm": 0.0525616795, "date": "2020-05-29"},
-    {"Station_Number": "2260110", "norm": 0.056290545, "date": "2020-05-30"},
-    {"Station_Number": "2260110", "norm": 0.0747816315, "date": "2020-05-31"},
-    {"Station_Number": "2260110", "norm": 0.0949072892, "date": "2020-06-01"},
-    {"Station_Number": "2260110", "norm": 0.0898503346, "date": "2020-06-02"},
-    {"Station_Number": "2260110", "norm": 0.0795831843, "date": "2020-06-03"},
-    {"Station_Number": "2260110", "norm": 0.0708484446, "date": "2020-06-04"},
-    {"Station_Number": "2260110", "norm": 0.0625223477, "date": "2020-06-05"},
-    {"Station_Number": "2260110", "norm": 0.0582826787, "date": "2020-06-06"},
-    {"Station_Number": "2260110", "norm": 0.0611431782, "date": "2020-06-07"},
-    {"Station_Number": "2260110", "norm": 0.060376973, "date": "2020-06-08"},
-    {"Station_Number": "2260110", "norm": 0.0690606324, "date": "2020-06-09"},
-    {"Station_Number": "2260110", "norm": 0.0806558717, "date": "2020-06-10"},
-    {"Station_Number": "2260110", "norm": 0.0912805844, "date": "2020-06-11"},
-    {"Station_Number": "2260110", "norm": 0.1089033049, "date": "2020-06-12"},
-    {"Station_Number": "2260110", "norm": 0.1128364918, "date": "2020-06-13"},
-    {"Station_Number": "2260110", "norm": 0.1139091791, "date": "2020-06-14"},
-    {"Station_Number": "2260110", "norm": 0.1328089084, "date": "2020-06-15"},
-    {"Station_Number": "2260110", "norm": 0.1727537416, "date": "2020-06-16"},
-    {"Station_Number": "2260110", "norm": 0.1956888185, "date": "2020-06-17"},
-    {"Station_Number": "2260110", "norm": 0.1980385146, "date": "2020-06-18"},
-    {"Station_Number": "2260110", "norm": 0.2456964806, "date": "2020-06-19"},
-    {"Station_Number": "2260110", "norm": 0.2776216989, "date": "2020-06-20"},
-    {"Station_Number": "2260110", "norm": 0.3423405016, "date": "2020-06-21"},
-    {"Station_Number": "2260110", "norm": 0.3772794606, "date": "2020-06-22"},
-    {"Station_Number": "2260110", "norm": 0.407161465, "date": "2020-06-23"},
-    {"Station_Number": "2260110", "norm": 0.4595188231, "date": "2020-06-24"},
-    {"Station_Number": "2260110", "norm": 0.471931348, "date": "2020-06-25"},
-    {"Station_Number": "2260110", "norm": 0.4523675742, "date": "2020-06-26"},
-    {"Station_Number": "2260110", "norm": 0.4358686213, "date": "2020-06-27"},
-    {"Station_Number": "2260110", "norm": 0.421923686, "date": "2020-06-28"},
-    {"Station_Number": "2260110", "norm": 0.3913265567, "date": "2020-06-29"},
-    {"Station_Number": "2260110", "norm": 0.3606272667, "date": "2020-06-30"},
-    {"Station_Number": "2260110", "norm": 0.3514838841, "date": "2020-07-01"},
-    {"Station_Number": "2260110", "norm": 0.3553659907, "date": "2020-07-02"},
-    {"Station_Number": "2260110", "norm": 0.357307044, "date": "2020-07-03"},
-    {"Station_Number": "2260110", "norm": 0.372069265, "date": "2020-07-04"},
-    {"Station_Number": "2260110", "norm": 0.3951065025, "date": "2020-07-05"},
-    {"Station_Number": "2260110", "norm": 0.4024620728, "date": "2020-07-06"},
-    {"Station_Number": "2260110", "norm": 0.4192675078, "date": "2020-07-07"},
-    {"Station_Number": "2260110", "norm": 0.4585482965, "date": "2020-07-08"},
-    {"Station_Number": "2260110", "norm": 0.4961434336, "date": "2020-07-09"},
-    {"Station_Number": "2260110", "norm": 0.5375185166, "date": "2020-07-10"},
-    {"Station_Number": "2260110", "norm": 0.5715891097, "date": "2020-07-11"},
-    {"Station_Number": "2260110", "norm": 0.5904888389, "date": "2020-07-12"},
-    {"Station_Number": "2260110", "norm": 0.6007049088, "date": "2020-07-13"},
-    {"Station_Number": "2260110", "norm": 0.6031056852, "date": "2020-07-14"},
-    {"Station_Number": "2260110", "norm": 0.62573428, "date": "2020-07-15"},
-    {"Station_Number": "2260110", "norm": 0.6526536242, "date": "2020-07-16"},
-    {"Station_Number": "2260110", "norm": 0.6779894774, "date": "2020-07-17"},
-    {"Station_Number": "2260110", "norm": 0.707309598, "date": "2020-07-18"},
-    {"Station_Number": "2260110", "norm": 0.7367318792, "date": "2020-07-19"},
-    {"Station_Number": "2260110", "norm": 0.7370894417, "date": "2020-07-20"},
-    {"Station_Number": "2260110", "norm": 0.7316238443, "date": "2020-07-21"},
-    {"Station_Number": "2260110", "norm": 0.7273841753, "date": "2020-07-22"},
-    {"Station_Number": "2260110", "norm": 0.7357102723, "date": "2020-07-23"},
-    {"Station_Number": "2260110", "norm": 0.7753997037, "date": "2020-07-24"},
-    {"Station_Number": "2260110", "norm": 0.8077335649, "date": "2020-07-25"},
-    {"Station_Number": "2260110", "norm": 0.8268376156, "date": "2020-07-26"},
-    {"Station_Number": "2260110", "norm": 0.8288808295, "date": "2020-07-27"},
-    {"Station_Number": "2260110", "norm": 0.8184604383, "date": "2020-07-28"},
-    {"Station_Number": "2260110", "norm": 0.8140675282, "date": "2020-07-29"},
-    {"Station_Number": "2260110", "norm": 0.8053838688, "date": "2020-07-30"},
-    {"Station_Number": "2260110", "norm": 0.7680952138, "date": "2020-07-31"},
-    {"Station_Number": "2260110", "norm": 0.7142565255, "date": "2020-08-01"},
-    {"Station_Number": "2260110", "norm": 0.6546968381, "date": "2020-08-02"},
-    {"Station_Number": "2260110", "norm": 0.5709250651, "date": "2020-08-03"},
-    {"Station_Number": "2260110", "norm": 0.4837819891, "date": "2020-08-04"},
-    {"Station_Number": "2260110", "norm": 0.4334167646, "date": "2020-08-05"},
-    {"Station_Number": "2260110", "norm": 0.4364815855, "date": "2020-08-06"},
-    {"Station_Number": "2260110", "norm": 0.4204423558, "date": "2020-08-07"},
-    {"Station_Number": "2260110", "norm": 0.3731419523, "date": "2020-08-08"},
-    {"Station_Number": "2260110", "norm": 0.3469888134, "date": "2020-08-09"},
-    {"Station_Number": "2260110", "norm": 0.3916841191, "date": "2020-08-10"},
-    {"Station_Number": "2260110", "norm": 0.4458292895, "date": "2020-08-11"},
-    {"Station_Number": "2260110", "norm": 0.5249527507, "date": "2020-08-12"},
-    {"Station_Number": "2260110", "norm": 0.5770547071, "date": "2020-08-13"},
-    {"Station_Number": "2260110", "norm": 0.6197578791, "date": "2020-08-14"},
-    {"Station_Number": "2260110", "norm": 0.6528068652, "date": "2020-08-15"},
-    {"Station_Number": "2260110", "norm": 0.6914746897, "date": "2020-08-16"},
-    {"Station_Number": "2260110", "norm": 0.7370894417, "date": "2020-08-17"},
-    {"Station_Number": "2260110", "norm": 0.7684016959, "date": "2020-08-18"},
-    {"Station_Number": "2260110", "norm": 0.7949634776, "date": "2020-08-19"},
-    {"Station_Number": "2260110", "norm": 0.8552382898, "date": "2020-08-20"},
-    {"Station_Number": "2260110", "norm": 0.9337487868, "date": "2020-08-21"},
-    {"Station_Number": "2260110", "norm": 0.9894263677, "date": "2020-08-22"},
-    {"Station_Number": "2260110", "norm": 1.0, "date": "2020-08-23"},
-    {"Station_Number": "2260110", "norm": 0.9792102978, "date": "2020-08-24"},
-    {"Station_Number": "2260110", "norm": 0.9318588139, "date": "2020-08-25"},
-    {"Station_Number": "2260110", "norm": 0.8715840016, "date": "2020-08-26"},
-    {"Station_Number": "2260110", "norm": 0.7951677989, "date": "2020-08-27"},
-    {"Station_Number": "2260110", "norm": 0.6968892067, "date": "2020-08-28"},
-    {"Station_Number": "2260110", "norm": 0.6179189866, "date": "2020-08-29"},
-    {"Station_Number": "2260110", "norm": 0.4851100782, "date": "2020-08-30"},
-    {"Station_Number": "2260110", "norm": 0.4137508301, "date": "2020-08-31"},
-    {"Station_Number": "2260110", "norm": 0.3948000204, "date": "2020-09-01"},
-    {"Station_Number": "2260110", "norm": 0.449558155, "date": "2020-09-02"},
-    {"Station_Number": "2260110", "norm": 0.4761199367, "date": "2020-09-03"},
-    {"Station_Number": "2260110", "norm": 0.4224855698, "date": "2020-09-04"},
-    {"Station_Number": "2260110", "norm": 0.352045768, "date": "2020-09-05"},
-    {"Station_Number": "2260110", "norm": 0.3052050876, "date": "2020-09-06"},
-    {"Station_Number": "2260110", "norm": 0.2728712264, "date": "2020-09-07"},
-    {"Station_Number": "2260110", "norm": 0.2675077898, "date": "2020-09-08"},
-    {"Station_Number": "2260110", "norm": 0.2685293967, "date": "2020-09-09"},
-    {"Station_Number": "2260110", "norm": 0.2663329417, "date": "2020-09-10"},
-    {"Station_Number": "2260110", "norm": 0.2569341574, "date": "2020-09-11"},
-    {"Station_Number": "2260110", "norm": 0.2602032998, "date": "2020-09-12"},
-    {"Station_Number": "2260110", "norm": 0.3030086326, "date": "2020-09-13"},
-    {"Station_Number": "2260110", "norm": 0.3656331409, "date": "2020-09-14"},
-    {"Station_Number": "2260110", "norm": 0.4127803034, "date": "2020-09-15"},
-    {"Station_Number": "2260110", "norm": 0.4446033611, "date": "2020-09-16"},
-    {"Station_Number": "2260110", "norm": 0.4722889105, "date": "2020-09-17"},
-    {"Station_Number": "2260110", "norm": 0.4984420493, "date": "2020-09-18"},
-    {"Station_Number": "2260110", "norm": 0.4977780048, "date": "2020-09-19"},
-    {"Station_Number": "2260110", "norm": 0.4832711856, "date": "2020-09-20"},
-    {"Station_Number": "2260110", "norm": 0.4588547786, "date": "2020-09-21"},
-    {"Station_Number": "2260110", "norm": 0.4380650764, "date": "2020-09-22"},
-    {"Station_Number": "2260110", "norm": 0.4452163253, "date": "2020-09-23"},
-    {"Station_Number": "2260110", "norm": 0.4833222659, "date": "2020-09-24"},
-    {"Station_Number": "2260110", "norm": 0.4891965061, "date": "2020-09-25"},
-    {"Station_Number": "2260110", "norm": 0.5349644992, "date": "2020-09-26"},
-    {"Station_Number": "2260110", "norm": 0.5720999132, "date": "2020-09-27"},
-    {"Station_Number": "2260110", "norm": 0.6013689534, "date": "2020-09-28"},
-    {"Station_Number": "2260110", "norm": 0.6281350564, "date": "2020-09-29"},
-    {"Station_Number": "2260110", "norm": 0.6516320172, "date": "2020-09-30"},
-    {"Station_Number": "2260110", "norm": 0.6686417735, "date": "2020-10-01"},
-    {"Station_Number": "2260110", "norm": 0.6814118609, "date": "2020-10-02"},
-    {"Station_Number": "2260110", "norm": 0.6977575727, "date": "2020-10-03"},
-    {"Station_Number": "2260110", "norm": 0.6875415028, "date": "2020-10-04"},
-    {"Station_Number": "2260110", "norm": 0.6401900189, "date": "2020-10-05"},
-    {"Station_Number": "2260110", "norm": 0.588598866, "date": "2020-10-06"},
-    {"Station_Number": "2260110", "norm": 0.5607089952, "date": "2020-10-07"},
-    {"Station_Number": "2260110", "norm": 0.5359861061, "date": "2020-10-08"},
-    {"Station_Number": "2260110", "norm": 0.5264851612, "date": "2020-10-09"},
-    {"Station_Number": "2260110", "norm": 0.5178015018, "date": "2020-10-10"},
-    {"Station_Number": "2260110", "norm": 0.4859273637, "date": "2020-10-11"},
-    {"Station_Number": "2260110", "norm": 0.427491444, "date": "2020-10-12"},
-    {"Station_Number": "2260110", "norm": 0.3750830056, "date": "2020-10-13"},
-    {"Station_Number": "2260110", "norm": 0.3314603872, "date": "2020-10-14"},
-    {"Station_Number": "2260110", "norm": 0.2939163304, "date": "2020-10-15"},
-    {"Station_Number": "2260110", "norm": 0.2648005312, "date": "2020-10-16"},
-    {"Station_Number": "2260110", "norm": 0.2454921592, "date": "2020-10-17"},
-    {"Station_Number": "2260110", "norm": 0.2361955356, "date": "2020-10-18"},
-    {"Station_Number": "2260110", "norm": 0.2295550902, "date": "2020-10-19"},
-    {"Station_Number": "2260110", "norm": 0.2305766971, "date": "2020-10-20"},
-    {"Station_Number": "2260110", "norm": 0.2441129897, "date": "2020-10-21"},
-    {"Station_Number": "2260110", "norm": 0.2763446902, "date": "2020-10-22"},
-    {"Station_Number": "2260110", "norm": 0.3817745313, "date": "2020-10-23"},
-    {"Station_Number": "2260110", "norm": 0.5935536599, "date": "2020-10-24"},
-    {"Station_Number": "2260110", "norm": 0.7069520356, "date": "2020-10-25"},
-    {"Station_Number": "2260110", "norm": 0.7713132758, "date": "2020-10-26"},
-    {"Station_Number": "2260110", "norm": 0.8148848138, "date": "2020-10-27"},
-    {"Station_Number": "2260110", "norm": 0.8188180007, "date": "2020-10-28"},
-    {"Station_Number": "2260110", "norm": 0.7994074679, "date": "2020-10-29"},
-    {"Station_Number": "2260110", "norm": 0.7502170915, "date": "2020-10-30"},
-    {"Station_Number": "2260110", "norm": 0.6620013281, "date": "2020-10-31"},
-    {"Station_Number": "2260110", "norm": 0.5959544363, "date": "2020-11-01"},
-    {"Station_Number": "2260110", "norm": 0.5126423865, "date": "2020-11-02"},
-    {"Station_Number": "2260110", "norm": 0.4654441436, "date": "2020-11-03"},
-    {"Station_Number": "2260110", "norm": 0.4520610921, "date": "2020-11-04"},
-    {"Station_Number": "2260110", "norm": 0.4452163253, "date": "2020-11-05"},
-    {"Station_Number": "2260110", "norm": 0.4219747663, "date": "2020-11-06"},
-    {"Station_Number": "2260110", "norm": 0.3835112632, "date": "2020-11-07"},
-    {"Station_Number": "2260110", "norm": 0.3428513051, "date": "2020-11-08"},
-    {"Station_Number": "2260110", "norm": 0.3072483016, "date": "2020-11-09"},
-    {"Station_Number": "2260110", "norm": 0.2753741636, "date": "2020-11-10"},
-    {"Station_Number": "2260110", "norm": 0.2491699443, "date": "2020-11-11"},
-    {"Station_Number": "2260110", "norm": 0.2318026255, "date": "2020-11-12"},
-    {"Station_Number": "2260110", "norm": 0.2166317618, "date": "2020-11-13"},
-    {"Station_Number": "2260110", "norm": 0.2041170762, "date": "2020-11-14"},
-    {"Station_Number": "2260110", "norm": 0.193134801, "date": "2020-11-15"},
-    {"Station_Number": "2260110", "norm": 0.1849619451, "date": "2020-11-16"},
-    {"Station_Number": "2260110", "norm": 0.1765847678, "date": "2020-11-17"},
-    {"Station_Number": "2260110", "norm": 0.1686673137, "date": "2020-11-18"},
-    {"Station_Number": "2260110", "norm": 0.1623844307, "date": "2020-11-19"},
-    {"Station_Number": "2260110", "norm": 0.1564591102, "date": "2020-11-20"},
-    {"Station_Number": "2260110", "norm": 0.1508913521, "date": "2020-11-21"},
-    {"Station_Number": "2260110", "norm": 0.147520049, "date": "2020-11-22"},
-    {"Station_Number": "2260110", "norm": 0.1430760586, "date": "2020-11-23"},
-    {"Station_Number": "2260110", "norm": 0.1380191041, "date": "2020-11-24"},
-    {"Station_Number": "2260110", "norm": 0.1324002656, "date": "2020-11-25"},
-    {"Station_Number": "2260110", "norm": 0.122950401, "date": "2020-11-26"},
-    {"Station_Number": "2260110", "norm": 0.1196301783, "date": "2020-11-27"},
-    {"Station_Number": "2260110", "norm": 0.1170761608, "date": "2020-11-28"},
-    {"Station_Number": "2260110", "norm": 0.1130408132, "date": "2020-11-29"},
-    {"Station_Number": "2260110", "norm": 0.1083925014, "date": "2020-11-30"},
-    {"Station_Number": "2260110", "norm": 0.1040506717, "date": "2020-12-01"},
-    {"Station_Number": "2260110", "norm": 0.1009858507, "date": "2020-12-02"},
-    {"Station_Number": "2260110", "norm": 0.0979721101, "date": "2020-12-03"},
-    {"Station_Number": "2260110", "norm": 0.0947540481, "date": "2020-12-04"},
-    {"Station_Number": "2260110", "norm": 0.092251111, "date": "2020-12-05"},
-    {"Station_Number": "2260110", "norm": 0.0897481739, "date": "2020-12-06"},
-    {"Station_Number": "2260110", "norm": 0.0877560403, "date": "2020-12-07"},
-    {"Station_Number": "2260110", "norm": 0.085968228, "date": "2020-12-08"},
-    {"Station_Number": "2260110", "norm": 0.0841293354, "date": "2020-12-09"},
-    {"Station_Number": "2260110", "norm": 0.0824947643, "date": "2020-12-10"},
-    {"Station_Number": "2260110", "norm": 0.081728559, "date": "2020-12-11"},
-    {"Station_Number": "2260110", "norm": 0.0795831843, "date": "2020-12-12"},
-    {"Station_Number": "2260110", "norm": 0.0785615774, "date": "2020-12-13"},
-    {"Station_Number": "2260110", "norm": 0.0769270062, "date": "2020-12-14"},
-    {"Station_Number": "2260110", "norm": 0.0757010778, "date": "2020-12-15"},
-    {"Station_Number": "2260110", "norm": 0.0741686673, "date": "2020-12-16"},
-    {"Station_Number": "2260110", "norm": 0.0729938193, "date": "2020-12-17"},
-    {"Station_Number": "2260110", "norm": 0.0710016857, "date": "2020-12-18"},
-    {"Station_Number": "2260110", "norm": 0.0698268376, "date": "2020-12-19"},
-    {"Station_Number": "2260110", "norm": 0.0680390254, "date": "2020-12-20"},
-    {"Station_Number": "2260110", "norm": 0.0678857843, "date": "2020-12-21"},
-    {"Station_Number": "2260110", "norm": 0.0674260612, "date": "2020-12-22"},
-    {"Station_Number": "2260110", "norm": 0.0674260612, "date": "2020-12-23"},
-    {"Station_Number": "2260110", "norm": 0.0674260612, "date": "2020-12-24"},
-    {"Station_Number": "2260110", "norm": 0.0674260612, "date": "2020-12-25"},
-    {"Station_Number": "2260110", "norm": 0.066966338, "date": "2020-12-26"},
-    {"Station_Number": "2260110", "norm": 0.0666087756, "date": "2020-12-27"},
-    {"Station_Number": "2260110", "norm": 0.0658425704, "date": "2020-12-28"},
-    {"Station_Number": "2260110", "norm": 0.0650252848, "date": "2020-12-29"},
-    {"Station_Number": "2260110", "norm": 0.0644123206, "date": "2020-12-30"},
-    {"Station_Number": "2260110", "norm": 0.0635439546, "date": "2020-12-31"},
-    {"Station_Number": "2260110", "norm": 0.0826792963, "date": "2021-01-01"},
-    {"Station_Number": "2260110", "norm": 0.0813261164, "date": "2021-01-02"},
-    {"Station_Number": "2260110", "norm": 0.0799729364, "date": "2021-01-03"},
-    {"Station_Number": "2260110", "norm": 0.0784844384, "date": "2021-01-04"},
-    {"Station_Number": "2260110", "norm": 0.0771989175, "date": "2021-01-05"},
-    {"Station_Number": "2260110", "norm": 0.0755074425, "date": "2021-01-06"},
-    {"Station_Number": "2260110", "norm": 0.0740189445, "date": "2021-01-07"},
-    {"Station_Number": "2260110", "norm": 0.0727334235, "date": "2021-01-08"},
-    {"Station_Number": "2260110", "norm": 0.0711096076, "date": "2021-01-09"},
-    {"Station_Number": "2260110", "norm": 0.0696211096, "date": "2021-01-10"},
-    {"Station_Number": "2260110", "norm": 0.0679972936, "date": "2021-01-11"},
-    {"Station_Number": "2260110", "norm": 0.0669147497, "date": "2021-01-12"},
-    {"Station_Number": "2260110", "norm": 0.0656968877, "date": "2021-01-13"},
-    {"Station_Number": "2260110", "norm": 0.0648849797, "date": "2021-01-14"},
-    {"Station_Number": "2260110", "norm": 0.0638024357, "date": "2021-01-15"},
-    {"Station_Number": "2260110", "norm": 0.0631258457, "date": "2021-01-16"},
-    {"Station_Number": "2260110", "norm": 0.0624492558, "date": "2021-01-17"},
-    {"Station_Number": "2260110", "norm": 0.0619756428, "date": "2021-01-18"},
-    {"Station_Number": "2260110", "norm": 0.0610284168, "date": "2021-01-19"},
-    {"Station_Number": "2260110", "norm": 0.0604871448, "date": "2021-01-20"},
-    {"Station_Number": "2260110", "norm": 0.0600811908, "date": "2021-01-21"},
-    {"Station_Number": "2260110", "norm": 0.0591339648, "date": "2021-01-22"},
-    {"Station_Number": "2260110", "norm": 0.0583220568, "date": "2021-01-23"},
-    {"Station_Number": "2260110", "norm": 0.0577131258, "date": "2021-01-24"},
-    {"Station_Number": "2260110", "norm": 0.0573071719, "date": "2021-01-25"},
-    {"Station_Number": "2260110", "norm": 0.0573071719, "date": "2021-01-26"},
-    {"Station_Number": "2260110", "norm": 0.0574424899, "date": "2021-01-27"},
-    {"Station_Number": "2260110", "norm": 0.0575778078, "date": "2021-01-28"},
-    {"Station_Number": "2260110", "norm": 0.0569012179, "date": "2021-01-29"},
-    {"Station_Number": "2260110", "norm": 0.0558186739, "date": "2021-01-30"},
-    {"Station_Number": "2260110", "norm": 0.0537212449, "date": "2021-01-31"},
-    {"Station_Number": "2260110", "norm": 0.052165088, "date": "2021-02-01"},
-    {"Station_Number": "2260110", "norm": 0.051082544, "date": "2021-02-02"},
-    {"Station_Number": "2260110", "norm": 0.050067659, "date": "2021-02-03"},
-    {"Station_Number": "2260110", "norm": 0.048849797, "date": "2021-02-04"},
-    {"Station_Number": "2260110", "norm": 0.048037889, "date": "2021-02-05"},
-    {"Station_Number": "2260110", "norm": 0.0472259811, "date": "2021-02-06"},
-    {"Station_Number": "2260110", "norm": 0.0465493911, "date": "2021-02-07"},
-    {"Station_Number": "2260110", "norm": 0.0460757781, "date": "2021-02-08"},
-    {"Station_Number": "2260110", "norm": 0.0452638701, "date": "2021-02-09"},
-    {"Station_Number": "2260110", "norm": 0.0443166441, "date": "2021-02-10"},
-    {"Station_Number": "2260110", "norm": 0.0437753721, "date": "2021-02-11"},
-    {"Station_Number": "2260110", "norm": 0.0431664411, "date": "2021-02-12"},
-    {"Station_Number": "2260110", "norm": 0.0425575101, "date": "2021-02-13"},
-    {"Station_Number": "2260110", "norm": 0.0419485792, "date": "2021-02-14"},
-    {"Station_Number": "2260110", "norm": 0.0414749662, "date": "2021-02-15"},
-    {"Station_Number": "2260110", "norm": 0.0407983762, "date": "2021-02-16"},
-    {"Station_Number": "2260110", "norm": 0.0405277402, "date": "2021-02-17"},
-    {"Station_Number": "2260110", "norm": 0.0399864682, "date": "2021-02-18"},
-    {"Station_Number": "2260110", "norm": 0.0391745602, "date": "2021-02-19"},
-    {"Station_Number": "2260110", "norm": 0.0385656292, "date": "2021-02-20"},
-    {"Station_Number": "2260110", "norm": 0.0380243572, "date": "2021-02-21"},
-    {"Station_Number": "2260110", "norm": 0.0376184032, "date": "2021-02-22"},
-    {"Station_Number": "2260110", "norm": 0.0370771313, "date": "2021-02-23"},
-    {"Station_Number": "2260110", "norm": 0.0366711773, "date": "2021-02-24"},
-    {"Station_Number": "2260110", "norm": 0.0361299053, "date": "2021-02-25"},
-    {"Station_Number": "2260110", "norm": 0.0358592693, "date": "2021-02-26"},
-    {"Station_Number": "2260110", "norm": 0.0354533153, "date": "2021-02-27"},
-    {"Station_Number": "2260110", "norm": 0.0349120433, "date": "2021-02-28"},
-    {"Station_Number": "2260110", "norm": 0.0346414073, "date": "2021-03-01"},
-    {"Station_Number": "2260110", "norm": 0.0343031123, "date": "2021-03-02"},
-    {"Station_Number": "2260110", "norm": 0.0340324763, "date": "2021-03-03"},
-    {"Station_Number": "2260110", "norm": 0.0336941813, "date": "2021-03-04"},
-    {"Station_Number": "2260110", "norm": 0.0334235453, "date": "2021-03-05"},
-    {"Station_Number": "2260110", "norm": 0.0330852503, "date": "2021-03-06"},
-    {"Station_Number": "2260110", "norm": 0.0328146143, "date": "2021-03-07"},
-    {"Station_Number": "2260110", "norm": 0.0324086604, "date": "2021-03-08"},
-    {"Station_Number": "2260110", "norm": 0.0318673884, "date": "2021-03-09"},
-    {"Station_Number": "2260110", "norm": 0.0315290934, "date": "2021-03-10"},
-    {"Station_Number": "2260110", "norm": 0.0311231394, "date": "2021-03-11"},
-    {"Station_Number": "2260110", "norm": 0.0309201624, "date": "2021-03-12"},
-    {"Station_Number": "2260110", "norm": 0.0312584574, "date": "2021-03-13"},
-    {"Station_Number": "2260110", "norm": 0.0326116373, "date": "2021-03-14"},
-    {"Station_Number": "2260110", "norm": 0.0330852503, "date": "2021-03-15"},
-    {"Station_Number": "2260110", "norm": 0.0330175913, "date": "2021-03-16"},
-    {"Station_Number": "2260110", "norm": 0.0324086604, "date": "2021-03-17"},
-    {"Station_Number": "2260110", "norm": 0.0316644114, "date": "2021-03-18"},
-    {"Station_Number": "2260110", "norm": 0.0303112314, "date": "2021-03-19"},
-    {"Station_Number": "2260110", "norm": 0.0290933694, "date": "2021-03-20"},
-    {"Station_Number": "2260110", "norm": 0.0280784844, "date": "2021-03-21"},
-    {"Station_Number": "2260110", "norm": 0.0277401894, "date": "2021-03-22"},
-    {"Station_Number": "2260110", "norm": 0.0276048714, "date": "2021-03-23"},
-    {"Station_Number": "2260110", "norm": 0.0273342355, "date": "2021-03-24"},
-    {"Station_Number": "2260110", "norm": 0.0269282815, "date": "2021-03-25"},
-    {"Station_Number": "2260110", "norm": 0.0265899865, "date": "2021-03-26"},
-    {"Station_Number": "2260110", "norm": 0.0262516915, "date": "2021-03-27"},
-    {"Station_Number": "2260110", "norm": 0.0259133965, "date": "2021-03-28"},
-    {"Station_Number": "2260110", "norm": 0.0254397835, "date": "2021-03-29"},
-    {"Station_Number": "2260110", "norm": 0.0250338295, "date": "2021-03-30"},
-    {"Station_Number": "2260110", "norm": 0.0245602165, "date": "2021-03-31"},
-    {"Station_Number": "2260110", "norm": 0.0240866035, "date": "2021-04-01"},
-    {"Station_Number": "2260110", "norm": 0.0236806495, "date": "2021-04-02"},
-    {"Station_Number": "2260110", "norm": 0.0234776725, "date": "2021-04-03"},
-    {"Station_Number": "2260110", "norm": 0.0234776725, "date": "2021-04-04"},
-    {"Station_Number": "2260110", "norm": 0.0235453315, "date": "2021-04-05"},
-    {"Station_Number": "2260110", "norm": 0.0238836265, "date": "2021-04-06"},
-    {"Station_Number": "2260110", "norm": 0.0242219215, "date": "2021-04-07"},
-    {"Station_Number": "2260110", "norm": 0.0250338295, "date": "2021-04-08"},
-    {"Station_Number": "2260110", "norm": 0.0246955345, "date": "2021-04-09"},
-    {"Station_Number": "2260110", "norm": 0.0243572395, "date": "2021-04-10"},
-    {"Station_Number": "2260110", "norm": 0.0240866035, "date": "2021-04-11"},
-    {"Station_Number": "2260110", "norm": 0.0236806495, "date": "2021-04-12"},
-    {"Station_Number": "2260110", "norm": 0.0234100135, "date": "2021-04-13"},
-    {"Station_Number": "2260110", "norm": 0.0230040595, "date": "2021-04-14"},
-    {"Station_Number": "2260110", "norm": 0.0228010825, "date": "2021-04-15"},
-    {"Station_Number": "2260110", "norm": 0.0225304465, "date": "2021-04-16"},
-    {"Station_Number": "2260110", "norm": 0.0222598106, "date": "2021-04-17"},
-    {"Station_Number": "2260110", "norm": 0.0218538566, "date": "2021-04-18"},
-    {"Station_Number": "2260110", "norm": 0.0216508796, "date": "2021-04-19"},
-    {"Station_Number": "2260110", "norm": 0.0222598106, "date": "2021-04-20"},
-    {"Station_Number": "2260110", "norm": 0.0222598106, "date": "2021-04-21"},
-    {"Station_Number": "2260110", "norm": 0.0218538566, "date": "2021-04-22"},
-    {"Station_Number": "2260110", "norm": 0.0218538566, "date": "2021-04-23"},
-    {"Station_Number": "2260110", "norm": 0.0218538566, "date": "2021-04-24"},
-    {"Station_Number": "2260110", "norm": 0.0216508796, "date": "2021-04-25"},
-    {"Station_Number": "2260110", "norm": 0.0213802436, "date": "2021-04-26"},
-    {"Station_Number": "2260110", "norm": 0.0211772666, "date": "2021-04-27"},
-    {"Station_Number": "2260110", "norm": 0.0209066306, "date": "2021-04-28"},
-    {"Station_Number": "2260110", "norm": 0.0207036536, "date": "2021-04-29"},
-    {"Station_Number": "2260110", "norm": 0.0207036536, "date": "2021-04-30"},
-    {"Station_Number": "2260110", "norm": 0.0207036536, "date": "2021-05-01"},
-    {"Station_Number": "2260110", "norm": 0.0205006766, "date": "2021-05-02"},
-    {"Station_Number": "2260110", "norm": 0.0205006766, "date": "2021-05-03"},
-    {"Station_Number": "2260110", "norm": 0.0201623816, "date": "2021-05-04"},
-    {"Station_Number": "2260110", "norm": 0.0198240866, "date": "2021-05-05"},
-    {"Station_Number": "2260110", "norm": 0.0198240866, "date": "2021-05-06"},
-    {"Station_Number": "2260110", "norm": 0.0201623816, "date": "2021-05-07"},
-    {"Station_Number": "2260110", "norm": 0.0205683356, "date": "2021-05-08"},
-    {"Station_Number": "2260110", "norm": 0.0212449256, "date": "2021-05-09"},
-    {"Station_Number": "2260110", "norm": 0.0238159675, "date": "2021-05-10"},
-    {"Station_Number": "2260110", "norm": 0.0246955345, "date": "2021-05-11"},
-    {"Station_Number": "2260110", "norm": 0.0253044655, "date": "2021-05-12"},
-    {"Station_Number": "2260110", "norm": 0.0258457375, "date": "2021-05-13"},
-    {"Station_Number": "2260110", "norm": 0.0259810555, "date": "2021-05-14"},
-    {"Station_Number": "2260110", "norm": 0.0263870095, "date": "2021-05-15"},
-    {"Station_Number": "2260110", "norm": 0.0264546685, "date": "2021-05-16"},
-    {"Station_Number": "2260110", "norm": 0.0264546685, "date": "2021-05-17"},
-    {"Station_Number": "2260110", "norm": 0.0262516915, "date": "2021-05-18"},
-    {"Station_Number": "2260110", "norm": 0.0259810555, "date": "2021-05-19"},
-    {"Station_Number": "2260110", "norm": 0.0255074425, "date": "2021-05-20"},
-    {"Station_Number": "2260110", "norm": 0.0249661705, "date": "2021-05-21"},
-    {"Station_Number": "2260110", "norm": 0.0239512855, "date": "2021-05-22"},
-    {"Station_Number": "2260110", "norm": 0.0236129905, "date": "2021-05-23"},
-    {"Station_Number": "2260110", "norm": 0.0228687415, "date": "2021-05-24"},
-    {"Station_Number": "2260110", "norm": 0.0228687415, "date": "2021-05-25"},
-    {"Station_Number": "2260110", "norm": 0.0248985115, "date": "2021-05-26"},
-    {"Station_Number": "2260110", "norm": 0.0353179973, "date": "2021-05-27"},
-    {"Station_Number": "2260110", "norm": 0.050405954, "date": "2021-05-28"},
-    {"Station_Number": "2260110", "norm": 0.0567658999, "date": "2021-05-29"},
-    {"Station_Number": "2260110", "norm": 0.0571718539, "date": "2021-05-30"},
-    {"Station_Number": "2260110", "norm": 0.0556833559, "date": "2021-05-31"},
-    {"Station_Number": "2260110", "norm": 0.0562246279, "date": "2021-06-01"},
-    {"Station_Number": "2260110", "norm": 0.0559539919, "date": "2021-06-02"},
-    {"Station_Number": "2260110", "norm": 0.0560893099, "date": "2021-06-03"},
-    {"Station_Number": "2260110", "norm": 0.0556833559, "date": "2021-06-04"},
-    {"Station_Number": "2260110", "norm": 0.0552774019, "date": "2021-06-05"},
-    {"Station_Number": "2260110", "norm": 0.0533152909, "date": "2021-06-06"},
-    {"Station_Number": "2260110", "norm": 0.051623816, "date": "2021-06-07"},
-    {"Station_Number": "2260110", "norm": 0.0535859269, "date": "2021-06-08"},
-    {"Station_Number": "2260110", "norm": 0.0574424899, "date": "2021-06-09"},
-    {"Station_Number": "2260110", "norm": 0.0615696888, "date": "2021-06-10"},
-    {"Station_Number": "2260110", "norm": 0.0670500677, "date": "2021-06-11"},
-    {"Station_Number": "2260110", "norm": 0.0846414073, "date": "2021-06-12"},
-    {"Station_Number": "2260110", "norm": 0.0798376184, "date": "2021-06-13"},
-    {"Station_Number": "2260110", "norm": 0.0805142084, "date": "2021-06-14"},
-    {"Station_Number": "2260110", "norm": 0.0826792963, "date": "2021-06-15"},
-    {"Station_Number": "2260110", "norm": 0.0839648173, "date": "2021-06-16"},
-    {"Station_Number": "2260110", "norm": 0.0956698241, "date": "2021-06-17"},
-    {"Station_Number": "2260110", "norm": 0.0974966171, "date": "2021-06-18"},
-    {"Station_Number": "2260110", "norm": 0.1169147497, "date": "2021-06-19"},
-    {"Station_Number": "2260110", "norm": 0.1442489851, "date": "2021-06-20"},
-    {"Station_Number": "2260110", "norm": 0.1599458728, "date": "2021-06-21"},
-    {"Station_Number": "2260110", "norm": 0.1654262517, "date": "2021-06-22"},
-    {"Station_Number": "2260110", "norm": 0.1592692828, "date": "2021-06-23"},
-    {"Station_Number": "2260110", "norm": 0.1891745602, "date": "2021-06-24"},
-    {"Station_Number": "2260110", "norm": 0.2201623816, "date": "2021-06-25"},
-    {"Station_Number": "2260110", "norm": 0.2860622463, "date": "2021-06-26"},
-    {"Station_Number": "2260110", "norm": 0.2911366712, "date": "2021-06-27"},
-    {"Station_Number": "2260110", "norm": 0.2592692828, "date": "2021-06-28"},
-    {"Station_Number": "2260110", "norm": 0.2364682003, "date": "2021-06-29"},
-    {"Station_Number": "2260110", "norm": 0.2267253045, "date": "2021-06-30"},
-    {"Station_Number": "2260110", "norm": 0.2205683356, "date": "2021-07-01"},
-    {"Station_Number": "2260110", "norm": 0.2182002706, "date": "2021-07-02"},
-    {"Station_Number": "2260110", "norm": 0.2248985115, "date": "2021-07-03"},
-    {"Station_Number": "2260110", "norm": 0.3066982409, "date": "2021-07-04"},
-    {"Station_Number": "2260110", "norm": 0.4327469553, "date": "2021-07-05"},
-    {"Station_Number": "2260110", "norm": 0.4846414073, "date": "2021-07-06"},
-    {"Station_Number": "2260110", "norm": 0.4824763194, "date": "2021-07-07"},
-    {"Station_Number": "2260110", "norm": 0.4758457375, "date": "2021-07-08"},
-    {"Station_Number": "2260110", "norm": 0.4617050068, "date": "2021-07-09"},
-    {"Station_Number": "2260110", "norm": 0.4258457375, "date": "2021-07-10"},
-    {"Station_Number": "2260110", "norm": 0.4219891746, "date": "2021-07-11"},
-    {"Station_Number": "2260110", "norm": 0.4129905277, "date": "2021-07-12"},
-    {"Station_Number": "2260110", "norm": 0.3757104195, "date": "2021-07-13"},
-    {"Station_Number": "2260110", "norm": 0.3351826793, "date": "2021-07-14"},
-    {"Station_Number": "2260110", "norm": 0.3095399188, "date": "2021-07-15"},
-    {"Station_Number": "2260110", "norm": 0.3321380244, "date": "2021-07-16"},
-    {"Station_Number": "2260110", "norm": 0.3403247632, "date": "2021-07-17"},
-    {"Station_Number": "2260110", "norm": 0.3466847091, "date": "2021-07-18"},
-    {"Station_Number": "2260110", "norm": 0.350338295, "date": "2021-07-19"},
-    {"Station_Number": "2260110", "norm": 0.3598782138, "date": "2021-07-20"},
-    {"Station_Number": "2260110", "norm": 0.3773342355, "date": "2021-07-21"},
-    {"Station_Number": "2260110", "norm": 0.3730717185, "date": "2021-07-22"},
-    {"Station_Number": "2260110", "norm": 0.3773342355, "date": "2021-07-23"},
-    {"Station_Number": "2260110", "norm": 0.3769959405, "date": "2021-07-24"},
-    {"Station_Number": "2260110", "norm": 0.3545331529, "date": "2021-07-25"},
-    {"Station_Number": "2260110", "norm": 0.3124492558, "date": "2021-07-26"},
-    {"Station_Number": "2260110", "norm": 0.352300406, "date": "2021-07-27"},
-    {"Station_Number": "2260110", "norm": 0.4370771313, "date": "2021-07-28"},
-    {"Station_Number": "2260110", "norm": 0.4625169147, "date": "2021-07-29"},
-    {"Station_Number": "2260110", "norm": 0.4619079838, "date": "2021-07-30"},
-    {"Station_Number": "2260110", "norm": 0.4527063599, "date": "2021-07-31"},
-    {"Station_Number": "2260110", "norm": 0.4604194858, "date": "2021-08-01"},
-    {"Station_Number": "2260110", "norm": 0.5606901218, "date": "2021-08-02"},
-    {"Station_Number": "2260110", "norm": 0.6684709066, "date": "2021-08-03"},
-    {"Station_Number": "2260110", "norm": 0.6960081191, "date": "2021-08-04"},
-    {"Station_Number": "2260110", "norm": 0.6204330176, "date": "2021-08-05"},
-    {"Station_Number": "2260110", "norm": 0.5202976996, "date": "2021-08-06"},
-    {"Station_Number": "2260110", "norm": 0.4770635995, "date": "2021-08-07"},
-    {"Station_Number": "2260110", "norm": 0.4532476319, "date": "2021-08-08"},
-    {"Station_Number": "2260110", "norm": 0.4576454668, "date": "2021-08-09"},
-    {"Station_Number": "2260110", "norm": 0.4337618403, "date": "2021-08-10"},
-    {"Station_Number": "2260110", "norm": 0.4037889039, "date": "2021-08-11"},
-    {"Station_Number": "2260110", "norm": 0.3889715832, "date": "2021-08-12"},
-    {"Station_Number": "2260110", "norm": 0.3864005413, "date": "2021-08-13"},
-    {"Station_Number": "2260110", "norm": 0.4055480379, "date": "2021-08-14"},
-    {"Station_Number": "2260110", "norm": 0.4642760487, "date": "2021-08-15"},
-    {"Station_Number": "2260110", "norm": 0.5432341001, "date": "2021-08-16"},
-    {"Station_Number": "2260110", "norm": 0.6154262517, "date": "2021-08-17"},
-    {"Station_Number": "2260110", "norm": 0.7257780785, "date": "2021-08-18"},
-    {"Station_Number": "2260110", "norm": 0.8026387009, "date": "2021-08-19"},
-    {"Station_Number": "2260110", "norm": 0.8464140731, "date": "2021-08-20"},
-    {"Station_Number": "2260110", "norm": 0.8827469553, "date": "2021-08-21"},
-    {"Station_Number": "2260110", "norm": 0.9194857916, "date": "2021-08-22"},
-    {"Station_Number": "2260110", "norm": 0.9539918809, "date": "2021-08-23"},
-    {"Station_Number": "2260110", "norm": 0.9853179973, "date": "2021-08-24"},
-    {"Station_Number": "2260110", "norm": 0.9853179973, "date": "2021-08-25"},
-    {"Station_Number": "2260110", "norm": 0.9781461434, "date": "2021-08-26"},
-    {"Station_Number": "2260110", "norm": 0.99932341, "date": "2021-08-27"},
-    {"Station_Number": "2260110", "norm": 1.0, "date": "2021-08-28"},
-    {"Station_Number": "2260110", "norm": 0.951962111, "date": "2021-08-29"},
-    {"Station_Number": "2260110", "norm": 0.9274018945, "date": "2021-08-30"},
-    {"Station_Number": "2260110", "norm": 0.900541272, "date": "2021-08-31"},
-    {"Station_Number": "2260110", "norm": 0.8430311231, "date": "2021-09-01"},
-    {"Station_Number": "2260110", "norm": 0.7679296346, "date": "2021-09-02"},
-    {"Station_Number": "2260110", "norm": 0.6794993234, "date": "2021-09-03"},
-    {"Station_Number": "2260110", "norm": 0.5859945873, "date": "2021-09-04"},
-    {"Station_Number": "2260110", "norm": 0.5160351827, "date": "2021-09-05"},
-    {"Station_Number": "2260110", "norm": 0.4806495264, "date": "2021-09-06"},
-    {"Station_Number": "2260110", "norm": 0.4584573748, "date": "2021-09-07"},
-    {"Station_Number": "2260110", "norm": 0.4282138024, "date": "2021-09-08"},
-    {"Station_Number": "2260110", "norm": 0.2751014885, "date": "2021-09-09"},
-    {"Station_Number": "2260110", "norm": 0.2617726658, "date": "2021-09-10"},
-    {"Station_Number": "2260110", "norm": 0.3627875507, "date": "2021-09-11"},
-    {"Station_Number": "2260110", "norm": 0.3391069012, "date": "2021-09-12"},
-    {"Station_Number": "2260110", "norm": 0.3125845737, "date": "2021-09-13"},
-    {"Station_Number": "2260110", "norm": 0.2919485792, "date": "2021-09-14"},
-    {"Station_Number": "2260110", "norm": 0.2734776725, "date": "2021-09-15"},
-    {"Station_Number": "2260110", "norm": 0.2610284168, "date": "2021-09-16"},
-    {"Station_Number": "2260110", "norm": 0.2668470907, "date": "2021-09-17"},
-    {"Station_Number": "2260110", "norm": 0.2667794317, "date": "2021-09-18"},
-    {"Station_Number": "2260110", "norm": 0.2905953992, "date": "2021-09-19"},
-    {"Station_Number": "2260110", "norm": 0.3145466847, "date": "2021-09-20"},
-    {"Station_Number": "2260110", "norm": 0.2919485792, "date": "2021-09-21"},
-    {"Station_Number": "2260110", "norm": 0.3161028417, "date": "2021-09-22"},
-    {"Station_Number": "2260110", "norm": 0.35202977, "date": "2021-09-23"},
-    {"Station_Number": "2260110", "norm": 0.3627875507, "date": "2021-09-24"},
-    {"Station_Number": "2260110", "norm": 0.3367388363, "date": "2021-09-25"},
-    {"Station_Number": "2260110", "norm": 0.2972936401, "date": "2021-09-26"},
-    {"Station_Number": "2260110", "norm": 0.2784844384, "date": "2021-09-27"},
-    {"Station_Number": "2260110", "norm": 0.2698240866, "date": "2021-09-28"},
-    {"Station_Number": "2260110", "norm": 0.2529769959, "date": "2021-09-29"},
-    {"Station_Number": "2260110", "norm": 0.2364682003, "date": "2021-09-30"},
-    {"Station_Number": "2260110", "norm": 0.2179296346, "date": "2021-10-01"},
-    {"Station_Number": "2260110", "norm": 0.2053450609, "date": "2021-10-02"},
-    {"Station_Number": "2260110", "norm": 0.198240866, "date": "2021-10-03"},
-    {"Station_Number": "2260110", "norm": 0.2225981055, "date": "2021-10-04"},
-    {"Station_Number": "2260110", "norm": 0.2449932341, "date": "2021-10-05"},
-    {"Station_Number": "2260110", "norm": 0.2351826793, "date": "2021-10-06"},
-    {"Station_Number": "2260110", "norm": 0.2292286874, "date": "2021-10-07"},
-    {"Station_Number": "2260110", "norm": 0.2253044655, "date": "2021-10-08"},
-    {"Station_Number": "2260110", "norm": 0.2141407307, "date": "2021-10-09"},
-    {"Station_Number": "2260110", "norm": 0.19797023, "date": "2021-10-10"},
-    {"Station_Number": "2260110", "norm": 0.1866035183, "date": "2021-10-11"},
-    {"Station_Number": "2260110", "norm": 0.1841001353, "date": "2021-10-12"},
-    {"Station_Number": "2260110", "norm": 0.1749661705, "date": "2021-10-13"},
-    {"Station_Number": "2260110", "norm": 0.1606224628, "date": "2021-10-14"},
-    {"Station_Number": "2260110", "norm": 0.152097429, "date": "2021-10-15"},
-    {"Station_Number": "2260110", "norm": 0.1464140731, "date": "2021-10-16"},
-    {"Station_Number": "2260110", "norm": 0.1468876861, "date": "2021-10-17"},
-    {"Station_Number": "2260110", "norm": 0.149255751, "date": "2021-10-18"},
-    {"Station_Number": "2260110", "norm": 0.15067659, "date": "2021-10-19"},
-    {"Station_Number": "2260110", "norm": 0.149729364, "date": "2021-10-20"},
-    {"Station_Number": "2260110", "norm": 0.1426251691, "date": "2021-10-21"},
-    {"Station_Number": "2260110", "norm": 0.151623816, "date": "2021-10-22"},
-    {"Station_Number": "2260110", "norm": 0.1539918809, "date": "2021-10-23"},
-    {"Station_Number": "2260110", "norm": 0.2025033829, "date": "2021-10-24"},
-    {"Station_Number": "2260110", "norm": 0.2532476319, "date": "2021-10-25"},
-    {"Station_Number": "2260110", "norm": 0.2768606225, "date": "2021-10-26"},
-    {"Station_Number": "2260110", "norm": 0.2558186739, "date": "2021-10-27"},
-    {"Station_Number": "2260110", "norm": 0.2256427605, "date": "2021-10-28"},
-    {"Station_Number": "2260110", "norm": 0.19797023, "date": "2021-10-29"},
-    {"Station_Number": "2260110", "norm": 0.1758457375, "date": "2021-10-30"},
-    {"Station_Number": "2260110", "norm": 0.1567658999, "date": "2021-10-31"},
-    {"Station_Number": "2260110", "norm": 0.148985115, "date": "2021-11-01"},
-    {"Station_Number": "2260110", "norm": 0.1437753721, "date": "2021-11-02"},
-    {"Station_Number": "2260110", "norm": 0.1290257104, "date": "2021-11-03"},
-    {"Station_Number": "2260110", "norm": 0.1214479026, "date": "2021-11-04"},
-    {"Station_Number": "2260110", "norm": 0.1162381597, "date": "2021-11-05"},
-    {"Station_Number": "2260110", "norm": 0.1098105548, "date": "2021-11-06"},
-    {"Station_Number": "2260110", "norm": 0.1042625169, "date": "2021-11-07"},
-    {"Station_Number": "2260110", "norm": 0.100067659, "date": "2021-11-08"},
-    {"Station_Number": "2260110", "norm": 0.0962787551, "date": "2021-11-09"},
-    {"Station_Number": "2260110", "norm": 0.0922868742, "date": "2021-11-10"},
-    {"Station_Number": "2260110", "norm": 0.0887686062, "date": "2021-11-11"},
-    {"Station_Number": "2260110", "norm": 0.0862652233, "date": "2021-11-12"},
-    {"Station_Number": "2260110", "norm": 0.0868741543, "date": "2021-11-13"},
-    {"Station_Number": "2260110", "norm": 0.0875507442, "date": "2021-11-14"},
-    {"Station_Number": "2260110", "norm": 0.0874154263, "date": "2021-11-15"},
-    {"Station_Number": "2260110", "norm": 0.0928281461, "date": "2021-11-16"},
-    {"Station_Number": "2260110", "norm": 0.0920838972, "date": "2021-11-17"},
-    {"Station_Number": "2260110", "norm": 0.0888362652, "date": "2021-11-18"},
-    {"Station_Number": "2260110", "norm": 0.0831529093, "date": "2021-11-19"},
-    {"Station_Number": "2260110", "norm": 0.0798376184, "date": "2021-11-20"},
-    {"Station_Number": "2260110", "norm": 0.0778078484, "date": "2021-11-21"},
-    {"Station_Number": "2260110", "norm": 0.0758457375, "date": "2021-11-22"},
-    {"Station_Number": "2260110", "norm": 0.0732070365, "date": "2021-11-23"},
-    {"Station_Number": "2260110", "norm": 0.0709742896, "date": "2021-11-24"},
-    {"Station_Number": "2260110", "norm": 0.0690121786, "date": "2021-11-25"},
-    {"Station_Number": "2260110", "norm": 0.0673883627, "date": "2021-11-26"},
-    {"Station_Number": "2260110", "norm": 0.0663734777, "date": "2021-11-27"},
-    {"Station_Number": "2260110", "norm": 0.0654262517, "date": "2021-11-28"},
-    {"Station_Number": "2260110", "norm": 0.0650879567, "date": "2021-11-29"},
-    {"Station_Number": "2260110", "norm": 0.0650879567, "date": "2021-11-30"},
-    {"Station_Number": "2260110", "norm": 0.0640730717, "date": "2021-12-01"},
-    {"Station_Number": "2260110", "norm": 0.0624492558, "date": "2021-12-02"},
-    {"Station_Number": "2260110", "norm": 0.0599458728, "date": "2021-12-03"},
-    {"Station_Number": "2260110", "norm": 0.0578484438, "date": "2021-12-04"},
-    {"Station_Number": "2260110", "norm": 0.0571718539, "date": "2021-12-05"},
-    {"Station_Number": "2260110", "norm": 0.0566305819, "date": "2021-12-06"},
-    {"Station_Number": "2260110", "norm": 0.0560893099, "date": "2021-12-07"},
-    {"Station_Number": "2260110", "norm": 0.0556833559, "date": "2021-12-08"},
-    {"Station_Number": "2260110", "norm": 0.0556833559, "date": "2021-12-09"},
-    {"Station_Number": "2260110", "norm": 0.0559539919, "date": "2021-12-10"},
-    {"Station_Number": "2260110", "norm": 0.0560893099, "date": "2021-12-11"},
-    {"Station_Number": "2260110", "norm": 0.0555480379, "date": "2021-12-12"},
-    {"Station_Number": "2260110", "norm": 0.0531123139, "date": "2021-12-13"},
-    {"Station_Number": "2260110", "norm": 0.05135318, "date": "2021-12-14"},
-    {"Station_Number": "2260110", "norm": 0.049526387, "date": "2021-12-15"},
-    {"Station_Number": "2260110", "norm": 0.048579161, "date": "2021-12-16"},
-    {"Station_Number": "2260110", "norm": 0.047631935, "date": "2021-12-17"},
-    {"Station_Number": "2260110", "norm": 0.0468200271, "date": "2021-12-18"},
-    {"Station_Number": "2260110", "norm": 0.0456698241, "date": "2021-12-19"},
-    {"Station_Number": "2260110", "norm": 0.0447225981, "date": "2021-12-20"},
-    {"Station_Number": "2260110", "norm": 0.0435723951, "date": "2021-12-21"},
-    {"Station_Number": "2260110", "norm": 0.0423545332, "date": "2021-12-22"},
-    {"Station_Number": "2260110", "norm": 0.0416779432, "date": "2021-12-23"},
-    {"Station_Number": "2260110", "norm": 0.0410013532, "date": "2021-12-24"},
-    {"Station_Number": "2260110", "norm": 0.0403924222, "date": "2021-12-25"},
-    {"Station_Number": "2260110", "norm": 0.0399188092, "date": "2021-12-26"},
-    {"Station_Number": "2260110", "norm": 0.0395805142, "date": "2021-12-27"},
-    {"Station_Number": "2260110", "norm": 0.0392422192, "date": "2021-12-28"},
-    {"Station_Number": "2260110", "norm": 0.0389715832, "date": "2021-12-29"},
-    {"Station_Number": "2260110", "norm": 0.0386332882, "date": "2021-12-30"},
-    {"Station_Number": "2260110", "norm": 0.0382273342, "date": "2021-12-31"},
-    {"Station_Number": "2260110", "norm": 0.0517513704, "date": "2022-01-01"},
-    {"Station_Number": "2260110", "norm": 0.0513797268, "date": "2022-01-02"},
-    {"Station_Number": "2260110", "norm": 0.0509151723, "date": "2022-01-03"},
-    {"Station_Number": "2260110", "norm": 0.0506364397, "date": "2022-01-04"},
-    {"Station_Number": "2260110", "norm": 0.0498931525, "date": "2022-01-05"},
-    {"Station_Number": "2260110", "norm": 0.0490569544, "date": "2022-01-06"},
-    {"Station_Number": "2260110", "norm": 0.0482207563, "date": "2022-01-07"},
-    {"Station_Number": "2260110", "norm": 0.04757038, "date": "2022-01-08"},
-    {"Station_Number": "2260110", "norm": 0.0470129146, "date": "2022-01-09"},
-    {"Station_Number": "2260110", "norm": 0.0462696274, "date": "2022-01-10"},
-    {"Station_Number": "2260110", "norm": 0.045712162, "date": "2022-01-11"},
-    {"Station_Number": "2260110", "norm": 0.0450617857, "date": "2022-01-12"},
-    {"Station_Number": "2260110", "norm": 0.0445972313, "date": "2022-01-13"},
-    {"Station_Number": "2260110", "norm": 0.0440397659, "date": "2022-01-14"},
-    {"Station_Number": "2260110", "norm": 0.0432964787, "date": "2022-01-15"},
-    {"Station_Number": "2260110", "norm": 0.0429248351, "date": "2022-01-16"},
-    {"Station_Number": "2260110", "norm": 0.0424602806, "date": "2022-01-17"},
-    {"Station_Number": "2260110", "norm": 0.042088637, "date": "2022-01-18"},
-    {"Station_Number": "2260110", "norm": 0.0416240825, "date": "2022-01-19"},
-    {"Station_Number": "2260110", "norm": 0.0424602806, "date": "2022-01-20"},
-    {"Station_Number": "2260110", "norm": 0.043017746, "date": "2022-01-21"},
-    {"Station_Number": "2260110", "norm": 0.0437610332, "date": "2022-01-22"},
-    {"Station_Number": "2260110", "norm": 0.0432035678, "date": "2022-01-23"},
-    {"Station_Number": "2260110", "norm": 0.0426461024, "date": "2022-01-24"},
-    {"Station_Number": "2260110", "norm": 0.042088637, "date": "2022-01-25"},
-    {"Station_Number": "2260110", "norm": 0.0416240825, "date": "2022-01-26"},
-    {"Station_Number": "2260110", "norm": 0.0416240825, "date": "2022-01-27"},
-    {"Station_Number": "2260110", "norm": 0.041159528, "date": "2022-01-28"},
-    {"Station_Number": "2260110", "norm": 0.0407878844, "date": "2022-01-29"},
-    {"Station_Number": "2260110", "norm": 0.0407878844, "date": "2022-01-30"},
-    {"Station_Number": "2260110", "norm": 0.0405091517, "date": "2022-01-31"},
-    {"Station_Number": "2260110", "norm": 0.0403233299, "date": "2022-02-01"},
-    {"Station_Number": "2260110", "norm": 0.0399516863, "date": "2022-02-02"},
-    {"Station_Number": "2260110", "norm": 0.0394871318, "date": "2022-02-03"},
-    {"Station_Number": "2260110", "norm": 0.0392083991, "date": "2022-02-04"},
-    {"Station_Number": "2260110", "norm": 0.0392083991, "date": "2022-02-05"},
-    {"Station_Number": "2260110", "norm": 0.0388367556, "date": "2022-02-06"},
-    {"Station_Number": "2260110", "norm": 0.0388367556, "date": "2022-02-07"},
-    {"Station_Number": "2260110", "norm": 0.0385580229, "date": "2022-02-08"},
-    {"Station_Number": "2260110", "norm": 0.0381863793, "date": "2022-02-09"},
-    {"Station_Number": "2260110", "norm": 0.0383722011, "date": "2022-02-10"},
-    {"Station_Number": "2260110", "norm": 0.0410666171, "date": "2022-02-11"},
-    {"Station_Number": "2260110", "norm": 0.0414382607, "date": "2022-02-12"},
-    {"Station_Number": "2260110", "norm": 0.041159528, "date": "2022-02-13"},
-    {"Station_Number": "2260110", "norm": 0.0407878844, "date": "2022-02-14"},
-    {"Station_Number": "2260110", "norm": 0.0403233299, "date": "2022-02-15"},
-    {"Station_Number": "2260110", "norm": 0.0399516863, "date": "2022-02-16"},
-    {"Station_Number": "2260110", "norm": 0.0392083991, "date": "2022-02-17"},
-    {"Station_Number": "2260110", "norm": 0.038465112, "date": "2022-02-18"},
-    {"Station_Number": "2260110", "norm": 0.0378147357, "date": "2022-02-19"},
-    {"Station_Number": "2260110", "norm": 0.0371643594, "date": "2022-02-20"},
-    {"Station_Number": "2260110", "norm": 0.0365139831, "date": "2022-02-21"},
-    {"Station_Number": "2260110", "norm": 0.0359565177, "date": "2022-02-22"},
-    {"Station_Number": "2260110", "norm": 0.0353990523, "date": "2022-02-23"},
-    {"Station_Number": "2260110", "norm": 0.0350274087, "date": "2022-02-24"},
-    {"Station_Number": "2260110", "norm": 0.034748676, "date": "2022-02-25"},
-    {"Station_Number": "2260110", "norm": 0.0344699433, "date": "2022-02-26"},
-    {"Station_Number": "2260110", "norm": 0.0344699433, "date": "2022-02-27"},
-    {"Station_Number": "2260110", "norm": 0.0353061414, "date": "2022-02-28"},
-    {"Station_Number": "2260110", "norm": 0.035677785, "date": "2022-03-01"},
-    {"Station_Number": "2260110", "norm": 0.0360494286, "date": "2022-03-02"},
-    {"Station_Number": "2260110", "norm": 0.0350274087, "date": "2022-03-03"},
-    {"Station_Number": "2260110", "norm": 0.0344699433, "date": "2022-03-04"},
-    {"Station_Number": "2260110", "norm": 0.0344699433, "date": "2022-03-05"},
-    {"Station_Number": "2260110", "norm": 0.0341912106, "date": "2022-03-06"},
-    {"Station_Number": "2260110", "norm": 0.033819567, "date": "2022-03-07"},
-    {"Station_Number": "2260110", "norm": 0.0334479234, "date": "2022-03-08"},
-    {"Station_Number": "2260110", "norm": 0.0331691907, "date": "2022-03-09"},
-    {"Station_Number": "2260110", "norm": 0.0327975472, "date": "2022-03-10"},
-    {"Station_Number": "2260110", "norm": 0.0322400818, "date": "2022-03-11"},
-    {"Station_Number": "2260110", "norm": 0.0318684382, "date": "2022-03-12"},
-    {"Station_Number": "2260110", "norm": 0.0315897055, "date": "2022-03-13"},
-    {"Station_Number": "2260110", "norm": 0.0313109728, "date": "2022-03-14"},
-    {"Station_Number": "2260110", "norm": 0.0309393292, "date": "2022-03-15"},
-    {"Station_Number": "2260110", "norm": 0.0306605965, "date": "2022-03-16"},
-    {"Station_Number": "2260110", "norm": 0.030196042, "date": "2022-03-17"},
-    {"Station_Number": "2260110", "norm": 0.0297314875, "date": "2022-03-18"},
-    {"Station_Number": "2260110", "norm": 0.0293598439, "date": "2022-03-19"},
-    {"Station_Number": "2260110", "norm": 0.0290811112, "date": "2022-03-20"},
-    {"Station_Number": "2260110", "norm": 0.0287094676, "date": "2022-03-21"},
-    {"Station_Number": "2260110", "norm": 0.0284307349, "date": "2022-03-22"},
-    {"Station_Number": "2260110", "norm": 0.0281520022, "date": "2022-03-23"},
-    {"Station_Number": "2260110", "norm": 0.0277803586, "date": "2022-03-24"},
-    {"Station_Number": "2260110", "norm": 0.0275016259, "date": "2022-03-25"},
-    {"Station_Number": "2260110", "norm": 0.0275016259, "date": "2022-03-26"},
-    {"Station_Number": "2260110", "norm": 0.0275016259, "date": "2022-03-27"},
-    {"Station_Number": "2260110", "norm": 0.0275016259, "date": "2022-03-28"},
-    {"Station_Number": "2260110", "norm": 0.0277803586, "date": "2022-03-29"},
-    {"Station_Number": "2260110", "norm": 0.0287094676, "date": "2022-03-30"},
-    {"Station_Number": "2260110", "norm": 0.0296385766, "date": "2022-03-31"},
-    {"Station_Number": "2260110", "norm": 0.0300102202, "date": "2022-04-01"},
-    {"Station_Number": "2260110", "norm": 0.0302889529, "date": "2022-04-02"},
-    {"Station_Number": "2260110", "norm": 0.0306605965, "date": "2022-04-03"},
-    {"Station_Number": "2260110", "norm": 0.0314038837, "date": "2022-04-04"},
-    {"Station_Number": "2260110", "norm": 0.0318684382, "date": "2022-04-05"},
-    {"Station_Number": "2260110", "norm": 0.0308464183, "date": "2022-04-06"},
-    {"Station_Number": "2260110", "norm": 0.0294527548, "date": "2022-04-07"},
-    {"Station_Number": "2260110", "norm": 0.0290811112, "date": "2022-04-08"},
-    {"Station_Number": "2260110", "norm": 0.0294527548, "date": "2022-04-09"},
-    {"Station_Number": "2260110", "norm": 0.0328904581, "date": "2022-04-10"},
-    {"Station_Number": "2260110", "norm": 0.0380934684, "date": "2022-04-11"},
-    {"Station_Number": "2260110", "norm": 0.0454334293, "date": "2022-04-12"},
-    {"Station_Number": "2260110", "norm": 0.0496144198, "date": "2022-04-13"},
-    {"Station_Number": "2260110", "norm": 0.0502647961, "date": "2022-04-14"},
-    {"Station_Number": "2260110", "norm": 0.04757038, "date": "2022-04-15"},
-    {"Station_Number": "2260110", "norm": 0.0464554492, "date": "2022-04-16"},
-    {"Station_Number": "2260110", "norm": 0.0482207563, "date": "2022-04-17"},
-    {"Station_Number": "2260110", "norm": 0.0478491127, "date": "2022-04-18"},
-    {"Station_Number": "2260110", "norm": 0.0454334293, "date": "2022-04-19"},
-    {"Station_Number": "2260110", "norm": 0.0563969154, "date": "2022-04-20"},
-    {"Station_Number": "2260110", "norm": 0.0815757688, "date": "2022-04-21"},
-    {"Station_Number": "2260110", "norm": 0.0775806002, "date": "2022-04-22"},
-    {"Station_Number": "2260110", "norm": 0.0641085199, "date": "2022-04-23"},
-    {"Station_Number": "2260110", "norm": 0.0570472916, "date": "2022-04-24"},
-    {"Station_Number": "2260110", "norm": 0.0601133513, "date": "2022-04-25"},
-    {"Station_Number": "2260110", "norm": 0.0663383815, "date": "2022-04-26"},
-    {"Station_Number": "2260110", "norm": 0.0650376289, "date": "2022-04-27"},
-    {"Station_Number": "2260110", "norm": 0.0577905788, "date": "2022-04-28"},
-    {"Station_Number": "2260110", "norm": 0.0517513704, "date": "2022-04-29"},
-    {"Station_Number": "2260110", "norm": 0.0500789743, "date": "2022-04-30"},
-    {"Station_Number": "2260110", "norm": 0.0500789743, "date": "2022-05-01"},
-    {"Station_Number": "2260110", "norm": 0.048499489, "date": "2022-05-02"},
-    {"Station_Number": "2260110", "norm": 0.0454334293, "date": "2022-05-03"},
-    {"Station_Number": "2260110", "norm": 0.0440397659, "date": "2022-05-04"},
-    {"Station_Number": "2260110", "norm": 0.0450617857, "date": "2022-05-05"},
-    {"Station_Number": "2260110", "norm": 0.0462696274, "date": "2022-05-06"},
-    {"Station_Number": "2260110", "norm": 0.0502647961, "date": "2022-05-07"},
-    {"Station_Number": "2260110", "norm": 0.0690327975, "date": "2022-05-08"},
-    {"Station_Number": "2260110", "norm": 0.1126080089, "date": "2022-05-09"},
-    {"Station_Number": "2260110", "norm": 0.1388088823, "date": "2022-05-10"},
-    {"Station_Number": "2260110", "norm": 0.1258013565, "date": "2022-05-11"},
-    {"Station_Number": "2260110", "norm": 0.1102852365, "date": "2022-05-12"},
-    {"Station_Number": "2260110", "norm": 0.0907739478, "date": "2022-05-13"},
-    {"Station_Number": "2260110", "norm": 0.081389947, "date": "2022-05-14"},
-    {"Station_Number": "2260110", "norm": 0.0770231348, "date": "2022-05-15"},
-    {"Station_Number": "2260110", "norm": 0.0812041252, "date": "2022-05-16"},
-    {"Station_Number": "2260110", "norm": 0.1001579485, "date": "2022-05-17"},
-    {"Station_Number": "2260110", "norm": 0.1379726842, "date": "2022-05-18"},
-    {"Station_Number": "2260110", "norm": 0.2374802564, "date": "2022-05-19"},
-    {"Station_Number": "2260110", "norm": 0.310136579, "date": "2022-05-20"},
-    {"Station_Number": "2260110", "norm": 0.3278825606, "date": "2022-05-21"},
-    {"Station_Number": "2260110", "norm": 0.3211929759, "date": "2022-05-22"},
-    {"Station_Number": "2260110", "norm": 0.311065688, "date": "2022-05-23"},
-    {"Station_Number": "2260110", "norm": 0.2979652513, "date": "2022-05-24"},
-    {"Station_Number": "2260110", "norm": 0.2647960606, "date": "2022-05-25"},
-    {"Station_Number": "2260110", "norm": 0.2225216018, "date": "2022-05-26"},
-    {"Station_Number": "2260110", "norm": 0.2129517792, "date": "2022-05-27"},
-    {"Station_Number": "2260110", "norm": 0.1932546688, "date": "2022-05-28"},
-    {"Station_Number": "2260110", "norm": 0.1665892409, "date": "2022-05-29"},
-    {"Station_Number": "2260110", "norm": 0.1513518536, "date": "2022-05-30"},
-    {"Station_Number": "2260110", "norm": 0.1494936356, "date": "2022-05-31"},
-    {"Station_Number": "2260110", "norm": 0.1497723683, "date": "2022-06-01"},
-    {"Station_Number": "2260110", "norm": 0.1622224287, "date": "2022-06-02"},
-    {"Station_Number": "2260110", "norm": 0.171048964, "date": "2022-06-03"},
-    {"Station_Number": "2260110", "norm": 0.1736504692, "date": "2022-06-04"},
-    {"Station_Number": "2260110", "norm": 0.2030103131, "date": "2022-06-05"},
-    {"Station_Number": "2260110", "norm": 0.2340425532, "date": "2022-06-06"},
-    {"Station_Number": "2260110", "norm": 0.274458794, "date": "2022-06-07"},
-    {"Station_Number": "2260110", "norm": 0.3022391527, "date": "2022-06-08"},
-    {"Station_Number": "2260110", "norm": 0.3356870761, "date": "2022-06-09"},
-    {"Station_Number": "2260110", "norm": 0.3591935334, "date": "2022-06-10"},
-    {"Station_Number": "2260110", "norm": 0.4145684289, "date": "2022-06-11"},
-    {"Station_Number": "2260110", "norm": 0.5353525969, "date": "2022-06-12"},
-    {"Station_Number": "2260110", "norm": 0.6124686426, "date": "2022-06-13"},
-    {"Station_Number": "2260110", "norm": 0.6786212023, "date": "2022-06-14"},
-    {"Station_Number": "2260110", "norm": 0.7288859983, "date": "2022-06-15"},
-    {"Station_Number": "2260110", "norm": 0.7176437796, "date": "2022-06-16"},
-    {"Station_Number": "2260110", "norm": 0.7052866301, "date": "2022-06-17"},
-    {"Station_Number": "2260110", "norm": 0.724612097, "date": "2022-06-18"},
-    {"Station_Number": "2260110", "norm": 0.771253368, "date": "2022-06-19"},
-    {"Station_Number": "2260110", "norm": 0.8131561832, "date": "2022-06-20"},
-    {"Station_Number": "2260110", "norm": 0.8420514726, "date": "2022-06-21"},
-    {"Station_Number": "2260110", "norm": 0.8567313946, "date": "2022-06-22"},
-    {"Station_Number": "2260110", "norm": 0.8600761869, "date": "2022-06-23"},
-    {"Station_Number": "2260110", "norm": 0.8516212952, "date": "2022-06-24"},
-    {"Station_Number": "2260110", "norm": 0.840843631, "date": "2022-06-25"},
-    {"Station_Number": "2260110", "norm": 0.8653721081, "date": "2022-06-26"},
-    {"Station_Number": "2260110", "norm": 0.8939886649, "date": "2022-06-27"},
-    {"Station_Number": "2260110", "norm": 0.9325466877, "date": "2022-06-28"},
-    {"Station_Number": "2260110", "norm": 0.9650655022, "date": "2022-06-29"},
-    {"Station_Number": "2260110", "norm": 0.9799312459, "date": "2022-06-30"},
-    {"Station_Number": "2260110", "norm": 1.0, "date": "2022-07-01"},
-    {"Station_Number": "2260110", "norm": 0.9929387717, "date": "2022-07-02"},
-    {"Station_Number": "2260110", "norm": 0.9897798012, "date": "2022-07-03"},
-    {"Station_Number": "2260110", "norm": 0.9625569079, "date": "2022-07-04"},
-    {"Station_Number": "2260110", "norm": 0.9101551612, "date": "2022-07-05"},
-    {"Station_Number": "2260110", "norm": 0.845396265, "date": "2022-07-06"},
-    {"Station_Number": "2260110", "norm": 0.7638204961, "date": "2022-07-07"},
-    {"Station_Number": "2260110", "norm": 0.6750905881, "date": "2022-07-08"},
-    {"Station_Number": "2260110", "norm": 0.5973241661, "date": "2022-07-09"},
-    {"Station_Number": "2260110", "norm": 0.5355384187, "date": "2022-07-10"},
-    {"Station_Number": "2260110", "norm": 0.5176995262, "date": "2022-07-11"},
-    {"Station_Number": "2260110", "norm": 0.514168912, "date": "2022-07-12"},
-    {"Station_Number": "2260110", "norm": 0.4723590077, "date": "2022-07-13"},
-    {"Station_Number": "2260110", "norm": 0.4390969061, "date": "2022-07-14"},
-    {"Station_Number": "2260110", "norm": 0.4057418935, "date": "2022-07-15"},
-    {"Station_Number": "2260110", "norm": 0.3743380098, "date": "2022-07-16"},
-    {"Station_Number": "2260110", "norm": 0.3555700084, "date": "2022-07-17"},
-    {"Station_Number": "2260110", "norm": 0.3336430363, "date": "2022-07-18"},
-    {"Station_Number": "2260110", "norm": 0.3297407786, "date": "2022-07-19"},
-    {"Station_Number": "2260110", "norm": 0.3243519465, "date": "2022-07-20"},
-    {"Station_Number": "2260110", "norm": 0.406206448, "date": "2022-07-21"},
-    {"Station_Number": "2260110", "norm": 0.4901979002, "date": "2022-07-22"},
-    {"Station_Number": "2260110", "norm": 0.5904487596, "date": "2022-07-23"},
-    {"Station_Number": "2260110", "norm": 0.635882189, "date": "2022-07-24"},
-    {"Station_Number": "2260110", "norm": 0.6297500697, "date": "2022-07-25"},
-    {"Station_Number": "2260110", "norm": 0.6008547803, "date": "2022-07-26"},
-    {"Station_Number": "2260110", "norm": 0.5766050358, "date": "2022-07-27"},
-    {"Station_Number": "2260110", "norm": 0.5657344607, "date": "2022-07-28"},
-    {"Station_Number": "2260110", "norm": 0.5435287559, "date": "2022-07-29"},
-    {"Station_Number": "2260110", "norm": 0.5493821425, "date": "2022-07-30"},
-    {"Station_Number": "2260110", "norm": 0.5661990151, "date": "2022-07-31"},
-    {"Station_Number": "2260110", "norm": 0.581900957, "date": "2022-08-01"},
-    {"Station_Number": "2260110", "norm": 0.5799498281, "date": "2022-08-02"},
-    {"Station_Number": "2260110", "norm": 0.5600668958, "date": "2022-08-03"},
-    {"Station_Number": "2260110", "norm": 0.5899842051, "date": "2022-08-04"},
-    {"Station_Number": "2260110", "norm": 0.5875685218, "date": "2022-08-05"},
-    {"Station_Number": "2260110", "norm": 0.5676855895, "date": "2022-08-06"},
-    {"Station_Number": "2260110", "norm": 0.5605314503, "date": "2022-08-07"},
-    {"Station_Number": "2260110", "norm": 0.5704729165, "date": "2022-08-08"},
-    {"Station_Number": "2260110", "norm": 0.5904487596, "date": "2022-08-09"},
-    {"Station_Number": "2260110", "norm": 0.5583015888, "date": "2022-08-10"},
-    {"Station_Number": "2260110", "norm": 0.5034841587, "date": "2022-08-11"},
-    {"Station_Number": "2260110", "norm": 0.4599089473, "date": "2022-08-12"},
-    {"Station_Number": "2260110", "norm": 0.4648332249, "date": "2022-08-13"},
-    {"Station_Number": "2260110", "norm": 0.4981882375, "date": "2022-08-14"},
-    {"Station_Number": "2260110", "norm": 0.4981882375, "date": "2022-08-15"},
-    {"Station_Number": "2260110", "norm": 0.4964229304, "date": "2022-08-16"},
-    {"Station_Number": "2260110", "norm": 0.4789556815, "date": "2022-08-17"},
-    {"Station_Number": "2260110", "norm": 0.491312831, "date": "2022-08-18"},
-    {"Station_Number": "2260110", "norm": 0.4871318406, "date": "2022-08-19"},
-    {"Station_Number": "2260110", "norm": 0.4769116417, "date": "2022-08-20"},
-    {"Station_Number": "2260110", "norm": 0.466598532, "date": "2022-08-21"},
-    {"Station_Number": "2260110", "norm": 0.4403047477, "date": "2022-08-22"},
-    {"Station_Number": "2260110", "norm": 0.4160550033, "date": "2022-08-23"},
-    {"Station_Number": "2260110", "norm": 0.3854873177, "date": "2022-08-24"},
-    {"Station_Number": "2260110", "norm": 0.3613304841, "date": "2022-08-25"},
-    {"Station_Number": "2260110", "norm": 0.3563132955, "date": "2022-08-26"},
-    {"Station_Number": "2260110", "norm": 0.3843723869, "date": "2022-08-27"},
-    {"Station_Number": "2260110", "norm": 0.4033262102, "date": "2022-08-28"},
-    {"Station_Number": "2260110", "norm": 0.43640249, "date": "2022-08-29"},
-    {"Station_Number": "2260110", "norm": 0.4943788906, "date": "2022-08-30"},
-    {"Station_Number": "2260110", "norm": 0.6065223451, "date": "2022-08-31"},
-    {"Station_Number": "2260110", "norm": 0.6569729629, "date": "2022-09-01"},
-    {"Station_Number": "2260110", "norm": 0.6278918517, "date": "2022-09-02"},
-    {"Station_Number": "2260110", "norm": 0.6085663848, "date": "2022-09-03"},
-    {"Station_Number": "2260110", "norm": 0.605686147, "date": "2022-09-04"},
-    {"Station_Number": "2260110", "norm": 0.5680572331, "date": "2022-09-05"},
-    {"Station_Number": "2260110", "norm": 0.5762333922, "date": "2022-09-06"},
-    {"Station_Number": "2260110", "norm": 0.6503762891, "date": "2022-09-07"},
-    {"Station_Number": "2260110", "norm": 0.7975471523, "date": "2022-09-08"},
-    {"Station_Number": "2260110", "norm": 0.8459537304, "date": "2022-09-09"},
-    {"Station_Number": "2260110", "norm": 0.8075815293, "date": "2022-09-10"},
-    {"Station_Number": "2260110", "norm": 0.7320449689, "date": "2022-09-11"},
-    {"Station_Number": "2260110", "norm": 0.6771346279, "date": "2022-09-12"},
-    {"Station_Number": "2260110", "norm": 0.6382978723, "date": "2022-09-13"},
-    {"Station_Number": "2260110", "norm": 0.5880330763, "date": "2022-09-14"},
-    {"Station_Number": "2260110", "norm": 0.5381399238, "date": "2022-09-15"},
-    {"Station_Number": "2260110", "norm": 0.4906624547, "date": "2022-09-16"},
-    {"Station_Number": "2260110", "norm": 0.4818359194, "date": "2022-09-17"},
-    {"Station_Number": "2260110", "norm": 0.4999535446, "date": "2022-09-18"},
-    {"Station_Number": "2260110", "norm": 0.5363746167, "date": "2022-09-19"},
-    {"Station_Number": "2260110", "norm": 0.5039487132, "date": "2022-09-20"},
-    {"Station_Number": "2260110", "norm": 0.4715228096, "date": "2022-09-21"},
-    {"Station_Number": "2260110", "norm": 0.4515469665, "date": "2022-09-22"},
-    {"Station_Number": "2260110", "norm": 0.4407693022, "date": "2022-09-23"},
-    {"Station_Number": "2260110", "norm": 0.4863885534, "date": "2022-09-24"},
-    {"Station_Number": "2260110", "norm": 0.5137043575, "date": "2022-09-25"},
-    {"Station_Number": "2260110", "norm": 0.5549567964, "date": "2022-09-26"},
-    {"Station_Number": "2260110", "norm": 0.5933289975, "date": "2022-09-27"},
-    {"Station_Number": "2260110", "norm": 0.59565177, "date": "2022-09-28"},
-    {"Station_Number": "2260110", "norm": 0.5564433708, "date": "2022-09-29"},
-    {"Station_Number": "2260110", "norm": 0.5026479606, "date": "2022-09-30"},
-    {"Station_Number": "2260110", "norm": 0.4548917588, "date": "2022-10-01"},
-    {"Station_Number": "2260110", "norm": 0.4349159156, "date": "2022-10-02"},
-    {"Station_Number": "2260110", "norm": 0.4569357986, "date": "2022-10-03"},
-    {"Station_Number": "2260110", "norm": 0.5742822633, "date": "2022-10-04"},
-    {"Station_Number": "2260110", "norm": 0.583759175, "date": "2022-10-05"},
-    {"Station_Number": "2260110", "norm": 0.513239803, "date": "2022-10-06"},
-    {"Station_Number": "2260110", "norm": 0.456564155, "date": "2022-10-07"},
-    {"Station_Number": "2260110", "norm": 0.430920747, "date": "2022-10-08"},
-    {"Station_Number": "2260110", "norm": 0.4548917588, "date": "2022-10-09"},
-    {"Station_Number": "2260110", "norm": 0.4615813435, "date": "2022-10-10"},
-    {"Station_Number": "2260110", "norm": 0.4486667286, "date": "2022-10-11"},
-    {"Station_Number": "2260110", "norm": 0.4536839171, "date": "2022-10-12"},
-    {"Station_Number": "2260110", "norm": 0.474867602, "date": "2022-10-13"},
-    {"Station_Number": "2260110", "norm": 0.513239803, "date": "2022-10-14"},
-    {"Station_Number": "2260110", "norm": 0.5239245564, "date": "2022-10-15"},
-    {"Station_Number": "2260110", "norm": 0.5283842795, "date": "2022-10-16"},
-    {"Station_Number": "2260110", "norm": 0.5213230512, "date": "2022-10-17"},
-    {"Station_Number": "2260110", "norm": 0.4994889901, "date": "2022-10-18"},
-    {"Station_Number": "2260110", "norm": 0.4607451454, "date": "2022-10-19"},
-    {"Station_Number": "2260110", "norm": 0.4291554399, "date": "2022-10-20"},
-    {"Station_Number": "2260110", "norm": 0.4036978538, "date": "2022-10-21"},
-    {"Station_Number": "2260110", "norm": 0.382421258, "date": "2022-10-22"},
-    {"Station_Number": "2260110", "norm": 0.3551983648, "date": "2022-10-23"},
-    {"Station_Number": "2260110", "norm": 0.3354083434, "date": "2022-10-24"},
-    {"Station_Number": "2260110", "norm": 0.3886462882, "date": "2022-10-25"},
-    {"Station_Number": "2260110", "norm": 0.528848834, "date": "2022-10-26"},
-    {"Station_Number": "2260110", "norm": 0.6237108613, "date": "2022-10-27"},
-    {"Station_Number": "2260110", "norm": 0.8109263217, "date": "2022-10-28"},
-    {"Station_Number": "2260110", "norm": 0.7390132863, "date": "2022-10-29"},
-    {"Station_Number": "2260110", "norm": 0.6397844467, "date": "2022-10-30"},
-    {"Station_Number": "2260110", "norm": 0.5447365976, "date": "2022-10-31"},
-    {"Station_Number": "2260110", "norm": 0.4627891852, "date": "2022-11-01"},
-    {"Station_Number": "2260110", "norm": 0.3955216947, "date": "2022-11-02"},
-    {"Station_Number": "2260110", "norm": 0.3495308, "date": "2022-11-03"},
-    {"Station_Number": "2260110", "norm": 0.3297407786, "date": "2022-11-04"},
-    {"Station_Number": "2260110", "norm": 0.3113444207, "date": "2022-11-05"},
-    {"Station_Number": "2260110", "norm": 0.2947133699, "date": "2022-11-06"},
-    {"Station_Number": "2260110", "norm": 0.279011428, "date": "2022-11-07"},
-    {"Station_Number": "2260110", "norm": 0.2686054074, "date": "2022-11-08"},
-    {"Station_Number": "2260110", "norm": 0.2578277432, "date": "2022-11-09"},
-    {"Station_Number": "2260110", "norm": 0.2463997027, "date": "2022-11-10"},
-    {"Station_Number": "2260110", "norm": 0.2362724148, "date": "2022-11-11"},
-    {"Station_Number": "2260110", "norm": 0.2236365326, "date": "2022-11-12"},
-    {"Station_Number": "2260110", "norm": 0.2185264332, "date": "2022-11-13"},
-    {"Station_Number": "2260110", "norm": 0.2118368485, "date": "2022-11-14"},
-    {"Station_Number": "2260110", "norm": 0.2039394221, "date": "2022-11-15"},
-    {"Station_Number": "2260110", "norm": 0.1974356592, "date": "2022-11-16"},
-    {"Station_Number": "2260110", "norm": 0.191210629, "date": "2022-11-17"},
-    {"Station_Number": "2260110", "norm": 0.1836848462, "date": "2022-11-18"},
-    {"Station_Number": "2260110", "norm": 0.1784818359, "date": "2022-11-19"},
-    {"Station_Number": "2260110", "norm": 0.1726284493, "date": "2022-11-20"},
-    {"Station_Number": "2260110", "norm": 0.1684474589, "date": "2022-11-21"},
-    {"Station_Number": "2260110", "norm": 0.1636160922, "date": "2022-11-22"},
-    {"Station_Number": "2260110", "norm": 0.1596209235, "date": "2022-11-23"},
-    {"Station_Number": "2260110", "norm": 0.1563690421, "date": "2022-11-24"},
-    {"Station_Number": "2260110", "norm": 0.1521880517, "date": "2022-11-25"},
-    {"Station_Number": "2260110", "norm": 0.1489361702, "date": "2022-11-26"},
-    {"Station_Number": "2260110", "norm": 0.1455913779, "date": "2022-11-27"},
-    {"Station_Number": "2260110", "norm": 0.1420607637, "date": "2022-11-28"},
-    {"Station_Number": "2260110", "norm": 0.139087615, "date": "2022-11-29"},
-    {"Station_Number": "2260110", "norm": 0.1357428226, "date": "2022-11-30"},
-    {"Station_Number": "2260110", "norm": 0.1324909412, "date": "2022-12-01"},
-    {"Station_Number": "2260110", "norm": 0.1294248815, "date": "2022-12-02"},
-    {"Station_Number": "2260110", "norm": 0.1267304655, "date": "2022-12-03"},
-    {"Station_Number": "2260110", "norm": 0.123478584, "date": "2022-12-04"},
-    {"Station_Number": "2260110", "norm": 0.1211558116, "date": "2022-12-05"},
-    {"Station_Number": "2260110", "norm": 0.1184613955, "date": "2022-12-06"},
-    {"Station_Number": "2260110", "norm": 0.1157669795, "date": "2022-12-07"},
-    {"Station_Number": "2260110", "norm": 0.1130725634, "date": "2022-12-08"},
-    {"Station_Number": "2260110", "norm": 0.1102852365, "date": "2022-12-09"},
-    {"Station_Number": "2260110", "norm": 0.1075908204, "date": "2022-12-10"},
-    {"Station_Number": "2260110", "norm": 0.1048964043, "date": "2022-12-11"},
-    {"Station_Number": "2260110", "norm": 0.1021090774, "date": "2022-12-12"},
-    {"Station_Number": "2260110", "norm": 0.0994146613, "date": "2022-12-13"},
-    {"Station_Number": "2260110", "norm": 0.097928087, "date": "2022-12-14"},
-    {"Station_Number": "2260110", "norm": 0.0954194927, "date": "2022-12-15"},
-    {"Station_Number": "2260110", "norm": 0.0936541856, "date": "2022-12-16"},
-    {"Station_Number": "2260110", "norm": 0.0914243241, "date": "2022-12-17"},
-    {"Station_Number": "2260110", "norm": 0.0886369971, "date": "2022-12-18"},
-    {"Station_Number": "2260110", "norm": 0.0863142247, "date": "2022-12-19"},
-    {"Station_Number": "2260110", "norm": 0.084177274, "date": "2022-12-20"},
-    {"Station_Number": "2260110", "norm": 0.082319056, "date": "2022-12-21"},
-    {"Station_Number": "2260110", "norm": 0.0806466599, "date": "2022-12-22"},
-    {"Station_Number": "2260110", "norm": 0.0790671746, "date": "2022-12-23"},
-    {"Station_Number": "2260110", "norm": 0.0779522438, "date": "2022-12-24"},
-    {"Station_Number": "2260110", "norm": 0.076837313, "date": "2022-12-25"},
-    {"Station_Number": "2260110", "norm": 0.0757223822, "date": "2022-12-26"},
-    {"Station_Number": "2260110", "norm": 0.0747003624, "date": "2022-12-27"},
-    {"Station_Number": "2260110", "norm": 0.0737712534, "date": "2022-12-28"},
-    {"Station_Number": "2260110", "norm": 0.073213788, "date": "2022-12-29"},
-    {"Station_Number": "2260110", "norm": 0.0727492335, "date": "2022-12-30"},
-    {"Station_Number": "2260110", "norm": 0.0721917681, "date": "2022-12-31"},
-    {"Station_Number": "2260110", "norm": 0.0491301854, "date": "2023-01-01"},
-    {"Station_Number": "2260110", "norm": 0.0491301854, "date": "2023-01-02"},
-    {"Station_Number": "2260110", "norm": 0.0487478494, "date": "2023-01-03"},
-    {"Station_Number": "2260110", "norm": 0.0483655133, "date": "2023-01-04"},
-    {"Station_Number": "2260110", "norm": 0.0479831772, "date": "2023-01-05"},
-    {"Station_Number": "2260110", "norm": 0.0479831772, "date": "2023-01-06"},
-    {"Station_Number": "2260110", "norm": 0.0476008411, "date": "2023-01-07"},
-    {"Station_Number": "2260110", "norm": 0.0472822277, "date": "2023-01-08"},
-    {"Station_Number": "2260110", "norm": 0.0468998917, "date": "2023-01-09"},
-    {"Station_Number": "2260110", "norm": 0.0463901102, "date": "2023-01-10"},
-    {"Station_Number": "2260110", "norm": 0.0456254381, "date": "2023-01-11"},
-    {"Station_Number": "2260110", "norm": 0.0449882113, "date": "2023-01-12"},
-    {"Station_Number": "2260110", "norm": 0.0446058752, "date": "2023-01-13"},
-    {"Station_Number": "2260110", "norm": 0.0442235392, "date": "2023-01-14"},
-    {"Station_Number": "2260110", "norm": 0.0438412031, "date": "2023-01-15"},
-    {"Station_Number": "2260110", "norm": 0.0433951443, "date": "2023-01-16"},
-    {"Station_Number": "2260110", "norm": 0.0426304722, "date": "2023-01-17"},
-    {"Station_Number": "2260110", "norm": 0.0418658, "date": "2023-01-18"},
-    {"Station_Number": "2260110", "norm": 0.0413560186, "date": "2023-01-19"},
-    {"Station_Number": "2260110", "norm": 0.0409736825, "date": "2023-01-20"},
-    {"Station_Number": "2260110", "norm": 0.0404639011, "date": "2023-01-21"},
-    {"Station_Number": "2260110", "norm": 0.040081565, "date": "2023-01-22"},
-    {"Station_Number": "2260110", "norm": 0.0396355063, "date": "2023-01-23"},
-    {"Station_Number": "2260110", "norm": 0.0392531702, "date": "2023-01-24"},
-    {"Station_Number": "2260110", "norm": 0.0386159434, "date": "2023-01-25"},
-    {"Station_Number": "2260110", "norm": 0.0380424393, "date": "2023-01-26"},
-    {"Station_Number": "2260110", "norm": 0.0375963806, "date": "2023-01-27"},
-    {"Station_Number": "2260110", "norm": 0.0372777672, "date": "2023-01-28"},
-    {"Station_Number": "2260110", "norm": 0.0369591538, "date": "2023-01-29"},
-    {"Station_Number": "2260110", "norm": 0.036704263, "date": "2023-01-30"},
-    {"Station_Number": "2260110", "norm": 0.036321927, "date": "2023-01-31"},
-    {"Station_Number": "2260110", "norm": 0.0358121455, "date": "2023-02-01"},
-    {"Station_Number": "2260110", "norm": 0.0354935321, "date": "2023-02-02"},
-    {"Station_Number": "2260110", "norm": 0.0351111961, "date": "2023-02-03"},
-    {"Station_Number": "2260110", "norm": 0.0346651373, "date": "2023-02-04"},
-    {"Station_Number": "2260110", "norm": 0.0343465239, "date": "2023-02-05"},
-    {"Station_Number": "2260110", "norm": 0.0340279105, "date": "2023-02-06"},
-    {"Station_Number": "2260110", "norm": 0.0337730198, "date": "2023-02-07"},
-    {"Station_Number": "2260110", "norm": 0.0334544064, "date": "2023-02-08"},
-    {"Station_Number": "2260110", "norm": 0.0331995157, "date": "2023-02-09"},
-    {"Station_Number": "2260110", "norm": 0.0328809023, "date": "2023-02-10"},
-    {"Station_Number": "2260110", "norm": 0.0326260116, "date": "2023-02-11"},
-    {"Station_Number": "2260110", "norm": 0.0323073982, "date": "2023-02-12"},
-    {"Station_Number": "2260110", "norm": 0.0320525075, "date": "2023-02-13"},
-    {"Station_Number": "2260110", "norm": 0.0317338941, "date": "2023-02-14"},
-    {"Station_Number": "2260110", "norm": 0.0314790034, "date": "2023-02-15"},
-    {"Station_Number": "2260110", "norm": 0.03116039, "date": "2023-02-16"},
-    {"Station_Number": "2260110", "norm": 0.0309054993, "date": "2023-02-17"},
-    {"Station_Number": "2260110", "norm": 0.0305868859, "date": "2023-02-18"},
-    {"Station_Number": "2260110", "norm": 0.0303319952, "date": "2023-02-19"},
-    {"Station_Number": "2260110", "norm": 0.0300133818, "date": "2023-02-20"},
-    {"Station_Number": "2260110", "norm": 0.0296947684, "date": "2023-02-21"},
-    {"Station_Number": "2260110", "norm": 0.0294398777, "date": "2023-02-22"},
-    {"Station_Number": "2260110", "norm": 0.0291212643, "date": "2023-02-23"},
-    {"Station_Number": "2260110", "norm": 0.0288663735, "date": "2023-02-24"},
-    {"Station_Number": "2260110", "norm": 0.0285477601, "date": "2023-02-25"},
-    {"Station_Number": "2260110", "norm": 0.0282291468, "date": "2023-02-26"},
-    {"Station_Number": "2260110", "norm": 0.027974256, "date": "2023-02-27"},
-    {"Station_Number": "2260110", "norm": 0.0276556426, "date": "2023-02-28"},
-    {"Station_Number": "2260110", "norm": 0.0274007519, "date": "2023-03-01"},
-    {"Station_Number": "2260110", "norm": 0.0274007519, "date": "2023-03-02"},
-    {"Station_Number": "2260110", "norm": 0.0270821385, "date": "2023-03-03"},
-    {"Station_Number": "2260110", "norm": 0.0272733066, "date": "2023-03-04"},
-    {"Station_Number": "2260110", "norm": 0.0285477601, "date": "2023-03-05"},
-    {"Station_Number": "2260110", "norm": 0.0291212643, "date": "2023-03-06"},
-    {"Station_Number": "2260110", "norm": 0.0296310457, "date": "2023-03-07"},
-    {"Station_Number": "2260110", "norm": 0.0286752055, "date": "2023-03-08"},
-    {"Station_Number": "2260110", "norm": 0.0281654241, "date": "2023-03-09"},
-    {"Station_Number": "2260110", "norm": 0.0274007519, "date": "2023-03-10"},
-    {"Station_Number": "2260110", "norm": 0.0270821385, "date": "2023-03-11"},
-    {"Station_Number": "2260110", "norm": 0.0268909705, "date": "2023-03-12"},
-    {"Station_Number": "2260110", "norm": 0.0266360798, "date": "2023-03-13"},
-    {"Station_Number": "2260110", "norm": 0.0264449117, "date": "2023-03-14"},
-    {"Station_Number": "2260110", "norm": 0.026190021, "date": "2023-03-15"},
-    {"Station_Number": "2260110", "norm": 0.025998853, "date": "2023-03-16"},
-    {"Station_Number": "2260110", "norm": 0.025807685, "date": "2023-03-17"},
-    {"Station_Number": "2260110", "norm": 0.0255527942, "date": "2023-03-18"},
-    {"Station_Number": "2260110", "norm": 0.0253616262, "date": "2023-03-19"},
-    {"Station_Number": "2260110", "norm": 0.0251067355, "date": "2023-03-20"},
-    {"Station_Number": "2260110", "norm": 0.0254890716, "date": "2023-03-21"},
-    {"Station_Number": "2260110", "norm": 0.025807685, "date": "2023-03-22"},
-    {"Station_Number": "2260110", "norm": 0.025807685, "date": "2023-03-23"},
-    {"Station_Number": "2260110", "norm": 0.0255527942, "date": "2023-03-24"},
-    {"Station_Number": "2260110", "norm": 0.0253616262, "date": "2023-03-25"},
-    {"Station_Number": "2260110", "norm": 0.0257439623, "date": "2023-03-26"},
-    {"Station_Number": "2260110", "norm": 0.0266360798, "date": "2023-03-27"},
-    {"Station_Number": "2260110", "norm": 0.027783088, "date": "2023-03-28"},
-    {"Station_Number": "2260110", "norm": 0.0294398777, "date": "2023-03-29"},
-    {"Station_Number": "2260110", "norm": 0.0312878353, "date": "2023-03-30"},
-    {"Station_Number": "2260110", "norm": 0.0326260116, "date": "2023-03-31"},
-    {"Station_Number": "2260110", "norm": 0.0330720703, "date": "2023-04-01"},
-    {"Station_Number": "2260110", "norm": 0.0320525075, "date": "2023-04-02"},
-    {"Station_Number": "2260110", "norm": 0.03116039, "date": "2023-04-03"},
-    {"Station_Number": "2260110", "norm": 0.0305231632, "date": "2023-04-04"},
-    {"Station_Number": "2260110", "norm": 0.0292487096, "date": "2023-04-05"},
-    {"Station_Number": "2260110", "norm": 0.0282291468, "date": "2023-04-06"},
-    {"Station_Number": "2260110", "norm": 0.02759192, "date": "2023-04-07"},
-    {"Station_Number": "2260110", "norm": 0.0270184159, "date": "2023-04-08"},
-    {"Station_Number": "2260110", "norm": 0.0266998025, "date": "2023-04-09"},
-    {"Station_Number": "2260110", "norm": 0.02759192, "date": "2023-04-10"},
-    {"Station_Number": "2260110", "norm": 0.0280379787, "date": "2023-04-11"},
-    {"Station_Number": "2260110", "norm": 0.0290575416, "date": "2023-04-12"},
-    {"Station_Number": "2260110", "norm": 0.0303319952, "date": "2023-04-13"},
-    {"Station_Number": "2260110", "norm": 0.0310966673, "date": "2023-04-14"},
-    {"Station_Number": "2260110", "norm": 0.0303319952, "date": "2023-04-15"},
-    {"Station_Number": "2260110", "norm": 0.0291212643, "date": "2023-04-16"},
-    {"Station_Number": "2260110", "norm": 0.0282291468, "date": "2023-04-17"},
-    {"Station_Number": "2260110", "norm": 0.02759192, "date": "2023-04-18"},
-    {"Station_Number": "2260110", "norm": 0.0270184159, "date": "2023-04-19"},
-    {"Station_Number": "2260110", "norm": 0.0265723571, "date": "2023-04-20"},
-    {"Station_Number": "2260110", "norm": 0.0261262983, "date": "2023-04-21"},
-    {"Station_Number": "2260110", "norm": 0.0256802396, "date": "2023-04-22"},
-    {"Station_Number": "2260110", "norm": 0.0249155675, "date": "2023-04-23"},
-    {"Station_Number": "2260110", "norm": 0.0244695087, "date": "2023-04-24"},
-    {"Station_Number": "2260110", "norm": 0.024214618, "date": "2023-04-25"},
-    {"Station_Number": "2260110", "norm": 0.0237685592, "date": "2023-04-26"},
-    {"Station_Number": "2260110", "norm": 0.0233862232, "date": "2023-04-27"},
-    {"Station_Number": "2260110", "norm": 0.0231950551, "date": "2023-04-28"},
-    {"Station_Number": "2260110", "norm": 0.0234499458, "date": "2023-04-29"},
-    {"Station_Number": "2260110", "norm": 0.0247881221, "date": "2023-04-30"},
-    {"Station_Number": "2260110", "norm": 0.0254253489, "date": "2023-05-01"},
-    {"Station_Number": "2260110", "norm": 0.0263811891, "date": "2023-05-02"},
-    {"Station_Number": "2260110", "norm": 0.026190021, "date": "2023-05-03"},
-    {"Station_Number": "2260110", "norm": 0.025807685, "date": "2023-05-04"},
-    {"Station_Number": "2260110", "norm": 0.0254890716, "date": "2023-05-05"},
-    {"Station_Number": "2260110", "norm": 0.0251067355, "date": "2023-05-06"},
-    {"Station_Number": "2260110", "norm": 0.0248518448, "date": "2023-05-07"},
-    {"Station_Number": "2260110", "norm": 0.0246606767, "date": "2023-05-08"},
-    {"Station_Number": "2260110", "norm": 0.0242783407, "date": "2023-05-09"},
-    {"Station_Number": "2260110", "norm": 0.0240234499, "date": "2023-05-10"},
-    {"Station_Number": "2260110", "norm": 0.0243420633, "date": "2023-05-11"},
-    {"Station_Number": "2260110", "norm": 0.0252979035, "date": "2023-05-12"},
-    {"Station_Number": "2260110", "norm": 0.0256165169, "date": "2023-05-13"},
-    {"Station_Number": "2260110", "norm": 0.0266360798, "date": "2023-05-14"},
-    {"Station_Number": "2260110", "norm": 0.0278468107, "date": "2023-05-15"},
-    {"Station_Number": "2260110", "norm": 0.0291212643, "date": "2023-05-16"},
-    {"Station_Number": "2260110", "norm": 0.0303319952, "date": "2023-05-17"},
-    {"Station_Number": "2260110", "norm": 0.0307143312, "date": "2023-05-18"},
-    {"Station_Number": "2260110", "norm": 0.0321162302, "date": "2023-05-19"},
-    {"Station_Number": "2260110", "norm": 0.034537692, "date": "2023-05-20"},
-    {"Station_Number": "2260110", "norm": 0.036321927, "date": "2023-05-21"},
-    {"Station_Number": "2260110", "norm": 0.0375963806, "date": "2023-05-22"},
-    {"Station_Number": "2260110", "norm": 0.0382336073, "date": "2023-05-23"},
-    {"Station_Number": "2260110", "norm": 0.0394443382, "date": "2023-05-24"},
-    {"Station_Number": "2260110", "norm": 0.0412285732, "date": "2023-05-25"},
-    {"Station_Number": "2260110", "norm": 0.0412285732, "date": "2023-05-26"},
-    {"Station_Number": "2260110", "norm": 0.0391894475, "date": "2023-05-27"},
-    {"Station_Number": "2260110", "norm": 0.036704263, "date": "2023-05-28"},
-    {"Station_Number": "2260110", "norm": 0.0358758682, "date": "2023-05-29"},
-    {"Station_Number": "2260110", "norm": 0.034537692, "date": "2023-05-30"},
-    {"Station_Number": "2260110", "norm": 0.0326897343, "date": "2023-05-31"},
-    {"Station_Number": "2260110", "norm": 0.0314790034, "date": "2023-06-01"},
-    {"Station_Number": "2260110", "norm": 0.0305868859, "date": "2023-06-02"},
-    {"Station_Number": "2260110", "norm": 0.0298859364, "date": "2023-06-03"},
-    {"Station_Number": "2260110", "norm": 0.0291212643, "date": "2023-06-04"},
-    {"Station_Number": "2260110", "norm": 0.027974256, "date": "2023-06-05"},
-    {"Station_Number": "2260110", "norm": 0.0268909705, "date": "2023-06-06"},
-    {"Station_Number": "2260110", "norm": 0.0263811891, "date": "2023-06-07"},
-    {"Station_Number": "2260110", "norm": 0.025998853, "date": "2023-06-08"},
-    {"Station_Number": "2260110", "norm": 0.0258714076, "date": "2023-06-09"},
-    {"Station_Number": "2260110", "norm": 0.025998853, "date": "2023-06-10"},
-    {"Station_Number": "2260110", "norm": 0.0266360798, "date": "2023-06-11"},
-    {"Station_Number": "2260110", "norm": 0.0278468107, "date": "2023-06-12"},
-    {"Station_Number": "2260110", "norm": 0.0296310457, "date": "2023-06-13"},
-    {"Station_Number": "2260110", "norm": 0.052188874, "date": "2023-06-14"},
-    {"Station_Number": "2260110", "norm": 0.1289109794, "date": "2023-06-15"},
-    {"Station_Number": "2260110", "norm": 0.1639584528, "date": "2023-06-16"},
-    {"Station_Number": "2260110", "norm": 0.2773848213, "date": "2023-06-17"},
-    {"Station_Number": "2260110", "norm": 0.3274071242, "date": "2023-06-18"},
-    {"Station_Number": "2260110", "norm": 0.3299560314, "date": "2023-06-19"},
-    {"Station_Number": "2260110", "norm": 0.3039571784, "date": "2023-06-20"},
-    {"Station_Number": "2260110", "norm": 0.2802523418, "date": "2023-06-21"},
-    {"Station_Number": "2260110", "norm": 0.2643853948, "date": "2023-06-22"},
-    {"Station_Number": "2260110", "norm": 0.2492831199, "date": "2023-06-23"},
-    {"Station_Number": "2260110", "norm": 0.2334161728, "date": "2023-06-24"},
-    {"Station_Number": "2260110", "norm": 0.2887911808, "date": "2023-06-25"},
-    {"Station_Number": "2260110", "norm": 0.3386860384, "date": "2023-06-26"},
-    {"Station_Number": "2260110", "norm": 0.3432103486, "date": "2023-06-27"},
-    {"Station_Number": "2260110", "norm": 0.3268336201, "date": "2023-06-28"},
-    {"Station_Number": "2260110", "norm": 0.2995603135, "date": "2023-06-29"},
-    {"Station_Number": "2260110", "norm": 0.2612629835, "date": "2023-06-30"},
-    {"Station_Number": "2260110", "norm": 0.2457783725, "date": "2023-07-01"},
-    {"Station_Number": "2260110", "norm": 0.2609443701, "date": "2023-07-02"},
-    {"Station_Number": "2260110", "norm": 0.2659784617, "date": "2023-07-03"},
-    {"Station_Number": "2260110", "norm": 0.2713311668, "date": "2023-07-04"},
-    {"Station_Number": "2260110", "norm": 0.2617727649, "date": "2023-07-05"},
-    {"Station_Number": "2260110", "norm": 0.2562288919, "date": "2023-07-06"},
-    {"Station_Number": "2260110", "norm": 0.2782769388, "date": "2023-07-07"},
-    {"Station_Number": "2260110", "norm": 0.31255974, "date": "2023-07-08"},
-    {"Station_Number": "2260110", "norm": 0.4053399605, "date": "2023-07-09"},
-    {"Station_Number": "2260110", "norm": 0.5142420187, "date": "2023-07-10"},
-    {"Station_Number": "2260110", "norm": 0.5845281336, "date": "2023-07-11"},
-    {"Station_Number": "2260110", "norm": 0.6176639266, "date": "2023-07-12"},
-    {"Station_Number": "2260110", "norm": 0.6480596444, "date": "2023-07-13"},
-    {"Station_Number": "2260110", "norm": 0.6869304786, "date": "2023-07-14"},
-    {"Station_Number": "2260110", "norm": 0.7338940929, "date": "2023-07-15"},
-    {"Station_Number": "2260110", "norm": 0.7740393806, "date": "2023-07-16"},
-    {"Station_Number": "2260110", "norm": 0.8271203721, "date": "2023-07-17"},
-    {"Station_Number": "2260110", "norm": 0.8589817116, "date": "2023-07-18"},
-    {"Station_Number": "2260110", "norm": 0.8916714459, "date": "2023-07-19"},
-    {"Station_Number": "2260110", "norm": 0.9267189193, "date": "2023-07-20"},
-    {"Station_Number": "2260110", "norm": 0.9356400943, "date": "2023-07-21"},
-    {"Station_Number": "2260110", "norm": 0.8959408654, "date": "2023-07-22"},
-    {"Station_Number": "2260110", "norm": 0.821385331, "date": "2023-07-23"},
-    {"Station_Number": "2260110", "norm": 0.6969349391, "date": "2023-07-24"},
-    {"Station_Number": "2260110", "norm": 0.5601860702, "date": "2023-07-25"},
-    {"Station_Number": "2260110", "norm": 0.4595679602, "date": "2023-07-26"},
-    {"Station_Number": "2260110", "norm": 0.4399413751, "date": "2023-07-27"},
-    {"Station_Number": "2260110", "norm": 0.4195501179, "date": "2023-07-28"},
-    {"Station_Number": "2260110", "norm": 0.4091633212, "date": "2023-07-29"},
-    {"Station_Number": "2260110", "norm": 0.4245842095, "date": "2023-07-30"},
-    {"Station_Number": "2260110", "norm": 0.4457401389, "date": "2023-07-31"},
-    {"Station_Number": "2260110", "norm": 0.449882113, "date": "2023-08-01"},
-    {"Station_Number": "2260110", "norm": 0.4468234245, "date": "2023-08-02"},
-    {"Station_Number": "2260110", "norm": 0.4328681578, "date": "2023-08-03"},
-    {"Station_Number": "2260110", "norm": 0.4227999745, "date": "2023-08-04"},
-    {"Station_Number": "2260110", "norm": 0.4156630345, "date": "2023-08-05"},
-    {"Station_Number": "2260110", "norm": 0.4785573185, "date": "2023-08-06"},
-    {"Station_Number": "2260110", "norm": 0.5596762888, "date": "2023-08-07"},
-    {"Station_Number": "2260110", "norm": 0.6357611674, "date": "2023-08-08"},
-    {"Station_Number": "2260110", "norm": 0.7094245842, "date": "2023-08-09"},
-    {"Station_Number": "2260110", "norm": 0.7804116485, "date": "2023-08-10"},
-    {"Station_Number": "2260110", "norm": 0.8156502899, "date": "2023-08-11"},
-    {"Station_Number": "2260110", "norm": 0.8494233098, "date": "2023-08-12"},
-    {"Station_Number": "2260110", "norm": 0.8604473332, "date": "2023-08-13"},
-    {"Station_Number": "2260110", "norm": 0.8812846492, "date": "2023-08-14"},
-    {"Station_Number": "2260110", "norm": 0.9133371567, "date": "2023-08-15"},
-    {"Station_Number": "2260110", "norm": 0.9883387498, "date": "2023-08-16"},
-    {"Station_Number": "2260110", "norm": 1.0, "date": "2023-08-17"},
-    {"Station_Number": "2260110", "norm": 0.9800548015, "date": "2023-08-18"},
-    {"Station_Number": "2260110", "norm": 0.9378066654, "date": "2023-08-19"},
-    {"Station_Number": "2260110", "norm": 0.8658000382, "date": "2023-08-20"},
-    {"Station_Number": "2260110", "norm": 0.7574714841, "date": "2023-08-21"},
-    {"Station_Number": "2260110", "norm": 0.6816414962, "date": "2023-08-22"},
-    {"Station_Number": "2260110", "norm": 0.6349964953, "date": "2023-08-23"},
-    {"Station_Number": "2260110", "norm": 0.6176639266, "date": "2023-08-24"},
-    {"Station_Number": "2260110", "norm": 0.7181545912, "date": "2023-08-25"},
-    {"Station_Number": "2260110", "norm": 0.767412222, "date": "2023-08-26"},
-    {"Station_Number": "2260110", "norm": 0.8201108775, "date": "2023-08-27"},
-    {"Station_Number": "2260110", "norm": 0.8500605365, "date": "2023-08-28"},
-    {"Station_Number": "2260110", "norm": 0.8604473332, "date": "2023-08-29"},
-    {"Station_Number": "2260110", "norm": 0.8772701204, "date": "2023-08-30"},
-    {"Station_Number": "2260110", "norm": 0.9018670745, "date": "2023-08-31"},
-    {"Station_Number": "2260110", "norm": 0.9311795068, "date": "2023-09-01"},
-    {"Station_Number": "2260110", "norm": 0.9541196712, "date": "2023-09-02"},
-    {"Station_Number": "2260110", "norm": 0.97240808, "date": "2023-09-03"},
-    {"Station_Number": "2260110", "norm": 0.9520168228, "date": "2023-09-04"},
-    {"Station_Number": "2260110", "norm": 0.8755496081, "date": "2023-09-05"},
-    {"Station_Number": "2260110", "norm": 0.746383738, "date": "2023-09-06"},
-    {"Station_Number": "2260110", "norm": 0.6057477856, "date": "2023-09-07"},
-    {"Station_Number": "2260110", "norm": 0.4965908367, "date": "2023-09-08"},
-    {"Station_Number": "2260110", "norm": 0.4317848722, "date": "2023-09-09"},
-    {"Station_Number": "2260110", "norm": 0.3918944752, "date": "2023-09-10"},
-    {"Station_Number": "2260110", "norm": 0.3623908749, "date": "2023-09-11"},
-    {"Station_Number": "2260110", "norm": 0.3334607787, "date": "2023-09-12"},
-    {"Station_Number": "2260110", "norm": 0.3154272606, "date": "2023-09-13"},
-    {"Station_Number": "2260110", "norm": 0.3274708469, "date": "2023-09-14"},
-    {"Station_Number": "2260110", "norm": 0.3569107245, "date": "2023-09-15"},
-    {"Station_Number": "2260110", "norm": 0.3395144332, "date": "2023-09-16"},
-    {"Station_Number": "2260110", "norm": 0.3171477729, "date": "2023-09-17"},
-    {"Station_Number": "2260110", "norm": 0.2973937424, "date": "2023-09-18"},
-    {"Station_Number": "2260110", "norm": 0.2944624992, "date": "2023-09-19"},
-    {"Station_Number": "2260110", "norm": 0.340342828, "date": "2023-09-20"},
-    {"Station_Number": "2260110", "norm": 0.3857133754, "date": "2023-09-21"},
-    {"Station_Number": "2260110", "norm": 0.3909386351, "date": "2023-09-22"},
-    {"Station_Number": "2260110", "norm": 0.3752628561, "date": "2023-09-23"},
-    {"Station_Number": "2260110", "norm": 0.3694003696, "date": "2023-09-24"},
-    {"Station_Number": "2260110", "norm": 0.3932326515, "date": "2023-09-25"},
-    {"Station_Number": "2260110", "norm": 0.3755814694, "date": "2023-09-26"},
-    {"Station_Number": "2260110", "norm": 0.364557446, "date": "2023-09-27"},
-    {"Station_Number": "2260110", "norm": 0.3559548843, "date": "2023-09-28"},
-    {"Station_Number": "2260110", "norm": 0.3323137705, "date": "2023-09-29"},
-    {"Station_Number": "2260110", "norm": 0.3179761677, "date": "2023-09-30"},
-    {"Station_Number": "2260110", "norm": 0.3045306825, "date": "2023-10-01"},
-    {"Station_Number": "2260110", "norm": 0.2958006755, "date": "2023-10-02"},
-    {"Station_Number": "2260110", "norm": 0.282801249, "date": "2023-10-03"},
-    {"Station_Number": "2260110", "norm": 0.2705027719, "date": "2023-10-04"},
-    {"Station_Number": "2260110", "norm": 0.2617727649, "date": "2023-10-05"},
-    {"Station_Number": "2260110", "norm": 0.2920410374, "date": "2023-10-06"},
-    {"Station_Number": "2260110", "norm": 0.3234563181, "date": "2023-10-07"},
-    {"Station_Number": "2260110", "norm": 0.3012808258, "date": "2023-10-08"},
-    {"Station_Number": "2260110", "norm": 0.2932517683, "date": "2023-10-09"},
-    {"Station_Number": "2260110", "norm": 0.3025552794, "date": "2023-10-10"},
-    {"Station_Number": "2260110", "norm": 0.2947173899, "date": "2023-10-11"},
-    {"Station_Number": "2260110", "norm": 0.3529599184, "date": "2023-10-12"},
-    {"Station_Number": "2260110", "norm": 0.4248391002, "date": "2023-10-13"},
-    {"Station_Number": "2260110", "norm": 0.4191040591, "date": "2023-10-14"},
-    {"Station_Number": "2260110", "norm": 0.3841840311, "date": "2023-10-15"},
-    {"Station_Number": "2260110", "norm": 0.3502198432, "date": "2023-10-16"},
-    {"Station_Number": "2260110", "norm": 0.3247944944, "date": "2023-10-17"},
-    {"Station_Number": "2260110", "norm": 0.2955457847, "date": "2023-10-18"},
-    {"Station_Number": "2260110", "norm": 0.265723571, "date": "2023-10-19"},
-    {"Station_Number": "2260110", "norm": 0.242910852, "date": "2023-10-20"},
-    {"Station_Number": "2260110", "norm": 0.2258968967, "date": "2023-10-21"},
-    {"Station_Number": "2260110", "norm": 0.211750462, "date": "2023-10-22"},
-    {"Station_Number": "2260110", "norm": 0.2007901612, "date": "2023-10-23"},
-    {"Station_Number": "2260110", "norm": 0.1913592047, "date": "2023-10-24"},
-    {"Station_Number": "2260110", "norm": 0.1833301472, "date": "2023-10-25"},
-    {"Station_Number": "2260110", "norm": 0.177021602, "date": "2023-10-26"},
-    {"Station_Number": "2260110", "norm": 0.1719237877, "date": "2023-10-27"},
-    {"Station_Number": "2260110", "norm": 0.1688013764, "date": "2023-10-28"},
-    {"Station_Number": "2260110", "norm": 0.1658064105, "date": "2023-10-29"},
-    {"Station_Number": "2260110", "norm": 0.1641496209, "date": "2023-10-30"},
-    {"Station_Number": "2260110", "norm": 0.1689925444, "date": "2023-10-31"},
-    {"Station_Number": "2260110", "norm": 0.1704581661, "date": "2023-11-01"},
-    {"Station_Number": "2260110", "norm": 0.1560568406, "date": "2023-11-02"},
-    {"Station_Number": "2260110", "norm": 0.1489199006, "date": "2023-11-03"},
-    {"Station_Number": "2260110", "norm": 0.1425476327, "date": "2023-11-04"},
-    {"Station_Number": "2260110", "norm": 0.1365577009, "date": "2023-11-05"},
-    {"Station_Number": "2260110", "norm": 0.1318422226, "date": "2023-11-06"},
-    {"Station_Number": "2260110", "norm": 0.1275728032, "date": "2023-11-07"},
-    {"Station_Number": "2260110", "norm": 0.1231122156, "date": "2023-11-08"},
-    {"Station_Number": "2260110", "norm": 0.1199898044, "date": "2023-11-09"},
-    {"Station_Number": "2260110", "norm": 0.1177595106, "date": "2023-11-10"},
-    {"Station_Number": "2260110", "norm": 0.1141910406, "date": "2023-11-11"},
-    {"Station_Number": "2260110", "norm": 0.1105588479, "date": "2023-11-12"},
-    {"Station_Number": "2260110", "norm": 0.1081373861, "date": "2023-11-13"},
-    {"Station_Number": "2260110", "norm": 0.1064805964, "date": "2023-11-14"},
-    {"Station_Number": "2260110", "norm": 0.104377748, "date": "2023-11-15"},
-    {"Station_Number": "2260110", "norm": 0.1021474543, "date": "2023-11-16"},
-    {"Station_Number": "2260110", "norm": 0.1011916141, "date": "2023-11-17"},
-    {"Station_Number": "2260110", "norm": 0.10418658, "date": "2023-11-18"},
-    {"Station_Number": "2260110", "norm": 0.1103676799, "date": "2023-11-19"},
-    {"Station_Number": "2260110", "norm": 0.1130440324, "date": "2023-11-20"},
-    {"Station_Number": "2260110", "norm": 0.1195437456, "date": "2023-11-21"},
-    {"Station_Number": "2260110", "norm": 0.1237494424, "date": "2023-11-22"},
-    {"Station_Number": "2260110", "norm": 0.1201809724, "date": "2023-11-23"},
-    {"Station_Number": "2260110", "norm": 0.1128528643, "date": "2023-11-24"},
-    {"Station_Number": "2260110", "norm": 0.1072452686, "date": "2023-11-25"},
-    {"Station_Number": "2260110", "norm": 0.1025297904, "date": "2023-11-26"},
-    {"Station_Number": "2260110", "norm": 0.0981966482, "date": "2023-11-27"},
-    {"Station_Number": "2260110", "norm": 0.0952016823, "date": "2023-11-28"},
-    {"Station_Number": "2260110", "norm": 0.0925253298, "date": "2023-11-29"},
-    {"Station_Number": "2260110", "norm": 0.090295036, "date": "2023-11-30"},
-    {"Station_Number": "2260110", "norm": 0.0878098515, "date": "2023-12-01"},
-    {"Station_Number": "2260110", "norm": 0.0861530619, "date": "2023-12-02"},
-    {"Station_Number": "2260110", "norm": 0.0848786083, "date": "2023-12-03"},
-    {"Station_Number": "2260110", "norm": 0.0830943733, "date": "2023-12-04"},
-    {"Station_Number": "2260110", "norm": 0.0820110877, "date": "2023-12-05"},
-    {"Station_Number": "2260110", "norm": 0.0812464156, "date": "2023-12-06"},
-    {"Station_Number": "2260110", "norm": 0.0811189702, "date": "2023-12-07"},
-    {"Station_Number": "2260110", "norm": 0.0834129867, "date": "2023-12-08"},
-    {"Station_Number": "2260110", "norm": 0.0865353979, "date": "2023-12-09"},
-    {"Station_Number": "2260110", "norm": 0.086726566, "date": "2023-12-10"},
-    {"Station_Number": "2260110", "norm": 0.0841139361, "date": "2023-12-11"},
-    {"Station_Number": "2260110", "norm": 0.0848148856, "date": "2023-12-12"},
-    {"Station_Number": "2260110", "norm": 0.0863442299, "date": "2023-12-13"},
-    {"Station_Number": "2260110", "norm": 0.0855795578, "date": "2023-12-14"},
-    {"Station_Number": "2260110", "norm": 0.0841139361, "date": "2023-12-15"},
-    {"Station_Number": "2260110", "norm": 0.0823297011, "date": "2023-12-16"},
-    {"Station_Number": "2260110", "norm": 0.0798445167, "date": "2023-12-17"},
-    {"Station_Number": "2260110", "norm": 0.0773593322, "date": "2023-12-18"},
-    {"Station_Number": "2260110", "norm": 0.0761486013, "date": "2023-12-19"},
-    {"Station_Number": "2260110", "norm": 0.0745555343, "date": "2023-12-20"},
-    {"Station_Number": "2260110", "norm": 0.0735996941, "date": "2023-12-21"},
-    {"Station_Number": "2260110", "norm": 0.0727075766, "date": "2023-12-22"},
-    {"Station_Number": "2260110", "norm": 0.0717517364, "date": "2023-12-23"},
-    {"Station_Number": "2260110", "norm": 0.0709870643, "date": "2023-12-24"},
-    {"Station_Number": "2260110", "norm": 0.0699037788, "date": "2023-12-25"},
-    {"Station_Number": "2260110", "norm": 0.0686930479, "date": "2023-12-26"},
-    {"Station_Number": "2260110", "norm": 0.0677372077, "date": "2023-12-27"},
-    {"Station_Number": "2260110", "norm": 0.0672911489, "date": "2023-12-28"},
-    {"Station_Number": "2260110", "norm": 0.0671637036, "date": "2023-12-29"},
-    {"Station_Number": "2260110", "norm": 0.0667176448, "date": "2023-12-30"},
-    {"Station_Number": "2260110", "norm": 0.0662078634, "date": "2023-12-31"},
-    {"Station_Number": "2260120", "norm": 0.0621391111, "date": "2020-01-01"},
-    {"Station_Number": "2260120", "norm": 0.0612385443, "date": "2020-01-02"},
-    {"Station_Number": "2260120", "norm": 0.0600731048, "date": "2020-01-03"},
-    {"Station_Number": "2260120", "norm": 0.0594903851, "date": "2020-01-04"},
-    {"Station_Number": "2260120", "norm": 0.0600731048, "date": "2020-01-05"},
-    {"Station_Number": "2260120", "norm": 0.0606558245, "date": "2020-01-06"},
-    {"Station_Number": "2260120", "norm": 0.0610796207, "date": "2020-01-07"},
-    {"Station_Number": "2260120", "norm": 0.0615563914, "date": "2020-01-08"},
-    {"Station_Number": "2260120", "norm": 0.0624039837, "date": "2020-01-09"},
-    {"Station_Number": "2260120", "norm": 0.0624039837, "date": "2020-01-10"},
-    {"Station_Number": "2260120", "norm": 0.0621391111, "date": "2020-01-11"},
-    {"Station_Number": "2260120", "norm": 0.0614504423, "date": "2020-01-12"},
-    {"Station_Number": "2260120", "norm": 0.0612385443, "date": "2020-01-13"},
-    {"Station_Number": "2260120", "norm": 0.0610796207, "date": "2020-01-14"},
-    {"Station_Number": "2260120", "norm": 0.0607617736, "date": "2020-01-15"},
-    {"Station_Number": "2260120", "norm": 0.060390952, "date": "2020-01-16"},
-    {"Station_Number": "2260120", "norm": 0.0599671558, "date": "2020-01-17"},
-    {"Station_Number": "2260120", "norm": 0.059278487, "date": "2020-01-18"},
-    {"Station_Number": "2260120", "norm": 0.057742226, "date": "2020-01-19"},
-    {"Station_Number": "2260120", "norm": 0.0561529904, "date": "2020-01-20"},
-    {"Station_Number": "2260120", "norm": 0.0553583726, "date": "2020-01-21"},
-    {"Station_Number": "2260120", "norm": 0.0546697039, "date": "2020-01-22"},
-    {"Station_Number": "2260120", "norm": 0.0542459077, "date": "2020-01-23"},
-    {"Station_Number": "2260120", "norm": 0.0540340096, "date": "2020-01-24"},
-    {"Station_Number": "2260120", "norm": 0.0533453409, "date": "2020-01-25"},
-    {"Station_Number": "2260120", "norm": 0.0526036976, "date": "2020-01-26"},
-    {"Station_Number": "2260120", "norm": 0.0518620544, "date": "2020-01-27"},
-    {"Station_Number": "2260120", "norm": 0.0513852837, "date": "2020-01-28"},
-    {"Station_Number": "2260120", "norm": 0.0511204111, "date": "2020-01-29"},
-    {"Station_Number": "2260120", "norm": 0.0505906659, "date": "2020-01-30"},
-    {"Station_Number": "2260120", "norm": 0.0503257933, "date": "2020-01-31"},
-    {"Station_Number": "2260120", "norm": 0.0501668697, "date": "2020-02-01"},
-    {"Station_Number": "2260120", "norm": 0.0499019971, "date": "2020-02-02"},
-    {"Station_Number": "2260120", "norm": 0.0497960481, "date": "2020-02-03"},
-    {"Station_Number": "2260120", "norm": 0.0495311755, "date": "2020-02-04"},
-    {"Station_Number": "2260120", "norm": 0.0492663029, "date": "2020-02-05"},
-    {"Station_Number": "2260120", "norm": 0.0491073794, "date": "2020-02-06"},
-    {"Station_Number": "2260120", "norm": 0.0488425068, "date": "2020-02-07"},
-    {"Station_Number": "2260120", "norm": 0.0484716851, "date": "2020-02-08"},
-    {"Station_Number": "2260120", "norm": 0.0482068125, "date": "2020-02-09"},
-    {"Station_Number": "2260120", "norm": 0.0478359909, "date": "2020-02-10"},
-    {"Station_Number": "2260120", "norm": 0.0476770673, "date": "2020-02-11"},
-    {"Station_Number": "2260120", "norm": 0.0474121947, "date": "2020-02-12"},
-    {"Station_Number": "2260120", "norm": 0.0472532712, "date": "2020-02-13"},
-    {"Station_Number": "2260120", "norm": 0.0469883986, "date": "2020-02-14"},
-    {"Station_Number": "2260120", "norm": 0.0468824495, "date": "2020-02-15"},
-    {"Station_Number": "2260120", "norm": 0.0466175769, "date": "2020-02-16"},
-    {"Station_Number": "2260120", "norm": 0.0465116279, "date": "2020-02-17"},
-    {"Station_Number": "2260120", "norm": 0.0463527043, "date": "2020-02-18"},
-    {"Station_Number": "2260120", "norm": 0.0461408063, "date": "2020-02-19"},
-    {"Station_Number": "2260120", "norm": 0.0458759337, "date": "2020-02-20"},
-    {"Station_Number": "2260120", "norm": 0.0457170101, "date": "2020-02-21"},
-    {"Station_Number": "2260120", "norm": 0.0454521375, "date": "2020-02-22"},
-    {"Station_Number": "2260120", "norm": 0.0450813159, "date": "2020-02-23"},
-    {"Station_Number": "2260120", "norm": 0.0448694178, "date": "2020-02-24"},
-    {"Station_Number": "2260120", "norm": 0.0447104943, "date": "2020-02-25"},
-    {"Station_Number": "2260120", "norm": 0.0446575197, "date": "2020-02-26"},
-    {"Station_Number": "2260120", "norm": 0.0444456217, "date": "2020-02-27"},
-    {"Station_Number": "2260120", "norm": 0.0442866981, "date": "2020-02-28"},
-    {"Station_Number": "2260120", "norm": 0.0441807491, "date": "2020-02-29"},
-    {"Station_Number": "2260120", "norm": 0.0440218255, "date": "2020-03-01"},
-    {"Station_Number": "2260120", "norm": 0.0438629019, "date": "2020-03-02"},
-    {"Station_Number": "2260120", "norm": 0.0439158765, "date": "2020-03-03"},
-    {"Station_Number": "2260120", "norm": 0.0441807491, "date": "2020-03-04"},
-    {"Station_Number": "2260120", "norm": 0.0442866981, "date": "2020-03-05"},
-    {"Station_Number": "2260120", "norm": 0.0444456217, "date": "2020-03-06"},
-    {"Station_Number": "2260120", "norm": 0.0444985962, "date": "2020-03-07"},
-    {"Station_Number": "2260120", "norm": 0.0450813159, "date": "2020-03-08"},
-    {"Station_Number": "2260120", "norm": 0.0450283414, "date": "2020-03-09"},
-    {"Station_Number": "2260120", "norm": 0.0447104943, "date": "2020-03-10"},
-    {"Station_Number": "2260120", "norm": 0.0444456217, "date": "2020-03-11"},
-    {"Station_Number": "2260120", "norm": 0.0441807491, "date": "2020-03-12"},
-    {"Station_Number": "2260120", "norm": 0.0440218255, "date": "2020-03-13"},
-    {"Station_Number": "2260120", "norm": 0.0438629019, "date": "2020-03-14"},
-    {"Station_Number": "2260120", "norm": 0.0438629019, "date": "2020-03-15"},
-    {"Station_Number": "2260120", "norm": 0.0437039784, "date": "2020-03-16"},
-    {"Station_Number": "2260120", "norm": 0.0436510039, "date": "2020-03-17"},
-    {"Station_Number": "2260120", "norm": 0.0429623351, "date": "2020-03-18"},
-    {"Station_Number": "2260120", "norm": 0.042538539, "date": "2020-03-19"},
-    {"Station_Number": "2260120", "norm": 0.0419558193, "date": "2020-03-20"},
-    {"Station_Number": "2260120", "norm": 0.0415320231, "date": "2020-03-21"},
-    {"Station_Number": "2260120", "norm": 0.0413730995, "date": "2020-03-22"},
-    {"Station_Number": "2260120", "norm": 0.0411082269, "date": "2020-03-23"},
-    {"Station_Number": "2260120", "norm": 0.0409493034, "date": "2020-03-24"},
-    {"Station_Number": "2260120", "norm": 0.0404725327, "date": "2020-03-25"},
-    {"Station_Number": "2260120", "norm": 0.0402606346, "date": "2020-03-26"},
-    {"Station_Number": "2260120", "norm": 0.039995762, "date": "2020-03-27"},
-    {"Station_Number": "2260120", "norm": 0.0396249404, "date": "2020-03-28"},
-    {"Station_Number": "2260120", "norm": 0.0394130423, "date": "2020-03-29"},
-    {"Station_Number": "2260120", "norm": 0.0392541188, "date": "2020-03-30"},
-    {"Station_Number": "2260120", "norm": 0.0391481697, "date": "2020-03-31"},
-    {"Station_Number": "2260120", "norm": 0.0389362717, "date": "2020-04-01"},
-    {"Station_Number": "2260120", "norm": 0.0387773481, "date": "2020-04-02"},
-    {"Station_Number": "2260120", "norm": 0.03856545, "date": "2020-04-03"},
-    {"Station_Number": "2260120", "norm": 0.0383535519, "date": "2020-04-04"},
-    {"Station_Number": "2260120", "norm": 0.0380886793, "date": "2020-04-05"},
-    {"Station_Number": "2260120", "norm": 0.0378767813, "date": "2020-04-06"},
-    {"Station_Number": "2260120", "norm": 0.0376648832, "date": "2020-04-07"},
-    {"Station_Number": "2260120", "norm": 0.0373470361, "date": "2020-04-08"},
-    {"Station_Number": "2260120", "norm": 0.037029189, "date": "2020-04-09"},
-    {"Station_Number": "2260120", "norm": 0.0368702654, "date": "2020-04-10"},
-    {"Station_Number": "2260120", "norm": 0.0366053928, "date": "2020-04-11"},
-    {"Station_Number": "2260120", "norm": 0.0363934947, "date": "2020-04-12"},
-    {"Station_Number": "2260120", "norm": 0.0361815967, "date": "2020-04-13"},
-    {"Station_Number": "2260120", "norm": 0.0360226731, "date": "2020-04-14"},
-    {"Station_Number": "2260120", "norm": 0.0360226731, "date": "2020-04-15"},
-    {"Station_Number": "2260120", "norm": 0.0358637495, "date": "2020-04-16"},
-    {"Station_Number": "2260120", "norm": 0.035810775, "date": "2020-04-17"},
-    {"Station_Number": "2260120", "norm": 0.035810775, "date": "2020-04-18"},
-    {"Station_Number": "2260120", "norm": 0.035810775, "date": "2020-04-19"},
-    {"Station_Number": "2260120", "norm": 0.035810775, "date": "2020-04-20"},
-    {"Station_Number": "2260120", "norm": 0.035810775, "date": "2020-04-21"},
-    {"Station_Number": "2260120", "norm": 0.0360226731, "date": "2020-04-22"},
-    {"Station_Number": "2260120", "norm": 0.0360226731, "date": "2020-04-23"},
-    {"Station_Number": "2260120", "norm": 0.0358637495, "date": "2020-04-24"},
-    {"Station_Number": "2260120", "norm": 0.0360226731, "date": "2020-04-25"},
-    {"Station_Number": "2260120", "norm": 0.0367113418, "date": "2020-04-26"},
-    {"Station_Number": "2260120", "norm": 0.0372940616, "date": "2020-04-27"},
-    {"Station_Number": "2260120", "norm": 0.0372940616, "date": "2020-04-28"},
-    {"Station_Number": "2260120", "norm": 0.0385124755, "date": "2020-04-29"},
-    {"Station_Number": "2260120", "norm": 0.039889813, "date": "2020-04-30"},
-    {"Station_Number": "2260120", "norm": 0.0417439212, "date": "2020-05-01"},
-    {"Station_Number": "2260120", "norm": 0.0434920803, "date": "2020-05-02"},
-    {"Station_Number": "2260120", "norm": 0.0448164433, "date": "2020-05-03"},
-    {"Station_Number": "2260120", "norm": 0.0457699846, "date": "2020-05-04"},
-    {"Station_Number": "2260120", "norm": 0.048047889, "date": "2020-05-05"},
-    {"Station_Number": "2260120", "norm": 0.0501668697, "date": "2020-05-06"},
-    {"Station_Number": "2260120", "norm": 0.0511204111, "date": "2020-05-07"},
-    {"Station_Number": "2260120", "norm": 0.0507495894, "date": "2020-05-08"},
-    {"Station_Number": "2260120", "norm": 0.0504847169, "date": "2020-05-09"},
-    {"Station_Number": "2260120", "norm": 0.0499549717, "date": "2020-05-10"},
-    {"Station_Number": "2260120", "norm": 0.0495311755, "date": "2020-05-11"},
-    {"Station_Number": "2260120", "norm": 0.0482068125, "date": "2020-05-12"},
-    {"Station_Number": "2260120", "norm": 0.0474121947, "date": "2020-05-13"},
-    {"Station_Number": "2260120", "norm": 0.0457170101, "date": "2020-05-14"},
-    {"Station_Number": "2260120", "norm": 0.0442866981, "date": "2020-05-15"},
-    {"Station_Number": "2260120", "norm": 0.0438629019, "date": "2020-05-16"},
-    {"Station_Number": "2260120", "norm": 0.0433331568, "date": "2020-05-17"},
-    {"Station_Number": "2260120", "norm": 0.042750437, "date": "2020-05-18"},
-    {"Station_Number": "2260120", "norm": 0.042644488, "date": "2020-05-19"},
-    {"Station_Number": "2260120", "norm": 0.0429093606, "date": "2020-05-20"},
-    {"Station_Number": "2260120", "norm": 0.042644488, "date": "2020-05-21"},
-    {"Station_Number": "2260120", "norm": 0.0422206918, "date": "2020-05-22"},
-    {"Station_Number": "2260120", "norm": 0.0440748, "date": "2020-05-23"},
-    {"Station_Number": "2260120", "norm": 0.0464586534, "date": "2020-05-24"},
-    {"Station_Number": "2260120", "norm": 0.048047889, "date": "2020-05-25"},
-    {"Station_Number": "2260120", "norm": 0.0487365577, "date": "2020-05-26"},
-    {"Station_Number": "2260120", "norm": 0.0491073794, "date": "2020-05-27"},
-    {"Station_Number": "2260120", "norm": 0.0503257933, "date": "2020-05-28"},
-    {"Station_Number": "2260120", "norm": 0.0530274938, "date": "2020-05-29"},
-    {"Station_Number": "2260120", "norm": 0.0574243789, "date": "2020-05-30"},
-    {"Station_Number": "2260120", "norm": 0.0634634741, "date": "2020-05-31"},
-    {"Station_Number": "2260120", "norm": 0.0707739577, "date": "2020-06-01"},
-    {"Station_Number": "2260120", "norm": 0.0807861419, "date": "2020-06-02"},
-    {"Station_Number": "2260120", "norm": 0.0973141919, "date": "2020-06-03"},
-    {"Station_Number": "2260120", "norm": 0.1022937967, "date": "2020-06-04"},
-    {"Station_Number": "2260120", "norm": 0.0992742491, "date": "2020-06-05"},
-    {"Station_Number": "2260120", "norm": 0.0917518674, "date": "2020-06-06"},
-    {"Station_Number": "2260120", "norm": 0.0876198548, "date": "2020-06-07"},
-    {"Station_Number": "2260120", "norm": 0.0832759443, "date": "2020-06-08"},
-    {"Station_Number": "2260120", "norm": 0.0835408169, "date": "2020-06-09"},
-    {"Station_Number": "2260120", "norm": 0.0862425173, "date": "2020-06-10"},
-    {"Station_Number": "2260120", "norm": 0.0898447847, "date": "2020-06-11"},
-    {"Station_Number": "2260120", "norm": 0.1011813318, "date": "2020-06-12"},
-    {"Station_Number": "2260120", "norm": 0.1062668856, "date": "2020-06-13"},
-    {"Station_Number": "2260120", "norm": 0.1185569741, "date": "2020-06-14"},
-    {"Station_Number": "2260120", "norm": 0.1250198654, "date": "2020-06-15"},
-    {"Station_Number": "2260120", "norm": 0.1285691582, "date": "2020-06-16"},
-    {"Station_Number": "2260120", "norm": 0.1426603804, "date": "2020-06-17"},
-    {"Station_Number": "2260120", "norm": 0.1745510409, "date": "2020-06-18"},
-    {"Station_Number": "2260120", "norm": 0.1938867405, "date": "2020-06-19"},
-    {"Station_Number": "2260120", "norm": 0.2075541664, "date": "2020-06-20"},
-    {"Station_Number": "2260120", "norm": 0.253112253, "date": "2020-06-21"},
-    {"Station_Number": "2260120", "norm": 0.3074641098, "date": "2020-06-22"},
-    {"Station_Number": "2260120", "norm": 0.3623986862, "date": "2020-06-23"},
-    {"Station_Number": "2260120", "norm": 0.4022355247, "date": "2020-06-24"},
-    {"Station_Number": "2260120", "norm": 0.445621656, "date": "2020-06-25"},
-    {"Station_Number": "2260120", "norm": 0.4785188324, "date": "2020-06-26"},
-    {"Station_Number": "2260120", "norm": 0.4701488584, "date": "2020-06-27"},
-    {"Station_Number": "2260120", "norm": 0.4559516872, "date": "2020-06-28"},
-    {"Station_Number": "2260120", "norm": 0.4440853949, "date": "2020-06-29"},
-    {"Station_Number": "2260120", "norm": 0.4248026699, "date": "2020-06-30"},
-    {"Station_Number": "2260120", "norm": 0.3927001112, "date": "2020-07-01"},
-    {"Station_Number": "2260120", "norm": 0.3711924564, "date": "2020-07-02"},
-    {"Station_Number": "2260120", "norm": 0.3678020872, "date": "2020-07-03"},
-    {"Station_Number": "2260120", "norm": 0.3726227684, "date": "2020-07-04"},
-    {"Station_Number": "2260120", "norm": 0.3827938761, "date": "2020-07-05"},
-    {"Station_Number": "2260120", "norm": 0.4143137151, "date": "2020-07-06"},
-    {"Station_Number": "2260120", "norm": 0.4252264661, "date": "2020-07-07"},
-    {"Station_Number": "2260120", "norm": 0.4528791651, "date": "2020-07-08"},
-    {"Station_Number": "2260120", "norm": 0.4827038195, "date": "2020-07-09"},
-    {"Station_Number": "2260120", "norm": 0.5197859829, "date": "2020-07-10"},
-    {"Station_Number": "2260120", "norm": 0.5622185729, "date": "2020-07-11"},
-    {"Station_Number": "2260120", "norm": 0.5911956349, "date": "2020-07-12"},
-    {"Station_Number": "2260120", "norm": 0.6155639138, "date": "2020-07-13"},
-    {"Station_Number": "2260120", "norm": 0.6388727022, "date": "2020-07-14"},
-    {"Station_Number": "2260120", "norm": 0.6408327594, "date": "2020-07-15"},
-    {"Station_Number": "2260120", "norm": 0.6567251152, "date": "2020-07-16"},
-    {"Station_Number": "2260120", "norm": 0.6848016104, "date": "2020-07-17"},
-    {"Station_Number": "2260120", "norm": 0.7312072893, "date": "2020-07-18"},
-    {"Station_Number": "2260120", "norm": 0.7612438417, "date": "2020-07-19"},
-    {"Station_Number": "2260120", "norm": 0.7850823754, "date": "2020-07-20"},
-    {"Station_Number": "2260120", "norm": 0.7872013561, "date": "2020-07-21"},
-    {"Station_Number": "2260120", "norm": 0.7751761403, "date": "2020-07-22"},
-    {"Station_Number": "2260120", "norm": 0.767600784, "date": "2020-07-23"},
-    {"Station_Number": "2260120", "norm": 0.7723684908, "date": "2020-07-24"},
-    {"Station_Number": "2260120", "norm": 0.7942469672, "date": "2020-07-25"},
-    {"Station_Number": "2260120", "norm": 0.8454733273, "date": "2020-07-26"},
-    {"Station_Number": "2260120", "norm": 0.8609948615, "date": "2020-07-27"},
-    {"Station_Number": "2260120", "norm": 0.8631138422, "date": "2020-07-28"},
-    {"Station_Number": "2260120", "norm": 0.8532605817, "date": "2020-07-29"},
-    {"Station_Number": "2260120", "norm": 0.8532605817, "date": "2020-07-30"},
-    {"Station_Number": "2260120", "norm": 0.8539492504, "date": "2020-07-31"},
-    {"Station_Number": "2260120", "norm": 0.827991736, "date": "2020-08-01"},
-    {"Station_Number": "2260120", "norm": 0.7783546114, "date": "2020-08-02"},
-    {"Station_Number": "2260120", "norm": 0.7388356201, "date": "2020-08-03"},
-    {"Station_Number": "2260120", "norm": 0.6593738412, "date": "2020-08-04"},
-    {"Station_Number": "2260120", "norm": 0.5758330243, "date": "2020-08-05"},
-    {"Station_Number": "2260120", "norm": 0.5276262118, "date": "2020-08-06"},
-    {"Station_Number": "2260120", "norm": 0.5606293373, "date": "2020-08-07"},
-    {"Station_Number": "2260120", "norm": 0.5689463368, "date": "2020-08-08"},
-    {"Station_Number": "2260120", "norm": 0.5211103459, "date": "2020-08-09"},
-    {"Station_Number": "2260120", "norm": 0.4611431901, "date": "2020-08-10"},
-    {"Station_Number": "2260120", "norm": 0.462043757, "date": "2020-08-11"},
-    {"Station_Number": "2260120", "norm": 0.50357578, "date": "2020-08-12"},
-    {"Station_Number": "2260120", "norm": 0.5815012979, "date": "2020-08-13"},
-    {"Station_Number": "2260120", "norm": 0.6355353075, "date": "2020-08-14"},
-    {"Station_Number": "2260120", "norm": 0.6759548657, "date": "2020-08-15"},
-    {"Station_Number": "2260120", "norm": 0.7103883032, "date": "2020-08-16"},
-    {"Station_Number": "2260120", "norm": 0.7420140912, "date": "2020-08-17"},
-    {"Station_Number": "2260120", "norm": 0.7741166499, "date": "2020-08-18"},
-    {"Station_Number": "2260120", "norm": 0.8027228903, "date": "2020-08-19"},
-    {"Station_Number": "2260120", "norm": 0.8304815384, "date": "2020-08-20"},
-    {"Station_Number": "2260120", "norm": 0.8744503894, "date": "2020-08-21"},
-    {"Station_Number": "2260120", "norm": 0.9325104625, "date": "2020-08-22"},
-    {"Station_Number": "2260120", "norm": 0.9826773322, "date": "2020-08-23"},
-    {"Station_Number": "2260120", "norm": 1.0, "date": "2020-08-24"},
-    {"Station_Number": "2260120", "norm": 0.9879747841, "date": "2020-08-25"},
-    {"Station_Number": "2260120", "norm": 0.9629178365, "date": "2020-08-26"},
-    {"Station_Number": "2260120", "norm": 0.9303914817, "date": "2020-08-27"},
-    {"Station_Number": "2260120", "norm": 0.8829263124, "date": "2020-08-28"},
-    {"Station_Number": "2260120", "norm": 0.8034645336, "date": "2020-08-29"},
-    {"Station_Number": "2260120", "norm": 0.6922180431, "date": "2020-08-30"},
-    {"Station_Number": "2260120", "norm": 0.5772633363, "date": "2020-08-31"},
-    {"Station_Number": "2260120", "norm": 0.4999205382, "date": "2020-09-01"},
-    {"Station_Number": "2260120", "norm": 0.4741219473, "date": "2020-09-02"},
-    {"Station_Number": "2260120", "norm": 0.4960533983, "date": "2020-09-03"},
-    {"Station_Number": "2260120", "norm": 0.5370027017, "date": "2020-09-04"},
-    {"Station_Number": "2260120", "norm": 0.5067012767, "date": "2020-09-05"},
-    {"Station_Number": "2260120", "norm": 0.4474757642, "date": "2020-09-06"},
-    {"Station_Number": "2260120", "norm": 0.3934417545, "date": "2020-09-07"},
-    {"Station_Number": "2260120", "norm": 0.3464533559, "date": "2020-09-08"},
-    {"Station_Number": "2260120", "norm": 0.3244159559, "date": "2020-09-09"},
-    {"Station_Number": "2260120", "norm": 0.3011071675, "date": "2020-09-10"},
-    {"Station_Number": "2260120", "norm": 0.2987762886, "date": "2020-09-11"},
-    {"Station_Number": "2260120", "norm": 0.298405467, "date": "2020-09-12"},
-    {"Station_Number": "2260120", "norm": 0.2952269958, "date": "2020-09-13"},
-    {"Station_Number": "2260120", "norm": 0.3201250199, "date": "2020-09-14"},
-    {"Station_Number": "2260120", "norm": 0.380939768, "date": "2020-09-15"},
-    {"Station_Number": "2260120", "norm": 0.4377814271, "date": "2020-09-16"},
-    {"Station_Number": "2260120", "norm": 0.4702548074, "date": "2020-09-17"},
-    {"Station_Number": "2260120", "norm": 0.496636118, "date": "2020-09-18"},
-    {"Station_Number": "2260120", "norm": 0.5206865498, "date": "2020-09-19"},
-    {"Station_Number": "2260120", "norm": 0.5246596387, "date": "2020-09-20"},
-    {"Station_Number": "2260120", "norm": 0.5177199767, "date": "2020-09-21"},
-    {"Station_Number": "2260120", "norm": 0.500609207, "date": "2020-09-22"},
-    {"Station_Number": "2260120", "norm": 0.5067012767, "date": "2020-09-23"},
-    {"Station_Number": "2260120", "norm": 0.5330825873, "date": "2020-09-24"},
-    {"Station_Number": "2260120", "norm": 0.5624304709, "date": "2020-09-25"},
-    {"Station_Number": "2260120", "norm": 0.5647083753, "date": "2020-09-26"},
-    {"Station_Number": "2260120", "norm": 0.5843089474, "date": "2020-09-27"},
-    {"Station_Number": "2260120", "norm": 0.6113259522, "date": "2020-09-28"},
-    {"Station_Number": "2260120", "norm": 0.6403030143, "date": "2020-09-29"},
-    {"Station_Number": "2260120", "norm": 0.6641415479, "date": "2020-09-30"},
-    {"Station_Number": "2260120", "norm": 0.6840599672, "date": "2020-10-01"},
-    {"Station_Number": "2260120", "norm": 0.7045611061, "date": "2020-10-02"},
-    {"Station_Number": "2260120", "norm": 0.71515601, "date": "2020-10-03"},
-    {"Station_Number": "2260120", "norm": 0.7389945436, "date": "2020-10-04"},
-    {"Station_Number": "2260120", "norm": 0.7345976585, "date": "2020-10-05"},
-    {"Station_Number": "2260120", "norm": 0.7031307941, "date": "2020-10-06"},
-    {"Station_Number": "2260120", "norm": 0.6595327647, "date": "2020-10-07"},
-    {"Station_Number": "2260120", "norm": 0.6416803518, "date": "2020-10-08"},
-    {"Station_Number": "2260120", "norm": 0.6028500291, "date": "2020-10-09"},
-    {"Station_Number": "2260120", "norm": 0.5784817503, "date": "2020-10-10"},
-    {"Station_Number": "2260120", "norm": 0.5691052604, "date": "2020-10-11"},
-    {"Station_Number": "2260120", "norm": 0.5327117656, "date": "2020-10-12"},
-    {"Station_Number": "2260120", "norm": 0.4812735074, "date": "2020-10-13"},
-    {"Station_Number": "2260120", "norm": 0.433278593, "date": "2020-10-14"},
-    {"Station_Number": "2260120", "norm": 0.3904751814, "date": "2020-10-15"},
-    {"Station_Number": "2260120", "norm": 0.3460825343, "date": "2020-10-16"},
-    {"Station_Number": "2260120", "norm": 0.3115961223, "date": "2020-10-17"},
-    {"Station_Number": "2260120", "norm": 0.2826190602, "date": "2020-10-18"},
-    {"Station_Number": "2260120", "norm": 0.2650315198, "date": "2020-10-19"},
-    {"Station_Number": "2260120", "norm": 0.2580388833, "date": "2020-10-20"},
-    {"Station_Number": "2260120", "norm": 0.2538009218, "date": "2020-10-21"},
-    {"Station_Number": "2260120", "norm": 0.2721830799, "date": "2020-10-22"},
-    {"Station_Number": "2260120", "norm": 0.2961275626, "date": "2020-10-23"},
-    {"Station_Number": "2260120", "norm": 0.3787148382, "date": "2020-10-24"},
-    {"Station_Number": "2260120", "norm": 0.5961222652, "date": "2020-10-25"},
-    {"Station_Number": "2260120", "norm": 0.7617735869, "date": "2020-10-26"},
-    {"Station_Number": "2260120", "norm": 0.8249721884, "date": "2020-10-27"},
-    {"Station_Number": "2260120", "norm": 0.858187212, "date": "2020-10-28"},
-    {"Station_Number": "2260120", "norm": 0.8624251735, "date": "2020-10-29"},
-    {"Station_Number": "2260120", "norm": 0.8445727605, "date": "2020-10-30"},
-    {"Station_Number": "2260120", "norm": 0.8120993802, "date": "2020-10-31"},
-    {"Station_Number": "2260120", "norm": 0.7531387403, "date": "2020-11-01"},
-    {"Station_Number": "2260120", "norm": 0.7059914181, "date": "2020-11-02"},
-    {"Station_Number": "2260120", "norm": 0.6662605287, "date": "2020-11-03"},
-    {"Station_Number": "2260120", "norm": 0.5980823224, "date": "2020-11-04"},
-    {"Station_Number": "2260120", "norm": 0.5645494517, "date": "2020-11-05"},
-    {"Station_Number": "2260120", "norm": 0.5336123325, "date": "2020-11-06"},
-    {"Station_Number": "2260120", "norm": 0.5051120411, "date": "2020-11-07"},
-    {"Station_Number": "2260120", "norm": 0.4584944642, "date": "2020-11-08"},
-    {"Station_Number": "2260120", "norm": 0.4130423266, "date": "2020-11-09"},
-    {"Station_Number": "2260120", "norm": 0.3715103035, "date": "2020-11-10"},
-    {"Station_Number": "2260120", "norm": 0.3284949939, "date": "2020-11-11"},
-    {"Station_Number": "2260120", "norm": 0.3031731737, "date": "2020-11-12"},
-    {"Station_Number": "2260120", "norm": 0.2704349208, "date": "2020-11-13"},
-    {"Station_Number": "2260120", "norm": 0.2482915718, "date": "2020-11-14"},
-    {"Station_Number": "2260120", "norm": 0.2307570059, "date": "2020-11-15"},
-    {"Station_Number": "2260120", "norm": 0.213116491, "date": "2020-11-16"},
-    {"Station_Number": "2260120", "norm": 0.202097791, "date": "2020-11-17"},
-    {"Station_Number": "2260120", "norm": 0.1912380145, "date": "2020-11-18"},
-    {"Station_Number": "2260120", "norm": 0.1835037347, "date": "2020-11-19"},
-    {"Station_Number": "2260120", "norm": 0.1809609578, "date": "2020-11-20"},
-    {"Station_Number": "2260120", "norm": 0.1771467924, "date": "2020-11-21"},
-    {"Station_Number": "2260120", "norm": 0.1709487736, "date": "2020-11-22"},
-    {"Station_Number": "2260120", "norm": 0.1657042962, "date": "2020-11-23"},
-    {"Station_Number": "2260120", "norm": 0.1615722837, "date": "2020-11-24"},
-    {"Station_Number": "2260120", "norm": 0.1570164751, "date": "2020-11-25"},
-    {"Station_Number": "2260120", "norm": 0.1518779467, "date": "2020-11-26"},
-    {"Station_Number": "2260120", "norm": 0.1481697304, "date": "2020-11-27"},
-    {"Station_Number": "2260120", "norm": 0.1449912592, "date": "2020-11-28"},
-    {"Station_Number": "2260120", "norm": 0.1409122212, "date": "2020-11-29"},
-    {"Station_Number": "2260120", "norm": 0.1377337501, "date": "2020-11-30"},
-    {"Station_Number": "2260120", "norm": 0.1334957885, "date": "2020-12-01"},
-    {"Station_Number": "2260120", "norm": 0.1303173174, "date": "2020-12-02"},
-    {"Station_Number": "2260120", "norm": 0.1275096678, "date": "2020-12-03"},
-    {"Station_Number": "2260120", "norm": 0.1244901203, "date": "2020-12-04"},
-    {"Station_Number": "2260120", "norm": 0.1223711395, "date": "2020-12-05"},
-    {"Station_Number": "2260120", "norm": 0.1193515919, "date": "2020-12-06"},
-    {"Station_Number": "2260120", "norm": 0.1174974837, "date": "2020-12-07"},
-    {"Station_Number": "2260120", "norm": 0.1159082481, "date": "2020-12-08"},
-    {"Station_Number": "2260120", "norm": 0.1141071145, "date": "2020-12-09"},
-    {"Station_Number": "2260120", "norm": 0.1113524395, "date": "2020-12-10"},
-    {"Station_Number": "2260120", "norm": 0.1088096626, "date": "2020-12-11"},
-    {"Station_Number": "2260120", "norm": 0.1071144779, "date": "2020-12-12"},
-    {"Station_Number": "2260120", "norm": 0.1054192933, "date": "2020-12-13"},
-    {"Station_Number": "2260120", "norm": 0.1039889813, "date": "2020-12-14"},
-    {"Station_Number": "2260120", "norm": 0.101922975, "date": "2020-12-15"},
-    {"Station_Number": "2260120", "norm": 0.1003337395, "date": "2020-12-16"},
-    {"Station_Number": "2260120", "norm": 0.097632039, "date": "2020-12-17"},
-    {"Station_Number": "2260120", "norm": 0.097737988, "date": "2020-12-18"},
-    {"Station_Number": "2260120", "norm": 0.0964665996, "date": "2020-12-19"},
-    {"Station_Number": "2260120", "norm": 0.0948243895, "date": "2020-12-20"},
-    {"Station_Number": "2260120", "norm": 0.0927054087, "date": "2020-12-21"},
-    {"Station_Number": "2260120", "norm": 0.0905864279, "date": "2020-12-22"},
-    {"Station_Number": "2260120", "norm": 0.089473963, "date": "2020-12-23"},
-    {"Station_Number": "2260120", "norm": 0.0887323198, "date": "2020-12-24"},
-    {"Station_Number": "2260120", "norm": 0.0879906765, "date": "2020-12-25"},
-    {"Station_Number": "2260120", "norm": 0.0868252371, "date": "2020-12-26"},
-    {"Station_Number": "2260120", "norm": 0.0850241034, "date": "2020-12-27"},
-    {"Station_Number": "2260120", "norm": 0.0835408169, "date": "2020-12-28"},
-    {"Station_Number": "2260120", "norm": 0.082428352, "date": "2020-12-29"},
-    {"Station_Number": "2260120", "norm": 0.0815807597, "date": "2020-12-30"},
-    {"Station_Number": "2260120", "norm": 0.0803093712, "date": "2020-12-31"},
-    {"Station_Number": "2260120", "norm": 0.0930563284, "date": "2021-01-01"},
-    {"Station_Number": "2260120", "norm": 0.0921288567, "date": "2021-01-02"},
-    {"Station_Number": "2260120", "norm": 0.0908922278, "date": "2021-01-03"},
-    {"Station_Number": "2260120", "norm": 0.0895937674, "date": "2021-01-04"},
-    {"Station_Number": "2260120", "norm": 0.0887899586, "date": "2021-01-05"},
-    {"Station_Number": "2260120", "norm": 0.0882334755, "date": "2021-01-06"},
-    {"Station_Number": "2260120", "norm": 0.0867495208, "date": "2021-01-07"},
-    {"Station_Number": "2260120", "norm": 0.0853273975, "date": "2021-01-08"},
-    {"Station_Number": "2260120", "norm": 0.0843999258, "date": "2021-01-09"},
-    {"Station_Number": "2260120", "norm": 0.0834106226, "date": "2021-01-10"},
-    {"Station_Number": "2260120", "norm": 0.0824831509, "date": "2021-01-11"},
-    {"Station_Number": "2260120", "norm": 0.0816793421, "date": "2021-01-12"},
-    {"Station_Number": "2260120", "norm": 0.0802572188, "date": "2021-01-13"},
-    {"Station_Number": "2260120", "norm": 0.0795152415, "date": "2021-01-14"},
-    {"Station_Number": "2260120", "norm": 0.0791442528, "date": "2021-01-15"},
-    {"Station_Number": "2260120", "norm": 0.0787732641, "date": "2021-01-16"},
-    {"Station_Number": "2260120", "norm": 0.0783404439, "date": "2021-01-17"},
-    {"Station_Number": "2260120", "norm": 0.0779694553, "date": "2021-01-18"},
-    {"Station_Number": "2260120", "norm": 0.0775984666, "date": "2021-01-19"},
-    {"Station_Number": "2260120", "norm": 0.0772893093, "date": "2021-01-20"},
-    {"Station_Number": "2260120", "norm": 0.0769183207, "date": "2021-01-21"},
-    {"Station_Number": "2260120", "norm": 0.0766091634, "date": "2021-01-22"},
-    {"Station_Number": "2260120", "norm": 0.0763618376, "date": "2021-01-23"},
-    {"Station_Number": "2260120", "norm": 0.0761145118, "date": "2021-01-24"},
-    {"Station_Number": "2260120", "norm": 0.0759290175, "date": "2021-01-25"},
-    {"Station_Number": "2260120", "norm": 0.0755580288, "date": "2021-01-26"},
-    {"Station_Number": "2260120", "norm": 0.0753725345, "date": "2021-01-27"},
-    {"Station_Number": "2260120", "norm": 0.0752488716, "date": "2021-01-28"},
-    {"Station_Number": "2260120", "norm": 0.0750015458, "date": "2021-01-29"},
-    {"Station_Number": "2260120", "norm": 0.0748778829, "date": "2021-01-30"},
-    {"Station_Number": "2260120", "norm": 0.0748778829, "date": "2021-01-31"},
-    {"Station_Number": "2260120", "norm": 0.0746923885, "date": "2021-02-01"},
-    {"Station_Number": "2260120", "norm": 0.074197737, "date": "2021-02-02"},
-    {"Station_Number": "2260120", "norm": 0.0732084338, "date": "2021-02-03"},
-    {"Station_Number": "2260120", "norm": 0.0721572992, "date": "2021-02-04"},
-    {"Station_Number": "2260120", "norm": 0.071167996, "date": "2021-02-05"},
-    {"Station_Number": "2260120", "norm": 0.0701168614, "date": "2021-02-06"},
-    {"Station_Number": "2260120", "norm": 0.0693130526, "date": "2021-02-07"},
-    {"Station_Number": "2260120", "norm": 0.0687565696, "date": "2021-02-08"},
-    {"Station_Number": "2260120", "norm": 0.0683237495, "date": "2021-02-09"},
-    {"Station_Number": "2260120", "norm": 0.0673962777, "date": "2021-02-10"},
-    {"Station_Number": "2260120", "norm": 0.0663451431, "date": "2021-02-11"},
-    {"Station_Number": "2260120", "norm": 0.0656649972, "date": "2021-02-12"},
-    {"Station_Number": "2260120", "norm": 0.0652940085, "date": "2021-02-13"},
-    {"Station_Number": "2260120", "norm": 0.0648611884, "date": "2021-02-14"},
-    {"Station_Number": "2260120", "norm": 0.0641810425, "date": "2021-02-15"},
-    {"Station_Number": "2260120", "norm": 0.063562728, "date": "2021-02-16"},
-    {"Station_Number": "2260120", "norm": 0.0631917393, "date": "2021-02-17"},
-    {"Station_Number": "2260120", "norm": 0.0628207506, "date": "2021-02-18"},
-    {"Station_Number": "2260120", "norm": 0.0624497619, "date": "2021-02-19"},
-    {"Station_Number": "2260120", "norm": 0.0621406047, "date": "2021-02-20"},
-    {"Station_Number": "2260120", "norm": 0.0615222902, "date": "2021-02-21"},
-    {"Station_Number": "2260120", "norm": 0.0609039758, "date": "2021-02-22"},
-    {"Station_Number": "2260120", "norm": 0.0601619984, "date": "2021-02-23"},
-    {"Station_Number": "2260120", "norm": 0.0595436839, "date": "2021-02-24"},
-    {"Station_Number": "2260120", "norm": 0.0590490323, "date": "2021-02-25"},
-    {"Station_Number": "2260120", "norm": 0.0586162122, "date": "2021-02-26"},
-    {"Station_Number": "2260120", "norm": 0.0581215606, "date": "2021-02-27"},
-    {"Station_Number": "2260120", "norm": 0.0578124034, "date": "2021-02-28"},
-    {"Station_Number": "2260120", "norm": 0.0575032462, "date": "2021-03-01"},
-    {"Station_Number": "2260120", "norm": 0.0571940889, "date": "2021-03-02"},
-    {"Station_Number": "2260120", "norm": 0.0568849317, "date": "2021-03-03"},
-    {"Station_Number": "2260120", "norm": 0.0564521115, "date": "2021-03-04"},
-    {"Station_Number": "2260120", "norm": 0.0558337971, "date": "2021-03-05"},
-    {"Station_Number": "2260120", "norm": 0.0552154826, "date": "2021-03-06"},
-    {"Station_Number": "2260120", "norm": 0.0545971681, "date": "2021-03-07"},
-    {"Station_Number": "2260120", "norm": 0.0540406851, "date": "2021-03-08"},
-    {"Station_Number": "2260120", "norm": 0.0535460335, "date": "2021-03-09"},
-    {"Station_Number": "2260120", "norm": 0.0531132134, "date": "2021-03-10"},
-    {"Station_Number": "2260120", "norm": 0.0528658876, "date": "2021-03-11"},
-    {"Station_Number": "2260120", "norm": 0.0526185618, "date": "2021-03-12"},
-    {"Station_Number": "2260120", "norm": 0.052371236, "date": "2021-03-13"},
-    {"Station_Number": "2260120", "norm": 0.0521239102, "date": "2021-03-14"},
-    {"Station_Number": "2260120", "norm": 0.0518765844, "date": "2021-03-15"},
-    {"Station_Number": "2260120", "norm": 0.0518765844, "date": "2021-03-16"},
-    {"Station_Number": "2260120", "norm": 0.0516292586, "date": "2021-03-17"},
-    {"Station_Number": "2260120", "norm": 0.0516292586, "date": "2021-03-18"},
-    {"Station_Number": "2260120", "norm": 0.0515055957, "date": "2021-03-19"},
-    {"Station_Number": "2260120", "norm": 0.0514437643, "date": "2021-03-20"},
-    {"Station_Number": "2260120", "norm": 0.0514437643, "date": "2021-03-21"},
-    {"Station_Number": "2260120", "norm": 0.0511346071, "date": "2021-03-22"},
-    {"Station_Number": "2260120", "norm": 0.0503307982, "date": "2021-03-23"},
-    {"Station_Number": "2260120", "norm": 0.049465158, "date": "2021-03-24"},
-    {"Station_Number": "2260120", "norm": 0.0484758548, "date": "2021-03-25"},
-    {"Station_Number": "2260120", "norm": 0.0475483831, "date": "2021-03-26"},
-    {"Station_Number": "2260120", "norm": 0.0471773944, "date": "2021-03-27"},
-    {"Station_Number": "2260120", "norm": 0.0465590799, "date": "2021-03-28"},
-    {"Station_Number": "2260120", "norm": 0.0461880913, "date": "2021-03-29"},
-    {"Station_Number": "2260120", "norm": 0.0457552711, "date": "2021-03-30"},
-    {"Station_Number": "2260120", "norm": 0.0455079453, "date": "2021-03-31"},
-    {"Station_Number": "2260120", "norm": 0.0451987881, "date": "2021-04-01"},
-    {"Station_Number": "2260120", "norm": 0.0447041365, "date": "2021-04-02"},
-    {"Station_Number": "2260120", "norm": 0.0445186422, "date": "2021-04-03"},
-    {"Station_Number": "2260120", "norm": 0.0443331478, "date": "2021-04-04"},
-    {"Station_Number": "2260120", "norm": 0.0440239906, "date": "2021-04-05"},
-    {"Station_Number": "2260120", "norm": 0.0438384963, "date": "2021-04-06"},
-    {"Station_Number": "2260120", "norm": 0.043529339, "date": "2021-04-07"},
-    {"Station_Number": "2260120", "norm": 0.0432820132, "date": "2021-04-08"},
-    {"Station_Number": "2260120", "norm": 0.0430965189, "date": "2021-04-09"},
-    {"Station_Number": "2260120", "norm": 0.0430346874, "date": "2021-04-10"},
-    {"Station_Number": "2260120", "norm": 0.0428491931, "date": "2021-04-11"},
-    {"Station_Number": "2260120", "norm": 0.0426018673, "date": "2021-04-12"},
-    {"Station_Number": "2260120", "norm": 0.0422927101, "date": "2021-04-13"},
-    {"Station_Number": "2260120", "norm": 0.0421072157, "date": "2021-04-14"},
-    {"Station_Number": "2260120", "norm": 0.0416125642, "date": "2021-04-15"},
-    {"Station_Number": "2260120", "norm": 0.0413652384, "date": "2021-04-16"},
-    {"Station_Number": "2260120", "norm": 0.0408705868, "date": "2021-04-17"},
-    {"Station_Number": "2260120", "norm": 0.040623261, "date": "2021-04-18"},
-    {"Station_Number": "2260120", "norm": 0.0403141038, "date": "2021-04-19"},
-    {"Station_Number": "2260120", "norm": 0.040066778, "date": "2021-04-20"},
-    {"Station_Number": "2260120", "norm": 0.0398194522, "date": "2021-04-21"},
-    {"Station_Number": "2260120", "norm": 0.0396339578, "date": "2021-04-22"},
-    {"Station_Number": "2260120", "norm": 0.0393248006, "date": "2021-04-23"},
-    {"Station_Number": "2260120", "norm": 0.0393248006, "date": "2021-04-24"},
-    {"Station_Number": "2260120", "norm": 0.0390156434, "date": "2021-04-25"},
-    {"Station_Number": "2260120", "norm": 0.0390156434, "date": "2021-04-26"},
-    {"Station_Number": "2260120", "norm": 0.038830149, "date": "2021-04-27"},
-    {"Station_Number": "2260120", "norm": 0.0387683176, "date": "2021-04-28"},
-    {"Station_Number": "2260120", "norm": 0.0387683176, "date": "2021-04-29"},
-    {"Station_Number": "2260120", "norm": 0.038273666, "date": "2021-04-30"},
-    {"Station_Number": "2260120", "norm": 0.0379645087, "date": "2021-05-01"},
-    {"Station_Number": "2260120", "norm": 0.0379645087, "date": "2021-05-02"},
-    {"Station_Number": "2260120", "norm": 0.0379645087, "date": "2021-05-03"},
-    {"Station_Number": "2260120", "norm": 0.037717183, "date": "2021-05-04"},
-    {"Station_Number": "2260120", "norm": 0.0374698572, "date": "2021-05-05"},
-    {"Station_Number": "2260120", "norm": 0.0383354974, "date": "2021-05-06"},
-    {"Station_Number": "2260120", "norm": 0.0402522723, "date": "2021-05-07"},
-    {"Station_Number": "2260120", "norm": 0.0407469239, "date": "2021-05-08"},
-    {"Station_Number": "2260120", "norm": 0.041736227, "date": "2021-05-09"},
-    {"Station_Number": "2260120", "norm": 0.0416125642, "date": "2021-05-10"},
-    {"Station_Number": "2260120", "norm": 0.0411179126, "date": "2021-05-11"},
-    {"Station_Number": "2260120", "norm": 0.040066778, "date": "2021-05-12"},
-    {"Station_Number": "2260120", "norm": 0.0413652384, "date": "2021-05-13"},
-    {"Station_Number": "2260120", "norm": 0.0418598899, "date": "2021-05-14"},
-    {"Station_Number": "2260120", "norm": 0.0422927101, "date": "2021-05-15"},
-    {"Station_Number": "2260120", "norm": 0.0420453843, "date": "2021-05-16"},
-    {"Station_Number": "2260120", "norm": 0.0420453843, "date": "2021-05-17"},
-    {"Station_Number": "2260120", "norm": 0.0418598899, "date": "2021-05-18"},
-    {"Station_Number": "2260120", "norm": 0.0422927101, "date": "2021-05-19"},
-    {"Station_Number": "2260120", "norm": 0.0422308786, "date": "2021-05-20"},
-    {"Station_Number": "2260120", "norm": 0.041736227, "date": "2021-05-21"},
-    {"Station_Number": "2260120", "norm": 0.0415507327, "date": "2021-05-22"},
-    {"Station_Number": "2260120", "norm": 0.0414889013, "date": "2021-05-23"},
-    {"Station_Number": "2260120", "norm": 0.0407469239, "date": "2021-05-24"},
-    {"Station_Number": "2260120", "norm": 0.0401286094, "date": "2021-05-25"},
-    {"Station_Number": "2260120", "norm": 0.0397576207, "date": "2021-05-26"},
-    {"Station_Number": "2260120", "norm": 0.0389538119, "date": "2021-05-27"},
-    {"Station_Number": "2260120", "norm": 0.0385209918, "date": "2021-05-28"},
-    {"Station_Number": "2260120", "norm": 0.0390156434, "date": "2021-05-29"},
-    {"Station_Number": "2260120", "norm": 0.0404995981, "date": "2021-05-30"},
-    {"Station_Number": "2260120", "norm": 0.0513201014, "date": "2021-05-31"},
-    {"Station_Number": "2260120", "norm": 0.0562666172, "date": "2021-06-01"},
-    {"Station_Number": "2260120", "norm": 0.0602238298, "date": "2021-06-02"},
-    {"Station_Number": "2260120", "norm": 0.0624497619, "date": "2021-06-03"},
-    {"Station_Number": "2260120", "norm": 0.0605329871, "date": "2021-06-04"},
-    {"Station_Number": "2260120", "norm": 0.0582452235, "date": "2021-06-05"},
-    {"Station_Number": "2260120", "norm": 0.0571940889, "date": "2021-06-06"},
-    {"Station_Number": "2260120", "norm": 0.0571940889, "date": "2021-06-07"},
-    {"Station_Number": "2260120", "norm": 0.0560811229, "date": "2021-06-08"},
-    {"Station_Number": "2260120", "norm": 0.0545353367, "date": "2021-06-09"},
-    {"Station_Number": "2260120", "norm": 0.0550299883, "date": "2021-06-10"},
-    {"Station_Number": "2260120", "norm": 0.059976504, "date": "2021-06-11"},
-    {"Station_Number": "2260120", "norm": 0.0981265071, "date": "2021-06-12"},
-    {"Station_Number": "2260120", "norm": 0.0913250479, "date": "2021-06-13"},
-    {"Station_Number": "2260120", "norm": 0.0908922278, "date": "2021-06-14"},
-    {"Station_Number": "2260120", "norm": 0.0952204291, "date": "2021-06-15"},
-    {"Station_Number": "2260120", "norm": 0.0910158907, "date": "2021-06-16"},
-    {"Station_Number": "2260120", "norm": 0.0882334755, "date": "2021-06-17"},
-    {"Station_Number": "2260120", "norm": 0.0903975762, "date": "2021-06-18"},
-    {"Station_Number": "2260120", "norm": 0.0923143511, "date": "2021-06-19"},
-    {"Station_Number": "2260120", "norm": 0.1035676745, "date": "2021-06-20"},
-    {"Station_Number": "2260120", "norm": 0.1092561677, "date": "2021-06-21"},
-    {"Station_Number": "2260120", "norm": 0.127125456, "date": "2021-06-22"},
-    {"Station_Number": "2260120", "norm": 0.1525381809, "date": "2021-06-23"},
-    {"Station_Number": "2260120", "norm": 0.161812898, "date": "2021-06-24"},
-    {"Station_Number": "2260120", "norm": 0.1550114388, "date": "2021-06-25"},
-    {"Station_Number": "2260120", "norm": 0.166512088, "date": "2021-06-26"},
-    {"Station_Number": "2260120", "norm": 0.1979842948, "date": "2021-06-27"},
-    {"Station_Number": "2260120", "norm": 0.2514066654, "date": "2021-06-28"},
-    {"Station_Number": "2260120", "norm": 0.2518394856, "date": "2021-06-29"},
-    {"Station_Number": "2260120", "norm": 0.2288381871, "date": "2021-06-30"},
-    {"Station_Number": "2260120", "norm": 0.2117108762, "date": "2021-07-01"},
-    {"Station_Number": "2260120", "norm": 0.1990972609, "date": "2021-07-02"},
-    {"Station_Number": "2260120", "norm": 0.1981697892, "date": "2021-07-03"},
-    {"Station_Number": "2260120", "norm": 0.1934087677, "date": "2021-07-04"},
-    {"Station_Number": "2260120", "norm": 0.200086564, "date": "2021-07-05"},
-    {"Station_Number": "2260120", "norm": 0.2924627466, "date": "2021-07-06"},
-    {"Station_Number": "2260120", "norm": 0.4006677796, "date": "2021-07-07"},
-    {"Station_Number": "2260120", "norm": 0.435540716, "date": "2021-07-08"},
-    {"Station_Number": "2260120", "norm": 0.434984233, "date": "2021-07-09"},
-    {"Station_Number": "2260120", "norm": 0.4389414456, "date": "2021-07-10"},
-    {"Station_Number": "2260120", "norm": 0.4309651889, "date": "2021-07-11"},
-    {"Station_Number": "2260120", "norm": 0.4093241823, "date": "2021-07-12"},
-    {"Station_Number": "2260120", "norm": 0.3998639708, "date": "2021-07-13"},
-    {"Station_Number": "2260120", "norm": 0.3717924937, "date": "2021-07-14"},
-    {"Station_Number": "2260120", "norm": 0.3323440302, "date": "2021-07-15"},
-    {"Station_Number": "2260120", "norm": 0.3040870587, "date": "2021-07-16"},
-    {"Station_Number": "2260120", "norm": 0.2894330056, "date": "2021-07-17"},
-    {"Station_Number": "2260120", "norm": 0.3152167192, "date": "2021-07-18"},
-    {"Station_Number": "2260120", "norm": 0.3118778211, "date": "2021-07-19"},
-    {"Station_Number": "2260120", "norm": 0.3189884375, "date": "2021-07-20"},
-    {"Station_Number": "2260120", "norm": 0.3365485686, "date": "2021-07-21"},
-    {"Station_Number": "2260120", "norm": 0.3583750696, "date": "2021-07-22"},
-    {"Station_Number": "2260120", "norm": 0.3641253942, "date": "2021-07-23"},
-    {"Station_Number": "2260120", "norm": 0.3641253942, "date": "2021-07-24"},
-    {"Station_Number": "2260120", "norm": 0.3740802572, "date": "2021-07-25"},
-    {"Station_Number": "2260120", "norm": 0.3769245038, "date": "2021-07-26"},
-    {"Station_Number": "2260120", "norm": 0.3338898164, "date": "2021-07-27"},
-    {"Station_Number": "2260120", "norm": 0.310208372, "date": "2021-07-28"},
-    {"Station_Number": "2260120", "norm": 0.3684535955, "date": "2021-07-29"},
-    {"Station_Number": "2260120", "norm": 0.4525443641, "date": "2021-07-30"},
-    {"Station_Number": "2260120", "norm": 0.4674457429, "date": "2021-07-31"},
-    {"Station_Number": "2260120", "norm": 0.4624992271, "date": "2021-08-01"},
-    {"Station_Number": "2260120", "norm": 0.4571198912, "date": "2021-08-02"},
-    {"Station_Number": "2260120", "norm": 0.5280405614, "date": "2021-08-03"},
-    {"Station_Number": "2260120", "norm": 0.6364310889, "date": "2021-08-04"},
-    {"Station_Number": "2260120", "norm": 0.6906572683, "date": "2021-08-05"},
-    {"Station_Number": "2260120", "norm": 0.6801459222, "date": "2021-08-06"},
-    {"Station_Number": "2260120", "norm": 0.6467569406, "date": "2021-08-07"},
-    {"Station_Number": "2260120", "norm": 0.5937673901, "date": "2021-08-08"},
-    {"Station_Number": "2260120", "norm": 0.537933593, "date": "2021-08-09"},
-    {"Station_Number": "2260120", "norm": 0.4968156805, "date": "2021-08-10"},
-    {"Station_Number": "2260120", "norm": 0.464972485, "date": "2021-08-11"},
-    {"Station_Number": "2260120", "norm": 0.4124775861, "date": "2021-08-12"},
-    {"Station_Number": "2260120", "norm": 0.3853954121, "date": "2021-08-13"},
-    {"Station_Number": "2260120", "norm": 0.3796450875, "date": "2021-08-14"},
-    {"Station_Number": "2260120", "norm": 0.3895381191, "date": "2021-08-15"},
-    {"Station_Number": "2260120", "norm": 0.4065417671, "date": "2021-08-16"},
-    {"Station_Number": "2260120", "norm": 0.4839547394, "date": "2021-08-17"},
-    {"Station_Number": "2260120", "norm": 0.5694057998, "date": "2021-08-18"},
-    {"Station_Number": "2260120", "norm": 0.6607926792, "date": "2021-08-19"},
-    {"Station_Number": "2260120", "norm": 0.768132072, "date": "2021-08-20"},
-    {"Station_Number": "2260120", "norm": 0.7910097075, "date": "2021-08-21"},
-    {"Station_Number": "2260120", "norm": 0.8198849935, "date": "2021-08-22"},
-    {"Station_Number": "2260120", "norm": 0.8530884808, "date": "2021-08-23"},
-    {"Station_Number": "2260120", "norm": 0.8747294874, "date": "2021-08-24"},
-    {"Station_Number": "2260120", "norm": 0.8928461015, "date": "2021-08-25"},
-    {"Station_Number": "2260120", "norm": 0.897607123, "date": "2021-08-26"},
-    {"Station_Number": "2260120", "norm": 0.8878995857, "date": "2021-08-27"},
-    {"Station_Number": "2260120", "norm": 0.9707537253, "date": "2021-08-28"},
-    {"Station_Number": "2260120", "norm": 1.0, "date": "2021-08-29"},
-    {"Station_Number": "2260120", "norm": 0.9486798986, "date": "2021-08-30"},
-    {"Station_Number": "2260120", "norm": 0.9196191183, "date": "2021-08-31"},
-    {"Station_Number": "2260120", "norm": 0.8843751932, "date": "2021-09-01"},
-    {"Station_Number": "2260120", "norm": 0.8404748655, "date": "2021-09-02"},
-    {"Station_Number": "2260120", "norm": 0.7780251036, "date": "2021-09-03"},
-    {"Station_Number": "2260120", "norm": 0.6986953565, "date": "2021-09-04"},
-    {"Station_Number": "2260120", "norm": 0.6140481049, "date": "2021-09-05"},
-    {"Station_Number": "2260120", "norm": 0.5371916157, "date": "2021-09-06"},
-    {"Station_Number": "2260120", "norm": 0.4857478514, "date": "2021-09-07"},
-    {"Station_Number": "2260120", "norm": 0.4744326965, "date": "2021-09-08"},
-    {"Station_Number": "2260120", "norm": 0.4447536017, "date": "2021-09-09"},
-    {"Station_Number": "2260120", "norm": 0.4114264515, "date": "2021-09-10"},
-    {"Station_Number": "2260120", "norm": 0.3973907129, "date": "2021-09-11"},
-    {"Station_Number": "2260120", "norm": 0.4315216719, "date": "2021-09-12"},
-    {"Station_Number": "2260120", "norm": 0.436097199, "date": "2021-09-13"},
-    {"Station_Number": "2260120", "norm": 0.3981945217, "date": "2021-09-14"},
-    {"Station_Number": "2260120", "norm": 0.366042169, "date": "2021-09-15"},
-    {"Station_Number": "2260120", "norm": 0.346688926, "date": "2021-09-16"},
-    {"Station_Number": "2260120", "norm": 0.3394546466, "date": "2021-09-17"},
-    {"Station_Number": "2260120", "norm": 0.370184876, "date": "2021-09-18"},
-    {"Station_Number": "2260120", "norm": 0.3895381191, "date": "2021-09-19"},
-    {"Station_Number": "2260120", "norm": 0.4390032771, "date": "2021-09-20"},
-    {"Station_Number": "2260120", "norm": 0.4839547394, "date": "2021-09-21"},
-    {"Station_Number": "2260120", "norm": 0.4885302665, "date": "2021-09-22"},
-    {"Station_Number": "2260120", "norm": 0.4682495517, "date": "2021-09-23"},
-    {"Station_Number": "2260120", "norm": 0.4567489025, "date": "2021-09-24"},
-    {"Station_Number": "2260120", "norm": 0.4788845607, "date": "2021-09-25"},
-    {"Station_Number": "2260120", "norm": 0.4633030359, "date": "2021-09-26"},
-    {"Station_Number": "2260120", "norm": 0.4023372287, "date": "2021-09-27"},
-    {"Station_Number": "2260120", "norm": 0.3562109689, "date": "2021-09-28"},
-    {"Station_Number": "2260120", "norm": 0.3800779076, "date": "2021-09-29"},
-    {"Station_Number": "2260120", "norm": 0.3779756384, "date": "2021-09-30"},
-    {"Station_Number": "2260120", "norm": 0.3604155073, "date": "2021-10-01"},
-    {"Station_Number": "2260120", "norm": 0.3256044024, "date": "2021-10-02"},
-    {"Station_Number": "2260120", "norm": 0.2969146108, "date": "2021-10-03"},
-    {"Station_Number": "2260120", "norm": 0.2519631485, "date": "2021-10-04"},
-    {"Station_Number": "2260120", "norm": 0.2461509924, "date": "2021-10-05"},
-    {"Station_Number": "2260120", "norm": 0.2590119335, "date": "2021-10-06"},
-    {"Station_Number": "2260120", "norm": 0.2621035058, "date": "2021-10-07"},
-    {"Station_Number": "2260120", "norm": 0.2506646881, "date": "2021-10-08"},
-    {"Station_Number": "2260120", "norm": 0.2421937798, "date": "2021-10-09"},
-    {"Station_Number": "2260120", "norm": 0.2366907809, "date": "2021-10-10"},
-    {"Station_Number": "2260120", "norm": 0.2230878625, "date": "2021-10-11"},
-    {"Station_Number": "2260120", "norm": 0.2109688988, "date": "2021-10-12"},
-    {"Station_Number": "2260120", "norm": 0.2075063377, "date": "2021-10-13"},
-    {"Station_Number": "2260120", "norm": 0.2070116861, "date": "2021-10-14"},
-    {"Station_Number": "2260120", "norm": 0.2021888332, "date": "2021-10-15"},
-    {"Station_Number": "2260120", "norm": 0.2041056081, "date": "2021-10-16"},
-    {"Station_Number": "2260120", "norm": 0.2134421567, "date": "2021-10-17"},
-    {"Station_Number": "2260120", "norm": 0.2141841341, "date": "2021-10-18"},
-    {"Station_Number": "2260120", "norm": 0.2352686576, "date": "2021-10-19"},
-    {"Station_Number": "2260120", "norm": 0.2672973474, "date": "2021-10-20"},
-    {"Station_Number": "2260120", "norm": 0.3278303345, "date": "2021-10-21"},
-    {"Station_Number": "2260120", "norm": 0.3286341433, "date": "2021-10-22"},
-    {"Station_Number": "2260120", "norm": 0.2620416744, "date": "2021-10-23"},
-    {"Station_Number": "2260120", "norm": 0.2218512335, "date": "2021-10-24"},
-    {"Station_Number": "2260120", "norm": 0.2109688988, "date": "2021-10-25"},
-    {"Station_Number": "2260120", "norm": 0.2349595004, "date": "2021-10-26"},
-    {"Station_Number": "2260120", "norm": 0.2722438632, "date": "2021-10-27"},
-    {"Station_Number": "2260120", "norm": 0.283682681, "date": "2021-10-28"},
-    {"Station_Number": "2260120", "norm": 0.274840784, "date": "2021-10-29"},
-    {"Station_Number": "2260120", "norm": 0.2507265195, "date": "2021-10-30"},
-    {"Station_Number": "2260120", "norm": 0.2272924009, "date": "2021-10-31"},
-    {"Station_Number": "2260120", "norm": 0.202436159, "date": "2021-11-01"},
-    {"Station_Number": "2260120", "norm": 0.1855561739, "date": "2021-11-02"},
-    {"Station_Number": "2260120", "norm": 0.1731280529, "date": "2021-11-03"},
-    {"Station_Number": "2260120", "norm": 0.1667594138, "date": "2021-11-04"},
-    {"Station_Number": "2260120", "norm": 0.1628022012, "date": "2021-11-05"},
-    {"Station_Number": "2260120", "norm": 0.1498175972, "date": "2021-11-06"},
-    {"Station_Number": "2260120", "norm": 0.1423978235, "date": "2021-11-07"},
-    {"Station_Number": "2260120", "norm": 0.1381932851, "date": "2021-11-08"},
-    {"Station_Number": "2260120", "norm": 0.1352872071, "date": "2021-11-09"},
-    {"Station_Number": "2260120", "norm": 0.1302170284, "date": "2021-11-10"},
-    {"Station_Number": "2260120", "norm": 0.1277437705, "date": "2021-11-11"},
-    {"Station_Number": "2260120", "norm": 0.1255178384, "date": "2021-11-12"},
-    {"Station_Number": "2260120", "norm": 0.1247140296, "date": "2021-11-13"},
-    {"Station_Number": "2260120", "norm": 0.1235392321, "date": "2021-11-14"},
-    {"Station_Number": "2260120", "norm": 0.1222407717, "date": "2021-11-15"},
-    {"Station_Number": "2260120", "norm": 0.1228590861, "date": "2021-11-16"},
-    {"Station_Number": "2260120", "norm": 0.1281765906, "date": "2021-11-17"},
-    {"Station_Number": "2260120", "norm": 0.1516725407, "date": "2021-11-18"},
-    {"Station_Number": "2260120", "norm": 0.1570518766, "date": "2021-11-19"},
-    {"Station_Number": "2260120", "norm": 0.1433252952, "date": "2021-11-20"},
-    {"Station_Number": "2260120", "norm": 0.1366474989, "date": "2021-11-21"},
-    {"Station_Number": "2260120", "norm": 0.1329376121, "date": "2021-11-22"},
-    {"Station_Number": "2260120", "norm": 0.1321956347, "date": "2021-11-23"},
-    {"Station_Number": "2260120", "norm": 0.1277437705, "date": "2021-11-24"},
-    {"Station_Number": "2260120", "norm": 0.1270017931, "date": "2021-11-25"},
-    {"Station_Number": "2260120", "norm": 0.1252086811, "date": "2021-11-26"},
-    {"Station_Number": "2260120", "norm": 0.1245285352, "date": "2021-11-27"},
-    {"Station_Number": "2260120", "norm": 0.1240338836, "date": "2021-11-28"},
-    {"Station_Number": "2260120", "norm": 0.1230445805, "date": "2021-11-29"},
-    {"Station_Number": "2260120", "norm": 0.1227354232, "date": "2021-11-30"},
-    {"Station_Number": "2260120", "norm": 0.1220552773, "date": "2021-12-01"},
-    {"Station_Number": "2260120", "norm": 0.1212514685, "date": "2021-12-02"},
-    {"Station_Number": "2260120", "norm": 0.1210659742, "date": "2021-12-03"},
-    {"Station_Number": "2260120", "norm": 0.1205713226, "date": "2021-12-04"},
-    {"Station_Number": "2260120", "norm": 0.1201385024, "date": "2021-12-05"},
-    {"Station_Number": "2260120", "norm": 0.1201385024, "date": "2021-12-06"},
-    {"Station_Number": "2260120", "norm": 0.1201385024, "date": "2021-12-07"},
-    {"Station_Number": "2260120", "norm": 0.1193965251, "date": "2021-12-08"},
-    {"Station_Number": "2260120", "norm": 0.1195820194, "date": "2021-12-09"},
-    {"Station_Number": "2260120", "norm": 0.1197056823, "date": "2021-12-10"},
-    {"Station_Number": "2260120", "norm": 0.1195820194, "date": "2021-12-11"},
-    {"Station_Number": "2260120", "norm": 0.1178507389, "date": "2021-12-12"},
-    {"Station_Number": "2260120", "norm": 0.1154393124, "date": "2021-12-13"},
-    {"Station_Number": "2260120", "norm": 0.1127805602, "date": "2021-12-14"},
-    {"Station_Number": "2260120", "norm": 0.1099981451, "date": "2021-12-15"},
-    {"Station_Number": "2260120", "norm": 0.1069684041, "date": "2021-12-16"},
-    {"Station_Number": "2260120", "norm": 0.1048661349, "date": "2021-12-17"},
-    {"Station_Number": "2260120", "norm": 0.1035058431, "date": "2021-12-18"},
-    {"Station_Number": "2260120", "norm": 0.1007852594, "date": "2021-12-19"},
-    {"Station_Number": "2260120", "norm": 0.0971990354, "date": "2021-12-20"},
-    {"Station_Number": "2260120", "norm": 0.0937364744, "date": "2021-12-21"},
-    {"Station_Number": "2260120", "norm": 0.0913250479, "date": "2021-12-22"},
-    {"Station_Number": "2260120", "norm": 0.0893464416, "date": "2021-12-23"},
-    {"Station_Number": "2260120", "norm": 0.087058678, "date": "2021-12-24"},
-    {"Station_Number": "2260120", "norm": 0.0849564088, "date": "2021-12-25"},
-    {"Station_Number": "2260120", "norm": 0.0831014654, "date": "2021-12-26"},
-    {"Station_Number": "2260120", "norm": 0.0810610276, "date": "2021-12-27"},
-    {"Station_Number": "2260120", "norm": 0.0795152415, "date": "2021-12-28"},
-    {"Station_Number": "2260120", "norm": 0.0779694553, "date": "2021-12-29"},
-    {"Station_Number": "2260120", "norm": 0.0769183207, "date": "2021-12-30"},
-    {"Station_Number": "2260120", "norm": 0.0755580288, "date": "2021-12-31"},
-    {"Station_Number": "2260120", "norm": 0.1092153285, "date": "2022-01-01"},
-    {"Station_Number": "2260120", "norm": 0.1070255474, "date": "2022-01-02"},
-    {"Station_Number": "2260120", "norm": 0.1054744526, "date": "2022-01-03"},
-    {"Station_Number": "2260120", "norm": 0.1042883212, "date": "2022-01-04"},
-    {"Station_Number": "2260120", "norm": 0.1032846715, "date": "2022-01-05"},
-    {"Station_Number": "2260120", "norm": 0.1022810219, "date": "2022-01-06"},
-    {"Station_Number": "2260120", "norm": 0.1012773723, "date": "2022-01-07"},
-    {"Station_Number": "2260120", "norm": 0.1002737226, "date": "2022-01-08"},
-    {"Station_Number": "2260120", "norm": 0.0994525547, "date": "2022-01-09"},
-    {"Station_Number": "2260120", "norm": 0.0989051095, "date": "2022-01-10"},
-    {"Station_Number": "2260120", "norm": 0.0989051095, "date": "2022-01-11"},
-    {"Station_Number": "2260120", "norm": 0.0984489051, "date": "2022-01-12"},
-    {"Station_Number": "2260120", "norm": 0.0980839416, "date": "2022-01-13"},
-    {"Station_Number": "2260120", "norm": 0.0977189781, "date": "2022-01-14"},
-    {"Station_Number": "2260120", "norm": 0.0972627737, "date": "2022-01-15"},
-    {"Station_Number": "2260120", "norm": 0.0968978102, "date": "2022-01-16"},
-    {"Station_Number": "2260120", "norm": 0.0968978102, "date": "2022-01-17"},
-    {"Station_Number": "2260120", "norm": 0.096350365, "date": "2022-01-18"},
-    {"Station_Number": "2260120", "norm": 0.096350365, "date": "2022-01-19"},
-    {"Station_Number": "2260120", "norm": 0.0958941606, "date": "2022-01-20"},
-    {"Station_Number": "2260120", "norm": 0.0953467153, "date": "2022-01-21"},
-    {"Station_Number": "2260120", "norm": 0.0953467153, "date": "2022-01-22"},
-    {"Station_Number": "2260120", "norm": 0.0948905109, "date": "2022-01-23"},
-    {"Station_Number": "2260120", "norm": 0.0948905109, "date": "2022-01-24"},
-    {"Station_Number": "2260120", "norm": 0.0948905109, "date": "2022-01-25"},
-    {"Station_Number": "2260120", "norm": 0.0948905109, "date": "2022-01-26"},
-    {"Station_Number": "2260120", "norm": 0.0943430657, "date": "2022-01-27"},
-    {"Station_Number": "2260120", "norm": 0.0943430657, "date": "2022-01-28"},
-    {"Station_Number": "2260120", "norm": 0.0943430657, "date": "2022-01-29"},
-    {"Station_Number": "2260120", "norm": 0.0943430657, "date": "2022-01-30"},
-    {"Station_Number": "2260120", "norm": 0.0943430657, "date": "2022-01-31"},
-    {"Station_Number": "2260120", "norm": 0.0939781022, "date": "2022-02-01"},
-    {"Station_Number": "2260120", "norm": 0.0937956204, "date": "2022-02-02"},
-    {"Station_Number": "2260120", "norm": 0.0937956204, "date": "2022-02-03"},
-    {"Station_Number": "2260120", "norm": 0.0932481752, "date": "2022-02-04"},
-    {"Station_Number": "2260120", "norm": 0.0932481752, "date": "2022-02-05"},
-    {"Station_Number": "2260120", "norm": 0.0932481752, "date": "2022-02-06"},
-    {"Station_Number": "2260120", "norm": 0.0932481752, "date": "2022-02-07"},
-    {"Station_Number": "2260120", "norm": 0.0927007299, "date": "2022-02-08"},
-    {"Station_Number": "2260120", "norm": 0.0927007299, "date": "2022-02-09"},
-    {"Station_Number": "2260120", "norm": 0.0921532847, "date": "2022-02-10"},
-    {"Station_Number": "2260120", "norm": 0.0921532847, "date": "2022-02-11"},
-    {"Station_Number": "2260120", "norm": 0.0916970803, "date": "2022-02-12"},
-    {"Station_Number": "2260120", "norm": 0.0921532847, "date": "2022-02-13"},
-    {"Station_Number": "2260120", "norm": 0.0927007299, "date": "2022-02-14"},
-    {"Station_Number": "2260120", "norm": 0.0925182482, "date": "2022-02-15"},
-    {"Station_Number": "2260120", "norm": 0.0932481752, "date": "2022-02-16"},
-    {"Station_Number": "2260120", "norm": 0.0932481752, "date": "2022-02-17"},
-    {"Station_Number": "2260120", "norm": 0.0927007299, "date": "2022-02-18"},
-    {"Station_Number": "2260120", "norm": 0.0923357664, "date": "2022-02-19"},
-    {"Station_Number": "2260120", "norm": 0.0902372263, "date": "2022-02-20"},
-    {"Station_Number": "2260120", "norm": 0.0885036496, "date": "2022-02-21"},
-    {"Station_Number": "2260120", "norm": 0.0868613139, "date": "2022-02-22"},
-    {"Station_Number": "2260120", "norm": 0.0862226277, "date": "2022-02-23"},
-    {"Station_Number": "2260120", "norm": 0.0862226277, "date": "2022-02-24"},
-    {"Station_Number": "2260120", "norm": 0.0854927007, "date": "2022-02-25"},
-    {"Station_Number": "2260120", "norm": 0.0848540146, "date": "2022-02-26"},
-    {"Station_Number": "2260120", "norm": 0.0834854015, "date": "2022-02-27"},
-    {"Station_Number": "2260120", "norm": 0.0830291971, "date": "2022-02-28"},
-    {"Station_Number": "2260120", "norm": 0.0828467153, "date": "2022-03-01"},
-    {"Station_Number": "2260120", "norm": 0.0823905109, "date": "2022-03-02"},
-    {"Station_Number": "2260120", "norm": 0.0816605839, "date": "2022-03-03"},
-    {"Station_Number": "2260120", "norm": 0.0813868613, "date": "2022-03-04"},
-    {"Station_Number": "2260120", "norm": 0.0812043796, "date": "2022-03-05"},
-    {"Station_Number": "2260120", "norm": 0.0809306569, "date": "2022-03-06"},
-    {"Station_Number": "2260120", "norm": 0.0807481752, "date": "2022-03-07"},
-    {"Station_Number": "2260120", "norm": 0.0807481752, "date": "2022-03-08"},
-    {"Station_Number": "2260120", "norm": 0.0807481752, "date": "2022-03-09"},
-    {"Station_Number": "2260120", "norm": 0.0807481752, "date": "2022-03-10"},
-    {"Station_Number": "2260120", "norm": 0.0804744526, "date": "2022-03-11"},
-    {"Station_Number": "2260120", "norm": 0.0802919708, "date": "2022-03-12"},
-    {"Station_Number": "2260120", "norm": 0.0800182482, "date": "2022-03-13"},
-    {"Station_Number": "2260120", "norm": 0.0798357664, "date": "2022-03-14"},
-    {"Station_Number": "2260120", "norm": 0.0794708029, "date": "2022-03-15"},
-    {"Station_Number": "2260120", "norm": 0.0788321168, "date": "2022-03-16"},
-    {"Station_Number": "2260120", "norm": 0.0783759124, "date": "2022-03-17"},
-    {"Station_Number": "2260120", "norm": 0.0780109489, "date": "2022-03-18"},
-    {"Station_Number": "2260120", "norm": 0.0773722628, "date": "2022-03-19"},
-    {"Station_Number": "2260120", "norm": 0.0769160584, "date": "2022-03-20"},
-    {"Station_Number": "2260120", "norm": 0.0762773723, "date": "2022-03-21"},
-    {"Station_Number": "2260120", "norm": 0.0759124088, "date": "2022-03-22"},
-    {"Station_Number": "2260120", "norm": 0.0755474453, "date": "2022-03-23"},
-    {"Station_Number": "2260120", "norm": 0.0755474453, "date": "2022-03-24"},
-    {"Station_Number": "2260120", "norm": 0.075, "date": "2022-03-25"},
-    {"Station_Number": "2260120", "norm": 0.0747262774, "date": "2022-03-26"},
-    {"Station_Number": "2260120", "norm": 0.0741788321, "date": "2022-03-27"},
-    {"Station_Number": "2260120", "norm": 0.0736313869, "date": "2022-03-28"},
-    {"Station_Number": "2260120", "norm": 0.0733576642, "date": "2022-03-29"},
-    {"Station_Number": "2260120", "norm": 0.0729927007, "date": "2022-03-30"},
-    {"Station_Number": "2260120", "norm": 0.0729927007, "date": "2022-03-31"},
-    {"Station_Number": "2260120", "norm": 0.0729927007, "date": "2022-04-01"},
-    {"Station_Number": "2260120", "norm": 0.073540146, "date": "2022-04-02"},
-    {"Station_Number": "2260120", "norm": 0.0743613139, "date": "2022-04-03"},
-    {"Station_Number": "2260120", "norm": 0.0749087591, "date": "2022-04-04"},
-    {"Station_Number": "2260120", "norm": 0.0751824818, "date": "2022-04-05"},
-    {"Station_Number": "2260120", "norm": 0.0752737226, "date": "2022-04-06"},
-    {"Station_Number": "2260120", "norm": 0.0752737226, "date": "2022-04-07"},
-    {"Station_Number": "2260120", "norm": 0.0758211679, "date": "2022-04-08"},
-    {"Station_Number": "2260120", "norm": 0.0761861314, "date": "2022-04-09"},
-    {"Station_Number": "2260120", "norm": 0.0761861314, "date": "2022-04-10"},
-    {"Station_Number": "2260120", "norm": 0.0759124088, "date": "2022-04-11"},
-    {"Station_Number": "2260120", "norm": 0.0759124088, "date": "2022-04-12"},
-    {"Station_Number": "2260120", "norm": 0.0765510949, "date": "2022-04-13"},
-    {"Station_Number": "2260120", "norm": 0.0796532847, "date": "2022-04-14"},
-    {"Station_Number": "2260120", "norm": 0.0843978102, "date": "2022-04-15"},
-    {"Station_Number": "2260120", "norm": 0.0883211679, "date": "2022-04-16"},
-    {"Station_Number": "2260120", "norm": 0.089689781, "date": "2022-04-17"},
-    {"Station_Number": "2260120", "norm": 0.0900547445, "date": "2022-04-18"},
-    {"Station_Number": "2260120", "norm": 0.0900547445, "date": "2022-04-19"},
-    {"Station_Number": "2260120", "norm": 0.091149635, "date": "2022-04-20"},
-    {"Station_Number": "2260120", "norm": 0.0921532847, "date": "2022-04-21"},
-    {"Station_Number": "2260120", "norm": 0.0936131387, "date": "2022-04-22"},
-    {"Station_Number": "2260120", "norm": 0.0996350365, "date": "2022-04-23"},
-    {"Station_Number": "2260120", "norm": 0.1083029197, "date": "2022-04-24"},
-    {"Station_Number": "2260120", "norm": 0.1128649635, "date": "2022-04-25"},
-    {"Station_Number": "2260120", "norm": 0.1121350365, "date": "2022-04-26"},
-    {"Station_Number": "2260120", "norm": 0.1084854015, "date": "2022-04-27"},
-    {"Station_Number": "2260120", "norm": 0.1066605839, "date": "2022-04-28"},
-    {"Station_Number": "2260120", "norm": 0.1074817518, "date": "2022-04-29"},
-    {"Station_Number": "2260120", "norm": 0.1100364964, "date": "2022-04-30"},
-    {"Station_Number": "2260120", "norm": 0.1074817518, "date": "2022-05-01"},
-    {"Station_Number": "2260120", "norm": 0.1024635036, "date": "2022-05-02"},
-    {"Station_Number": "2260120", "norm": 0.1, "date": "2022-05-03"},
-    {"Station_Number": "2260120", "norm": 0.0984489051, "date": "2022-05-04"},
-    {"Station_Number": "2260120", "norm": 0.0980839416, "date": "2022-05-05"},
-    {"Station_Number": "2260120", "norm": 0.0968978102, "date": "2022-05-06"},
-    {"Station_Number": "2260120", "norm": 0.0953467153, "date": "2022-05-07"},
-    {"Station_Number": "2260120", "norm": 0.096350365, "date": "2022-05-08"},
-    {"Station_Number": "2260120", "norm": 0.0984489051, "date": "2022-05-09"},
-    {"Station_Number": "2260120", "norm": 0.1063868613, "date": "2022-05-10"},
-    {"Station_Number": "2260120", "norm": 0.1246350365, "date": "2022-05-11"},
-    {"Station_Number": "2260120", "norm": 0.1464416058, "date": "2022-05-12"},
-    {"Station_Number": "2260120", "norm": 0.1541058394, "date": "2022-05-13"},
-    {"Station_Number": "2260120", "norm": 0.1532846715, "date": "2022-05-14"},
-    {"Station_Number": "2260120", "norm": 0.1449817518, "date": "2022-05-15"},
-    {"Station_Number": "2260120", "norm": 0.1388686131, "date": "2022-05-16"},
-    {"Station_Number": "2260120", "norm": 0.136770073, "date": "2022-05-17"},
-    {"Station_Number": "2260120", "norm": 0.1390510949, "date": "2022-05-18"},
-    {"Station_Number": "2260120", "norm": 0.1475364964, "date": "2022-05-19"},
-    {"Station_Number": "2260120", "norm": 0.1655109489, "date": "2022-05-20"},
-    {"Station_Number": "2260120", "norm": 0.1944343066, "date": "2022-05-21"},
-    {"Station_Number": "2260120", "norm": 0.2820255474, "date": "2022-05-22"},
-    {"Station_Number": "2260120", "norm": 0.3058394161, "date": "2022-05-23"},
-    {"Station_Number": "2260120", "norm": 0.3069343066, "date": "2022-05-24"},
-    {"Station_Number": "2260120", "norm": 0.3054744526, "date": "2022-05-25"},
-    {"Station_Number": "2260120", "norm": 0.3033759124, "date": "2022-05-26"},
-    {"Station_Number": "2260120", "norm": 0.278649635, "date": "2022-05-27"},
-    {"Station_Number": "2260120", "norm": 0.2457116788, "date": "2022-05-28"},
-    {"Station_Number": "2260120", "norm": 0.2290145985, "date": "2022-05-29"},
-    {"Station_Number": "2260120", "norm": 0.2214416058, "date": "2022-05-30"},
-    {"Station_Number": "2260120", "norm": 0.2008211679, "date": "2022-05-31"},
-    {"Station_Number": "2260120", "norm": 0.1856751825, "date": "2022-06-01"},
-    {"Station_Number": "2260120", "norm": 0.177919708, "date": "2022-06-02"},
-    {"Station_Number": "2260120", "norm": 0.177919708, "date": "2022-06-03"},
-    {"Station_Number": "2260120", "norm": 0.1812956204, "date": "2022-06-04"},
-    {"Station_Number": "2260120", "norm": 0.1928832117, "date": "2022-06-05"},
-    {"Station_Number": "2260120", "norm": 0.1975364964, "date": "2022-06-06"},
-    {"Station_Number": "2260120", "norm": 0.2020985401, "date": "2022-06-07"},
-    {"Station_Number": "2260120", "norm": 0.2128649635, "date": "2022-06-08"},
-    {"Station_Number": "2260120", "norm": 0.2402372263, "date": "2022-06-09"},
-    {"Station_Number": "2260120", "norm": 0.2655109489, "date": "2022-06-10"},
-    {"Station_Number": "2260120", "norm": 0.3034671533, "date": "2022-06-11"},
-    {"Station_Number": "2260120", "norm": 0.3336678832, "date": "2022-06-12"},
-    {"Station_Number": "2260120", "norm": 0.3926094891, "date": "2022-06-13"},
-    {"Station_Number": "2260120", "norm": 0.4846715328, "date": "2022-06-14"},
-    {"Station_Number": "2260120", "norm": 0.5884124088, "date": "2022-06-15"},
-    {"Station_Number": "2260120", "norm": 0.6630474453, "date": "2022-06-16"},
-    {"Station_Number": "2260120", "norm": 0.6916058394, "date": "2022-06-17"},
-    {"Station_Number": "2260120", "norm": 0.6854927007, "date": "2022-06-18"},
-    {"Station_Number": "2260120", "norm": 0.6781934307, "date": "2022-06-19"},
-    {"Station_Number": "2260120", "norm": 0.6982664234, "date": "2022-06-20"},
-    {"Station_Number": "2260120", "norm": 0.7419708029, "date": "2022-06-21"},
-    {"Station_Number": "2260120", "norm": 0.7859489051, "date": "2022-06-22"},
-    {"Station_Number": "2260120", "norm": 0.8211678832, "date": "2022-06-23"},
-    {"Station_Number": "2260120", "norm": 0.836770073, "date": "2022-06-24"},
-    {"Station_Number": "2260120", "norm": 0.8547445255, "date": "2022-06-25"},
-    {"Station_Number": "2260120", "norm": 0.8602189781, "date": "2022-06-26"},
-    {"Station_Number": "2260120", "norm": 0.859580292, "date": "2022-06-27"},
-    {"Station_Number": "2260120", "norm": 0.8822992701, "date": "2022-06-28"},
-    {"Station_Number": "2260120", "norm": 0.9179744526, "date": "2022-06-29"},
-    {"Station_Number": "2260120", "norm": 0.9562043796, "date": "2022-06-30"},
-    {"Station_Number": "2260120", "norm": 0.9906021898, "date": "2022-07-01"},
-    {"Station_Number": "2260120", "norm": 0.9990875912, "date": "2022-07-02"},
-    {"Station_Number": "2260120", "norm": 0.9972627737, "date": "2022-07-03"},
-    {"Station_Number": "2260120", "norm": 0.9881386861, "date": "2022-07-04"},
-    {"Station_Number": "2260120", "norm": 0.9823905109, "date": "2022-07-05"},
-    {"Station_Number": "2260120", "norm": 0.9774635036, "date": "2022-07-06"},
-    {"Station_Number": "2260120", "norm": 0.9292883212, "date": "2022-07-07"},
-    {"Station_Number": "2260120", "norm": 0.8630474453, "date": "2022-07-08"},
-    {"Station_Number": "2260120", "norm": 0.7647810219, "date": "2022-07-09"},
-    {"Station_Number": "2260120", "norm": 0.6391423358, "date": "2022-07-10"},
-    {"Station_Number": "2260120", "norm": 0.588229927, "date": "2022-07-11"},
-    {"Station_Number": "2260120", "norm": 0.5405109489, "date": "2022-07-12"},
-    {"Station_Number": "2260120", "norm": 0.5172445255, "date": "2022-07-13"},
-    {"Station_Number": "2260120", "norm": 0.5195255474, "date": "2022-07-14"},
-    {"Station_Number": "2260120", "norm": 0.4791970803, "date": "2022-07-15"},
-    {"Station_Number": "2260120", "norm": 0.4559306569, "date": "2022-07-16"},
-    {"Station_Number": "2260120", "norm": 0.4233576642, "date": "2022-07-17"},
-    {"Station_Number": "2260120", "norm": 0.4052919708, "date": "2022-07-18"},
-    {"Station_Number": "2260120", "norm": 0.3751824818, "date": "2022-07-19"},
-    {"Station_Number": "2260120", "norm": 0.3557481752, "date": "2022-07-20"},
-    {"Station_Number": "2260120", "norm": 0.3504562044, "date": "2022-07-21"},
-    {"Station_Number": "2260120", "norm": 0.3739963504, "date": "2022-07-22"},
-    {"Station_Number": "2260120", "norm": 0.4790145985, "date": "2022-07-23"},
-    {"Station_Number": "2260120", "norm": 0.5833029197, "date": "2022-07-24"},
-    {"Station_Number": "2260120", "norm": 0.6502737226, "date": "2022-07-25"},
-    {"Station_Number": "2260120", "norm": 0.704379562, "date": "2022-07-26"},
-    {"Station_Number": "2260120", "norm": 0.7125912409, "date": "2022-07-27"},
-    {"Station_Number": "2260120", "norm": 0.6927919708, "date": "2022-07-28"},
-    {"Station_Number": "2260120", "norm": 0.6504562044, "date": "2022-07-29"},
-    {"Station_Number": "2260120", "norm": 0.604379562, "date": "2022-07-30"},
-    {"Station_Number": "2260120", "norm": 0.5663321168, "date": "2022-07-31"},
-    {"Station_Number": "2260120", "norm": 0.5620437956, "date": "2022-08-01"},
-    {"Station_Number": "2260120", "norm": 0.5699817518, "date": "2022-08-02"},
-    {"Station_Number": "2260120", "norm": 0.5827554745, "date": "2022-08-03"},
-    {"Station_Number": "2260120", "norm": 0.5924270073, "date": "2022-08-04"},
-    {"Station_Number": "2260120", "norm": 0.6136861314, "date": "2022-08-05"},
-    {"Station_Number": "2260120", "norm": 0.6100364964, "date": "2022-08-06"},
-    {"Station_Number": "2260120", "norm": 0.6046532847, "date": "2022-08-07"},
-    {"Station_Number": "2260120", "norm": 0.6126824818, "date": "2022-08-08"},
-    {"Station_Number": "2260120", "norm": 0.6266423358, "date": "2022-08-09"},
-    {"Station_Number": "2260120", "norm": 0.6844890511, "date": "2022-08-10"},
-    {"Station_Number": "2260120", "norm": 0.7427007299, "date": "2022-08-11"},
-    {"Station_Number": "2260120", "norm": 0.7072992701, "date": "2022-08-12"},
-    {"Station_Number": "2260120", "norm": 0.6424270073, "date": "2022-08-13"},
-    {"Station_Number": "2260120", "norm": 0.5814781022, "date": "2022-08-14"},
-    {"Station_Number": "2260120", "norm": 0.5565693431, "date": "2022-08-15"},
-    {"Station_Number": "2260120", "norm": 0.5693430657, "date": "2022-08-16"},
-    {"Station_Number": "2260120", "norm": 0.5784671533, "date": "2022-08-17"},
-    {"Station_Number": "2260120", "norm": 0.5665145985, "date": "2022-08-18"},
-    {"Station_Number": "2260120", "norm": 0.5460766423, "date": "2022-08-19"},
-    {"Station_Number": "2260120", "norm": 0.5416970803, "date": "2022-08-20"},
-    {"Station_Number": "2260120", "norm": 0.5308394161, "date": "2022-08-21"},
-    {"Station_Number": "2260120", "norm": 0.5159671533, "date": "2022-08-22"},
-    {"Station_Number": "2260120", "norm": 0.5091240876, "date": "2022-08-23"},
-    {"Station_Number": "2260120", "norm": 0.5048357664, "date": "2022-08-24"},
-    {"Station_Number": "2260120", "norm": 0.4913321168, "date": "2022-08-25"},
-    {"Station_Number": "2260120", "norm": 0.4738138686, "date": "2022-08-26"},
-    {"Station_Number": "2260120", "norm": 0.4519160584, "date": "2022-08-27"},
-    {"Station_Number": "2260120", "norm": 0.4299270073, "date": "2022-08-28"},
-    {"Station_Number": "2260120", "norm": 0.4329379562, "date": "2022-08-29"},
-    {"Station_Number": "2260120", "norm": 0.4520072993, "date": "2022-08-30"},
-    {"Station_Number": "2260120", "norm": 0.4872262774, "date": "2022-08-31"},
-    {"Station_Number": "2260120", "norm": 0.573540146, "date": "2022-09-01"},
-    {"Station_Number": "2260120", "norm": 0.6737226277, "date": "2022-09-02"},
-    {"Station_Number": "2260120", "norm": 0.6843065693, "date": "2022-09-03"},
-    {"Station_Number": "2260120", "norm": 0.6685218978, "date": "2022-09-04"},
-    {"Station_Number": "2260120", "norm": 0.6531021898, "date": "2022-09-05"},
-    {"Station_Number": "2260120", "norm": 0.6268248175, "date": "2022-09-06"},
-    {"Station_Number": "2260120", "norm": 0.602189781, "date": "2022-09-07"},
-    {"Station_Number": "2260120", "norm": 0.6313868613, "date": "2022-09-08"},
-    {"Station_Number": "2260120", "norm": 0.75, "date": "2022-09-09"},
-    {"Station_Number": "2260120", "norm": 0.8769160584, "date": "2022-09-10"},
-    {"Station_Number": "2260120", "norm": 0.9498175182, "date": "2022-09-11"},
-    {"Station_Number": "2260120", "norm": 1.0, "date": "2022-09-12"},
-    {"Station_Number": "2260120", "norm": 0.9409671533, "date": "2022-09-13"},
-    {"Station_Number": "2260120", "norm": 0.9066605839, "date": "2022-09-14"},
-    {"Station_Number": "2260120", "norm": 0.8609489051, "date": "2022-09-15"},
-    {"Station_Number": "2260120", "norm": 0.7658759124, "date": "2022-09-16"},
-    {"Station_Number": "2260120", "norm": 0.6740875912, "date": "2022-09-17"},
-    {"Station_Number": "2260120", "norm": 0.5967153285, "date": "2022-09-18"},
-    {"Station_Number": "2260120", "norm": 0.5802919708, "date": "2022-09-19"},
-    {"Station_Number": "2260120", "norm": 0.598540146, "date": "2022-09-20"},
-    {"Station_Number": "2260120", "norm": 0.5796532847, "date": "2022-09-21"},
-    {"Station_Number": "2260120", "norm": 0.5243613139, "date": "2022-09-22"},
-    {"Station_Number": "2260120", "norm": 0.5315693431, "date": "2022-09-23"},
-    {"Station_Number": "2260120", "norm": 0.5086678832, "date": "2022-09-24"},
-    {"Station_Number": "2260120", "norm": 0.5068430657, "date": "2022-09-25"},
-    {"Station_Number": "2260120", "norm": 0.5827554745, "date": "2022-09-26"},
-    {"Station_Number": "2260120", "norm": 0.5894160584, "date": "2022-09-27"},
-    {"Station_Number": "2260120", "norm": 0.6058394161, "date": "2022-09-28"},
-    {"Station_Number": "2260120", "norm": 0.6303832117, "date": "2022-09-29"},
-    {"Station_Number": "2260120", "norm": 0.6018248175, "date": "2022-09-30"},
-    {"Station_Number": "2260120", "norm": 0.5718065693, "date": "2022-10-01"},
-    {"Station_Number": "2260120", "norm": 0.5500912409, "date": "2022-10-02"},
-    {"Station_Number": "2260120", "norm": 0.5656021898, "date": "2022-10-03"},
-    {"Station_Number": "2260120", "norm": 0.7013686131, "date": "2022-10-04"},
-    {"Station_Number": "2260120", "norm": 0.8486313869, "date": "2022-10-05"},
-    {"Station_Number": "2260120", "norm": 0.9176094891, "date": "2022-10-06"},
-    {"Station_Number": "2260120", "norm": 0.8400547445, "date": "2022-10-07"},
-    {"Station_Number": "2260120", "norm": 0.7093065693, "date": "2022-10-08"},
-    {"Station_Number": "2260120", "norm": 0.5964416058, "date": "2022-10-09"},
-    {"Station_Number": "2260120", "norm": 0.5460766423, "date": "2022-10-10"},
-    {"Station_Number": "2260120", "norm": 0.547080292, "date": "2022-10-11"},
-    {"Station_Number": "2260120", "norm": 0.527919708, "date": "2022-10-12"},
-    {"Station_Number": "2260120", "norm": 0.5027372263, "date": "2022-10-13"},
-    {"Station_Number": "2260120", "norm": 0.5196167883, "date": "2022-10-14"},
-    {"Station_Number": "2260120", "norm": 0.5622262774, "date": "2022-10-15"},
-    {"Station_Number": "2260120", "norm": 0.5924270073, "date": "2022-10-16"},
-    {"Station_Number": "2260120", "norm": 0.5778284672, "date": "2022-10-17"},
-    {"Station_Number": "2260120", "norm": 0.5741788321, "date": "2022-10-18"},
-    {"Station_Number": "2260120", "norm": 0.5559306569, "date": "2022-10-19"},
-    {"Station_Number": "2260120", "norm": 0.508120438, "date": "2022-10-20"},
-    {"Station_Number": "2260120", "norm": 0.4738138686, "date": "2022-10-21"},
-    {"Station_Number": "2260120", "norm": 0.4371350365, "date": "2022-10-22"},
-    {"Station_Number": "2260120", "norm": 0.4123175182, "date": "2022-10-23"},
-    {"Station_Number": "2260120", "norm": 0.3856751825, "date": "2022-10-24"},
-    {"Station_Number": "2260120", "norm": 0.3957116788, "date": "2022-10-25"},
-    {"Station_Number": "2260120", "norm": 0.4655109489, "date": "2022-10-26"},
-    {"Station_Number": "2260120", "norm": 0.6283759124, "date": "2022-10-27"},
-    {"Station_Number": "2260120", "norm": 0.814689781, "date": "2022-10-28"},
-    {"Station_Number": "2260120", "norm": 0.8819343066, "date": "2022-10-29"},
-    {"Station_Number": "2260120", "norm": 0.8303832117, "date": "2022-10-30"},
-    {"Station_Number": "2260120", "norm": 0.7245437956, "date": "2022-10-31"},
-    {"Station_Number": "2260120", "norm": 0.6302919708, "date": "2022-11-01"},
-    {"Station_Number": "2260120", "norm": 0.527189781, "date": "2022-11-02"},
-    {"Station_Number": "2260120", "norm": 0.448540146, "date": "2022-11-03"},
-    {"Station_Number": "2260120", "norm": 0.3906934307, "date": "2022-11-04"},
-    {"Station_Number": "2260120", "norm": 0.3512773723, "date": "2022-11-05"},
-    {"Station_Number": "2260120", "norm": 0.3230839416, "date": "2022-11-06"},
-    {"Station_Number": "2260120", "norm": 0.3047445255, "date": "2022-11-07"},
-    {"Station_Number": "2260120", "norm": 0.2883211679, "date": "2022-11-08"},
-    {"Station_Number": "2260120", "norm": 0.2768248175, "date": "2022-11-09"},
-    {"Station_Number": "2260120", "norm": 0.2615875912, "date": "2022-11-10"},
-    {"Station_Number": "2260120", "norm": 0.253649635, "date": "2022-11-11"},
-    {"Station_Number": "2260120", "norm": 0.2429744526, "date": "2022-11-12"},
-    {"Station_Number": "2260120", "norm": 0.2354014599, "date": "2022-11-13"},
-    {"Station_Number": "2260120", "norm": 0.2269160584, "date": "2022-11-14"},
-    {"Station_Number": "2260120", "norm": 0.2198905109, "date": "2022-11-15"},
-    {"Station_Number": "2260120", "norm": 0.2125912409, "date": "2022-11-16"},
-    {"Station_Number": "2260120", "norm": 0.2084854015, "date": "2022-11-17"},
-    {"Station_Number": "2260120", "norm": 0.2030109489, "date": "2022-11-18"},
-    {"Station_Number": "2260120", "norm": 0.1996350365, "date": "2022-11-19"},
-    {"Station_Number": "2260120", "norm": 0.1950729927, "date": "2022-11-20"},
-    {"Station_Number": "2260120", "norm": 0.1881386861, "date": "2022-11-21"},
-    {"Station_Number": "2260120", "norm": 0.1837591241, "date": "2022-11-22"},
-    {"Station_Number": "2260120", "norm": 0.1798357664, "date": "2022-11-23"},
-    {"Station_Number": "2260120", "norm": 0.1755474453, "date": "2022-11-24"},
-    {"Station_Number": "2260120", "norm": 0.1717153285, "date": "2022-11-25"},
-    {"Station_Number": "2260120", "norm": 0.1688868613, "date": "2022-11-26"},
-    {"Station_Number": "2260120", "norm": 0.1659671533, "date": "2022-11-27"},
-    {"Station_Number": "2260120", "norm": 0.1626824818, "date": "2022-11-28"},
-    {"Station_Number": "2260120", "norm": 0.1596715328, "date": "2022-11-29"},
-    {"Station_Number": "2260120", "norm": 0.1560218978, "date": "2022-11-30"},
-    {"Station_Number": "2260120", "norm": 0.1541058394, "date": "2022-12-01"},
-    {"Station_Number": "2260120", "norm": 0.1524635036, "date": "2022-12-02"},
-    {"Station_Number": "2260120", "norm": 0.1510948905, "date": "2022-12-03"},
-    {"Station_Number": "2260120", "norm": 0.1482664234, "date": "2022-12-04"},
-    {"Station_Number": "2260120", "norm": 0.1467153285, "date": "2022-12-05"},
-    {"Station_Number": "2260120", "norm": 0.1441605839, "date": "2022-12-06"},
-    {"Station_Number": "2260120", "norm": 0.1407846715, "date": "2022-12-07"},
-    {"Station_Number": "2260120", "norm": 0.1385948905, "date": "2022-12-08"},
-    {"Station_Number": "2260120", "norm": 0.1368613139, "date": "2022-12-09"},
-    {"Station_Number": "2260120", "norm": 0.1357664234, "date": "2022-12-10"},
-    {"Station_Number": "2260120", "norm": 0.1343978102, "date": "2022-12-11"},
-    {"Station_Number": "2260120", "norm": 0.1333941606, "date": "2022-12-12"},
-    {"Station_Number": "2260120", "norm": 0.1322992701, "date": "2022-12-13"},
-    {"Station_Number": "2260120", "norm": 0.1305656934, "date": "2022-12-14"},
-    {"Station_Number": "2260120", "norm": 0.1292883212, "date": "2022-12-15"},
-    {"Station_Number": "2260120", "norm": 0.1282846715, "date": "2022-12-16"},
-    {"Station_Number": "2260120", "norm": 0.1260948905, "date": "2022-12-17"},
-    {"Station_Number": "2260120", "norm": 0.1243613139, "date": "2022-12-18"},
-    {"Station_Number": "2260120", "norm": 0.1224452555, "date": "2022-12-19"},
-    {"Station_Number": "2260120", "norm": 0.1217153285, "date": "2022-12-20"},
-    {"Station_Number": "2260120", "norm": 0.1199817518, "date": "2022-12-21"},
-    {"Station_Number": "2260120", "norm": 0.1190693431, "date": "2022-12-22"},
-    {"Station_Number": "2260120", "norm": 0.1180656934, "date": "2022-12-23"},
-    {"Station_Number": "2260120", "norm": 0.1157846715, "date": "2022-12-24"},
-    {"Station_Number": "2260120", "norm": 0.1142335766, "date": "2022-12-25"},
-    {"Station_Number": "2260120", "norm": 0.1135036496, "date": "2022-12-26"},
-    {"Station_Number": "2260120", "norm": 0.1130474453, "date": "2022-12-27"},
-    {"Station_Number": "2260120", "norm": 0.1128649635, "date": "2022-12-28"},
-    {"Station_Number": "2260120", "norm": 0.1113138686, "date": "2022-12-29"},
-    {"Station_Number": "2260120", "norm": 0.1104927007, "date": "2022-12-30"},
-    {"Station_Number": "2260120", "norm": 0.1098540146, "date": "2022-12-31"},
-    {"Station_Number": "2260120", "norm": 0.0743163272, "date": "2023-01-01"},
-    {"Station_Number": "2260120", "norm": 0.0737556843, "date": "2023-01-02"},
-    {"Station_Number": "2260120", "norm": 0.0733819224, "date": "2023-01-03"},
-    {"Station_Number": "2260120", "norm": 0.0733819224, "date": "2023-01-04"},
-    {"Station_Number": "2260120", "norm": 0.0733819224, "date": "2023-01-05"},
-    {"Station_Number": "2260120", "norm": 0.0733819224, "date": "2023-01-06"},
-    {"Station_Number": "2260120", "norm": 0.0731950414, "date": "2023-01-07"},
-    {"Station_Number": "2260120", "norm": 0.0728212795, "date": "2023-01-08"},
-    {"Station_Number": "2260120", "norm": 0.0723852239, "date": "2023-01-09"},
-    {"Station_Number": "2260120", "norm": 0.072011462, "date": "2023-01-10"},
-    {"Station_Number": "2260120", "norm": 0.0716999938, "date": "2023-01-11"},
-    {"Station_Number": "2260120", "norm": 0.0711393509, "date": "2023-01-12"},
-    {"Station_Number": "2260120", "norm": 0.0706410017, "date": "2023-01-13"},
-    {"Station_Number": "2260120", "norm": 0.0702049461, "date": "2023-01-14"},
-    {"Station_Number": "2260120", "norm": 0.0697688906, "date": "2023-01-15"},
-    {"Station_Number": "2260120", "norm": 0.069145954, "date": "2023-01-16"},
-    {"Station_Number": "2260120", "norm": 0.0684607239, "date": "2023-01-17"},
-    {"Station_Number": "2260120", "norm": 0.067900081, "date": "2023-01-18"},
-    {"Station_Number": "2260120", "norm": 0.0675263191, "date": "2023-01-19"},
-    {"Station_Number": "2260120", "norm": 0.0670902635, "date": "2023-01-20"},
-    {"Station_Number": "2260120", "norm": 0.0665296206, "date": "2023-01-21"},
-    {"Station_Number": "2260120", "norm": 0.0661558587, "date": "2023-01-22"},
-    {"Station_Number": "2260120", "norm": 0.0656575095, "date": "2023-01-23"},
-    {"Station_Number": "2260120", "norm": 0.0650968666, "date": "2023-01-24"},
-    {"Station_Number": "2260120", "norm": 0.0647853984, "date": "2023-01-25"},
-    {"Station_Number": "2260120", "norm": 0.0644116365, "date": "2023-01-26"},
-    {"Station_Number": "2260120", "norm": 0.0639132872, "date": "2023-01-27"},
-    {"Station_Number": "2260120", "norm": 0.063414938, "date": "2023-01-28"},
-    {"Station_Number": "2260120", "norm": 0.0629165888, "date": "2023-01-29"},
-    {"Station_Number": "2260120", "norm": 0.0626051205, "date": "2023-01-30"},
-    {"Station_Number": "2260120", "norm": 0.061982184, "date": "2023-01-31"},
-    {"Station_Number": "2260120", "norm": 0.0614838348, "date": "2023-02-01"},
-    {"Station_Number": "2260120", "norm": 0.0611100729, "date": "2023-02-02"},
-    {"Station_Number": "2260120", "norm": 0.060736311, "date": "2023-02-03"},
-    {"Station_Number": "2260120", "norm": 0.0604248427, "date": "2023-02-04"},
-    {"Station_Number": "2260120", "norm": 0.0601133744, "date": "2023-02-05"},
-    {"Station_Number": "2260120", "norm": 0.0598019062, "date": "2023-02-06"},
-    {"Station_Number": "2260120", "norm": 0.0594904379, "date": "2023-02-07"},
-    {"Station_Number": "2260120", "norm": 0.0591789697, "date": "2023-02-08"},
-    {"Station_Number": "2260120", "norm": 0.0588675014, "date": "2023-02-09"},
-    {"Station_Number": "2260120", "norm": 0.0585560331, "date": "2023-02-10"},
-    {"Station_Number": "2260120", "norm": 0.0582445649, "date": "2023-02-11"},
-    {"Station_Number": "2260120", "norm": 0.0577462157, "date": "2023-02-12"},
-    {"Station_Number": "2260120", "norm": 0.0571855728, "date": "2023-02-13"},
-    {"Station_Number": "2260120", "norm": 0.0566872236, "date": "2023-02-14"},
-    {"Station_Number": "2260120", "norm": 0.0561888744, "date": "2023-02-15"},
-    {"Station_Number": "2260120", "norm": 0.0557528188, "date": "2023-02-16"},
-    {"Station_Number": "2260120", "norm": 0.0554413505, "date": "2023-02-17"},
-    {"Station_Number": "2260120", "norm": 0.0551298823, "date": "2023-02-18"},
-    {"Station_Number": "2260120", "norm": 0.0551298823, "date": "2023-02-19"},
-    {"Station_Number": "2260120", "norm": 0.054818414, "date": "2023-02-20"},
-    {"Station_Number": "2260120", "norm": 0.054818414, "date": "2023-02-21"},
-    {"Station_Number": "2260120", "norm": 0.0545069457, "date": "2023-02-22"},
-    {"Station_Number": "2260120", "norm": 0.0545069457, "date": "2023-02-23"},
-    {"Station_Number": "2260120", "norm": 0.0542577711, "date": "2023-02-24"},
-    {"Station_Number": "2260120", "norm": 0.0540085965, "date": "2023-02-25"},
-    {"Station_Number": "2260120", "norm": 0.0537594219, "date": "2023-02-26"},
-    {"Station_Number": "2260120", "norm": 0.0535102473, "date": "2023-02-27"},
-    {"Station_Number": "2260120", "norm": 0.0532610727, "date": "2023-02-28"},
-    {"Station_Number": "2260120", "norm": 0.0530118981, "date": "2023-03-01"},
-    {"Station_Number": "2260120", "norm": 0.0527627235, "date": "2023-03-02"},
-    {"Station_Number": "2260120", "norm": 0.0525135489, "date": "2023-03-03"},
-    {"Station_Number": "2260120", "norm": 0.0522643743, "date": "2023-03-04"},
-    {"Station_Number": "2260120", "norm": 0.0522643743, "date": "2023-03-05"},
-    {"Station_Number": "2260120", "norm": 0.0520774933, "date": "2023-03-06"},
-    {"Station_Number": "2260120", "norm": 0.0527627235, "date": "2023-03-07"},
-    {"Station_Number": "2260120", "norm": 0.0533233663, "date": "2023-03-08"},
-    {"Station_Number": "2260120", "norm": 0.0534479537, "date": "2023-03-09"},
-    {"Station_Number": "2260120", "norm": 0.0528250171, "date": "2023-03-10"},
-    {"Station_Number": "2260120", "norm": 0.0523266679, "date": "2023-03-11"},
-    {"Station_Number": "2260120", "norm": 0.0520151997, "date": "2023-03-12"},
-    {"Station_Number": "2260120", "norm": 0.0520151997, "date": "2023-03-13"},
-    {"Station_Number": "2260120", "norm": 0.0518283187, "date": "2023-03-14"},
-    {"Station_Number": "2260120", "norm": 0.0515791441, "date": "2023-03-15"},
-    {"Station_Number": "2260120", "norm": 0.0514545568, "date": "2023-03-16"},
-    {"Station_Number": "2260120", "norm": 0.0514545568, "date": "2023-03-17"},
-    {"Station_Number": "2260120", "norm": 0.0511430885, "date": "2023-03-18"},
-    {"Station_Number": "2260120", "norm": 0.0510185012, "date": "2023-03-19"},
-    {"Station_Number": "2260120", "norm": 0.050707033, "date": "2023-03-20"},
-    {"Station_Number": "2260120", "norm": 0.0506447393, "date": "2023-03-21"},
-    {"Station_Number": "2260120", "norm": 0.0509562076, "date": "2023-03-22"},
-    {"Station_Number": "2260120", "norm": 0.050707033, "date": "2023-03-23"},
-    {"Station_Number": "2260120", "norm": 0.0506447393, "date": "2023-03-24"},
-    {"Station_Number": "2260120", "norm": 0.050520152, "date": "2023-03-25"},
-    {"Station_Number": "2260120", "norm": 0.050520152, "date": "2023-03-26"},
-    {"Station_Number": "2260120", "norm": 0.0502709774, "date": "2023-03-27"},
-    {"Station_Number": "2260120", "norm": 0.050520152, "date": "2023-03-28"},
-    {"Station_Number": "2260120", "norm": 0.0508939139, "date": "2023-03-29"},
-    {"Station_Number": "2260120", "norm": 0.0512053822, "date": "2023-03-30"},
-    {"Station_Number": "2260120", "norm": 0.0520151997, "date": "2023-03-31"},
-    {"Station_Number": "2260120", "norm": 0.0539463029, "date": "2023-04-01"},
-    {"Station_Number": "2260120", "norm": 0.0558774061, "date": "2023-04-02"},
-    {"Station_Number": "2260120", "norm": 0.0565626363, "date": "2023-04-03"},
-    {"Station_Number": "2260120", "norm": 0.0566872236, "date": "2023-04-04"},
-    {"Station_Number": "2260120", "norm": 0.056251168, "date": "2023-04-05"},
-    {"Station_Number": "2260120", "norm": 0.0553167632, "date": "2023-04-06"},
-    {"Station_Number": "2260120", "norm": 0.0543200648, "date": "2023-04-07"},
-    {"Station_Number": "2260120", "norm": 0.053572541, "date": "2023-04-08"},
-    {"Station_Number": "2260120", "norm": 0.0525758425, "date": "2023-04-09"},
-    {"Station_Number": "2260120", "norm": 0.0520774933, "date": "2023-04-10"},
-    {"Station_Number": "2260120", "norm": 0.051766025, "date": "2023-04-11"},
-    {"Station_Number": "2260120", "norm": 0.0513922631, "date": "2023-04-12"},
-    {"Station_Number": "2260120", "norm": 0.051766025, "date": "2023-04-13"},
-    {"Station_Number": "2260120", "norm": 0.053198779, "date": "2023-04-14"},
-    {"Station_Number": "2260120", "norm": 0.0549430013, "date": "2023-04-15"},
-    {"Station_Number": "2260120", "norm": 0.0553167632, "date": "2023-04-16"},
-    {"Station_Number": "2260120", "norm": 0.0552544696, "date": "2023-04-17"},
-    {"Station_Number": "2260120", "norm": 0.0543200648, "date": "2023-04-18"},
-    {"Station_Number": "2260120", "norm": 0.0533233663, "date": "2023-04-19"},
-    {"Station_Number": "2260120", "norm": 0.0522020806, "date": "2023-04-20"},
-    {"Station_Number": "2260120", "norm": 0.0513922631, "date": "2023-04-21"},
-    {"Station_Number": "2260120", "norm": 0.050707033, "date": "2023-04-22"},
-    {"Station_Number": "2260120", "norm": 0.0500840964, "date": "2023-04-23"},
-    {"Station_Number": "2260120", "norm": 0.0493988663, "date": "2023-04-24"},
-    {"Station_Number": "2260120", "norm": 0.0485890488, "date": "2023-04-25"},
-    {"Station_Number": "2260120", "norm": 0.0480906996, "date": "2023-04-26"},
-    {"Station_Number": "2260120", "norm": 0.0479038186, "date": "2023-04-27"},
-    {"Station_Number": "2260120", "norm": 0.0475923503, "date": "2023-04-28"},
-    {"Station_Number": "2260120", "norm": 0.0473431757, "date": "2023-04-29"},
-    {"Station_Number": "2260120", "norm": 0.0470940011, "date": "2023-04-30"},
-    {"Station_Number": "2260120", "norm": 0.0469071202, "date": "2023-05-01"},
-    {"Station_Number": "2260120", "norm": 0.0479038186, "date": "2023-05-02"},
-    {"Station_Number": "2260120", "norm": 0.049087398, "date": "2023-05-03"},
-    {"Station_Number": "2260120", "norm": 0.0502709774, "date": "2023-05-04"},
-    {"Station_Number": "2260120", "norm": 0.0511430885, "date": "2023-05-05"},
-    {"Station_Number": "2260120", "norm": 0.0512053822, "date": "2023-05-06"},
-    {"Station_Number": "2260120", "norm": 0.0507693266, "date": "2023-05-07"},
-    {"Station_Number": "2260120", "norm": 0.0505824456, "date": "2023-05-08"},
-    {"Station_Number": "2260120", "norm": 0.0500840964, "date": "2023-05-09"},
-    {"Station_Number": "2260120", "norm": 0.0493365726, "date": "2023-05-10"},
-    {"Station_Number": "2260120", "norm": 0.0486513424, "date": "2023-05-11"},
-    {"Station_Number": "2260120", "norm": 0.0484021678, "date": "2023-05-12"},
-    {"Station_Number": "2260120", "norm": 0.0507693266, "date": "2023-05-13"},
-    {"Station_Number": "2260120", "norm": 0.054818414, "date": "2023-05-14"},
-    {"Station_Number": "2260120", "norm": 0.2665545381, "date": "2023-05-15"},
-    {"Station_Number": "2260120", "norm": 0.1508129322, "date": "2023-05-16"},
-    {"Station_Number": "2260120", "norm": 0.1074565502, "date": "2023-05-17"},
-    {"Station_Number": "2260120", "norm": 0.1412820034, "date": "2023-05-18"},
-    {"Station_Number": "2260120", "norm": 0.1196038124, "date": "2023-05-19"},
-    {"Station_Number": "2260120", "norm": 0.0888307481, "date": "2023-05-20"},
-    {"Station_Number": "2260120", "norm": 0.0721360493, "date": "2023-05-21"},
-    {"Station_Number": "2260120", "norm": 0.0702049461, "date": "2023-05-22"},
-    {"Station_Number": "2260120", "norm": 0.0698311842, "date": "2023-05-23"},
-    {"Station_Number": "2260120", "norm": 0.0696443032, "date": "2023-05-24"},
-    {"Station_Number": "2260120", "norm": 0.069145954, "date": "2023-05-25"},
-    {"Station_Number": "2260120", "norm": 0.0687098985, "date": "2023-05-26"},
-    {"Station_Number": "2260120", "norm": 0.0696443032, "date": "2023-05-27"},
-    {"Station_Number": "2260120", "norm": 0.0699557715, "date": "2023-05-28"},
-    {"Station_Number": "2260120", "norm": 0.0693951286, "date": "2023-05-29"},
-    {"Station_Number": "2260120", "norm": 0.0680246683, "date": "2023-05-30"},
-    {"Station_Number": "2260120", "norm": 0.0677754937, "date": "2023-05-31"},
-    {"Station_Number": "2260120", "norm": 0.0669656762, "date": "2023-06-01"},
-    {"Station_Number": "2260120", "norm": 0.0657820968, "date": "2023-06-02"},
-    {"Station_Number": "2260120", "norm": 0.0652214539, "date": "2023-06-03"},
-    {"Station_Number": "2260120", "norm": 0.0644116365, "date": "2023-06-04"},
-    {"Station_Number": "2260120", "norm": 0.0640378745, "date": "2023-06-05"},
-    {"Station_Number": "2260120", "norm": 0.0637886999, "date": "2023-06-06"},
-    {"Station_Number": "2260120", "norm": 0.0630411761, "date": "2023-06-07"},
-    {"Station_Number": "2260120", "norm": 0.0629165888, "date": "2023-06-08"},
-    {"Station_Number": "2260120", "norm": 0.0636641126, "date": "2023-06-09"},
-    {"Station_Number": "2260120", "norm": 0.0661558587, "date": "2023-06-10"},
-    {"Station_Number": "2260120", "norm": 0.0687098985, "date": "2023-06-11"},
-    {"Station_Number": "2260120", "norm": 0.0705164144, "date": "2023-06-12"},
-    {"Station_Number": "2260120", "norm": 0.0726966922, "date": "2023-06-13"},
-    {"Station_Number": "2260120", "norm": 0.0731950414, "date": "2023-06-14"},
-    {"Station_Number": "2260120", "norm": 0.0761228431, "date": "2023-06-15"},
-    {"Station_Number": "2260120", "norm": 0.0954338753, "date": "2023-06-16"},
-    {"Station_Number": "2260120", "norm": 0.1197906933, "date": "2023-06-17"},
-    {"Station_Number": "2260120", "norm": 0.1619634959, "date": "2023-06-18"},
-    {"Station_Number": "2260120", "norm": 0.2367158787, "date": "2023-06-19"},
-    {"Station_Number": "2260120", "norm": 0.2790132685, "date": "2023-06-20"},
-    {"Station_Number": "2260120", "norm": 0.2760231732, "date": "2023-06-21"},
-    {"Station_Number": "2260120", "norm": 0.2578334268, "date": "2023-06-22"},
-    {"Station_Number": "2260120", "norm": 0.2429452439, "date": "2023-06-23"},
-    {"Station_Number": "2260120", "norm": 0.2277455927, "date": "2023-06-24"},
-    {"Station_Number": "2260120", "norm": 0.2226375132, "date": "2023-06-25"},
-    {"Station_Number": "2260120", "norm": 0.2215785211, "date": "2023-06-26"},
-    {"Station_Number": "2260120", "norm": 0.2669905937, "date": "2023-06-27"},
-    {"Station_Number": "2260120", "norm": 0.3113436741, "date": "2023-06-28"},
-    {"Station_Number": "2260120", "norm": 0.3105961503, "date": "2023-06-29"},
-    {"Station_Number": "2260120", "norm": 0.2979505388, "date": "2023-06-30"},
-    {"Station_Number": "2260120", "norm": 0.267115181, "date": "2023-07-01"},
-    {"Station_Number": "2260120", "norm": 0.2401420295, "date": "2023-07-02"},
-    {"Station_Number": "2260120", "norm": 0.2281816483, "date": "2023-07-03"},
-    {"Station_Number": "2260120", "norm": 0.2331651405, "date": "2023-07-04"},
-    {"Station_Number": "2260120", "norm": 0.2420108391, "date": "2023-07-05"},
-    {"Station_Number": "2260120", "norm": 0.244004236, "date": "2023-07-06"},
-    {"Station_Number": "2260120", "norm": 0.2382109263, "date": "2023-07-07"},
-    {"Station_Number": "2260120", "norm": 0.2376502834, "date": "2023-07-08"},
-    {"Station_Number": "2260120", "norm": 0.2639382047, "date": "2023-07-09"},
-    {"Station_Number": "2260120", "norm": 0.3223073569, "date": "2023-07-10"},
-    {"Station_Number": "2260120", "norm": 0.4497601694, "date": "2023-07-11"},
-    {"Station_Number": "2260120", "norm": 0.5278764094, "date": "2023-07-12"},
-    {"Station_Number": "2260120", "norm": 0.5702983866, "date": "2023-07-13"},
-    {"Station_Number": "2260120", "norm": 0.5963371332, "date": "2023-07-14"},
-    {"Station_Number": "2260120", "norm": 0.6264872609, "date": "2023-07-15"},
-    {"Station_Number": "2260120", "norm": 0.6773188812, "date": "2023-07-16"},
-    {"Station_Number": "2260120", "norm": 0.7573039307, "date": "2023-07-17"},
-    {"Station_Number": "2260120", "norm": 0.7967358126, "date": "2023-07-18"},
-    {"Station_Number": "2260120", "norm": 0.835357877, "date": "2023-07-19"},
-    {"Station_Number": "2260120", "norm": 0.8770946241, "date": "2023-07-20"},
-    {"Station_Number": "2260120", "norm": 0.9013891484, "date": "2023-07-21"},
-    {"Station_Number": "2260120", "norm": 0.9231919267, "date": "2023-07-22"},
-    {"Station_Number": "2260120", "norm": 0.914906871, "date": "2023-07-23"},
-    {"Station_Number": "2260120", "norm": 0.8806453622, "date": "2023-07-24"},
-    {"Station_Number": "2260120", "norm": 0.7666479786, "date": "2023-07-25"},
-    {"Station_Number": "2260120", "norm": 0.6295396499, "date": "2023-07-26"},
-    {"Station_Number": "2260120", "norm": 0.5158537345, "date": "2023-07-27"},
-    {"Station_Number": "2260120", "norm": 0.4572354077, "date": "2023-07-28"},
-    {"Station_Number": "2260120", "norm": 0.4355572167, "date": "2023-07-29"},
-    {"Station_Number": "2260120", "norm": 0.4140659067, "date": "2023-07-30"},
-    {"Station_Number": "2260120", "norm": 0.4275836292, "date": "2023-07-31"},
-    {"Station_Number": "2260120", "norm": 0.4609730268, "date": "2023-08-01"},
-    {"Station_Number": "2260120", "norm": 0.4936149006, "date": "2023-08-02"},
-    {"Station_Number": "2260120", "norm": 0.5116800598, "date": "2023-08-03"},
-    {"Station_Number": "2260120", "norm": 0.5045162898, "date": "2023-08-04"},
-    {"Station_Number": "2260120", "norm": 0.4788513051, "date": "2023-08-05"},
-    {"Station_Number": "2260120", "norm": 0.4494487012, "date": "2023-08-06"},
-    {"Station_Number": "2260120", "norm": 0.4551797172, "date": "2023-08-07"},
-    {"Station_Number": "2260120", "norm": 0.5111817106, "date": "2023-08-08"},
-    {"Station_Number": "2260120", "norm": 0.590107768, "date": "2023-08-09"},
-    {"Station_Number": "2260120", "norm": 0.6629913412, "date": "2023-08-10"},
-    {"Station_Number": "2260120", "norm": 0.7541892481, "date": "2023-08-11"},
-    {"Station_Number": "2260120", "norm": 0.8068896779, "date": "2023-08-12"},
-    {"Station_Number": "2260120", "norm": 0.8521771631, "date": "2023-08-13"},
-    {"Station_Number": "2260120", "norm": 0.8725471874, "date": "2023-08-14"},
-    {"Station_Number": "2260120", "norm": 0.8841338068, "date": "2023-08-15"},
-    {"Station_Number": "2260120", "norm": 0.9065595216, "date": "2023-08-16"},
-    {"Station_Number": "2260120", "norm": 0.9722170311, "date": "2023-08-17"},
-    {"Station_Number": "2260120", "norm": 1.0, "date": "2023-08-18"},
-    {"Station_Number": "2260120", "norm": 0.9977574285, "date": "2023-08-19"},
-    {"Station_Number": "2260120", "norm": 0.9742727216, "date": "2023-08-20"},
-    {"Station_Number": "2260120", "norm": 0.9051267676, "date": "2023-08-21"},
-    {"Station_Number": "2260120", "norm": 0.8185385909, "date": "2023-08-22"},
-    {"Station_Number": "2260120", "norm": 0.7622874229, "date": "2023-08-23"},
-    {"Station_Number": "2260120", "norm": 0.72590793, "date": "2023-08-24"},
-    {"Station_Number": "2260120", "norm": 0.6908366038, "date": "2023-08-25"},
-    {"Station_Number": "2260120", "norm": 0.7292717872, "date": "2023-08-26"},
-    {"Station_Number": "2260120", "norm": 0.7670217405, "date": "2023-08-27"},
-    {"Station_Number": "2260120", "norm": 0.8143649162, "date": "2023-08-28"},
-    {"Station_Number": "2260120", "norm": 0.8492493615, "date": "2023-08-29"},
-    {"Station_Number": "2260120", "norm": 0.8675636953, "date": "2023-08-30"},
-    {"Station_Number": "2260120", "norm": 0.873170124, "date": "2023-08-31"},
-    {"Station_Number": "2260120", "norm": 0.8814551797, "date": "2023-09-01"},
-    {"Station_Number": "2260120", "norm": 0.9063726406, "date": "2023-09-02"},
-    {"Station_Number": "2260120", "norm": 0.9647417928, "date": "2023-09-03"},
-    {"Station_Number": "2260120", "norm": 0.9836167695, "date": "2023-09-04"},
-    {"Station_Number": "2260120", "norm": 0.9879773251, "date": "2023-09-05"},
-    {"Station_Number": "2260120", "norm": 0.9890363172, "date": "2023-09-06"},
-    {"Station_Number": "2260120", "norm": 0.902012085, "date": "2023-09-07"},
-    {"Station_Number": "2260120", "norm": 0.8108764717, "date": "2023-09-08"},
-    {"Station_Number": "2260120", "norm": 0.727153803, "date": "2023-09-09"},
-    {"Station_Number": "2260120", "norm": 0.6586307855, "date": "2023-09-10"},
-    {"Station_Number": "2260120", "norm": 0.6071139351, "date": "2023-09-11"},
-    {"Station_Number": "2260120", "norm": 0.5265682427, "date": "2023-09-12"},
-    {"Station_Number": "2260120", "norm": 0.4406652962, "date": "2023-09-13"},
-    {"Station_Number": "2260120", "norm": 0.4032268112, "date": "2023-09-14"},
-    {"Station_Number": "2260120", "norm": 0.3793060487, "date": "2023-09-15"},
-    {"Station_Number": "2260120", "norm": 0.4124462717, "date": "2023-09-16"},
-    {"Station_Number": "2260120", "norm": 0.4321933595, "date": "2023-09-17"},
-    {"Station_Number": "2260120", "norm": 0.3887123902, "date": "2023-09-18"},
-    {"Station_Number": "2260120", "norm": 0.4044726842, "date": "2023-09-19"},
-    {"Station_Number": "2260120", "norm": 0.4742415748, "date": "2023-09-20"},
-    {"Station_Number": "2260120", "norm": 0.4808447019, "date": "2023-09-21"},
-    {"Station_Number": "2260120", "norm": 0.5466267987, "date": "2023-09-22"},
-    {"Station_Number": "2260120", "norm": 0.5533545132, "date": "2023-09-23"},
-    {"Station_Number": "2260120", "norm": 0.5178471314, "date": "2023-09-24"},
-    {"Station_Number": "2260120", "norm": 0.4705039556, "date": "2023-09-25"},
-    {"Station_Number": "2260120", "norm": 0.4609730268, "date": "2023-09-26"},
-    {"Station_Number": "2260120", "norm": 0.4404784152, "date": "2023-09-27"},
-    {"Station_Number": "2260120", "norm": 0.4176166449, "date": "2023-09-28"},
-    {"Station_Number": "2260120", "norm": 0.395377811, "date": "2023-09-29"},
-    {"Station_Number": "2260120", "norm": 0.4140659067, "date": "2023-09-30"},
-    {"Station_Number": "2260120", "norm": 0.4975394007, "date": "2023-10-01"},
-    {"Station_Number": "2260120", "norm": 0.4858904878, "date": "2023-10-02"},
-    {"Station_Number": "2260120", "norm": 0.4746776303, "date": "2023-10-03"},
-    {"Station_Number": "2260120", "norm": 0.4713760668, "date": "2023-10-04"},
-    {"Station_Number": "2260120", "norm": 0.4617828443, "date": "2023-10-05"},
-    {"Station_Number": "2260120", "norm": 0.417056002, "date": "2023-10-06"},
-    {"Station_Number": "2260120", "norm": 0.3793683424, "date": "2023-10-07"},
-    {"Station_Number": "2260120", "norm": 0.4617828443, "date": "2023-10-08"},
-    {"Station_Number": "2260120", "norm": 0.4274590419, "date": "2023-10-09"},
-    {"Station_Number": "2260120", "norm": 0.378184763, "date": "2023-10-10"},
-    {"Station_Number": "2260120", "norm": 0.3542640005, "date": "2023-10-11"},
-    {"Station_Number": "2260120", "norm": 0.3530181275, "date": "2023-10-12"},
-    {"Station_Number": "2260120", "norm": 0.4964804086, "date": "2023-10-13"},
-    {"Station_Number": "2260120", "norm": 0.5216470442, "date": "2023-10-14"},
-    {"Station_Number": "2260120", "norm": 0.5263190681, "date": "2023-10-15"},
-    {"Station_Number": "2260120", "norm": 0.4688843207, "date": "2023-10-16"},
-    {"Station_Number": "2260120", "norm": 0.3924500093, "date": "2023-10-17"},
-    {"Station_Number": "2260120", "norm": 0.3531427148, "date": "2023-10-18"},
-    {"Station_Number": "2260120", "norm": 0.3244253411, "date": "2023-10-19"},
-    {"Station_Number": "2260120", "norm": 0.291471999, "date": "2023-10-20"},
-    {"Station_Number": "2260120", "norm": 0.2661807762, "date": "2023-10-21"},
-    {"Station_Number": "2260120", "norm": 0.240951847, "date": "2023-10-22"},
-    {"Station_Number": "2260120", "norm": 0.2196474179, "date": "2023-10-23"},
-    {"Station_Number": "2260120", "norm": 0.2152868623, "date": "2023-10-24"},
-    {"Station_Number": "2260120", "norm": 0.2130442908, "date": "2023-10-25"},
-    {"Station_Number": "2260120", "norm": 0.2155983305, "date": "2023-10-26"},
-    {"Station_Number": "2260120", "norm": 0.2340372516, "date": "2023-10-27"},
-    {"Station_Number": "2260120", "norm": 0.25976453, "date": "2023-10-28"},
-    {"Station_Number": "2260120", "norm": 0.2328536722, "date": "2023-10-29"},
-    {"Station_Number": "2260120", "norm": 0.2037625366, "date": "2023-10-30"},
-    {"Station_Number": "2260120", "norm": 0.1908054569, "date": "2023-10-31"},
-    {"Station_Number": "2260120", "norm": 0.1803401233, "date": "2023-11-01"},
-    {"Station_Number": "2260120", "norm": 0.1769139725, "date": "2023-11-02"},
-    {"Station_Number": "2260120", "norm": 0.1750451629, "date": "2023-11-03"},
-    {"Station_Number": "2260120", "norm": 0.1650781785, "date": "2023-11-04"},
-    {"Station_Number": "2260120", "norm": 0.1590356943, "date": "2023-11-05"},
-    {"Station_Number": "2260120", "norm": 0.1544882576, "date": "2023-11-06"},
-    {"Station_Number": "2260120", "norm": 0.1465769638, "date": "2023-11-07"},
-    {"Station_Number": "2260120", "norm": 0.1433376939, "date": "2023-11-08"},
-    {"Station_Number": "2260120", "norm": 0.1382919081, "date": "2023-11-09"},
-    {"Station_Number": "2260120", "norm": 0.1364230985, "date": "2023-11-10"},
-    {"Station_Number": "2260120", "norm": 0.1319379555, "date": "2023-11-11"},
-    {"Station_Number": "2260120", "norm": 0.1263938205, "date": "2023-11-12"},
-    {"Station_Number": "2260120", "norm": 0.123964368, "date": "2023-11-13"},
-    {"Station_Number": "2260120", "norm": 0.1214726219, "date": "2023-11-14"},
-    {"Station_Number": "2260120", "norm": 0.1192923441, "date": "2023-11-15"},
-    {"Station_Number": "2260120", "norm": 0.1172366536, "date": "2023-11-16"},
-    {"Station_Number": "2260120", "norm": 0.1166137171, "date": "2023-11-17"},
-    {"Station_Number": "2260120", "norm": 0.1175481218, "date": "2023-11-18"},
-    {"Station_Number": "2260120", "norm": 0.1217217965, "date": "2023-11-19"},
-    {"Station_Number": "2260120", "norm": 0.1401607176, "date": "2023-11-20"},
-    {"Station_Number": "2260120", "norm": 0.1700616707, "date": "2023-11-21"},
-    {"Station_Number": "2260120", "norm": 0.1675699246, "date": "2023-11-22"},
-    {"Station_Number": "2260120", "norm": 0.1524325671, "date": "2023-11-23"},
-    {"Station_Number": "2260120", "norm": 0.1459540273, "date": "2023-11-24"},
-    {"Station_Number": "2260120", "norm": 0.1407836541, "date": "2023-11-25"},
-    {"Station_Number": "2260120", "norm": 0.1364230985, "date": "2023-11-26"},
-    {"Station_Number": "2260120", "norm": 0.1257085903, "date": "2023-11-27"},
-    {"Station_Number": "2260120", "norm": 0.1146203202, "date": "2023-11-28"},
-    {"Station_Number": "2260120", "norm": 0.1079548994, "date": "2023-11-29"},
-    {"Station_Number": "2260120", "norm": 0.1058992089, "date": "2023-11-30"},
-    {"Station_Number": "2260120", "norm": 0.1052762723, "date": "2023-12-01"},
-    {"Station_Number": "2260120", "norm": 0.1045287485, "date": "2023-12-02"},
-    {"Station_Number": "2260120", "norm": 0.1033451691, "date": "2023-12-03"},
-    {"Station_Number": "2260120", "norm": 0.1017255342, "date": "2023-12-04"},
-    {"Station_Number": "2260120", "norm": 0.0987977325, "date": "2023-12-05"},
-    {"Station_Number": "2260120", "norm": 0.0966174547, "date": "2023-12-06"},
-    {"Station_Number": "2260120", "norm": 0.095122407, "date": "2023-12-07"},
-    {"Station_Number": "2260120", "norm": 0.0939388276, "date": "2023-12-08"},
-    {"Station_Number": "2260120", "norm": 0.0932535975, "date": "2023-12-09"},
-    {"Station_Number": "2260120", "norm": 0.0974272722, "date": "2023-12-10"},
-    {"Station_Number": "2260120", "norm": 0.1085778359, "date": "2023-12-11"},
-    {"Station_Number": "2260120", "norm": 0.1070827883, "date": "2023-12-12"},
-    {"Station_Number": "2260120", "norm": 0.1044041612, "date": "2023-12-13"},
-    {"Station_Number": "2260120", "norm": 0.1039681057, "date": "2023-12-14"},
-    {"Station_Number": "2260120", "norm": 0.0996698436, "date": "2023-12-15"},
-    {"Station_Number": "2260120", "norm": 0.0979256214, "date": "2023-12-16"},
-    {"Station_Number": "2260120", "norm": 0.0966174547, "date": "2023-12-17"},
-    {"Station_Number": "2260120", "norm": 0.0957453435, "date": "2023-12-18"},
-    {"Station_Number": "2260120", "norm": 0.0940011213, "date": "2023-12-19"},
-    {"Station_Number": "2260120", "norm": 0.0915716688, "date": "2023-12-20"},
-    {"Station_Number": "2260120", "norm": 0.0890176291, "date": "2023-12-21"},
-    {"Station_Number": "2260120", "norm": 0.0864012957, "date": "2023-12-22"},
-    {"Station_Number": "2260120", "norm": 0.0847816607, "date": "2023-12-23"},
-    {"Station_Number": "2260120", "norm": 0.0840341369, "date": "2023-12-24"},
-    {"Station_Number": "2260120", "norm": 0.0832243194, "date": "2023-12-25"},
-    {"Station_Number": "2260120", "norm": 0.0828505575, "date": "2023-12-26"},
-    {"Station_Number": "2260120", "norm": 0.082414502, "date": "2023-12-27"},
-    {"Station_Number": "2260120", "norm": 0.0815423908, "date": "2023-12-28"},
-    {"Station_Number": "2260120", "norm": 0.0801096368, "date": "2023-12-29"},
-    {"Station_Number": "2260120", "norm": 0.0785522955, "date": "2023-12-30"},
-    {"Station_Number": "2260120", "norm": 0.0774933034, "date": "2023-12-31"},
-    {"Station_Number": "2260400", "norm": 0.0785371703, "date": "2020-01-01"},
-    {"Station_Number": "2260400", "norm": 0.0782374101, "date": "2020-01-02"},
-    {"Station_Number": "2260400", "norm": 0.0773381295, "date": "2020-01-03"},
-    {"Station_Number": "2260400", "norm": 0.0761390887, "date": "2020-01-04"},
-    {"Station_Number": "2260400", "norm": 0.0763189448, "date": "2020-01-05"},
-    {"Station_Number": "2260400", "norm": 0.0786570743, "date": "2020-01-06"},
-    {"Station_Number": "2260400", "norm": 0.092146283, "date": "2020-01-07"},
-    {"Station_Number": "2260400", "norm": 0.1077338129, "date": "2020-01-08"},
-    {"Station_Number": "2260400", "norm": 0.1119304556, "date": "2020-01-09"},
-    {"Station_Number": "2260400", "norm": 0.1116906475, "date": "2020-01-10"},
-    {"Station_Number": "2260400", "norm": 0.0975419664, "date": "2020-01-11"},
-    {"Station_Number": "2260400", "norm": 0.0876498801, "date": "2020-01-12"},
-    {"Station_Number": "2260400", "norm": 0.0841127098, "date": "2020-01-13"},
-    {"Station_Number": "2260400", "norm": 0.0857314149, "date": "2020-01-14"},
-    {"Station_Number": "2260400", "norm": 0.0833333333, "date": "2020-01-15"},
-    {"Station_Number": "2260400", "norm": 0.0794364508, "date": "2020-01-16"},
-    {"Station_Number": "2260400", "norm": 0.078117506, "date": "2020-01-17"},
-    {"Station_Number": "2260400", "norm": 0.0775179856, "date": "2020-01-18"},
-    {"Station_Number": "2260400", "norm": 0.0767386091, "date": "2020-01-19"},
-    {"Station_Number": "2260400", "norm": 0.0745203837, "date": "2020-01-20"},
-    {"Station_Number": "2260400", "norm": 0.0743405276, "date": "2020-01-21"},
-    {"Station_Number": "2260400", "norm": 0.0733213429, "date": "2020-01-22"},
-    {"Station_Number": "2260400", "norm": 0.0723621103, "date": "2020-01-23"},
-    {"Station_Number": "2260400", "norm": 0.0714628297, "date": "2020-01-24"},
-    {"Station_Number": "2260400", "norm": 0.0792565947, "date": "2020-01-25"},
-    {"Station_Number": "2260400", "norm": 0.0809352518, "date": "2020-01-26"},
-    {"Station_Number": "2260400", "norm": 0.079616307, "date": "2020-01-27"},
-    {"Station_Number": "2260400", "norm": 0.0790167866, "date": "2020-01-28"},
-    {"Station_Number": "2260400", "norm": 0.0785371703, "date": "2020-01-29"},
-    {"Station_Number": "2260400", "norm": 0.0771582734, "date": "2020-01-30"},
-    {"Station_Number": "2260400", "norm": 0.0737410072, "date": "2020-01-31"},
-    {"Station_Number": "2260400", "norm": 0.0702038369, "date": "2020-02-01"},
-    {"Station_Number": "2260400", "norm": 0.0688848921, "date": "2020-02-02"},
-    {"Station_Number": "2260400", "norm": 0.0679256595, "date": "2020-02-03"},
-    {"Station_Number": "2260400", "norm": 0.0679256595, "date": "2020-02-04"},
-    {"Station_Number": "2260400", "norm": 0.0700239808, "date": "2020-02-05"},
-    {"Station_Number": "2260400", "norm": 0.0682853717, "date": "2020-02-06"},
-    {"Station_Number": "2260400", "norm": 0.0676258993, "date": "2020-02-07"},
-    {"Station_Number": "2260400", "norm": 0.067146283, "date": "2020-02-08"},
-    {"Station_Number": "2260400", "norm": 0.0667266187, "date": "2020-02-09"},
-    {"Station_Number": "2260400", "norm": 0.0660071942, "date": "2020-02-10"},
-    {"Station_Number": "2260400", "norm": 0.0650479616, "date": "2020-02-11"},
-    {"Station_Number": "2260400", "norm": 0.0633693046, "date": "2020-02-12"},
-    {"Station_Number": "2260400", "norm": 0.0650479616, "date": "2020-02-13"},
-    {"Station_Number": "2260400", "norm": 0.0702038369, "date": "2020-02-14"},
-    {"Station_Number": "2260400", "norm": 0.0666067146, "date": "2020-02-15"},
-    {"Station_Number": "2260400", "norm": 0.0636690647, "date": "2020-02-16"},
-    {"Station_Number": "2260400", "norm": 0.0619304556, "date": "2020-02-17"},
-    {"Station_Number": "2260400", "norm": 0.0617505995, "date": "2020-02-18"},
-    {"Station_Number": "2260400", "norm": 0.062470024, "date": "2020-02-19"},
-    {"Station_Number": "2260400", "norm": 0.0626498801, "date": "2020-02-20"},
-    {"Station_Number": "2260400", "norm": 0.0623501199, "date": "2020-02-21"},
-    {"Station_Number": "2260400", "norm": 0.0619304556, "date": "2020-02-22"},
-    {"Station_Number": "2260400", "norm": 0.0675659472, "date": "2020-02-23"},
-    {"Station_Number": "2260400", "norm": 0.0681055156, "date": "2020-02-24"},
-    {"Station_Number": "2260400", "norm": 0.0647482014, "date": "2020-02-25"},
-    {"Station_Number": "2260400", "norm": 0.0626498801, "date": "2020-02-26"},
-    {"Station_Number": "2260400", "norm": 0.0619304556, "date": "2020-02-27"},
-    {"Station_Number": "2260400", "norm": 0.0614508393, "date": "2020-02-28"},
-    {"Station_Number": "2260400", "norm": 0.0614508393, "date": "2020-02-29"},
-    {"Station_Number": "2260400", "norm": 0.0617505995, "date": "2020-03-01"},
-    {"Station_Number": "2260400", "norm": 0.0736810552, "date": "2020-03-02"},
-    {"Station_Number": "2260400", "norm": 0.0775179856, "date": "2020-03-03"},
-    {"Station_Number": "2260400", "norm": 0.0702038369, "date": "2020-03-04"},
-    {"Station_Number": "2260400", "norm": 0.0670263789, "date": "2020-03-05"},
-    {"Station_Number": "2260400", "norm": 0.0651678657, "date": "2020-03-06"},
-    {"Station_Number": "2260400", "norm": 0.0729016787, "date": "2020-03-07"},
-    {"Station_Number": "2260400", "norm": 0.0747601918, "date": "2020-03-08"},
-    {"Station_Number": "2260400", "norm": 0.0690647482, "date": "2020-03-09"},
-    {"Station_Number": "2260400", "norm": 0.0663069544, "date": "2020-03-10"},
-    {"Station_Number": "2260400", "norm": 0.0649280576, "date": "2020-03-11"},
-    {"Station_Number": "2260400", "norm": 0.070263789, "date": "2020-03-12"},
-    {"Station_Number": "2260400", "norm": 0.0777577938, "date": "2020-03-13"},
-    {"Station_Number": "2260400", "norm": 0.0712829736, "date": "2020-03-14"},
-    {"Station_Number": "2260400", "norm": 0.0660071942, "date": "2020-03-15"},
-    {"Station_Number": "2260400", "norm": 0.0664268585, "date": "2020-03-16"},
-    {"Station_Number": "2260400", "norm": 0.067146283, "date": "2020-03-17"},
-    {"Station_Number": "2260400", "norm": 0.0654676259, "date": "2020-03-18"},
-    {"Station_Number": "2260400", "norm": 0.068764988, "date": "2020-03-19"},
-    {"Station_Number": "2260400", "norm": 0.0768585132, "date": "2020-03-20"},
-    {"Station_Number": "2260400", "norm": 0.0802158273, "date": "2020-03-21"},
-    {"Station_Number": "2260400", "norm": 0.0757194245, "date": "2020-03-22"},
-    {"Station_Number": "2260400", "norm": 0.0692446043, "date": "2020-03-23"},
-    {"Station_Number": "2260400", "norm": 0.0647482014, "date": "2020-03-24"},
-    {"Station_Number": "2260400", "norm": 0.0626498801, "date": "2020-03-25"},
-    {"Station_Number": "2260400", "norm": 0.0616306954, "date": "2020-03-26"},
-    {"Station_Number": "2260400", "norm": 0.0616306954, "date": "2020-03-27"},
-    {"Station_Number": "2260400", "norm": 0.0643285372, "date": "2020-03-28"},
-    {"Station_Number": "2260400", "norm": 0.0647482014, "date": "2020-03-29"},
-    {"Station_Number": "2260400", "norm": 0.06558753, "date": "2020-03-30"},
-    {"Station_Number": "2260400", "norm": 0.0651678657, "date": "2020-03-31"},
-    {"Station_Number": "2260400", "norm": 0.0723621103, "date": "2020-04-01"},
-    {"Station_Number": "2260400", "norm": 0.099940048, "date": "2020-04-02"},
-    {"Station_Number": "2260400", "norm": 0.0971223022, "date": "2020-04-03"},
-    {"Station_Number": "2260400", "norm": 0.0830335731, "date": "2020-04-04"},
-    {"Station_Number": "2260400", "norm": 0.0757194245, "date": "2020-04-05"},
-    {"Station_Number": "2260400", "norm": 0.0708633094, "date": "2020-04-06"},
-    {"Station_Number": "2260400", "norm": 0.0690647482, "date": "2020-04-07"},
-    {"Station_Number": "2260400", "norm": 0.0737410072, "date": "2020-04-08"},
-    {"Station_Number": "2260400", "norm": 0.068764988, "date": "2020-04-09"},
-    {"Station_Number": "2260400", "norm": 0.0639088729, "date": "2020-04-10"},
-    {"Station_Number": "2260400", "norm": 0.062470024, "date": "2020-04-11"},
-    {"Station_Number": "2260400", "norm": 0.0636690647, "date": "2020-04-12"},
-    {"Station_Number": "2260400", "norm": 0.0646282974, "date": "2020-04-13"},
-    {"Station_Number": "2260400", "norm": 0.0682853717, "date": "2020-04-14"},
-    {"Station_Number": "2260400", "norm": 0.0708033573, "date": "2020-04-15"},
-    {"Station_Number": "2260400", "norm": 0.0679256595, "date": "2020-04-16"},
-    {"Station_Number": "2260400", "norm": 0.0660071942, "date": "2020-04-17"},
-    {"Station_Number": "2260400", "norm": 0.0669064748, "date": "2020-04-18"},
-    {"Station_Number": "2260400", "norm": 0.070323741, "date": "2020-04-19"},
-    {"Station_Number": "2260400", "norm": 0.0795563549, "date": "2020-04-20"},
-    {"Station_Number": "2260400", "norm": 0.1010191847, "date": "2020-04-21"},
-    {"Station_Number": "2260400", "norm": 0.1029376499, "date": "2020-04-22"},
-    {"Station_Number": "2260400", "norm": 0.1199040767, "date": "2020-04-23"},
-    {"Station_Number": "2260400", "norm": 0.1260791367, "date": "2020-04-24"},
-    {"Station_Number": "2260400", "norm": 0.1241007194, "date": "2020-04-25"},
-    {"Station_Number": "2260400", "norm": 0.1492805755, "date": "2020-04-26"},
-    {"Station_Number": "2260400", "norm": 0.1399880096, "date": "2020-04-27"},
-    {"Station_Number": "2260400", "norm": 0.1266786571, "date": "2020-04-28"},
-    {"Station_Number": "2260400", "norm": 0.1395083933, "date": "2020-04-29"},
-    {"Station_Number": "2260400", "norm": 0.1294964029, "date": "2020-04-30"},
-    {"Station_Number": "2260400", "norm": 0.1121103118, "date": "2020-05-01"},
-    {"Station_Number": "2260400", "norm": 0.1101318945, "date": "2020-05-02"},
-    {"Station_Number": "2260400", "norm": 0.1336930456, "date": "2020-05-03"},
-    {"Station_Number": "2260400", "norm": 0.1324940048, "date": "2020-05-04"},
-    {"Station_Number": "2260400", "norm": 0.1143285372, "date": "2020-05-05"},
-    {"Station_Number": "2260400", "norm": 0.1032374101, "date": "2020-05-06"},
-    {"Station_Number": "2260400", "norm": 0.1002997602, "date": "2020-05-07"},
-    {"Station_Number": "2260400", "norm": 0.0995203837, "date": "2020-05-08"},
-    {"Station_Number": "2260400", "norm": 0.1013189448, "date": "2020-05-09"},
-    {"Station_Number": "2260400", "norm": 0.104736211, "date": "2020-05-10"},
-    {"Station_Number": "2260400", "norm": 0.1098920863, "date": "2020-05-11"},
-    {"Station_Number": "2260400", "norm": 0.1014388489, "date": "2020-05-12"},
-    {"Station_Number": "2260400", "norm": 0.0973021583, "date": "2020-05-13"},
-    {"Station_Number": "2260400", "norm": 0.084352518, "date": "2020-05-14"},
-    {"Station_Number": "2260400", "norm": 0.0799160671, "date": "2020-05-15"},
-    {"Station_Number": "2260400", "norm": 0.087529976, "date": "2020-05-16"},
-    {"Station_Number": "2260400", "norm": 0.1133093525, "date": "2020-05-17"},
-    {"Station_Number": "2260400", "norm": 0.128117506, "date": "2020-05-18"},
-    {"Station_Number": "2260400", "norm": 0.110911271, "date": "2020-05-19"},
-    {"Station_Number": "2260400", "norm": 0.1164868106, "date": "2020-05-20"},
-    {"Station_Number": "2260400", "norm": 0.1128896882, "date": "2020-05-21"},
-    {"Station_Number": "2260400", "norm": 0.103117506, "date": "2020-05-22"},
-    {"Station_Number": "2260400", "norm": 0.1073141487, "date": "2020-05-23"},
-    {"Station_Number": "2260400", "norm": 0.120323741, "date": "2020-05-24"},
-    {"Station_Number": "2260400", "norm": 0.1912470024, "date": "2020-05-25"},
-    {"Station_Number": "2260400", "norm": 0.2595923261, "date": "2020-05-26"},
-    {"Station_Number": "2260400", "norm": 0.3309352518, "date": "2020-05-27"},
-    {"Station_Number": "2260400", "norm": 0.4668465228, "date": "2020-05-28"},
-    {"Station_Number": "2260400", "norm": 0.5592326139, "date": "2020-05-29"},
-    {"Station_Number": "2260400", "norm": 0.6026978417, "date": "2020-05-30"},
-    {"Station_Number": "2260400", "norm": 0.5929256595, "date": "2020-05-31"},
-    {"Station_Number": "2260400", "norm": 0.518705036, "date": "2020-06-01"},
-    {"Station_Number": "2260400", "norm": 0.4034772182, "date": "2020-06-02"},
-    {"Station_Number": "2260400", "norm": 0.3042565947, "date": "2020-06-03"},
-    {"Station_Number": "2260400", "norm": 0.2516786571, "date": "2020-06-04"},
-    {"Station_Number": "2260400", "norm": 0.2664868106, "date": "2020-06-05"},
-    {"Station_Number": "2260400", "norm": 0.2862709832, "date": "2020-06-06"},
-    {"Station_Number": "2260400", "norm": 0.3019784173, "date": "2020-06-07"},
-    {"Station_Number": "2260400", "norm": 0.2943645084, "date": "2020-06-08"},
-    {"Station_Number": "2260400", "norm": 0.3064748201, "date": "2020-06-09"},
-    {"Station_Number": "2260400", "norm": 0.3282374101, "date": "2020-06-10"},
-    {"Station_Number": "2260400", "norm": 0.3161270983, "date": "2020-06-11"},
-    {"Station_Number": "2260400", "norm": 0.2763788969, "date": "2020-06-12"},
-    {"Station_Number": "2260400", "norm": 0.270383693, "date": "2020-06-13"},
-    {"Station_Number": "2260400", "norm": 0.3291366906, "date": "2020-06-14"},
-    {"Station_Number": "2260400", "norm": 0.4057553957, "date": "2020-06-15"},
-    {"Station_Number": "2260400", "norm": 0.4181654676, "date": "2020-06-16"},
-    {"Station_Number": "2260400", "norm": 0.4105515588, "date": "2020-06-17"},
-    {"Station_Number": "2260400", "norm": 0.4448441247, "date": "2020-06-18"},
-    {"Station_Number": "2260400", "norm": 0.5101918465, "date": "2020-06-19"},
-    {"Station_Number": "2260400", "norm": 0.5655275779, "date": "2020-06-20"},
-    {"Station_Number": "2260400", "norm": 0.593705036, "date": "2020-06-21"},
-    {"Station_Number": "2260400", "norm": 0.6200839329, "date": "2020-06-22"},
-    {"Station_Number": "2260400", "norm": 0.6414868106, "date": "2020-06-23"},
-    {"Station_Number": "2260400", "norm": 0.6646882494, "date": "2020-06-24"},
-    {"Station_Number": "2260400", "norm": 0.6930455635, "date": "2020-06-25"},
-    {"Station_Number": "2260400", "norm": 0.7152278177, "date": "2020-06-26"},
-    {"Station_Number": "2260400", "norm": 0.7260191847, "date": "2020-06-27"},
-    {"Station_Number": "2260400", "norm": 0.7102517986, "date": "2020-06-28"},
-    {"Station_Number": "2260400", "norm": 0.7074340528, "date": "2020-06-29"},
-    {"Station_Number": "2260400", "norm": 0.7339928058, "date": "2020-06-30"},
-    {"Station_Number": "2260400", "norm": 0.7585731415, "date": "2020-07-01"},
-    {"Station_Number": "2260400", "norm": 0.7685851319, "date": "2020-07-02"},
-    {"Station_Number": "2260400", "norm": 0.7633693046, "date": "2020-07-03"},
-    {"Station_Number": "2260400", "norm": 0.7465827338, "date": "2020-07-04"},
-    {"Station_Number": "2260400", "norm": 0.7326139089, "date": "2020-07-05"},
-    {"Station_Number": "2260400", "norm": 0.7142086331, "date": "2020-07-06"},
-    {"Station_Number": "2260400", "norm": 0.7106115108, "date": "2020-07-07"},
-    {"Station_Number": "2260400", "norm": 0.714028777, "date": "2020-07-08"},
-    {"Station_Number": "2260400", "norm": 0.7384292566, "date": "2020-07-09"},
-    {"Station_Number": "2260400", "norm": 0.7685851319, "date": "2020-07-10"},
-    {"Station_Number": "2260400", "norm": 0.7997601918, "date": "2020-07-11"},
-    {"Station_Number": "2260400", "norm": 0.8431055156, "date": "2020-07-12"},
-    {"Station_Number": "2260400", "norm": 0.893705036, "date": "2020-07-13"},
-    {"Station_Number": "2260400", "norm": 0.9448441247, "date": "2020-07-14"},
-    {"Station_Number": "2260400", "norm": 0.9736211031, "date": "2020-07-15"},
-    {"Station_Number": "2260400", "norm": 0.9760191847, "date": "2020-07-16"},
-    {"Station_Number": "2260400", "norm": 0.9658273381, "date": "2020-07-17"},
-    {"Station_Number": "2260400", "norm": 0.9508393285, "date": "2020-07-18"},
-    {"Station_Number": "2260400", "norm": 0.9376498801, "date": "2020-07-19"},
-    {"Station_Number": "2260400", "norm": 0.9376498801, "date": "2020-07-20"},
-    {"Station_Number": "2260400", "norm": 0.9514388489, "date": "2020-07-21"},
-    {"Station_Number": "2260400", "norm": 0.9622302158, "date": "2020-07-22"},
-    {"Station_Number": "2260400", "norm": 0.9778177458, "date": "2020-07-23"},
-    {"Station_Number": "2260400", "norm": 0.9952038369, "date": "2020-07-24"},
-    {"Station_Number": "2260400", "norm": 1.0, "date": "2020-07-25"},
-    {"Station_Number": "2260400", "norm": 0.9940047962, "date": "2020-07-26"},
-    {"Station_Number": "2260400", "norm": 0.9748201439, "date": "2020-07-27"},
-    {"Station_Number": "2260400", "norm": 0.9460431655, "date": "2020-07-28"},
-    {"Station_Number": "2260400", "norm": 0.9080935252, "date": "2020-07-29"},
-    {"Station_Number": "2260400", "norm": 0.8619304556, "date": "2020-07-30"},
-    {"Station_Number": "2260400", "norm": 0.7939448441, "date": "2020-07-31"},
-    {"Station_Number": "2260400", "norm": 0.7142086331, "date": "2020-08-01"},
-    {"Station_Number": "2260400", "norm": 0.6318944844, "date": "2020-08-02"},
-    {"Station_Number": "2260400", "norm": 0.5517386091, "date": "2020-08-03"},
-    {"Station_Number": "2260400", "norm": 0.4929856115, "date": "2020-08-04"},
-    {"Station_Number": "2260400", "norm": 0.4517386091, "date": "2020-08-05"},
-    {"Station_Number": "2260400", "norm": 0.3994004796, "date": "2020-08-06"},
-    {"Station_Number": "2260400", "norm": 0.3892086331, "date": "2020-08-07"},
-    {"Station_Number": "2260400", "norm": 0.3932853717, "date": "2020-08-08"},
-    {"Station_Number": "2260400", "norm": 0.3884892086, "date": "2020-08-09"},
-    {"Station_Number": "2260400", "norm": 0.4226618705, "date": "2020-08-10"},
-    {"Station_Number": "2260400", "norm": 0.4962230216, "date": "2020-08-11"},
-    {"Station_Number": "2260400", "norm": 0.5885491607, "date": "2020-08-12"},
-    {"Station_Number": "2260400", "norm": 0.6930455635, "date": "2020-08-13"},
-    {"Station_Number": "2260400", "norm": 0.7505995204, "date": "2020-08-14"},
-    {"Station_Number": "2260400", "norm": 0.7907673861, "date": "2020-08-15"},
-    {"Station_Number": "2260400", "norm": 0.8111510791, "date": "2020-08-16"},
-    {"Station_Number": "2260400", "norm": 0.8325539568, "date": "2020-08-17"},
-    {"Station_Number": "2260400", "norm": 0.843705036, "date": "2020-08-18"},
-    {"Station_Number": "2260400", "norm": 0.8757194245, "date": "2020-08-19"},
-    {"Station_Number": "2260400", "norm": 0.9086930456, "date": "2020-08-20"},
-    {"Station_Number": "2260400", "norm": 0.9676258993, "date": "2020-08-21"},
-    {"Station_Number": "2260400", "norm": 0.9664268585, "date": "2020-08-22"},
-    {"Station_Number": "2260400", "norm": 0.9298561151, "date": "2020-08-23"},
-    {"Station_Number": "2260400", "norm": 0.8794964029, "date": "2020-08-24"},
-    {"Station_Number": "2260400", "norm": 0.8561151079, "date": "2020-08-25"},
-    {"Station_Number": "2260400", "norm": 0.7720023981, "date": "2020-08-26"},
-    {"Station_Number": "2260400", "norm": 0.7350119904, "date": "2020-08-27"},
-    {"Station_Number": "2260400", "norm": 0.7230215827, "date": "2020-08-28"},
-    {"Station_Number": "2260400", "norm": 0.671882494, "date": "2020-08-29"},
-    {"Station_Number": "2260400", "norm": 0.6152877698, "date": "2020-08-30"},
-    {"Station_Number": "2260400", "norm": 0.5963429257, "date": "2020-08-31"},
-    {"Station_Number": "2260400", "norm": 0.6175059952, "date": "2020-09-01"},
-    {"Station_Number": "2260400", "norm": 0.6520983213, "date": "2020-09-02"},
-    {"Station_Number": "2260400", "norm": 0.6642685851, "date": "2020-09-03"},
-    {"Station_Number": "2260400", "norm": 0.6425059952, "date": "2020-09-04"},
-    {"Station_Number": "2260400", "norm": 0.5847122302, "date": "2020-09-05"},
-    {"Station_Number": "2260400", "norm": 0.5221822542, "date": "2020-09-06"},
-    {"Station_Number": "2260400", "norm": 0.4902278177, "date": "2020-09-07"},
-    {"Station_Number": "2260400", "norm": 0.4974220624, "date": "2020-09-08"},
-    {"Station_Number": "2260400", "norm": 0.525, "date": "2020-09-09"},
-    {"Station_Number": "2260400", "norm": 0.5325539568, "date": "2020-09-10"},
-    {"Station_Number": "2260400", "norm": 0.5297961631, "date": "2020-09-11"},
-    {"Station_Number": "2260400", "norm": 0.5309952038, "date": "2020-09-12"},
-    {"Station_Number": "2260400", "norm": 0.5384892086, "date": "2020-09-13"},
-    {"Station_Number": "2260400", "norm": 0.5795563549, "date": "2020-09-14"},
-    {"Station_Number": "2260400", "norm": 0.6157074341, "date": "2020-09-15"},
-    {"Station_Number": "2260400", "norm": 0.6618705036, "date": "2020-09-16"},
-    {"Station_Number": "2260400", "norm": 0.7096522782, "date": "2020-09-17"},
-    {"Station_Number": "2260400", "norm": 0.7511990408, "date": "2020-09-18"},
-    {"Station_Number": "2260400", "norm": 0.7817745803, "date": "2020-09-19"},
-    {"Station_Number": "2260400", "norm": 0.7931654676, "date": "2020-09-20"},
-    {"Station_Number": "2260400", "norm": 0.7771582734, "date": "2020-09-21"},
-    {"Station_Number": "2260400", "norm": 0.7270383693, "date": "2020-09-22"},
-    {"Station_Number": "2260400", "norm": 0.6580935252, "date": "2020-09-23"},
-    {"Station_Number": "2260400", "norm": 0.6300959233, "date": "2020-09-24"},
-    {"Station_Number": "2260400", "norm": 0.6748800959, "date": "2020-09-25"},
-    {"Station_Number": "2260400", "norm": 0.7505995204, "date": "2020-09-26"},
-    {"Station_Number": "2260400", "norm": 0.8151678657, "date": "2020-09-27"},
-    {"Station_Number": "2260400", "norm": 0.8682853717, "date": "2020-09-28"},
-    {"Station_Number": "2260400", "norm": 0.9286570743, "date": "2020-09-29"},
-    {"Station_Number": "2260400", "norm": 0.9658273381, "date": "2020-09-30"},
-    {"Station_Number": "2260400", "norm": 0.9712230216, "date": "2020-10-01"},
-    {"Station_Number": "2260400", "norm": 0.9502398082, "date": "2020-10-02"},
-    {"Station_Number": "2260400", "norm": 0.9102517986, "date": "2020-10-03"},
-    {"Station_Number": "2260400", "norm": 0.849940048, "date": "2020-10-04"},
-    {"Station_Number": "2260400", "norm": 0.7829736211, "date": "2020-10-05"},
-    {"Station_Number": "2260400", "norm": 0.7303956835, "date": "2020-10-06"},
-    {"Station_Number": "2260400", "norm": 0.6930455635, "date": "2020-10-07"},
-    {"Station_Number": "2260400", "norm": 0.675059952, "date": "2020-10-08"},
-    {"Station_Number": "2260400", "norm": 0.6626498801, "date": "2020-10-09"},
-    {"Station_Number": "2260400", "norm": 0.653057554, "date": "2020-10-10"},
-    {"Station_Number": "2260400", "norm": 0.626498801, "date": "2020-10-11"},
-    {"Station_Number": "2260400", "norm": 0.5735611511, "date": "2020-10-12"},
-    {"Station_Number": "2260400", "norm": 0.5113908873, "date": "2020-10-13"},
-    {"Station_Number": "2260400", "norm": 0.4564148681, "date": "2020-10-14"},
-    {"Station_Number": "2260400", "norm": 0.4050959233, "date": "2020-10-15"},
-    {"Station_Number": "2260400", "norm": 0.3645083933, "date": "2020-10-16"},
-    {"Station_Number": "2260400", "norm": 0.3303357314, "date": "2020-10-17"},
-    {"Station_Number": "2260400", "norm": 0.3070743405, "date": "2020-10-18"},
-    {"Station_Number": "2260400", "norm": 0.2877697842, "date": "2020-10-19"},
-    {"Station_Number": "2260400", "norm": 0.2982613909, "date": "2020-10-20"},
-    {"Station_Number": "2260400", "norm": 0.3174460432, "date": "2020-10-21"},
-    {"Station_Number": "2260400", "norm": 0.4006594724, "date": "2020-10-22"},
-    {"Station_Number": "2260400", "norm": 0.4769184652, "date": "2020-10-23"},
-    {"Station_Number": "2260400", "norm": 0.5350719424, "date": "2020-10-24"},
-    {"Station_Number": "2260400", "norm": 0.5485611511, "date": "2020-10-25"},
-    {"Station_Number": "2260400", "norm": 0.5807553957, "date": "2020-10-26"},
-    {"Station_Number": "2260400", "norm": 0.6512589928, "date": "2020-10-27"},
-    {"Station_Number": "2260400", "norm": 0.6954436451, "date": "2020-10-28"},
-    {"Station_Number": "2260400", "norm": 0.6818345324, "date": "2020-10-29"},
-    {"Station_Number": "2260400", "norm": 0.6065347722, "date": "2020-10-30"},
-    {"Station_Number": "2260400", "norm": 0.5001798561, "date": "2020-10-31"},
-    {"Station_Number": "2260400", "norm": 0.4133693046, "date": "2020-11-01"},
-    {"Station_Number": "2260400", "norm": 0.3541366906, "date": "2020-11-02"},
-    {"Station_Number": "2260400", "norm": 0.2931654676, "date": "2020-11-03"},
-    {"Station_Number": "2260400", "norm": 0.4063549161, "date": "2020-11-04"},
-    {"Station_Number": "2260400", "norm": 0.4538369305, "date": "2020-11-05"},
-    {"Station_Number": "2260400", "norm": 0.4504196643, "date": "2020-11-06"},
-    {"Station_Number": "2260400", "norm": 0.4316546763, "date": "2020-11-07"},
-    {"Station_Number": "2260400", "norm": 0.4063549161, "date": "2020-11-08"},
-    {"Station_Number": "2260400", "norm": 0.3502398082, "date": "2020-11-09"},
-    {"Station_Number": "2260400", "norm": 0.3129496403, "date": "2020-11-10"},
-    {"Station_Number": "2260400", "norm": 0.2838729017, "date": "2020-11-11"},
-    {"Station_Number": "2260400", "norm": 0.264088729, "date": "2020-11-12"},
-    {"Station_Number": "2260400", "norm": 0.2470023981, "date": "2020-11-13"},
-    {"Station_Number": "2260400", "norm": 0.2348920863, "date": "2020-11-14"},
-    {"Station_Number": "2260400", "norm": 0.2230215827, "date": "2020-11-15"},
-    {"Station_Number": "2260400", "norm": 0.2131294964, "date": "2020-11-16"},
-    {"Station_Number": "2260400", "norm": 0.2038369305, "date": "2020-11-17"},
-    {"Station_Number": "2260400", "norm": 0.1963429257, "date": "2020-11-18"},
-    {"Station_Number": "2260400", "norm": 0.1882494005, "date": "2020-11-19"},
-    {"Station_Number": "2260400", "norm": 0.1810551559, "date": "2020-11-20"},
-    {"Station_Number": "2260400", "norm": 0.1786570743, "date": "2020-11-21"},
-    {"Station_Number": "2260400", "norm": 0.1786570743, "date": "2020-11-22"},
-    {"Station_Number": "2260400", "norm": 0.1772781775, "date": "2020-11-23"},
-    {"Station_Number": "2260400", "norm": 0.1723621103, "date": "2020-11-24"},
-    {"Station_Number": "2260400", "norm": 0.1630695444, "date": "2020-11-25"},
-    {"Station_Number": "2260400", "norm": 0.1564748201, "date": "2020-11-26"},
-    {"Station_Number": "2260400", "norm": 0.1519784173, "date": "2020-11-27"},
-    {"Station_Number": "2260400", "norm": 0.1422661871, "date": "2020-11-28"},
-    {"Station_Number": "2260400", "norm": 0.1384892086, "date": "2020-11-29"},
-    {"Station_Number": "2260400", "norm": 0.1332733813, "date": "2020-11-30"},
-    {"Station_Number": "2260400", "norm": 0.128117506, "date": "2020-12-01"},
-    {"Station_Number": "2260400", "norm": 0.1230815348, "date": "2020-12-02"},
-    {"Station_Number": "2260400", "norm": 0.1205035971, "date": "2020-12-03"},
-    {"Station_Number": "2260400", "norm": 0.1176858513, "date": "2020-12-04"},
-    {"Station_Number": "2260400", "norm": 0.1155275779, "date": "2020-12-05"},
-    {"Station_Number": "2260400", "norm": 0.1145083933, "date": "2020-12-06"},
-    {"Station_Number": "2260400", "norm": 0.112529976, "date": "2020-12-07"},
-    {"Station_Number": "2260400", "norm": 0.1079136691, "date": "2020-12-08"},
-    {"Station_Number": "2260400", "norm": 0.1061151079, "date": "2020-12-09"},
-    {"Station_Number": "2260400", "norm": 0.104736211, "date": "2020-12-10"},
-    {"Station_Number": "2260400", "norm": 0.1026978417, "date": "2020-12-11"},
-    {"Station_Number": "2260400", "norm": 0.1017985612, "date": "2020-12-12"},
-    {"Station_Number": "2260400", "norm": 0.1004196643, "date": "2020-12-13"},
-    {"Station_Number": "2260400", "norm": 0.0992206235, "date": "2020-12-14"},
-    {"Station_Number": "2260400", "norm": 0.0986211031, "date": "2020-12-15"},
-    {"Station_Number": "2260400", "norm": 0.0979016787, "date": "2020-12-16"},
-    {"Station_Number": "2260400", "norm": 0.0974220624, "date": "2020-12-17"},
-    {"Station_Number": "2260400", "norm": 0.0971223022, "date": "2020-12-18"},
-    {"Station_Number": "2260400", "norm": 0.0971223022, "date": "2020-12-19"},
-    {"Station_Number": "2260400", "norm": 0.0962230216, "date": "2020-12-20"},
-    {"Station_Number": "2260400", "norm": 0.09382494, "date": "2020-12-21"},
-    {"Station_Number": "2260400", "norm": 0.0923261391, "date": "2020-12-22"},
-    {"Station_Number": "2260400", "norm": 0.0911270983, "date": "2020-12-23"},
-    {"Station_Number": "2260400", "norm": 0.0896282974, "date": "2020-12-24"},
-    {"Station_Number": "2260400", "norm": 0.0893285372, "date": "2020-12-25"},
-    {"Station_Number": "2260400", "norm": 0.0878297362, "date": "2020-12-26"},
-    {"Station_Number": "2260400", "norm": 0.085911271, "date": "2020-12-27"},
-    {"Station_Number": "2260400", "norm": 0.0857314149, "date": "2020-12-28"},
-    {"Station_Number": "2260400", "norm": 0.0851318945, "date": "2020-12-29"},
-    {"Station_Number": "2260400", "norm": 0.0845323741, "date": "2020-12-30"},
-    {"Station_Number": "2260400", "norm": 0.0845323741, "date": "2020-12-31"},
-    {"Station_Number": "2260400", "norm": 0.0903080873, "date": "2021-01-01"},
-    {"Station_Number": "2260400", "norm": 0.0892169448, "date": "2021-01-02"},
-    {"Station_Number": "2260400", "norm": 0.0883825417, "date": "2021-01-03"},
-    {"Station_Number": "2260400", "norm": 0.0872913992, "date": "2021-01-04"},
-    {"Station_Number": "2260400", "norm": 0.086521181, "date": "2021-01-05"},
-    {"Station_Number": "2260400", "norm": 0.0863286264, "date": "2021-01-06"},
-    {"Station_Number": "2260400", "norm": 0.0863286264, "date": "2021-01-07"},
-    {"Station_Number": "2260400", "norm": 0.0860077022, "date": "2021-01-08"},
-    {"Station_Number": "2260400", "norm": 0.0860077022, "date": "2021-01-09"},
-    {"Station_Number": "2260400", "norm": 0.0860077022, "date": "2021-01-10"},
-    {"Station_Number": "2260400", "norm": 0.0856867779, "date": "2021-01-11"},
-    {"Station_Number": "2260400", "norm": 0.0856867779, "date": "2021-01-12"},
-    {"Station_Number": "2260400", "norm": 0.0856867779, "date": "2021-01-13"},
-    {"Station_Number": "2260400", "norm": 0.0853658537, "date": "2021-01-14"},
-    {"Station_Number": "2260400", "norm": 0.0850449294, "date": "2021-01-15"},
-    {"Station_Number": "2260400", "norm": 0.0850449294, "date": "2021-01-16"},
-    {"Station_Number": "2260400", "norm": 0.0850449294, "date": "2021-01-17"},
-    {"Station_Number": "2260400", "norm": 0.0847240051, "date": "2021-01-18"},
-    {"Station_Number": "2260400", "norm": 0.0847240051, "date": "2021-01-19"},
-    {"Station_Number": "2260400", "norm": 0.0847240051, "date": "2021-01-20"},
-    {"Station_Number": "2260400", "norm": 0.0844030809, "date": "2021-01-21"},
-    {"Station_Number": "2260400", "norm": 0.0839537869, "date": "2021-01-22"},
-    {"Station_Number": "2260400", "norm": 0.0837612323, "date": "2021-01-23"},
-    {"Station_Number": "2260400", "norm": 0.0834403081, "date": "2021-01-24"},
-    {"Station_Number": "2260400", "norm": 0.0834403081, "date": "2021-01-25"},
-    {"Station_Number": "2260400", "norm": 0.0834403081, "date": "2021-01-26"},
-    {"Station_Number": "2260400", "norm": 0.0827984596, "date": "2021-01-27"},
-    {"Station_Number": "2260400", "norm": 0.082156611, "date": "2021-01-28"},
-    {"Station_Number": "2260400", "norm": 0.082156611, "date": "2021-01-29"},
-    {"Station_Number": "2260400", "norm": 0.0815147625, "date": "2021-01-30"},
-    {"Station_Number": "2260400", "norm": 0.0815147625, "date": "2021-01-31"},
-    {"Station_Number": "2260400", "norm": 0.0815147625, "date": "2021-02-01"},
-    {"Station_Number": "2260400", "norm": 0.080872914, "date": "2021-02-02"},
-    {"Station_Number": "2260400", "norm": 0.080872914, "date": "2021-02-03"},
-    {"Station_Number": "2260400", "norm": 0.080872914, "date": "2021-02-04"},
-    {"Station_Number": "2260400", "norm": 0.0802310655, "date": "2021-02-05"},
-    {"Station_Number": "2260400", "norm": 0.0802310655, "date": "2021-02-06"},
-    {"Station_Number": "2260400", "norm": 0.0795892169, "date": "2021-02-07"},
-    {"Station_Number": "2260400", "norm": 0.0795892169, "date": "2021-02-08"},
-    {"Station_Number": "2260400", "norm": 0.0789473684, "date": "2021-02-09"},
-    {"Station_Number": "2260400", "norm": 0.0783055199, "date": "2021-02-10"},
-    {"Station_Number": "2260400", "norm": 0.0776636714, "date": "2021-02-11"},
-    {"Station_Number": "2260400", "norm": 0.0770218228, "date": "2021-02-12"},
-    {"Station_Number": "2260400", "norm": 0.076508344, "date": "2021-02-13"},
-    {"Station_Number": "2260400", "norm": 0.0759948652, "date": "2021-02-14"},
-    {"Station_Number": "2260400", "norm": 0.0754813864, "date": "2021-02-15"},
-    {"Station_Number": "2260400", "norm": 0.0754813864, "date": "2021-02-16"},
-    {"Station_Number": "2260400", "norm": 0.0749679076, "date": "2021-02-17"},
-    {"Station_Number": "2260400", "norm": 0.0749679076, "date": "2021-02-18"},
-    {"Station_Number": "2260400", "norm": 0.0744544288, "date": "2021-02-19"},
-    {"Station_Number": "2260400", "norm": 0.0739409499, "date": "2021-02-20"},
-    {"Station_Number": "2260400", "norm": 0.0734274711, "date": "2021-02-21"},
-    {"Station_Number": "2260400", "norm": 0.0734274711, "date": "2021-02-22"},
-    {"Station_Number": "2260400", "norm": 0.0729139923, "date": "2021-02-23"},
-    {"Station_Number": "2260400", "norm": 0.0729139923, "date": "2021-02-24"},
-    {"Station_Number": "2260400", "norm": 0.0729139923, "date": "2021-02-25"},
-    {"Station_Number": "2260400", "norm": 0.0724005135, "date": "2021-02-26"},
-    {"Station_Number": "2260400", "norm": 0.0724005135, "date": "2021-02-27"},
-    {"Station_Number": "2260400", "norm": 0.0724005135, "date": "2021-02-28"},
-    {"Station_Number": "2260400", "norm": 0.0724005135, "date": "2021-03-01"},
-    {"Station_Number": "2260400", "norm": 0.0724005135, "date": "2021-03-02"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-03"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-04"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-05"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-06"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-07"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-08"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-09"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-10"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-11"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-12"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-13"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-14"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-03-15"},
-    {"Station_Number": "2260400", "norm": 0.0714377407, "date": "2021-03-16"},
-    {"Station_Number": "2260400", "norm": 0.0700898588, "date": "2021-03-17"},
-    {"Station_Number": "2260400", "norm": 0.0691912709, "date": "2021-03-18"},
-    {"Station_Number": "2260400", "norm": 0.0687419769, "date": "2021-03-19"},
-    {"Station_Number": "2260400", "norm": 0.0687419769, "date": "2021-03-20"},
-    {"Station_Number": "2260400", "norm": 0.0682926829, "date": "2021-03-21"},
-    {"Station_Number": "2260400", "norm": 0.0679717587, "date": "2021-03-22"},
-    {"Station_Number": "2260400", "norm": 0.0667522465, "date": "2021-03-23"},
-    {"Station_Number": "2260400", "norm": 0.0654685494, "date": "2021-03-24"},
-    {"Station_Number": "2260400", "norm": 0.0654685494, "date": "2021-03-25"},
-    {"Station_Number": "2260400", "norm": 0.0654685494, "date": "2021-03-26"},
-    {"Station_Number": "2260400", "norm": 0.0646983312, "date": "2021-03-27"},
-    {"Station_Number": "2260400", "norm": 0.0605263158, "date": "2021-03-28"},
-    {"Station_Number": "2260400", "norm": 0.0590500642, "date": "2021-03-29"},
-    {"Station_Number": "2260400", "norm": 0.0590500642, "date": "2021-03-30"},
-    {"Station_Number": "2260400", "norm": 0.0584082157, "date": "2021-03-31"},
-    {"Station_Number": "2260400", "norm": 0.0577663671, "date": "2021-04-01"},
-    {"Station_Number": "2260400", "norm": 0.0573170732, "date": "2021-04-02"},
-    {"Station_Number": "2260400", "norm": 0.0573170732, "date": "2021-04-03"},
-    {"Station_Number": "2260400", "norm": 0.0679075738, "date": "2021-04-04"},
-    {"Station_Number": "2260400", "norm": 0.1050706033, "date": "2021-04-05"},
-    {"Station_Number": "2260400", "norm": 0.1057124519, "date": "2021-04-06"},
-    {"Station_Number": "2260400", "norm": 0.0938382542, "date": "2021-04-07"},
-    {"Station_Number": "2260400", "norm": 0.0815147625, "date": "2021-04-08"},
-    {"Station_Number": "2260400", "norm": 0.071758665, "date": "2021-04-09"},
-    {"Station_Number": "2260400", "norm": 0.0675866496, "date": "2021-04-10"},
-    {"Station_Number": "2260400", "norm": 0.0662387677, "date": "2021-04-11"},
-    {"Station_Number": "2260400", "norm": 0.0659820282, "date": "2021-04-12"},
-    {"Station_Number": "2260400", "norm": 0.0654685494, "date": "2021-04-13"},
-    {"Station_Number": "2260400", "norm": 0.0643774069, "date": "2021-04-14"},
-    {"Station_Number": "2260400", "norm": 0.0665596919, "date": "2021-04-15"},
-    {"Station_Number": "2260400", "norm": 0.0688703466, "date": "2021-04-16"},
-    {"Station_Number": "2260400", "norm": 0.0651476252, "date": "2021-04-17"},
-    {"Station_Number": "2260400", "norm": 0.0641848524, "date": "2021-04-18"},
-    {"Station_Number": "2260400", "norm": 0.0620667522, "date": "2021-04-19"},
-    {"Station_Number": "2260400", "norm": 0.0571887035, "date": "2021-04-20"},
-    {"Station_Number": "2260400", "norm": 0.0565468549, "date": "2021-04-21"},
-    {"Station_Number": "2260400", "norm": 0.0598844673, "date": "2021-04-22"},
-    {"Station_Number": "2260400", "norm": 0.0646983312, "date": "2021-04-23"},
-    {"Station_Number": "2260400", "norm": 0.071309371, "date": "2021-04-24"},
-    {"Station_Number": "2260400", "norm": 0.0706675225, "date": "2021-04-25"},
-    {"Station_Number": "2260400", "norm": 0.0634146341, "date": "2021-04-26"},
-    {"Station_Number": "2260400", "norm": 0.0584724005, "date": "2021-04-27"},
-    {"Station_Number": "2260400", "norm": 0.0569961489, "date": "2021-04-28"},
-    {"Station_Number": "2260400", "norm": 0.0590500642, "date": "2021-04-29"},
-    {"Station_Number": "2260400", "norm": 0.0609756098, "date": "2021-04-30"},
-    {"Station_Number": "2260400", "norm": 0.0616174583, "date": "2021-05-01"},
-    {"Station_Number": "2260400", "norm": 0.0603337612, "date": "2021-05-02"},
-    {"Station_Number": "2260400", "norm": 0.0586007702, "date": "2021-05-03"},
-    {"Station_Number": "2260400", "norm": 0.0577021823, "date": "2021-05-04"},
-    {"Station_Number": "2260400", "norm": 0.0616174583, "date": "2021-05-05"},
-    {"Station_Number": "2260400", "norm": 0.0641848524, "date": "2021-05-06"},
-    {"Station_Number": "2260400", "norm": 0.0653401797, "date": "2021-05-07"},
-    {"Station_Number": "2260400", "norm": 0.0670731707, "date": "2021-05-08"},
-    {"Station_Number": "2260400", "norm": 0.0699614891, "date": "2021-05-09"},
-    {"Station_Number": "2260400", "norm": 0.0900513479, "date": "2021-05-10"},
-    {"Station_Number": "2260400", "norm": 0.107381258, "date": "2021-05-11"},
-    {"Station_Number": "2260400", "norm": 0.1083440308, "date": "2021-05-12"},
-    {"Station_Number": "2260400", "norm": 0.1046213094, "date": "2021-05-13"},
-    {"Station_Number": "2260400", "norm": 0.1026957638, "date": "2021-05-14"},
-    {"Station_Number": "2260400", "norm": 0.0951219512, "date": "2021-05-15"},
-    {"Station_Number": "2260400", "norm": 0.0864569961, "date": "2021-05-16"},
-    {"Station_Number": "2260400", "norm": 0.0835686778, "date": "2021-05-17"},
-    {"Station_Number": "2260400", "norm": 0.1207958922, "date": "2021-05-18"},
-    {"Station_Number": "2260400", "norm": 0.1412066752, "date": "2021-05-19"},
-    {"Station_Number": "2260400", "norm": 0.1206675225, "date": "2021-05-20"},
-    {"Station_Number": "2260400", "norm": 0.1012195122, "date": "2021-05-21"},
-    {"Station_Number": "2260400", "norm": 0.1673299101, "date": "2021-05-22"},
-    {"Station_Number": "2260400", "norm": 0.3152759949, "date": "2021-05-23"},
-    {"Station_Number": "2260400", "norm": 0.3395378691, "date": "2021-05-24"},
-    {"Station_Number": "2260400", "norm": 0.3339537869, "date": "2021-05-25"},
-    {"Station_Number": "2260400", "norm": 0.2567394095, "date": "2021-05-26"},
-    {"Station_Number": "2260400", "norm": 0.1836970475, "date": "2021-05-27"},
-    {"Station_Number": "2260400", "norm": 0.1407573813, "date": "2021-05-28"},
-    {"Station_Number": "2260400", "norm": 0.1272785623, "date": "2021-05-29"},
-    {"Station_Number": "2260400", "norm": 0.1422978177, "date": "2021-05-30"},
-    {"Station_Number": "2260400", "norm": 0.169127086, "date": "2021-05-31"},
-    {"Station_Number": "2260400", "norm": 0.15, "date": "2021-06-01"},
-    {"Station_Number": "2260400", "norm": 0.160012837, "date": "2021-06-02"},
-    {"Station_Number": "2260400", "norm": 0.1829268293, "date": "2021-06-03"},
-    {"Station_Number": "2260400", "norm": 0.1803594352, "date": "2021-06-04"},
-    {"Station_Number": "2260400", "norm": 0.2110397946, "date": "2021-06-05"},
-    {"Station_Number": "2260400", "norm": 0.2374839538, "date": "2021-06-06"},
-    {"Station_Number": "2260400", "norm": 0.2270860077, "date": "2021-06-07"},
-    {"Station_Number": "2260400", "norm": 0.1905006418, "date": "2021-06-08"},
-    {"Station_Number": "2260400", "norm": 0.1553273427, "date": "2021-06-09"},
-    {"Station_Number": "2260400", "norm": 0.1358793325, "date": "2021-06-10"},
-    {"Station_Number": "2260400", "norm": 0.1369062901, "date": "2021-06-11"},
-    {"Station_Number": "2260400", "norm": 0.1517971759, "date": "2021-06-12"},
-    {"Station_Number": "2260400", "norm": 0.1559691913, "date": "2021-06-13"},
-    {"Station_Number": "2260400", "norm": 0.1820924262, "date": "2021-06-14"},
-    {"Station_Number": "2260400", "norm": 0.1942875481, "date": "2021-06-15"},
-    {"Station_Number": "2260400", "norm": 0.2141848524, "date": "2021-06-16"},
-    {"Station_Number": "2260400", "norm": 0.2108472401, "date": "2021-06-17"},
-    {"Station_Number": "2260400", "norm": 0.2984595635, "date": "2021-06-18"},
-    {"Station_Number": "2260400", "norm": 0.3592426187, "date": "2021-06-19"},
-    {"Station_Number": "2260400", "norm": 0.4064826701, "date": "2021-06-20"},
-    {"Station_Number": "2260400", "norm": 0.4333761232, "date": "2021-06-21"},
-    {"Station_Number": "2260400", "norm": 0.4513478819, "date": "2021-06-22"},
-    {"Station_Number": "2260400", "norm": 0.4523748395, "date": "2021-06-23"},
-    {"Station_Number": "2260400", "norm": 0.4340821566, "date": "2021-06-24"},
-    {"Station_Number": "2260400", "norm": 0.4528241335, "date": "2021-06-25"},
-    {"Station_Number": "2260400", "norm": 0.4998074454, "date": "2021-06-26"},
-    {"Station_Number": "2260400", "norm": 0.5149550706, "date": "2021-06-27"},
-    {"Station_Number": "2260400", "norm": 0.4948652118, "date": "2021-06-28"},
-    {"Station_Number": "2260400", "norm": 0.4841463415, "date": "2021-06-29"},
-    {"Station_Number": "2260400", "norm": 0.5256739409, "date": "2021-06-30"},
-    {"Station_Number": "2260400", "norm": 0.5842747112, "date": "2021-07-01"},
-    {"Station_Number": "2260400", "norm": 0.6247111682, "date": "2021-07-02"},
-    {"Station_Number": "2260400", "norm": 0.6623876765, "date": "2021-07-03"},
-    {"Station_Number": "2260400", "norm": 0.7289473684, "date": "2021-07-04"},
-    {"Station_Number": "2260400", "norm": 0.781322208, "date": "2021-07-05"},
-    {"Station_Number": "2260400", "norm": 0.8170731707, "date": "2021-07-06"},
-    {"Station_Number": "2260400", "norm": 0.8256097561, "date": "2021-07-07"},
-    {"Station_Number": "2260400", "norm": 0.8035943517, "date": "2021-07-08"},
-    {"Station_Number": "2260400", "norm": 0.7706675225, "date": "2021-07-09"},
-    {"Station_Number": "2260400", "norm": 0.7340821566, "date": "2021-07-10"},
-    {"Station_Number": "2260400", "norm": 0.6940308087, "date": "2021-07-11"},
-    {"Station_Number": "2260400", "norm": 0.6279204108, "date": "2021-07-12"},
-    {"Station_Number": "2260400", "norm": 0.567843389, "date": "2021-07-13"},
-    {"Station_Number": "2260400", "norm": 0.5017971759, "date": "2021-07-14"},
-    {"Station_Number": "2260400", "norm": 0.4547496791, "date": "2021-07-15"},
-    {"Station_Number": "2260400", "norm": 0.4299101412, "date": "2021-07-16"},
-    {"Station_Number": "2260400", "norm": 0.428241335, "date": "2021-07-17"},
-    {"Station_Number": "2260400", "norm": 0.430872914, "date": "2021-07-18"},
-    {"Station_Number": "2260400", "norm": 0.4770218228, "date": "2021-07-19"},
-    {"Station_Number": "2260400", "norm": 0.5008344031, "date": "2021-07-20"},
-    {"Station_Number": "2260400", "norm": 0.4942233633, "date": "2021-07-21"},
-    {"Station_Number": "2260400", "norm": 0.4724005135, "date": "2021-07-22"},
-    {"Station_Number": "2260400", "norm": 0.4462130937, "date": "2021-07-23"},
-    {"Station_Number": "2260400", "norm": 0.447817715, "date": "2021-07-24"},
-    {"Station_Number": "2260400", "norm": 0.4228498074, "date": "2021-07-25"},
-    {"Station_Number": "2260400", "norm": 0.4245827985, "date": "2021-07-26"},
-    {"Station_Number": "2260400", "norm": 0.4790115533, "date": "2021-07-27"},
-    {"Station_Number": "2260400", "norm": 0.4974326059, "date": "2021-07-28"},
-    {"Station_Number": "2260400", "norm": 0.5064184852, "date": "2021-07-29"},
-    {"Station_Number": "2260400", "norm": 0.5312580231, "date": "2021-07-30"},
-    {"Station_Number": "2260400", "norm": 0.5419127086, "date": "2021-07-31"},
-    {"Station_Number": "2260400", "norm": 0.5709242619, "date": "2021-08-01"},
-    {"Station_Number": "2260400", "norm": 0.6140564827, "date": "2021-08-02"},
-    {"Station_Number": "2260400", "norm": 0.6381899872, "date": "2021-08-03"},
-    {"Station_Number": "2260400", "norm": 0.6501925546, "date": "2021-08-04"},
-    {"Station_Number": "2260400", "norm": 0.6166238768, "date": "2021-08-05"},
-    {"Station_Number": "2260400", "norm": 0.5462130937, "date": "2021-08-06"},
-    {"Station_Number": "2260400", "norm": 0.4672657253, "date": "2021-08-07"},
-    {"Station_Number": "2260400", "norm": 0.4019897304, "date": "2021-08-08"},
-    {"Station_Number": "2260400", "norm": 0.3692554557, "date": "2021-08-09"},
-    {"Station_Number": "2260400", "norm": 0.3737483954, "date": "2021-08-10"},
-    {"Station_Number": "2260400", "norm": 0.420860077, "date": "2021-08-11"},
-    {"Station_Number": "2260400", "norm": 0.4993581515, "date": "2021-08-12"},
-    {"Station_Number": "2260400", "norm": 0.5890885751, "date": "2021-08-13"},
-    {"Station_Number": "2260400", "norm": 0.6527599487, "date": "2021-08-14"},
-    {"Station_Number": "2260400", "norm": 0.7195121951, "date": "2021-08-15"},
-    {"Station_Number": "2260400", "norm": 0.7931322208, "date": "2021-08-16"},
-    {"Station_Number": "2260400", "norm": 0.8459563543, "date": "2021-08-17"},
-    {"Station_Number": "2260400", "norm": 0.8767650834, "date": "2021-08-18"},
-    {"Station_Number": "2260400", "norm": 0.9013478819, "date": "2021-08-19"},
-    {"Station_Number": "2260400", "norm": 0.9340821566, "date": "2021-08-20"},
-    {"Station_Number": "2260400", "norm": 0.9788189987, "date": "2021-08-21"},
-    {"Station_Number": "2260400", "norm": 1.0, "date": "2021-08-22"},
-    {"Station_Number": "2260400", "norm": 0.9922978177, "date": "2021-08-23"},
-    {"Station_Number": "2260400", "norm": 0.958279846, "date": "2021-08-24"},
-    {"Station_Number": "2260400", "norm": 0.9259948652, "date": "2021-08-25"},
-    {"Station_Number": "2260400", "norm": 0.9013478819, "date": "2021-08-26"},
-    {"Station_Number": "2260400", "norm": 0.8992297818, "date": "2021-08-27"},
-    {"Station_Number": "2260400", "norm": 0.9127086008, "date": "2021-08-28"},
-    {"Station_Number": "2260400", "norm": 0.933055199, "date": "2021-08-29"},
-    {"Station_Number": "2260400", "norm": 0.9580872914, "date": "2021-08-30"},
-    {"Station_Number": "2260400", "norm": 0.9651476252, "date": "2021-08-31"},
-    {"Station_Number": "2260400", "norm": 0.9424261874, "date": "2021-09-01"},
-    {"Station_Number": "2260400", "norm": 0.8955712452, "date": "2021-09-02"},
-    {"Station_Number": "2260400", "norm": 0.8155969191, "date": "2021-09-03"},
-    {"Station_Number": "2260400", "norm": 0.7229139923, "date": "2021-09-04"},
-    {"Station_Number": "2260400", "norm": 0.6238767651, "date": "2021-09-05"},
-    {"Station_Number": "2260400", "norm": 0.5862002567, "date": "2021-09-06"},
-    {"Station_Number": "2260400", "norm": 0.5684852375, "date": "2021-09-07"},
-    {"Station_Number": "2260400", "norm": 0.5598844673, "date": "2021-09-08"},
-    {"Station_Number": "2260400", "norm": 0.5564826701, "date": "2021-09-09"},
-    {"Station_Number": "2260400", "norm": 0.553465982, "date": "2021-09-10"},
-    {"Station_Number": "2260400", "norm": 0.5112323492, "date": "2021-09-11"},
-    {"Station_Number": "2260400", "norm": 0.4581514763, "date": "2021-09-12"},
-    {"Station_Number": "2260400", "norm": 0.4118741977, "date": "2021-09-13"},
-    {"Station_Number": "2260400", "norm": 0.3641206675, "date": "2021-09-14"},
-    {"Station_Number": "2260400", "norm": 0.3448652118, "date": "2021-09-15"},
-    {"Station_Number": "2260400", "norm": 0.3333119384, "date": "2021-09-16"},
-    {"Station_Number": "2260400", "norm": 0.3202824134, "date": "2021-09-17"},
-    {"Station_Number": "2260400", "norm": 0.3019897304, "date": "2021-09-18"},
-    {"Station_Number": "2260400", "norm": 0.3161103979, "date": "2021-09-19"},
-    {"Station_Number": "2260400", "norm": 0.3387676508, "date": "2021-09-20"},
-    {"Station_Number": "2260400", "norm": 0.48042362, "date": "2021-09-21"},
-    {"Station_Number": "2260400", "norm": 0.5444801027, "date": "2021-09-22"},
-    {"Station_Number": "2260400", "norm": 0.4980744544, "date": "2021-09-23"},
-    {"Station_Number": "2260400", "norm": 0.4245827985, "date": "2021-09-24"},
-    {"Station_Number": "2260400", "norm": 0.364762516, "date": "2021-09-25"},
-    {"Station_Number": "2260400", "norm": 0.326508344, "date": "2021-09-26"},
-    {"Station_Number": "2260400", "norm": 0.2997432606, "date": "2021-09-27"},
-    {"Station_Number": "2260400", "norm": 0.2878690629, "date": "2021-09-28"},
-    {"Station_Number": "2260400", "norm": 0.278241335, "date": "2021-09-29"},
-    {"Station_Number": "2260400", "norm": 0.2657252888, "date": "2021-09-30"},
-    {"Station_Number": "2260400", "norm": 0.2644415918, "date": "2021-10-01"},
-    {"Station_Number": "2260400", "norm": 0.2537227214, "date": "2021-10-02"},
-    {"Station_Number": "2260400", "norm": 0.2451861361, "date": "2021-10-03"},
-    {"Station_Number": "2260400", "norm": 0.2326700899, "date": "2021-10-04"},
-    {"Station_Number": "2260400", "norm": 0.2259306804, "date": "2021-10-05"},
-    {"Station_Number": "2260400", "norm": 0.2539794608, "date": "2021-10-06"},
-    {"Station_Number": "2260400", "norm": 0.2505134788, "date": "2021-10-07"},
-    {"Station_Number": "2260400", "norm": 0.2731065469, "date": "2021-10-08"},
-    {"Station_Number": "2260400", "norm": 0.2456996149, "date": "2021-10-09"},
-    {"Station_Number": "2260400", "norm": 0.2229139923, "date": "2021-10-10"},
-    {"Station_Number": "2260400", "norm": 0.217394095, "date": "2021-10-11"},
-    {"Station_Number": "2260400", "norm": 0.2143774069, "date": "2021-10-12"},
-    {"Station_Number": "2260400", "norm": 0.2069961489, "date": "2021-10-13"},
-    {"Station_Number": "2260400", "norm": 0.1919127086, "date": "2021-10-14"},
-    {"Station_Number": "2260400", "norm": 0.1867779204, "date": "2021-10-15"},
-    {"Station_Number": "2260400", "norm": 0.1842105263, "date": "2021-10-16"},
-    {"Station_Number": "2260400", "norm": 0.1732991014, "date": "2021-10-17"},
-    {"Station_Number": "2260400", "norm": 0.1700898588, "date": "2021-10-18"},
-    {"Station_Number": "2260400", "norm": 0.1683568678, "date": "2021-10-19"},
-    {"Station_Number": "2260400", "norm": 0.1670731707, "date": "2021-10-20"},
-    {"Station_Number": "2260400", "norm": 0.2284980745, "date": "2021-10-21"},
-    {"Station_Number": "2260400", "norm": 0.2355584082, "date": "2021-10-22"},
-    {"Station_Number": "2260400", "norm": 0.4098202824, "date": "2021-10-23"},
-    {"Station_Number": "2260400", "norm": 0.5605263158, "date": "2021-10-24"},
-    {"Station_Number": "2260400", "norm": 0.6007702182, "date": "2021-10-25"},
-    {"Station_Number": "2260400", "norm": 0.5380616175, "date": "2021-10-26"},
-    {"Station_Number": "2260400", "norm": 0.4170089859, "date": "2021-10-27"},
-    {"Station_Number": "2260400", "norm": 0.3090500642, "date": "2021-10-28"},
-    {"Station_Number": "2260400", "norm": 0.2506418485, "date": "2021-10-29"},
-    {"Station_Number": "2260400", "norm": 0.2216302953, "date": "2021-10-30"},
-    {"Station_Number": "2260400", "norm": 0.2000641849, "date": "2021-10-31"},
-    {"Station_Number": "2260400", "norm": 0.1910783055, "date": "2021-11-01"},
-    {"Station_Number": "2260400", "norm": 0.1819640565, "date": "2021-11-02"},
-    {"Station_Number": "2260400", "norm": 0.1758664955, "date": "2021-11-03"},
-    {"Station_Number": "2260400", "norm": 0.1670731707, "date": "2021-11-04"},
-    {"Station_Number": "2260400", "norm": 0.1570603338, "date": "2021-11-05"},
-    {"Station_Number": "2260400", "norm": 0.1461489089, "date": "2021-11-06"},
-    {"Station_Number": "2260400", "norm": 0.137804878, "date": "2021-11-07"},
-    {"Station_Number": "2260400", "norm": 0.1317715019, "date": "2021-11-08"},
-    {"Station_Number": "2260400", "norm": 0.1294608472, "date": "2021-11-09"},
-    {"Station_Number": "2260400", "norm": 0.1268934531, "date": "2021-11-10"},
-    {"Station_Number": "2260400", "norm": 0.1249679076, "date": "2021-11-11"},
-    {"Station_Number": "2260400", "norm": 0.1232349166, "date": "2021-11-12"},
-    {"Station_Number": "2260400", "norm": 0.1224005135, "date": "2021-11-13"},
-    {"Station_Number": "2260400", "norm": 0.1219512195, "date": "2021-11-14"},
-    {"Station_Number": "2260400", "norm": 0.1215019255, "date": "2021-11-15"},
-    {"Station_Number": "2260400", "norm": 0.11957638, "date": "2021-11-16"},
-    {"Station_Number": "2260400", "norm": 0.1187419769, "date": "2021-11-17"},
-    {"Station_Number": "2260400", "norm": 0.1176508344, "date": "2021-11-18"},
-    {"Station_Number": "2260400", "norm": 0.1163671374, "date": "2021-11-19"},
-    {"Station_Number": "2260400", "norm": 0.1116816431, "date": "2021-11-20"},
-    {"Station_Number": "2260400", "norm": 0.1066752246, "date": "2021-11-21"},
-    {"Station_Number": "2260400", "norm": 0.1043003851, "date": "2021-11-22"},
-    {"Station_Number": "2260400", "norm": 0.1031450578, "date": "2021-11-23"},
-    {"Station_Number": "2260400", "norm": 0.1026957638, "date": "2021-11-24"},
-    {"Station_Number": "2260400", "norm": 0.1014120668, "date": "2021-11-25"},
-    {"Station_Number": "2260400", "norm": 0.0982028241, "date": "2021-11-26"},
-    {"Station_Number": "2260400", "norm": 0.0959563543, "date": "2021-11-27"},
-    {"Station_Number": "2260400", "norm": 0.0940308087, "date": "2021-11-28"},
-    {"Station_Number": "2260400", "norm": 0.0906931964, "date": "2021-11-29"},
-    {"Station_Number": "2260400", "norm": 0.0890243902, "date": "2021-11-30"},
-    {"Station_Number": "2260400", "norm": 0.0864569961, "date": "2021-12-01"},
-    {"Station_Number": "2260400", "norm": 0.0853658537, "date": "2021-12-02"},
-    {"Station_Number": "2260400", "norm": 0.0847240051, "date": "2021-12-03"},
-    {"Station_Number": "2260400", "norm": 0.0839537869, "date": "2021-12-04"},
-    {"Station_Number": "2260400", "norm": 0.0834403081, "date": "2021-12-05"},
-    {"Station_Number": "2260400", "norm": 0.082605905, "date": "2021-12-06"},
-    {"Station_Number": "2260400", "norm": 0.0819640565, "date": "2021-12-07"},
-    {"Station_Number": "2260400", "norm": 0.080872914, "date": "2021-12-08"},
-    {"Station_Number": "2260400", "norm": 0.0793966624, "date": "2021-12-09"},
-    {"Station_Number": "2260400", "norm": 0.0783055199, "date": "2021-12-10"},
-    {"Station_Number": "2260400", "norm": 0.0774711168, "date": "2021-12-11"},
-    {"Station_Number": "2260400", "norm": 0.0758023107, "date": "2021-12-12"},
-    {"Station_Number": "2260400", "norm": 0.0754813864, "date": "2021-12-13"},
-    {"Station_Number": "2260400", "norm": 0.0749679076, "date": "2021-12-14"},
-    {"Station_Number": "2260400", "norm": 0.0744544288, "date": "2021-12-15"},
-    {"Station_Number": "2260400", "norm": 0.0739409499, "date": "2021-12-16"},
-    {"Station_Number": "2260400", "norm": 0.0739409499, "date": "2021-12-17"},
-    {"Station_Number": "2260400", "norm": 0.0734274711, "date": "2021-12-18"},
-    {"Station_Number": "2260400", "norm": 0.0734274711, "date": "2021-12-19"},
-    {"Station_Number": "2260400", "norm": 0.0722079589, "date": "2021-12-20"},
-    {"Station_Number": "2260400", "norm": 0.0718870347, "date": "2021-12-21"},
-    {"Station_Number": "2260400", "norm": 0.0714377407, "date": "2021-12-22"},
-    {"Station_Number": "2260400", "norm": 0.0709884467, "date": "2021-12-23"},
-    {"Station_Number": "2260400", "norm": 0.0709884467, "date": "2021-12-24"},
-    {"Station_Number": "2260400", "norm": 0.0714377407, "date": "2021-12-25"},
-    {"Station_Number": "2260400", "norm": 0.071309371, "date": "2021-12-26"},
-    {"Station_Number": "2260400", "norm": 0.0709884467, "date": "2021-12-27"},
-    {"Station_Number": "2260400", "norm": 0.0704107831, "date": "2021-12-28"},
-    {"Station_Number": "2260400", "norm": 0.0686136072, "date": "2021-12-29"},
-    {"Station_Number": "2260400", "norm": 0.067843389, "date": "2021-12-30"},
-    {"Station_Number": "2260400", "norm": 0.0672657253, "date": "2021-12-31"},
-    {"Station_Number": "2260400", "norm": 0.0618562874, "date": "2022-01-01"},
-    {"Station_Number": "2260400", "norm": 0.061257485, "date": "2022-01-02"},
-    {"Station_Number": "2260400", "norm": 0.0603592814, "date": "2022-01-03"},
-    {"Station_Number": "2260400", "norm": 0.0588622754, "date": "2022-01-04"},
-    {"Station_Number": "2260400", "norm": 0.0562874251, "date": "2022-01-05"},
-    {"Station_Number": "2260400", "norm": 0.0549101796, "date": "2022-01-06"},
-    {"Station_Number": "2260400", "norm": 0.0537724551, "date": "2022-01-07"},
-    {"Station_Number": "2260400", "norm": 0.0530538922, "date": "2022-01-08"},
-    {"Station_Number": "2260400", "norm": 0.0525149701, "date": "2022-01-09"},
-    {"Station_Number": "2260400", "norm": 0.051257485, "date": "2022-01-10"},
-    {"Station_Number": "2260400", "norm": 0.0508383234, "date": "2022-01-11"},
-    {"Station_Number": "2260400", "norm": 0.05, "date": "2022-01-12"},
-    {"Station_Number": "2260400", "norm": 0.0495808383, "date": "2022-01-13"},
-    {"Station_Number": "2260400", "norm": 0.0490419162, "date": "2022-01-14"},
-    {"Station_Number": "2260400", "norm": 0.0486227545, "date": "2022-01-15"},
-    {"Station_Number": "2260400", "norm": 0.0492814371, "date": "2022-01-16"},
-    {"Station_Number": "2260400", "norm": 0.0631736527, "date": "2022-01-17"},
-    {"Station_Number": "2260400", "norm": 0.0736526946, "date": "2022-01-18"},
-    {"Station_Number": "2260400", "norm": 0.0670658683, "date": "2022-01-19"},
-    {"Station_Number": "2260400", "norm": 0.0550898204, "date": "2022-01-20"},
-    {"Station_Number": "2260400", "norm": 0.0499401198, "date": "2022-01-21"},
-    {"Station_Number": "2260400", "norm": 0.0486826347, "date": "2022-01-22"},
-    {"Station_Number": "2260400", "norm": 0.0486227545, "date": "2022-01-23"},
-    {"Station_Number": "2260400", "norm": 0.0486227545, "date": "2022-01-24"},
-    {"Station_Number": "2260400", "norm": 0.0491616766, "date": "2022-01-25"},
-    {"Station_Number": "2260400", "norm": 0.0491017964, "date": "2022-01-26"},
-    {"Station_Number": "2260400", "norm": 0.0494610778, "date": "2022-01-27"},
-    {"Station_Number": "2260400", "norm": 0.0498203593, "date": "2022-01-28"},
-    {"Station_Number": "2260400", "norm": 0.0513772455, "date": "2022-01-29"},
-    {"Station_Number": "2260400", "norm": 0.0523353293, "date": "2022-01-30"},
-    {"Station_Number": "2260400", "norm": 0.0574850299, "date": "2022-01-31"},
-    {"Station_Number": "2260400", "norm": 0.0738323353, "date": "2022-02-01"},
-    {"Station_Number": "2260400", "norm": 0.0754491018, "date": "2022-02-02"},
-    {"Station_Number": "2260400", "norm": 0.0690419162, "date": "2022-02-03"},
-    {"Station_Number": "2260400", "norm": 0.0620958084, "date": "2022-02-04"},
-    {"Station_Number": "2260400", "norm": 0.0604790419, "date": "2022-02-05"},
-    {"Station_Number": "2260400", "norm": 0.0648502994, "date": "2022-02-06"},
-    {"Station_Number": "2260400", "norm": 0.0669461078, "date": "2022-02-07"},
-    {"Station_Number": "2260400", "norm": 0.0638323353, "date": "2022-02-08"},
-    {"Station_Number": "2260400", "norm": 0.0639520958, "date": "2022-02-09"},
-    {"Station_Number": "2260400", "norm": 0.0862275449, "date": "2022-02-10"},
-    {"Station_Number": "2260400", "norm": 0.0801197605, "date": "2022-02-11"},
-    {"Station_Number": "2260400", "norm": 0.0737125749, "date": "2022-02-12"},
-    {"Station_Number": "2260400", "norm": 0.0667065868, "date": "2022-02-13"},
-    {"Station_Number": "2260400", "norm": 0.0624550898, "date": "2022-02-14"},
-    {"Station_Number": "2260400", "norm": 0.0610778443, "date": "2022-02-15"},
-    {"Station_Number": "2260400", "norm": 0.0604790419, "date": "2022-02-16"},
-    {"Station_Number": "2260400", "norm": 0.0597005988, "date": "2022-02-17"},
-    {"Station_Number": "2260400", "norm": 0.058502994, "date": "2022-02-18"},
-    {"Station_Number": "2260400", "norm": 0.0573053892, "date": "2022-02-19"},
-    {"Station_Number": "2260400", "norm": 0.0550898204, "date": "2022-02-20"},
-    {"Station_Number": "2260400", "norm": 0.0537724551, "date": "2022-02-21"},
-    {"Station_Number": "2260400", "norm": 0.0525149701, "date": "2022-02-22"},
-    {"Station_Number": "2260400", "norm": 0.0506586826, "date": "2022-02-23"},
-    {"Station_Number": "2260400", "norm": 0.0513772455, "date": "2022-02-24"},
-    {"Station_Number": "2260400", "norm": 0.0546706587, "date": "2022-02-25"},
-    {"Station_Number": "2260400", "norm": 0.0600598802, "date": "2022-02-26"},
-    {"Station_Number": "2260400", "norm": 0.0558682635, "date": "2022-02-27"},
-    {"Station_Number": "2260400", "norm": 0.0520958084, "date": "2022-02-28"},
-    {"Station_Number": "2260400", "norm": 0.0501197605, "date": "2022-03-01"},
-    {"Station_Number": "2260400", "norm": 0.0501197605, "date": "2022-03-02"},
-    {"Station_Number": "2260400", "norm": 0.0494610778, "date": "2022-03-03"},
-    {"Station_Number": "2260400", "norm": 0.0497005988, "date": "2022-03-04"},
-    {"Station_Number": "2260400", "norm": 0.0508383234, "date": "2022-03-05"},
-    {"Station_Number": "2260400", "norm": 0.0519161677, "date": "2022-03-06"},
-    {"Station_Number": "2260400", "norm": 0.0509580838, "date": "2022-03-07"},
-    {"Station_Number": "2260400", "norm": 0.0505389222, "date": "2022-03-08"},
-    {"Station_Number": "2260400", "norm": 0.0509580838, "date": "2022-03-09"},
-    {"Station_Number": "2260400", "norm": 0.0523353293, "date": "2022-03-10"},
-    {"Station_Number": "2260400", "norm": 0.0550898204, "date": "2022-03-11"},
-    {"Station_Number": "2260400", "norm": 0.0580838323, "date": "2022-03-12"},
-    {"Station_Number": "2260400", "norm": 0.0604790419, "date": "2022-03-13"},
-    {"Station_Number": "2260400", "norm": 0.0611976048, "date": "2022-03-14"},
-    {"Station_Number": "2260400", "norm": 0.0617964072, "date": "2022-03-15"},
-    {"Station_Number": "2260400", "norm": 0.0629341317, "date": "2022-03-16"},
-    {"Station_Number": "2260400", "norm": 0.0632934132, "date": "2022-03-17"},
-    {"Station_Number": "2260400", "norm": 0.0632934132, "date": "2022-03-18"},
-    {"Station_Number": "2260400", "norm": 0.0637125749, "date": "2022-03-19"},
-    {"Station_Number": "2260400", "norm": 0.062754491, "date": "2022-03-20"},
-    {"Station_Number": "2260400", "norm": 0.0607784431, "date": "2022-03-21"},
-    {"Station_Number": "2260400", "norm": 0.0586826347, "date": "2022-03-22"},
-    {"Station_Number": "2260400", "norm": 0.0604790419, "date": "2022-03-23"},
-    {"Station_Number": "2260400", "norm": 0.0608982036, "date": "2022-03-24"},
-    {"Station_Number": "2260400", "norm": 0.0620958084, "date": "2022-03-25"},
-    {"Station_Number": "2260400", "norm": 0.0650898204, "date": "2022-03-26"},
-    {"Station_Number": "2260400", "norm": 0.0641317365, "date": "2022-03-27"},
-    {"Station_Number": "2260400", "norm": 0.0668862275, "date": "2022-03-28"},
-    {"Station_Number": "2260400", "norm": 0.0740718563, "date": "2022-03-29"},
-    {"Station_Number": "2260400", "norm": 0.0801197605, "date": "2022-03-30"},
-    {"Station_Number": "2260400", "norm": 0.087245509, "date": "2022-03-31"},
-    {"Station_Number": "2260400", "norm": 0.0836526946, "date": "2022-04-01"},
-    {"Station_Number": "2260400", "norm": 0.0793413174, "date": "2022-04-02"},
-    {"Station_Number": "2260400", "norm": 0.0718562874, "date": "2022-04-03"},
-    {"Station_Number": "2260400", "norm": 0.0923952096, "date": "2022-04-04"},
-    {"Station_Number": "2260400", "norm": 0.219760479, "date": "2022-04-05"},
-    {"Station_Number": "2260400", "norm": 0.2076047904, "date": "2022-04-06"},
-    {"Station_Number": "2260400", "norm": 0.3256287425, "date": "2022-04-07"},
-    {"Station_Number": "2260400", "norm": 0.3682634731, "date": "2022-04-08"},
-    {"Station_Number": "2260400", "norm": 0.3279640719, "date": "2022-04-09"},
-    {"Station_Number": "2260400", "norm": 0.2535928144, "date": "2022-04-10"},
-    {"Station_Number": "2260400", "norm": 0.1949101796, "date": "2022-04-11"},
-    {"Station_Number": "2260400", "norm": 0.1724550898, "date": "2022-04-12"},
-    {"Station_Number": "2260400", "norm": 0.1655688623, "date": "2022-04-13"},
-    {"Station_Number": "2260400", "norm": 0.1610778443, "date": "2022-04-14"},
-    {"Station_Number": "2260400", "norm": 0.1586826347, "date": "2022-04-15"},
-    {"Station_Number": "2260400", "norm": 0.155508982, "date": "2022-04-16"},
-    {"Station_Number": "2260400", "norm": 0.2817365269, "date": "2022-04-17"},
-    {"Station_Number": "2260400", "norm": 0.361497006, "date": "2022-04-18"},
-    {"Station_Number": "2260400", "norm": 0.3562874251, "date": "2022-04-19"},
-    {"Station_Number": "2260400", "norm": 0.3335329341, "date": "2022-04-20"},
-    {"Station_Number": "2260400", "norm": 0.2928143713, "date": "2022-04-21"},
-    {"Station_Number": "2260400", "norm": 0.2495209581, "date": "2022-04-22"},
-    {"Station_Number": "2260400", "norm": 0.2130538922, "date": "2022-04-23"},
-    {"Station_Number": "2260400", "norm": 0.1922155689, "date": "2022-04-24"},
-    {"Station_Number": "2260400", "norm": 0.1788622754, "date": "2022-04-25"},
-    {"Station_Number": "2260400", "norm": 0.1604790419, "date": "2022-04-26"},
-    {"Station_Number": "2260400", "norm": 0.1510778443, "date": "2022-04-27"},
-    {"Station_Number": "2260400", "norm": 0.1655688623, "date": "2022-04-28"},
-    {"Station_Number": "2260400", "norm": 0.1625748503, "date": "2022-04-29"},
-    {"Station_Number": "2260400", "norm": 0.154491018, "date": "2022-04-30"},
-    {"Station_Number": "2260400", "norm": 0.1473053892, "date": "2022-05-01"},
-    {"Station_Number": "2260400", "norm": 0.1401197605, "date": "2022-05-02"},
-    {"Station_Number": "2260400", "norm": 0.1377245509, "date": "2022-05-03"},
-    {"Station_Number": "2260400", "norm": 0.1377245509, "date": "2022-05-04"},
-    {"Station_Number": "2260400", "norm": 0.1349101796, "date": "2022-05-05"},
-    {"Station_Number": "2260400", "norm": 0.1516766467, "date": "2022-05-06"},
-    {"Station_Number": "2260400", "norm": 0.2116766467, "date": "2022-05-07"},
-    {"Station_Number": "2260400", "norm": 0.207005988, "date": "2022-05-08"},
-    {"Station_Number": "2260400", "norm": 0.1789221557, "date": "2022-05-09"},
-    {"Station_Number": "2260400", "norm": 0.1676646707, "date": "2022-05-10"},
-    {"Station_Number": "2260400", "norm": 0.1640718563, "date": "2022-05-11"},
-    {"Station_Number": "2260400", "norm": 0.1604790419, "date": "2022-05-12"},
-    {"Station_Number": "2260400", "norm": 0.1670658683, "date": "2022-05-13"},
-    {"Station_Number": "2260400", "norm": 0.197005988, "date": "2022-05-14"},
-    {"Station_Number": "2260400", "norm": 0.2928143713, "date": "2022-05-15"},
-    {"Station_Number": "2260400", "norm": 0.3850299401, "date": "2022-05-16"},
-    {"Station_Number": "2260400", "norm": 0.5280239521, "date": "2022-05-17"},
-    {"Station_Number": "2260400", "norm": 0.5864071856, "date": "2022-05-18"},
-    {"Station_Number": "2260400", "norm": 0.5884431138, "date": "2022-05-19"},
-    {"Station_Number": "2260400", "norm": 0.5800598802, "date": "2022-05-20"},
-    {"Station_Number": "2260400", "norm": 0.5947904192, "date": "2022-05-21"},
-    {"Station_Number": "2260400", "norm": 0.5828143713, "date": "2022-05-22"},
-    {"Station_Number": "2260400", "norm": 0.5180838323, "date": "2022-05-23"},
-    {"Station_Number": "2260400", "norm": 0.4305389222, "date": "2022-05-24"},
-    {"Station_Number": "2260400", "norm": 0.348502994, "date": "2022-05-25"},
-    {"Station_Number": "2260400", "norm": 0.2980239521, "date": "2022-05-26"},
-    {"Station_Number": "2260400", "norm": 0.2646706587, "date": "2022-05-27"},
-    {"Station_Number": "2260400", "norm": 0.2486826347, "date": "2022-05-28"},
-    {"Station_Number": "2260400", "norm": 0.3153892216, "date": "2022-05-29"},
-    {"Station_Number": "2260400", "norm": 0.3748502994, "date": "2022-05-30"},
-    {"Station_Number": "2260400", "norm": 0.3836526946, "date": "2022-05-31"},
-    {"Station_Number": "2260400", "norm": 0.3760479042, "date": "2022-06-01"},
-    {"Station_Number": "2260400", "norm": 0.3339520958, "date": "2022-06-02"},
-    {"Station_Number": "2260400", "norm": 0.3389221557, "date": "2022-06-03"},
-    {"Station_Number": "2260400", "norm": 0.2345508982, "date": "2022-06-04"},
-    {"Station_Number": "2260400", "norm": 0.3458083832, "date": "2022-06-05"},
-    {"Station_Number": "2260400", "norm": 0.4369461078, "date": "2022-06-06"},
-    {"Station_Number": "2260400", "norm": 0.5155688623, "date": "2022-06-07"},
-    {"Station_Number": "2260400", "norm": 0.5660479042, "date": "2022-06-08"},
-    {"Station_Number": "2260400", "norm": 0.584011976, "date": "2022-06-09"},
-    {"Station_Number": "2260400", "norm": 0.5928143713, "date": "2022-06-10"},
-    {"Station_Number": "2260400", "norm": 0.607005988, "date": "2022-06-11"},
-    {"Station_Number": "2260400", "norm": 0.629760479, "date": "2022-06-12"},
-    {"Station_Number": "2260400", "norm": 0.658502994, "date": "2022-06-13"},
-    {"Station_Number": "2260400", "norm": 0.7047904192, "date": "2022-06-14"},
-    {"Station_Number": "2260400", "norm": 0.7546706587, "date": "2022-06-15"},
-    {"Station_Number": "2260400", "norm": 0.7934131737, "date": "2022-06-16"},
-    {"Station_Number": "2260400", "norm": 0.8339520958, "date": "2022-06-17"},
-    {"Station_Number": "2260400", "norm": 0.8886227545, "date": "2022-06-18"},
-    {"Station_Number": "2260400", "norm": 0.9473053892, "date": "2022-06-19"},
-    {"Station_Number": "2260400", "norm": 0.9748502994, "date": "2022-06-20"},
-    {"Station_Number": "2260400", "norm": 0.9916167665, "date": "2022-06-21"},
-    {"Station_Number": "2260400", "norm": 1.0, "date": "2022-06-22"},
-    {"Station_Number": "2260400", "norm": 0.9946107784, "date": "2022-06-23"},
-    {"Station_Number": "2260400", "norm": 0.977245509, "date": "2022-06-24"},
-    {"Station_Number": "2260400", "norm": 0.9592814371, "date": "2022-06-25"},
-    {"Station_Number": "2260400", "norm": 0.9299401198, "date": "2022-06-26"},
-    {"Station_Number": "2260400", "norm": 0.9125748503, "date": "2022-06-27"},
-    {"Station_Number": "2260400", "norm": 0.894011976, "date": "2022-06-28"},
-    {"Station_Number": "2260400", "norm": 0.8926347305, "date": "2022-06-29"},
-    {"Station_Number": "2260400", "norm": 0.895988024, "date": "2022-06-30"},
-    {"Station_Number": "2260400", "norm": 0.9239520958, "date": "2022-07-01"},
-    {"Station_Number": "2260400", "norm": 0.9305389222, "date": "2022-07-02"},
-    {"Station_Number": "2260400", "norm": 0.9191616766, "date": "2022-07-03"},
-    {"Station_Number": "2260400", "norm": 0.9004191617, "date": "2022-07-04"},
-    {"Station_Number": "2260400", "norm": 0.8646706587, "date": "2022-07-05"},
-    {"Station_Number": "2260400", "norm": 0.838502994, "date": "2022-07-06"},
-    {"Station_Number": "2260400", "norm": 0.7423353293, "date": "2022-07-07"},
-    {"Station_Number": "2260400", "norm": 0.6638922156, "date": "2022-07-08"},
-    {"Station_Number": "2260400", "norm": 0.5898203593, "date": "2022-07-09"},
-    {"Station_Number": "2260400", "norm": 0.5259281437, "date": "2022-07-10"},
-    {"Station_Number": "2260400", "norm": 0.5064071856, "date": "2022-07-11"},
-    {"Station_Number": "2260400", "norm": 0.4792215569, "date": "2022-07-12"},
-    {"Station_Number": "2260400", "norm": 0.4668862275, "date": "2022-07-13"},
-    {"Station_Number": "2260400", "norm": 0.4601796407, "date": "2022-07-14"},
-    {"Station_Number": "2260400", "norm": 0.4550898204, "date": "2022-07-15"},
-    {"Station_Number": "2260400", "norm": 0.4450898204, "date": "2022-07-16"},
-    {"Station_Number": "2260400", "norm": 0.4194610778, "date": "2022-07-17"},
-    {"Station_Number": "2260400", "norm": 0.4116766467, "date": "2022-07-18"},
-    {"Station_Number": "2260400", "norm": 0.3826347305, "date": "2022-07-19"},
-    {"Station_Number": "2260400", "norm": 0.3898203593, "date": "2022-07-20"},
-    {"Station_Number": "2260400", "norm": 0.4686826347, "date": "2022-07-21"},
-    {"Station_Number": "2260400", "norm": 0.5443113772, "date": "2022-07-22"},
-    {"Station_Number": "2260400", "norm": 0.5732335329, "date": "2022-07-23"},
-    {"Station_Number": "2260400", "norm": 0.5684431138, "date": "2022-07-24"},
-    {"Station_Number": "2260400", "norm": 0.577245509, "date": "2022-07-25"},
-    {"Station_Number": "2260400", "norm": 0.5756287425, "date": "2022-07-26"},
-    {"Station_Number": "2260400", "norm": 0.5489221557, "date": "2022-07-27"},
-    {"Station_Number": "2260400", "norm": 0.518742515, "date": "2022-07-28"},
-    {"Station_Number": "2260400", "norm": 0.4932335329, "date": "2022-07-29"},
-    {"Station_Number": "2260400", "norm": 0.4988023952, "date": "2022-07-30"},
-    {"Station_Number": "2260400", "norm": 0.504011976, "date": "2022-07-31"},
-    {"Station_Number": "2260400", "norm": 0.4828143713, "date": "2022-08-01"},
-    {"Station_Number": "2260400", "norm": 0.4692814371, "date": "2022-08-02"},
-    {"Station_Number": "2260400", "norm": 0.4744311377, "date": "2022-08-03"},
-    {"Station_Number": "2260400", "norm": 0.494011976, "date": "2022-08-04"},
-    {"Station_Number": "2260400", "norm": 0.5163473054, "date": "2022-08-05"},
-    {"Station_Number": "2260400", "norm": 0.5347305389, "date": "2022-08-06"},
-    {"Station_Number": "2260400", "norm": 0.532754491, "date": "2022-08-07"},
-    {"Station_Number": "2260400", "norm": 0.5295209581, "date": "2022-08-08"},
-    {"Station_Number": "2260400", "norm": 0.5, "date": "2022-08-09"},
-    {"Station_Number": "2260400", "norm": 0.4639520958, "date": "2022-08-10"},
-    {"Station_Number": "2260400", "norm": 0.4343113772, "date": "2022-08-11"},
-    {"Station_Number": "2260400", "norm": 0.4552095808, "date": "2022-08-12"},
-    {"Station_Number": "2260400", "norm": 0.4547904192, "date": "2022-08-13"},
-    {"Station_Number": "2260400", "norm": 0.4120958084, "date": "2022-08-14"},
-    {"Station_Number": "2260400", "norm": 0.3724550898, "date": "2022-08-15"},
-    {"Station_Number": "2260400", "norm": 0.3929341317, "date": "2022-08-16"},
-    {"Station_Number": "2260400", "norm": 0.408502994, "date": "2022-08-17"},
-    {"Station_Number": "2260400", "norm": 0.4105988024, "date": "2022-08-18"},
-    {"Station_Number": "2260400", "norm": 0.3956287425, "date": "2022-08-19"},
-    {"Station_Number": "2260400", "norm": 0.3784431138, "date": "2022-08-20"},
-    {"Station_Number": "2260400", "norm": 0.3683832335, "date": "2022-08-21"},
-    {"Station_Number": "2260400", "norm": 0.3902994012, "date": "2022-08-22"},
-    {"Station_Number": "2260400", "norm": 0.4092814371, "date": "2022-08-23"},
-    {"Station_Number": "2260400", "norm": 0.3882035928, "date": "2022-08-24"},
-    {"Station_Number": "2260400", "norm": 0.3704790419, "date": "2022-08-25"},
-    {"Station_Number": "2260400", "norm": 0.359760479, "date": "2022-08-26"},
-    {"Station_Number": "2260400", "norm": 0.3549101796, "date": "2022-08-27"},
-    {"Station_Number": "2260400", "norm": 0.3938922156, "date": "2022-08-28"},
-    {"Station_Number": "2260400", "norm": 0.3986826347, "date": "2022-08-29"},
-    {"Station_Number": "2260400", "norm": 0.3943113772, "date": "2022-08-30"},
-    {"Station_Number": "2260400", "norm": 0.4161676647, "date": "2022-08-31"},
-    {"Station_Number": "2260400", "norm": 0.4495808383, "date": "2022-09-01"},
-    {"Station_Number": "2260400", "norm": 0.4768263473, "date": "2022-09-02"},
-    {"Station_Number": "2260400", "norm": 0.5028143713, "date": "2022-09-03"},
-    {"Station_Number": "2260400", "norm": 0.5271257485, "date": "2022-09-04"},
-    {"Station_Number": "2260400", "norm": 0.5537724551, "date": "2022-09-05"},
-    {"Station_Number": "2260400", "norm": 0.584011976, "date": "2022-09-06"},
-    {"Station_Number": "2260400", "norm": 0.6532934132, "date": "2022-09-07"},
-    {"Station_Number": "2260400", "norm": 0.7163473054, "date": "2022-09-08"},
-    {"Station_Number": "2260400", "norm": 0.7473053892, "date": "2022-09-09"},
-    {"Station_Number": "2260400", "norm": 0.7431137725, "date": "2022-09-10"},
-    {"Station_Number": "2260400", "norm": 0.6971856287, "date": "2022-09-11"},
-    {"Station_Number": "2260400", "norm": 0.6139520958, "date": "2022-09-12"},
-    {"Station_Number": "2260400", "norm": 0.5111976048, "date": "2022-09-13"},
-    {"Station_Number": "2260400", "norm": 0.4322155689, "date": "2022-09-14"},
-    {"Station_Number": "2260400", "norm": 0.3803592814, "date": "2022-09-15"},
-    {"Station_Number": "2260400", "norm": 0.3663473054, "date": "2022-09-16"},
-    {"Station_Number": "2260400", "norm": 0.3837125749, "date": "2022-09-17"},
-    {"Station_Number": "2260400", "norm": 0.4116766467, "date": "2022-09-18"},
-    {"Station_Number": "2260400", "norm": 0.438742515, "date": "2022-09-19"},
-    {"Station_Number": "2260400", "norm": 0.4510778443, "date": "2022-09-20"},
-    {"Station_Number": "2260400", "norm": 0.4526946108, "date": "2022-09-21"},
-    {"Station_Number": "2260400", "norm": 0.4543113772, "date": "2022-09-22"},
-    {"Station_Number": "2260400", "norm": 0.4565868263, "date": "2022-09-23"},
-    {"Station_Number": "2260400", "norm": 0.4764670659, "date": "2022-09-24"},
-    {"Station_Number": "2260400", "norm": 0.4956287425, "date": "2022-09-25"},
-    {"Station_Number": "2260400", "norm": 0.4880239521, "date": "2022-09-26"},
-    {"Station_Number": "2260400", "norm": 0.5091616766, "date": "2022-09-27"},
-    {"Station_Number": "2260400", "norm": 0.5076047904, "date": "2022-09-28"},
-    {"Station_Number": "2260400", "norm": 0.461257485, "date": "2022-09-29"},
-    {"Station_Number": "2260400", "norm": 0.4125748503, "date": "2022-09-30"},
-    {"Station_Number": "2260400", "norm": 0.364251497, "date": "2022-10-01"},
-    {"Station_Number": "2260400", "norm": 0.3261676647, "date": "2022-10-02"},
-    {"Station_Number": "2260400", "norm": 0.2874251497, "date": "2022-10-03"},
-    {"Station_Number": "2260400", "norm": 0.2799401198, "date": "2022-10-04"},
-    {"Station_Number": "2260400", "norm": 0.2739520958, "date": "2022-10-05"},
-    {"Station_Number": "2260400", "norm": 0.2874251497, "date": "2022-10-06"},
-    {"Station_Number": "2260400", "norm": 0.2913173653, "date": "2022-10-07"},
-    {"Station_Number": "2260400", "norm": 0.3528742515, "date": "2022-10-08"},
-    {"Station_Number": "2260400", "norm": 0.3848502994, "date": "2022-10-09"},
-    {"Station_Number": "2260400", "norm": 0.3653892216, "date": "2022-10-10"},
-    {"Station_Number": "2260400", "norm": 0.3477245509, "date": "2022-10-11"},
-    {"Station_Number": "2260400", "norm": 0.3645508982, "date": "2022-10-12"},
-    {"Station_Number": "2260400", "norm": 0.4417365269, "date": "2022-10-13"},
-    {"Station_Number": "2260400", "norm": 0.5195808383, "date": "2022-10-14"},
-    {"Station_Number": "2260400", "norm": 0.5464071856, "date": "2022-10-15"},
-    {"Station_Number": "2260400", "norm": 0.538502994, "date": "2022-10-16"},
-    {"Station_Number": "2260400", "norm": 0.5091616766, "date": "2022-10-17"},
-    {"Station_Number": "2260400", "norm": 0.4589820359, "date": "2022-10-18"},
-    {"Station_Number": "2260400", "norm": 0.3913173653, "date": "2022-10-19"},
-    {"Station_Number": "2260400", "norm": 0.3350299401, "date": "2022-10-20"},
-    {"Station_Number": "2260400", "norm": 0.3004790419, "date": "2022-10-21"},
-    {"Station_Number": "2260400", "norm": 0.2760479042, "date": "2022-10-22"},
-    {"Station_Number": "2260400", "norm": 0.245988024, "date": "2022-10-23"},
-    {"Station_Number": "2260400", "norm": 0.225748503, "date": "2022-10-24"},
-    {"Station_Number": "2260400", "norm": 0.2082634731, "date": "2022-10-25"},
-    {"Station_Number": "2260400", "norm": 0.1946107784, "date": "2022-10-26"},
-    {"Station_Number": "2260400", "norm": 0.1818562874, "date": "2022-10-27"},
-    {"Station_Number": "2260400", "norm": 0.3194610778, "date": "2022-10-28"},
-    {"Station_Number": "2260400", "norm": 0.3947904192, "date": "2022-10-29"},
-    {"Station_Number": "2260400", "norm": 0.3700598802, "date": "2022-10-30"},
-    {"Station_Number": "2260400", "norm": 0.2888023952, "date": "2022-10-31"},
-    {"Station_Number": "2260400", "norm": 0.2247305389, "date": "2022-11-01"},
-    {"Station_Number": "2260400", "norm": 0.2046706587, "date": "2022-11-02"},
-    {"Station_Number": "2260400", "norm": 0.1865269461, "date": "2022-11-03"},
-    {"Station_Number": "2260400", "norm": 0.1676646707, "date": "2022-11-04"},
-    {"Station_Number": "2260400", "norm": 0.1558682635, "date": "2022-11-05"},
-    {"Station_Number": "2260400", "norm": 0.1443113772, "date": "2022-11-06"},
-    {"Station_Number": "2260400", "norm": 0.1407185629, "date": "2022-11-07"},
-    {"Station_Number": "2260400", "norm": 0.1371257485, "date": "2022-11-08"},
-    {"Station_Number": "2260400", "norm": 0.1299401198, "date": "2022-11-09"},
-    {"Station_Number": "2260400", "norm": 0.1251497006, "date": "2022-11-10"},
-    {"Station_Number": "2260400", "norm": 0.1237724551, "date": "2022-11-11"},
-    {"Station_Number": "2260400", "norm": 0.1209580838, "date": "2022-11-12"},
-    {"Station_Number": "2260400", "norm": 0.1195808383, "date": "2022-11-13"},
-    {"Station_Number": "2260400", "norm": 0.1155688623, "date": "2022-11-14"},
-    {"Station_Number": "2260400", "norm": 0.1119760479, "date": "2022-11-15"},
-    {"Station_Number": "2260400", "norm": 0.11, "date": "2022-11-16"},
-    {"Station_Number": "2260400", "norm": 0.1095808383, "date": "2022-11-17"},
-    {"Station_Number": "2260400", "norm": 0.1088023952, "date": "2022-11-18"},
-    {"Station_Number": "2260400", "norm": 0.1065868263, "date": "2022-11-19"},
-    {"Station_Number": "2260400", "norm": 0.1053892216, "date": "2022-11-20"},
-    {"Station_Number": "2260400", "norm": 0.1035928144, "date": "2022-11-21"},
-    {"Station_Number": "2260400", "norm": 0.1023952096, "date": "2022-11-22"},
-    {"Station_Number": "2260400", "norm": 0.0980239521, "date": "2022-11-23"},
-    {"Station_Number": "2260400", "norm": 0.0971257485, "date": "2022-11-24"},
-    {"Station_Number": "2260400", "norm": 0.0965269461, "date": "2022-11-25"},
-    {"Station_Number": "2260400", "norm": 0.095508982, "date": "2022-11-26"},
-    {"Station_Number": "2260400", "norm": 0.0922155689, "date": "2022-11-27"},
-    {"Station_Number": "2260400", "norm": 0.0886227545, "date": "2022-11-28"},
-    {"Station_Number": "2260400", "norm": 0.0965868263, "date": "2022-11-29"},
-    {"Station_Number": "2260400", "norm": 0.095988024, "date": "2022-11-30"},
-    {"Station_Number": "2260400", "norm": 0.0931137725, "date": "2022-12-01"},
-    {"Station_Number": "2260400", "norm": 0.0910179641, "date": "2022-12-02"},
-    {"Station_Number": "2260400", "norm": 0.0877245509, "date": "2022-12-03"},
-    {"Station_Number": "2260400", "norm": 0.0850299401, "date": "2022-12-04"},
-    {"Station_Number": "2260400", "norm": 0.0836526946, "date": "2022-12-05"},
-    {"Station_Number": "2260400", "norm": 0.0824550898, "date": "2022-12-06"},
-    {"Station_Number": "2260400", "norm": 0.081257485, "date": "2022-12-07"},
-    {"Station_Number": "2260400", "norm": 0.0799401198, "date": "2022-12-08"},
-    {"Station_Number": "2260400", "norm": 0.0789221557, "date": "2022-12-09"},
-    {"Station_Number": "2260400", "norm": 0.0780239521, "date": "2022-12-10"},
-    {"Station_Number": "2260400", "norm": 0.077245509, "date": "2022-12-11"},
-    {"Station_Number": "2260400", "norm": 0.0764670659, "date": "2022-12-12"},
-    {"Station_Number": "2260400", "norm": 0.0754491018, "date": "2022-12-13"},
-    {"Station_Number": "2260400", "norm": 0.0740718563, "date": "2022-12-14"},
-    {"Station_Number": "2260400", "norm": 0.0728742515, "date": "2022-12-15"},
-    {"Station_Number": "2260400", "norm": 0.0716766467, "date": "2022-12-16"},
-    {"Station_Number": "2260400", "norm": 0.0708982036, "date": "2022-12-17"},
-    {"Station_Number": "2260400", "norm": 0.0707185629, "date": "2022-12-18"},
-    {"Station_Number": "2260400", "norm": 0.0704191617, "date": "2022-12-19"},
-    {"Station_Number": "2260400", "norm": 0.0699401198, "date": "2022-12-20"},
-    {"Station_Number": "2260400", "norm": 0.0699401198, "date": "2022-12-21"},
-    {"Station_Number": "2260400", "norm": 0.0694610778, "date": "2022-12-22"},
-    {"Station_Number": "2260400", "norm": 0.0689820359, "date": "2022-12-23"},
-    {"Station_Number": "2260400", "norm": 0.0689820359, "date": "2022-12-24"},
-    {"Station_Number": "2260400", "norm": 0.068502994, "date": "2022-12-25"},
-    {"Station_Number": "2260400", "norm": 0.0680239521, "date": "2022-12-26"},
-    {"Station_Number": "2260400", "norm": 0.0675449102, "date": "2022-12-27"},
-    {"Station_Number": "2260400", "norm": 0.0670658683, "date": "2022-12-28"},
-    {"Station_Number": "2260400", "norm": 0.067245509, "date": "2022-12-29"},
-    {"Station_Number": "2260400", "norm": 0.0723952096, "date": "2022-12-30"},
-    {"Station_Number": "2260400", "norm": 0.0746706587, "date": "2022-12-31"},
-    {"Station_Number": "2260400", "norm": 0.0638622247, "date": "2023-01-01"},
-    {"Station_Number": "2260400", "norm": 0.0623941276, "date": "2023-01-02"},
-    {"Station_Number": "2260400", "norm": 0.0621682665, "date": "2023-01-03"},
-    {"Station_Number": "2260400", "norm": 0.0611518916, "date": "2023-01-04"},
-    {"Station_Number": "2260400", "norm": 0.0605307736, "date": "2023-01-05"},
-    {"Station_Number": "2260400", "norm": 0.0603049125, "date": "2023-01-06"},
-    {"Station_Number": "2260400", "norm": 0.0584980237, "date": "2023-01-07"},
-    {"Station_Number": "2260400", "norm": 0.0572557877, "date": "2023-01-08"},
-    {"Station_Number": "2260400", "norm": 0.0560700169, "date": "2023-01-09"},
-    {"Station_Number": "2260400", "norm": 0.0551101073, "date": "2023-01-10"},
-    {"Station_Number": "2260400", "norm": 0.0548842462, "date": "2023-01-11"},
-    {"Station_Number": "2260400", "norm": 0.0539243365, "date": "2023-01-12"},
-    {"Station_Number": "2260400", "norm": 0.0533032185, "date": "2023-01-13"},
-    {"Station_Number": "2260400", "norm": 0.0531338227, "date": "2023-01-14"},
-    {"Station_Number": "2260400", "norm": 0.0521174478, "date": "2023-01-15"},
-    {"Station_Number": "2260400", "norm": 0.051552795, "date": "2023-01-16"},
-    {"Station_Number": "2260400", "norm": 0.0513269339, "date": "2023-01-17"},
-    {"Station_Number": "2260400", "norm": 0.0503670243, "date": "2023-01-18"},
-    {"Station_Number": "2260400", "norm": 0.0501976285, "date": "2023-01-19"},
-    {"Station_Number": "2260400", "norm": 0.0492377188, "date": "2023-01-20"},
-    {"Station_Number": "2260400", "norm": 0.049068323, "date": "2023-01-21"},
-    {"Station_Number": "2260400", "norm": 0.0485036702, "date": "2023-01-22"},
-    {"Station_Number": "2260400", "norm": 0.0474872953, "date": "2023-01-23"},
-    {"Station_Number": "2260400", "norm": 0.0463579898, "date": "2023-01-24"},
-    {"Station_Number": "2260400", "norm": 0.0452286844, "date": "2023-01-25"},
-    {"Station_Number": "2260400", "norm": 0.0450592885, "date": "2023-01-26"},
-    {"Station_Number": "2260400", "norm": 0.0439864483, "date": "2023-01-27"},
-    {"Station_Number": "2260400", "norm": 0.0434217956, "date": "2023-01-28"},
-    {"Station_Number": "2260400", "norm": 0.0424618859, "date": "2023-01-29"},
-    {"Station_Number": "2260400", "norm": 0.0422924901, "date": "2023-01-30"},
-    {"Station_Number": "2260400", "norm": 0.0417843027, "date": "2023-01-31"},
-    {"Station_Number": "2260400", "norm": 0.040824393, "date": "2023-02-01"},
-    {"Station_Number": "2260400", "norm": 0.0406549972, "date": "2023-02-02"},
-    {"Station_Number": "2260400", "norm": 0.0403162055, "date": "2023-02-03"},
-    {"Station_Number": "2260400", "norm": 0.0403162055, "date": "2023-02-04"},
-    {"Station_Number": "2260400", "norm": 0.0403162055, "date": "2023-02-05"},
-    {"Station_Number": "2260400", "norm": 0.0397515528, "date": "2023-02-06"},
-    {"Station_Number": "2260400", "norm": 0.039582157, "date": "2023-02-07"},
-    {"Station_Number": "2260400", "norm": 0.0392433653, "date": "2023-02-08"},
-    {"Station_Number": "2260400", "norm": 0.0390739695, "date": "2023-02-09"},
-    {"Station_Number": "2260400", "norm": 0.038565782, "date": "2023-02-10"},
-    {"Station_Number": "2260400", "norm": 0.0381705251, "date": "2023-02-11"},
-    {"Station_Number": "2260400", "norm": 0.0381705251, "date": "2023-02-12"},
-    {"Station_Number": "2260400", "norm": 0.0381705251, "date": "2023-02-13"},
-    {"Station_Number": "2260400", "norm": 0.0380011293, "date": "2023-02-14"},
-    {"Station_Number": "2260400", "norm": 0.0376623377, "date": "2023-02-15"},
-    {"Station_Number": "2260400", "norm": 0.0371541502, "date": "2023-02-16"},
-    {"Station_Number": "2260400", "norm": 0.0387351779, "date": "2023-02-17"},
-    {"Station_Number": "2260400", "norm": 0.0399209486, "date": "2023-02-18"},
-    {"Station_Number": "2260400", "norm": 0.0387351779, "date": "2023-02-19"},
-    {"Station_Number": "2260400", "norm": 0.0376623377, "date": "2023-02-20"},
-    {"Station_Number": "2260400", "norm": 0.0369847544, "date": "2023-02-21"},
-    {"Station_Number": "2260400", "norm": 0.0364765669, "date": "2023-02-22"},
-    {"Station_Number": "2260400", "norm": 0.0355731225, "date": "2023-02-23"},
-    {"Station_Number": "2260400", "norm": 0.0350649351, "date": "2023-02-24"},
-    {"Station_Number": "2260400", "norm": 0.0354037267, "date": "2023-02-25"},
-    {"Station_Number": "2260400", "norm": 0.0533596838, "date": "2023-02-26"},
-    {"Station_Number": "2260400", "norm": 0.0655561829, "date": "2023-02-27"},
-    {"Station_Number": "2260400", "norm": 0.0711462451, "date": "2023-02-28"},
-    {"Station_Number": "2260400", "norm": 0.0622247318, "date": "2023-03-01"},
-    {"Station_Number": "2260400", "norm": 0.0570863919, "date": "2023-03-02"},
-    {"Station_Number": "2260400", "norm": 0.0511575381, "date": "2023-03-03"},
-    {"Station_Number": "2260400", "norm": 0.0473178995, "date": "2023-03-04"},
-    {"Station_Number": "2260400", "norm": 0.0446640316, "date": "2023-03-05"},
-    {"Station_Number": "2260400", "norm": 0.0428571429, "date": "2023-03-06"},
-    {"Station_Number": "2260400", "norm": 0.0422924901, "date": "2023-03-07"},
-    {"Station_Number": "2260400", "norm": 0.0413890457, "date": "2023-03-08"},
-    {"Station_Number": "2260400", "norm": 0.040824393, "date": "2023-03-09"},
-    {"Station_Number": "2260400", "norm": 0.0409937888, "date": "2023-03-10"},
-    {"Station_Number": "2260400", "norm": 0.0430265387, "date": "2023-03-11"},
-    {"Station_Number": "2260400", "norm": 0.0435911914, "date": "2023-03-12"},
-    {"Station_Number": "2260400", "norm": 0.0430265387, "date": "2023-03-13"},
-    {"Station_Number": "2260400", "norm": 0.0409937888, "date": "2023-03-14"},
-    {"Station_Number": "2260400", "norm": 0.0403162055, "date": "2023-03-15"},
-    {"Station_Number": "2260400", "norm": 0.0397515528, "date": "2023-03-16"},
-    {"Station_Number": "2260400", "norm": 0.0397515528, "date": "2023-03-17"},
-    {"Station_Number": "2260400", "norm": 0.0399209486, "date": "2023-03-18"},
-    {"Station_Number": "2260400", "norm": 0.0430265387, "date": "2023-03-19"},
-    {"Station_Number": "2260400", "norm": 0.0441558442, "date": "2023-03-20"},
-    {"Station_Number": "2260400", "norm": 0.0469226426, "date": "2023-03-21"},
-    {"Station_Number": "2260400", "norm": 0.0457933371, "date": "2023-03-22"},
-    {"Station_Number": "2260400", "norm": 0.049689441, "date": "2023-03-23"},
-    {"Station_Number": "2260400", "norm": 0.1029361942, "date": "2023-03-24"},
-    {"Station_Number": "2260400", "norm": 0.1223602484, "date": "2023-03-25"},
-    {"Station_Number": "2260400", "norm": 0.1141163185, "date": "2023-03-26"},
-    {"Station_Number": "2260400", "norm": 0.0839638622, "date": "2023-03-27"},
-    {"Station_Number": "2260400", "norm": 0.0837380011, "date": "2023-03-28"},
-    {"Station_Number": "2260400", "norm": 0.0583286279, "date": "2023-03-29"},
-    {"Station_Number": "2260400", "norm": 0.0490118577, "date": "2023-03-30"},
-    {"Station_Number": "2260400", "norm": 0.061038961, "date": "2023-03-31"},
-    {"Station_Number": "2260400", "norm": 0.0754940711, "date": "2023-04-01"},
-    {"Station_Number": "2260400", "norm": 0.0647656691, "date": "2023-04-02"},
-    {"Station_Number": "2260400", "norm": 0.0496329757, "date": "2023-04-03"},
-    {"Station_Number": "2260400", "norm": 0.0428571429, "date": "2023-04-04"},
-    {"Station_Number": "2260400", "norm": 0.0435911914, "date": "2023-04-05"},
-    {"Station_Number": "2260400", "norm": 0.1109542631, "date": "2023-04-06"},
-    {"Station_Number": "2260400", "norm": 0.1512140034, "date": "2023-04-07"},
-    {"Station_Number": "2260400", "norm": 0.1207227555, "date": "2023-04-08"},
-    {"Station_Number": "2260400", "norm": 0.102879729, "date": "2023-04-09"},
-    {"Station_Number": "2260400", "norm": 0.0916996047, "date": "2023-04-10"},
-    {"Station_Number": "2260400", "norm": 0.0687747036, "date": "2023-04-11"},
-    {"Station_Number": "2260400", "norm": 0.0555053642, "date": "2023-04-12"},
-    {"Station_Number": "2260400", "norm": 0.048447205, "date": "2023-04-13"},
-    {"Station_Number": "2260400", "norm": 0.0437605872, "date": "2023-04-14"},
-    {"Station_Number": "2260400", "norm": 0.0413890457, "date": "2023-04-15"},
-    {"Station_Number": "2260400", "norm": 0.0406549972, "date": "2023-04-16"},
-    {"Station_Number": "2260400", "norm": 0.0397515528, "date": "2023-04-17"},
-    {"Station_Number": "2260400", "norm": 0.0392433653, "date": "2023-04-18"},
-    {"Station_Number": "2260400", "norm": 0.040824393, "date": "2023-04-19"},
-    {"Station_Number": "2260400", "norm": 0.0463579898, "date": "2023-04-20"},
-    {"Station_Number": "2260400", "norm": 0.0577075099, "date": "2023-04-21"},
-    {"Station_Number": "2260400", "norm": 0.051552795, "date": "2023-04-22"},
-    {"Station_Number": "2260400", "norm": 0.0469226426, "date": "2023-04-23"},
-    {"Station_Number": "2260400", "norm": 0.0529079616, "date": "2023-04-24"},
-    {"Station_Number": "2260400", "norm": 0.0745341615, "date": "2023-04-25"},
-    {"Station_Number": "2260400", "norm": 0.0823263693, "date": "2023-04-26"},
-    {"Station_Number": "2260400", "norm": 0.0737436477, "date": "2023-04-27"},
-    {"Station_Number": "2260400", "norm": 0.075042349, "date": "2023-04-28"},
-    {"Station_Number": "2260400", "norm": 0.0673066064, "date": "2023-04-29"},
-    {"Station_Number": "2260400", "norm": 0.0540937324, "date": "2023-04-30"},
-    {"Station_Number": "2260400", "norm": 0.0482778091, "date": "2023-05-01"},
-    {"Station_Number": "2260400", "norm": 0.0452286844, "date": "2023-05-02"},
-    {"Station_Number": "2260400", "norm": 0.0428571429, "date": "2023-05-03"},
-    {"Station_Number": "2260400", "norm": 0.0392433653, "date": "2023-05-04"},
-    {"Station_Number": "2260400", "norm": 0.0418972332, "date": "2023-05-05"},
-    {"Station_Number": "2260400", "norm": 0.1111236589, "date": "2023-05-06"},
-    {"Station_Number": "2260400", "norm": 0.1342744212, "date": "2023-05-07"},
-    {"Station_Number": "2260400", "norm": 0.0970073405, "date": "2023-05-08"},
-    {"Station_Number": "2260400", "norm": 0.1041784303, "date": "2023-05-09"},
-    {"Station_Number": "2260400", "norm": 0.1002823264, "date": "2023-05-10"},
-    {"Station_Number": "2260400", "norm": 0.0701298701, "date": "2023-05-11"},
-    {"Station_Number": "2260400", "norm": 0.0543195935, "date": "2023-05-12"},
-    {"Station_Number": "2260400", "norm": 0.0482778091, "date": "2023-05-13"},
-    {"Station_Number": "2260400", "norm": 0.0480519481, "date": "2023-05-14"},
-    {"Station_Number": "2260400", "norm": 0.0519480519, "date": "2023-05-15"},
-    {"Station_Number": "2260400", "norm": 0.0496329757, "date": "2023-05-16"},
-    {"Station_Number": "2260400", "norm": 0.0469226426, "date": "2023-05-17"},
-    {"Station_Number": "2260400", "norm": 0.0904009034, "date": "2023-05-18"},
-    {"Station_Number": "2260400", "norm": 0.1973461321, "date": "2023-05-19"},
-    {"Station_Number": "2260400", "norm": 0.1815923207, "date": "2023-05-20"},
-    {"Station_Number": "2260400", "norm": 0.1398080181, "date": "2023-05-21"},
-    {"Station_Number": "2260400", "norm": 0.1073969509, "date": "2023-05-22"},
-    {"Station_Number": "2260400", "norm": 0.1107848673, "date": "2023-05-23"},
-    {"Station_Number": "2260400", "norm": 0.1419536985, "date": "2023-05-24"},
-    {"Station_Number": "2260400", "norm": 0.1224167137, "date": "2023-05-25"},
-    {"Station_Number": "2260400", "norm": 0.097515528, "date": "2023-05-26"},
-    {"Station_Number": "2260400", "norm": 0.0825522304, "date": "2023-05-27"},
-    {"Station_Number": "2260400", "norm": 0.0782044043, "date": "2023-05-28"},
-    {"Station_Number": "2260400", "norm": 0.0786561265, "date": "2023-05-29"},
-    {"Station_Number": "2260400", "norm": 0.0967814794, "date": "2023-05-30"},
-    {"Station_Number": "2260400", "norm": 0.1295878035, "date": "2023-05-31"},
-    {"Station_Number": "2260400", "norm": 0.0983060418, "date": "2023-06-01"},
-    {"Station_Number": "2260400", "norm": 0.0757763975, "date": "2023-06-02"},
-    {"Station_Number": "2260400", "norm": 0.0715979673, "date": "2023-06-03"},
-    {"Station_Number": "2260400", "norm": 0.0722190853, "date": "2023-06-04"},
-    {"Station_Number": "2260400", "norm": 0.0731225296, "date": "2023-06-05"},
-    {"Station_Number": "2260400", "norm": 0.079390175, "date": "2023-06-06"},
-    {"Station_Number": "2260400", "norm": 0.0733483907, "date": "2023-06-07"},
-    {"Station_Number": "2260400", "norm": 0.0722190853, "date": "2023-06-08"},
-    {"Station_Number": "2260400", "norm": 0.0713721062, "date": "2023-06-09"},
-    {"Station_Number": "2260400", "norm": 0.0683229814, "date": "2023-06-10"},
-    {"Station_Number": "2260400", "norm": 0.0739695088, "date": "2023-06-11"},
-    {"Station_Number": "2260400", "norm": 0.0837380011, "date": "2023-06-12"},
-    {"Station_Number": "2260400", "norm": 0.182891022, "date": "2023-06-13"},
-    {"Station_Number": "2260400", "norm": 0.3938452851, "date": "2023-06-14"},
-    {"Station_Number": "2260400", "norm": 0.4788255223, "date": "2023-06-15"},
-    {"Station_Number": "2260400", "norm": 0.5105025409, "date": "2023-06-16"},
-    {"Station_Number": "2260400", "norm": 0.5758893281, "date": "2023-06-17"},
-    {"Station_Number": "2260400", "norm": 0.6589497459, "date": "2023-06-18"},
-    {"Station_Number": "2260400", "norm": 0.70824393, "date": "2023-06-19"},
-    {"Station_Number": "2260400", "norm": 0.7313946923, "date": "2023-06-20"},
-    {"Station_Number": "2260400", "norm": 0.7206662902, "date": "2023-06-21"},
-    {"Station_Number": "2260400", "norm": 0.6898362507, "date": "2023-06-22"},
-    {"Station_Number": "2260400", "norm": 0.6986448334, "date": "2023-06-23"},
-    {"Station_Number": "2260400", "norm": 0.7423489554, "date": "2023-06-24"},
-    {"Station_Number": "2260400", "norm": 0.8089779785, "date": "2023-06-25"},
-    {"Station_Number": "2260400", "norm": 0.8558441558, "date": "2023-06-26"},
-    {"Station_Number": "2260400", "norm": 0.8522303783, "date": "2023-06-27"},
-    {"Station_Number": "2260400", "norm": 0.786391869, "date": "2023-06-28"},
-    {"Station_Number": "2260400", "norm": 0.6700734049, "date": "2023-06-29"},
-    {"Station_Number": "2260400", "norm": 0.5654997177, "date": "2023-06-30"},
-    {"Station_Number": "2260400", "norm": 0.5446075663, "date": "2023-07-01"},
-    {"Station_Number": "2260400", "norm": 0.5699604743, "date": "2023-07-02"},
-    {"Station_Number": "2260400", "norm": 0.5749858837, "date": "2023-07-03"},
-    {"Station_Number": "2260400", "norm": 0.5723884811, "date": "2023-07-04"},
-    {"Station_Number": "2260400", "norm": 0.5883681536, "date": "2023-07-05"},
-    {"Station_Number": "2260400", "norm": 0.6181253529, "date": "2023-07-06"},
-    {"Station_Number": "2260400", "norm": 0.6480519481, "date": "2023-07-07"},
-    {"Station_Number": "2260400", "norm": 0.7103331451, "date": "2023-07-08"},
-    {"Station_Number": "2260400", "norm": 0.7660643704, "date": "2023-07-09"},
-    {"Station_Number": "2260400", "norm": 0.8074534161, "date": "2023-07-10"},
-    {"Station_Number": "2260400", "norm": 0.8273856578, "date": "2023-07-11"},
-    {"Station_Number": "2260400", "norm": 0.8279503106, "date": "2023-07-12"},
-    {"Station_Number": "2260400", "norm": 0.8134952005, "date": "2023-07-13"},
-    {"Station_Number": "2260400", "norm": 0.8172219085, "date": "2023-07-14"},
-    {"Station_Number": "2260400", "norm": 0.8485036702, "date": "2023-07-15"},
-    {"Station_Number": "2260400", "norm": 0.8838509317, "date": "2023-07-16"},
-    {"Station_Number": "2260400", "norm": 0.8870694523, "date": "2023-07-17"},
-    {"Station_Number": "2260400", "norm": 0.8627893845, "date": "2023-07-18"},
-    {"Station_Number": "2260400", "norm": 0.8352907962, "date": "2023-07-19"},
-    {"Station_Number": "2260400", "norm": 0.7991530209, "date": "2023-07-20"},
-    {"Station_Number": "2260400", "norm": 0.7409937888, "date": "2023-07-21"},
-    {"Station_Number": "2260400", "norm": 0.632580463, "date": "2023-07-22"},
-    {"Station_Number": "2260400", "norm": 0.5701298701, "date": "2023-07-23"},
-    {"Station_Number": "2260400", "norm": 0.5785996612, "date": "2023-07-24"},
-    {"Station_Number": "2260400", "norm": 0.5554488989, "date": "2023-07-25"},
-    {"Station_Number": "2260400", "norm": 0.5184076793, "date": "2023-07-26"},
-    {"Station_Number": "2260400", "norm": 0.5170525127, "date": "2023-07-27"},
-    {"Station_Number": "2260400", "norm": 0.537944664, "date": "2023-07-28"},
-    {"Station_Number": "2260400", "norm": 0.5704686618, "date": "2023-07-29"},
-    {"Station_Number": "2260400", "norm": 0.602484472, "date": "2023-07-30"},
-    {"Station_Number": "2260400", "norm": 0.6166007905, "date": "2023-07-31"},
-    {"Station_Number": "2260400", "norm": 0.6359683794, "date": "2023-08-01"},
-    {"Station_Number": "2260400", "norm": 0.6354037267, "date": "2023-08-02"},
-    {"Station_Number": "2260400", "norm": 0.6209486166, "date": "2023-08-03"},
-    {"Station_Number": "2260400", "norm": 0.6429700734, "date": "2023-08-04"},
-    {"Station_Number": "2260400", "norm": 0.6894409938, "date": "2023-08-05"},
-    {"Station_Number": "2260400", "norm": 0.7268774704, "date": "2023-08-06"},
-    {"Station_Number": "2260400", "norm": 0.7711462451, "date": "2023-08-07"},
-    {"Station_Number": "2260400", "norm": 0.8332580463, "date": "2023-08-08"},
-    {"Station_Number": "2260400", "norm": 0.9030491248, "date": "2023-08-09"},
-    {"Station_Number": "2260400", "norm": 0.9563523433, "date": "2023-08-10"},
-    {"Station_Number": "2260400", "norm": 0.98040655, "date": "2023-08-11"},
-    {"Station_Number": "2260400", "norm": 0.9783738001, "date": "2023-08-12"},
-    {"Station_Number": "2260400", "norm": 0.9638622247, "date": "2023-08-13"},
-    {"Station_Number": "2260400", "norm": 0.9463579898, "date": "2023-08-14"},
-    {"Station_Number": "2260400", "norm": 0.9491812535, "date": "2023-08-15"},
-    {"Station_Number": "2260400", "norm": 0.9553924337, "date": "2023-08-16"},
-    {"Station_Number": "2260400", "norm": 0.9425748165, "date": "2023-08-17"},
-    {"Station_Number": "2260400", "norm": 0.9301524562, "date": "2023-08-18"},
-    {"Station_Number": "2260400", "norm": 0.8908526256, "date": "2023-08-19"},
-    {"Station_Number": "2260400", "norm": 0.8464144551, "date": "2023-08-20"},
-    {"Station_Number": "2260400", "norm": 0.7852625635, "date": "2023-08-21"},
-    {"Station_Number": "2260400", "norm": 0.7639751553, "date": "2023-08-22"},
-    {"Station_Number": "2260400", "norm": 0.7688876341, "date": "2023-08-23"},
-    {"Station_Number": "2260400", "norm": 0.7822134387, "date": "2023-08-24"},
-    {"Station_Number": "2260400", "norm": 0.7940711462, "date": "2023-08-25"},
-    {"Station_Number": "2260400", "norm": 0.797120271, "date": "2023-08-26"},
-    {"Station_Number": "2260400", "norm": 0.8074534161, "date": "2023-08-27"},
-    {"Station_Number": "2260400", "norm": 0.8456804065, "date": "2023-08-28"},
-    {"Station_Number": "2260400", "norm": 0.894014681, "date": "2023-08-29"},
-    {"Station_Number": "2260400", "norm": 0.9425748165, "date": "2023-08-30"},
-    {"Station_Number": "2260400", "norm": 0.9787125918, "date": "2023-08-31"},
-    {"Station_Number": "2260400", "norm": 1.0, "date": "2023-09-01"},
-    {"Station_Number": "2260400", "norm": 0.9988706945, "date": "2023-09-02"},
-    {"Station_Number": "2260400", "norm": 0.9766798419, "date": "2023-09-03"},
-    {"Station_Number": "2260400", "norm": 0.9459627329, "date": "2023-09-04"},
-    {"Station_Number": "2260400", "norm": 0.8891586674, "date": "2023-09-05"},
-    {"Station_Number": "2260400", "norm": 0.8001129305, "date": "2023-09-06"},
-    {"Station_Number": "2260400", "norm": 0.6881422925, "date": "2023-09-07"},
-    {"Station_Number": "2260400", "norm": 0.5915866742, "date": "2023-09-08"},
-    {"Station_Number": "2260400", "norm": 0.5343873518, "date": "2023-09-09"},
-    {"Station_Number": "2260400", "norm": 0.4883116883, "date": "2023-09-10"},
-    {"Station_Number": "2260400", "norm": 0.4600790514, "date": "2023-09-11"},
-    {"Station_Number": "2260400", "norm": 0.4304347826, "date": "2023-09-12"},
-    {"Station_Number": "2260400", "norm": 0.4428571429, "date": "2023-09-13"},
-    {"Station_Number": "2260400", "norm": 0.4504234896, "date": "2023-09-14"},
-    {"Station_Number": "2260400", "norm": 0.4801242236, "date": "2023-09-15"},
-    {"Station_Number": "2260400", "norm": 0.5126482213, "date": "2023-09-16"},
-    {"Station_Number": "2260400", "norm": 0.4630717109, "date": "2023-09-17"},
-    {"Station_Number": "2260400", "norm": 0.3994918125, "date": "2023-09-18"},
-    {"Station_Number": "2260400", "norm": 0.3752117448, "date": "2023-09-19"},
-    {"Station_Number": "2260400", "norm": 0.3763410503, "date": "2023-09-20"},
-    {"Station_Number": "2260400", "norm": 0.3986448334, "date": "2023-09-21"},
-    {"Station_Number": "2260400", "norm": 0.3962168267, "date": "2023-09-22"},
-    {"Station_Number": "2260400", "norm": 0.440824393, "date": "2023-09-23"},
-    {"Station_Number": "2260400", "norm": 0.502258611, "date": "2023-09-24"},
-    {"Station_Number": "2260400", "norm": 0.5717673631, "date": "2023-09-25"},
-    {"Station_Number": "2260400", "norm": 0.5979672501, "date": "2023-09-26"},
-    {"Station_Number": "2260400", "norm": 0.5795031056, "date": "2023-09-27"},
-    {"Station_Number": "2260400", "norm": 0.5455110107, "date": "2023-09-28"},
-    {"Station_Number": "2260400", "norm": 0.4745906268, "date": "2023-09-29"},
-    {"Station_Number": "2260400", "norm": 0.4055900621, "date": "2023-09-30"},
-    {"Station_Number": "2260400", "norm": 0.3712591756, "date": "2023-10-01"},
-    {"Station_Number": "2260400", "norm": 0.3179559571, "date": "2023-10-02"},
-    {"Station_Number": "2260400", "norm": 0.2988142292, "date": "2023-10-03"},
-    {"Station_Number": "2260400", "norm": 0.2980801807, "date": "2023-10-04"},
-    {"Station_Number": "2260400", "norm": 0.3178994918, "date": "2023-10-05"},
-    {"Station_Number": "2260400", "norm": 0.3823263693, "date": "2023-10-06"},
-    {"Station_Number": "2260400", "norm": 0.4075098814, "date": "2023-10-07"},
-    {"Station_Number": "2260400", "norm": 0.4840767928, "date": "2023-10-08"},
-    {"Station_Number": "2260400", "norm": 0.556295878, "date": "2023-10-09"},
-    {"Station_Number": "2260400", "norm": 0.5571993224, "date": "2023-10-10"},
-    {"Station_Number": "2260400", "norm": 0.5522868436, "date": "2023-10-11"},
-    {"Station_Number": "2260400", "norm": 0.5838509317, "date": "2023-10-12"},
-    {"Station_Number": "2260400", "norm": 0.5832862789, "date": "2023-10-13"},
-    {"Station_Number": "2260400", "norm": 0.6051383399, "date": "2023-10-14"},
-    {"Station_Number": "2260400", "norm": 0.6387916431, "date": "2023-10-15"},
-    {"Station_Number": "2260400", "norm": 0.6133822699, "date": "2023-10-16"},
-    {"Station_Number": "2260400", "norm": 0.5375494071, "date": "2023-10-17"},
-    {"Station_Number": "2260400", "norm": 0.453811406, "date": "2023-10-18"},
-    {"Station_Number": "2260400", "norm": 0.3843591191, "date": "2023-10-19"},
-    {"Station_Number": "2260400", "norm": 0.3400903444, "date": "2023-10-20"},
-    {"Station_Number": "2260400", "norm": 0.3032185206, "date": "2023-10-21"},
-    {"Station_Number": "2260400", "norm": 0.2780350085, "date": "2023-10-22"},
-    {"Station_Number": "2260400", "norm": 0.2622811971, "date": "2023-10-23"},
-    {"Station_Number": "2260400", "norm": 0.2351214003, "date": "2023-10-24"},
-    {"Station_Number": "2260400", "norm": 0.2151326934, "date": "2023-10-25"},
-    {"Station_Number": "2260400", "norm": 0.2058159232, "date": "2023-10-26"},
-    {"Station_Number": "2260400", "norm": 0.2010163749, "date": "2023-10-27"},
-    {"Station_Number": "2260400", "norm": 0.1904573687, "date": "2023-10-28"},
-    {"Station_Number": "2260400", "norm": 0.2116318464, "date": "2023-10-29"},
-    {"Station_Number": "2260400", "norm": 0.2785431959, "date": "2023-10-30"},
-    {"Station_Number": "2260400", "norm": 0.2883681536, "date": "2023-10-31"},
-    {"Station_Number": "2260400", "norm": 0.2462450593, "date": "2023-11-01"},
-    {"Station_Number": "2260400", "norm": 0.2199887069, "date": "2023-11-02"},
-    {"Station_Number": "2260400", "norm": 0.1963862225, "date": "2023-11-03"},
-    {"Station_Number": "2260400", "norm": 0.1845849802, "date": "2023-11-04"},
-    {"Station_Number": "2260400", "norm": 0.1791078487, "date": "2023-11-05"},
-    {"Station_Number": "2260400", "norm": 0.1754940711, "date": "2023-11-06"},
-    {"Station_Number": "2260400", "norm": 0.1737436477, "date": "2023-11-07"},
-    {"Station_Number": "2260400", "norm": 0.1725578769, "date": "2023-11-08"},
-    {"Station_Number": "2260400", "norm": 0.1707509881, "date": "2023-11-09"},
-    {"Station_Number": "2260400", "norm": 0.1674760023, "date": "2023-11-10"},
-    {"Station_Number": "2260400", "norm": 0.1654432524, "date": "2023-11-11"},
-    {"Station_Number": "2260400", "norm": 0.1636928289, "date": "2023-11-12"},
-    {"Station_Number": "2260400", "norm": 0.1604743083, "date": "2023-11-13"},
-    {"Station_Number": "2260400", "norm": 0.1587238848, "date": "2023-11-14"},
-    {"Station_Number": "2260400", "norm": 0.1587238848, "date": "2023-11-15"},
-    {"Station_Number": "2260400", "norm": 0.1575381141, "date": "2023-11-16"},
-    {"Station_Number": "2260400", "norm": 0.1561264822, "date": "2023-11-17"},
-    {"Station_Number": "2260400", "norm": 0.1564088086, "date": "2023-11-18"},
-    {"Station_Number": "2260400", "norm": 0.1592885375, "date": "2023-11-19"},
-    {"Station_Number": "2260400", "norm": 0.1592885375, "date": "2023-11-20"},
-    {"Station_Number": "2260400", "norm": 0.1575381141, "date": "2023-11-21"},
-    {"Station_Number": "2260400", "norm": 0.1543760587, "date": "2023-11-22"},
-    {"Station_Number": "2260400", "norm": 0.1523433089, "date": "2023-11-23"},
-    {"Station_Number": "2260400", "norm": 0.1506493506, "date": "2023-11-24"},
-    {"Station_Number": "2260400", "norm": 0.1475437606, "date": "2023-11-25"},
-    {"Station_Number": "2260400", "norm": 0.1447204969, "date": "2023-11-26"},
-    {"Station_Number": "2260400", "norm": 0.1430265387, "date": "2023-11-27"},
-    {"Station_Number": "2260400", "norm": 0.1413890457, "date": "2023-11-28"},
-    {"Station_Number": "2260400", "norm": 0.1389045737, "date": "2023-11-29"},
-    {"Station_Number": "2260400", "norm": 0.1372106155, "date": "2023-11-30"},
-    {"Station_Number": "2260400", "norm": 0.1347826087, "date": "2023-12-01"},
-    {"Station_Number": "2260400", "norm": 0.1334274421, "date": "2023-12-02"},
-    {"Station_Number": "2260400", "norm": 0.1322981366, "date": "2023-12-03"},
-    {"Station_Number": "2260400", "norm": 0.1309429701, "date": "2023-12-04"},
-    {"Station_Number": "2260400", "norm": 0.1298701299, "date": "2023-12-05"},
-    {"Station_Number": "2260400", "norm": 0.1273856578, "date": "2023-12-06"},
-    {"Station_Number": "2260400", "norm": 0.1245059289, "date": "2023-12-07"},
-    {"Station_Number": "2260400", "norm": 0.1228684359, "date": "2023-12-08"},
-    {"Station_Number": "2260400", "norm": 0.1228684359, "date": "2023-12-09"},
-    {"Station_Number": "2260400", "norm": 0.1210050819, "date": "2023-12-10"},
-    {"Station_Number": "2260400", "norm": 0.1194240542, "date": "2023-12-11"},
-    {"Station_Number": "2260400", "norm": 0.1184076793, "date": "2023-12-12"},
-    {"Station_Number": "2260400", "norm": 0.1194240542, "date": "2023-12-13"},
-    {"Station_Number": "2260400", "norm": 0.1181818182, "date": "2023-12-14"},
-    {"Station_Number": "2260400", "norm": 0.117108978, "date": "2023-12-15"},
-    {"Station_Number": "2260400", "norm": 0.1158102767, "date": "2023-12-16"},
-    {"Station_Number": "2260400", "norm": 0.1142857143, "date": "2023-12-17"},
-    {"Station_Number": "2260400", "norm": 0.1112365895, "date": "2023-12-18"},
-    {"Station_Number": "2260400", "norm": 0.1127611519, "date": "2023-12-19"},
-    {"Station_Number": "2260400", "norm": 0.1112365895, "date": "2023-12-20"},
-    {"Station_Number": "2260400", "norm": 0.1094297007, "date": "2023-12-21"},
-    {"Station_Number": "2260400", "norm": 0.1086956522, "date": "2023-12-22"},
-    {"Station_Number": "2260400", "norm": 0.1058723885, "date": "2023-12-23"},
-    {"Station_Number": "2260400", "norm": 0.1043478261, "date": "2023-12-24"},
-    {"Station_Number": "2260400", "norm": 0.1036137775, "date": "2023-12-25"},
-    {"Station_Number": "2260400", "norm": 0.1033879164, "date": "2023-12-26"},
-    {"Station_Number": "2260400", "norm": 0.1014116318, "date": "2023-12-27"},
-    {"Station_Number": "2260400", "norm": 0.1014116318, "date": "2023-12-28"},
-    {"Station_Number": "2260400", "norm": 0.1006775833, "date": "2023-12-29"},
-    {"Station_Number": "2260400", "norm": 0.0989271598, "date": "2023-12-30"},
-    {"Station_Number": "2260400", "norm": 0.0976849238, "date": "2023-12-31"},
-    {"Station_Number": "2260500", "norm": 0.0341110151, "date": "2020-01-01"},
-    {"Station_Number": "2260500", "norm": 0.0340287207, "date": "2020-01-02"},
-    {"Station_Number": "2260500", "norm": 0.0348928116, "date": "2020-01-03"},
-    {"Station_Number": "2260500", "norm": 0.0384726165, "date": "2020-01-04"},
-    {"Station_Number": "2260500", "norm": 0.0348105172, "date": "2020-01-05"},
-    {"Station_Number": "2260500", "norm": 0.0340287207, "date": "2020-01-06"},
-    {"Station_Number": "2260500", "norm": 0.0341933095, "date": "2020-01-07"},
-    {"Station_Number": "2260500", "norm": 0.0357980496, "date": "2020-01-08"},
-    {"Station_Number": "2260500", "norm": 0.0411883307, "date": "2020-01-09"},
-    {"Station_Number": "2260500", "norm": 0.0479364687, "date": "2020-01-10"},
-    {"Station_Number": "2260500", "norm": 0.055178373, "date": "2020-01-11"},
-    {"Station_Number": "2260500", "norm": 0.0570711435, "date": "2020-01-12"},
-    {"Station_Number": "2260500", "norm": 0.0523392174, "date": "2020-01-13"},
-    {"Station_Number": "2260500", "norm": 0.0467432004, "date": "2020-01-14"},
-    {"Station_Number": "2260500", "norm": 0.0431222483, "date": "2020-01-15"},
-    {"Station_Number": "2260500", "norm": 0.0444389582, "date": "2020-01-16"},
-    {"Station_Number": "2260500", "norm": 0.0422581574, "date": "2020-01-17"},
-    {"Station_Number": "2260500", "norm": 0.0415998025, "date": "2020-01-18"},
-    {"Station_Number": "2260500", "norm": 0.037443937, "date": "2020-01-19"},
-    {"Station_Number": "2260500", "norm": 0.03184792, "date": "2020-01-20"},
-    {"Station_Number": "2260500", "norm": 0.0332880714, "date": "2020-01-21"},
-    {"Station_Number": "2260500", "norm": 0.0330411883, "date": "2020-01-22"},
-    {"Station_Number": "2260500", "norm": 0.0326708637, "date": "2020-01-23"},
-    {"Station_Number": "2260500", "norm": 0.0303254742, "date": "2020-01-24"},
-    {"Station_Number": "2260500", "norm": 0.0297905608, "date": "2020-01-25"},
-    {"Station_Number": "2260500", "norm": 0.0280623791, "date": "2020-01-26"},
-    {"Station_Number": "2260500", "norm": 0.0275686129, "date": "2020-01-27"},
-    {"Station_Number": "2260500", "norm": 0.0319302144, "date": "2020-01-28"},
-    {"Station_Number": "2260500", "norm": 0.0337406904, "date": "2020-01-29"},
-    {"Station_Number": "2260500", "norm": 0.034316751, "date": "2020-01-30"},
-    {"Station_Number": "2260500", "norm": 0.0337406904, "date": "2020-01-31"},
-    {"Station_Number": "2260500", "norm": 0.0338229848, "date": "2020-02-01"},
-    {"Station_Number": "2260500", "norm": 0.032958894, "date": "2020-02-02"},
-    {"Station_Number": "2260500", "norm": 0.0296671193, "date": "2020-02-03"},
-    {"Station_Number": "2260500", "norm": 0.0315598897, "date": "2020-02-04"},
-    {"Station_Number": "2260500", "norm": 0.0320536559, "date": "2020-02-05"},
-    {"Station_Number": "2260500", "norm": 0.0309015348, "date": "2020-02-06"},
-    {"Station_Number": "2260500", "norm": 0.0296671193, "date": "2020-02-07"},
-    {"Station_Number": "2260500", "norm": 0.0288030284, "date": "2020-02-08"},
-    {"Station_Number": "2260500", "norm": 0.0290087644, "date": "2020-02-09"},
-    {"Station_Number": "2260500", "norm": 0.0274863186, "date": "2020-02-10"},
-    {"Station_Number": "2260500", "norm": 0.0280623791, "date": "2020-02-11"},
-    {"Station_Number": "2260500", "norm": 0.027815496, "date": "2020-02-12"},
-    {"Station_Number": "2260500", "norm": 0.0271571411, "date": "2020-02-13"},
-    {"Station_Number": "2260500", "norm": 0.0274863186, "date": "2020-02-14"},
-    {"Station_Number": "2260500", "norm": 0.0267456693, "date": "2020-02-15"},
-    {"Station_Number": "2260500", "norm": 0.0264164918, "date": "2020-02-16"},
-    {"Station_Number": "2260500", "norm": 0.0255524009, "date": "2020-02-17"},
-    {"Station_Number": "2260500", "norm": 0.0257169897, "date": "2020-02-18"},
-    {"Station_Number": "2260500", "norm": 0.0253055178, "date": "2020-02-19"},
-    {"Station_Number": "2260500", "norm": 0.0254701066, "date": "2020-02-20"},
-    {"Station_Number": "2260500", "norm": 0.02600502, "date": "2020-02-21"},
-    {"Station_Number": "2260500", "norm": 0.0268279636, "date": "2020-02-22"},
-    {"Station_Number": "2260500", "norm": 0.0275686129, "date": "2020-02-23"},
-    {"Station_Number": "2260500", "norm": 0.0262107559, "date": "2020-02-24"},
-    {"Station_Number": "2260500", "norm": 0.0271571411, "date": "2020-02-25"},
-    {"Station_Number": "2260500", "norm": 0.028473851, "date": "2020-02-26"},
-    {"Station_Number": "2260500", "norm": 0.0283915566, "date": "2020-02-27"},
-    {"Station_Number": "2260500", "norm": 0.0270748467, "date": "2020-02-28"},
-    {"Station_Number": "2260500", "norm": 0.026457639, "date": "2020-02-29"},
-    {"Station_Number": "2260500", "norm": 0.0257169897, "date": "2020-03-01"},
-    {"Station_Number": "2260500", "norm": 0.0237007777, "date": "2020-03-02"},
-    {"Station_Number": "2260500", "norm": 0.0234538946, "date": "2020-03-03"},
-    {"Station_Number": "2260500", "norm": 0.0260461671, "date": "2020-03-04"},
-    {"Station_Number": "2260500", "norm": 0.0309838292, "date": "2020-03-05"},
-    {"Station_Number": "2260500", "norm": 0.0332469242, "date": "2020-03-06"},
-    {"Station_Number": "2260500", "norm": 0.0315598897, "date": "2020-03-07"},
-    {"Station_Number": "2260500", "norm": 0.0286384397, "date": "2020-03-08"},
-    {"Station_Number": "2260500", "norm": 0.0263753446, "date": "2020-03-09"},
-    {"Station_Number": "2260500", "norm": 0.0277332017, "date": "2020-03-10"},
-    {"Station_Number": "2260500", "norm": 0.0320536559, "date": "2020-03-11"},
-    {"Station_Number": "2260500", "norm": 0.0314364482, "date": "2020-03-12"},
-    {"Station_Number": "2260500", "norm": 0.0307780932, "date": "2020-03-13"},
-    {"Station_Number": "2260500", "norm": 0.0296671193, "date": "2020-03-14"},
-    {"Station_Number": "2260500", "norm": 0.0304489158, "date": "2020-03-15"},
-    {"Station_Number": "2260500", "norm": 0.0297905608, "date": "2020-03-16"},
-    {"Station_Number": "2260500", "norm": 0.0326297165, "date": "2020-03-17"},
-    {"Station_Number": "2260500", "norm": 0.03184792, "date": "2020-03-18"},
-    {"Station_Number": "2260500", "norm": 0.0309015348, "date": "2020-03-19"},
-    {"Station_Number": "2260500", "norm": 0.0299962968, "date": "2020-03-20"},
-    {"Station_Number": "2260500", "norm": 0.0299140024, "date": "2020-03-21"},
-    {"Station_Number": "2260500", "norm": 0.0301197383, "date": "2020-03-22"},
-    {"Station_Number": "2260500", "norm": 0.0297905608, "date": "2020-03-23"},
-    {"Station_Number": "2260500", "norm": 0.0328354524, "date": "2020-03-24"},
-    {"Station_Number": "2260500", "norm": 0.0322593918, "date": "2020-03-25"},
-    {"Station_Number": "2260500", "norm": 0.0303254742, "date": "2020-03-26"},
-    {"Station_Number": "2260500", "norm": 0.0280623791, "date": "2020-03-27"},
-    {"Station_Number": "2260500", "norm": 0.025799284, "date": "2020-03-28"},
-    {"Station_Number": "2260500", "norm": 0.025799284, "date": "2020-03-29"},
-    {"Station_Number": "2260500", "norm": 0.0259638728, "date": "2020-03-30"},
-    {"Station_Number": "2260500", "norm": 0.028268115, "date": "2020-03-31"},
-    {"Station_Number": "2260500", "norm": 0.0280623791, "date": "2020-04-01"},
-    {"Station_Number": "2260500", "norm": 0.0279800848, "date": "2020-04-02"},
-    {"Station_Number": "2260500", "norm": 0.0274040242, "date": "2020-04-03"},
-    {"Station_Number": "2260500", "norm": 0.0320536559, "date": "2020-04-04"},
-    {"Station_Number": "2260500", "norm": 0.0411883307, "date": "2020-04-05"},
-    {"Station_Number": "2260500", "norm": 0.0420112743, "date": "2020-04-06"},
-    {"Station_Number": "2260500", "norm": 0.037238201, "date": "2020-04-07"},
-    {"Station_Number": "2260500", "norm": 0.0319713616, "date": "2020-04-08"},
-    {"Station_Number": "2260500", "norm": 0.0294613834, "date": "2020-04-09"},
-    {"Station_Number": "2260500", "norm": 0.0282269679, "date": "2020-04-10"},
-    {"Station_Number": "2260500", "norm": 0.0274863186, "date": "2020-04-11"},
-    {"Station_Number": "2260500", "norm": 0.025346665, "date": "2020-04-12"},
-    {"Station_Number": "2260500", "norm": 0.0246883101, "date": "2020-04-13"},
-    {"Station_Number": "2260500", "norm": 0.0237007777, "date": "2020-04-14"},
-    {"Station_Number": "2260500", "norm": 0.0234538946, "date": "2020-04-15"},
-    {"Station_Number": "2260500", "norm": 0.023783072, "date": "2020-04-16"},
-    {"Station_Number": "2260500", "norm": 0.0250174876, "date": "2020-04-17"},
-    {"Station_Number": "2260500", "norm": 0.0254701066, "date": "2020-04-18"},
-    {"Station_Number": "2260500", "norm": 0.025346665, "date": "2020-04-19"},
-    {"Station_Number": "2260500", "norm": 0.0256758425, "date": "2020-04-20"},
-    {"Station_Number": "2260500", "norm": 0.0273217298, "date": "2020-04-21"},
-    {"Station_Number": "2260500", "norm": 0.0281446735, "date": "2020-04-22"},
-    {"Station_Number": "2260500", "norm": 0.0321770975, "date": "2020-04-23"},
-    {"Station_Number": "2260500", "norm": 0.0422581574, "date": "2020-04-24"},
-    {"Station_Number": "2260500", "norm": 0.0472781138, "date": "2020-04-25"},
-    {"Station_Number": "2260500", "norm": 0.0524626589, "date": "2020-04-26"},
-    {"Station_Number": "2260500", "norm": 0.055178373, "date": "2020-04-27"},
-    {"Station_Number": "2260500", "norm": 0.0620499527, "date": "2020-04-28"},
-    {"Station_Number": "2260500", "norm": 0.0683043246, "date": "2020-04-29"},
-    {"Station_Number": "2260500", "norm": 0.0640250175, "date": "2020-04-30"},
-    {"Station_Number": "2260500", "norm": 0.0660000823, "date": "2020-05-01"},
-    {"Station_Number": "2260500", "norm": 0.0664938485, "date": "2020-05-02"},
-    {"Station_Number": "2260500", "norm": 0.0597457104, "date": "2020-05-03"},
-    {"Station_Number": "2260500", "norm": 0.0553018146, "date": "2020-05-04"},
-    {"Station_Number": "2260500", "norm": 0.06369584, "date": "2020-05-05"},
-    {"Station_Number": "2260500", "norm": 0.0737357528, "date": "2020-05-06"},
-    {"Station_Number": "2260500", "norm": 0.0699502119, "date": "2020-05-07"},
-    {"Station_Number": "2260500", "norm": 0.0651771386, "date": "2020-05-08"},
-    {"Station_Number": "2260500", "norm": 0.0604040653, "date": "2020-05-09"},
-    {"Station_Number": "2260500", "norm": 0.0577706456, "date": "2020-05-10"},
-    {"Station_Number": "2260500", "norm": 0.0549726371, "date": "2020-05-11"},
-    {"Station_Number": "2260500", "norm": 0.0564950829, "date": "2020-05-12"},
-    {"Station_Number": "2260500", "norm": 0.0585935893, "date": "2020-05-13"},
-    {"Station_Number": "2260500", "norm": 0.0615561865, "date": "2020-05-14"},
-    {"Station_Number": "2260500", "norm": 0.0587993252, "date": "2020-05-15"},
-    {"Station_Number": "2260500", "norm": 0.0554252561, "date": "2020-05-16"},
-    {"Station_Number": "2260500", "norm": 0.0511459491, "date": "2020-05-17"},
-    {"Station_Number": "2260500", "norm": 0.0485125293, "date": "2020-05-18"},
-    {"Station_Number": "2260500", "norm": 0.0547669012, "date": "2020-05-19"},
-    {"Station_Number": "2260500", "norm": 0.0622145414, "date": "2020-05-20"},
-    {"Station_Number": "2260500", "norm": 0.064354195, "date": "2020-05-21"},
-    {"Station_Number": "2260500", "norm": 0.0604040653, "date": "2020-05-22"},
-    {"Station_Number": "2260500", "norm": 0.066823026, "date": "2020-05-23"},
-    {"Station_Number": "2260500", "norm": 0.066823026, "date": "2020-05-24"},
-    {"Station_Number": "2260500", "norm": 0.0589227667, "date": "2020-05-25"},
-    {"Station_Number": "2260500", "norm": 0.0655063161, "date": "2020-05-26"},
-    {"Station_Number": "2260500", "norm": 0.0866148212, "date": "2020-05-27"},
-    {"Station_Number": "2260500", "norm": 0.1257046455, "date": "2020-05-28"},
-    {"Station_Number": "2260500", "norm": 0.1782084516, "date": "2020-05-29"},
-    {"Station_Number": "2260500", "norm": 0.2478706333, "date": "2020-05-30"},
-    {"Station_Number": "2260500", "norm": 0.3023906514, "date": "2020-05-31"},
-    {"Station_Number": "2260500", "norm": 0.3311525326, "date": "2020-06-01"},
-    {"Station_Number": "2260500", "norm": 0.3485989384, "date": "2020-06-02"},
-    {"Station_Number": "2260500", "norm": 0.3351026622, "date": "2020-06-03"},
-    {"Station_Number": "2260500", "norm": 0.2893881414, "date": "2020-06-04"},
-    {"Station_Number": "2260500", "norm": 0.2385713698, "date": "2020-06-05"},
-    {"Station_Number": "2260500", "norm": 0.1921573468, "date": "2020-06-06"},
-    {"Station_Number": "2260500", "norm": 0.1752870016, "date": "2020-06-07"},
-    {"Station_Number": "2260500", "norm": 0.176727153, "date": "2020-06-08"},
-    {"Station_Number": "2260500", "norm": 0.1859029749, "date": "2020-06-09"},
-    {"Station_Number": "2260500", "norm": 0.1915401391, "date": "2020-06-10"},
-    {"Station_Number": "2260500", "norm": 0.206764597, "date": "2020-06-11"},
-    {"Station_Number": "2260500", "norm": 0.2090688392, "date": "2020-06-12"},
-    {"Station_Number": "2260500", "norm": 0.2069703329, "date": "2020-06-13"},
-    {"Station_Number": "2260500", "norm": 0.1903057236, "date": "2020-06-14"},
-    {"Station_Number": "2260500", "norm": 0.1729827593, "date": "2020-06-15"},
-    {"Station_Number": "2260500", "norm": 0.1892358968, "date": "2020-06-16"},
-    {"Station_Number": "2260500", "norm": 0.220672345, "date": "2020-06-17"},
-    {"Station_Number": "2260500", "norm": 0.2421511748, "date": "2020-06-18"},
-    {"Station_Number": "2260500", "norm": 0.2476237502, "date": "2020-06-19"},
-    {"Station_Number": "2260500", "norm": 0.2624367362, "date": "2020-06-20"},
-    {"Station_Number": "2260500", "norm": 0.2907871456, "date": "2020-06-21"},
-    {"Station_Number": "2260500", "norm": 0.3146936592, "date": "2020-06-22"},
-    {"Station_Number": "2260500", "norm": 0.3521375962, "date": "2020-06-23"},
-    {"Station_Number": "2260500", "norm": 0.3755503436, "date": "2020-06-24"},
-    {"Station_Number": "2260500", "norm": 0.3926675719, "date": "2020-06-25"},
-    {"Station_Number": "2260500", "norm": 0.4070690861, "date": "2020-06-26"},
-    {"Station_Number": "2260500", "norm": 0.4254618771, "date": "2020-06-27"},
-    {"Station_Number": "2260500", "norm": 0.4391638892, "date": "2020-06-28"},
-    {"Station_Number": "2260500", "norm": 0.4657861169, "date": "2020-06-29"},
-    {"Station_Number": "2260500", "norm": 0.4847138213, "date": "2020-06-30"},
-    {"Station_Number": "2260500", "norm": 0.4941776735, "date": "2020-07-01"},
-    {"Station_Number": "2260500", "norm": 0.5056988849, "date": "2020-07-02"},
-    {"Station_Number": "2260500", "norm": 0.5172200963, "date": "2020-07-03"},
-    {"Station_Number": "2260500", "norm": 0.5266839485, "date": "2020-07-04"},
-    {"Station_Number": "2260500", "norm": 0.530387195, "date": "2020-07-05"},
-    {"Station_Number": "2260500", "norm": 0.5365592725, "date": "2020-07-06"},
-    {"Station_Number": "2260500", "norm": 0.5480804839, "date": "2020-07-07"},
-    {"Station_Number": "2260500", "norm": 0.5461465663, "date": "2020-07-08"},
-    {"Station_Number": "2260500", "norm": 0.5409620211, "date": "2020-07-09"},
-    {"Station_Number": "2260500", "norm": 0.5365592725, "date": "2020-07-10"},
-    {"Station_Number": "2260500", "norm": 0.5343784718, "date": "2020-07-11"},
-    {"Station_Number": "2260500", "norm": 0.5390281035, "date": "2020-07-12"},
-    {"Station_Number": "2260500", "norm": 0.5464345966, "date": "2020-07-13"},
-    {"Station_Number": "2260500", "norm": 0.5697650496, "date": "2020-07-14"},
-    {"Station_Number": "2260500", "norm": 0.6095132288, "date": "2020-07-15"},
-    {"Station_Number": "2260500", "norm": 0.6679422294, "date": "2020-07-16"},
-    {"Station_Number": "2260500", "norm": 0.7340657532, "date": "2020-07-17"},
-    {"Station_Number": "2260500", "norm": 0.8016705756, "date": "2020-07-18"},
-    {"Station_Number": "2260500", "norm": 0.8586182776, "date": "2020-07-19"},
-    {"Station_Number": "2260500", "norm": 0.8806731679, "date": "2020-07-20"},
-    {"Station_Number": "2260500", "norm": 0.8894786652, "date": "2020-07-21"},
-    {"Station_Number": "2260500", "norm": 0.8990659589, "date": "2020-07-22"},
-    {"Station_Number": "2260500", "norm": 0.9063490104, "date": "2020-07-23"},
-    {"Station_Number": "2260500", "norm": 0.9222318232, "date": "2020-07-24"},
-    {"Station_Number": "2260500", "norm": 0.9413241164, "date": "2020-07-25"},
-    {"Station_Number": "2260500", "norm": 0.9651894828, "date": "2020-07-26"},
-    {"Station_Number": "2260500", "norm": 0.9850635724, "date": "2020-07-27"},
-    {"Station_Number": "2260500", "norm": 1.0, "date": "2020-07-28"},
-    {"Station_Number": "2260500", "norm": 0.9978191993, "date": "2020-07-29"},
-    {"Station_Number": "2260500", "norm": 0.9891782907, "date": "2020-07-30"},
-    {"Station_Number": "2260500", "norm": 0.9727194174, "date": "2020-07-31"},
-    {"Station_Number": "2260500", "norm": 0.9443278608, "date": "2020-08-01"},
-    {"Station_Number": "2260500", "norm": 0.9026457639, "date": "2020-08-02"},
-    {"Station_Number": "2260500", "norm": 0.8271818294, "date": "2020-08-03"},
-    {"Station_Number": "2260500", "norm": 0.728181706, "date": "2020-08-04"},
-    {"Station_Number": "2260500", "norm": 0.6294284656, "date": "2020-08-05"},
-    {"Station_Number": "2260500", "norm": 0.5307986668, "date": "2020-08-06"},
-    {"Station_Number": "2260500", "norm": 0.4504382175, "date": "2020-08-07"},
-    {"Station_Number": "2260500", "norm": 0.3757149323, "date": "2020-08-08"},
-    {"Station_Number": "2260500", "norm": 0.3179854339, "date": "2020-08-09"},
-    {"Station_Number": "2260500", "norm": 0.2929679463, "date": "2020-08-10"},
-    {"Station_Number": "2260500", "norm": 0.2904991153, "date": "2020-08-11"},
-    {"Station_Number": "2260500", "norm": 0.2979056084, "date": "2020-08-12"},
-    {"Station_Number": "2260500", "norm": 0.3301650002, "date": "2020-08-13"},
-    {"Station_Number": "2260500", "norm": 0.3633296301, "date": "2020-08-14"},
-    {"Station_Number": "2260500", "norm": 0.4015142164, "date": "2020-08-15"},
-    {"Station_Number": "2260500", "norm": 0.4624943423, "date": "2020-08-16"},
-    {"Station_Number": "2260500", "norm": 0.4962350327, "date": "2020-08-17"},
-    {"Station_Number": "2260500", "norm": 0.5354482986, "date": "2020-08-18"},
-    {"Station_Number": "2260500", "norm": 0.579064313, "date": "2020-08-19"},
-    {"Station_Number": "2260500", "norm": 0.6288524051, "date": "2020-08-20"},
-    {"Station_Number": "2260500", "norm": 0.6801629428, "date": "2020-08-21"},
-    {"Station_Number": "2260500", "norm": 0.7302390651, "date": "2020-08-22"},
-    {"Station_Number": "2260500", "norm": 0.7919598403, "date": "2020-08-23"},
-    {"Station_Number": "2260500", "norm": 0.8693165453, "date": "2020-08-24"},
-    {"Station_Number": "2260500", "norm": 0.9191046373, "date": "2020-08-25"},
-    {"Station_Number": "2260500", "norm": 0.9336295931, "date": "2020-08-26"},
-    {"Station_Number": "2260500", "norm": 0.9234662387, "date": "2020-08-27"},
-    {"Station_Number": "2260500", "norm": 0.8860223018, "date": "2020-08-28"},
-    {"Station_Number": "2260500", "norm": 0.8262354442, "date": "2020-08-29"},
-    {"Station_Number": "2260500", "norm": 0.7652141711, "date": "2020-08-30"},
-    {"Station_Number": "2260500", "norm": 0.7170719664, "date": "2020-08-31"},
-    {"Station_Number": "2260500", "norm": 0.6600008229, "date": "2020-09-01"},
-    {"Station_Number": "2260500", "norm": 0.5919845287, "date": "2020-09-02"},
-    {"Station_Number": "2260500", "norm": 0.5583672798, "date": "2020-09-03"},
-    {"Station_Number": "2260500", "norm": 0.5442537958, "date": "2020-09-04"},
-    {"Station_Number": "2260500", "norm": 0.5398510472, "date": "2020-09-05"},
-    {"Station_Number": "2260500", "norm": 0.5350368267, "date": "2020-09-06"},
-    {"Station_Number": "2260500", "norm": 0.51804304, "date": "2020-09-07"},
-    {"Station_Number": "2260500", "norm": 0.4858247953, "date": "2020-09-08"},
-    {"Station_Number": "2260500", "norm": 0.4459120273, "date": "2020-09-09"},
-    {"Station_Number": "2260500", "norm": 0.4158745834, "date": "2020-09-10"},
-    {"Station_Number": "2260500", "norm": 0.4091264453, "date": "2020-09-11"},
-    {"Station_Number": "2260500", "norm": 0.4192897996, "date": "2020-09-12"},
-    {"Station_Number": "2260500", "norm": 0.4316339547, "date": "2020-09-13"},
-    {"Station_Number": "2260500", "norm": 0.4420441921, "date": "2020-09-14"},
-    {"Station_Number": "2260500", "norm": 0.4571452084, "date": "2020-09-15"},
-    {"Station_Number": "2260500", "norm": 0.4743035839, "date": "2020-09-16"},
-    {"Station_Number": "2260500", "norm": 0.4962350327, "date": "2020-09-17"},
-    {"Station_Number": "2260500", "norm": 0.5225692301, "date": "2020-09-18"},
-    {"Station_Number": "2260500", "norm": 0.5607126692, "date": "2020-09-19"},
-    {"Station_Number": "2260500", "norm": 0.5893511089, "date": "2020-09-20"},
-    {"Station_Number": "2260500", "norm": 0.6222688557, "date": "2020-09-21"},
-    {"Station_Number": "2260500", "norm": 0.6476566679, "date": "2020-09-22"},
-    {"Station_Number": "2260500", "norm": 0.666296342, "date": "2020-09-23"},
-    {"Station_Number": "2260500", "norm": 0.6650619265, "date": "2020-09-24"},
-    {"Station_Number": "2260500", "norm": 0.6405382052, "date": "2020-09-25"},
-    {"Station_Number": "2260500", "norm": 0.601036909, "date": "2020-09-26"},
-    {"Station_Number": "2260500", "norm": 0.5767600708, "date": "2020-09-27"},
-    {"Station_Number": "2260500", "norm": 0.5841665638, "date": "2020-09-28"},
-    {"Station_Number": "2260500", "norm": 0.6158498951, "date": "2020-09-29"},
-    {"Station_Number": "2260500", "norm": 0.6756367527, "date": "2020-09-30"},
-    {"Station_Number": "2260500", "norm": 0.7517590421, "date": "2020-10-01"},
-    {"Station_Number": "2260500", "norm": 0.8473439493, "date": "2020-10-02"},
-    {"Station_Number": "2260500", "norm": 0.9247006542, "date": "2020-10-03"},
-    {"Station_Number": "2260500", "norm": 0.9644899807, "date": "2020-10-04"},
-    {"Station_Number": "2260500", "norm": 0.9751882484, "date": "2020-10-05"},
-    {"Station_Number": "2260500", "norm": 0.9607867341, "date": "2020-10-06"},
-    {"Station_Number": "2260500", "norm": 0.9304612599, "date": "2020-10-07"},
-    {"Station_Number": "2260500", "norm": 0.870139489, "date": "2020-10-08"},
-    {"Station_Number": "2260500", "norm": 0.7886680657, "date": "2020-10-09"},
-    {"Station_Number": "2260500", "norm": 0.7170719664, "date": "2020-10-10"},
-    {"Station_Number": "2260500", "norm": 0.6664609307, "date": "2020-10-11"},
-    {"Station_Number": "2260500", "norm": 0.6126815619, "date": "2020-10-12"},
-    {"Station_Number": "2260500", "norm": 0.5694770193, "date": "2020-10-13"},
-    {"Station_Number": "2260500", "norm": 0.5335555281, "date": "2020-10-14"},
-    {"Station_Number": "2260500", "norm": 0.4858247953, "date": "2020-10-15"},
-    {"Station_Number": "2260500", "norm": 0.4250915525, "date": "2020-10-16"},
-    {"Station_Number": "2260500", "norm": 0.3640291322, "date": "2020-10-17"},
-    {"Station_Number": "2260500", "norm": 0.3126774472, "date": "2020-10-18"},
-    {"Station_Number": "2260500", "norm": 0.2781549603, "date": "2020-10-19"},
-    {"Station_Number": "2260500", "norm": 0.2521087932, "date": "2020-10-20"},
-    {"Station_Number": "2260500", "norm": 0.2354030367, "date": "2020-10-21"},
-    {"Station_Number": "2260500", "norm": 0.2308768465, "date": "2020-10-22"},
-    {"Station_Number": "2260500", "norm": 0.2493519319, "date": "2020-10-23"},
-    {"Station_Number": "2260500", "norm": 0.2907871456, "date": "2020-10-24"},
-    {"Station_Number": "2260500", "norm": 0.3380652594, "date": "2020-10-25"},
-    {"Station_Number": "2260500", "norm": 0.3777311443, "date": "2020-10-26"},
-    {"Station_Number": "2260500", "norm": 0.4011850389, "date": "2020-10-27"},
-    {"Station_Number": "2260500", "norm": 0.4279307081, "date": "2020-10-28"},
-    {"Station_Number": "2260500", "norm": 0.4599020697, "date": "2020-10-29"},
-    {"Station_Number": "2260500", "norm": 0.4877175657, "date": "2020-10-30"},
-    {"Station_Number": "2260500", "norm": 0.5056988849, "date": "2020-10-31"},
-    {"Station_Number": "2260500", "norm": 0.5077562441, "date": "2020-11-01"},
-    {"Station_Number": "2260500", "norm": 0.4785417438, "date": "2020-11-02"},
-    {"Station_Number": "2260500", "norm": 0.4175204707, "date": "2020-11-03"},
-    {"Station_Number": "2260500", "norm": 0.352549068, "date": "2020-11-04"},
-    {"Station_Number": "2260500", "norm": 0.3265440481, "date": "2020-11-05"},
-    {"Station_Number": "2260500", "norm": 0.3311525326, "date": "2020-11-06"},
-    {"Station_Number": "2260500", "norm": 0.3466238736, "date": "2020-11-07"},
-    {"Station_Number": "2260500", "norm": 0.3495864708, "date": "2020-11-08"},
-    {"Station_Number": "2260500", "norm": 0.3360901946, "date": "2020-11-09"},
-    {"Station_Number": "2260500", "norm": 0.3140353043, "date": "2020-11-10"},
-    {"Station_Number": "2260500", "norm": 0.2833806526, "date": "2020-11-11"},
-    {"Station_Number": "2260500", "norm": 0.2443731227, "date": "2020-11-12"},
-    {"Station_Number": "2260500", "norm": 0.2156935358, "date": "2020-11-13"},
-    {"Station_Number": "2260500", "norm": 0.2013331687, "date": "2020-11-14"},
-    {"Station_Number": "2260500", "norm": 0.1892358968, "date": "2020-11-15"},
-    {"Station_Number": "2260500", "norm": 0.1765214171, "date": "2020-11-16"},
-    {"Station_Number": "2260500", "norm": 0.1702670452, "date": "2020-11-17"},
-    {"Station_Number": "2260500", "norm": 0.1607620458, "date": "2020-11-18"},
-    {"Station_Number": "2260500", "norm": 0.1539316134, "date": "2020-11-19"},
-    {"Station_Number": "2260500", "norm": 0.1458667654, "date": "2020-11-20"},
-    {"Station_Number": "2260500", "norm": 0.1374315928, "date": "2020-11-21"},
-    {"Station_Number": "2260500", "norm": 0.1337694935, "date": "2020-11-22"},
-    {"Station_Number": "2260500", "norm": 0.1330288442, "date": "2020-11-23"},
-    {"Station_Number": "2260500", "norm": 0.1322470477, "date": "2020-11-24"},
-    {"Station_Number": "2260500", "norm": 0.1280088878, "date": "2020-11-25"},
-    {"Station_Number": "2260500", "norm": 0.1230300786, "date": "2020-11-26"},
-    {"Station_Number": "2260500", "norm": 0.1220836934, "date": "2020-11-27"},
-    {"Station_Number": "2260500", "norm": 0.1172694729, "date": "2020-11-28"},
-    {"Station_Number": "2260500", "norm": 0.1140188454, "date": "2020-11-29"},
-    {"Station_Number": "2260500", "norm": 0.1092046249, "date": "2020-11-30"},
-    {"Station_Number": "2260500", "norm": 0.1066946468, "date": "2020-12-01"},
-    {"Station_Number": "2260500", "norm": 0.1038966383, "date": "2020-12-02"},
-    {"Station_Number": "2260500", "norm": 0.0979302967, "date": "2020-12-03"},
-    {"Station_Number": "2260500", "norm": 0.095996379, "date": "2020-12-04"},
-    {"Station_Number": "2260500", "norm": 0.0945150804, "date": "2020-12-05"},
-    {"Station_Number": "2260500", "norm": 0.0929103403, "date": "2020-12-06"},
-    {"Station_Number": "2260500", "norm": 0.0897420072, "date": "2020-12-07"},
-    {"Station_Number": "2260500", "norm": 0.0876435008, "date": "2020-12-08"},
-    {"Station_Number": "2260500", "norm": 0.0850512282, "date": "2020-12-09"},
-    {"Station_Number": "2260500", "norm": 0.0832407522, "date": "2020-12-10"},
-    {"Station_Number": "2260500", "norm": 0.0815948648, "date": "2020-12-11"},
-    {"Station_Number": "2260500", "norm": 0.0804427437, "date": "2020-12-12"},
-    {"Station_Number": "2260500", "norm": 0.0790848866, "date": "2020-12-13"},
-    {"Station_Number": "2260500", "norm": 0.0765337613, "date": "2020-12-14"},
-    {"Station_Number": "2260500", "norm": 0.0779739127, "date": "2020-12-15"},
-    {"Station_Number": "2260500", "norm": 0.0752170514, "date": "2020-12-16"},
-    {"Station_Number": "2260500", "norm": 0.0735711641, "date": "2020-12-17"},
-    {"Station_Number": "2260500", "norm": 0.0714315105, "date": "2020-12-18"},
-    {"Station_Number": "2260500", "norm": 0.0701148006, "date": "2020-12-19"},
-    {"Station_Number": "2260500", "norm": 0.0689626795, "date": "2020-12-20"},
-    {"Station_Number": "2260500", "norm": 0.0640250175, "date": "2020-12-21"},
-    {"Station_Number": "2260500", "norm": 0.06369584, "date": "2020-12-22"},
-    {"Station_Number": "2260500", "norm": 0.0635312513, "date": "2020-12-23"},
-    {"Station_Number": "2260500", "norm": 0.0618853639, "date": "2020-12-24"},
-    {"Station_Number": "2260500", "norm": 0.0627083076, "date": "2020-12-25"},
-    {"Station_Number": "2260500", "norm": 0.0604040653, "date": "2020-12-26"},
-    {"Station_Number": "2260500", "norm": 0.0620499527, "date": "2020-12-27"},
-    {"Station_Number": "2260500", "norm": 0.0608978315, "date": "2020-12-28"},
-    {"Station_Number": "2260500", "norm": 0.0618853639, "date": "2020-12-29"},
-    {"Station_Number": "2260500", "norm": 0.0577294984, "date": "2020-12-30"},
-    {"Station_Number": "2260500", "norm": 0.0560836111, "date": "2020-12-31"},
-    {"Station_Number": "2260500", "norm": 0.1044616877, "date": "2021-01-01"},
-    {"Station_Number": "2260500", "norm": 0.0997090204, "date": "2021-01-02"},
-    {"Station_Number": "2260500", "norm": 0.0986905917, "date": "2021-01-03"},
-    {"Station_Number": "2260500", "norm": 0.1023763337, "date": "2021-01-04"},
-    {"Station_Number": "2260500", "norm": 0.1082444229, "date": "2021-01-05"},
-    {"Station_Number": "2260500", "norm": 0.10528613, "date": "2021-01-06"},
-    {"Station_Number": "2260500", "norm": 0.0976236663, "date": "2021-01-07"},
-    {"Station_Number": "2260500", "norm": 0.0960232784, "date": "2021-01-08"},
-    {"Station_Number": "2260500", "norm": 0.0951988361, "date": "2021-01-09"},
-    {"Station_Number": "2260500", "norm": 0.0958292919, "date": "2021-01-10"},
-    {"Station_Number": "2260500", "norm": 0.091028128, "date": "2021-01-11"},
-    {"Station_Number": "2260500", "norm": 0.0924345296, "date": "2021-01-12"},
-    {"Station_Number": "2260500", "norm": 0.0903976722, "date": "2021-01-13"},
-    {"Station_Number": "2260500", "norm": 0.0880698351, "date": "2021-01-14"},
-    {"Station_Number": "2260500", "norm": 0.088457808, "date": "2021-01-15"},
-    {"Station_Number": "2260500", "norm": 0.0874878758, "date": "2021-01-16"},
-    {"Station_Number": "2260500", "norm": 0.087099903, "date": "2021-01-17"},
-    {"Station_Number": "2260500", "norm": 0.088457808, "date": "2021-01-18"},
-    {"Station_Number": "2260500", "norm": 0.0865179437, "date": "2021-01-19"},
-    {"Station_Number": "2260500", "norm": 0.0833656644, "date": "2021-01-20"},
-    {"Station_Number": "2260500", "norm": 0.0865179437, "date": "2021-01-21"},
-    {"Station_Number": "2260500", "norm": 0.085499515, "date": "2021-01-22"},
-    {"Station_Number": "2260500", "norm": 0.0843355965, "date": "2021-01-23"},
-    {"Station_Number": "2260500", "norm": 0.079970902, "date": "2021-01-24"},
-    {"Station_Number": "2260500", "norm": 0.076042677, "date": "2021-01-25"},
-    {"Station_Number": "2260500", "norm": 0.0788554801, "date": "2021-01-26"},
-    {"Station_Number": "2260500", "norm": 0.0827837051, "date": "2021-01-27"},
-    {"Station_Number": "2260500", "norm": 0.0853055286, "date": "2021-01-28"},
-    {"Station_Number": "2260500", "norm": 0.0902521823, "date": "2021-01-29"},
-    {"Station_Number": "2260500", "norm": 0.0898157129, "date": "2021-01-30"},
-    {"Station_Number": "2260500", "norm": 0.0835596508, "date": "2021-01-31"},
-    {"Station_Number": "2260500", "norm": 0.0758486906, "date": "2021-02-01"},
-    {"Station_Number": "2260500", "norm": 0.0716294859, "date": "2021-02-02"},
-    {"Station_Number": "2260500", "norm": 0.0704170708, "date": "2021-02-03"},
-    {"Station_Number": "2260500", "norm": 0.0688166828, "date": "2021-02-04"},
-    {"Station_Number": "2260500", "norm": 0.0678952473, "date": "2021-02-05"},
-    {"Station_Number": "2260500", "norm": 0.0686226964, "date": "2021-02-06"},
-    {"Station_Number": "2260500", "norm": 0.0702230844, "date": "2021-02-07"},
-    {"Station_Number": "2260500", "norm": 0.06842871, "date": "2021-02-08"},
-    {"Station_Number": "2260500", "norm": 0.0656159069, "date": "2021-02-09"},
-    {"Station_Number": "2260500", "norm": 0.062657614, "date": "2021-02-10"},
-    {"Station_Number": "2260500", "norm": 0.0625121242, "date": "2021-02-11"},
-    {"Station_Number": "2260500", "norm": 0.0616391853, "date": "2021-02-12"},
-    {"Station_Number": "2260500", "norm": 0.0609602328, "date": "2021-02-13"},
-    {"Station_Number": "2260500", "norm": 0.0606207565, "date": "2021-02-14"},
-    {"Station_Number": "2260500", "norm": 0.0594083414, "date": "2021-02-15"},
-    {"Station_Number": "2260500", "norm": 0.0592628516, "date": "2021-02-16"},
-    {"Station_Number": "2260500", "norm": 0.0600872939, "date": "2021-02-17"},
-    {"Station_Number": "2260500", "norm": 0.0594083414, "date": "2021-02-18"},
-    {"Station_Number": "2260500", "norm": 0.0577594568, "date": "2021-02-19"},
-    {"Station_Number": "2260500", "norm": 0.0574199806, "date": "2021-02-20"},
-    {"Station_Number": "2260500", "norm": 0.0584384093, "date": "2021-02-21"},
-    {"Station_Number": "2260500", "norm": 0.0572259942, "date": "2021-02-22"},
-    {"Station_Number": "2260500", "norm": 0.055528613, "date": "2021-02-23"},
-    {"Station_Number": "2260500", "norm": 0.0582929195, "date": "2021-02-24"},
-    {"Station_Number": "2260500", "norm": 0.0609602328, "date": "2021-02-25"},
-    {"Station_Number": "2260500", "norm": 0.0609602328, "date": "2021-02-26"},
-    {"Station_Number": "2260500", "norm": 0.0584384093, "date": "2021-02-27"},
-    {"Station_Number": "2260500", "norm": 0.061299709, "date": "2021-02-28"},
-    {"Station_Number": "2260500", "norm": 0.0572259942, "date": "2021-03-01"},
-    {"Station_Number": "2260500", "norm": 0.0558195926, "date": "2021-03-02"},
-    {"Station_Number": "2260500", "norm": 0.053928225, "date": "2021-03-03"},
-    {"Station_Number": "2260500", "norm": 0.0538312318, "date": "2021-03-04"},
-    {"Station_Number": "2260500", "norm": 0.053443259, "date": "2021-03-05"},
-    {"Station_Number": "2260500", "norm": 0.0546071775, "date": "2021-03-06"},
-    {"Station_Number": "2260500", "norm": 0.0549466537, "date": "2021-03-07"},
-    {"Station_Number": "2260500", "norm": 0.0552376334, "date": "2021-03-08"},
-    {"Station_Number": "2260500", "norm": 0.0568865179, "date": "2021-03-09"},
-    {"Station_Number": "2260500", "norm": 0.0590688652, "date": "2021-03-10"},
-    {"Station_Number": "2260500", "norm": 0.0597478177, "date": "2021-03-11"},
-    {"Station_Number": "2260500", "norm": 0.0621241513, "date": "2021-03-12"},
-    {"Station_Number": "2260500", "norm": 0.0649369544, "date": "2021-03-13"},
-    {"Station_Number": "2260500", "norm": 0.0675557711, "date": "2021-03-14"},
-    {"Station_Number": "2260500", "norm": 0.0666828322, "date": "2021-03-15"},
-    {"Station_Number": "2260500", "norm": 0.0616391853, "date": "2021-03-16"},
-    {"Station_Number": "2260500", "norm": 0.0591173618, "date": "2021-03-17"},
-    {"Station_Number": "2260500", "norm": 0.0570805044, "date": "2021-03-18"},
-    {"Station_Number": "2260500", "norm": 0.0554316198, "date": "2021-03-19"},
-    {"Station_Number": "2260500", "norm": 0.0549466537, "date": "2021-03-20"},
-    {"Station_Number": "2260500", "norm": 0.0544131911, "date": "2021-03-21"},
-    {"Station_Number": "2260500", "norm": 0.0550436469, "date": "2021-03-22"},
-    {"Station_Number": "2260500", "norm": 0.0542192047, "date": "2021-03-23"},
-    {"Station_Number": "2260500", "norm": 0.0533462658, "date": "2021-03-24"},
-    {"Station_Number": "2260500", "norm": 0.0515518914, "date": "2021-03-25"},
-    {"Station_Number": "2260500", "norm": 0.0530552861, "date": "2021-03-26"},
-    {"Station_Number": "2260500", "norm": 0.0526188167, "date": "2021-03-27"},
-    {"Station_Number": "2260500", "norm": 0.050242483, "date": "2021-03-28"},
-    {"Station_Number": "2260500", "norm": 0.0494665373, "date": "2021-03-29"},
-    {"Station_Number": "2260500", "norm": 0.0485935984, "date": "2021-03-30"},
-    {"Station_Number": "2260500", "norm": 0.0494665373, "date": "2021-03-31"},
-    {"Station_Number": "2260500", "norm": 0.0535402522, "date": "2021-04-01"},
-    {"Station_Number": "2260500", "norm": 0.0538312318, "date": "2021-04-02"},
-    {"Station_Number": "2260500", "norm": 0.0524733269, "date": "2021-04-03"},
-    {"Station_Number": "2260500", "norm": 0.0522793404, "date": "2021-04-04"},
-    {"Station_Number": "2260500", "norm": 0.0487390883, "date": "2021-04-05"},
-    {"Station_Number": "2260500", "norm": 0.0455868089, "date": "2021-04-06"},
-    {"Station_Number": "2260500", "norm": 0.0493695441, "date": "2021-04-07"},
-    {"Station_Number": "2260500", "norm": 0.0612512124, "date": "2021-04-08"},
-    {"Station_Number": "2260500", "norm": 0.074199806, "date": "2021-04-09"},
-    {"Station_Number": "2260500", "norm": 0.076042677, "date": "2021-04-10"},
-    {"Station_Number": "2260500", "norm": 0.0710960233, "date": "2021-04-11"},
-    {"Station_Number": "2260500", "norm": 0.0623181377, "date": "2021-04-12"},
-    {"Station_Number": "2260500", "norm": 0.0561590689, "date": "2021-04-13"},
-    {"Station_Number": "2260500", "norm": 0.0562560621, "date": "2021-04-14"},
-    {"Station_Number": "2260500", "norm": 0.0567895247, "date": "2021-04-15"},
-    {"Station_Number": "2260500", "norm": 0.0521338506, "date": "2021-04-16"},
-    {"Station_Number": "2260500", "norm": 0.0501454898, "date": "2021-04-17"},
-    {"Station_Number": "2260500", "norm": 0.0484481086, "date": "2021-04-18"},
-    {"Station_Number": "2260500", "norm": 0.048157129, "date": "2021-04-19"},
-    {"Station_Number": "2260500", "norm": 0.0510669253, "date": "2021-04-20"},
-    {"Station_Number": "2260500", "norm": 0.0577109602, "date": "2021-04-21"},
-    {"Station_Number": "2260500", "norm": 0.0623181377, "date": "2021-04-22"},
-    {"Station_Number": "2260500", "norm": 0.070756547, "date": "2021-04-23"},
-    {"Station_Number": "2260500", "norm": 0.072356935, "date": "2021-04-24"},
-    {"Station_Number": "2260500", "norm": 0.070756547, "date": "2021-04-25"},
-    {"Station_Number": "2260500", "norm": 0.0694956353, "date": "2021-04-26"},
-    {"Station_Number": "2260500", "norm": 0.0736178468, "date": "2021-04-27"},
-    {"Station_Number": "2260500", "norm": 0.0652764306, "date": "2021-04-28"},
-    {"Station_Number": "2260500", "norm": 0.0604267701, "date": "2021-04-29"},
-    {"Station_Number": "2260500", "norm": 0.0598448109, "date": "2021-04-30"},
-    {"Station_Number": "2260500", "norm": 0.0527643065, "date": "2021-05-01"},
-    {"Station_Number": "2260500", "norm": 0.0545101843, "date": "2021-05-02"},
-    {"Station_Number": "2260500", "norm": 0.0527643065, "date": "2021-05-03"},
-    {"Station_Number": "2260500", "norm": 0.0558680892, "date": "2021-05-04"},
-    {"Station_Number": "2260500", "norm": 0.0589233754, "date": "2021-05-05"},
-    {"Station_Number": "2260500", "norm": 0.0628516004, "date": "2021-05-06"},
-    {"Station_Number": "2260500", "norm": 0.0565955383, "date": "2021-05-07"},
-    {"Station_Number": "2260500", "norm": 0.0574684772, "date": "2021-05-08"},
-    {"Station_Number": "2260500", "norm": 0.0617846751, "date": "2021-05-09"},
-    {"Station_Number": "2260500", "norm": 0.0566440349, "date": "2021-05-10"},
-    {"Station_Number": "2260500", "norm": 0.0619786615, "date": "2021-05-11"},
-    {"Station_Number": "2260500", "norm": 0.0694956353, "date": "2021-05-12"},
-    {"Station_Number": "2260500", "norm": 0.0780795344, "date": "2021-05-13"},
-    {"Station_Number": "2260500", "norm": 0.0845295829, "date": "2021-05-14"},
-    {"Station_Number": "2260500", "norm": 0.0880698351, "date": "2021-05-15"},
-    {"Station_Number": "2260500", "norm": 0.0916100873, "date": "2021-05-16"},
-    {"Station_Number": "2260500", "norm": 0.0916100873, "date": "2021-05-17"},
-    {"Station_Number": "2260500", "norm": 0.0932104753, "date": "2021-05-18"},
-    {"Station_Number": "2260500", "norm": 0.0867119302, "date": "2021-05-19"},
-    {"Station_Number": "2260500", "norm": 0.092628516, "date": "2021-05-20"},
-    {"Station_Number": "2260500", "norm": 0.1153734239, "date": "2021-05-21"},
-    {"Station_Number": "2260500", "norm": 0.1197381183, "date": "2021-05-22"},
-    {"Station_Number": "2260500", "norm": 0.11842871, "date": "2021-05-23"},
-    {"Station_Number": "2260500", "norm": 0.1208050436, "date": "2021-05-24"},
-    {"Station_Number": "2260500", "norm": 0.2193501455, "date": "2021-05-25"},
-    {"Station_Number": "2260500", "norm": 0.2763336566, "date": "2021-05-26"},
-    {"Station_Number": "2260500", "norm": 0.2864694471, "date": "2021-05-27"},
-    {"Station_Number": "2260500", "norm": 0.2629970902, "date": "2021-05-28"},
-    {"Station_Number": "2260500", "norm": 0.2272065955, "date": "2021-05-29"},
-    {"Station_Number": "2260500", "norm": 0.1812318138, "date": "2021-05-30"},
-    {"Station_Number": "2260500", "norm": 0.1727934045, "date": "2021-05-31"},
-    {"Station_Number": "2260500", "norm": 0.170756547, "date": "2021-06-01"},
-    {"Station_Number": "2260500", "norm": 0.1823472357, "date": "2021-06-02"},
-    {"Station_Number": "2260500", "norm": 0.1841416101, "date": "2021-06-03"},
-    {"Station_Number": "2260500", "norm": 0.1825897187, "date": "2021-06-04"},
-    {"Station_Number": "2260500", "norm": 0.1919980601, "date": "2021-06-05"},
-    {"Station_Number": "2260500", "norm": 0.1960232784, "date": "2021-06-06"},
-    {"Station_Number": "2260500", "norm": 0.2112512124, "date": "2021-06-07"},
-    {"Station_Number": "2260500", "norm": 0.2319592629, "date": "2021-06-08"},
-    {"Station_Number": "2260500", "norm": 0.2357419981, "date": "2021-06-09"},
-    {"Station_Number": "2260500", "norm": 0.2212415131, "date": "2021-06-10"},
-    {"Station_Number": "2260500", "norm": 0.1918040737, "date": "2021-06-11"},
-    {"Station_Number": "2260500", "norm": 0.1684772066, "date": "2021-06-12"},
-    {"Station_Number": "2260500", "norm": 0.1580504365, "date": "2021-06-13"},
-    {"Station_Number": "2260500", "norm": 0.1614936954, "date": "2021-06-14"},
-    {"Station_Number": "2260500", "norm": 0.1692531523, "date": "2021-06-15"},
-    {"Station_Number": "2260500", "norm": 0.1760911736, "date": "2021-06-16"},
-    {"Station_Number": "2260500", "norm": 0.1912221145, "date": "2021-06-17"},
-    {"Station_Number": "2260500", "norm": 0.2013579049, "date": "2021-06-18"},
-    {"Station_Number": "2260500", "norm": 0.2137245393, "date": "2021-06-19"},
-    {"Station_Number": "2260500", "norm": 0.2532492726, "date": "2021-06-20"},
-    {"Station_Number": "2260500", "norm": 0.3104752667, "date": "2021-06-21"},
-    {"Station_Number": "2260500", "norm": 0.3631910766, "date": "2021-06-22"},
-    {"Station_Number": "2260500", "norm": 0.3911251212, "date": "2021-06-23"},
-    {"Station_Number": "2260500", "norm": 0.4087293889, "date": "2021-06-24"},
-    {"Station_Number": "2260500", "norm": 0.4115906887, "date": "2021-06-25"},
-    {"Station_Number": "2260500", "norm": 0.4097963143, "date": "2021-06-26"},
-    {"Station_Number": "2260500", "norm": 0.4216294859, "date": "2021-06-27"},
-    {"Station_Number": "2260500", "norm": 0.4522793404, "date": "2021-06-28"},
-    {"Station_Number": "2260500", "norm": 0.4701745878, "date": "2021-06-29"},
-    {"Station_Number": "2260500", "norm": 0.470514064, "date": "2021-06-30"},
-    {"Station_Number": "2260500", "norm": 0.4675557711, "date": "2021-07-01"},
-    {"Station_Number": "2260500", "norm": 0.483414161, "date": "2021-07-02"},
-    {"Station_Number": "2260500", "norm": 0.5164888458, "date": "2021-07-03"},
-    {"Station_Number": "2260500", "norm": 0.5441319108, "date": "2021-07-04"},
-    {"Station_Number": "2260500", "norm": 0.5730843841, "date": "2021-07-05"},
-    {"Station_Number": "2260500", "norm": 0.6078079534, "date": "2021-07-06"},
-    {"Station_Number": "2260500", "norm": 0.6453443259, "date": "2021-07-07"},
-    {"Station_Number": "2260500", "norm": 0.6702230844, "date": "2021-07-08"},
-    {"Station_Number": "2260500", "norm": 0.6957807953, "date": "2021-07-09"},
-    {"Station_Number": "2260500", "norm": 0.7164403492, "date": "2021-07-10"},
-    {"Station_Number": "2260500", "norm": 0.722114452, "date": "2021-07-11"},
-    {"Station_Number": "2260500", "norm": 0.7182347236, "date": "2021-07-12"},
-    {"Station_Number": "2260500", "norm": 0.70528613, "date": "2021-07-13"},
-    {"Station_Number": "2260500", "norm": 0.6826867119, "date": "2021-07-14"},
-    {"Station_Number": "2260500", "norm": 0.6416100873, "date": "2021-07-15"},
-    {"Station_Number": "2260500", "norm": 0.5864694471, "date": "2021-07-16"},
-    {"Station_Number": "2260500", "norm": 0.5315227934, "date": "2021-07-17"},
-    {"Station_Number": "2260500", "norm": 0.4845295829, "date": "2021-07-18"},
-    {"Station_Number": "2260500", "norm": 0.456013579, "date": "2021-07-19"},
-    {"Station_Number": "2260500", "norm": 0.4500969932, "date": "2021-07-20"},
-    {"Station_Number": "2260500", "norm": 0.4716779825, "date": "2021-07-21"},
-    {"Station_Number": "2260500", "norm": 0.4906401552, "date": "2021-07-22"},
-    {"Station_Number": "2260500", "norm": 0.4841901067, "date": "2021-07-23"},
-    {"Station_Number": "2260500", "norm": 0.4724054316, "date": "2021-07-24"},
-    {"Station_Number": "2260500", "norm": 0.4641610087, "date": "2021-07-25"},
-    {"Station_Number": "2260500", "norm": 0.4522793404, "date": "2021-07-26"},
-    {"Station_Number": "2260500", "norm": 0.4419980601, "date": "2021-07-27"},
-    {"Station_Number": "2260500", "norm": 0.4397672163, "date": "2021-07-28"},
-    {"Station_Number": "2260500", "norm": 0.4667798254, "date": "2021-07-29"},
-    {"Station_Number": "2260500", "norm": 0.4938409311, "date": "2021-07-30"},
-    {"Station_Number": "2260500", "norm": 0.5053346266, "date": "2021-07-31"},
-    {"Station_Number": "2260500", "norm": 0.509214355, "date": "2021-08-01"},
-    {"Station_Number": "2260500", "norm": 0.5266731329, "date": "2021-08-02"},
-    {"Station_Number": "2260500", "norm": 0.5533462658, "date": "2021-08-03"},
-    {"Station_Number": "2260500", "norm": 0.5811348206, "date": "2021-08-04"},
-    {"Station_Number": "2260500", "norm": 0.6087778855, "date": "2021-08-05"},
-    {"Station_Number": "2260500", "norm": 0.6264306499, "date": "2021-08-06"},
-    {"Station_Number": "2260500", "norm": 0.6291464597, "date": "2021-08-07"},
-    {"Station_Number": "2260500", "norm": 0.6104267701, "date": "2021-08-08"},
-    {"Station_Number": "2260500", "norm": 0.5580504365, "date": "2021-08-09"},
-    {"Station_Number": "2260500", "norm": 0.4972841901, "date": "2021-08-10"},
-    {"Station_Number": "2260500", "norm": 0.4490300679, "date": "2021-08-11"},
-    {"Station_Number": "2260500", "norm": 0.427400582, "date": "2021-08-12"},
-    {"Station_Number": "2260500", "norm": 0.4375848691, "date": "2021-08-13"},
-    {"Station_Number": "2260500", "norm": 0.4841416101, "date": "2021-08-14"},
-    {"Station_Number": "2260500", "norm": 0.5449563531, "date": "2021-08-15"},
-    {"Station_Number": "2260500", "norm": 0.5918040737, "date": "2021-08-16"},
-    {"Station_Number": "2260500", "norm": 0.6359359845, "date": "2021-08-17"},
-    {"Station_Number": "2260500", "norm": 0.6766731329, "date": "2021-08-18"},
-    {"Station_Number": "2260500", "norm": 0.7266246363, "date": "2021-08-19"},
-    {"Station_Number": "2260500", "norm": 0.775800194, "date": "2021-08-20"},
-    {"Station_Number": "2260500", "norm": 0.8238118332, "date": "2021-08-21"},
-    {"Station_Number": "2260500", "norm": 0.8577594568, "date": "2021-08-22"},
-    {"Station_Number": "2260500", "norm": 0.8899127061, "date": "2021-08-23"},
-    {"Station_Number": "2260500", "norm": 0.9224054316, "date": "2021-08-24"},
-    {"Station_Number": "2260500", "norm": 0.9501939864, "date": "2021-08-25"},
-    {"Station_Number": "2260500", "norm": 0.9670223084, "date": "2021-08-26"},
-    {"Station_Number": "2260500", "norm": 0.9670223084, "date": "2021-08-27"},
-    {"Station_Number": "2260500", "norm": 0.9645974782, "date": "2021-08-28"},
-    {"Station_Number": "2260500", "norm": 0.9616876819, "date": "2021-08-29"},
-    {"Station_Number": "2260500", "norm": 0.9715324927, "date": "2021-08-30"},
-    {"Station_Number": "2260500", "norm": 0.9899612027, "date": "2021-08-31"},
-    {"Station_Number": "2260500", "norm": 0.9990300679, "date": "2021-09-01"},
-    {"Station_Number": "2260500", "norm": 0.9990300679, "date": "2021-09-02"},
-    {"Station_Number": "2260500", "norm": 1.0, "date": "2021-09-03"},
-    {"Station_Number": "2260500", "norm": 0.9894762367, "date": "2021-09-04"},
-    {"Station_Number": "2260500", "norm": 0.961057226, "date": "2021-09-05"},
-    {"Station_Number": "2260500", "norm": 0.907371484, "date": "2021-09-06"},
-    {"Station_Number": "2260500", "norm": 0.8658098933, "date": "2021-09-07"},
-    {"Station_Number": "2260500", "norm": 0.8066440349, "date": "2021-09-08"},
-    {"Station_Number": "2260500", "norm": 0.7597963143, "date": "2021-09-09"},
-    {"Station_Number": "2260500", "norm": 0.720514064, "date": "2021-09-10"},
-    {"Station_Number": "2260500", "norm": 0.683656644, "date": "2021-09-11"},
-    {"Station_Number": "2260500", "norm": 0.6490300679, "date": "2021-09-12"},
-    {"Station_Number": "2260500", "norm": 0.6123666343, "date": "2021-09-13"},
-    {"Station_Number": "2260500", "norm": 0.562900097, "date": "2021-09-14"},
-    {"Station_Number": "2260500", "norm": 0.5087293889, "date": "2021-09-15"},
-    {"Station_Number": "2260500", "norm": 0.4623181377, "date": "2021-09-16"},
-    {"Station_Number": "2260500", "norm": 0.4375848691, "date": "2021-09-17"},
-    {"Station_Number": "2260500", "norm": 0.4270611057, "date": "2021-09-18"},
-    {"Station_Number": "2260500", "norm": 0.413385063, "date": "2021-09-19"},
-    {"Station_Number": "2260500", "norm": 0.4690591659, "date": "2021-09-20"},
-    {"Station_Number": "2260500", "norm": 0.4623181377, "date": "2021-09-21"},
-    {"Station_Number": "2260500", "norm": 0.497914646, "date": "2021-09-22"},
-    {"Station_Number": "2260500", "norm": 0.5674102813, "date": "2021-09-23"},
-    {"Station_Number": "2260500", "norm": 0.599757517, "date": "2021-09-24"},
-    {"Station_Number": "2260500", "norm": 0.5963627546, "date": "2021-09-25"},
-    {"Station_Number": "2260500", "norm": 0.5591658584, "date": "2021-09-26"},
-    {"Station_Number": "2260500", "norm": 0.5029097963, "date": "2021-09-27"},
-    {"Station_Number": "2260500", "norm": 0.4464597478, "date": "2021-09-28"},
-    {"Station_Number": "2260500", "norm": 0.4045101843, "date": "2021-09-29"},
-    {"Station_Number": "2260500", "norm": 0.3803103783, "date": "2021-09-30"},
-    {"Station_Number": "2260500", "norm": 0.3655674103, "date": "2021-10-01"},
-    {"Station_Number": "2260500", "norm": 0.3467022308, "date": "2021-10-02"},
-    {"Station_Number": "2260500", "norm": 0.3301648885, "date": "2021-10-03"},
-    {"Station_Number": "2260500", "norm": 0.3142095053, "date": "2021-10-04"},
-    {"Station_Number": "2260500", "norm": 0.3049466537, "date": "2021-10-05"},
-    {"Station_Number": "2260500", "norm": 0.3001939864, "date": "2021-10-06"},
-    {"Station_Number": "2260500", "norm": 0.3027158099, "date": "2021-10-07"},
-    {"Station_Number": "2260500", "norm": 0.3113482056, "date": "2021-10-08"},
-    {"Station_Number": "2260500", "norm": 0.3155189137, "date": "2021-10-09"},
-    {"Station_Number": "2260500", "norm": 0.31842871, "date": "2021-10-10"},
-    {"Station_Number": "2260500", "norm": 0.3027643065, "date": "2021-10-11"},
-    {"Station_Number": "2260500", "norm": 0.2837051406, "date": "2021-10-12"},
-    {"Station_Number": "2260500", "norm": 0.2698836081, "date": "2021-10-13"},
-    {"Station_Number": "2260500", "norm": 0.2493695441, "date": "2021-10-14"},
-    {"Station_Number": "2260500", "norm": 0.2339961203, "date": "2021-10-15"},
-    {"Station_Number": "2260500", "norm": 0.2268186227, "date": "2021-10-16"},
-    {"Station_Number": "2260500", "norm": 0.2175557711, "date": "2021-10-17"},
-    {"Station_Number": "2260500", "norm": 0.2087293889, "date": "2021-10-18"},
-    {"Station_Number": "2260500", "norm": 0.2016488846, "date": "2021-10-19"},
-    {"Station_Number": "2260500", "norm": 0.2032977692, "date": "2021-10-20"},
-    {"Station_Number": "2260500", "norm": 0.1949563531, "date": "2021-10-21"},
-    {"Station_Number": "2260500", "norm": 0.2008729389, "date": "2021-10-22"},
-    {"Station_Number": "2260500", "norm": 0.2288069835, "date": "2021-10-23"},
-    {"Station_Number": "2260500", "norm": 0.25528613, "date": "2021-10-24"},
-    {"Station_Number": "2260500", "norm": 0.3672162949, "date": "2021-10-25"},
-    {"Station_Number": "2260500", "norm": 0.4717264791, "date": "2021-10-26"},
-    {"Station_Number": "2260500", "norm": 0.5208535403, "date": "2021-10-27"},
-    {"Station_Number": "2260500", "norm": 0.5156644035, "date": "2021-10-28"},
-    {"Station_Number": "2260500", "norm": 0.4587293889, "date": "2021-10-29"},
-    {"Station_Number": "2260500", "norm": 0.3794374394, "date": "2021-10-30"},
-    {"Station_Number": "2260500", "norm": 0.3101842871, "date": "2021-10-31"},
-    {"Station_Number": "2260500", "norm": 0.270514064, "date": "2021-11-01"},
-    {"Station_Number": "2260500", "norm": 0.2603297769, "date": "2021-11-02"},
-    {"Station_Number": "2260500", "norm": 0.2388942774, "date": "2021-11-03"},
-    {"Station_Number": "2260500", "norm": 0.2240543162, "date": "2021-11-04"},
-    {"Station_Number": "2260500", "norm": 0.2181377304, "date": "2021-11-05"},
-    {"Station_Number": "2260500", "norm": 0.212900097, "date": "2021-11-06"},
-    {"Station_Number": "2260500", "norm": 0.2048981571, "date": "2021-11-07"},
-    {"Station_Number": "2260500", "norm": 0.1989815713, "date": "2021-11-08"},
-    {"Station_Number": "2260500", "norm": 0.1925800194, "date": "2021-11-09"},
-    {"Station_Number": "2260500", "norm": 0.1859844811, "date": "2021-11-10"},
-    {"Station_Number": "2260500", "norm": 0.1758486906, "date": "2021-11-11"},
-    {"Station_Number": "2260500", "norm": 0.1687196896, "date": "2021-11-12"},
-    {"Station_Number": "2260500", "norm": 0.1642095053, "date": "2021-11-13"},
-    {"Station_Number": "2260500", "norm": 0.1592628516, "date": "2021-11-14"},
-    {"Station_Number": "2260500", "norm": 0.1509699321, "date": "2021-11-15"},
-    {"Station_Number": "2260500", "norm": 0.1512124151, "date": "2021-11-16"},
-    {"Station_Number": "2260500", "norm": 0.1495150339, "date": "2021-11-17"},
-    {"Station_Number": "2260500", "norm": 0.1459262852, "date": "2021-11-18"},
-    {"Station_Number": "2260500", "norm": 0.142628516, "date": "2021-11-19"},
-    {"Station_Number": "2260500", "norm": 0.1490300679, "date": "2021-11-20"},
-    {"Station_Number": "2260500", "norm": 0.1524248303, "date": "2021-11-21"},
-    {"Station_Number": "2260500", "norm": 0.1433074685, "date": "2021-11-22"},
-    {"Station_Number": "2260500", "norm": 0.1445198836, "date": "2021-11-23"},
-    {"Station_Number": "2260500", "norm": 0.1416585839, "date": "2021-11-24"},
-    {"Station_Number": "2260500", "norm": 0.1400096993, "date": "2021-11-25"},
-    {"Station_Number": "2260500", "norm": 0.1355965082, "date": "2021-11-26"},
-    {"Station_Number": "2260500", "norm": 0.1309893307, "date": "2021-11-27"},
-    {"Station_Number": "2260500", "norm": 0.1289039767, "date": "2021-11-28"},
-    {"Station_Number": "2260500", "norm": 0.1293889428, "date": "2021-11-29"},
-    {"Station_Number": "2260500", "norm": 0.1284675073, "date": "2021-11-30"},
-    {"Station_Number": "2260500", "norm": 0.124199806, "date": "2021-12-01"},
-    {"Station_Number": "2260500", "norm": 0.1197381183, "date": "2021-12-02"},
-    {"Station_Number": "2260500", "norm": 0.1166828322, "date": "2021-12-03"},
-    {"Station_Number": "2260500", "norm": 0.1123181377, "date": "2021-12-04"},
-    {"Station_Number": "2260500", "norm": 0.1091173618, "date": "2021-12-05"},
-    {"Station_Number": "2260500", "norm": 0.1032007759, "date": "2021-12-06"},
-    {"Station_Number": "2260500", "norm": 0.105528613, "date": "2021-12-07"},
-    {"Station_Number": "2260500", "norm": 0.0968477207, "date": "2021-12-08"},
-    {"Station_Number": "2260500", "norm": 0.0924345296, "date": "2021-12-09"},
-    {"Station_Number": "2260500", "norm": 0.0896217265, "date": "2021-12-10"},
-    {"Station_Number": "2260500", "norm": 0.0880698351, "date": "2021-12-11"},
-    {"Station_Number": "2260500", "norm": 0.0878758487, "date": "2021-12-12"},
-    {"Station_Number": "2260500", "norm": 0.0851115422, "date": "2021-12-13"},
-    {"Station_Number": "2260500", "norm": 0.0863239573, "date": "2021-12-14"},
-    {"Station_Number": "2260500", "norm": 0.0827837051, "date": "2021-12-15"},
-    {"Station_Number": "2260500", "norm": 0.0786614937, "date": "2021-12-16"},
-    {"Station_Number": "2260500", "norm": 0.079970902, "date": "2021-12-17"},
-    {"Station_Number": "2260500", "norm": 0.0801648885, "date": "2021-12-18"},
-    {"Station_Number": "2260500", "norm": 0.0782735209, "date": "2021-12-19"},
-    {"Station_Number": "2260500", "norm": 0.0747332687, "date": "2021-12-20"},
-    {"Station_Number": "2260500", "norm": 0.0725509214, "date": "2021-12-21"},
-    {"Station_Number": "2260500", "norm": 0.0714839961, "date": "2021-12-22"},
-    {"Station_Number": "2260500", "norm": 0.0712900097, "date": "2021-12-23"},
-    {"Station_Number": "2260500", "norm": 0.0704170708, "date": "2021-12-24"},
-    {"Station_Number": "2260500", "norm": 0.0680892338, "date": "2021-12-25"},
-    {"Station_Number": "2260500", "norm": 0.066828322, "date": "2021-12-26"},
-    {"Station_Number": "2260500", "norm": 0.064742968, "date": "2021-12-27"},
-    {"Station_Number": "2260500", "norm": 0.0659553831, "date": "2021-12-28"},
-    {"Station_Number": "2260500", "norm": 0.06842871, "date": "2021-12-29"},
-    {"Station_Number": "2260500", "norm": 0.0650824442, "date": "2021-12-30"},
-    {"Station_Number": "2260500", "norm": 0.064742968, "date": "2021-12-31"},
-    {"Station_Number": "2260500", "norm": 0.0638755981, "date": "2022-01-01"},
-    {"Station_Number": "2260500", "norm": 0.0644019139, "date": "2022-01-02"},
-    {"Station_Number": "2260500", "norm": 0.06215311, "date": "2022-01-03"},
-    {"Station_Number": "2260500", "norm": 0.0601435407, "date": "2022-01-04"},
-    {"Station_Number": "2260500", "norm": 0.059138756, "date": "2022-01-05"},
-    {"Station_Number": "2260500", "norm": 0.0579904306, "date": "2022-01-06"},
-    {"Station_Number": "2260500", "norm": 0.0574641148, "date": "2022-01-07"},
-    {"Station_Number": "2260500", "norm": 0.0566507177, "date": "2022-01-08"},
-    {"Station_Number": "2260500", "norm": 0.0560287081, "date": "2022-01-09"},
-    {"Station_Number": "2260500", "norm": 0.0554066986, "date": "2022-01-10"},
-    {"Station_Number": "2260500", "norm": 0.0548803828, "date": "2022-01-11"},
-    {"Station_Number": "2260500", "norm": 0.0546889952, "date": "2022-01-12"},
-    {"Station_Number": "2260500", "norm": 0.0544976077, "date": "2022-01-13"},
-    {"Station_Number": "2260500", "norm": 0.0535885167, "date": "2022-01-14"},
-    {"Station_Number": "2260500", "norm": 0.0530143541, "date": "2022-01-15"},
-    {"Station_Number": "2260500", "norm": 0.0533014354, "date": "2022-01-16"},
-    {"Station_Number": "2260500", "norm": 0.0525358852, "date": "2022-01-17"},
-    {"Station_Number": "2260500", "norm": 0.0531100478, "date": "2022-01-18"},
-    {"Station_Number": "2260500", "norm": 0.0550239234, "date": "2022-01-19"},
-    {"Station_Number": "2260500", "norm": 0.0633971292, "date": "2022-01-20"},
-    {"Station_Number": "2260500", "norm": 0.0673684211, "date": "2022-01-21"},
-    {"Station_Number": "2260500", "norm": 0.0649282297, "date": "2022-01-22"},
-    {"Station_Number": "2260500", "norm": 0.0625358852, "date": "2022-01-23"},
-    {"Station_Number": "2260500", "norm": 0.0576555024, "date": "2022-01-24"},
-    {"Station_Number": "2260500", "norm": 0.0555023923, "date": "2022-01-25"},
-    {"Station_Number": "2260500", "norm": 0.0541148325, "date": "2022-01-26"},
-    {"Station_Number": "2260500", "norm": 0.053923445, "date": "2022-01-27"},
-    {"Station_Number": "2260500", "norm": 0.0544976077, "date": "2022-01-28"},
-    {"Station_Number": "2260500", "norm": 0.0555023923, "date": "2022-01-29"},
-    {"Station_Number": "2260500", "norm": 0.0555980861, "date": "2022-01-30"},
-    {"Station_Number": "2260500", "norm": 0.0546889952, "date": "2022-01-31"},
-    {"Station_Number": "2260500", "norm": 0.0555023923, "date": "2022-02-01"},
-    {"Station_Number": "2260500", "norm": 0.0562679426, "date": "2022-02-02"},
-    {"Station_Number": "2260500", "norm": 0.0606698565, "date": "2022-02-03"},
-    {"Station_Number": "2260500", "norm": 0.0661244019, "date": "2022-02-04"},
-    {"Station_Number": "2260500", "norm": 0.0645933014, "date": "2022-02-05"},
-    {"Station_Number": "2260500", "norm": 0.0596172249, "date": "2022-02-06"},
-    {"Station_Number": "2260500", "norm": 0.054784689, "date": "2022-02-07"},
-    {"Station_Number": "2260500", "norm": 0.0545933014, "date": "2022-02-08"},
-    {"Station_Number": "2260500", "norm": 0.0557894737, "date": "2022-02-09"},
-    {"Station_Number": "2260500", "norm": 0.0562200957, "date": "2022-02-10"},
-    {"Station_Number": "2260500", "norm": 0.0555023923, "date": "2022-02-11"},
-    {"Station_Number": "2260500", "norm": 0.0583253589, "date": "2022-02-12"},
-    {"Station_Number": "2260500", "norm": 0.0645933014, "date": "2022-02-13"},
-    {"Station_Number": "2260500", "norm": 0.0652631579, "date": "2022-02-14"},
-    {"Station_Number": "2260500", "norm": 0.0623444976, "date": "2022-02-15"},
-    {"Station_Number": "2260500", "norm": 0.0570334928, "date": "2022-02-16"},
-    {"Station_Number": "2260500", "norm": 0.0543062201, "date": "2022-02-17"},
-    {"Station_Number": "2260500", "norm": 0.0531100478, "date": "2022-02-18"},
-    {"Station_Number": "2260500", "norm": 0.0519138756, "date": "2022-02-19"},
-    {"Station_Number": "2260500", "norm": 0.0518660287, "date": "2022-02-20"},
-    {"Station_Number": "2260500", "norm": 0.0507655502, "date": "2022-02-21"},
-    {"Station_Number": "2260500", "norm": 0.0499043062, "date": "2022-02-22"},
-    {"Station_Number": "2260500", "norm": 0.049569378, "date": "2022-02-23"},
-    {"Station_Number": "2260500", "norm": 0.0494736842, "date": "2022-02-24"},
-    {"Station_Number": "2260500", "norm": 0.0499043062, "date": "2022-02-25"},
-    {"Station_Number": "2260500", "norm": 0.0504784689, "date": "2022-02-26"},
-    {"Station_Number": "2260500", "norm": 0.0518181818, "date": "2022-02-27"},
-    {"Station_Number": "2260500", "norm": 0.0528229665, "date": "2022-02-28"},
-    {"Station_Number": "2260500", "norm": 0.0533971292, "date": "2022-03-01"},
-    {"Station_Number": "2260500", "norm": 0.0522009569, "date": "2022-03-02"},
-    {"Station_Number": "2260500", "norm": 0.049569378, "date": "2022-03-03"},
-    {"Station_Number": "2260500", "norm": 0.0477990431, "date": "2022-03-04"},
-    {"Station_Number": "2260500", "norm": 0.0473205742, "date": "2022-03-05"},
-    {"Station_Number": "2260500", "norm": 0.0474162679, "date": "2022-03-06"},
-    {"Station_Number": "2260500", "norm": 0.0478947368, "date": "2022-03-07"},
-    {"Station_Number": "2260500", "norm": 0.0482296651, "date": "2022-03-08"},
-    {"Station_Number": "2260500", "norm": 0.0491866029, "date": "2022-03-09"},
-    {"Station_Number": "2260500", "norm": 0.0484210526, "date": "2022-03-10"},
-    {"Station_Number": "2260500", "norm": 0.0485167464, "date": "2022-03-11"},
-    {"Station_Number": "2260500", "norm": 0.048708134, "date": "2022-03-12"},
-    {"Station_Number": "2260500", "norm": 0.0512440191, "date": "2022-03-13"},
-    {"Station_Number": "2260500", "norm": 0.053923445, "date": "2022-03-14"},
-    {"Station_Number": "2260500", "norm": 0.0549760766, "date": "2022-03-15"},
-    {"Station_Number": "2260500", "norm": 0.0566028708, "date": "2022-03-16"},
-    {"Station_Number": "2260500", "norm": 0.0557894737, "date": "2022-03-17"},
-    {"Station_Number": "2260500", "norm": 0.0596650718, "date": "2022-03-18"},
-    {"Station_Number": "2260500", "norm": 0.059138756, "date": "2022-03-19"},
-    {"Station_Number": "2260500", "norm": 0.0583253589, "date": "2022-03-20"},
-    {"Station_Number": "2260500", "norm": 0.0569856459, "date": "2022-03-21"},
-    {"Station_Number": "2260500", "norm": 0.0573205742, "date": "2022-03-22"},
-    {"Station_Number": "2260500", "norm": 0.0579904306, "date": "2022-03-23"},
-    {"Station_Number": "2260500", "norm": 0.0594736842, "date": "2022-03-24"},
-    {"Station_Number": "2260500", "norm": 0.0614832536, "date": "2022-03-25"},
-    {"Station_Number": "2260500", "norm": 0.0616746411, "date": "2022-03-26"},
-    {"Station_Number": "2260500", "norm": 0.0604784689, "date": "2022-03-27"},
-    {"Station_Number": "2260500", "norm": 0.0594736842, "date": "2022-03-28"},
-    {"Station_Number": "2260500", "norm": 0.0604784689, "date": "2022-03-29"},
-    {"Station_Number": "2260500", "norm": 0.0604784689, "date": "2022-03-30"},
-    {"Station_Number": "2260500", "norm": 0.0693301435, "date": "2022-03-31"},
-    {"Station_Number": "2260500", "norm": 0.0962200957, "date": "2022-04-01"},
-    {"Station_Number": "2260500", "norm": 0.1116746411, "date": "2022-04-02"},
-    {"Station_Number": "2260500", "norm": 0.1038755981, "date": "2022-04-03"},
-    {"Station_Number": "2260500", "norm": 0.0842105263, "date": "2022-04-04"},
-    {"Station_Number": "2260500", "norm": 0.0755502392, "date": "2022-04-05"},
-    {"Station_Number": "2260500", "norm": 0.0799043062, "date": "2022-04-06"},
-    {"Station_Number": "2260500", "norm": 0.1525837321, "date": "2022-04-07"},
-    {"Station_Number": "2260500", "norm": 0.1966028708, "date": "2022-04-08"},
-    {"Station_Number": "2260500", "norm": 0.2590909091, "date": "2022-04-09"},
-    {"Station_Number": "2260500", "norm": 0.3128708134, "date": "2022-04-10"},
-    {"Station_Number": "2260500", "norm": 0.3024401914, "date": "2022-04-11"},
-    {"Station_Number": "2260500", "norm": 0.2645454545, "date": "2022-04-12"},
-    {"Station_Number": "2260500", "norm": 0.2275119617, "date": "2022-04-13"},
-    {"Station_Number": "2260500", "norm": 0.1928708134, "date": "2022-04-14"},
-    {"Station_Number": "2260500", "norm": 0.1702392344, "date": "2022-04-15"},
-    {"Station_Number": "2260500", "norm": 0.1513397129, "date": "2022-04-16"},
-    {"Station_Number": "2260500", "norm": 0.1411483254, "date": "2022-04-17"},
-    {"Station_Number": "2260500", "norm": 0.1372248804, "date": "2022-04-18"},
-    {"Station_Number": "2260500", "norm": 0.2072248804, "date": "2022-04-19"},
-    {"Station_Number": "2260500", "norm": 0.2928708134, "date": "2022-04-20"},
-    {"Station_Number": "2260500", "norm": 0.3256937799, "date": "2022-04-21"},
-    {"Station_Number": "2260500", "norm": 0.3192822967, "date": "2022-04-22"},
-    {"Station_Number": "2260500", "norm": 0.2937320574, "date": "2022-04-23"},
-    {"Station_Number": "2260500", "norm": 0.2600956938, "date": "2022-04-24"},
-    {"Station_Number": "2260500", "norm": 0.2280382775, "date": "2022-04-25"},
-    {"Station_Number": "2260500", "norm": 0.2000478469, "date": "2022-04-26"},
-    {"Station_Number": "2260500", "norm": 0.176076555, "date": "2022-04-27"},
-    {"Station_Number": "2260500", "norm": 0.1617703349, "date": "2022-04-28"},
-    {"Station_Number": "2260500", "norm": 0.1666985646, "date": "2022-04-29"},
-    {"Station_Number": "2260500", "norm": 0.1727751196, "date": "2022-04-30"},
-    {"Station_Number": "2260500", "norm": 0.1649760766, "date": "2022-05-01"},
-    {"Station_Number": "2260500", "norm": 0.1479904306, "date": "2022-05-02"},
-    {"Station_Number": "2260500", "norm": 0.136507177, "date": "2022-05-03"},
-    {"Station_Number": "2260500", "norm": 0.1316746411, "date": "2022-05-04"},
-    {"Station_Number": "2260500", "norm": 0.126507177, "date": "2022-05-05"},
-    {"Station_Number": "2260500", "norm": 0.1251674641, "date": "2022-05-06"},
-    {"Station_Number": "2260500", "norm": 0.1233971292, "date": "2022-05-07"},
-    {"Station_Number": "2260500", "norm": 0.1372727273, "date": "2022-05-08"},
-    {"Station_Number": "2260500", "norm": 0.1763636364, "date": "2022-05-09"},
-    {"Station_Number": "2260500", "norm": 0.2029665072, "date": "2022-05-10"},
-    {"Station_Number": "2260500", "norm": 0.1984210526, "date": "2022-05-11"},
-    {"Station_Number": "2260500", "norm": 0.1845454545, "date": "2022-05-12"},
-    {"Station_Number": "2260500", "norm": 0.1667464115, "date": "2022-05-13"},
-    {"Station_Number": "2260500", "norm": 0.1677033493, "date": "2022-05-14"},
-    {"Station_Number": "2260500", "norm": 0.180430622, "date": "2022-05-15"},
-    {"Station_Number": "2260500", "norm": 0.2136842105, "date": "2022-05-16"},
-    {"Station_Number": "2260500", "norm": 0.2766507177, "date": "2022-05-17"},
-    {"Station_Number": "2260500", "norm": 0.3605263158, "date": "2022-05-18"},
-    {"Station_Number": "2260500", "norm": 0.4481339713, "date": "2022-05-19"},
-    {"Station_Number": "2260500", "norm": 0.5022488038, "date": "2022-05-20"},
-    {"Station_Number": "2260500", "norm": 0.5258373206, "date": "2022-05-21"},
-    {"Station_Number": "2260500", "norm": 0.536507177, "date": "2022-05-22"},
-    {"Station_Number": "2260500", "norm": 0.5467464115, "date": "2022-05-23"},
-    {"Station_Number": "2260500", "norm": 0.5572727273, "date": "2022-05-24"},
-    {"Station_Number": "2260500", "norm": 0.5357416268, "date": "2022-05-25"},
-    {"Station_Number": "2260500", "norm": 0.5022488038, "date": "2022-05-26"},
-    {"Station_Number": "2260500", "norm": 0.4372727273, "date": "2022-05-27"},
-    {"Station_Number": "2260500", "norm": 0.3655023923, "date": "2022-05-28"},
-    {"Station_Number": "2260500", "norm": 0.3151674641, "date": "2022-05-29"},
-    {"Station_Number": "2260500", "norm": 0.2850717703, "date": "2022-05-30"},
-    {"Station_Number": "2260500", "norm": 0.304354067, "date": "2022-05-31"},
-    {"Station_Number": "2260500", "norm": 0.3473205742, "date": "2022-06-01"},
-    {"Station_Number": "2260500", "norm": 0.3667464115, "date": "2022-06-02"},
-    {"Station_Number": "2260500", "norm": 0.3654066986, "date": "2022-06-03"},
-    {"Station_Number": "2260500", "norm": 0.3479904306, "date": "2022-06-04"},
-    {"Station_Number": "2260500", "norm": 0.3228229665, "date": "2022-06-05"},
-    {"Station_Number": "2260500", "norm": 0.3075119617, "date": "2022-06-06"},
-    {"Station_Number": "2260500", "norm": 0.3332057416, "date": "2022-06-07"},
-    {"Station_Number": "2260500", "norm": 0.388708134, "date": "2022-06-08"},
-    {"Station_Number": "2260500", "norm": 0.4455502392, "date": "2022-06-09"},
-    {"Station_Number": "2260500", "norm": 0.4867464115, "date": "2022-06-10"},
-    {"Station_Number": "2260500", "norm": 0.5161244019, "date": "2022-06-11"},
-    {"Station_Number": "2260500", "norm": 0.5352631579, "date": "2022-06-12"},
-    {"Station_Number": "2260500", "norm": 0.5513397129, "date": "2022-06-13"},
-    {"Station_Number": "2260500", "norm": 0.5704784689, "date": "2022-06-14"},
-    {"Station_Number": "2260500", "norm": 0.5915311005, "date": "2022-06-15"},
-    {"Station_Number": "2260500", "norm": 0.6285645933, "date": "2022-06-16"},
-    {"Station_Number": "2260500", "norm": 0.6615789474, "date": "2022-06-17"},
-    {"Station_Number": "2260500", "norm": 0.6912440191, "date": "2022-06-18"},
-    {"Station_Number": "2260500", "norm": 0.7231100478, "date": "2022-06-19"},
-    {"Station_Number": "2260500", "norm": 0.7611004785, "date": "2022-06-20"},
-    {"Station_Number": "2260500", "norm": 0.8052631579, "date": "2022-06-21"},
-    {"Station_Number": "2260500", "norm": 0.8527751196, "date": "2022-06-22"},
-    {"Station_Number": "2260500", "norm": 0.8995215311, "date": "2022-06-23"},
-    {"Station_Number": "2260500", "norm": 0.9417703349, "date": "2022-06-24"},
-    {"Station_Number": "2260500", "norm": 0.9743062201, "date": "2022-06-25"},
-    {"Station_Number": "2260500", "norm": 0.9933014354, "date": "2022-06-26"},
-    {"Station_Number": "2260500", "norm": 1.0, "date": "2022-06-27"},
-    {"Station_Number": "2260500", "norm": 0.9966507177, "date": "2022-06-28"},
-    {"Station_Number": "2260500", "norm": 0.9881818182, "date": "2022-06-29"},
-    {"Station_Number": "2260500", "norm": 0.9722488038, "date": "2022-06-30"},
-    {"Station_Number": "2260500", "norm": 0.9583732057, "date": "2022-07-01"},
-    {"Station_Number": "2260500", "norm": 0.9526315789, "date": "2022-07-02"},
-    {"Station_Number": "2260500", "norm": 0.9574162679, "date": "2022-07-03"},
-    {"Station_Number": "2260500", "norm": 0.9766985646, "date": "2022-07-04"},
-    {"Station_Number": "2260500", "norm": 0.9896172249, "date": "2022-07-05"},
-    {"Station_Number": "2260500", "norm": 0.9980861244, "date": "2022-07-06"},
-    {"Station_Number": "2260500", "norm": 0.9985645933, "date": "2022-07-07"},
-    {"Station_Number": "2260500", "norm": 0.9818181818, "date": "2022-07-08"},
-    {"Station_Number": "2260500", "norm": 0.9510526316, "date": "2022-07-09"},
-    {"Station_Number": "2260500", "norm": 0.904784689, "date": "2022-07-10"},
-    {"Station_Number": "2260500", "norm": 0.8459330144, "date": "2022-07-11"},
-    {"Station_Number": "2260500", "norm": 0.7757416268, "date": "2022-07-12"},
-    {"Station_Number": "2260500", "norm": 0.7030143541, "date": "2022-07-13"},
-    {"Station_Number": "2260500", "norm": 0.6429186603, "date": "2022-07-14"},
-    {"Station_Number": "2260500", "norm": 0.5924880383, "date": "2022-07-15"},
-    {"Station_Number": "2260500", "norm": 0.5612440191, "date": "2022-07-16"},
-    {"Station_Number": "2260500", "norm": 0.5400478469, "date": "2022-07-17"},
-    {"Station_Number": "2260500", "norm": 0.5258373206, "date": "2022-07-18"},
-    {"Station_Number": "2260500", "norm": 0.5142105263, "date": "2022-07-19"},
-    {"Station_Number": "2260500", "norm": 0.493923445, "date": "2022-07-20"},
-    {"Station_Number": "2260500", "norm": 0.471291866, "date": "2022-07-21"},
-    {"Station_Number": "2260500", "norm": 0.4667942584, "date": "2022-07-22"},
-    {"Station_Number": "2260500", "norm": 0.4991866029, "date": "2022-07-23"},
-    {"Station_Number": "2260500", "norm": 0.5419617225, "date": "2022-07-24"},
-    {"Station_Number": "2260500", "norm": 0.57784689, "date": "2022-07-25"},
-    {"Station_Number": "2260500", "norm": 0.6033492823, "date": "2022-07-26"},
-    {"Station_Number": "2260500", "norm": 0.6245454545, "date": "2022-07-27"},
-    {"Station_Number": "2260500", "norm": 0.6392344498, "date": "2022-07-28"},
-    {"Station_Number": "2260500", "norm": 0.6408133971, "date": "2022-07-29"},
-    {"Station_Number": "2260500", "norm": 0.6144976077, "date": "2022-07-30"},
-    {"Station_Number": "2260500", "norm": 0.6001435407, "date": "2022-07-31"},
-    {"Station_Number": "2260500", "norm": 0.6051196172, "date": "2022-08-01"},
-    {"Station_Number": "2260500", "norm": 0.5928229665, "date": "2022-08-02"},
-    {"Station_Number": "2260500", "norm": 0.5810047847, "date": "2022-08-03"},
-    {"Station_Number": "2260500", "norm": 0.565215311, "date": "2022-08-04"},
-    {"Station_Number": "2260500", "norm": 0.5537320574, "date": "2022-08-05"},
-    {"Station_Number": "2260500", "norm": 0.5510526316, "date": "2022-08-06"},
-    {"Station_Number": "2260500", "norm": 0.5593301435, "date": "2022-08-07"},
-    {"Station_Number": "2260500", "norm": 0.571291866, "date": "2022-08-08"},
-    {"Station_Number": "2260500", "norm": 0.589138756, "date": "2022-08-09"},
-    {"Station_Number": "2260500", "norm": 0.6025358852, "date": "2022-08-10"},
-    {"Station_Number": "2260500", "norm": 0.6052631579, "date": "2022-08-11"},
-    {"Station_Number": "2260500", "norm": 0.595215311, "date": "2022-08-12"},
-    {"Station_Number": "2260500", "norm": 0.5741626794, "date": "2022-08-13"},
-    {"Station_Number": "2260500", "norm": 0.5585167464, "date": "2022-08-14"},
-    {"Station_Number": "2260500", "norm": 0.5540669856, "date": "2022-08-15"},
-    {"Station_Number": "2260500", "norm": 0.5352631579, "date": "2022-08-16"},
-    {"Station_Number": "2260500", "norm": 0.503492823, "date": "2022-08-17"},
-    {"Station_Number": "2260500", "norm": 0.4874162679, "date": "2022-08-18"},
-    {"Station_Number": "2260500", "norm": 0.4898086124, "date": "2022-08-19"},
-    {"Station_Number": "2260500", "norm": 0.4878947368, "date": "2022-08-20"},
-    {"Station_Number": "2260500", "norm": 0.474354067, "date": "2022-08-21"},
-    {"Station_Number": "2260500", "norm": 0.4605263158, "date": "2022-08-22"},
-    {"Station_Number": "2260500", "norm": 0.4480861244, "date": "2022-08-23"},
-    {"Station_Number": "2260500", "norm": 0.4510047847, "date": "2022-08-24"},
-    {"Station_Number": "2260500", "norm": 0.4656937799, "date": "2022-08-25"},
-    {"Station_Number": "2260500", "norm": 0.463492823, "date": "2022-08-26"},
-    {"Station_Number": "2260500", "norm": 0.4499043062, "date": "2022-08-27"},
-    {"Station_Number": "2260500", "norm": 0.4455023923, "date": "2022-08-28"},
-    {"Station_Number": "2260500", "norm": 0.4502392344, "date": "2022-08-29"},
-    {"Station_Number": "2260500", "norm": 0.471291866, "date": "2022-08-30"},
-    {"Station_Number": "2260500", "norm": 0.478708134, "date": "2022-08-31"},
-    {"Station_Number": "2260500", "norm": 0.4671770335, "date": "2022-09-01"},
-    {"Station_Number": "2260500", "norm": 0.4731578947, "date": "2022-09-02"},
-    {"Station_Number": "2260500", "norm": 0.4909090909, "date": "2022-09-03"},
-    {"Station_Number": "2260500", "norm": 0.5051196172, "date": "2022-09-04"},
-    {"Station_Number": "2260500", "norm": 0.5293301435, "date": "2022-09-05"},
-    {"Station_Number": "2260500", "norm": 0.5550239234, "date": "2022-09-06"},
-    {"Station_Number": "2260500", "norm": 0.5786124402, "date": "2022-09-07"},
-    {"Station_Number": "2260500", "norm": 0.6129186603, "date": "2022-09-08"},
-    {"Station_Number": "2260500", "norm": 0.6481818182, "date": "2022-09-09"},
-    {"Station_Number": "2260500", "norm": 0.6886602871, "date": "2022-09-10"},
-    {"Station_Number": "2260500", "norm": 0.7226315789, "date": "2022-09-11"},
-    {"Station_Number": "2260500", "norm": 0.7515311005, "date": "2022-09-12"},
-    {"Station_Number": "2260500", "norm": 0.7749760766, "date": "2022-09-13"},
-    {"Station_Number": "2260500", "norm": 0.7668421053, "date": "2022-09-14"},
-    {"Station_Number": "2260500", "norm": 0.7274162679, "date": "2022-09-15"},
-    {"Station_Number": "2260500", "norm": 0.658708134, "date": "2022-09-16"},
-    {"Station_Number": "2260500", "norm": 0.5722488038, "date": "2022-09-17"},
-    {"Station_Number": "2260500", "norm": 0.5173684211, "date": "2022-09-18"},
-    {"Station_Number": "2260500", "norm": 0.4991866029, "date": "2022-09-19"},
-    {"Station_Number": "2260500", "norm": 0.5071770335, "date": "2022-09-20"},
-    {"Station_Number": "2260500", "norm": 0.519138756, "date": "2022-09-21"},
-    {"Station_Number": "2260500", "norm": 0.5309569378, "date": "2022-09-22"},
-    {"Station_Number": "2260500", "norm": 0.5358851675, "date": "2022-09-23"},
-    {"Station_Number": "2260500", "norm": 0.5373205742, "date": "2022-09-24"},
-    {"Station_Number": "2260500", "norm": 0.5373205742, "date": "2022-09-25"},
-    {"Station_Number": "2260500", "norm": 0.5435406699, "date": "2022-09-26"},
-    {"Station_Number": "2260500", "norm": 0.5464114833, "date": "2022-09-27"},
-    {"Station_Number": "2260500", "norm": 0.5505741627, "date": "2022-09-28"},
-    {"Station_Number": "2260500", "norm": 0.5500956938, "date": "2022-09-29"},
-    {"Station_Number": "2260500", "norm": 0.5489473684, "date": "2022-09-30"},
-    {"Station_Number": "2260500", "norm": 0.5223444976, "date": "2022-10-01"},
-    {"Station_Number": "2260500", "norm": 0.4958373206, "date": "2022-10-02"},
-    {"Station_Number": "2260500", "norm": 0.4535885167, "date": "2022-10-03"},
-    {"Station_Number": "2260500", "norm": 0.4202870813, "date": "2022-10-04"},
-    {"Station_Number": "2260500", "norm": 0.3945454545, "date": "2022-10-05"},
-    {"Station_Number": "2260500", "norm": 0.3838277512, "date": "2022-10-06"},
-    {"Station_Number": "2260500", "norm": 0.3748803828, "date": "2022-10-07"},
-    {"Station_Number": "2260500", "norm": 0.3704784689, "date": "2022-10-08"},
-    {"Station_Number": "2260500", "norm": 0.37215311, "date": "2022-10-09"},
-    {"Station_Number": "2260500", "norm": 0.4064593301, "date": "2022-10-10"},
-    {"Station_Number": "2260500", "norm": 0.4342583732, "date": "2022-10-11"},
-    {"Station_Number": "2260500", "norm": 0.4414832536, "date": "2022-10-12"},
-    {"Station_Number": "2260500", "norm": 0.4364114833, "date": "2022-10-13"},
-    {"Station_Number": "2260500", "norm": 0.4433014354, "date": "2022-10-14"},
-    {"Station_Number": "2260500", "norm": 0.4806698565, "date": "2022-10-15"},
-    {"Station_Number": "2260500", "norm": 0.528708134, "date": "2022-10-16"},
-    {"Station_Number": "2260500", "norm": 0.55215311, "date": "2022-10-17"},
-    {"Station_Number": "2260500", "norm": 0.5625358852, "date": "2022-10-18"},
-    {"Station_Number": "2260500", "norm": 0.561722488, "date": "2022-10-19"},
-    {"Station_Number": "2260500", "norm": 0.5360287081, "date": "2022-10-20"},
-    {"Station_Number": "2260500", "norm": 0.4855502392, "date": "2022-10-21"},
-    {"Station_Number": "2260500", "norm": 0.4238755981, "date": "2022-10-22"},
-    {"Station_Number": "2260500", "norm": 0.3759808612, "date": "2022-10-23"},
-    {"Station_Number": "2260500", "norm": 0.3423923445, "date": "2022-10-24"},
-    {"Station_Number": "2260500", "norm": 0.316076555, "date": "2022-10-25"},
-    {"Station_Number": "2260500", "norm": 0.2974162679, "date": "2022-10-26"},
-    {"Station_Number": "2260500", "norm": 0.2822966507, "date": "2022-10-27"},
-    {"Station_Number": "2260500", "norm": 0.2713875598, "date": "2022-10-28"},
-    {"Station_Number": "2260500", "norm": 0.269569378, "date": "2022-10-29"},
-    {"Station_Number": "2260500", "norm": 0.3388516746, "date": "2022-10-30"},
-    {"Station_Number": "2260500", "norm": 0.3942105263, "date": "2022-10-31"},
-    {"Station_Number": "2260500", "norm": 0.3924401914, "date": "2022-11-01"},
-    {"Station_Number": "2260500", "norm": 0.348708134, "date": "2022-11-02"},
-    {"Station_Number": "2260500", "norm": 0.2906698565, "date": "2022-11-03"},
-    {"Station_Number": "2260500", "norm": 0.2588995215, "date": "2022-11-04"},
-    {"Station_Number": "2260500", "norm": 0.2422488038, "date": "2022-11-05"},
-    {"Station_Number": "2260500", "norm": 0.2257416268, "date": "2022-11-06"},
-    {"Station_Number": "2260500", "norm": 0.2179904306, "date": "2022-11-07"},
-    {"Station_Number": "2260500", "norm": 0.21, "date": "2022-11-08"},
-    {"Station_Number": "2260500", "norm": 0.2043062201, "date": "2022-11-09"},
-    {"Station_Number": "2260500", "norm": 0.2, "date": "2022-11-10"},
-    {"Station_Number": "2260500", "norm": 0.1955023923, "date": "2022-11-11"},
-    {"Station_Number": "2260500", "norm": 0.1907655502, "date": "2022-11-12"},
-    {"Station_Number": "2260500", "norm": 0.1886602871, "date": "2022-11-13"},
-    {"Station_Number": "2260500", "norm": 0.1845454545, "date": "2022-11-14"},
-    {"Station_Number": "2260500", "norm": 0.1775598086, "date": "2022-11-15"},
-    {"Station_Number": "2260500", "norm": 0.1672248804, "date": "2022-11-16"},
-    {"Station_Number": "2260500", "norm": 0.1617703349, "date": "2022-11-17"},
-    {"Station_Number": "2260500", "norm": 0.1576076555, "date": "2022-11-18"},
-    {"Station_Number": "2260500", "norm": 0.1546889952, "date": "2022-11-19"},
-    {"Station_Number": "2260500", "norm": 0.1513397129, "date": "2022-11-20"},
-    {"Station_Number": "2260500", "norm": 0.1470334928, "date": "2022-11-21"},
-    {"Station_Number": "2260500", "norm": 0.143492823, "date": "2022-11-22"},
-    {"Station_Number": "2260500", "norm": 0.14, "date": "2022-11-23"},
-    {"Station_Number": "2260500", "norm": 0.1376555024, "date": "2022-11-24"},
-    {"Station_Number": "2260500", "norm": 0.1349282297, "date": "2022-11-25"},
-    {"Station_Number": "2260500", "norm": 0.1314832536, "date": "2022-11-26"},
-    {"Station_Number": "2260500", "norm": 0.1305741627, "date": "2022-11-27"},
-    {"Station_Number": "2260500", "norm": 0.12784689, "date": "2022-11-28"},
-    {"Station_Number": "2260500", "norm": 0.1224880383, "date": "2022-11-29"},
-    {"Station_Number": "2260500", "norm": 0.1172727273, "date": "2022-11-30"},
-    {"Station_Number": "2260500", "norm": 0.1127272727, "date": "2022-12-01"},
-    {"Station_Number": "2260500", "norm": 0.1101913876, "date": "2022-12-02"},
-    {"Station_Number": "2260500", "norm": 0.1070334928, "date": "2022-12-03"},
-    {"Station_Number": "2260500", "norm": 0.1043062201, "date": "2022-12-04"},
-    {"Station_Number": "2260500", "norm": 0.1024401914, "date": "2022-12-05"},
-    {"Station_Number": "2260500", "norm": 0.1012440191, "date": "2022-12-06"},
-    {"Station_Number": "2260500", "norm": 0.0989952153, "date": "2022-12-07"},
-    {"Station_Number": "2260500", "norm": 0.0983732057, "date": "2022-12-08"},
-    {"Station_Number": "2260500", "norm": 0.0967464115, "date": "2022-12-09"},
-    {"Station_Number": "2260500", "norm": 0.0937320574, "date": "2022-12-10"},
-    {"Station_Number": "2260500", "norm": 0.0913875598, "date": "2022-12-11"},
-    {"Station_Number": "2260500", "norm": 0.0886124402, "date": "2022-12-12"},
-    {"Station_Number": "2260500", "norm": 0.0872727273, "date": "2022-12-13"},
-    {"Station_Number": "2260500", "norm": 0.0861244019, "date": "2022-12-14"},
-    {"Station_Number": "2260500", "norm": 0.0857416268, "date": "2022-12-15"},
-    {"Station_Number": "2260500", "norm": 0.0832057416, "date": "2022-12-16"},
-    {"Station_Number": "2260500", "norm": 0.0830143541, "date": "2022-12-17"},
-    {"Station_Number": "2260500", "norm": 0.0811483254, "date": "2022-12-18"},
-    {"Station_Number": "2260500", "norm": 0.0809569378, "date": "2022-12-19"},
-    {"Station_Number": "2260500", "norm": 0.0807655502, "date": "2022-12-20"},
-    {"Station_Number": "2260500", "norm": 0.0803827751, "date": "2022-12-21"},
-    {"Station_Number": "2260500", "norm": 0.0811483254, "date": "2022-12-22"},
-    {"Station_Number": "2260500", "norm": 0.08, "date": "2022-12-23"},
-    {"Station_Number": "2260500", "norm": 0.0798086124, "date": "2022-12-24"},
-    {"Station_Number": "2260500", "norm": 0.0798086124, "date": "2022-12-25"},
-    {"Station_Number": "2260500", "norm": 0.0772248804, "date": "2022-12-26"},
-    {"Station_Number": "2260500", "norm": 0.0770334928, "date": "2022-12-27"},
-    {"Station_Number": "2260500", "norm": 0.0774162679, "date": "2022-12-28"},
-    {"Station_Number": "2260500", "norm": 0.0757416268, "date": "2022-12-29"},
-    {"Station_Number": "2260500", "norm": 0.0735885167, "date": "2022-12-30"},
-    {"Station_Number": "2260500", "norm": 0.0713875598, "date": "2022-12-31"},
-    {"Station_Number": "2260500", "norm": 0.0381845091, "date": "2023-01-01"},
-    {"Station_Number": "2260500", "norm": 0.0428219043, "date": "2023-01-02"},
-    {"Station_Number": "2260500", "norm": 0.0494819931, "date": "2023-01-03"},
-    {"Station_Number": "2260500", "norm": 0.0456339418, "date": "2023-01-04"},
-    {"Station_Number": "2260500", "norm": 0.0414898865, "date": "2023-01-05"},
-    {"Station_Number": "2260500", "norm": 0.0384805131, "date": "2023-01-06"},
-    {"Station_Number": "2260500", "norm": 0.0372964973, "date": "2023-01-07"},
-    {"Station_Number": "2260500", "norm": 0.0353231376, "date": "2023-01-08"},
-    {"Station_Number": "2260500", "norm": 0.0336457819, "date": "2023-01-09"},
-    {"Station_Number": "2260500", "norm": 0.0325604341, "date": "2023-01-10"},
-    {"Station_Number": "2260500", "norm": 0.0313270844, "date": "2023-01-11"},
-    {"Station_Number": "2260500", "norm": 0.0308337444, "date": "2023-01-12"},
-    {"Station_Number": "2260500", "norm": 0.0307350765, "date": "2023-01-13"},
-    {"Station_Number": "2260500", "norm": 0.0305870745, "date": "2023-01-14"},
-    {"Station_Number": "2260500", "norm": 0.0303897385, "date": "2023-01-15"},
-    {"Station_Number": "2260500", "norm": 0.0302417366, "date": "2023-01-16"},
-    {"Station_Number": "2260500", "norm": 0.0301924026, "date": "2023-01-17"},
-    {"Station_Number": "2260500", "norm": 0.0297483966, "date": "2023-01-18"},
-    {"Station_Number": "2260500", "norm": 0.0297483966, "date": "2023-01-19"},
-    {"Station_Number": "2260500", "norm": 0.0293043907, "date": "2023-01-20"},
-    {"Station_Number": "2260500", "norm": 0.0296497287, "date": "2023-01-21"},
-    {"Station_Number": "2260500", "norm": 0.0298470646, "date": "2023-01-22"},
-    {"Station_Number": "2260500", "norm": 0.0296003947, "date": "2023-01-23"},
-    {"Station_Number": "2260500", "norm": 0.0287123828, "date": "2023-01-24"},
-    {"Station_Number": "2260500", "norm": 0.0281203749, "date": "2023-01-25"},
-    {"Station_Number": "2260500", "norm": 0.0266403552, "date": "2023-01-26"},
-    {"Station_Number": "2260500", "norm": 0.0253576714, "date": "2023-01-27"},
-    {"Station_Number": "2260500", "norm": 0.0243709916, "date": "2023-01-28"},
-    {"Station_Number": "2260500", "norm": 0.0239763197, "date": "2023-01-29"},
-    {"Station_Number": "2260500", "norm": 0.0234829798, "date": "2023-01-30"},
-    {"Station_Number": "2260500", "norm": 0.0232856438, "date": "2023-01-31"},
-    {"Station_Number": "2260500", "norm": 0.0231376418, "date": "2023-02-01"},
-    {"Station_Number": "2260500", "norm": 0.0232363098, "date": "2023-02-02"},
-    {"Station_Number": "2260500", "norm": 0.0230883078, "date": "2023-02-03"},
-    {"Station_Number": "2260500", "norm": 0.0228909719, "date": "2023-02-04"},
-    {"Station_Number": "2260500", "norm": 0.0226936359, "date": "2023-02-05"},
-    {"Station_Number": "2260500", "norm": 0.0224963, "date": "2023-02-06"},
-    {"Station_Number": "2260500", "norm": 0.02224963, "date": "2023-02-07"},
-    {"Station_Number": "2260500", "norm": 0.0217069561, "date": "2023-02-08"},
-    {"Station_Number": "2260500", "norm": 0.0211149482, "date": "2023-02-09"},
-    {"Station_Number": "2260500", "norm": 0.0209176122, "date": "2023-02-10"},
-    {"Station_Number": "2260500", "norm": 0.0208682782, "date": "2023-02-11"},
-    {"Station_Number": "2260500", "norm": 0.0209176122, "date": "2023-02-12"},
-    {"Station_Number": "2260500", "norm": 0.0211149482, "date": "2023-02-13"},
-    {"Station_Number": "2260500", "norm": 0.0209176122, "date": "2023-02-14"},
-    {"Station_Number": "2260500", "norm": 0.0207202763, "date": "2023-02-15"},
-    {"Station_Number": "2260500", "norm": 0.0205229403, "date": "2023-02-16"},
-    {"Station_Number": "2260500", "norm": 0.0203256043, "date": "2023-02-17"},
-    {"Station_Number": "2260500", "norm": 0.0201282684, "date": "2023-02-18"},
-    {"Station_Number": "2260500", "norm": 0.0199802664, "date": "2023-02-19"},
-    {"Station_Number": "2260500", "norm": 0.0201282684, "date": "2023-02-20"},
-    {"Station_Number": "2260500", "norm": 0.0205229403, "date": "2023-02-21"},
-    {"Station_Number": "2260500", "norm": 0.0209669462, "date": "2023-02-22"},
-    {"Station_Number": "2260500", "norm": 0.0207202763, "date": "2023-02-23"},
-    {"Station_Number": "2260500", "norm": 0.0203256043, "date": "2023-02-24"},
-    {"Station_Number": "2260500", "norm": 0.0205229403, "date": "2023-02-25"},
-    {"Station_Number": "2260500", "norm": 0.0205229403, "date": "2023-02-26"},
-    {"Station_Number": "2260500", "norm": 0.0210656142, "date": "2023-02-27"},
-    {"Station_Number": "2260500", "norm": 0.022348298, "date": "2023-02-28"},
-    {"Station_Number": "2260500", "norm": 0.0330537741, "date": "2023-03-01"},
-    {"Station_Number": "2260500", "norm": 0.0468672916, "date": "2023-03-02"},
-    {"Station_Number": "2260500", "norm": 0.0468672916, "date": "2023-03-03"},
-    {"Station_Number": "2260500", "norm": 0.0367538234, "date": "2023-03-04"},
-    {"Station_Number": "2260500", "norm": 0.0315244203, "date": "2023-03-05"},
-    {"Station_Number": "2260500", "norm": 0.0281203749, "date": "2023-03-06"},
-    {"Station_Number": "2260500", "norm": 0.027528367, "date": "2023-03-07"},
-    {"Station_Number": "2260500", "norm": 0.0257523434, "date": "2023-03-08"},
-    {"Station_Number": "2260500", "norm": 0.0239763197, "date": "2023-03-09"},
-    {"Station_Number": "2260500", "norm": 0.0243216576, "date": "2023-03-10"},
-    {"Station_Number": "2260500", "norm": 0.0242229896, "date": "2023-03-11"},
-    {"Station_Number": "2260500", "norm": 0.0232363098, "date": "2023-03-12"},
-    {"Station_Number": "2260500", "norm": 0.0235323138, "date": "2023-03-13"},
-    {"Station_Number": "2260500", "norm": 0.0235323138, "date": "2023-03-14"},
-    {"Station_Number": "2260500", "norm": 0.0239763197, "date": "2023-03-15"},
-    {"Station_Number": "2260500", "norm": 0.0249629995, "date": "2023-03-16"},
-    {"Station_Number": "2260500", "norm": 0.0251603355, "date": "2023-03-17"},
-    {"Station_Number": "2260500", "norm": 0.0244696596, "date": "2023-03-18"},
-    {"Station_Number": "2260500", "norm": 0.0224963, "date": "2023-03-19"},
-    {"Station_Number": "2260500", "norm": 0.0217562901, "date": "2023-03-20"},
-    {"Station_Number": "2260500", "norm": 0.0229403059, "date": "2023-03-21"},
-    {"Station_Number": "2260500", "norm": 0.0229403059, "date": "2023-03-22"},
-    {"Station_Number": "2260500", "norm": 0.0251603355, "date": "2023-03-23"},
-    {"Station_Number": "2260500", "norm": 0.0269363592, "date": "2023-03-24"},
-    {"Station_Number": "2260500", "norm": 0.0304390725, "date": "2023-03-25"},
-    {"Station_Number": "2260500", "norm": 0.0368031574, "date": "2023-03-26"},
-    {"Station_Number": "2260500", "norm": 0.0617168229, "date": "2023-03-27"},
-    {"Station_Number": "2260500", "norm": 0.0795263937, "date": "2023-03-28"},
-    {"Station_Number": "2260500", "norm": 0.0838677849, "date": "2023-03-29"},
-    {"Station_Number": "2260500", "norm": 0.0712382832, "date": "2023-03-30"},
-    {"Station_Number": "2260500", "norm": 0.0602368032, "date": "2023-03-31"},
-    {"Station_Number": "2260500", "norm": 0.0487419832, "date": "2023-04-01"},
-    {"Station_Number": "2260500", "norm": 0.0430685742, "date": "2023-04-02"},
-    {"Station_Number": "2260500", "norm": 0.044647262, "date": "2023-04-03"},
-    {"Station_Number": "2260500", "norm": 0.050271337, "date": "2023-04-04"},
-    {"Station_Number": "2260500", "norm": 0.0458806117, "date": "2023-04-05"},
-    {"Station_Number": "2260500", "norm": 0.0410458806, "date": "2023-04-06"},
-    {"Station_Number": "2260500", "norm": 0.0372964973, "date": "2023-04-07"},
-    {"Station_Number": "2260500", "norm": 0.049925999, "date": "2023-04-08"},
-    {"Station_Number": "2260500", "norm": 0.0708929452, "date": "2023-04-09"},
-    {"Station_Number": "2260500", "norm": 0.0757770104, "date": "2023-04-10"},
-    {"Station_Number": "2260500", "norm": 0.0698569314, "date": "2023-04-11"},
-    {"Station_Number": "2260500", "norm": 0.0661568821, "date": "2023-04-12"},
-    {"Station_Number": "2260500", "norm": 0.0597434632, "date": "2023-04-13"},
-    {"Station_Number": "2260500", "norm": 0.0520966946, "date": "2023-04-14"},
-    {"Station_Number": "2260500", "norm": 0.044647262, "date": "2023-04-15"},
-    {"Station_Number": "2260500", "norm": 0.0408978786, "date": "2023-04-16"},
-    {"Station_Number": "2260500", "norm": 0.0380858411, "date": "2023-04-17"},
-    {"Station_Number": "2260500", "norm": 0.0358658115, "date": "2023-04-18"},
-    {"Station_Number": "2260500", "norm": 0.0351751357, "date": "2023-04-19"},
-    {"Station_Number": "2260500", "norm": 0.0341391219, "date": "2023-04-20"},
-    {"Station_Number": "2260500", "norm": 0.0330537741, "date": "2023-04-21"},
-    {"Station_Number": "2260500", "norm": 0.033152442, "date": "2023-04-22"},
-    {"Station_Number": "2260500", "norm": 0.0365071534, "date": "2023-04-23"},
-    {"Station_Number": "2260500", "norm": 0.0394178589, "date": "2023-04-24"},
-    {"Station_Number": "2260500", "norm": 0.038825851, "date": "2023-04-25"},
-    {"Station_Number": "2260500", "norm": 0.0367538234, "date": "2023-04-26"},
-    {"Station_Number": "2260500", "norm": 0.0405525407, "date": "2023-04-27"},
-    {"Station_Number": "2260500", "norm": 0.0510606808, "date": "2023-04-28"},
-    {"Station_Number": "2260500", "norm": 0.0532807104, "date": "2023-04-29"},
-    {"Station_Number": "2260500", "norm": 0.0515540207, "date": "2023-04-30"},
-    {"Station_Number": "2260500", "norm": 0.0496299951, "date": "2023-05-01"},
-    {"Station_Number": "2260500", "norm": 0.0456339418, "date": "2023-05-02"},
-    {"Station_Number": "2260500", "norm": 0.0397138629, "date": "2023-05-03"},
-    {"Station_Number": "2260500", "norm": 0.0349284657, "date": "2023-05-04"},
-    {"Station_Number": "2260500", "norm": 0.0337444499, "date": "2023-05-05"},
-    {"Station_Number": "2260500", "norm": 0.0322644302, "date": "2023-05-06"},
-    {"Station_Number": "2260500", "norm": 0.0320670942, "date": "2023-05-07"},
-    {"Station_Number": "2260500", "norm": 0.0410458806, "date": "2023-05-08"},
-    {"Station_Number": "2260500", "norm": 0.0631475086, "date": "2023-05-09"},
-    {"Station_Number": "2260500", "norm": 0.0669462259, "date": "2023-05-10"},
-    {"Station_Number": "2260500", "norm": 0.0644795264, "date": "2023-05-11"},
-    {"Station_Number": "2260500", "norm": 0.0647261963, "date": "2023-05-12"},
-    {"Station_Number": "2260500", "norm": 0.0607794771, "date": "2023-05-13"},
-    {"Station_Number": "2260500", "norm": 0.0558954119, "date": "2023-05-14"},
-    {"Station_Number": "2260500", "norm": 0.050271337, "date": "2023-05-15"},
-    {"Station_Number": "2260500", "norm": 0.0597434632, "date": "2023-05-16"},
-    {"Station_Number": "2260500", "norm": 0.0534287124, "date": "2023-05-17"},
-    {"Station_Number": "2260500", "norm": 0.0423285644, "date": "2023-05-18"},
-    {"Station_Number": "2260500", "norm": 0.0376911692, "date": "2023-05-19"},
-    {"Station_Number": "2260500", "norm": 0.044548594, "date": "2023-05-20"},
-    {"Station_Number": "2260500", "norm": 0.0848051307, "date": "2023-05-21"},
-    {"Station_Number": "2260500", "norm": 0.1092254563, "date": "2023-05-22"},
-    {"Station_Number": "2260500", "norm": 0.1032560434, "date": "2023-05-23"},
-    {"Station_Number": "2260500", "norm": 0.0892451899, "date": "2023-05-24"},
-    {"Station_Number": "2260500", "norm": 0.0781450419, "date": "2023-05-25"},
-    {"Station_Number": "2260500", "norm": 0.0858411445, "date": "2023-05-26"},
-    {"Station_Number": "2260500", "norm": 0.0921558954, "date": "2023-05-27"},
-    {"Station_Number": "2260500", "norm": 0.077947706, "date": "2023-05-28"},
-    {"Station_Number": "2260500", "norm": 0.0718302911, "date": "2023-05-29"},
-    {"Station_Number": "2260500", "norm": 0.0659102121, "date": "2023-05-30"},
-    {"Station_Number": "2260500", "norm": 0.0635421806, "date": "2023-05-31"},
-    {"Station_Number": "2260500", "norm": 0.0655155402, "date": "2023-06-01"},
-    {"Station_Number": "2260500", "norm": 0.0716822891, "date": "2023-06-02"},
-    {"Station_Number": "2260500", "norm": 0.077553034, "date": "2023-06-03"},
-    {"Station_Number": "2260500", "norm": 0.0684262457, "date": "2023-06-04"},
-    {"Station_Number": "2260500", "norm": 0.0647261963, "date": "2023-06-05"},
-    {"Station_Number": "2260500", "norm": 0.061026147, "date": "2023-06-06"},
-    {"Station_Number": "2260500", "norm": 0.0578687716, "date": "2023-06-07"},
-    {"Station_Number": "2260500", "norm": 0.0606314751, "date": "2023-06-08"},
-    {"Station_Number": "2260500", "norm": 0.0615688209, "date": "2023-06-09"},
-    {"Station_Number": "2260500", "norm": 0.0593487913, "date": "2023-06-10"},
-    {"Station_Number": "2260500", "norm": 0.0581647755, "date": "2023-06-11"},
-    {"Station_Number": "2260500", "norm": 0.0569807597, "date": "2023-06-12"},
-    {"Station_Number": "2260500", "norm": 0.0584114455, "date": "2023-06-13"},
-    {"Station_Number": "2260500", "norm": 0.0617168229, "date": "2023-06-14"},
-    {"Station_Number": "2260500", "norm": 0.0914158855, "date": "2023-06-15"},
-    {"Station_Number": "2260500", "norm": 0.1763690183, "date": "2023-06-16"},
-    {"Station_Number": "2260500", "norm": 0.2383818451, "date": "2023-06-17"},
-    {"Station_Number": "2260500", "norm": 0.2762703503, "date": "2023-06-18"},
-    {"Station_Number": "2260500", "norm": 0.3142575234, "date": "2023-06-19"},
-    {"Station_Number": "2260500", "norm": 0.3561914159, "date": "2023-06-20"},
-    {"Station_Number": "2260500", "norm": 0.3926985693, "date": "2023-06-21"},
-    {"Station_Number": "2260500", "norm": 0.4179575728, "date": "2023-06-22"},
-    {"Station_Number": "2260500", "norm": 0.4317217563, "date": "2023-06-23"},
-    {"Station_Number": "2260500", "norm": 0.4367044894, "date": "2023-06-24"},
-    {"Station_Number": "2260500", "norm": 0.4436112481, "date": "2023-06-25"},
-    {"Station_Number": "2260500", "norm": 0.4607794771, "date": "2023-06-26"},
-    {"Station_Number": "2260500", "norm": 0.4796250617, "date": "2023-06-27"},
-    {"Station_Number": "2260500", "norm": 0.5160335471, "date": "2023-06-28"},
-    {"Station_Number": "2260500", "norm": 0.5476073014, "date": "2023-06-29"},
-    {"Station_Number": "2260500", "norm": 0.5538727183, "date": "2023-06-30"},
-    {"Station_Number": "2260500", "norm": 0.528021707, "date": "2023-07-01"},
-    {"Station_Number": "2260500", "norm": 0.4693635915, "date": "2023-07-02"},
-    {"Station_Number": "2260500", "norm": 0.4264430192, "date": "2023-07-03"},
-    {"Station_Number": "2260500", "norm": 0.3962506167, "date": "2023-07-04"},
-    {"Station_Number": "2260500", "norm": 0.3828317711, "date": "2023-07-05"},
-    {"Station_Number": "2260500", "norm": 0.3753330044, "date": "2023-07-06"},
-    {"Station_Number": "2260500", "norm": 0.3804637395, "date": "2023-07-07"},
-    {"Station_Number": "2260500", "norm": 0.394671929, "date": "2023-07-08"},
-    {"Station_Number": "2260500", "norm": 0.4171682289, "date": "2023-07-09"},
-    {"Station_Number": "2260500", "norm": 0.4458312778, "date": "2023-07-10"},
-    {"Station_Number": "2260500", "norm": 0.4765663542, "date": "2023-07-11"},
-    {"Station_Number": "2260500", "norm": 0.5086334484, "date": "2023-07-12"},
-    {"Station_Number": "2260500", "norm": 0.5402072028, "date": "2023-07-13"},
-    {"Station_Number": "2260500", "norm": 0.5709422792, "date": "2023-07-14"},
-    {"Station_Number": "2260500", "norm": 0.5829797731, "date": "2023-07-15"},
-    {"Station_Number": "2260500", "norm": 0.5910212136, "date": "2023-07-16"},
-    {"Station_Number": "2260500", "norm": 0.6041933892, "date": "2023-07-17"},
-    {"Station_Number": "2260500", "norm": 0.6211149482, "date": "2023-07-18"},
-    {"Station_Number": "2260500", "norm": 0.6377405032, "date": "2023-07-19"},
-    {"Station_Number": "2260500", "norm": 0.6492353231, "date": "2023-07-20"},
-    {"Station_Number": "2260500", "norm": 0.6541687222, "date": "2023-07-21"},
-    {"Station_Number": "2260500", "norm": 0.6586087815, "date": "2023-07-22"},
-    {"Station_Number": "2260500", "norm": 0.6291563888, "date": "2023-07-23"},
-    {"Station_Number": "2260500", "norm": 0.588899852, "date": "2023-07-24"},
-    {"Station_Number": "2260500", "norm": 0.5370991613, "date": "2023-07-25"},
-    {"Station_Number": "2260500", "norm": 0.4874198323, "date": "2023-07-26"},
-    {"Station_Number": "2260500", "norm": 0.4519980266, "date": "2023-07-27"},
-    {"Station_Number": "2260500", "norm": 0.4132215096, "date": "2023-07-28"},
-    {"Station_Number": "2260500", "norm": 0.3883571781, "date": "2023-07-29"},
-    {"Station_Number": "2260500", "norm": 0.3907252097, "date": "2023-07-30"},
-    {"Station_Number": "2260500", "norm": 0.405722743, "date": "2023-07-31"},
-    {"Station_Number": "2260500", "norm": 0.4237789837, "date": "2023-08-01"},
-    {"Station_Number": "2260500", "norm": 0.4402565368, "date": "2023-08-02"},
-    {"Station_Number": "2260500", "norm": 0.4592994573, "date": "2023-08-03"},
-    {"Station_Number": "2260500", "norm": 0.4657622102, "date": "2023-08-04"},
-    {"Station_Number": "2260500", "norm": 0.4690182536, "date": "2023-08-05"},
-    {"Station_Number": "2260500", "norm": 0.4773063641, "date": "2023-08-06"},
-    {"Station_Number": "2260500", "norm": 0.4909718796, "date": "2023-08-07"},
-    {"Station_Number": "2260500", "norm": 0.5081401085, "date": "2023-08-08"},
-    {"Station_Number": "2260500", "norm": 0.5319684262, "date": "2023-08-09"},
-    {"Station_Number": "2260500", "norm": 0.5671928959, "date": "2023-08-10"},
-    {"Station_Number": "2260500", "norm": 0.6091267884, "date": "2023-08-11"},
-    {"Station_Number": "2260500", "norm": 0.6525407005, "date": "2023-08-12"},
-    {"Station_Number": "2260500", "norm": 0.7036507153, "date": "2023-08-13"},
-    {"Station_Number": "2260500", "norm": 0.7671435619, "date": "2023-08-14"},
-    {"Station_Number": "2260500", "norm": 0.8092254563, "date": "2023-08-15"},
-    {"Station_Number": "2260500", "norm": 0.8355698076, "date": "2023-08-16"},
-    {"Station_Number": "2260500", "norm": 0.8503700049, "date": "2023-08-17"},
-    {"Station_Number": "2260500", "norm": 0.8479033054, "date": "2023-08-18"},
-    {"Station_Number": "2260500", "norm": 0.8457326098, "date": "2023-08-19"},
-    {"Station_Number": "2260500", "norm": 0.8450912679, "date": "2023-08-20"},
-    {"Station_Number": "2260500", "norm": 0.8450912679, "date": "2023-08-21"},
-    {"Station_Number": "2260500", "norm": 0.8347311297, "date": "2023-08-22"},
-    {"Station_Number": "2260500", "norm": 0.7975826344, "date": "2023-08-23"},
-    {"Station_Number": "2260500", "norm": 0.7548100641, "date": "2023-08-24"},
-    {"Station_Number": "2260500", "norm": 0.7089294524, "date": "2023-08-25"},
-    {"Station_Number": "2260500", "norm": 0.6852491367, "date": "2023-08-26"},
-    {"Station_Number": "2260500", "norm": 0.6793290577, "date": "2023-08-27"},
-    {"Station_Number": "2260500", "norm": 0.6684755797, "date": "2023-08-28"},
-    {"Station_Number": "2260500", "norm": 0.6633941786, "date": "2023-08-29"},
-    {"Station_Number": "2260500", "norm": 0.66650222, "date": "2023-08-30"},
-    {"Station_Number": "2260500", "norm": 0.6974346325, "date": "2023-08-31"},
-    {"Station_Number": "2260500", "norm": 0.7595954613, "date": "2023-09-01"},
-    {"Station_Number": "2260500", "norm": 0.8131721756, "date": "2023-09-02"},
-    {"Station_Number": "2260500", "norm": 0.8784903799, "date": "2023-09-03"},
-    {"Station_Number": "2260500", "norm": 0.9404538727, "date": "2023-09-04"},
-    {"Station_Number": "2260500", "norm": 0.9906265417, "date": "2023-09-05"},
-    {"Station_Number": "2260500", "norm": 1.0, "date": "2023-09-06"},
-    {"Station_Number": "2260500", "norm": 0.9748396645, "date": "2023-09-07"},
-    {"Station_Number": "2260500", "norm": 0.9131721756, "date": "2023-09-08"},
-    {"Station_Number": "2260500", "norm": 0.8312777504, "date": "2023-09-09"},
-    {"Station_Number": "2260500", "norm": 0.750222003, "date": "2023-09-10"},
-    {"Station_Number": "2260500", "norm": 0.627528367, "date": "2023-09-11"},
-    {"Station_Number": "2260500", "norm": 0.5476073014, "date": "2023-09-12"},
-    {"Station_Number": "2260500", "norm": 0.4769116922, "date": "2023-09-13"},
-    {"Station_Number": "2260500", "norm": 0.4423285644, "date": "2023-09-14"},
-    {"Station_Number": "2260500", "norm": 0.4324124322, "date": "2023-09-15"},
-    {"Station_Number": "2260500", "norm": 0.4423778984, "date": "2023-09-16"},
-    {"Station_Number": "2260500", "norm": 0.4647755303, "date": "2023-09-17"},
-    {"Station_Number": "2260500", "norm": 0.4670448939, "date": "2023-09-18"},
-    {"Station_Number": "2260500", "norm": 0.4435619142, "date": "2023-09-19"},
-    {"Station_Number": "2260500", "norm": 0.4116428219, "date": "2023-09-20"},
-    {"Station_Number": "2260500", "norm": 0.3867784904, "date": "2023-09-21"},
-    {"Station_Number": "2260500", "norm": 0.3780957079, "date": "2023-09-22"},
-    {"Station_Number": "2260500", "norm": 0.3769116922, "date": "2023-09-23"},
-    {"Station_Number": "2260500", "norm": 0.3674395659, "date": "2023-09-24"},
-    {"Station_Number": "2260500", "norm": 0.3761223483, "date": "2023-09-25"},
-    {"Station_Number": "2260500", "norm": 0.4013813518, "date": "2023-09-26"},
-    {"Station_Number": "2260500", "norm": 0.4284657129, "date": "2023-09-27"},
-    {"Station_Number": "2260500", "norm": 0.4438085841, "date": "2023-09-28"},
-    {"Station_Number": "2260500", "norm": 0.4455846078, "date": "2023-09-29"},
-    {"Station_Number": "2260500", "norm": 0.4328071041, "date": "2023-09-30"},
-    {"Station_Number": "2260500", "norm": 0.3911198816, "date": "2023-10-01"},
-    {"Station_Number": "2260500", "norm": 0.3384311791, "date": "2023-10-02"},
-    {"Station_Number": "2260500", "norm": 0.2983719783, "date": "2023-10-03"},
-    {"Station_Number": "2260500", "norm": 0.2725209669, "date": "2023-10-04"},
-    {"Station_Number": "2260500", "norm": 0.2594967933, "date": "2023-10-05"},
-    {"Station_Number": "2260500", "norm": 0.2578687716, "date": "2023-10-06"},
-    {"Station_Number": "2260500", "norm": 0.2688209176, "date": "2023-10-07"},
-    {"Station_Number": "2260500", "norm": 0.294178589, "date": "2023-10-08"},
-    {"Station_Number": "2260500", "norm": 0.3289097188, "date": "2023-10-09"},
-    {"Station_Number": "2260500", "norm": 0.3689689196, "date": "2023-10-10"},
-    {"Station_Number": "2260500", "norm": 0.4096694623, "date": "2023-10-11"},
-    {"Station_Number": "2260500", "norm": 0.4163788851, "date": "2023-10-12"},
-    {"Station_Number": "2260500", "norm": 0.4712876172, "date": "2023-10-13"},
-    {"Station_Number": "2260500", "norm": 0.5517020227, "date": "2023-10-14"},
-    {"Station_Number": "2260500", "norm": 0.5851011347, "date": "2023-10-15"},
-    {"Station_Number": "2260500", "norm": 0.6091267884, "date": "2023-10-16"},
-    {"Station_Number": "2260500", "norm": 0.6133695116, "date": "2023-10-17"},
-    {"Station_Number": "2260500", "norm": 0.5901825358, "date": "2023-10-18"},
-    {"Station_Number": "2260500", "norm": 0.533152442, "date": "2023-10-19"},
-    {"Station_Number": "2260500", "norm": 0.4525900345, "date": "2023-10-20"},
-    {"Station_Number": "2260500", "norm": 0.3782930439, "date": "2023-10-21"},
-    {"Station_Number": "2260500", "norm": 0.316428219, "date": "2023-10-22"},
-    {"Station_Number": "2260500", "norm": 0.2743956586, "date": "2023-10-23"},
-    {"Station_Number": "2260500", "norm": 0.2541193883, "date": "2023-10-24"},
-    {"Station_Number": "2260500", "norm": 0.2479033054, "date": "2023-10-25"},
-    {"Station_Number": "2260500", "norm": 0.2426245683, "date": "2023-10-26"},
-    {"Station_Number": "2260500", "norm": 0.2318697583, "date": "2023-10-27"},
-    {"Station_Number": "2260500", "norm": 0.2231376418, "date": "2023-10-28"},
-    {"Station_Number": "2260500", "norm": 0.2106561421, "date": "2023-10-29"},
-    {"Station_Number": "2260500", "norm": 0.1954119388, "date": "2023-10-30"},
-    {"Station_Number": "2260500", "norm": 0.2083867785, "date": "2023-10-31"},
-    {"Station_Number": "2260500", "norm": 0.2233843118, "date": "2023-11-01"},
-    {"Station_Number": "2260500", "norm": 0.2059200789, "date": "2023-11-02"},
-    {"Station_Number": "2260500", "norm": 0.1883078441, "date": "2023-11-03"},
-    {"Station_Number": "2260500", "norm": 0.1698569314, "date": "2023-11-04"},
-    {"Station_Number": "2260500", "norm": 0.1583127775, "date": "2023-11-05"},
-    {"Station_Number": "2260500", "norm": 0.1458806117, "date": "2023-11-06"},
-    {"Station_Number": "2260500", "norm": 0.1401578688, "date": "2023-11-07"},
-    {"Station_Number": "2260500", "norm": 0.1343857918, "date": "2023-11-08"},
-    {"Station_Number": "2260500", "norm": 0.1295510607, "date": "2023-11-09"},
-    {"Station_Number": "2260500", "norm": 0.1244696596, "date": "2023-11-10"},
-    {"Station_Number": "2260500", "norm": 0.1189442526, "date": "2023-11-11"},
-    {"Station_Number": "2260500", "norm": 0.1134681796, "date": "2023-11-12"},
-    {"Station_Number": "2260500", "norm": 0.1123828318, "date": "2023-11-13"},
-    {"Station_Number": "2260500", "norm": 0.1077947706, "date": "2023-11-14"},
-    {"Station_Number": "2260500", "norm": 0.1036013814, "date": "2023-11-15"},
-    {"Station_Number": "2260500", "norm": 0.1025160335, "date": "2023-11-16"},
-    {"Station_Number": "2260500", "norm": 0.100197336, "date": "2023-11-17"},
-    {"Station_Number": "2260500", "norm": 0.1039960533, "date": "2023-11-18"},
-    {"Station_Number": "2260500", "norm": 0.1122348298, "date": "2023-11-19"},
-    {"Station_Number": "2260500", "norm": 0.1183522447, "date": "2023-11-20"},
-    {"Station_Number": "2260500", "norm": 0.1311790824, "date": "2023-11-21"},
-    {"Station_Number": "2260500", "norm": 0.1406018747, "date": "2023-11-22"},
-    {"Station_Number": "2260500", "norm": 0.1484459793, "date": "2023-11-23"},
-    {"Station_Number": "2260500", "norm": 0.1518993587, "date": "2023-11-24"},
-    {"Station_Number": "2260500", "norm": 0.1325604341, "date": "2023-11-25"},
-    {"Station_Number": "2260500", "norm": 0.1134681796, "date": "2023-11-26"},
-    {"Station_Number": "2260500", "norm": 0.1048840651, "date": "2023-11-27"},
-    {"Station_Number": "2260500", "norm": 0.0961026147, "date": "2023-11-28"},
-    {"Station_Number": "2260500", "norm": 0.094573261, "date": "2023-11-29"},
-    {"Station_Number": "2260500", "norm": 0.0933399112, "date": "2023-11-30"},
-    {"Station_Number": "2260500", "norm": 0.0897878638, "date": "2023-12-01"},
-    {"Station_Number": "2260500", "norm": 0.0868278244, "date": "2023-12-02"},
-    {"Station_Number": "2260500", "norm": 0.0824864332, "date": "2023-12-03"},
-    {"Station_Number": "2260500", "norm": 0.0799210656, "date": "2023-12-04"},
-    {"Station_Number": "2260500", "norm": 0.0773556981, "date": "2023-12-05"},
-    {"Station_Number": "2260500", "norm": 0.0749876665, "date": "2023-12-06"},
-    {"Station_Number": "2260500", "norm": 0.0689195856, "date": "2023-12-07"},
-    {"Station_Number": "2260500", "norm": 0.0656635422, "date": "2023-12-08"},
-    {"Station_Number": "2260500", "norm": 0.0648741983, "date": "2023-12-09"},
-    {"Station_Number": "2260500", "norm": 0.0647261963, "date": "2023-12-10"},
-    {"Station_Number": "2260500", "norm": 0.0645781944, "date": "2023-12-11"},
-    {"Station_Number": "2260500", "norm": 0.0663048841, "date": "2023-12-12"},
-    {"Station_Number": "2260500", "norm": 0.0699062654, "date": "2023-12-13"},
-    {"Station_Number": "2260500", "norm": 0.0767636902, "date": "2023-12-14"},
-    {"Station_Number": "2260500", "norm": 0.083473113, "date": "2023-12-15"},
-    {"Station_Number": "2260500", "norm": 0.0789343858, "date": "2023-12-16"},
-    {"Station_Number": "2260500", "norm": 0.0706462753, "date": "2023-12-17"},
-    {"Station_Number": "2260500", "norm": 0.0660582141, "date": "2023-12-18"},
-    {"Station_Number": "2260500", "norm": 0.0629995067, "date": "2023-12-19"},
-    {"Station_Number": "2260500", "norm": 0.0631475086, "date": "2023-12-20"},
-    {"Station_Number": "2260500", "norm": 0.0629995067, "date": "2023-12-21"},
-    {"Station_Number": "2260500", "norm": 0.0606314751, "date": "2023-12-22"},
-    {"Station_Number": "2260500", "norm": 0.0574740997, "date": "2023-12-23"},
-    {"Station_Number": "2260500", "norm": 0.0550074001, "date": "2023-12-24"},
-    {"Station_Number": "2260500", "norm": 0.0527380365, "date": "2023-12-25"},
-    {"Station_Number": "2260500", "norm": 0.0515540207, "date": "2023-12-26"},
-    {"Station_Number": "2260500", "norm": 0.0509126788, "date": "2023-12-27"},
-    {"Station_Number": "2260500", "norm": 0.0507646769, "date": "2023-12-28"},
-    {"Station_Number": "2260500", "norm": 0.0507646769, "date": "2023-12-29"},
-    {"Station_Number": "2260500", "norm": 0.0511593488, "date": "2023-12-30"},
-    {"Station_Number": "2260500", "norm": 0.0492353231, "date": "2023-12-31"},
-    {"Station_Number": "2260600", "norm": 0.0507395668, "date": "2020-01-01"},
-    {"Station_Number": "2260600", "norm": 0.0502905441, "date": "2020-01-02"},
-    {"Station_Number": "2260600", "norm": 0.0498679345, "date": "2020-01-03"},
-    {"Station_Number": "2260600", "norm": 0.0492604332, "date": "2020-01-04"},
-    {"Station_Number": "2260600", "norm": 0.0490227153, "date": "2020-01-05"},
-    {"Station_Number": "2260600", "norm": 0.0491811939, "date": "2020-01-06"},
-    {"Station_Number": "2260600", "norm": 0.0507395668, "date": "2020-01-07"},
-    {"Station_Number": "2260600", "norm": 0.0503961965, "date": "2020-01-08"},
-    {"Station_Number": "2260600", "norm": 0.0496038035, "date": "2020-01-09"},
-    {"Station_Number": "2260600", "norm": 0.0497886952, "date": "2020-01-10"},
-    {"Station_Number": "2260600", "norm": 0.0511621764, "date": "2020-01-11"},
-    {"Station_Number": "2260600", "norm": 0.0542260961, "date": "2020-01-12"},
-    {"Station_Number": "2260600", "norm": 0.0581880613, "date": "2020-01-13"},
-    {"Station_Number": "2260600", "norm": 0.0614632858, "date": "2020-01-14"},
-    {"Station_Number": "2260600", "norm": 0.062836767, "date": "2020-01-15"},
-    {"Station_Number": "2260600", "norm": 0.0600105652, "date": "2020-01-16"},
-    {"Station_Number": "2260600", "norm": 0.057342842, "date": "2020-01-17"},
-    {"Station_Number": "2260600", "norm": 0.0548600106, "date": "2020-01-18"},
-    {"Station_Number": "2260600", "norm": 0.053671421, "date": "2020-01-19"},
-    {"Station_Number": "2260600", "norm": 0.0525092446, "date": "2020-01-20"},
-    {"Station_Number": "2260600", "norm": 0.0511621764, "date": "2020-01-21"},
-    {"Station_Number": "2260600", "norm": 0.0493660856, "date": "2020-01-22"},
-    {"Station_Number": "2260600", "norm": 0.0469889065, "date": "2020-01-23"},
-    {"Station_Number": "2260600", "norm": 0.0459852087, "date": "2020-01-24"},
-    {"Station_Number": "2260600", "norm": 0.0452456418, "date": "2020-01-25"},
-    {"Station_Number": "2260600", "norm": 0.0437929213, "date": "2020-01-26"},
-    {"Station_Number": "2260600", "norm": 0.0428420497, "date": "2020-01-27"},
-    {"Station_Number": "2260600", "norm": 0.0423666138, "date": "2020-01-28"},
-    {"Station_Number": "2260600", "norm": 0.0421288959, "date": "2020-01-29"},
-    {"Station_Number": "2260600", "norm": 0.0414421553, "date": "2020-01-30"},
-    {"Station_Number": "2260600", "norm": 0.0432382462, "date": "2020-01-31"},
-    {"Station_Number": "2260600", "norm": 0.0449286846, "date": "2020-02-01"},
-    {"Station_Number": "2260600", "norm": 0.044770206, "date": "2020-02-02"},
-    {"Station_Number": "2260600", "norm": 0.0440306392, "date": "2020-02-03"},
-    {"Station_Number": "2260600", "norm": 0.0434759641, "date": "2020-02-04"},
-    {"Station_Number": "2260600", "norm": 0.0426043317, "date": "2020-02-05"},
-    {"Station_Number": "2260600", "norm": 0.041891178, "date": "2020-02-06"},
-    {"Station_Number": "2260600", "norm": 0.0412044374, "date": "2020-02-07"},
-    {"Station_Number": "2260600", "norm": 0.0409667195, "date": "2020-02-08"},
-    {"Station_Number": "2260600", "norm": 0.0407290016, "date": "2020-02-09"},
-    {"Station_Number": "2260600", "norm": 0.0399101955, "date": "2020-02-10"},
-    {"Station_Number": "2260600", "norm": 0.0393555203, "date": "2020-02-11"},
-    {"Station_Number": "2260600", "norm": 0.0391442155, "date": "2020-02-12"},
-    {"Station_Number": "2260600", "norm": 0.0383782356, "date": "2020-02-13"},
-    {"Station_Number": "2260600", "norm": 0.0376650819, "date": "2020-02-14"},
-    {"Station_Number": "2260600", "norm": 0.0373745378, "date": "2020-02-15"},
-    {"Station_Number": "2260600", "norm": 0.0371368199, "date": "2020-02-16"},
-    {"Station_Number": "2260600", "norm": 0.0369255151, "date": "2020-02-17"},
-    {"Station_Number": "2260600", "norm": 0.0367142102, "date": "2020-02-18"},
-    {"Station_Number": "2260600", "norm": 0.0363444268, "date": "2020-02-19"},
-    {"Station_Number": "2260600", "norm": 0.0359746434, "date": "2020-02-20"},
-    {"Station_Number": "2260600", "norm": 0.0355520338, "date": "2020-02-21"},
-    {"Station_Number": "2260600", "norm": 0.0351294242, "date": "2020-02-22"},
-    {"Station_Number": "2260600", "norm": 0.0347860539, "date": "2020-02-23"},
-    {"Station_Number": "2260600", "norm": 0.0345747491, "date": "2020-02-24"},
-    {"Station_Number": "2260600", "norm": 0.035340729, "date": "2020-02-25"},
-    {"Station_Number": "2260600", "norm": 0.0361859482, "date": "2020-02-26"},
-    {"Station_Number": "2260600", "norm": 0.0361859482, "date": "2020-02-27"},
-    {"Station_Number": "2260600", "norm": 0.0358425779, "date": "2020-02-28"},
-    {"Station_Number": "2260600", "norm": 0.0357105124, "date": "2020-02-29"},
-    {"Station_Number": "2260600", "norm": 0.0362651875, "date": "2020-03-01"},
-    {"Station_Number": "2260600", "norm": 0.0358425779, "date": "2020-03-02"},
-    {"Station_Number": "2260600", "norm": 0.0354199683, "date": "2020-03-03"},
-    {"Station_Number": "2260600", "norm": 0.0349973587, "date": "2020-03-04"},
-    {"Station_Number": "2260600", "norm": 0.0342313788, "date": "2020-03-05"},
-    {"Station_Number": "2260600", "norm": 0.0335446381, "date": "2020-03-06"},
-    {"Station_Number": "2260600", "norm": 0.0337559429, "date": "2020-03-07"},
-    {"Station_Number": "2260600", "norm": 0.0366349709, "date": "2020-03-08"},
-    {"Station_Number": "2260600", "norm": 0.0390649762, "date": "2020-03-09"},
-    {"Station_Number": "2260600", "norm": 0.0397517169, "date": "2020-03-10"},
-    {"Station_Number": "2260600", "norm": 0.0380876915, "date": "2020-03-11"},
-    {"Station_Number": "2260600", "norm": 0.0367670365, "date": "2020-03-12"},
-    {"Station_Number": "2260600", "norm": 0.0366349709, "date": "2020-03-13"},
-    {"Station_Number": "2260600", "norm": 0.0382461701, "date": "2020-03-14"},
-    {"Station_Number": "2260600", "norm": 0.0391442155, "date": "2020-03-15"},
-    {"Station_Number": "2260600", "norm": 0.0384574749, "date": "2020-03-16"},
-    {"Station_Number": "2260600", "norm": 0.0382461701, "date": "2020-03-17"},
-    {"Station_Number": "2260600", "norm": 0.0380084522, "date": "2020-03-18"},
-    {"Station_Number": "2260600", "norm": 0.0383254094, "date": "2020-03-19"},
-    {"Station_Number": "2260600", "norm": 0.0389064976, "date": "2020-03-20"},
-    {"Station_Number": "2260600", "norm": 0.039276281, "date": "2020-03-21"},
-    {"Station_Number": "2260600", "norm": 0.0386951928, "date": "2020-03-22"},
-    {"Station_Number": "2260600", "norm": 0.037955626, "date": "2020-03-23"},
-    {"Station_Number": "2260600", "norm": 0.0370575806, "date": "2020-03-24"},
-    {"Station_Number": "2260600", "norm": 0.0367670365, "date": "2020-03-25"},
-    {"Station_Number": "2260600", "norm": 0.0371368199, "date": "2020-03-26"},
-    {"Station_Number": "2260600", "norm": 0.0375066033, "date": "2020-03-27"},
-    {"Station_Number": "2260600", "norm": 0.0382461701, "date": "2020-03-28"},
-    {"Station_Number": "2260600", "norm": 0.0375066033, "date": "2020-03-29"},
-    {"Station_Number": "2260600", "norm": 0.0365557316, "date": "2020-03-30"},
-    {"Station_Number": "2260600", "norm": 0.0357105124, "date": "2020-03-31"},
-    {"Station_Number": "2260600", "norm": 0.0347860539, "date": "2020-04-01"},
-    {"Station_Number": "2260600", "norm": 0.0345747491, "date": "2020-04-02"},
-    {"Station_Number": "2260600", "norm": 0.0351294242, "date": "2020-04-03"},
-    {"Station_Number": "2260600", "norm": 0.0358425779, "date": "2020-04-04"},
-    {"Station_Number": "2260600", "norm": 0.0354199683, "date": "2020-04-05"},
-    {"Station_Number": "2260600", "norm": 0.0352086635, "date": "2020-04-06"},
-    {"Station_Number": "2260600", "norm": 0.0368726889, "date": "2020-04-07"},
-    {"Station_Number": "2260600", "norm": 0.0409667195, "date": "2020-04-08"},
-    {"Station_Number": "2260600", "norm": 0.043713682, "date": "2020-04-09"},
-    {"Station_Number": "2260600", "norm": 0.0426835711, "date": "2020-04-10"},
-    {"Station_Number": "2260600", "norm": 0.0402007396, "date": "2020-04-11"},
-    {"Station_Number": "2260600", "norm": 0.0377971474, "date": "2020-04-12"},
-    {"Station_Number": "2260600", "norm": 0.0364236661, "date": "2020-04-13"},
-    {"Station_Number": "2260600", "norm": 0.0352879028, "date": "2020-04-14"},
-    {"Station_Number": "2260600", "norm": 0.0340993133, "date": "2020-04-15"},
-    {"Station_Number": "2260600", "norm": 0.0329371368, "date": "2020-04-16"},
-    {"Station_Number": "2260600", "norm": 0.0317221342, "date": "2020-04-17"},
-    {"Station_Number": "2260600", "norm": 0.0313259377, "date": "2020-04-18"},
-    {"Station_Number": "2260600", "norm": 0.031141046, "date": "2020-04-19"},
-    {"Station_Number": "2260600", "norm": 0.031669308, "date": "2020-04-20"},
-    {"Station_Number": "2260600", "norm": 0.0323296355, "date": "2020-04-21"},
-    {"Station_Number": "2260600", "norm": 0.0323824617, "date": "2020-04-22"},
-    {"Station_Number": "2260600", "norm": 0.032725832, "date": "2020-04-23"},
-    {"Station_Number": "2260600", "norm": 0.0335446381, "date": "2020-04-24"},
-    {"Station_Number": "2260600", "norm": 0.0343634443, "date": "2020-04-25"},
-    {"Station_Number": "2260600", "norm": 0.0362123613, "date": "2020-04-26"},
-    {"Station_Number": "2260600", "norm": 0.0406497623, "date": "2020-04-27"},
-    {"Station_Number": "2260600", "norm": 0.0445324881, "date": "2020-04-28"},
-    {"Station_Number": "2260600", "norm": 0.0482567353, "date": "2020-04-29"},
-    {"Station_Number": "2260600", "norm": 0.052086635, "date": "2020-04-30"},
-    {"Station_Number": "2260600", "norm": 0.0562334918, "date": "2020-05-01"},
-    {"Station_Number": "2260600", "norm": 0.0587427364, "date": "2020-05-02"},
-    {"Station_Number": "2260600", "norm": 0.0599049128, "date": "2020-05-03"},
-    {"Station_Number": "2260600", "norm": 0.0604860011, "date": "2020-05-04"},
-    {"Station_Number": "2260600", "norm": 0.0599049128, "date": "2020-05-05"},
-    {"Station_Number": "2260600", "norm": 0.0587427364, "date": "2020-05-06"},
-    {"Station_Number": "2260600", "norm": 0.0576333862, "date": "2020-05-07"},
-    {"Station_Number": "2260600", "norm": 0.0596407818, "date": "2020-05-08"},
-    {"Station_Number": "2260600", "norm": 0.064923402, "date": "2020-05-09"},
-    {"Station_Number": "2260600", "norm": 0.0670628632, "date": "2020-05-10"},
-    {"Station_Number": "2260600", "norm": 0.0652139461, "date": "2020-05-11"},
-    {"Station_Number": "2260600", "norm": 0.0616481775, "date": "2020-05-12"},
-    {"Station_Number": "2260600", "norm": 0.0599049128, "date": "2020-05-13"},
-    {"Station_Number": "2260600", "norm": 0.0587427364, "date": "2020-05-14"},
-    {"Station_Number": "2260600", "norm": 0.0584521923, "date": "2020-05-15"},
-    {"Station_Number": "2260600", "norm": 0.0596143687, "date": "2020-05-16"},
-    {"Station_Number": "2260600", "norm": 0.0601954569, "date": "2020-05-17"},
-    {"Station_Number": "2260600", "norm": 0.0590332805, "date": "2020-05-18"},
-    {"Station_Number": "2260600", "norm": 0.0568674062, "date": "2020-05-19"},
-    {"Station_Number": "2260600", "norm": 0.0545958796, "date": "2020-05-20"},
-    {"Station_Number": "2260600", "norm": 0.0532223983, "date": "2020-05-21"},
-    {"Station_Number": "2260600", "norm": 0.0546751189, "date": "2020-05-22"},
-    {"Station_Number": "2260600", "norm": 0.0590332805, "date": "2020-05-23"},
-    {"Station_Number": "2260600", "norm": 0.0601954569, "date": "2020-05-24"},
-    {"Station_Number": "2260600", "norm": 0.0596143687, "date": "2020-05-25"},
-    {"Station_Number": "2260600", "norm": 0.0618594823, "date": "2020-05-26"},
-    {"Station_Number": "2260600", "norm": 0.0623349181, "date": "2020-05-27"},
-    {"Station_Number": "2260600", "norm": 0.0622292657, "date": "2020-05-28"},
-    {"Station_Number": "2260600", "norm": 0.0666666667, "date": "2020-05-29"},
-    {"Station_Number": "2260600", "norm": 0.0837295298, "date": "2020-05-30"},
-    {"Station_Number": "2260600", "norm": 0.1088483888, "date": "2020-05-31"},
-    {"Station_Number": "2260600", "norm": 0.1521658743, "date": "2020-06-01"},
-    {"Station_Number": "2260600", "norm": 0.1871104068, "date": "2020-06-02"},
-    {"Station_Number": "2260600", "norm": 0.2089276281, "date": "2020-06-03"},
-    {"Station_Number": "2260600", "norm": 0.2247226624, "date": "2020-06-04"},
-    {"Station_Number": "2260600", "norm": 0.2298996302, "date": "2020-06-05"},
-    {"Station_Number": "2260600", "norm": 0.222239831, "date": "2020-06-06"},
-    {"Station_Number": "2260600", "norm": 0.203671421, "date": "2020-06-07"},
-    {"Station_Number": "2260600", "norm": 0.1811938722, "date": "2020-06-08"},
-    {"Station_Number": "2260600", "norm": 0.1622556788, "date": "2020-06-09"},
-    {"Station_Number": "2260600", "norm": 0.1510301109, "date": "2020-06-10"},
-    {"Station_Number": "2260600", "norm": 0.1475964078, "date": "2020-06-11"},
-    {"Station_Number": "2260600", "norm": 0.1515319599, "date": "2020-06-12"},
-    {"Station_Number": "2260600", "norm": 0.1639725304, "date": "2020-06-13"},
-    {"Station_Number": "2260600", "norm": 0.1707606973, "date": "2020-06-14"},
-    {"Station_Number": "2260600", "norm": 0.1751980983, "date": "2020-06-15"},
-    {"Station_Number": "2260600", "norm": 0.1751980983, "date": "2020-06-16"},
-    {"Station_Number": "2260600", "norm": 0.1711304807, "date": "2020-06-17"},
-    {"Station_Number": "2260600", "norm": 0.1707606973, "date": "2020-06-18"},
-    {"Station_Number": "2260600", "norm": 0.1865557316, "date": "2020-06-19"},
-    {"Station_Number": "2260600", "norm": 0.2127839408, "date": "2020-06-20"},
-    {"Station_Number": "2260600", "norm": 0.2334918119, "date": "2020-06-21"},
-    {"Station_Number": "2260600", "norm": 0.2509508716, "date": "2020-06-22"},
-    {"Station_Number": "2260600", "norm": 0.2763602747, "date": "2020-06-23"},
-    {"Station_Number": "2260600", "norm": 0.3098256735, "date": "2020-06-24"},
-    {"Station_Number": "2260600", "norm": 0.3460116218, "date": "2020-06-25"},
-    {"Station_Number": "2260600", "norm": 0.3790279979, "date": "2020-06-26"},
-    {"Station_Number": "2260600", "norm": 0.41098785, "date": "2020-06-27"},
-    {"Station_Number": "2260600", "norm": 0.4321183307, "date": "2020-06-28"},
-    {"Station_Number": "2260600", "norm": 0.4455890122, "date": "2020-06-29"},
-    {"Station_Number": "2260600", "norm": 0.4550977285, "date": "2020-06-30"},
-    {"Station_Number": "2260600", "norm": 0.4610935024, "date": "2020-07-01"},
-    {"Station_Number": "2260600", "norm": 0.4647913365, "date": "2020-07-02"},
-    {"Station_Number": "2260600", "norm": 0.4656629688, "date": "2020-07-03"},
-    {"Station_Number": "2260600", "norm": 0.4656629688, "date": "2020-07-04"},
-    {"Station_Number": "2260600", "norm": 0.4669836239, "date": "2020-07-05"},
-    {"Station_Number": "2260600", "norm": 0.4734020074, "date": "2020-07-06"},
-    {"Station_Number": "2260600", "norm": 0.4804543053, "date": "2020-07-07"},
-    {"Station_Number": "2260600", "norm": 0.4904120444, "date": "2020-07-08"},
-    {"Station_Number": "2260600", "norm": 0.5012414157, "date": "2020-07-09"},
-    {"Station_Number": "2260600", "norm": 0.5104860011, "date": "2020-07-10"},
-    {"Station_Number": "2260600", "norm": 0.5208663497, "date": "2020-07-11"},
-    {"Station_Number": "2260600", "norm": 0.5326730058, "date": "2020-07-12"},
-    {"Station_Number": "2260600", "norm": 0.5470153196, "date": "2020-07-13"},
-    {"Station_Number": "2260600", "norm": 0.5635763339, "date": "2020-07-14"},
-    {"Station_Number": "2260600", "norm": 0.5808240887, "date": "2020-07-15"},
-    {"Station_Number": "2260600", "norm": 0.5967511886, "date": "2020-07-16"},
-    {"Station_Number": "2260600", "norm": 0.6120707871, "date": "2020-07-17"},
-    {"Station_Number": "2260600", "norm": 0.6349709456, "date": "2020-07-18"},
-    {"Station_Number": "2260600", "norm": 0.6643687269, "date": "2020-07-19"},
-    {"Station_Number": "2260600", "norm": 0.6996830428, "date": "2020-07-20"},
-    {"Station_Number": "2260600", "norm": 0.736133122, "date": "2020-07-21"},
-    {"Station_Number": "2260600", "norm": 0.7685419968, "date": "2020-07-22"},
-    {"Station_Number": "2260600", "norm": 0.7996038035, "date": "2020-07-23"},
-    {"Station_Number": "2260600", "norm": 0.8147649234, "date": "2020-07-24"},
-    {"Station_Number": "2260600", "norm": 0.8278658214, "date": "2020-07-25"},
-    {"Station_Number": "2260600", "norm": 0.8371104068, "date": "2020-07-26"},
-    {"Station_Number": "2260600", "norm": 0.8545430534, "date": "2020-07-27"},
-    {"Station_Number": "2260600", "norm": 0.8797411516, "date": "2020-07-28"},
-    {"Station_Number": "2260600", "norm": 0.9096671949, "date": "2020-07-29"},
-    {"Station_Number": "2260600", "norm": 0.9396988906, "date": "2020-07-30"},
-    {"Station_Number": "2260600", "norm": 0.963100898, "date": "2020-07-31"},
-    {"Station_Number": "2260600", "norm": 0.9731378764, "date": "2020-08-01"},
-    {"Station_Number": "2260600", "norm": 0.9764923402, "date": "2020-08-02"},
-    {"Station_Number": "2260600", "norm": 0.9697041733, "date": "2020-08-03"},
-    {"Station_Number": "2260600", "norm": 0.9592445853, "date": "2020-08-04"},
-    {"Station_Number": "2260600", "norm": 0.9354727945, "date": "2020-08-05"},
-    {"Station_Number": "2260600", "norm": 0.8840464871, "date": "2020-08-06"},
-    {"Station_Number": "2260600", "norm": 0.8014527205, "date": "2020-08-07"},
-    {"Station_Number": "2260600", "norm": 0.7121764395, "date": "2020-08-08"},
-    {"Station_Number": "2260600", "norm": 0.6308240887, "date": "2020-08-09"},
-    {"Station_Number": "2260600", "norm": 0.566745906, "date": "2020-08-10"},
-    {"Station_Number": "2260600", "norm": 0.5048335975, "date": "2020-08-11"},
-    {"Station_Number": "2260600", "norm": 0.4545694665, "date": "2020-08-12"},
-    {"Station_Number": "2260600", "norm": 0.4284997359, "date": "2020-08-13"},
-    {"Station_Number": "2260600", "norm": 0.4330956154, "date": "2020-08-14"},
-    {"Station_Number": "2260600", "norm": 0.4641574221, "date": "2020-08-15"},
-    {"Station_Number": "2260600", "norm": 0.5044902272, "date": "2020-08-16"},
-    {"Station_Number": "2260600", "norm": 0.5440306392, "date": "2020-08-17"},
-    {"Station_Number": "2260600", "norm": 0.5826730058, "date": "2020-08-18"},
-    {"Station_Number": "2260600", "norm": 0.6288959324, "date": "2020-08-19"},
-    {"Station_Number": "2260600", "norm": 0.6651611199, "date": "2020-08-20"},
-    {"Station_Number": "2260600", "norm": 0.7031959852, "date": "2020-08-21"},
-    {"Station_Number": "2260600", "norm": 0.7373745378, "date": "2020-08-22"},
-    {"Station_Number": "2260600", "norm": 0.7762017961, "date": "2020-08-23"},
-    {"Station_Number": "2260600", "norm": 0.8234812467, "date": "2020-08-24"},
-    {"Station_Number": "2260600", "norm": 0.8698626519, "date": "2020-08-25"},
-    {"Station_Number": "2260600", "norm": 0.9246434231, "date": "2020-08-26"},
-    {"Station_Number": "2260600", "norm": 0.9736661384, "date": "2020-08-27"},
-    {"Station_Number": "2260600", "norm": 0.9965662969, "date": "2020-08-28"},
-    {"Station_Number": "2260600", "norm": 1.0, "date": "2020-08-29"},
-    {"Station_Number": "2260600", "norm": 0.991098785, "date": "2020-08-30"},
-    {"Station_Number": "2260600", "norm": 0.9587955626, "date": "2020-08-31"},
-    {"Station_Number": "2260600", "norm": 0.9059693608, "date": "2020-09-01"},
-    {"Station_Number": "2260600", "norm": 0.8341257264, "date": "2020-09-02"},
-    {"Station_Number": "2260600", "norm": 0.7531167459, "date": "2020-09-03"},
-    {"Station_Number": "2260600", "norm": 0.6811146329, "date": "2020-09-04"},
-    {"Station_Number": "2260600", "norm": 0.6375330164, "date": "2020-09-05"},
-    {"Station_Number": "2260600", "norm": 0.6184099313, "date": "2020-09-06"},
-    {"Station_Number": "2260600", "norm": 0.596328579, "date": "2020-09-07"},
-    {"Station_Number": "2260600", "norm": 0.568858954, "date": "2020-09-08"},
-    {"Station_Number": "2260600", "norm": 0.5381141046, "date": "2020-09-09"},
-    {"Station_Number": "2260600", "norm": 0.498679345, "date": "2020-09-10"},
-    {"Station_Number": "2260600", "norm": 0.4586106709, "date": "2020-09-11"},
-    {"Station_Number": "2260600", "norm": 0.4337031167, "date": "2020-09-12"},
-    {"Station_Number": "2260600", "norm": 0.4199683043, "date": "2020-09-13"},
-    {"Station_Number": "2260600", "norm": 0.412836767, "date": "2020-09-14"},
-    {"Station_Number": "2260600", "norm": 0.412836767, "date": "2020-09-15"},
-    {"Station_Number": "2260600", "norm": 0.4231378764, "date": "2020-09-16"},
-    {"Station_Number": "2260600", "norm": 0.4464606445, "date": "2020-09-17"},
-    {"Station_Number": "2260600", "norm": 0.4769413629, "date": "2020-09-18"},
-    {"Station_Number": "2260600", "norm": 0.509165346, "date": "2020-09-19"},
-    {"Station_Number": "2260600", "norm": 0.5432382462, "date": "2020-09-20"},
-    {"Station_Number": "2260600", "norm": 0.5751980983, "date": "2020-09-21"},
-    {"Station_Number": "2260600", "norm": 0.6062599049, "date": "2020-09-22"},
-    {"Station_Number": "2260600", "norm": 0.6296883254, "date": "2020-09-23"},
-    {"Station_Number": "2260600", "norm": 0.6368198627, "date": "2020-09-24"},
-    {"Station_Number": "2260600", "norm": 0.6458795563, "date": "2020-09-25"},
-    {"Station_Number": "2260600", "norm": 0.655758056, "date": "2020-09-26"},
-    {"Station_Number": "2260600", "norm": 0.6623613312, "date": "2020-09-27"},
-    {"Station_Number": "2260600", "norm": 0.6611991548, "date": "2020-09-28"},
-    {"Station_Number": "2260600", "norm": 0.6585578447, "date": "2020-09-29"},
-    {"Station_Number": "2260600", "norm": 0.6635763339, "date": "2020-09-30"},
-    {"Station_Number": "2260600", "norm": 0.6818013735, "date": "2020-10-01"},
-    {"Station_Number": "2260600", "norm": 0.7104331749, "date": "2020-10-02"},
-    {"Station_Number": "2260600", "norm": 0.7427363973, "date": "2020-10-03"},
-    {"Station_Number": "2260600", "norm": 0.7807712625, "date": "2020-10-04"},
-    {"Station_Number": "2260600", "norm": 0.8195985209, "date": "2020-10-05"},
-    {"Station_Number": "2260600", "norm": 0.8631801373, "date": "2020-10-06"},
-    {"Station_Number": "2260600", "norm": 0.8934759641, "date": "2020-10-07"},
-    {"Station_Number": "2260600", "norm": 0.9078182779, "date": "2020-10-08"},
-    {"Station_Number": "2260600", "norm": 0.9027205494, "date": "2020-10-09"},
-    {"Station_Number": "2260600", "norm": 0.8775224511, "date": "2020-10-10"},
-    {"Station_Number": "2260600", "norm": 0.8372160592, "date": "2020-10-11"},
-    {"Station_Number": "2260600", "norm": 0.7914157422, "date": "2020-10-12"},
-    {"Station_Number": "2260600", "norm": 0.7414157422, "date": "2020-10-13"},
-    {"Station_Number": "2260600", "norm": 0.697649234, "date": "2020-10-14"},
-    {"Station_Number": "2260600", "norm": 0.6474643423, "date": "2020-10-15"},
-    {"Station_Number": "2260600", "norm": 0.6008188061, "date": "2020-10-16"},
-    {"Station_Number": "2260600", "norm": 0.5436608558, "date": "2020-10-17"},
-    {"Station_Number": "2260600", "norm": 0.4837031167, "date": "2020-10-18"},
-    {"Station_Number": "2260600", "norm": 0.4255942948, "date": "2020-10-19"},
-    {"Station_Number": "2260600", "norm": 0.3751452721, "date": "2020-10-20"},
-    {"Station_Number": "2260600", "norm": 0.3404648706, "date": "2020-10-21"},
-    {"Station_Number": "2260600", "norm": 0.3117538299, "date": "2020-10-22"},
-    {"Station_Number": "2260600", "norm": 0.2946909667, "date": "2020-10-23"},
-    {"Station_Number": "2260600", "norm": 0.2933703117, "date": "2020-10-24"},
-    {"Station_Number": "2260600", "norm": 0.3098256735, "date": "2020-10-25"},
-    {"Station_Number": "2260600", "norm": 0.3681193872, "date": "2020-10-26"},
-    {"Station_Number": "2260600", "norm": 0.4272847332, "date": "2020-10-27"},
-    {"Station_Number": "2260600", "norm": 0.5417326994, "date": "2020-10-28"},
-    {"Station_Number": "2260600", "norm": 0.6030110935, "date": "2020-10-29"},
-    {"Station_Number": "2260600", "norm": 0.6512678288, "date": "2020-10-30"},
-    {"Station_Number": "2260600", "norm": 0.6893026941, "date": "2020-10-31"},
-    {"Station_Number": "2260600", "norm": 0.7128103539, "date": "2020-11-01"},
-    {"Station_Number": "2260600", "norm": 0.7225832013, "date": "2020-11-02"},
-    {"Station_Number": "2260600", "norm": 0.713602747, "date": "2020-11-03"},
-    {"Station_Number": "2260600", "norm": 0.6826994189, "date": "2020-11-04"},
-    {"Station_Number": "2260600", "norm": 0.6372688854, "date": "2020-11-05"},
-    {"Station_Number": "2260600", "norm": 0.5759904913, "date": "2020-11-06"},
-    {"Station_Number": "2260600", "norm": 0.5218436344, "date": "2020-11-07"},
-    {"Station_Number": "2260600", "norm": 0.4962229266, "date": "2020-11-08"},
-    {"Station_Number": "2260600", "norm": 0.4784204966, "date": "2020-11-09"},
-    {"Station_Number": "2260600", "norm": 0.4549128368, "date": "2020-11-10"},
-    {"Station_Number": "2260600", "norm": 0.4300845219, "date": "2020-11-11"},
-    {"Station_Number": "2260600", "norm": 0.3999735869, "date": "2020-11-12"},
-    {"Station_Number": "2260600", "norm": 0.3557844691, "date": "2020-11-13"},
-    {"Station_Number": "2260600", "norm": 0.3196777602, "date": "2020-11-14"},
-    {"Station_Number": "2260600", "norm": 0.2886159535, "date": "2020-11-15"},
-    {"Station_Number": "2260600", "norm": 0.265451664, "date": "2020-11-16"},
-    {"Station_Number": "2260600", "norm": 0.2494189118, "date": "2020-11-17"},
-    {"Station_Number": "2260600", "norm": 0.2341257264, "date": "2020-11-18"},
-    {"Station_Number": "2260600", "norm": 0.2218172213, "date": "2020-11-19"},
-    {"Station_Number": "2260600", "norm": 0.2117010037, "date": "2020-11-20"},
-    {"Station_Number": "2260600", "norm": 0.2020602219, "date": "2020-11-21"},
-    {"Station_Number": "2260600", "norm": 0.1928684628, "date": "2020-11-22"},
-    {"Station_Number": "2260600", "norm": 0.1844690967, "date": "2020-11-23"},
-    {"Station_Number": "2260600", "norm": 0.175911252, "date": "2020-11-24"},
-    {"Station_Number": "2260600", "norm": 0.170945589, "date": "2020-11-25"},
-    {"Station_Number": "2260600", "norm": 0.1670892763, "date": "2020-11-26"},
-    {"Station_Number": "2260600", "norm": 0.1636291601, "date": "2020-11-27"},
-    {"Station_Number": "2260600", "norm": 0.1590332805, "date": "2020-11-28"},
-    {"Station_Number": "2260600", "norm": 0.1553354464, "date": "2020-11-29"},
-    {"Station_Number": "2260600", "norm": 0.1511885895, "date": "2020-11-30"},
-    {"Station_Number": "2260600", "norm": 0.1468040148, "date": "2020-12-01"},
-    {"Station_Number": "2260600", "norm": 0.1423137876, "date": "2020-12-02"},
-    {"Station_Number": "2260600", "norm": 0.1385367142, "date": "2020-12-03"},
-    {"Station_Number": "2260600", "norm": 0.1357633386, "date": "2020-12-04"},
-    {"Station_Number": "2260600", "norm": 0.1317749604, "date": "2020-12-05"},
-    {"Station_Number": "2260600", "norm": 0.127997887, "date": "2020-12-06"},
-    {"Station_Number": "2260600", "norm": 0.1258055996, "date": "2020-12-07"},
-    {"Station_Number": "2260600", "norm": 0.123296355, "date": "2020-12-08"},
-    {"Station_Number": "2260600", "norm": 0.120681458, "date": "2020-12-09"},
-    {"Station_Number": "2260600", "norm": 0.1176703645, "date": "2020-12-10"},
-    {"Station_Number": "2260600", "norm": 0.1147120972, "date": "2020-12-11"},
-    {"Station_Number": "2260600", "norm": 0.111251981, "date": "2020-12-12"},
-    {"Station_Number": "2260600", "norm": 0.1079767565, "date": "2020-12-13"},
-    {"Station_Number": "2260600", "norm": 0.1063655573, "date": "2020-12-14"},
-    {"Station_Number": "2260600", "norm": 0.1039619651, "date": "2020-12-15"},
-    {"Station_Number": "2260600", "norm": 0.1009508716, "date": "2020-12-16"},
-    {"Station_Number": "2260600", "norm": 0.0983888008, "date": "2020-12-17"},
-    {"Station_Number": "2260600", "norm": 0.0977548864, "date": "2020-12-18"},
-    {"Station_Number": "2260600", "norm": 0.0962229266, "date": "2020-12-19"},
-    {"Station_Number": "2260600", "norm": 0.0948230322, "date": "2020-12-20"},
-    {"Station_Number": "2260600", "norm": 0.0929477021, "date": "2020-12-21"},
-    {"Station_Number": "2260600", "norm": 0.0914685684, "date": "2020-12-22"},
-    {"Station_Number": "2260600", "norm": 0.0895139989, "date": "2020-12-23"},
-    {"Station_Number": "2260600", "norm": 0.0880876915, "date": "2020-12-24"},
-    {"Station_Number": "2260600", "norm": 0.0862916006, "date": "2020-12-25"},
-    {"Station_Number": "2260600", "norm": 0.0852350766, "date": "2020-12-26"},
-    {"Station_Number": "2260600", "norm": 0.0838087691, "date": "2020-12-27"},
-    {"Station_Number": "2260600", "norm": 0.0827786582, "date": "2020-12-28"},
-    {"Station_Number": "2260600", "norm": 0.0812731115, "date": "2020-12-29"},
-    {"Station_Number": "2260600", "norm": 0.0803486529, "date": "2020-12-30"},
-    {"Station_Number": "2260600", "norm": 0.0798996302, "date": "2020-12-31"},
-    {"Station_Number": "2260600", "norm": 0.0887588031, "date": "2021-01-01"},
-    {"Station_Number": "2260600", "norm": 0.087748492, "date": "2021-01-02"},
-    {"Station_Number": "2260600", "norm": 0.0852524292, "date": "2021-01-03"},
-    {"Station_Number": "2260600", "norm": 0.0837666776, "date": "2021-01-04"},
-    {"Station_Number": "2260600", "norm": 0.0815677651, "date": "2021-01-05"},
-    {"Station_Number": "2260600", "norm": 0.0789231272, "date": "2021-01-06"},
-    {"Station_Number": "2260600", "norm": 0.0781208213, "date": "2021-01-07"},
-    {"Station_Number": "2260600", "norm": 0.0792797076, "date": "2021-01-08"},
-    {"Station_Number": "2260600", "norm": 0.0783585416, "date": "2021-01-09"},
-    {"Station_Number": "2260600", "norm": 0.0762487743, "date": "2021-01-10"},
-    {"Station_Number": "2260600", "norm": 0.0744064422, "date": "2021-01-11"},
-    {"Station_Number": "2260600", "norm": 0.0726829703, "date": "2021-01-12"},
-    {"Station_Number": "2260600", "norm": 0.0715537991, "date": "2021-01-13"},
-    {"Station_Number": "2260600", "norm": 0.0703651978, "date": "2021-01-14"},
-    {"Station_Number": "2260600", "norm": 0.0690280213, "date": "2021-01-15"},
-    {"Station_Number": "2260600", "norm": 0.0677205598, "date": "2021-01-16"},
-    {"Station_Number": "2260600", "norm": 0.0664130984, "date": "2021-01-17"},
-    {"Station_Number": "2260600", "norm": 0.0653433572, "date": "2021-01-18"},
-    {"Station_Number": "2260600", "norm": 0.0641844709, "date": "2021-01-19"},
-    {"Station_Number": "2260600", "norm": 0.0631444448, "date": "2021-01-20"},
-    {"Station_Number": "2260600", "norm": 0.0625204291, "date": "2021-01-21"},
-    {"Station_Number": "2260600", "norm": 0.0616289781, "date": "2021-01-22"},
-    {"Station_Number": "2260600", "norm": 0.0607969572, "date": "2021-01-23"},
-    {"Station_Number": "2260600", "norm": 0.0598757912, "date": "2021-01-24"},
-    {"Station_Number": "2260600", "norm": 0.0595786408, "date": "2021-01-25"},
-    {"Station_Number": "2260600", "norm": 0.0586871898, "date": "2021-01-26"},
-    {"Station_Number": "2260600", "norm": 0.0580631742, "date": "2021-01-27"},
-    {"Station_Number": "2260600", "norm": 0.0570825781, "date": "2021-01-28"},
-    {"Station_Number": "2260600", "norm": 0.0556265415, "date": "2021-01-29"},
-    {"Station_Number": "2260600", "norm": 0.0556265415, "date": "2021-01-30"},
-    {"Station_Number": "2260600", "norm": 0.0573797284, "date": "2021-01-31"},
-    {"Station_Number": "2260600", "norm": 0.0586871898, "date": "2021-02-01"},
-    {"Station_Number": "2260600", "norm": 0.0585980448, "date": "2021-02-02"},
-    {"Station_Number": "2260600", "norm": 0.0574688735, "date": "2021-02-03"},
-    {"Station_Number": "2260600", "norm": 0.0561911271, "date": "2021-02-04"},
-    {"Station_Number": "2260600", "norm": 0.0539922147, "date": "2021-02-05"},
-    {"Station_Number": "2260600", "norm": 0.0521201676, "date": "2021-02-06"},
-    {"Station_Number": "2260600", "norm": 0.0510801414, "date": "2021-02-07"},
-    {"Station_Number": "2260600", "norm": 0.0500995454, "date": "2021-02-08"},
-    {"Station_Number": "2260600", "norm": 0.0491783793, "date": "2021-02-09"},
-    {"Station_Number": "2260600", "norm": 0.0484652186, "date": "2021-02-10"},
-    {"Station_Number": "2260600", "norm": 0.047930348, "date": "2021-02-11"},
-    {"Station_Number": "2260600", "norm": 0.0473954774, "date": "2021-02-12"},
-    {"Station_Number": "2260600", "norm": 0.0464445963, "date": "2021-02-13"},
-    {"Station_Number": "2260600", "norm": 0.0453154251, "date": "2021-02-14"},
-    {"Station_Number": "2260600", "norm": 0.0445428342, "date": "2021-02-15"},
-    {"Station_Number": "2260600", "norm": 0.0437702434, "date": "2021-02-16"},
-    {"Station_Number": "2260600", "norm": 0.0435325231, "date": "2021-02-17"},
-    {"Station_Number": "2260600", "norm": 0.0430273675, "date": "2021-02-18"},
-    {"Station_Number": "2260600", "norm": 0.042522212, "date": "2021-02-19"},
-    {"Station_Number": "2260600", "norm": 0.0422844917, "date": "2021-02-20"},
-    {"Station_Number": "2260600", "norm": 0.0420467715, "date": "2021-02-21"},
-    {"Station_Number": "2260600", "norm": 0.0417793362, "date": "2021-02-22"},
-    {"Station_Number": "2260600", "norm": 0.0413038956, "date": "2021-02-23"},
-    {"Station_Number": "2260600", "norm": 0.0405610198, "date": "2021-02-24"},
-    {"Station_Number": "2260600", "norm": 0.0400855793, "date": "2021-02-25"},
-    {"Station_Number": "2260600", "norm": 0.0396101388, "date": "2021-02-26"},
-    {"Station_Number": "2260600", "norm": 0.0389861231, "date": "2021-02-27"},
-    {"Station_Number": "2260600", "norm": 0.0384215375, "date": "2021-02-28"},
-    {"Station_Number": "2260600", "norm": 0.0388375479, "date": "2021-03-01"},
-    {"Station_Number": "2260600", "norm": 0.0397587139, "date": "2021-03-02"},
-    {"Station_Number": "2260600", "norm": 0.038896978, "date": "2021-03-03"},
-    {"Station_Number": "2260600", "norm": 0.0384215375, "date": "2021-03-04"},
-    {"Station_Number": "2260600", "norm": 0.037975812, "date": "2021-03-05"},
-    {"Station_Number": "2260600", "norm": 0.0372626512, "date": "2021-03-06"},
-    {"Station_Number": "2260600", "norm": 0.0365792054, "date": "2021-03-07"},
-    {"Station_Number": "2260600", "norm": 0.0359254747, "date": "2021-03-08"},
-    {"Station_Number": "2260600", "norm": 0.0356877544, "date": "2021-03-09"},
-    {"Station_Number": "2260600", "norm": 0.0354797492, "date": "2021-03-10"},
-    {"Station_Number": "2260600", "norm": 0.0352420289, "date": "2021-03-11"},
-    {"Station_Number": "2260600", "norm": 0.0350340237, "date": "2021-03-12"},
-    {"Station_Number": "2260600", "norm": 0.0363712002, "date": "2021-03-13"},
-    {"Station_Number": "2260600", "norm": 0.0375003714, "date": "2021-03-14"},
-    {"Station_Number": "2260600", "norm": 0.0377380917, "date": "2021-03-15"},
-    {"Station_Number": "2260600", "norm": 0.0384215375, "date": "2021-03-16"},
-    {"Station_Number": "2260600", "norm": 0.0392832734, "date": "2021-03-17"},
-    {"Station_Number": "2260600", "norm": 0.0395209937, "date": "2021-03-18"},
-    {"Station_Number": "2260600", "norm": 0.0406501649, "date": "2021-03-19"},
-    {"Station_Number": "2260600", "norm": 0.0396101388, "date": "2021-03-20"},
-    {"Station_Number": "2260600", "norm": 0.0386592577, "date": "2021-03-21"},
-    {"Station_Number": "2260600", "norm": 0.037975812, "date": "2021-03-22"},
-    {"Station_Number": "2260600", "norm": 0.0375003714, "date": "2021-03-23"},
-    {"Station_Number": "2260600", "norm": 0.0370546459, "date": "2021-03-24"},
-    {"Station_Number": "2260600", "norm": 0.0365792054, "date": "2021-03-25"},
-    {"Station_Number": "2260600", "norm": 0.0361334799, "date": "2021-03-26"},
-    {"Station_Number": "2260600", "norm": 0.0356877544, "date": "2021-03-27"},
-    {"Station_Number": "2260600", "norm": 0.0352420289, "date": "2021-03-28"},
-    {"Station_Number": "2260600", "norm": 0.0347963034, "date": "2021-03-29"},
-    {"Station_Number": "2260600", "norm": 0.0342020028, "date": "2021-03-30"},
-    {"Station_Number": "2260600", "norm": 0.0336968472, "date": "2021-03-31"},
-    {"Station_Number": "2260600", "norm": 0.0332511217, "date": "2021-04-01"},
-    {"Station_Number": "2260600", "norm": 0.0326865361, "date": "2021-04-02"},
-    {"Station_Number": "2260600", "norm": 0.0321813806, "date": "2021-04-03"},
-    {"Station_Number": "2260600", "norm": 0.0317653701, "date": "2021-04-04"},
-    {"Station_Number": "2260600", "norm": 0.0318248002, "date": "2021-04-05"},
-    {"Station_Number": "2260600", "norm": 0.0324191008, "date": "2021-04-06"},
-    {"Station_Number": "2260600", "norm": 0.0321813806, "date": "2021-04-07"},
-    {"Station_Number": "2260600", "norm": 0.03170594, "date": "2021-04-08"},
-    {"Station_Number": "2260600", "norm": 0.0308144891, "date": "2021-04-09"},
-    {"Station_Number": "2260600", "norm": 0.0309333492, "date": "2021-04-10"},
-    {"Station_Number": "2260600", "norm": 0.0345882982, "date": "2021-04-11"},
-    {"Station_Number": "2260600", "norm": 0.0395507087, "date": "2021-04-12"},
-    {"Station_Number": "2260600", "norm": 0.043443378, "date": "2021-04-13"},
-    {"Station_Number": "2260600", "norm": 0.0435325231, "date": "2021-04-14"},
-    {"Station_Number": "2260600", "norm": 0.0411256054, "date": "2021-04-15"},
-    {"Station_Number": "2260600", "norm": 0.0384215375, "date": "2021-04-16"},
-    {"Station_Number": "2260600", "norm": 0.0370546459, "date": "2021-04-17"},
-    {"Station_Number": "2260600", "norm": 0.0365792054, "date": "2021-04-18"},
-    {"Station_Number": "2260600", "norm": 0.0360740499, "date": "2021-04-19"},
-    {"Station_Number": "2260600", "norm": 0.0350340237, "date": "2021-04-20"},
-    {"Station_Number": "2260600", "norm": 0.0337562773, "date": "2021-04-21"},
-    {"Station_Number": "2260600", "norm": 0.0332511217, "date": "2021-04-22"},
-    {"Station_Number": "2260600", "norm": 0.0333402668, "date": "2021-04-23"},
-    {"Station_Number": "2260600", "norm": 0.0353906041, "date": "2021-04-24"},
-    {"Station_Number": "2260600", "norm": 0.0383621074, "date": "2021-04-25"},
-    {"Station_Number": "2260600", "norm": 0.0400855793, "date": "2021-04-26"},
-    {"Station_Number": "2260600", "norm": 0.0410364603, "date": "2021-04-27"},
-    {"Station_Number": "2260600", "norm": 0.0415416159, "date": "2021-04-28"},
-    {"Station_Number": "2260600", "norm": 0.0421953466, "date": "2021-04-29"},
-    {"Station_Number": "2260600", "norm": 0.0432650878, "date": "2021-04-30"},
-    {"Station_Number": "2260600", "norm": 0.0430273675, "date": "2021-05-01"},
-    {"Station_Number": "2260600", "norm": 0.0409770303, "date": "2021-05-02"},
-    {"Station_Number": "2260600", "norm": 0.0400855793, "date": "2021-05-03"},
-    {"Station_Number": "2260600", "norm": 0.038896978, "date": "2021-05-04"},
-    {"Station_Number": "2260600", "norm": 0.0375895165, "date": "2021-05-05"},
-    {"Station_Number": "2260600", "norm": 0.0364306303, "date": "2021-05-06"},
-    {"Station_Number": "2260600", "norm": 0.0365792054, "date": "2021-05-07"},
-    {"Station_Number": "2260600", "norm": 0.0372626512, "date": "2021-05-08"},
-    {"Station_Number": "2260600", "norm": 0.0378866669, "date": "2021-05-09"},
-    {"Station_Number": "2260600", "norm": 0.0387484028, "date": "2021-05-10"},
-    {"Station_Number": "2260600", "norm": 0.0376489466, "date": "2021-05-11"},
-    {"Station_Number": "2260600", "norm": 0.0383621074, "date": "2021-05-12"},
-    {"Station_Number": "2260600", "norm": 0.0411256054, "date": "2021-05-13"},
-    {"Station_Number": "2260600", "norm": 0.0400855793, "date": "2021-05-14"},
-    {"Station_Number": "2260600", "norm": 0.0429382224, "date": "2021-05-15"},
-    {"Station_Number": "2260600", "norm": 0.0468011767, "date": "2021-05-16"},
-    {"Station_Number": "2260600", "norm": 0.0493566695, "date": "2021-05-17"},
-    {"Station_Number": "2260600", "norm": 0.0516447271, "date": "2021-05-18"},
-    {"Station_Number": "2260600", "norm": 0.0531601937, "date": "2021-05-19"},
-    {"Station_Number": "2260600", "norm": 0.0539922147, "date": "2021-05-20"},
-    {"Station_Number": "2260600", "norm": 0.0545568003, "date": "2021-05-21"},
-    {"Station_Number": "2260600", "norm": 0.0537247794, "date": "2021-05-22"},
-    {"Station_Number": "2260600", "norm": 0.0539922147, "date": "2021-05-23"},
-    {"Station_Number": "2260600", "norm": 0.05880605, "date": "2021-05-24"},
-    {"Station_Number": "2260600", "norm": 0.0640061807, "date": "2021-05-25"},
-    {"Station_Number": "2260600", "norm": 0.065135352, "date": "2021-05-26"},
-    {"Station_Number": "2260600", "norm": 0.0718806644, "date": "2021-05-27"},
-    {"Station_Number": "2260600", "norm": 0.0999316554, "date": "2021-05-28"},
-    {"Station_Number": "2260600", "norm": 0.1245654176, "date": "2021-05-29"},
-    {"Station_Number": "2260600", "norm": 0.1356194099, "date": "2021-05-30"},
-    {"Station_Number": "2260600", "norm": 0.1279826464, "date": "2021-05-31"},
-    {"Station_Number": "2260600", "norm": 0.1153537575, "date": "2021-06-01"},
-    {"Station_Number": "2260600", "norm": 0.1054289365, "date": "2021-06-02"},
-    {"Station_Number": "2260600", "norm": 0.0966927168, "date": "2021-06-03"},
-    {"Station_Number": "2260600", "norm": 0.0953555404, "date": "2021-06-04"},
-    {"Station_Number": "2260600", "norm": 0.1000505156, "date": "2021-06-05"},
-    {"Station_Number": "2260600", "norm": 0.1035866045, "date": "2021-06-06"},
-    {"Station_Number": "2260600", "norm": 0.1052803613, "date": "2021-06-07"},
-    {"Station_Number": "2260600", "norm": 0.1069444032, "date": "2021-06-08"},
-    {"Station_Number": "2260600", "norm": 0.1096781862, "date": "2021-06-09"},
-    {"Station_Number": "2260600", "norm": 0.1168395091, "date": "2021-06-10"},
-    {"Station_Number": "2260600", "norm": 0.1242385523, "date": "2021-06-11"},
-    {"Station_Number": "2260600", "norm": 0.1320536059, "date": "2021-06-12"},
-    {"Station_Number": "2260600", "norm": 0.1236442516, "date": "2021-06-13"},
-    {"Station_Number": "2260600", "norm": 0.1133034202, "date": "2021-06-14"},
-    {"Station_Number": "2260600", "norm": 0.1078061391, "date": "2021-06-15"},
-    {"Station_Number": "2260600", "norm": 0.1056963718, "date": "2021-06-16"},
-    {"Station_Number": "2260600", "norm": 0.104983211, "date": "2021-06-17"},
-    {"Station_Number": "2260600", "norm": 0.1091136006, "date": "2021-06-18"},
-    {"Station_Number": "2260600", "norm": 0.1125605444, "date": "2021-06-19"},
-    {"Station_Number": "2260600", "norm": 0.1174040947, "date": "2021-06-20"},
-    {"Station_Number": "2260600", "norm": 0.1245357026, "date": "2021-06-21"},
-    {"Station_Number": "2260600", "norm": 0.1353222595, "date": "2021-06-22"},
-    {"Station_Number": "2260600", "norm": 0.1587674204, "date": "2021-06-23"},
-    {"Station_Number": "2260600", "norm": 0.1886310284, "date": "2021-06-24"},
-    {"Station_Number": "2260600", "norm": 0.2163848691, "date": "2021-06-25"},
-    {"Station_Number": "2260600", "norm": 0.234392179, "date": "2021-06-26"},
-    {"Station_Number": "2260600", "norm": 0.2440495647, "date": "2021-06-27"},
-    {"Station_Number": "2260600", "norm": 0.249784566, "date": "2021-06-28"},
-    {"Station_Number": "2260600", "norm": 0.2603334027, "date": "2021-06-29"},
-    {"Station_Number": "2260600", "norm": 0.2880872433, "date": "2021-06-30"},
-    {"Station_Number": "2260600", "norm": 0.3177428461, "date": "2021-07-01"},
-    {"Station_Number": "2260600", "norm": 0.3188423023, "date": "2021-07-02"},
-    {"Station_Number": "2260600", "norm": 0.313998752, "date": "2021-07-03"},
-    {"Station_Number": "2260600", "norm": 0.31221585, "date": "2021-07-04"},
-    {"Station_Number": "2260600", "norm": 0.3172674056, "date": "2021-07-05"},
-    {"Station_Number": "2260600", "norm": 0.3307283155, "date": "2021-07-06"},
-    {"Station_Number": "2260600", "norm": 0.3474578789, "date": "2021-07-07"},
-    {"Station_Number": "2260600", "norm": 0.3876920334, "date": "2021-07-08"},
-    {"Station_Number": "2260600", "norm": 0.4462306481, "date": "2021-07-09"},
-    {"Station_Number": "2260600", "norm": 0.4824829881, "date": "2021-07-10"},
-    {"Station_Number": "2260600", "norm": 0.5110094197, "date": "2021-07-11"},
-    {"Station_Number": "2260600", "norm": 0.5297298904, "date": "2021-07-12"},
-    {"Station_Number": "2260600", "norm": 0.5346625858, "date": "2021-07-13"},
-    {"Station_Number": "2260600", "norm": 0.53397914, "date": "2021-07-14"},
-    {"Station_Number": "2260600", "norm": 0.5208153805, "date": "2021-07-15"},
-    {"Station_Number": "2260600", "norm": 0.5043532523, "date": "2021-07-16"},
-    {"Station_Number": "2260600", "norm": 0.4748462247, "date": "2021-07-17"},
-    {"Station_Number": "2260600", "norm": 0.4311651264, "date": "2021-07-18"},
-    {"Station_Number": "2260600", "norm": 0.3931298844, "date": "2021-07-19"},
-    {"Station_Number": "2260600", "norm": 0.3744985588, "date": "2021-07-20"},
-    {"Station_Number": "2260600", "norm": 0.3569666894, "date": "2021-07-21"},
-    {"Station_Number": "2260600", "norm": 0.3496567914, "date": "2021-07-22"},
-    {"Station_Number": "2260600", "norm": 0.359254747, "date": "2021-07-23"},
-    {"Station_Number": "2260600", "norm": 0.3736071078, "date": "2021-07-24"},
-    {"Station_Number": "2260600", "norm": 0.3827296229, "date": "2021-07-25"},
-    {"Station_Number": "2260600", "norm": 0.378272368, "date": "2021-07-26"},
-    {"Station_Number": "2260600", "norm": 0.3738151131, "date": "2021-07-27"},
-    {"Station_Number": "2260600", "norm": 0.3705464595, "date": "2021-07-28"},
-    {"Station_Number": "2260600", "norm": 0.3604433483, "date": "2021-07-29"},
-    {"Station_Number": "2260600", "norm": 0.3491516358, "date": "2021-07-30"},
-    {"Station_Number": "2260600", "norm": 0.3607404986, "date": "2021-07-31"},
-    {"Station_Number": "2260600", "norm": 0.3952990818, "date": "2021-08-01"},
-    {"Station_Number": "2260600", "norm": 0.4238255133, "date": "2021-08-02"},
-    {"Station_Number": "2260600", "norm": 0.4374944284, "date": "2021-08-03"},
-    {"Station_Number": "2260600", "norm": 0.4490832912, "date": "2021-08-04"},
-    {"Station_Number": "2260600", "norm": 0.4787983241, "date": "2021-08-05"},
-    {"Station_Number": "2260600", "norm": 0.5291355897, "date": "2021-08-06"},
-    {"Station_Number": "2260600", "norm": 0.581018037, "date": "2021-08-07"},
-    {"Station_Number": "2260600", "norm": 0.5957864083, "date": "2021-08-08"},
-    {"Station_Number": "2260600", "norm": 0.5833060946, "date": "2021-08-09"},
-    {"Station_Number": "2260600", "norm": 0.5616141206, "date": "2021-08-10"},
-    {"Station_Number": "2260600", "norm": 0.5265503818, "date": "2021-08-11"},
-    {"Station_Number": "2260600", "norm": 0.4817698274, "date": "2021-08-12"},
-    {"Station_Number": "2260600", "norm": 0.4377915788, "date": "2021-08-13"},
-    {"Station_Number": "2260600", "norm": 0.4019552492, "date": "2021-08-14"},
-    {"Station_Number": "2260600", "norm": 0.3880783288, "date": "2021-08-15"},
-    {"Station_Number": "2260600", "norm": 0.3914361275, "date": "2021-08-16"},
-    {"Station_Number": "2260600", "norm": 0.415416159, "date": "2021-08-17"},
-    {"Station_Number": "2260600", "norm": 0.4493804416, "date": "2021-08-18"},
-    {"Station_Number": "2260600", "norm": 0.4982319555, "date": "2021-08-19"},
-    {"Station_Number": "2260600", "norm": 0.5539773571, "date": "2021-08-20"},
-    {"Station_Number": "2260600", "norm": 0.6147148843, "date": "2021-08-21"},
-    {"Station_Number": "2260600", "norm": 0.6743232401, "date": "2021-08-22"},
-    {"Station_Number": "2260600", "norm": 0.7202032508, "date": "2021-08-23"},
-    {"Station_Number": "2260600", "norm": 0.7569310314, "date": "2021-08-24"},
-    {"Station_Number": "2260600", "norm": 0.7916084747, "date": "2021-08-25"},
-    {"Station_Number": "2260600", "norm": 0.8294357115, "date": "2021-08-26"},
-    {"Station_Number": "2260600", "norm": 0.8593587496, "date": "2021-08-27"},
-    {"Station_Number": "2260600", "norm": 0.8875880308, "date": "2021-08-28"},
-    {"Station_Number": "2260600", "norm": 0.9141235551, "date": "2021-08-29"},
-    {"Station_Number": "2260600", "norm": 0.9378064363, "date": "2021-08-30"},
-    {"Station_Number": "2260600", "norm": 0.9689180757, "date": "2021-08-31"},
-    {"Station_Number": "2260600", "norm": 0.9872225359, "date": "2021-09-01"},
-    {"Station_Number": "2260600", "norm": 0.9917986509, "date": "2021-09-02"},
-    {"Station_Number": "2260600", "norm": 1.0, "date": "2021-09-03"},
-    {"Station_Number": "2260600", "norm": 0.9954536, "date": "2021-09-04"},
-    {"Station_Number": "2260600", "norm": 0.980090928, "date": "2021-09-05"},
-    {"Station_Number": "2260600", "norm": 0.9528719579, "date": "2021-09-06"},
-    {"Station_Number": "2260600", "norm": 0.9074079577, "date": "2021-09-07"},
-    {"Station_Number": "2260600", "norm": 0.8471755861, "date": "2021-09-08"},
-    {"Station_Number": "2260600", "norm": 0.7778504145, "date": "2021-09-09"},
-    {"Station_Number": "2260600", "norm": 0.7211838469, "date": "2021-09-10"},
-    {"Station_Number": "2260600", "norm": 0.68323775, "date": "2021-09-11"},
-    {"Station_Number": "2260600", "norm": 0.6320387484, "date": "2021-09-12"},
-    {"Station_Number": "2260600", "norm": 0.5841084004, "date": "2021-09-13"},
-    {"Station_Number": "2260600", "norm": 0.5561762696, "date": "2021-09-14"},
-    {"Station_Number": "2260600", "norm": 0.5325825335, "date": "2021-09-15"},
-    {"Station_Number": "2260600", "norm": 0.5019760497, "date": "2021-09-16"},
-    {"Station_Number": "2260600", "norm": 0.4744599293, "date": "2021-09-17"},
-    {"Station_Number": "2260600", "norm": 0.4451311919, "date": "2021-09-18"},
-    {"Station_Number": "2260600", "norm": 0.4232312127, "date": "2021-09-19"},
-    {"Station_Number": "2260600", "norm": 0.4091760021, "date": "2021-09-20"},
-    {"Station_Number": "2260600", "norm": 0.4210620153, "date": "2021-09-21"},
-    {"Station_Number": "2260600", "norm": 0.4526490952, "date": "2021-09-22"},
-    {"Station_Number": "2260600", "norm": 0.4845630404, "date": "2021-09-23"},
-    {"Station_Number": "2260600", "norm": 0.5016788994, "date": "2021-09-24"},
-    {"Station_Number": "2260600", "norm": 0.548450361, "date": "2021-09-25"},
-    {"Station_Number": "2260600", "norm": 0.5829197991, "date": "2021-09-26"},
-    {"Station_Number": "2260600", "norm": 0.6011351143, "date": "2021-09-27"},
-    {"Station_Number": "2260600", "norm": 0.6011351143, "date": "2021-09-28"},
-    {"Station_Number": "2260600", "norm": 0.5631890173, "date": "2021-09-29"},
-    {"Station_Number": "2260600", "norm": 0.4852464862, "date": "2021-09-30"},
-    {"Station_Number": "2260600", "norm": 0.4337503343, "date": "2021-10-01"},
-    {"Station_Number": "2260600", "norm": 0.4019552492, "date": "2021-10-02"},
-    {"Station_Number": "2260600", "norm": 0.3854039759, "date": "2021-10-03"},
-    {"Station_Number": "2260600", "norm": 0.3555997979, "date": "2021-10-04"},
-    {"Station_Number": "2260600", "norm": 0.3262710605, "date": "2021-10-05"},
-    {"Station_Number": "2260600", "norm": 0.3010132826, "date": "2021-10-06"},
-    {"Station_Number": "2260600", "norm": 0.2885626839, "date": "2021-10-07"},
-    {"Station_Number": "2260600", "norm": 0.2843134342, "date": "2021-10-08"},
-    {"Station_Number": "2260600", "norm": 0.2825602472, "date": "2021-10-09"},
-    {"Station_Number": "2260600", "norm": 0.28056934, "date": "2021-10-10"},
-    {"Station_Number": "2260600", "norm": 0.2793510237, "date": "2021-10-11"},
-    {"Station_Number": "2260600", "norm": 0.2764092354, "date": "2021-10-12"},
-    {"Station_Number": "2260600", "norm": 0.2722788459, "date": "2021-10-13"},
-    {"Station_Number": "2260600", "norm": 0.2648203726, "date": "2021-10-14"},
-    {"Station_Number": "2260600", "norm": 0.251626898, "date": "2021-10-15"},
-    {"Station_Number": "2260600", "norm": 0.2563218732, "date": "2021-10-16"},
-    {"Station_Number": "2260600", "norm": 0.2903158708, "date": "2021-10-17"},
-    {"Station_Number": "2260600", "norm": 0.3138798918, "date": "2021-10-18"},
-    {"Station_Number": "2260600", "norm": 0.343000624, "date": "2021-10-19"},
-    {"Station_Number": "2260600", "norm": 0.2828871126, "date": "2021-10-20"},
-    {"Station_Number": "2260600", "norm": 0.2595905268, "date": "2021-10-21"},
-    {"Station_Number": "2260600", "norm": 0.2586396458, "date": "2021-10-22"},
-    {"Station_Number": "2260600", "norm": 0.2655038184, "date": "2021-10-23"},
-    {"Station_Number": "2260600", "norm": 0.2674352955, "date": "2021-10-24"},
-    {"Station_Number": "2260600", "norm": 0.2558464327, "date": "2021-10-25"},
-    {"Station_Number": "2260600", "norm": 0.2491011203, "date": "2021-10-26"},
-    {"Station_Number": "2260600", "norm": 0.2782218524, "date": "2021-10-27"},
-    {"Station_Number": "2260600", "norm": 0.3385433691, "date": "2021-10-28"},
-    {"Station_Number": "2260600", "norm": 0.3798472647, "date": "2021-10-29"},
-    {"Station_Number": "2260600", "norm": 0.3898612308, "date": "2021-10-30"},
-    {"Station_Number": "2260600", "norm": 0.3721213562, "date": "2021-10-31"},
-    {"Station_Number": "2260600", "norm": 0.3328083678, "date": "2021-11-01"},
-    {"Station_Number": "2260600", "norm": 0.291385612, "date": "2021-11-02"},
-    {"Station_Number": "2260600", "norm": 0.2563218732, "date": "2021-11-03"},
-    {"Station_Number": "2260600", "norm": 0.234392179, "date": "2021-11-04"},
-    {"Station_Number": "2260600", "norm": 0.2206044038, "date": "2021-11-05"},
-    {"Station_Number": "2260600", "norm": 0.2127299201, "date": "2021-11-06"},
-    {"Station_Number": "2260600", "norm": 0.2019730782, "date": "2021-11-07"},
-    {"Station_Number": "2260600", "norm": 0.1937122991, "date": "2021-11-08"},
-    {"Station_Number": "2260600", "norm": 0.1869967016, "date": "2021-11-09"},
-    {"Station_Number": "2260600", "norm": 0.1794787983, "date": "2021-11-10"},
-    {"Station_Number": "2260600", "norm": 0.17193118, "date": "2021-11-11"},
-    {"Station_Number": "2260600", "norm": 0.1666121891, "date": "2021-11-12"},
-    {"Station_Number": "2260600", "norm": 0.1611743381, "date": "2021-11-13"},
-    {"Station_Number": "2260600", "norm": 0.1553501917, "date": "2021-11-14"},
-    {"Station_Number": "2260600", "norm": 0.1502986361, "date": "2021-11-15"},
-    {"Station_Number": "2260600", "norm": 0.1465545419, "date": "2021-11-16"},
-    {"Station_Number": "2260600", "norm": 0.1413544112, "date": "2021-11-17"},
-    {"Station_Number": "2260600", "norm": 0.1383829079, "date": "2021-11-18"},
-    {"Station_Number": "2260600", "norm": 0.1382343327, "date": "2021-11-19"},
-    {"Station_Number": "2260600", "norm": 0.1426915877, "date": "2021-11-20"},
-    {"Station_Number": "2260600", "norm": 0.1477431433, "date": "2021-11-21"},
-    {"Station_Number": "2260600", "norm": 0.1446824949, "date": "2021-11-22"},
-    {"Station_Number": "2260600", "norm": 0.1387097733, "date": "2021-11-23"},
-    {"Station_Number": "2260600", "norm": 0.1336582177, "date": "2021-11-24"},
-    {"Station_Number": "2260600", "norm": 0.1290523876, "date": "2021-11-25"},
-    {"Station_Number": "2260600", "norm": 0.1248328529, "date": "2021-11-26"},
-    {"Station_Number": "2260600", "norm": 0.1223962202, "date": "2021-11-27"},
-    {"Station_Number": "2260600", "norm": 0.1198110124, "date": "2021-11-28"},
-    {"Station_Number": "2260600", "norm": 0.1162154934, "date": "2021-11-29"},
-    {"Station_Number": "2260600", "norm": 0.1124119692, "date": "2021-11-30"},
-    {"Station_Number": "2260600", "norm": 0.1111045078, "date": "2021-12-01"},
-    {"Station_Number": "2260600", "norm": 0.1099753365, "date": "2021-12-02"},
-    {"Station_Number": "2260600", "norm": 0.1088164502, "date": "2021-12-03"},
-    {"Station_Number": "2260600", "norm": 0.1065283927, "date": "2021-12-04"},
-    {"Station_Number": "2260600", "norm": 0.1044186254, "date": "2021-12-05"},
-    {"Station_Number": "2260600", "norm": 0.1024871482, "date": "2021-12-06"},
-    {"Station_Number": "2260600", "norm": 0.1000505156, "date": "2021-12-07"},
-    {"Station_Number": "2260600", "norm": 0.0976138829, "date": "2021-12-08"},
-    {"Station_Number": "2260600", "norm": 0.0953555404, "date": "2021-12-09"},
-    {"Station_Number": "2260600", "norm": 0.0928594776, "date": "2021-12-10"},
-    {"Station_Number": "2260600", "norm": 0.0907794253, "date": "2021-12-11"},
-    {"Station_Number": "2260600", "norm": 0.0886102279, "date": "2021-12-12"},
-    {"Station_Number": "2260600", "norm": 0.0866193207, "date": "2021-12-13"},
-    {"Station_Number": "2260600", "norm": 0.0852524292, "date": "2021-12-14"},
-    {"Station_Number": "2260600", "norm": 0.0836478174, "date": "2021-12-15"},
-    {"Station_Number": "2260600", "norm": 0.0821620658, "date": "2021-12-16"},
-    {"Station_Number": "2260600", "norm": 0.0807357442, "date": "2021-12-17"},
-    {"Station_Number": "2260600", "norm": 0.0797551481, "date": "2021-12-18"},
-    {"Station_Number": "2260600", "norm": 0.0785962618, "date": "2021-12-19"},
-    {"Station_Number": "2260600", "norm": 0.0770807952, "date": "2021-12-20"},
-    {"Station_Number": "2260600", "norm": 0.0758921939, "date": "2021-12-21"},
-    {"Station_Number": "2260600", "norm": 0.0747630226, "date": "2021-12-22"},
-    {"Station_Number": "2260600", "norm": 0.0729206906, "date": "2021-12-23"},
-    {"Station_Number": "2260600", "norm": 0.0717915193, "date": "2021-12-24"},
-    {"Station_Number": "2260600", "norm": 0.0706920631, "date": "2021-12-25"},
-    {"Station_Number": "2260600", "norm": 0.0694737468, "date": "2021-12-26"},
-    {"Station_Number": "2260600", "norm": 0.0684931507, "date": "2021-12-27"},
-    {"Station_Number": "2260600", "norm": 0.0673936945, "date": "2021-12-28"},
-    {"Station_Number": "2260600", "norm": 0.0662050932, "date": "2021-12-29"},
-    {"Station_Number": "2260600", "norm": 0.0654622173, "date": "2021-12-30"},
-    {"Station_Number": "2260600", "norm": 0.065135352, "date": "2021-12-31"},
-    {"Station_Number": "2260600", "norm": 0.0772116065, "date": "2022-01-01"},
-    {"Station_Number": "2260600", "norm": 0.0761854211, "date": "2022-01-02"},
-    {"Station_Number": "2260600", "norm": 0.0756900212, "date": "2022-01-03"},
-    {"Station_Number": "2260600", "norm": 0.0753361642, "date": "2022-01-04"},
-    {"Station_Number": "2260600", "norm": 0.0750884643, "date": "2022-01-05"},
-    {"Station_Number": "2260600", "norm": 0.0736022647, "date": "2022-01-06"},
-    {"Station_Number": "2260600", "norm": 0.0719037509, "date": "2022-01-07"},
-    {"Station_Number": "2260600", "norm": 0.0713021939, "date": "2022-01-08"},
-    {"Station_Number": "2260600", "norm": 0.0701344657, "date": "2022-01-09"},
-    {"Station_Number": "2260600", "norm": 0.069143666, "date": "2022-01-10"},
-    {"Station_Number": "2260600", "norm": 0.0687898089, "date": "2022-01-11"},
-    {"Station_Number": "2260600", "norm": 0.0677282378, "date": "2022-01-12"},
-    {"Station_Number": "2260600", "norm": 0.0663481953, "date": "2022-01-13"},
-    {"Station_Number": "2260600", "norm": 0.0663481953, "date": "2022-01-14"},
-    {"Station_Number": "2260600", "norm": 0.0655697098, "date": "2022-01-15"},
-    {"Station_Number": "2260600", "norm": 0.0653220099, "date": "2022-01-16"},
-    {"Station_Number": "2260600", "norm": 0.0649681529, "date": "2022-01-17"},
-    {"Station_Number": "2260600", "norm": 0.0644019816, "date": "2022-01-18"},
-    {"Station_Number": "2260600", "norm": 0.0633050248, "date": "2022-01-19"},
-    {"Station_Number": "2260600", "norm": 0.0629511677, "date": "2022-01-20"},
-    {"Station_Number": "2260600", "norm": 0.0627388535, "date": "2022-01-21"},
-    {"Station_Number": "2260600", "norm": 0.0636234961, "date": "2022-01-22"},
-    {"Station_Number": "2260600", "norm": 0.0673743808, "date": "2022-01-23"},
-    {"Station_Number": "2260600", "norm": 0.0690375088, "date": "2022-01-24"},
-    {"Station_Number": "2260600", "norm": 0.0687898089, "date": "2022-01-25"},
-    {"Station_Number": "2260600", "norm": 0.0677282378, "date": "2022-01-26"},
-    {"Station_Number": "2260600", "norm": 0.0663481953, "date": "2022-01-27"},
-    {"Station_Number": "2260600", "norm": 0.0644019816, "date": "2022-01-28"},
-    {"Station_Number": "2260600", "norm": 0.0630573248, "date": "2022-01-29"},
-    {"Station_Number": "2260600", "norm": 0.0626326964, "date": "2022-01-30"},
-    {"Station_Number": "2260600", "norm": 0.0631988677, "date": "2022-01-31"},
-    {"Station_Number": "2260600", "norm": 0.0636234961, "date": "2022-02-01"},
-    {"Station_Number": "2260600", "norm": 0.0636234961, "date": "2022-02-02"},
-    {"Station_Number": "2260600", "norm": 0.0633050248, "date": "2022-02-03"},
-    {"Station_Number": "2260600", "norm": 0.0629511677, "date": "2022-02-04"},
-    {"Station_Number": "2260600", "norm": 0.063517339, "date": "2022-02-05"},
-    {"Station_Number": "2260600", "norm": 0.0652158528, "date": "2022-02-06"},
-    {"Station_Number": "2260600", "norm": 0.0667020524, "date": "2022-02-07"},
-    {"Station_Number": "2260600", "norm": 0.0673743808, "date": "2022-02-08"},
-    {"Station_Number": "2260600", "norm": 0.0663481953, "date": "2022-02-09"},
-    {"Station_Number": "2260600", "norm": 0.0639773531, "date": "2022-02-10"},
-    {"Station_Number": "2260600", "norm": 0.0626326964, "date": "2022-02-11"},
-    {"Station_Number": "2260600", "norm": 0.0627388535, "date": "2022-02-12"},
-    {"Station_Number": "2260600", "norm": 0.063517339, "date": "2022-02-13"},
-    {"Station_Number": "2260600", "norm": 0.0631988677, "date": "2022-02-14"},
-    {"Station_Number": "2260600", "norm": 0.0634111819, "date": "2022-02-15"},
-    {"Station_Number": "2260600", "norm": 0.0669143666, "date": "2022-02-16"},
-    {"Station_Number": "2260600", "norm": 0.0683297948, "date": "2022-02-17"},
-    {"Station_Number": "2260600", "norm": 0.0670559094, "date": "2022-02-18"},
-    {"Station_Number": "2260600", "norm": 0.065428167, "date": "2022-02-19"},
-    {"Station_Number": "2260600", "norm": 0.0639773531, "date": "2022-02-20"},
-    {"Station_Number": "2260600", "norm": 0.0626326964, "date": "2022-02-21"},
-    {"Station_Number": "2260600", "norm": 0.0610403397, "date": "2022-02-22"},
-    {"Station_Number": "2260600", "norm": 0.0601910828, "date": "2022-02-23"},
-    {"Station_Number": "2260600", "norm": 0.059094126, "date": "2022-02-24"},
-    {"Station_Number": "2260600", "norm": 0.058138712, "date": "2022-02-25"},
-    {"Station_Number": "2260600", "norm": 0.0571832979, "date": "2022-02-26"},
-    {"Station_Number": "2260600", "norm": 0.0562278839, "date": "2022-02-27"},
-    {"Station_Number": "2260600", "norm": 0.0553078556, "date": "2022-02-28"},
-    {"Station_Number": "2260600", "norm": 0.0548832272, "date": "2022-03-01"},
-    {"Station_Number": "2260600", "norm": 0.0552016985, "date": "2022-03-02"},
-    {"Station_Number": "2260600", "norm": 0.0560155697, "date": "2022-03-03"},
-    {"Station_Number": "2260600", "norm": 0.0561217268, "date": "2022-03-04"},
-    {"Station_Number": "2260600", "norm": 0.055626327, "date": "2022-03-05"},
-    {"Station_Number": "2260600", "norm": 0.0545647558, "date": "2022-03-06"},
-    {"Station_Number": "2260600", "norm": 0.0539631989, "date": "2022-03-07"},
-    {"Station_Number": "2260600", "norm": 0.0536447275, "date": "2022-03-08"},
-    {"Station_Number": "2260600", "norm": 0.0540339703, "date": "2022-03-09"},
-    {"Station_Number": "2260600", "norm": 0.0545647558, "date": "2022-03-10"},
-    {"Station_Number": "2260600", "norm": 0.0545647558, "date": "2022-03-11"},
-    {"Station_Number": "2260600", "norm": 0.0545647558, "date": "2022-03-12"},
-    {"Station_Number": "2260600", "norm": 0.0548832272, "date": "2022-03-13"},
-    {"Station_Number": "2260600", "norm": 0.0548832272, "date": "2022-03-14"},
-    {"Station_Number": "2260600", "norm": 0.0548832272, "date": "2022-03-15"},
-    {"Station_Number": "2260600", "norm": 0.0557324841, "date": "2022-03-16"},
-    {"Station_Number": "2260600", "norm": 0.0570771408, "date": "2022-03-17"},
-    {"Station_Number": "2260600", "norm": 0.0585633404, "date": "2022-03-18"},
-    {"Station_Number": "2260600", "norm": 0.0599787686, "date": "2022-03-19"},
-    {"Station_Number": "2260600", "norm": 0.0606157113, "date": "2022-03-20"},
-    {"Station_Number": "2260600", "norm": 0.0609341826, "date": "2022-03-21"},
-    {"Station_Number": "2260600", "norm": 0.0612880396, "date": "2022-03-22"},
-    {"Station_Number": "2260600", "norm": 0.061960368, "date": "2022-03-23"},
-    {"Station_Number": "2260600", "norm": 0.0659235669, "date": "2022-03-24"},
-    {"Station_Number": "2260600", "norm": 0.0648619958, "date": "2022-03-25"},
-    {"Station_Number": "2260600", "norm": 0.0617126681, "date": "2022-03-26"},
-    {"Station_Number": "2260600", "norm": 0.0601910828, "date": "2022-03-27"},
-    {"Station_Number": "2260600", "norm": 0.0606157113, "date": "2022-03-28"},
-    {"Station_Number": "2260600", "norm": 0.0607218684, "date": "2022-03-29"},
-    {"Station_Number": "2260600", "norm": 0.0609341826, "date": "2022-03-30"},
-    {"Station_Number": "2260600", "norm": 0.0606157113, "date": "2022-03-31"},
-    {"Station_Number": "2260600", "norm": 0.0599787686, "date": "2022-04-01"},
-    {"Station_Number": "2260600", "norm": 0.0606157113, "date": "2022-04-02"},
-    {"Station_Number": "2260600", "norm": 0.0644019816, "date": "2022-04-03"},
-    {"Station_Number": "2260600", "norm": 0.0738499646, "date": "2022-04-04"},
-    {"Station_Number": "2260600", "norm": 0.0803963199, "date": "2022-04-05"},
-    {"Station_Number": "2260600", "norm": 0.0796178344, "date": "2022-04-06"},
-    {"Station_Number": "2260600", "norm": 0.0670912951, "date": "2022-04-07"},
-    {"Station_Number": "2260600", "norm": 0.0687898089, "date": "2022-04-08"},
-    {"Station_Number": "2260600", "norm": 0.0720452937, "date": "2022-04-09"},
-    {"Station_Number": "2260600", "norm": 0.1062278839, "date": "2022-04-10"},
-    {"Station_Number": "2260600", "norm": 0.1392073602, "date": "2022-04-11"},
-    {"Station_Number": "2260600", "norm": 0.1703467799, "date": "2022-04-12"},
-    {"Station_Number": "2260600", "norm": 0.1839348903, "date": "2022-04-13"},
-    {"Station_Number": "2260600", "norm": 0.1783793347, "date": "2022-04-14"},
-    {"Station_Number": "2260600", "norm": 0.1667374381, "date": "2022-04-15"},
-    {"Station_Number": "2260600", "norm": 0.1555555556, "date": "2022-04-16"},
-    {"Station_Number": "2260600", "norm": 0.1486907289, "date": "2022-04-17"},
-    {"Station_Number": "2260600", "norm": 0.138039632, "date": "2022-04-18"},
-    {"Station_Number": "2260600", "norm": 0.1297593772, "date": "2022-04-19"},
-    {"Station_Number": "2260600", "norm": 0.124522293, "date": "2022-04-20"},
-    {"Station_Number": "2260600", "norm": 0.1331917905, "date": "2022-04-21"},
-    {"Station_Number": "2260600", "norm": 0.1710191083, "date": "2022-04-22"},
-    {"Station_Number": "2260600", "norm": 0.2092356688, "date": "2022-04-23"},
-    {"Station_Number": "2260600", "norm": 0.2190021231, "date": "2022-04-24"},
-    {"Station_Number": "2260600", "norm": 0.2176220807, "date": "2022-04-25"},
-    {"Station_Number": "2260600", "norm": 0.2083510262, "date": "2022-04-26"},
-    {"Station_Number": "2260600", "norm": 0.1951521585, "date": "2022-04-27"},
-    {"Station_Number": "2260600", "norm": 0.1779547063, "date": "2022-04-28"},
-    {"Station_Number": "2260600", "norm": 0.1607218684, "date": "2022-04-29"},
-    {"Station_Number": "2260600", "norm": 0.1496107573, "date": "2022-04-30"},
-    {"Station_Number": "2260600", "norm": 0.1446567587, "date": "2022-05-01"},
-    {"Station_Number": "2260600", "norm": 0.1446567587, "date": "2022-05-02"},
-    {"Station_Number": "2260600", "norm": 0.1472045294, "date": "2022-05-03"},
-    {"Station_Number": "2260600", "norm": 0.1430290163, "date": "2022-05-04"},
-    {"Station_Number": "2260600", "norm": 0.13492569, "date": "2022-05-05"},
-    {"Station_Number": "2260600", "norm": 0.1253361642, "date": "2022-05-06"},
-    {"Station_Number": "2260600", "norm": 0.1215498938, "date": "2022-05-07"},
-    {"Station_Number": "2260600", "norm": 0.1205944798, "date": "2022-05-08"},
-    {"Station_Number": "2260600", "norm": 0.12009908, "date": "2022-05-09"},
-    {"Station_Number": "2260600", "norm": 0.1199221515, "date": "2022-05-10"},
-    {"Station_Number": "2260600", "norm": 0.1311394197, "date": "2022-05-11"},
-    {"Station_Number": "2260600", "norm": 0.1494338287, "date": "2022-05-12"},
-    {"Station_Number": "2260600", "norm": 0.1628450106, "date": "2022-05-13"},
-    {"Station_Number": "2260600", "norm": 0.168542109, "date": "2022-05-14"},
-    {"Station_Number": "2260600", "norm": 0.1675513093, "date": "2022-05-15"},
-    {"Station_Number": "2260600", "norm": 0.1663481953, "date": "2022-05-16"},
-    {"Station_Number": "2260600", "norm": 0.1647912243, "date": "2022-05-17"},
-    {"Station_Number": "2260600", "norm": 0.1715145081, "date": "2022-05-18"},
-    {"Station_Number": "2260600", "norm": 0.1932767162, "date": "2022-05-19"},
-    {"Station_Number": "2260600", "norm": 0.2341472045, "date": "2022-05-20"},
-    {"Station_Number": "2260600", "norm": 0.2904812456, "date": "2022-05-21"},
-    {"Station_Number": "2260600", "norm": 0.3321302194, "date": "2022-05-22"},
-    {"Station_Number": "2260600", "norm": 0.3701344657, "date": "2022-05-23"},
-    {"Station_Number": "2260600", "norm": 0.4102264685, "date": "2022-05-24"},
-    {"Station_Number": "2260600", "norm": 0.4401981599, "date": "2022-05-25"},
-    {"Station_Number": "2260600", "norm": 0.4525831564, "date": "2022-05-26"},
-    {"Station_Number": "2260600", "norm": 0.4539985846, "date": "2022-05-27"},
-    {"Station_Number": "2260600", "norm": 0.4387827318, "date": "2022-05-28"},
-    {"Station_Number": "2260600", "norm": 0.4097664544, "date": "2022-05-29"},
-    {"Station_Number": "2260600", "norm": 0.3674451522, "date": "2022-05-30"},
-    {"Station_Number": "2260600", "norm": 0.3268577495, "date": "2022-05-31"},
-    {"Station_Number": "2260600", "norm": 0.2988676575, "date": "2022-06-01"},
-    {"Station_Number": "2260600", "norm": 0.2814932767, "date": "2022-06-02"},
-    {"Station_Number": "2260600", "norm": 0.283368719, "date": "2022-06-03"},
-    {"Station_Number": "2260600", "norm": 0.2936305732, "date": "2022-06-04"},
-    {"Station_Number": "2260600", "norm": 0.29497523, "date": "2022-06-05"},
-    {"Station_Number": "2260600", "norm": 0.2857749469, "date": "2022-06-06"},
-    {"Station_Number": "2260600", "norm": 0.2769992923, "date": "2022-06-07"},
-    {"Station_Number": "2260600", "norm": 0.2788393489, "date": "2022-06-08"},
-    {"Station_Number": "2260600", "norm": 0.3008138712, "date": "2022-06-09"},
-    {"Station_Number": "2260600", "norm": 0.3335810333, "date": "2022-06-10"},
-    {"Station_Number": "2260600", "norm": 0.3335810333, "date": "2022-06-11"},
-    {"Station_Number": "2260600", "norm": 0.3668435952, "date": "2022-06-12"},
-    {"Station_Number": "2260600", "norm": 0.3972753008, "date": "2022-06-13"},
-    {"Station_Number": "2260600", "norm": 0.4247346072, "date": "2022-06-14"},
-    {"Station_Number": "2260600", "norm": 0.4525831564, "date": "2022-06-15"},
-    {"Station_Number": "2260600", "norm": 0.4882165605, "date": "2022-06-16"},
-    {"Station_Number": "2260600", "norm": 0.5282024062, "date": "2022-06-17"},
-    {"Station_Number": "2260600", "norm": 0.5650035386, "date": "2022-06-18"},
-    {"Station_Number": "2260600", "norm": 0.5923566879, "date": "2022-06-19"},
-    {"Station_Number": "2260600", "norm": 0.6101556971, "date": "2022-06-20"},
-    {"Station_Number": "2260600", "norm": 0.6303255485, "date": "2022-06-21"},
-    {"Station_Number": "2260600", "norm": 0.6588818117, "date": "2022-06-22"},
-    {"Station_Number": "2260600", "norm": 0.704069356, "date": "2022-06-23"},
-    {"Station_Number": "2260600", "norm": 0.7403750885, "date": "2022-06-24"},
-    {"Station_Number": "2260600", "norm": 0.7796532201, "date": "2022-06-25"},
-    {"Station_Number": "2260600", "norm": 0.8127034678, "date": "2022-06-26"},
-    {"Station_Number": "2260600", "norm": 0.8475937721, "date": "2022-06-27"},
-    {"Station_Number": "2260600", "norm": 0.8781670205, "date": "2022-06-28"},
-    {"Station_Number": "2260600", "norm": 0.9044585987, "date": "2022-06-29"},
-    {"Station_Number": "2260600", "norm": 0.9298301486, "date": "2022-06-30"},
-    {"Station_Number": "2260600", "norm": 0.9443382873, "date": "2022-07-01"},
-    {"Station_Number": "2260600", "norm": 0.9517692852, "date": "2022-07-02"},
-    {"Station_Number": "2260600", "norm": 0.9610757254, "date": "2022-07-03"},
-    {"Station_Number": "2260600", "norm": 0.9642604388, "date": "2022-07-04"},
-    {"Station_Number": "2260600", "norm": 0.9653220099, "date": "2022-07-05"},
-    {"Station_Number": "2260600", "norm": 0.9761854211, "date": "2022-07-06"},
-    {"Station_Number": "2260600", "norm": 0.983368719, "date": "2022-07-07"},
-    {"Station_Number": "2260600", "norm": 0.9910474168, "date": "2022-07-08"},
-    {"Station_Number": "2260600", "norm": 1.0, "date": "2022-07-09"},
-    {"Station_Number": "2260600", "norm": 0.9883227176, "date": "2022-07-10"},
-    {"Station_Number": "2260600", "norm": 0.9533970276, "date": "2022-07-11"},
-    {"Station_Number": "2260600", "norm": 0.9692144374, "date": "2022-07-12"},
-    {"Station_Number": "2260600", "norm": 0.8434890304, "date": "2022-07-13"},
-    {"Station_Number": "2260600", "norm": 0.762561925, "date": "2022-07-14"},
-    {"Station_Number": "2260600", "norm": 0.6883581033, "date": "2022-07-15"},
-    {"Station_Number": "2260600", "norm": 0.6295116773, "date": "2022-07-16"},
-    {"Station_Number": "2260600", "norm": 0.5778485492, "date": "2022-07-17"},
-    {"Station_Number": "2260600", "norm": 0.5305378627, "date": "2022-07-18"},
-    {"Station_Number": "2260600", "norm": 0.4900920028, "date": "2022-07-19"},
-    {"Station_Number": "2260600", "norm": 0.4646142958, "date": "2022-07-20"},
-    {"Station_Number": "2260600", "norm": 0.4432767162, "date": "2022-07-21"},
-    {"Station_Number": "2260600", "norm": 0.4238145789, "date": "2022-07-22"},
-    {"Station_Number": "2260600", "norm": 0.4117834395, "date": "2022-07-23"},
-    {"Station_Number": "2260600", "norm": 0.4194267516, "date": "2022-07-24"},
-    {"Station_Number": "2260600", "norm": 0.4456121727, "date": "2022-07-25"},
-    {"Station_Number": "2260600", "norm": 0.491861288, "date": "2022-07-26"},
-    {"Station_Number": "2260600", "norm": 0.5398796886, "date": "2022-07-27"},
-    {"Station_Number": "2260600", "norm": 0.5843241331, "date": "2022-07-28"},
-    {"Station_Number": "2260600", "norm": 0.6114649682, "date": "2022-07-29"},
-    {"Station_Number": "2260600", "norm": 0.6219745223, "date": "2022-07-30"},
-    {"Station_Number": "2260600", "norm": 0.6164189667, "date": "2022-07-31"},
-    {"Station_Number": "2260600", "norm": 0.6010969568, "date": "2022-08-01"},
-    {"Station_Number": "2260600", "norm": 0.5831564048, "date": "2022-08-02"},
-    {"Station_Number": "2260600", "norm": 0.5712314225, "date": "2022-08-03"},
-    {"Station_Number": "2260600", "norm": 0.5693559802, "date": "2022-08-04"},
-    {"Station_Number": "2260600", "norm": 0.5658174098, "date": "2022-08-05"},
-    {"Station_Number": "2260600", "norm": 0.5616772824, "date": "2022-08-06"},
-    {"Station_Number": "2260600", "norm": 0.5612172682, "date": "2022-08-07"},
-    {"Station_Number": "2260600", "norm": 0.5601556971, "date": "2022-08-08"},
-    {"Station_Number": "2260600", "norm": 0.5750176929, "date": "2022-08-09"},
-    {"Station_Number": "2260600", "norm": 0.5865888181, "date": "2022-08-10"},
-    {"Station_Number": "2260600", "norm": 0.5986199575, "date": "2022-08-11"},
-    {"Station_Number": "2260600", "norm": 0.6545293701, "date": "2022-08-12"},
-    {"Station_Number": "2260600", "norm": 0.6286978061, "date": "2022-08-13"},
-    {"Station_Number": "2260600", "norm": 0.627388535, "date": "2022-08-14"},
-    {"Station_Number": "2260600", "norm": 0.6065109696, "date": "2022-08-15"},
-    {"Station_Number": "2260600", "norm": 0.5830502477, "date": "2022-08-16"},
-    {"Station_Number": "2260600", "norm": 0.5665251238, "date": "2022-08-17"},
-    {"Station_Number": "2260600", "norm": 0.5596956829, "date": "2022-08-18"},
-    {"Station_Number": "2260600", "norm": 0.550353857, "date": "2022-08-19"},
-    {"Station_Number": "2260600", "norm": 0.5371549894, "date": "2022-08-20"},
-    {"Station_Number": "2260600", "norm": 0.5236022647, "date": "2022-08-21"},
-    {"Station_Number": "2260600", "norm": 0.5148619958, "date": "2022-08-22"},
-    {"Station_Number": "2260600", "norm": 0.508846426, "date": "2022-08-23"},
-    {"Station_Number": "2260600", "norm": 0.5031847134, "date": "2022-08-24"},
-    {"Station_Number": "2260600", "norm": 0.4903397028, "date": "2022-08-25"},
-    {"Station_Number": "2260600", "norm": 0.483368719, "date": "2022-08-26"},
-    {"Station_Number": "2260600", "norm": 0.4815994338, "date": "2022-08-27"},
-    {"Station_Number": "2260600", "norm": 0.4805378627, "date": "2022-08-28"},
-    {"Station_Number": "2260600", "norm": 0.466383581, "date": "2022-08-29"},
-    {"Station_Number": "2260600", "norm": 0.4518754423, "date": "2022-08-30"},
-    {"Station_Number": "2260600", "norm": 0.4501061571, "date": "2022-08-31"},
-    {"Station_Number": "2260600", "norm": 0.4585987261, "date": "2022-09-01"},
-    {"Station_Number": "2260600", "norm": 0.4706298655, "date": "2022-09-02"},
-    {"Station_Number": "2260600", "norm": 0.4932767162, "date": "2022-09-03"},
-    {"Station_Number": "2260600", "norm": 0.52512385, "date": "2022-09-04"},
-    {"Station_Number": "2260600", "norm": 0.5400920028, "date": "2022-09-05"},
-    {"Station_Number": "2260600", "norm": 0.551556971, "date": "2022-09-06"},
-    {"Station_Number": "2260600", "norm": 0.5738499646, "date": "2022-09-07"},
-    {"Station_Number": "2260600", "norm": 0.601556971, "date": "2022-09-08"},
-    {"Station_Number": "2260600", "norm": 0.634571833, "date": "2022-09-09"},
-    {"Station_Number": "2260600", "norm": 0.6518046709, "date": "2022-09-10"},
-    {"Station_Number": "2260600", "norm": 0.6952229299, "date": "2022-09-11"},
-    {"Station_Number": "2260600", "norm": 0.7644373673, "date": "2022-09-12"},
-    {"Station_Number": "2260600", "norm": 0.8083156405, "date": "2022-09-13"},
-    {"Station_Number": "2260600", "norm": 0.8345010616, "date": "2022-09-14"},
-    {"Station_Number": "2260600", "norm": 0.846532201, "date": "2022-09-15"},
-    {"Station_Number": "2260600", "norm": 0.8435951875, "date": "2022-09-16"},
-    {"Station_Number": "2260600", "norm": 0.8165958953, "date": "2022-09-17"},
-    {"Station_Number": "2260600", "norm": 0.7621019108, "date": "2022-09-18"},
-    {"Station_Number": "2260600", "norm": 0.6848195329, "date": "2022-09-19"},
-    {"Station_Number": "2260600", "norm": 0.6157112527, "date": "2022-09-20"},
-    {"Station_Number": "2260600", "norm": 0.5740622788, "date": "2022-09-21"},
-    {"Station_Number": "2260600", "norm": 0.5629865534, "date": "2022-09-22"},
-    {"Station_Number": "2260600", "norm": 0.5616772824, "date": "2022-09-23"},
-    {"Station_Number": "2260600", "norm": 0.5612172682, "date": "2022-09-24"},
-    {"Station_Number": "2260600", "norm": 0.5608634112, "date": "2022-09-25"},
-    {"Station_Number": "2260600", "norm": 0.5601556971, "date": "2022-09-26"},
-    {"Station_Number": "2260600", "norm": 0.5609695683, "date": "2022-09-27"},
-    {"Station_Number": "2260600", "norm": 0.5742038217, "date": "2022-09-28"},
-    {"Station_Number": "2260600", "norm": 0.5874026893, "date": "2022-09-29"},
-    {"Station_Number": "2260600", "norm": 0.5931705591, "date": "2022-09-30"},
-    {"Station_Number": "2260600", "norm": 0.6202052371, "date": "2022-10-01"},
-    {"Station_Number": "2260600", "norm": 0.6371903751, "date": "2022-10-02"},
-    {"Station_Number": "2260600", "norm": 0.6320948337, "date": "2022-10-03"},
-    {"Station_Number": "2260600", "norm": 0.5906935598, "date": "2022-10-04"},
-    {"Station_Number": "2260600", "norm": 0.5657112527, "date": "2022-10-05"},
-    {"Station_Number": "2260600", "norm": 0.5721868365, "date": "2022-10-06"},
-    {"Station_Number": "2260600", "norm": 0.5826963907, "date": "2022-10-07"},
-    {"Station_Number": "2260600", "norm": 0.5948336872, "date": "2022-10-08"},
-    {"Station_Number": "2260600", "norm": 0.5912951168, "date": "2022-10-09"},
-    {"Station_Number": "2260600", "norm": 0.5480184006, "date": "2022-10-10"},
-    {"Station_Number": "2260600", "norm": 0.508138712, "date": "2022-10-11"},
-    {"Station_Number": "2260600", "norm": 0.4925690021, "date": "2022-10-12"},
-    {"Station_Number": "2260600", "norm": 0.4953998585, "date": "2022-10-13"},
-    {"Station_Number": "2260600", "norm": 0.4953998585, "date": "2022-10-14"},
-    {"Station_Number": "2260600", "norm": 0.4892781316, "date": "2022-10-15"},
-    {"Station_Number": "2260600", "norm": 0.4917551309, "date": "2022-10-16"},
-    {"Station_Number": "2260600", "norm": 0.5149681529, "date": "2022-10-17"},
-    {"Station_Number": "2260600", "norm": 0.5460014154, "date": "2022-10-18"},
-    {"Station_Number": "2260600", "norm": 0.5700636943, "date": "2022-10-19"},
-    {"Station_Number": "2260600", "norm": 0.5732484076, "date": "2022-10-20"},
-    {"Station_Number": "2260600", "norm": 0.5708775655, "date": "2022-10-21"},
-    {"Station_Number": "2260600", "norm": 0.5526185421, "date": "2022-10-22"},
-    {"Station_Number": "2260600", "norm": 0.5195682944, "date": "2022-10-23"},
-    {"Station_Number": "2260600", "norm": 0.4725053079, "date": "2022-10-24"},
-    {"Station_Number": "2260600", "norm": 0.4422151451, "date": "2022-10-25"},
-    {"Station_Number": "2260600", "norm": 0.4055201699, "date": "2022-10-26"},
-    {"Station_Number": "2260600", "norm": 0.3754423213, "date": "2022-10-27"},
-    {"Station_Number": "2260600", "norm": 0.371656051, "date": "2022-10-28"},
-    {"Station_Number": "2260600", "norm": 0.3981953291, "date": "2022-10-29"},
-    {"Station_Number": "2260600", "norm": 0.4416135881, "date": "2022-10-30"},
-    {"Station_Number": "2260600", "norm": 0.4725053079, "date": "2022-10-31"},
-    {"Station_Number": "2260600", "norm": 0.4940905874, "date": "2022-11-01"},
-    {"Station_Number": "2260600", "norm": 0.5076786978, "date": "2022-11-02"},
-    {"Station_Number": "2260600", "norm": 0.491861288, "date": "2022-11-03"},
-    {"Station_Number": "2260600", "norm": 0.4446921444, "date": "2022-11-04"},
-    {"Station_Number": "2260600", "norm": 0.3998584572, "date": "2022-11-05"},
-    {"Station_Number": "2260600", "norm": 0.3473460722, "date": "2022-11-06"},
-    {"Station_Number": "2260600", "norm": 0.3130927105, "date": "2022-11-07"},
-    {"Station_Number": "2260600", "norm": 0.2847133758, "date": "2022-11-08"},
-    {"Station_Number": "2260600", "norm": 0.2591295117, "date": "2022-11-09"},
-    {"Station_Number": "2260600", "norm": 0.2451521585, "date": "2022-11-10"},
-    {"Station_Number": "2260600", "norm": 0.2340056617, "date": "2022-11-11"},
-    {"Station_Number": "2260600", "norm": 0.2259377212, "date": "2022-11-12"},
-    {"Station_Number": "2260600", "norm": 0.218542109, "date": "2022-11-13"},
-    {"Station_Number": "2260600", "norm": 0.2119249823, "date": "2022-11-14"},
-    {"Station_Number": "2260600", "norm": 0.2069709837, "date": "2022-11-15"},
-    {"Station_Number": "2260600", "norm": 0.2005661713, "date": "2022-11-16"},
-    {"Station_Number": "2260600", "norm": 0.1940905874, "date": "2022-11-17"},
-    {"Station_Number": "2260600", "norm": 0.187084218, "date": "2022-11-18"},
-    {"Station_Number": "2260600", "norm": 0.1820948337, "date": "2022-11-19"},
-    {"Station_Number": "2260600", "norm": 0.1781670205, "date": "2022-11-20"},
-    {"Station_Number": "2260600", "norm": 0.1717268224, "date": "2022-11-21"},
-    {"Station_Number": "2260600", "norm": 0.1667374381, "date": "2022-11-22"},
-    {"Station_Number": "2260600", "norm": 0.1636234961, "date": "2022-11-23"},
-    {"Station_Number": "2260600", "norm": 0.1593772116, "date": "2022-11-24"},
-    {"Station_Number": "2260600", "norm": 0.1546001415, "date": "2022-11-25"},
-    {"Station_Number": "2260600", "norm": 0.1508846426, "date": "2022-11-26"},
-    {"Station_Number": "2260600", "norm": 0.1486553432, "date": "2022-11-27"},
-    {"Station_Number": "2260600", "norm": 0.1448336872, "date": "2022-11-28"},
-    {"Station_Number": "2260600", "norm": 0.1419674452, "date": "2022-11-29"},
-    {"Station_Number": "2260600", "norm": 0.1394550602, "date": "2022-11-30"},
-    {"Station_Number": "2260600", "norm": 0.1363057325, "date": "2022-12-01"},
-    {"Station_Number": "2260600", "norm": 0.1335102619, "date": "2022-12-02"},
-    {"Station_Number": "2260600", "norm": 0.1297593772, "date": "2022-12-03"},
-    {"Station_Number": "2260600", "norm": 0.1246992215, "date": "2022-12-04"},
-    {"Station_Number": "2260600", "norm": 0.1220452937, "date": "2022-12-05"},
-    {"Station_Number": "2260600", "norm": 0.1196036801, "date": "2022-12-06"},
-    {"Station_Number": "2260600", "norm": 0.1175159236, "date": "2022-12-07"},
-    {"Station_Number": "2260600", "norm": 0.1151450814, "date": "2022-12-08"},
-    {"Station_Number": "2260600", "norm": 0.1130573248, "date": "2022-12-09"},
-    {"Station_Number": "2260600", "norm": 0.1101203114, "date": "2022-12-10"},
-    {"Station_Number": "2260600", "norm": 0.1062986553, "date": "2022-12-11"},
-    {"Station_Number": "2260600", "norm": 0.1025477707, "date": "2022-12-12"},
-    {"Station_Number": "2260600", "norm": 0.1006369427, "date": "2022-12-13"},
-    {"Station_Number": "2260600", "norm": 0.0987261146, "date": "2022-12-14"},
-    {"Station_Number": "2260600", "norm": 0.0961429582, "date": "2022-12-15"},
-    {"Station_Number": "2260600", "norm": 0.0937367304, "date": "2022-12-16"},
-    {"Station_Number": "2260600", "norm": 0.0927459306, "date": "2022-12-17"},
-    {"Station_Number": "2260600", "norm": 0.0920382166, "date": "2022-12-18"},
-    {"Station_Number": "2260600", "norm": 0.0905166313, "date": "2022-12-19"},
-    {"Station_Number": "2260600", "norm": 0.0891719745, "date": "2022-12-20"},
-    {"Station_Number": "2260600", "norm": 0.0879334749, "date": "2022-12-21"},
-    {"Station_Number": "2260600", "norm": 0.0866949752, "date": "2022-12-22"},
-    {"Station_Number": "2260600", "norm": 0.0861641897, "date": "2022-12-23"},
-    {"Station_Number": "2260600", "norm": 0.0854918613, "date": "2022-12-24"},
-    {"Station_Number": "2260600", "norm": 0.0848195329, "date": "2022-12-25"},
-    {"Station_Number": "2260600", "norm": 0.084571833, "date": "2022-12-26"},
-    {"Station_Number": "2260600", "norm": 0.0836518047, "date": "2022-12-27"},
-    {"Station_Number": "2260600", "norm": 0.0827317764, "date": "2022-12-28"},
-    {"Station_Number": "2260600", "norm": 0.0812809625, "date": "2022-12-29"},
-    {"Station_Number": "2260600", "norm": 0.0803963199, "date": "2022-12-30"},
-    {"Station_Number": "2260600", "norm": 0.0797239915, "date": "2022-12-31"},
-    {"Station_Number": "2260600", "norm": 0.058845251, "date": "2023-01-01"},
-    {"Station_Number": "2260600", "norm": 0.0577374515, "date": "2023-01-02"},
-    {"Station_Number": "2260600", "norm": 0.0564186427, "date": "2023-01-03"},
-    {"Station_Number": "2260600", "norm": 0.0559702477, "date": "2023-01-04"},
-    {"Station_Number": "2260600", "norm": 0.0569989186, "date": "2023-01-05"},
-    {"Station_Number": "2260600", "norm": 0.0582913513, "date": "2023-01-06"},
-    {"Station_Number": "2260600", "norm": 0.0574473136, "date": "2023-01-07"},
-    {"Station_Number": "2260600", "norm": 0.0563395142, "date": "2023-01-08"},
-    {"Station_Number": "2260600", "norm": 0.055416348, "date": "2023-01-09"},
-    {"Station_Number": "2260600", "norm": 0.0550470815, "date": "2023-01-10"},
-    {"Station_Number": "2260600", "norm": 0.0543349247, "date": "2023-01-11"},
-    {"Station_Number": "2260600", "norm": 0.0535172632, "date": "2023-01-12"},
-    {"Station_Number": "2260600", "norm": 0.0526996017, "date": "2023-01-13"},
-    {"Station_Number": "2260600", "norm": 0.0523567114, "date": "2023-01-14"},
-    {"Station_Number": "2260600", "norm": 0.0519083164, "date": "2023-01-15"},
-    {"Station_Number": "2260600", "norm": 0.0515390499, "date": "2023-01-16"},
-    {"Station_Number": "2260600", "norm": 0.0510906549, "date": "2023-01-17"},
-    {"Station_Number": "2260600", "norm": 0.0507477646, "date": "2023-01-18"},
-    {"Station_Number": "2260600", "norm": 0.0502202411, "date": "2023-01-19"},
-    {"Station_Number": "2260600", "norm": 0.0499828555, "date": "2023-01-20"},
-    {"Station_Number": "2260600", "norm": 0.0499828555, "date": "2023-01-21"},
-    {"Station_Number": "2260600", "norm": 0.0495344605, "date": "2023-01-22"},
-    {"Station_Number": "2260600", "norm": 0.0486112943, "date": "2023-01-23"},
-    {"Station_Number": "2260600", "norm": 0.0476089996, "date": "2023-01-24"},
-    {"Station_Number": "2260600", "norm": 0.0471869807, "date": "2023-01-25"},
-    {"Station_Number": "2260600", "norm": 0.0471869807, "date": "2023-01-26"},
-    {"Station_Number": "2260600", "norm": 0.0466858334, "date": "2023-01-27"},
-    {"Station_Number": "2260600", "norm": 0.0456835386, "date": "2023-01-28"},
-    {"Station_Number": "2260600", "norm": 0.0449450057, "date": "2023-01-29"},
-    {"Station_Number": "2260600", "norm": 0.0442328489, "date": "2023-01-30"},
-    {"Station_Number": "2260600", "norm": 0.0434151874, "date": "2023-01-31"},
-    {"Station_Number": "2260600", "norm": 0.0426239021, "date": "2023-02-01"},
-    {"Station_Number": "2260600", "norm": 0.0420700024, "date": "2023-02-02"},
-    {"Station_Number": "2260600", "norm": 0.0414633503, "date": "2023-02-03"},
-    {"Station_Number": "2260600", "norm": 0.0409094506, "date": "2023-02-04"},
-    {"Station_Number": "2260600", "norm": 0.0403027985, "date": "2023-02-05"},
-    {"Station_Number": "2260600", "norm": 0.0398544035, "date": "2023-02-06"},
-    {"Station_Number": "2260600", "norm": 0.0395378894, "date": "2023-02-07"},
-    {"Station_Number": "2260600", "norm": 0.0393005038, "date": "2023-02-08"},
-    {"Station_Number": "2260600", "norm": 0.0390103658, "date": "2023-02-09"},
-    {"Station_Number": "2260600", "norm": 0.0385619708, "date": "2023-02-10"},
-    {"Station_Number": "2260600", "norm": 0.0378234379, "date": "2023-02-11"},
-    {"Station_Number": "2260600", "norm": 0.0368738955, "date": "2023-02-12"},
-    {"Station_Number": "2260600", "norm": 0.0364255005, "date": "2023-02-13"},
-    {"Station_Number": "2260600", "norm": 0.0357924722, "date": "2023-02-14"},
-    {"Station_Number": "2260600", "norm": 0.0355814628, "date": "2023-02-15"},
-    {"Station_Number": "2260600", "norm": 0.0354495819, "date": "2023-02-16"},
-    {"Station_Number": "2260600", "norm": 0.0352913249, "date": "2023-02-17"},
-    {"Station_Number": "2260600", "norm": 0.035159444, "date": "2023-02-18"},
-    {"Station_Number": "2260600", "norm": 0.0350803155, "date": "2023-02-19"},
-    {"Station_Number": "2260600", "norm": 0.0346055443, "date": "2023-02-20"},
-    {"Station_Number": "2260600", "norm": 0.0342362778, "date": "2023-02-21"},
-    {"Station_Number": "2260600", "norm": 0.0331548545, "date": "2023-02-22"},
-    {"Station_Number": "2260600", "norm": 0.0326800833, "date": "2023-02-23"},
-    {"Station_Number": "2260600", "norm": 0.0328910928, "date": "2023-02-24"},
-    {"Station_Number": "2260600", "norm": 0.033365864, "date": "2023-02-25"},
-    {"Station_Number": "2260600", "norm": 0.0337615066, "date": "2023-02-26"},
-    {"Station_Number": "2260600", "norm": 0.0340252684, "date": "2023-02-27"},
-    {"Station_Number": "2260600", "norm": 0.0343945349, "date": "2023-02-28"},
-    {"Station_Number": "2260600", "norm": 0.0346055443, "date": "2023-03-01"},
-    {"Station_Number": "2260600", "norm": 0.0347374252, "date": "2023-03-02"},
-    {"Station_Number": "2260600", "norm": 0.0356605914, "date": "2023-03-03"},
-    {"Station_Number": "2260600", "norm": 0.0374541714, "date": "2023-03-04"},
-    {"Station_Number": "2260600", "norm": 0.040672065, "date": "2023-03-05"},
-    {"Station_Number": "2260600", "norm": 0.0428612877, "date": "2023-03-06"},
-    {"Station_Number": "2260600", "norm": 0.0416216074, "date": "2023-03-07"},
-    {"Station_Number": "2260600", "norm": 0.0399862844, "date": "2023-03-08"},
-    {"Station_Number": "2260600", "norm": 0.0381135758, "date": "2023-03-09"},
-    {"Station_Number": "2260600", "norm": 0.037243162, "date": "2023-03-10"},
-    {"Station_Number": "2260600", "norm": 0.0366628861, "date": "2023-03-11"},
-    {"Station_Number": "2260600", "norm": 0.0360826102, "date": "2023-03-12"},
-    {"Station_Number": "2260600", "norm": 0.0355814628, "date": "2023-03-13"},
-    {"Station_Number": "2260600", "norm": 0.0350803155, "date": "2023-03-14"},
-    {"Station_Number": "2260600", "norm": 0.0349484346, "date": "2023-03-15"},
-    {"Station_Number": "2260600", "norm": 0.0347374252, "date": "2023-03-16"},
-    {"Station_Number": "2260600", "norm": 0.0345264157, "date": "2023-03-17"},
-    {"Station_Number": "2260600", "norm": 0.0343945349, "date": "2023-03-18"},
-    {"Station_Number": "2260600", "norm": 0.0343154063, "date": "2023-03-19"},
-    {"Station_Number": "2260600", "norm": 0.0341835254, "date": "2023-03-20"},
-    {"Station_Number": "2260600", "norm": 0.0341835254, "date": "2023-03-21"},
-    {"Station_Number": "2260600", "norm": 0.0338933875, "date": "2023-03-22"},
-    {"Station_Number": "2260600", "norm": 0.0335768734, "date": "2023-03-23"},
-    {"Station_Number": "2260600", "norm": 0.0329438451, "date": "2023-03-24"},
-    {"Station_Number": "2260600", "norm": 0.0332076069, "date": "2023-03-25"},
-    {"Station_Number": "2260600", "norm": 0.0335768734, "date": "2023-03-26"},
-    {"Station_Number": "2260600", "norm": 0.0349484346, "date": "2023-03-27"},
-    {"Station_Number": "2260600", "norm": 0.0379025664, "date": "2023-03-28"},
-    {"Station_Number": "2260600", "norm": 0.0414633503, "date": "2023-03-29"},
-    {"Station_Number": "2260600", "norm": 0.0447339963, "date": "2023-03-30"},
-    {"Station_Number": "2260600", "norm": 0.0528051064, "date": "2023-03-31"},
-    {"Station_Number": "2260600", "norm": 0.0587661224, "date": "2023-04-01"},
-    {"Station_Number": "2260600", "norm": 0.0587661224, "date": "2023-04-02"},
-    {"Station_Number": "2260600", "norm": 0.0552317147, "date": "2023-04-03"},
-    {"Station_Number": "2260600", "norm": 0.0520929496, "date": "2023-04-04"},
-    {"Station_Number": "2260600", "norm": 0.0501411125, "date": "2023-04-05"},
-    {"Station_Number": "2260600", "norm": 0.049903727, "date": "2023-04-06"},
-    {"Station_Number": "2260600", "norm": 0.049903727, "date": "2023-04-07"},
-    {"Station_Number": "2260600", "norm": 0.0495344605, "date": "2023-04-08"},
-    {"Station_Number": "2260600", "norm": 0.0478463851, "date": "2023-04-09"},
-    {"Station_Number": "2260600", "norm": 0.0469232189, "date": "2023-04-10"},
-    {"Station_Number": "2260600", "norm": 0.0502466173, "date": "2023-04-11"},
-    {"Station_Number": "2260600", "norm": 0.0577374515, "date": "2023-04-12"},
-    {"Station_Number": "2260600", "norm": 0.0605860787, "date": "2023-04-13"},
-    {"Station_Number": "2260600", "norm": 0.0600058028, "date": "2023-04-14"},
-    {"Station_Number": "2260600", "norm": 0.0579220848, "date": "2023-04-15"},
-    {"Station_Number": "2260600", "norm": 0.0554954765, "date": "2023-04-16"},
-    {"Station_Number": "2260600", "norm": 0.0526996017, "date": "2023-04-17"},
-    {"Station_Number": "2260600", "norm": 0.0501411125, "date": "2023-04-18"},
-    {"Station_Number": "2260600", "norm": 0.0477672566, "date": "2023-04-19"},
-    {"Station_Number": "2260600", "norm": 0.0460000528, "date": "2023-04-20"},
-    {"Station_Number": "2260600", "norm": 0.0447867486, "date": "2023-04-21"},
-    {"Station_Number": "2260600", "norm": 0.0434943159, "date": "2023-04-22"},
-    {"Station_Number": "2260600", "norm": 0.042307388, "date": "2023-04-23"},
-    {"Station_Number": "2260600", "norm": 0.0413050932, "date": "2023-04-24"},
-    {"Station_Number": "2260600", "norm": 0.0411468362, "date": "2023-04-25"},
-    {"Station_Number": "2260600", "norm": 0.0421491309, "date": "2023-04-26"},
-    {"Station_Number": "2260600", "norm": 0.0434943159, "date": "2023-04-27"},
-    {"Station_Number": "2260600", "norm": 0.0431778018, "date": "2023-04-28"},
-    {"Station_Number": "2260600", "norm": 0.0423865165, "date": "2023-04-29"},
-    {"Station_Number": "2260600", "norm": 0.0430195447, "date": "2023-04-30"},
-    {"Station_Number": "2260600", "norm": 0.0449450057, "date": "2023-05-01"},
-    {"Station_Number": "2260600", "norm": 0.0467649619, "date": "2023-05-02"},
-    {"Station_Number": "2260600", "norm": 0.0467649619, "date": "2023-05-03"},
-    {"Station_Number": "2260600", "norm": 0.0461055575, "date": "2023-05-04"},
-    {"Station_Number": "2260600", "norm": 0.0452615198, "date": "2023-05-05"},
-    {"Station_Number": "2260600", "norm": 0.0447867486, "date": "2023-05-06"},
-    {"Station_Number": "2260600", "norm": 0.0438108301, "date": "2023-05-07"},
-    {"Station_Number": "2260600", "norm": 0.0426239021, "date": "2023-05-08"},
-    {"Station_Number": "2260600", "norm": 0.0430195447, "date": "2023-05-09"},
-    {"Station_Number": "2260600", "norm": 0.0419908738, "date": "2023-05-10"},
-    {"Station_Number": "2260600", "norm": 0.045287896, "date": "2023-05-11"},
-    {"Station_Number": "2260600", "norm": 0.0511961596, "date": "2023-05-12"},
-    {"Station_Number": "2260600", "norm": 0.05422942, "date": "2023-05-13"},
-    {"Station_Number": "2260600", "norm": 0.066599847, "date": "2023-05-14"},
-    {"Station_Number": "2260600", "norm": 0.1456756258, "date": "2023-05-15"},
-    {"Station_Number": "2260600", "norm": 0.1293487722, "date": "2023-05-16"},
-    {"Station_Number": "2260600", "norm": 0.0959829082, "date": "2023-05-17"},
-    {"Station_Number": "2260600", "norm": 0.0800516973, "date": "2023-05-18"},
-    {"Station_Number": "2260600", "norm": 0.0638303484, "date": "2023-05-19"},
-    {"Station_Number": "2260600", "norm": 0.0582913513, "date": "2023-05-20"},
-    {"Station_Number": "2260600", "norm": 0.0564450189, "date": "2023-05-21"},
-    {"Station_Number": "2260600", "norm": 0.0493762034, "date": "2023-05-22"},
-    {"Station_Number": "2260600", "norm": 0.0468440904, "date": "2023-05-23"},
-    {"Station_Number": "2260600", "norm": 0.0551525862, "date": "2023-05-24"},
-    {"Station_Number": "2260600", "norm": 0.0593463983, "date": "2023-05-25"},
-    {"Station_Number": "2260600", "norm": 0.0586606177, "date": "2023-05-26"},
-    {"Station_Number": "2260600", "norm": 0.0569725424, "date": "2023-05-27"},
-    {"Station_Number": "2260600", "norm": 0.0532535014, "date": "2023-05-28"},
-    {"Station_Number": "2260600", "norm": 0.0543349247, "date": "2023-05-29"},
-    {"Station_Number": "2260600", "norm": 0.0560493762, "date": "2023-05-30"},
-    {"Station_Number": "2260600", "norm": 0.0556009812, "date": "2023-05-31"},
-    {"Station_Number": "2260600", "norm": 0.0552317147, "date": "2023-06-01"},
-    {"Station_Number": "2260600", "norm": 0.0520929496, "date": "2023-06-02"},
-    {"Station_Number": "2260600", "norm": 0.0507477646, "date": "2023-06-03"},
-    {"Station_Number": "2260600", "norm": 0.0538865297, "date": "2023-06-04"},
-    {"Station_Number": "2260600", "norm": 0.0586078654, "date": "2023-06-05"},
-    {"Station_Number": "2260600", "norm": 0.0618521352, "date": "2023-06-06"},
-    {"Station_Number": "2260600", "norm": 0.0606915834, "date": "2023-06-07"},
-    {"Station_Number": "2260600", "norm": 0.0591353889, "date": "2023-06-08"},
-    {"Station_Number": "2260600", "norm": 0.0592408936, "date": "2023-06-09"},
-    {"Station_Number": "2260600", "norm": 0.0583704798, "date": "2023-06-10"},
-    {"Station_Number": "2260600", "norm": 0.0604014454, "date": "2023-06-11"},
-    {"Station_Number": "2260600", "norm": 0.0607970881, "date": "2023-06-12"},
-    {"Station_Number": "2260600", "norm": 0.0596365363, "date": "2023-06-13"},
-    {"Station_Number": "2260600", "norm": 0.0595310316, "date": "2023-06-14"},
-    {"Station_Number": "2260600", "norm": 0.0604014454, "date": "2023-06-15"},
-    {"Station_Number": "2260600", "norm": 0.061087226, "date": "2023-06-16"},
-    {"Station_Number": "2260600", "norm": 0.0685253079, "date": "2023-06-17"},
-    {"Station_Number": "2260600", "norm": 0.0971698362, "date": "2023-06-18"},
-    {"Station_Number": "2260600", "norm": 0.1430907604, "date": "2023-06-19"},
-    {"Station_Number": "2260600", "norm": 0.1904623744, "date": "2023-06-20"},
-    {"Station_Number": "2260600", "norm": 0.2355656371, "date": "2023-06-21"},
-    {"Station_Number": "2260600", "norm": 0.2764223353, "date": "2023-06-22"},
-    {"Station_Number": "2260600", "norm": 0.3089441616, "date": "2023-06-23"},
-    {"Station_Number": "2260600", "norm": 0.3233719305, "date": "2023-06-24"},
-    {"Station_Number": "2260600", "norm": 0.3289109277, "date": "2023-06-25"},
-    {"Station_Number": "2260600", "norm": 0.3312847836, "date": "2023-06-26"},
-    {"Station_Number": "2260600", "norm": 0.3347136866, "date": "2023-06-27"},
-    {"Station_Number": "2260600", "norm": 0.3402526838, "date": "2023-06-28"},
-    {"Station_Number": "2260600", "norm": 0.3619602775, "date": "2023-06-29"},
-    {"Station_Number": "2260600", "norm": 0.388705721, "date": "2023-06-30"},
-    {"Station_Number": "2260600", "norm": 0.4069844117, "date": "2023-07-01"},
-    {"Station_Number": "2260600", "norm": 0.4157676786, "date": "2023-07-02"},
-    {"Station_Number": "2260600", "norm": 0.4075910638, "date": "2023-07-03"},
-    {"Station_Number": "2260600", "norm": 0.3832458523, "date": "2023-07-04"},
-    {"Station_Number": "2260600", "norm": 0.366365099, "date": "2023-07-05"},
-    {"Station_Number": "2260600", "norm": 0.3471104898, "date": "2023-07-06"},
-    {"Station_Number": "2260600", "norm": 0.336560019, "date": "2023-07-07"},
-    {"Station_Number": "2260600", "norm": 0.3304934983, "date": "2023-07-08"},
-    {"Station_Number": "2260600", "norm": 0.3268008335, "date": "2023-07-09"},
-    {"Station_Number": "2260600", "norm": 0.3294384512, "date": "2023-07-10"},
-    {"Station_Number": "2260600", "norm": 0.3455279192, "date": "2023-07-11"},
-    {"Station_Number": "2260600", "norm": 0.3777068552, "date": "2023-07-12"},
-    {"Station_Number": "2260600", "norm": 0.4315933849, "date": "2023-07-13"},
-    {"Station_Number": "2260600", "norm": 0.4807585789, "date": "2023-07-14"},
-    {"Station_Number": "2260600", "norm": 0.5204811015, "date": "2023-07-15"},
-    {"Station_Number": "2260600", "norm": 0.549758658, "date": "2023-07-16"},
-    {"Station_Number": "2260600", "norm": 0.5719146467, "date": "2023-07-17"},
-    {"Station_Number": "2260600", "norm": 0.5903779706, "date": "2023-07-18"},
-    {"Station_Number": "2260600", "norm": 0.614564925, "date": "2023-07-19"},
-    {"Station_Number": "2260600", "norm": 0.635138343, "date": "2023-07-20"},
-    {"Station_Number": "2260600", "norm": 0.6567668082, "date": "2023-07-21"},
-    {"Station_Number": "2260600", "norm": 0.6805053676, "date": "2023-07-22"},
-    {"Station_Number": "2260600", "norm": 0.7042439269, "date": "2023-07-23"},
-    {"Station_Number": "2260600", "norm": 0.7211246802, "date": "2023-07-24"},
-    {"Station_Number": "2260600", "norm": 0.7279824862, "date": "2023-07-25"},
-    {"Station_Number": "2260600", "norm": 0.7159285733, "date": "2023-07-26"},
-    {"Station_Number": "2260600", "norm": 0.672671643, "date": "2023-07-27"},
-    {"Station_Number": "2260600", "norm": 0.6116635455, "date": "2023-07-28"},
-    {"Station_Number": "2260600", "norm": 0.5471210403, "date": "2023-07-29"},
-    {"Station_Number": "2260600", "norm": 0.4910452879, "date": "2023-07-30"},
-    {"Station_Number": "2260600", "norm": 0.4529580883, "date": "2023-07-31"},
-    {"Station_Number": "2260600", "norm": 0.4322264131, "date": "2023-08-01"},
-    {"Station_Number": "2260600", "norm": 0.4294832907, "date": "2023-08-02"},
-    {"Station_Number": "2260600", "norm": 0.4437264263, "date": "2023-08-03"},
-    {"Station_Number": "2260600", "norm": 0.4627172738, "date": "2023-08-04"},
-    {"Station_Number": "2260600", "norm": 0.4759053623, "date": "2023-08-05"},
-    {"Station_Number": "2260600", "norm": 0.482420278, "date": "2023-08-06"},
-    {"Station_Number": "2260600", "norm": 0.4807585789, "date": "2023-08-07"},
-    {"Station_Number": "2260600", "norm": 0.4765383905, "date": "2023-08-08"},
-    {"Station_Number": "2260600", "norm": 0.4836599583, "date": "2023-08-09"},
-    {"Station_Number": "2260600", "norm": 0.4981668557, "date": "2023-08-10"},
-    {"Station_Number": "2260600", "norm": 0.5292907446, "date": "2023-08-11"},
-    {"Station_Number": "2260600", "norm": 0.6153562103, "date": "2023-08-12"},
-    {"Station_Number": "2260600", "norm": 0.6514124443, "date": "2023-08-13"},
-    {"Station_Number": "2260600", "norm": 0.6883390921, "date": "2023-08-14"},
-    {"Station_Number": "2260600", "norm": 0.7244744547, "date": "2023-08-15"},
-    {"Station_Number": "2260600", "norm": 0.7573391713, "date": "2023-08-16"},
-    {"Station_Number": "2260600", "norm": 0.7826603012, "date": "2023-08-17"},
-    {"Station_Number": "2260600", "norm": 0.8053438135, "date": "2023-08-18"},
-    {"Station_Number": "2260600", "norm": 0.8271569119, "date": "2023-08-19"},
-    {"Station_Number": "2260600", "norm": 0.850710838, "date": "2023-08-20"},
-    {"Station_Number": "2260600", "norm": 0.8636351647, "date": "2023-08-21"},
-    {"Station_Number": "2260600", "norm": 0.8685675098, "date": "2023-08-22"},
-    {"Station_Number": "2260600", "norm": 0.8685675098, "date": "2023-08-23"},
-    {"Station_Number": "2260600", "norm": 0.8565135969, "date": "2023-08-24"},
-    {"Station_Number": "2260600", "norm": 0.8315617334, "date": "2023-08-25"},
-    {"Station_Number": "2260600", "norm": 0.8015720202, "date": "2023-08-26"},
-    {"Station_Number": "2260600", "norm": 0.774589191, "date": "2023-08-27"},
-    {"Station_Number": "2260600", "norm": 0.7582359613, "date": "2023-08-28"},
-    {"Station_Number": "2260600", "norm": 0.7540949015, "date": "2023-08-29"},
-    {"Station_Number": "2260600", "norm": 0.756996281, "date": "2023-08-30"},
-    {"Station_Number": "2260600", "norm": 0.7678896421, "date": "2023-08-31"},
-    {"Station_Number": "2260600", "norm": 0.7763300187, "date": "2023-09-01"},
-    {"Station_Number": "2260600", "norm": 0.7831086962, "date": "2023-09-02"},
-    {"Station_Number": "2260600", "norm": 0.805871337, "date": "2023-09-03"},
-    {"Station_Number": "2260600", "norm": 0.8735789835, "date": "2023-09-04"},
-    {"Station_Number": "2260600", "norm": 0.9043599821, "date": "2023-09-05"},
-    {"Station_Number": "2260600", "norm": 0.9355629995, "date": "2023-09-06"},
-    {"Station_Number": "2260600", "norm": 0.97467887, "date": "2023-09-07"},
-    {"Station_Number": "2260600", "norm": 1.0, "date": "2023-09-08"},
-    {"Station_Number": "2260600", "norm": 0.9946456361, "date": "2023-09-09"},
-    {"Station_Number": "2260600", "norm": 0.958431145, "date": "2023-09-10"},
-    {"Station_Number": "2260600", "norm": 0.9218473874, "date": "2023-09-11"},
-    {"Station_Number": "2260600", "norm": 0.8595996096, "date": "2023-09-12"},
-    {"Station_Number": "2260600", "norm": 0.7848759001, "date": "2023-09-13"},
-    {"Station_Number": "2260600", "norm": 0.6847255559, "date": "2023-09-14"},
-    {"Station_Number": "2260600", "norm": 0.6007701844, "date": "2023-09-15"},
-    {"Station_Number": "2260600", "norm": 0.5309524438, "date": "2023-09-16"},
-    {"Station_Number": "2260600", "norm": 0.4928916203, "date": "2023-09-17"},
-    {"Station_Number": "2260600", "norm": 0.5028090629, "date": "2023-09-18"},
-    {"Station_Number": "2260600", "norm": 0.5170521985, "date": "2023-09-19"},
-    {"Station_Number": "2260600", "norm": 0.5139925619, "date": "2023-09-20"},
-    {"Station_Number": "2260600", "norm": 0.5031783293, "date": "2023-09-21"},
-    {"Station_Number": "2260600", "norm": 0.4963205233, "date": "2023-09-22"},
-    {"Station_Number": "2260600", "norm": 0.4900693693, "date": "2023-09-23"},
-    {"Station_Number": "2260600", "norm": 0.4910452879, "date": "2023-09-24"},
-    {"Station_Number": "2260600", "norm": 0.4909397832, "date": "2023-09-25"},
-    {"Station_Number": "2260600", "norm": 0.475562472, "date": "2023-09-26"},
-    {"Station_Number": "2260600", "norm": 0.4644844776, "date": "2023-09-27"},
-    {"Station_Number": "2260600", "norm": 0.4664099385, "date": "2023-09-28"},
-    {"Station_Number": "2260600", "norm": 0.4985888745, "date": "2023-09-29"},
-    {"Station_Number": "2260600", "norm": 0.5174214649, "date": "2023-09-30"},
-    {"Station_Number": "2260600", "norm": 0.5181072455, "date": "2023-10-01"},
-    {"Station_Number": "2260600", "norm": 0.5047609, "date": "2023-10-02"},
-    {"Station_Number": "2260600", "norm": 0.4981668557, "date": "2023-10-03"},
-    {"Station_Number": "2260600", "norm": 0.4797826603, "date": "2023-10-04"},
-    {"Station_Number": "2260600", "norm": 0.4498984517, "date": "2023-10-05"},
-    {"Station_Number": "2260600", "norm": 0.4166644687, "date": "2023-10-06"},
-    {"Station_Number": "2260600", "norm": 0.3966977026, "date": "2023-10-07"},
-    {"Station_Number": "2260600", "norm": 0.3804236014, "date": "2023-10-08"},
-    {"Station_Number": "2260600", "norm": 0.3858043415, "date": "2023-10-09"},
-    {"Station_Number": "2260600", "norm": 0.3900245298, "date": "2023-10-10"},
-    {"Station_Number": "2260600", "norm": 0.4023158283, "date": "2023-10-11"},
-    {"Station_Number": "2260600", "norm": 0.4166644687, "date": "2023-10-12"},
-    {"Station_Number": "2260600", "norm": 0.4205153905, "date": "2023-10-13"},
-    {"Station_Number": "2260600", "norm": 0.4292195289, "date": "2023-10-14"},
-    {"Station_Number": "2260600", "norm": 0.4744282964, "date": "2023-10-15"},
-    {"Station_Number": "2260600", "norm": 0.5174214649, "date": "2023-10-16"},
-    {"Station_Number": "2260600", "norm": 0.546329755, "date": "2023-10-17"},
-    {"Station_Number": "2260600", "norm": 0.5557460502, "date": "2023-10-18"},
-    {"Station_Number": "2260600", "norm": 0.5445889273, "date": "2023-10-19"},
-    {"Station_Number": "2260600", "norm": 0.5207448632, "date": "2023-10-20"},
-    {"Station_Number": "2260600", "norm": 0.4849787672, "date": "2023-10-21"},
-    {"Station_Number": "2260600", "norm": 0.4401392662, "date": "2023-10-22"},
-    {"Station_Number": "2260600", "norm": 0.3872022789, "date": "2023-10-23"},
-    {"Station_Number": "2260600", "norm": 0.3471896183, "date": "2023-10-24"},
-    {"Station_Number": "2260600", "norm": 0.3203914225, "date": "2023-10-25"},
-    {"Station_Number": "2260600", "norm": 0.295149421, "date": "2023-10-26"},
-    {"Station_Number": "2260600", "norm": 0.2778202727, "date": "2023-10-27"},
-    {"Station_Number": "2260600", "norm": 0.263999156, "date": "2023-10-28"},
-    {"Station_Number": "2260600", "norm": 0.2599372247, "date": "2023-10-29"},
-    {"Station_Number": "2260600", "norm": 0.2579326352, "date": "2023-10-30"},
-    {"Station_Number": "2260600", "norm": 0.2499406536, "date": "2023-10-31"},
-    {"Station_Number": "2260600", "norm": 0.2293936117, "date": "2023-11-01"},
-    {"Station_Number": "2260600", "norm": 0.2231688339, "date": "2023-11-02"},
-    {"Station_Number": "2260600", "norm": 0.2252261757, "date": "2023-11-03"},
-    {"Station_Number": "2260600", "norm": 0.2184474982, "date": "2023-11-04"},
-    {"Station_Number": "2260600", "norm": 0.2033339488, "date": "2023-11-05"},
-    {"Station_Number": "2260600", "norm": 0.1910954026, "date": "2023-11-06"},
-    {"Station_Number": "2260600", "norm": 0.1803602986, "date": "2023-11-07"},
-    {"Station_Number": "2260600", "norm": 0.1693086804, "date": "2023-11-08"},
-    {"Station_Number": "2260600", "norm": 0.16358505, "date": "2023-11-09"},
-    {"Station_Number": "2260600", "norm": 0.1569646295, "date": "2023-11-10"},
-    {"Station_Number": "2260600", "norm": 0.1516366418, "date": "2023-11-11"},
-    {"Station_Number": "2260600", "norm": 0.1469153061, "date": "2023-11-12"},
-    {"Station_Number": "2260600", "norm": 0.1425896131, "date": "2023-11-13"},
-    {"Station_Number": "2260600", "norm": 0.1374198824, "date": "2023-11-14"},
-    {"Station_Number": "2260600", "norm": 0.1343338696, "date": "2023-11-15"},
-    {"Station_Number": "2260600", "norm": 0.1309840952, "date": "2023-11-16"},
-    {"Station_Number": "2260600", "norm": 0.127528816, "date": "2023-11-17"},
-    {"Station_Number": "2260600", "norm": 0.1305357002, "date": "2023-11-18"},
-    {"Station_Number": "2260600", "norm": 0.1415081898, "date": "2023-11-19"},
-    {"Station_Number": "2260600", "norm": 0.1405586474, "date": "2023-11-20"},
-    {"Station_Number": "2260600", "norm": 0.1416664469, "date": "2023-11-21"},
-    {"Station_Number": "2260600", "norm": 0.1521377891, "date": "2023-11-22"},
-    {"Station_Number": "2260600", "norm": 0.1654841347, "date": "2023-11-23"},
-    {"Station_Number": "2260600", "norm": 0.1726584549, "date": "2023-11-24"},
-    {"Station_Number": "2260600", "norm": 0.1722891884, "date": "2023-11-25"},
-    {"Station_Number": "2260600", "norm": 0.1694669375, "date": "2023-11-26"},
-    {"Station_Number": "2260600", "norm": 0.1606836705, "date": "2023-11-27"},
-    {"Station_Number": "2260600", "norm": 0.1482077388, "date": "2023-11-28"},
-    {"Station_Number": "2260600", "norm": 0.1364967162, "date": "2023-11-29"},
-    {"Station_Number": "2260600", "norm": 0.1266584021, "date": "2023-11-30"},
-    {"Station_Number": "2260600", "norm": 0.119642339, "date": "2023-12-01"},
-    {"Station_Number": "2260600", "norm": 0.1170838499, "date": "2023-12-02"},
-    {"Station_Number": "2260600", "norm": 0.1139978372, "date": "2023-12-03"},
-    {"Station_Number": "2260600", "norm": 0.110542558, "date": "2023-12-04"},
-    {"Station_Number": "2260600", "norm": 0.1070081502, "date": "2023-12-05"},
-    {"Station_Number": "2260600", "norm": 0.103552871, "date": "2023-12-06"},
-    {"Station_Number": "2260600", "norm": 0.1006778677, "date": "2023-12-07"},
-    {"Station_Number": "2260600", "norm": 0.0979874977, "date": "2023-12-08"},
-    {"Station_Number": "2260600", "norm": 0.0960884129, "date": "2023-12-09"},
-    {"Station_Number": "2260600", "norm": 0.09445309, "date": "2023-12-10"},
-    {"Station_Number": "2260600", "norm": 0.0902329016, "date": "2023-12-11"},
-    {"Station_Number": "2260600", "norm": 0.089388864, "date": "2023-12-12"},
-    {"Station_Number": "2260600", "norm": 0.090734049, "date": "2023-12-13"},
-    {"Station_Number": "2260600", "norm": 0.0929496479, "date": "2023-12-14"},
-    {"Station_Number": "2260600", "norm": 0.0947959803, "date": "2023-12-15"},
-    {"Station_Number": "2260600", "norm": 0.0956927703, "date": "2023-12-16"},
-    {"Station_Number": "2260600", "norm": 0.0977237359, "date": "2023-12-17"},
-    {"Station_Number": "2260600", "norm": 0.0983831403, "date": "2023-12-18"},
-    {"Station_Number": "2260600", "norm": 0.0960884129, "date": "2023-12-19"},
-    {"Station_Number": "2260600", "norm": 0.0911033155, "date": "2023-12-20"},
-    {"Station_Number": "2260600", "norm": 0.0873578983, "date": "2023-12-21"},
-    {"Station_Number": "2260600", "norm": 0.0846411521, "date": "2023-12-22"},
-    {"Station_Number": "2260600", "norm": 0.0830058291, "date": "2023-12-23"},
-    {"Station_Number": "2260600", "norm": 0.0813705062, "date": "2023-12-24"},
-    {"Station_Number": "2260600", "norm": 0.0798934402, "date": "2023-12-25"},
-    {"Station_Number": "2260600", "norm": 0.0778888508, "date": "2023-12-26"},
-    {"Station_Number": "2260600", "norm": 0.0755677472, "date": "2023-12-27"},
-    {"Station_Number": "2260600", "norm": 0.0731675151, "date": "2023-12-28"},
-    {"Station_Number": "2260600", "norm": 0.0719805871, "date": "2023-12-29"},
-    {"Station_Number": "2260600", "norm": 0.0705826498, "date": "2023-12-30"},
-    {"Station_Number": "2260600", "norm": 0.0700551262, "date": "2023-12-31"},
-    {"Station_Number": "2260700", "norm": 0.0646200302, "date": "2020-01-01"},
-    {"Station_Number": "2260700", "norm": 0.0637896326, "date": "2020-01-02"},
-    {"Station_Number": "2260700", "norm": 0.0632108707, "date": "2020-01-03"},
-    {"Station_Number": "2260700", "norm": 0.0626321087, "date": "2020-01-04"},
-    {"Station_Number": "2260700", "norm": 0.062154001, "date": "2020-01-05"},
-    {"Station_Number": "2260700", "norm": 0.0618017111, "date": "2020-01-06"},
-    {"Station_Number": "2260700", "norm": 0.0616758933, "date": "2020-01-07"},
-    {"Station_Number": "2260700", "norm": 0.0625062909, "date": "2020-01-08"},
-    {"Station_Number": "2260700", "norm": 0.0628585808, "date": "2020-01-09"},
-    {"Station_Number": "2260700", "norm": 0.0622798188, "date": "2020-01-10"},
-    {"Station_Number": "2260700", "norm": 0.062154001, "date": "2020-01-11"},
-    {"Station_Number": "2260700", "norm": 0.0635631605, "date": "2020-01-12"},
-    {"Station_Number": "2260700", "norm": 0.06532461, "date": "2020-01-13"},
-    {"Station_Number": "2260700", "norm": 0.0688475088, "date": "2020-01-14"},
-    {"Station_Number": "2260700", "norm": 0.074484147, "date": "2020-01-15"},
-    {"Station_Number": "2260700", "norm": 0.0785858078, "date": "2020-01-16"},
-    {"Station_Number": "2260700", "norm": 0.0764720684, "date": "2020-01-17"},
-    {"Station_Number": "2260700", "norm": 0.0727226975, "date": "2020-01-18"},
-    {"Station_Number": "2260700", "norm": 0.0695520886, "date": "2020-01-19"},
-    {"Station_Number": "2260700", "norm": 0.0674383493, "date": "2020-01-20"},
-    {"Station_Number": "2260700", "norm": 0.0656768998, "date": "2020-01-21"},
-    {"Station_Number": "2260700", "norm": 0.0642677403, "date": "2020-01-22"},
-    {"Station_Number": "2260700", "norm": 0.0625062909, "date": "2020-01-23"},
-    {"Station_Number": "2260700", "norm": 0.0604177151, "date": "2020-01-24"},
-    {"Station_Number": "2260700", "norm": 0.058983392, "date": "2020-01-25"},
-    {"Station_Number": "2260700", "norm": 0.0582788123, "date": "2020-01-26"},
-    {"Station_Number": "2260700", "norm": 0.0567689985, "date": "2020-01-27"},
-    {"Station_Number": "2260700", "norm": 0.0555611475, "date": "2020-01-28"},
-    {"Station_Number": "2260700", "norm": 0.0543532964, "date": "2020-01-29"},
-    {"Station_Number": "2260700", "norm": 0.0531454454, "date": "2020-01-30"},
-    {"Station_Number": "2260700", "norm": 0.0525415199, "date": "2020-01-31"},
-    {"Station_Number": "2260700", "norm": 0.0528434826, "date": "2020-02-01"},
-    {"Station_Number": "2260700", "norm": 0.0551585304, "date": "2020-02-02"},
-    {"Station_Number": "2260700", "norm": 0.056165073, "date": "2020-02-03"},
-    {"Station_Number": "2260700", "norm": 0.0555611475, "date": "2020-02-04"},
-    {"Station_Number": "2260700", "norm": 0.0548565677, "date": "2020-02-05"},
-    {"Station_Number": "2260700", "norm": 0.0542526422, "date": "2020-02-06"},
-    {"Station_Number": "2260700", "norm": 0.0531454454, "date": "2020-02-07"},
-    {"Station_Number": "2260700", "norm": 0.0521389029, "date": "2020-02-08"},
-    {"Station_Number": "2260700", "norm": 0.0518369401, "date": "2020-02-09"},
-    {"Station_Number": "2260700", "norm": 0.0523402114, "date": "2020-02-10"},
-    {"Station_Number": "2260700", "norm": 0.0503271263, "date": "2020-02-11"},
-    {"Station_Number": "2260700", "norm": 0.0495218923, "date": "2020-02-12"},
-    {"Station_Number": "2260700", "norm": 0.049018621, "date": "2020-02-13"},
-    {"Station_Number": "2260700", "norm": 0.0480120785, "date": "2020-02-14"},
-    {"Station_Number": "2260700", "norm": 0.047005536, "date": "2020-02-15"},
-    {"Station_Number": "2260700", "norm": 0.0464016105, "date": "2020-02-16"},
-    {"Station_Number": "2260700", "norm": 0.0458983392, "date": "2020-02-17"},
-    {"Station_Number": "2260700", "norm": 0.0455963764, "date": "2020-02-18"},
-    {"Station_Number": "2260700", "norm": 0.0452944137, "date": "2020-02-19"},
-    {"Station_Number": "2260700", "norm": 0.0449924509, "date": "2020-02-20"},
-    {"Station_Number": "2260700", "norm": 0.0444891797, "date": "2020-02-21"},
-    {"Station_Number": "2260700", "norm": 0.0437845999, "date": "2020-02-22"},
-    {"Station_Number": "2260700", "norm": 0.0434826371, "date": "2020-02-23"},
-    {"Station_Number": "2260700", "norm": 0.0428787116, "date": "2020-02-24"},
-    {"Station_Number": "2260700", "norm": 0.0425767489, "date": "2020-02-25"},
-    {"Station_Number": "2260700", "norm": 0.0428787116, "date": "2020-02-26"},
-    {"Station_Number": "2260700", "norm": 0.0435832914, "date": "2020-02-27"},
-    {"Station_Number": "2260700", "norm": 0.0440865627, "date": "2020-02-28"},
-    {"Station_Number": "2260700", "norm": 0.0434826371, "date": "2020-02-29"},
-    {"Station_Number": "2260700", "norm": 0.0431806744, "date": "2020-03-01"},
-    {"Station_Number": "2260700", "norm": 0.0434826371, "date": "2020-03-02"},
-    {"Station_Number": "2260700", "norm": 0.0431806744, "date": "2020-03-03"},
-    {"Station_Number": "2260700", "norm": 0.0428787116, "date": "2020-03-04"},
-    {"Station_Number": "2260700", "norm": 0.0422747861, "date": "2020-03-05"},
-    {"Station_Number": "2260700", "norm": 0.0414695521, "date": "2020-03-06"},
-    {"Station_Number": "2260700", "norm": 0.0407649723, "date": "2020-03-07"},
-    {"Station_Number": "2260700", "norm": 0.0401610468, "date": "2020-03-08"},
-    {"Station_Number": "2260700", "norm": 0.0422747861, "date": "2020-03-09"},
-    {"Station_Number": "2260700", "norm": 0.0443885254, "date": "2020-03-10"},
-    {"Station_Number": "2260700", "norm": 0.0452944137, "date": "2020-03-11"},
-    {"Station_Number": "2260700", "norm": 0.0443885254, "date": "2020-03-12"},
-    {"Station_Number": "2260700", "norm": 0.0432813286, "date": "2020-03-13"},
-    {"Station_Number": "2260700", "norm": 0.0425767489, "date": "2020-03-14"},
-    {"Station_Number": "2260700", "norm": 0.0436839456, "date": "2020-03-15"},
-    {"Station_Number": "2260700", "norm": 0.0449924509, "date": "2020-03-16"},
-    {"Station_Number": "2260700", "norm": 0.0452944137, "date": "2020-03-17"},
-    {"Station_Number": "2260700", "norm": 0.0446904882, "date": "2020-03-18"},
-    {"Station_Number": "2260700", "norm": 0.0440865627, "date": "2020-03-19"},
-    {"Station_Number": "2260700", "norm": 0.0440865627, "date": "2020-03-20"},
-    {"Station_Number": "2260700", "norm": 0.0449924509, "date": "2020-03-21"},
-    {"Station_Number": "2260700", "norm": 0.0452944137, "date": "2020-03-22"},
-    {"Station_Number": "2260700", "norm": 0.0449924509, "date": "2020-03-23"},
-    {"Station_Number": "2260700", "norm": 0.0446904882, "date": "2020-03-24"},
-    {"Station_Number": "2260700", "norm": 0.0440865627, "date": "2020-03-25"},
-    {"Station_Number": "2260700", "norm": 0.0434826371, "date": "2020-03-26"},
-    {"Station_Number": "2260700", "norm": 0.0431806744, "date": "2020-03-27"},
-    {"Station_Number": "2260700", "norm": 0.0433819829, "date": "2020-03-28"},
-    {"Station_Number": "2260700", "norm": 0.0437845999, "date": "2020-03-29"},
-    {"Station_Number": "2260700", "norm": 0.0434826371, "date": "2020-03-30"},
-    {"Station_Number": "2260700", "norm": 0.0425767489, "date": "2020-03-31"},
-    {"Station_Number": "2260700", "norm": 0.0415702063, "date": "2020-04-01"},
-    {"Station_Number": "2260700", "norm": 0.039859084, "date": "2020-04-02"},
-    {"Station_Number": "2260700", "norm": 0.0392551585, "date": "2020-04-03"},
-    {"Station_Number": "2260700", "norm": 0.0397584298, "date": "2020-04-04"},
-    {"Station_Number": "2260700", "norm": 0.0404630096, "date": "2020-04-05"},
-    {"Station_Number": "2260700", "norm": 0.0404630096, "date": "2020-04-06"},
-    {"Station_Number": "2260700", "norm": 0.0401610468, "date": "2020-04-07"},
-    {"Station_Number": "2260700", "norm": 0.0411675893, "date": "2020-04-08"},
-    {"Station_Number": "2260700", "norm": 0.0434826371, "date": "2020-04-09"},
-    {"Station_Number": "2260700", "norm": 0.0468042275, "date": "2020-04-10"},
-    {"Station_Number": "2260700", "norm": 0.0483140413, "date": "2020-04-11"},
-    {"Station_Number": "2260700", "norm": 0.0473074987, "date": "2020-04-12"},
-    {"Station_Number": "2260700", "norm": 0.0452944137, "date": "2020-04-13"},
-    {"Station_Number": "2260700", "norm": 0.0440865627, "date": "2020-04-14"},
-    {"Station_Number": "2260700", "norm": 0.0428787116, "date": "2020-04-15"},
-    {"Station_Number": "2260700", "norm": 0.0416708606, "date": "2020-04-16"},
-    {"Station_Number": "2260700", "norm": 0.0401610468, "date": "2020-04-17"},
-    {"Station_Number": "2260700", "norm": 0.0389531958, "date": "2020-04-18"},
-    {"Station_Number": "2260700", "norm": 0.0381479618, "date": "2020-04-19"},
-    {"Station_Number": "2260700", "norm": 0.037443382, "date": "2020-04-20"},
-    {"Station_Number": "2260700", "norm": 0.0371414192, "date": "2020-04-21"},
-    {"Station_Number": "2260700", "norm": 0.0377453447, "date": "2020-04-22"},
-    {"Station_Number": "2260700", "norm": 0.038248616, "date": "2020-04-23"},
-    {"Station_Number": "2260700", "norm": 0.0389531958, "date": "2020-04-24"},
-    {"Station_Number": "2260700", "norm": 0.0395571213, "date": "2020-04-25"},
-    {"Station_Number": "2260700", "norm": 0.0405636638, "date": "2020-04-26"},
-    {"Station_Number": "2260700", "norm": 0.0434826371, "date": "2020-04-27"},
-    {"Station_Number": "2260700", "norm": 0.0483140413, "date": "2020-04-28"},
-    {"Station_Number": "2260700", "norm": 0.0528434826, "date": "2020-04-29"},
-    {"Station_Number": "2260700", "norm": 0.057372924, "date": "2020-04-30"},
-    {"Station_Number": "2260700", "norm": 0.062154001, "date": "2020-05-01"},
-    {"Station_Number": "2260700", "norm": 0.0667337695, "date": "2020-05-02"},
-    {"Station_Number": "2260700", "norm": 0.0702566683, "date": "2020-05-03"},
-    {"Station_Number": "2260700", "norm": 0.0715400101, "date": "2020-05-04"},
-    {"Station_Number": "2260700", "norm": 0.0720181178, "date": "2020-05-05"},
-    {"Station_Number": "2260700", "norm": 0.0720181178, "date": "2020-05-06"},
-    {"Station_Number": "2260700", "norm": 0.0709612481, "date": "2020-05-07"},
-    {"Station_Number": "2260700", "norm": 0.0695520886, "date": "2020-05-08"},
-    {"Station_Number": "2260700", "norm": 0.070734776, "date": "2020-05-09"},
-    {"Station_Number": "2260700", "norm": 0.0741318571, "date": "2020-05-10"},
-    {"Station_Number": "2260700", "norm": 0.0768243583, "date": "2020-05-11"},
-    {"Station_Number": "2260700", "norm": 0.0755410166, "date": "2020-05-12"},
-    {"Station_Number": "2260700", "norm": 0.0741318571, "date": "2020-05-13"},
-    {"Station_Number": "2260700", "norm": 0.0723704076, "date": "2020-05-14"},
-    {"Station_Number": "2260700", "norm": 0.0710870659, "date": "2020-05-15"},
-    {"Station_Number": "2260700", "norm": 0.0700301963, "date": "2020-05-16"},
-    {"Station_Number": "2260700", "norm": 0.0706089582, "date": "2020-05-17"},
-    {"Station_Number": "2260700", "norm": 0.071313538, "date": "2020-05-18"},
-    {"Station_Number": "2260700", "norm": 0.0709612481, "date": "2020-05-19"},
-    {"Station_Number": "2260700", "norm": 0.0695520886, "date": "2020-05-20"},
-    {"Station_Number": "2260700", "norm": 0.0680171112, "date": "2020-05-21"},
-    {"Station_Number": "2260700", "norm": 0.0661550075, "date": "2020-05-22"},
-    {"Station_Number": "2260700", "norm": 0.0665072974, "date": "2020-05-23"},
-    {"Station_Number": "2260700", "norm": 0.0699043785, "date": "2020-05-24"},
-    {"Station_Number": "2260700", "norm": 0.0718922999, "date": "2020-05-25"},
-    {"Station_Number": "2260700", "norm": 0.0721439356, "date": "2020-05-26"},
-    {"Station_Number": "2260700", "norm": 0.0730749874, "date": "2020-05-27"},
-    {"Station_Number": "2260700", "norm": 0.074484147, "date": "2020-05-28"},
-    {"Station_Number": "2260700", "norm": 0.0760191243, "date": "2020-05-29"},
-    {"Station_Number": "2260700", "norm": 0.0796426774, "date": "2020-05-30"},
-    {"Station_Number": "2260700", "norm": 0.0873930549, "date": "2020-05-31"},
-    {"Station_Number": "2260700", "norm": 0.1105686965, "date": "2020-06-01"},
-    {"Station_Number": "2260700", "norm": 0.1536738802, "date": "2020-06-02"},
-    {"Station_Number": "2260700", "norm": 0.1976346251, "date": "2020-06-03"},
-    {"Station_Number": "2260700", "norm": 0.2286361349, "date": "2020-06-04"},
-    {"Station_Number": "2260700", "norm": 0.2476094615, "date": "2020-06-05"},
-    {"Station_Number": "2260700", "norm": 0.2546552592, "date": "2020-06-06"},
-    {"Station_Number": "2260700", "norm": 0.2441117262, "date": "2020-06-07"},
-    {"Station_Number": "2260700", "norm": 0.224886764, "date": "2020-06-08"},
-    {"Station_Number": "2260700", "norm": 0.2046552592, "date": "2020-06-09"},
-    {"Station_Number": "2260700", "norm": 0.1854554605, "date": "2020-06-10"},
-    {"Station_Number": "2260700", "norm": 0.1742073478, "date": "2020-06-11"},
-    {"Station_Number": "2260700", "norm": 0.1721690991, "date": "2020-06-12"},
-    {"Station_Number": "2260700", "norm": 0.1767740312, "date": "2020-06-13"},
-    {"Station_Number": "2260700", "norm": 0.1834172119, "date": "2020-06-14"},
-    {"Station_Number": "2260700", "norm": 0.1917211877, "date": "2020-06-15"},
-    {"Station_Number": "2260700", "norm": 0.1954202315, "date": "2020-06-16"},
-    {"Station_Number": "2260700", "norm": 0.1970810267, "date": "2020-06-17"},
-    {"Station_Number": "2260700", "norm": 0.1909914444, "date": "2020-06-18"},
-    {"Station_Number": "2260700", "norm": 0.1932058379, "date": "2020-06-19"},
-    {"Station_Number": "2260700", "norm": 0.2112984399, "date": "2020-06-20"},
-    {"Station_Number": "2260700", "norm": 0.2340966281, "date": "2020-06-21"},
-    {"Station_Number": "2260700", "norm": 0.2540261701, "date": "2020-06-22"},
-    {"Station_Number": "2260700", "norm": 0.2747861097, "date": "2020-06-23"},
-    {"Station_Number": "2260700", "norm": 0.2999496729, "date": "2020-06-24"},
-    {"Station_Number": "2260700", "norm": 0.3370156014, "date": "2020-06-25"},
-    {"Station_Number": "2260700", "norm": 0.3765223956, "date": "2020-06-26"},
-    {"Station_Number": "2260700", "norm": 0.4194011072, "date": "2020-06-27"},
-    {"Station_Number": "2260700", "norm": 0.4549572219, "date": "2020-06-28"},
-    {"Station_Number": "2260700", "norm": 0.4885002516, "date": "2020-06-29"},
-    {"Station_Number": "2260700", "norm": 0.5029441369, "date": "2020-06-30"},
-    {"Station_Number": "2260700", "norm": 0.5135128334, "date": "2020-07-01"},
-    {"Station_Number": "2260700", "norm": 0.5223200805, "date": "2020-07-02"},
-    {"Station_Number": "2260700", "norm": 0.5259184701, "date": "2020-07-03"},
-    {"Station_Number": "2260700", "norm": 0.5259184701, "date": "2020-07-04"},
-    {"Station_Number": "2260700", "norm": 0.5249119275, "date": "2020-07-05"},
-    {"Station_Number": "2260700", "norm": 0.5296930045, "date": "2020-07-06"},
-    {"Station_Number": "2260700", "norm": 0.5390035229, "date": "2020-07-07"},
-    {"Station_Number": "2260700", "norm": 0.5470558631, "date": "2020-07-08"},
-    {"Station_Number": "2260700", "norm": 0.5603925516, "date": "2020-07-09"},
-    {"Station_Number": "2260700", "norm": 0.5729743332, "date": "2020-07-10"},
-    {"Station_Number": "2260700", "norm": 0.5832913941, "date": "2020-07-11"},
-    {"Station_Number": "2260700", "norm": 0.5965525918, "date": "2020-07-12"},
-    {"Station_Number": "2260700", "norm": 0.6111474585, "date": "2020-07-13"},
-    {"Station_Number": "2260700", "norm": 0.6255661802, "date": "2020-07-14"},
-    {"Station_Number": "2260700", "norm": 0.6445143432, "date": "2020-07-15"},
-    {"Station_Number": "2260700", "norm": 0.6602164066, "date": "2020-07-16"},
-    {"Station_Number": "2260700", "norm": 0.677075994, "date": "2020-07-17"},
-    {"Station_Number": "2260700", "norm": 0.6955208858, "date": "2020-07-18"},
-    {"Station_Number": "2260700", "norm": 0.7239557121, "date": "2020-07-19"},
-    {"Station_Number": "2260700", "norm": 0.7533215903, "date": "2020-07-20"},
-    {"Station_Number": "2260700", "norm": 0.7887015601, "date": "2020-07-21"},
-    {"Station_Number": "2260700", "norm": 0.820910921, "date": "2020-07-22"},
-    {"Station_Number": "2260700", "norm": 0.8440613991, "date": "2020-07-23"},
-    {"Station_Number": "2260700", "norm": 0.8605938601, "date": "2020-07-24"},
-    {"Station_Number": "2260700", "norm": 0.8789632612, "date": "2020-07-25"},
-    {"Station_Number": "2260700", "norm": 0.8913688978, "date": "2020-07-26"},
-    {"Station_Number": "2260700", "norm": 0.8960744841, "date": "2020-07-27"},
-    {"Station_Number": "2260700", "norm": 0.9125062909, "date": "2020-07-28"},
-    {"Station_Number": "2260700", "norm": 0.9317312531, "date": "2020-07-29"},
-    {"Station_Number": "2260700", "norm": 0.9520130851, "date": "2020-07-30"},
-    {"Station_Number": "2260700", "norm": 0.9738298943, "date": "2020-07-31"},
-    {"Station_Number": "2260700", "norm": 0.9828887771, "date": "2020-08-01"},
-    {"Station_Number": "2260700", "norm": 0.9889280322, "date": "2020-08-02"},
-    {"Station_Number": "2260700", "norm": 0.9894313035, "date": "2020-08-03"},
-    {"Station_Number": "2260700", "norm": 0.9954705586, "date": "2020-08-04"},
-    {"Station_Number": "2260700", "norm": 0.9758429794, "date": "2020-08-05"},
-    {"Station_Number": "2260700", "norm": 0.9521137393, "date": "2020-08-06"},
-    {"Station_Number": "2260700", "norm": 0.9031202818, "date": "2020-08-07"},
-    {"Station_Number": "2260700", "norm": 0.8356819326, "date": "2020-08-08"},
-    {"Station_Number": "2260700", "norm": 0.7659033719, "date": "2020-08-09"},
-    {"Station_Number": "2260700", "norm": 0.6887267237, "date": "2020-08-10"},
-    {"Station_Number": "2260700", "norm": 0.6257423251, "date": "2020-08-11"},
-    {"Station_Number": "2260700", "norm": 0.5650981379, "date": "2020-08-12"},
-    {"Station_Number": "2260700", "norm": 0.5140161047, "date": "2020-08-13"},
-    {"Station_Number": "2260700", "norm": 0.4921992954, "date": "2020-08-14"},
-    {"Station_Number": "2260700", "norm": 0.5051082033, "date": "2020-08-15"},
-    {"Station_Number": "2260700", "norm": 0.5437091092, "date": "2020-08-16"},
-    {"Station_Number": "2260700", "norm": 0.5837946653, "date": "2020-08-17"},
-    {"Station_Number": "2260700", "norm": 0.622118772, "date": "2020-08-18"},
-    {"Station_Number": "2260700", "norm": 0.6589582285, "date": "2020-08-19"},
-    {"Station_Number": "2260700", "norm": 0.7027428284, "date": "2020-08-20"},
-    {"Station_Number": "2260700", "norm": 0.7439104177, "date": "2020-08-21"},
-    {"Station_Number": "2260700", "norm": 0.777302466, "date": "2020-08-22"},
-    {"Station_Number": "2260700", "norm": 0.8100905888, "date": "2020-08-23"},
-    {"Station_Number": "2260700", "norm": 0.8451685959, "date": "2020-08-24"},
-    {"Station_Number": "2260700", "norm": 0.8829894313, "date": "2020-08-25"},
-    {"Station_Number": "2260700", "norm": 0.9355812783, "date": "2020-08-26"},
-    {"Station_Number": "2260700", "norm": 0.9672873679, "date": "2020-08-27"},
-    {"Station_Number": "2260700", "norm": 0.9894313035, "date": "2020-08-28"},
-    {"Station_Number": "2260700", "norm": 1.0, "date": "2020-08-29"},
-    {"Station_Number": "2260700", "norm": 0.9974836437, "date": "2020-08-30"},
-    {"Station_Number": "2260700", "norm": 0.9833920483, "date": "2020-08-31"},
-    {"Station_Number": "2260700", "norm": 0.9613236034, "date": "2020-09-01"},
-    {"Station_Number": "2260700", "norm": 0.9195520886, "date": "2020-09-02"},
-    {"Station_Number": "2260700", "norm": 0.8568193256, "date": "2020-09-03"},
-    {"Station_Number": "2260700", "norm": 0.797005536, "date": "2020-09-04"},
-    {"Station_Number": "2260700", "norm": 0.741645697, "date": "2020-09-05"},
-    {"Station_Number": "2260700", "norm": 0.7128082536, "date": "2020-09-06"},
-    {"Station_Number": "2260700", "norm": 0.6808505284, "date": "2020-09-07"},
-    {"Station_Number": "2260700", "norm": 0.6609713135, "date": "2020-09-08"},
-    {"Station_Number": "2260700", "norm": 0.6324358329, "date": "2020-09-09"},
-    {"Station_Number": "2260700", "norm": 0.5918470055, "date": "2020-09-10"},
-    {"Station_Number": "2260700", "norm": 0.5566935078, "date": "2020-09-11"},
-    {"Station_Number": "2260700", "norm": 0.5186210367, "date": "2020-09-12"},
-    {"Station_Number": "2260700", "norm": 0.4915198792, "date": "2020-09-13"},
-    {"Station_Number": "2260700", "norm": 0.4747609461, "date": "2020-09-14"},
-    {"Station_Number": "2260700", "norm": 0.4710619024, "date": "2020-09-15"},
-    {"Station_Number": "2260700", "norm": 0.4747609461, "date": "2020-09-16"},
-    {"Station_Number": "2260700", "norm": 0.4891796678, "date": "2020-09-17"},
-    {"Station_Number": "2260700", "norm": 0.5171867136, "date": "2020-09-18"},
-    {"Station_Number": "2260700", "norm": 0.5649974836, "date": "2020-09-19"},
-    {"Station_Number": "2260700", "norm": 0.6100402617, "date": "2020-09-20"},
-    {"Station_Number": "2260700", "norm": 0.636462003, "date": "2020-09-21"},
-    {"Station_Number": "2260700", "norm": 0.6602164066, "date": "2020-09-22"},
-    {"Station_Number": "2260700", "norm": 0.698792149, "date": "2020-09-23"},
-    {"Station_Number": "2260700", "norm": 0.710367388, "date": "2020-09-24"},
-    {"Station_Number": "2260700", "norm": 0.7146451938, "date": "2020-09-25"},
-    {"Station_Number": "2260700", "norm": 0.7196024157, "date": "2020-09-26"},
-    {"Station_Number": "2260700", "norm": 0.7253900352, "date": "2020-09-27"},
-    {"Station_Number": "2260700", "norm": 0.7281580272, "date": "2020-09-28"},
-    {"Station_Number": "2260700", "norm": 0.7244589834, "date": "2020-09-29"},
-    {"Station_Number": "2260700", "norm": 0.7258933065, "date": "2020-09-30"},
-    {"Station_Number": "2260700", "norm": 0.7339456467, "date": "2020-10-01"},
-    {"Station_Number": "2260700", "norm": 0.7519627579, "date": "2020-10-02"},
-    {"Station_Number": "2260700", "norm": 0.7764720684, "date": "2020-10-03"},
-    {"Station_Number": "2260700", "norm": 0.8039003523, "date": "2020-10-04"},
-    {"Station_Number": "2260700", "norm": 0.834851535, "date": "2020-10-05"},
-    {"Station_Number": "2260700", "norm": 0.8654504278, "date": "2020-10-06"},
-    {"Station_Number": "2260700", "norm": 0.9012833417, "date": "2020-10-07"},
-    {"Station_Number": "2260700", "norm": 0.9204831404, "date": "2020-10-08"},
-    {"Station_Number": "2260700", "norm": 0.926094615, "date": "2020-10-09"},
-    {"Station_Number": "2260700", "norm": 0.9167086059, "date": "2020-10-10"},
-    {"Station_Number": "2260700", "norm": 0.8922999497, "date": "2020-10-11"},
-    {"Station_Number": "2260700", "norm": 0.8546300956, "date": "2020-10-12"},
-    {"Station_Number": "2260700", "norm": 0.825289381, "date": "2020-10-13"},
-    {"Station_Number": "2260700", "norm": 0.7881982889, "date": "2020-10-14"},
-    {"Station_Number": "2260700", "norm": 0.746602919, "date": "2020-10-15"},
-    {"Station_Number": "2260700", "norm": 0.6951937594, "date": "2020-10-16"},
-    {"Station_Number": "2260700", "norm": 0.643608455, "date": "2020-10-17"},
-    {"Station_Number": "2260700", "norm": 0.5887518873, "date": "2020-10-18"},
-    {"Station_Number": "2260700", "norm": 0.5312028183, "date": "2020-10-19"},
-    {"Station_Number": "2260700", "norm": 0.4740815299, "date": "2020-10-20"},
-    {"Station_Number": "2260700", "norm": 0.4176396578, "date": "2020-10-21"},
-    {"Station_Number": "2260700", "norm": 0.3794665325, "date": "2020-10-22"},
-    {"Station_Number": "2260700", "norm": 0.3512833417, "date": "2020-10-23"},
-    {"Station_Number": "2260700", "norm": 0.3357574233, "date": "2020-10-24"},
-    {"Station_Number": "2260700", "norm": 0.33467539, "date": "2020-10-25"},
-    {"Station_Number": "2260700", "norm": 0.3568948163, "date": "2020-10-26"},
-    {"Station_Number": "2260700", "norm": 0.420734776, "date": "2020-10-27"},
-    {"Station_Number": "2260700", "norm": 0.5400855561, "date": "2020-10-28"},
-    {"Station_Number": "2260700", "norm": 0.6151736286, "date": "2020-10-29"},
-    {"Station_Number": "2260700", "norm": 0.6706844489, "date": "2020-10-30"},
-    {"Station_Number": "2260700", "norm": 0.7335933568, "date": "2020-10-31"},
-    {"Station_Number": "2260700", "norm": 0.7633870156, "date": "2020-11-01"},
-    {"Station_Number": "2260700", "norm": 0.7734524409, "date": "2020-11-02"},
-    {"Station_Number": "2260700", "norm": 0.777302466, "date": "2020-11-03"},
-    {"Station_Number": "2260700", "norm": 0.7612732763, "date": "2020-11-04"},
-    {"Station_Number": "2260700", "norm": 0.7326874685, "date": "2020-11-05"},
-    {"Station_Number": "2260700", "norm": 0.6805988928, "date": "2020-11-06"},
-    {"Station_Number": "2260700", "norm": 0.6233014595, "date": "2020-11-07"},
-    {"Station_Number": "2260700", "norm": 0.5775792652, "date": "2020-11-08"},
-    {"Station_Number": "2260700", "norm": 0.5496477101, "date": "2020-11-09"},
-    {"Station_Number": "2260700", "norm": 0.5304479114, "date": "2020-11-10"},
-    {"Station_Number": "2260700", "norm": 0.5064670357, "date": "2020-11-11"},
-    {"Station_Number": "2260700", "norm": 0.4774282838, "date": "2020-11-12"},
-    {"Station_Number": "2260700", "norm": 0.4421992954, "date": "2020-11-13"},
-    {"Station_Number": "2260700", "norm": 0.4048062406, "date": "2020-11-14"},
-    {"Station_Number": "2260700", "norm": 0.3616758933, "date": "2020-11-15"},
-    {"Station_Number": "2260700", "norm": 0.3283090086, "date": "2020-11-16"},
-    {"Station_Number": "2260700", "norm": 0.301207851, "date": "2020-11-17"},
-    {"Station_Number": "2260700", "norm": 0.2803220936, "date": "2020-11-18"},
-    {"Station_Number": "2260700", "norm": 0.2640412682, "date": "2020-11-19"},
-    {"Station_Number": "2260700", "norm": 0.2463009562, "date": "2020-11-20"},
-    {"Station_Number": "2260700", "norm": 0.2345244087, "date": "2020-11-21"},
-    {"Station_Number": "2260700", "norm": 0.2236537494, "date": "2020-11-22"},
-    {"Station_Number": "2260700", "norm": 0.2142425767, "date": "2020-11-23"},
-    {"Station_Number": "2260700", "norm": 0.2053850025, "date": "2020-11-24"},
-    {"Station_Number": "2260700", "norm": 0.1976346251, "date": "2020-11-25"},
-    {"Station_Number": "2260700", "norm": 0.1928283845, "date": "2020-11-26"},
-    {"Station_Number": "2260700", "norm": 0.1895067942, "date": "2020-11-27"},
-    {"Station_Number": "2260700", "norm": 0.1849018621, "date": "2020-11-28"},
-    {"Station_Number": "2260700", "norm": 0.1799194766, "date": "2020-11-29"},
-    {"Station_Number": "2260700", "norm": 0.1754906895, "date": "2020-11-30"},
-    {"Station_Number": "2260700", "norm": 0.170508304, "date": "2020-12-01"},
-    {"Station_Number": "2260700", "norm": 0.1661046804, "date": "2020-12-02"},
-    {"Station_Number": "2260700", "norm": 0.1620533468, "date": "2020-12-03"},
-    {"Station_Number": "2260700", "norm": 0.1580271766, "date": "2020-12-04"},
-    {"Station_Number": "2260700", "norm": 0.1540010065, "date": "2020-12-05"},
-    {"Station_Number": "2260700", "norm": 0.1496477101, "date": "2020-12-06"},
-    {"Station_Number": "2260700", "norm": 0.1454453951, "date": "2020-12-07"},
-    {"Station_Number": "2260700", "norm": 0.1414443885, "date": "2020-12-08"},
-    {"Station_Number": "2260700", "norm": 0.1381982889, "date": "2020-12-09"},
-    {"Station_Number": "2260700", "norm": 0.1345747358, "date": "2020-12-10"},
-    {"Station_Number": "2260700", "norm": 0.1314041268, "date": "2020-12-11"},
-    {"Station_Number": "2260700", "norm": 0.1282335179, "date": "2020-12-12"},
-    {"Station_Number": "2260700", "norm": 0.1252138903, "date": "2020-12-13"},
-    {"Station_Number": "2260700", "norm": 0.1224962255, "date": "2020-12-14"},
-    {"Station_Number": "2260700", "norm": 0.1202315048, "date": "2020-12-15"},
-    {"Station_Number": "2260700", "norm": 0.1179667841, "date": "2020-12-16"},
-    {"Station_Number": "2260700", "norm": 0.1157020634, "date": "2020-12-17"},
-    {"Station_Number": "2260700", "norm": 0.1137393055, "date": "2020-12-18"},
-    {"Station_Number": "2260700", "norm": 0.1123804731, "date": "2020-12-19"},
-    {"Station_Number": "2260700", "norm": 0.1105686965, "date": "2020-12-20"},
-    {"Station_Number": "2260700", "norm": 0.10875692, "date": "2020-12-21"},
-    {"Station_Number": "2260700", "norm": 0.1069451434, "date": "2020-12-22"},
-    {"Station_Number": "2260700", "norm": 0.1048314041, "date": "2020-12-23"},
-    {"Station_Number": "2260700", "norm": 0.1028686462, "date": "2020-12-24"},
-    {"Station_Number": "2260700", "norm": 0.1007549069, "date": "2020-12-25"},
-    {"Station_Number": "2260700", "norm": 0.098792149, "date": "2020-12-26"},
-    {"Station_Number": "2260700", "norm": 0.0969803724, "date": "2020-12-27"},
-    {"Station_Number": "2260700", "norm": 0.0952692501, "date": "2020-12-28"},
-    {"Station_Number": "2260700", "norm": 0.0938600906, "date": "2020-12-29"},
-    {"Station_Number": "2260700", "norm": 0.0924509311, "date": "2020-12-30"},
-    {"Station_Number": "2260700", "norm": 0.0916205335, "date": "2020-12-31"},
-    {"Station_Number": "2260700", "norm": 0.0988209487, "date": "2021-01-01"},
-    {"Station_Number": "2260700", "norm": 0.0976693172, "date": "2021-01-02"},
-    {"Station_Number": "2260700", "norm": 0.0965176858, "date": "2021-01-03"},
-    {"Station_Number": "2260700", "norm": 0.0951192761, "date": "2021-01-04"},
-    {"Station_Number": "2260700", "norm": 0.0930627913, "date": "2021-01-05"},
-    {"Station_Number": "2260700", "norm": 0.0907595284, "date": "2021-01-06"},
-    {"Station_Number": "2260700", "norm": 0.0888401426, "date": "2021-01-07"},
-    {"Station_Number": "2260700", "norm": 0.0880723883, "date": "2021-01-08"},
-    {"Station_Number": "2260700", "norm": 0.0883191664, "date": "2021-01-09"},
-    {"Station_Number": "2260700", "norm": 0.0873046339, "date": "2021-01-10"},
-    {"Station_Number": "2260700", "norm": 0.0857691253, "date": "2021-01-11"},
-    {"Station_Number": "2260700", "norm": 0.0842336167, "date": "2021-01-12"},
-    {"Station_Number": "2260700", "norm": 0.082698108, "date": "2021-01-13"},
-    {"Station_Number": "2260700", "norm": 0.0815464766, "date": "2021-01-14"},
-    {"Station_Number": "2260700", "norm": 0.0801480669, "date": "2021-01-15"},
-    {"Station_Number": "2260700", "norm": 0.0784754593, "date": "2021-01-16"},
-    {"Station_Number": "2260700", "norm": 0.0769399506, "date": "2021-01-17"},
-    {"Station_Number": "2260700", "norm": 0.075404442, "date": "2021-01-18"},
-    {"Station_Number": "2260700", "norm": 0.0740060324, "date": "2021-01-19"},
-    {"Station_Number": "2260700", "norm": 0.073238278, "date": "2021-01-20"},
-    {"Station_Number": "2260700", "norm": 0.0724705237, "date": "2021-01-21"},
-    {"Station_Number": "2260700", "norm": 0.0718124486, "date": "2021-01-22"},
-    {"Station_Number": "2260700", "norm": 0.0711817933, "date": "2021-01-23"},
-    {"Station_Number": "2260700", "norm": 0.0705511379, "date": "2021-01-24"},
-    {"Station_Number": "2260700", "norm": 0.0697833836, "date": "2021-01-25"},
-    {"Station_Number": "2260700", "norm": 0.0690156293, "date": "2021-01-26"},
-    {"Station_Number": "2260700", "norm": 0.068247875, "date": "2021-01-27"},
-    {"Station_Number": "2260700", "norm": 0.0673430217, "date": "2021-01-28"},
-    {"Station_Number": "2260700", "norm": 0.0661913902, "date": "2021-01-29"},
-    {"Station_Number": "2260700", "norm": 0.0652591171, "date": "2021-01-30"},
-    {"Station_Number": "2260700", "norm": 0.0653687963, "date": "2021-01-31"},
-    {"Station_Number": "2260700", "norm": 0.065944612, "date": "2021-02-01"},
-    {"Station_Number": "2260700", "norm": 0.0673430217, "date": "2021-02-02"},
-    {"Station_Number": "2260700", "norm": 0.0668220455, "date": "2021-02-03"},
-    {"Station_Number": "2260700", "norm": 0.0668220455, "date": "2021-02-04"},
-    {"Station_Number": "2260700", "norm": 0.065944612, "date": "2021-02-05"},
-    {"Station_Number": "2260700", "norm": 0.0644913628, "date": "2021-02-06"},
-    {"Station_Number": "2260700", "norm": 0.0632848917, "date": "2021-02-07"},
-    {"Station_Number": "2260700", "norm": 0.062297779, "date": "2021-02-08"},
-    {"Station_Number": "2260700", "norm": 0.0614203455, "date": "2021-02-09"},
-    {"Station_Number": "2260700", "norm": 0.0603235536, "date": "2021-02-10"},
-    {"Station_Number": "2260700", "norm": 0.0593364409, "date": "2021-02-11"},
-    {"Station_Number": "2260700", "norm": 0.0586783658, "date": "2021-02-12"},
-    {"Station_Number": "2260700", "norm": 0.0578009323, "date": "2021-02-13"},
-    {"Station_Number": "2260700", "norm": 0.0568138196, "date": "2021-02-14"},
-    {"Station_Number": "2260700", "norm": 0.0558267069, "date": "2021-02-15"},
-    {"Station_Number": "2260700", "norm": 0.0548395942, "date": "2021-02-16"},
-    {"Station_Number": "2260700", "norm": 0.0541815191, "date": "2021-02-17"},
-    {"Station_Number": "2260700", "norm": 0.0536331231, "date": "2021-02-18"},
-    {"Station_Number": "2260700", "norm": 0.0533040855, "date": "2021-02-19"},
-    {"Station_Number": "2260700", "norm": 0.052975048, "date": "2021-02-20"},
-    {"Station_Number": "2260700", "norm": 0.0526460104, "date": "2021-02-21"},
-    {"Station_Number": "2260700", "norm": 0.0523169729, "date": "2021-02-22"},
-    {"Station_Number": "2260700", "norm": 0.0516588977, "date": "2021-02-23"},
-    {"Station_Number": "2260700", "norm": 0.0510008226, "date": "2021-02-24"},
-    {"Station_Number": "2260700", "norm": 0.0503427475, "date": "2021-02-25"},
-    {"Station_Number": "2260700", "norm": 0.0500137099, "date": "2021-02-26"},
-    {"Station_Number": "2260700", "norm": 0.0496846723, "date": "2021-02-27"},
-    {"Station_Number": "2260700", "norm": 0.0490265972, "date": "2021-02-28"},
-    {"Station_Number": "2260700", "norm": 0.0486975596, "date": "2021-03-01"},
-    {"Station_Number": "2260700", "norm": 0.0493556348, "date": "2021-03-02"},
-    {"Station_Number": "2260700", "norm": 0.0490265972, "date": "2021-03-03"},
-    {"Station_Number": "2260700", "norm": 0.0486975596, "date": "2021-03-04"},
-    {"Station_Number": "2260700", "norm": 0.0483685221, "date": "2021-03-05"},
-    {"Station_Number": "2260700", "norm": 0.0480394845, "date": "2021-03-06"},
-    {"Station_Number": "2260700", "norm": 0.0477104469, "date": "2021-03-07"},
-    {"Station_Number": "2260700", "norm": 0.0473814094, "date": "2021-03-08"},
-    {"Station_Number": "2260700", "norm": 0.0470523718, "date": "2021-03-09"},
-    {"Station_Number": "2260700", "norm": 0.0467233342, "date": "2021-03-10"},
-    {"Station_Number": "2260700", "norm": 0.0463942967, "date": "2021-03-11"},
-    {"Station_Number": "2260700", "norm": 0.0460652591, "date": "2021-03-12"},
-    {"Station_Number": "2260700", "norm": 0.0457362216, "date": "2021-03-13"},
-    {"Station_Number": "2260700", "norm": 0.0463942967, "date": "2021-03-14"},
-    {"Station_Number": "2260700", "norm": 0.0470523718, "date": "2021-03-15"},
-    {"Station_Number": "2260700", "norm": 0.0473814094, "date": "2021-03-16"},
-    {"Station_Number": "2260700", "norm": 0.0477104469, "date": "2021-03-17"},
-    {"Station_Number": "2260700", "norm": 0.0480394845, "date": "2021-03-18"},
-    {"Station_Number": "2260700", "norm": 0.0483685221, "date": "2021-03-19"},
-    {"Station_Number": "2260700", "norm": 0.0486975596, "date": "2021-03-20"},
-    {"Station_Number": "2260700", "norm": 0.0480394845, "date": "2021-03-21"},
-    {"Station_Number": "2260700", "norm": 0.0473814094, "date": "2021-03-22"},
-    {"Station_Number": "2260700", "norm": 0.0467233342, "date": "2021-03-23"},
-    {"Station_Number": "2260700", "norm": 0.0460652591, "date": "2021-03-24"},
-    {"Station_Number": "2260700", "norm": 0.045407184, "date": "2021-03-25"},
-    {"Station_Number": "2260700", "norm": 0.0447491089, "date": "2021-03-26"},
-    {"Station_Number": "2260700", "norm": 0.0444200713, "date": "2021-03-27"},
-    {"Station_Number": "2260700", "norm": 0.0440910337, "date": "2021-03-28"},
-    {"Station_Number": "2260700", "norm": 0.0434329586, "date": "2021-03-29"},
-    {"Station_Number": "2260700", "norm": 0.0427748835, "date": "2021-03-30"},
-    {"Station_Number": "2260700", "norm": 0.0421168083, "date": "2021-03-31"},
-    {"Station_Number": "2260700", "norm": 0.0417877708, "date": "2021-04-01"},
-    {"Station_Number": "2260700", "norm": 0.0411296956, "date": "2021-04-02"},
-    {"Station_Number": "2260700", "norm": 0.0404716205, "date": "2021-04-03"},
-    {"Station_Number": "2260700", "norm": 0.0398135454, "date": "2021-04-04"},
-    {"Station_Number": "2260700", "norm": 0.0394845078, "date": "2021-04-05"},
-    {"Station_Number": "2260700", "norm": 0.0401425829, "date": "2021-04-06"},
-    {"Station_Number": "2260700", "norm": 0.0408006581, "date": "2021-04-07"},
-    {"Station_Number": "2260700", "norm": 0.0404716205, "date": "2021-04-08"},
-    {"Station_Number": "2260700", "norm": 0.0398135454, "date": "2021-04-09"},
-    {"Station_Number": "2260700", "norm": 0.0391554702, "date": "2021-04-10"},
-    {"Station_Number": "2260700", "norm": 0.0381683576, "date": "2021-04-11"},
-    {"Station_Number": "2260700", "norm": 0.0381683576, "date": "2021-04-12"},
-    {"Station_Number": "2260700", "norm": 0.0410200165, "date": "2021-04-13"},
-    {"Station_Number": "2260700", "norm": 0.0452975048, "date": "2021-04-14"},
-    {"Station_Number": "2260700", "norm": 0.0467233342, "date": "2021-04-15"},
-    {"Station_Number": "2260700", "norm": 0.0467233342, "date": "2021-04-16"},
-    {"Station_Number": "2260700", "norm": 0.0451878256, "date": "2021-04-17"},
-    {"Station_Number": "2260700", "norm": 0.0434329586, "date": "2021-04-18"},
-    {"Station_Number": "2260700", "norm": 0.0424458459, "date": "2021-04-19"},
-    {"Station_Number": "2260700", "norm": 0.0417877708, "date": "2021-04-20"},
-    {"Station_Number": "2260700", "norm": 0.0408006581, "date": "2021-04-21"},
-    {"Station_Number": "2260700", "norm": 0.0398135454, "date": "2021-04-22"},
-    {"Station_Number": "2260700", "norm": 0.0388264327, "date": "2021-04-23"},
-    {"Station_Number": "2260700", "norm": 0.0381683576, "date": "2021-04-24"},
-    {"Station_Number": "2260700", "norm": 0.0389361119, "date": "2021-04-25"},
-    {"Station_Number": "2260700", "norm": 0.0405812997, "date": "2021-04-26"},
-    {"Station_Number": "2260700", "norm": 0.0424458459, "date": "2021-04-27"},
-    {"Station_Number": "2260700", "norm": 0.043652317, "date": "2021-04-28"},
-    {"Station_Number": "2260700", "norm": 0.0446394297, "date": "2021-04-29"},
-    {"Station_Number": "2260700", "norm": 0.0455168632, "date": "2021-04-30"},
-    {"Station_Number": "2260700", "norm": 0.0469426926, "date": "2021-05-01"},
-    {"Station_Number": "2260700", "norm": 0.0477104469, "date": "2021-05-02"},
-    {"Station_Number": "2260700", "norm": 0.0467233342, "date": "2021-05-03"},
-    {"Station_Number": "2260700", "norm": 0.0460652591, "date": "2021-05-04"},
-    {"Station_Number": "2260700", "norm": 0.0450781464, "date": "2021-05-05"},
-    {"Station_Number": "2260700", "norm": 0.0438716753, "date": "2021-05-06"},
-    {"Station_Number": "2260700", "norm": 0.0425555251, "date": "2021-05-07"},
-    {"Station_Number": "2260700", "norm": 0.0424458459, "date": "2021-05-08"},
-    {"Station_Number": "2260700", "norm": 0.0427748835, "date": "2021-05-09"},
-    {"Station_Number": "2260700", "norm": 0.0434329586, "date": "2021-05-10"},
-    {"Station_Number": "2260700", "norm": 0.0442007129, "date": "2021-05-11"},
-    {"Station_Number": "2260700", "norm": 0.0434329586, "date": "2021-05-12"},
-    {"Station_Number": "2260700", "norm": 0.043103921, "date": "2021-05-13"},
-    {"Station_Number": "2260700", "norm": 0.0437619962, "date": "2021-05-14"},
-    {"Station_Number": "2260700", "norm": 0.043103921, "date": "2021-05-15"},
-    {"Station_Number": "2260700", "norm": 0.0438716753, "date": "2021-05-16"},
-    {"Station_Number": "2260700", "norm": 0.0467233342, "date": "2021-05-17"},
-    {"Station_Number": "2260700", "norm": 0.0493556348, "date": "2021-05-18"},
-    {"Station_Number": "2260700", "norm": 0.0519879353, "date": "2021-05-19"},
-    {"Station_Number": "2260700", "norm": 0.0545105566, "date": "2021-05-20"},
-    {"Station_Number": "2260700", "norm": 0.0562654236, "date": "2021-05-21"},
-    {"Station_Number": "2260700", "norm": 0.0574718947, "date": "2021-05-22"},
-    {"Station_Number": "2260700", "norm": 0.0575815739, "date": "2021-05-23"},
-    {"Station_Number": "2260700", "norm": 0.0579106115, "date": "2021-05-24"},
-    {"Station_Number": "2260700", "norm": 0.0598848369, "date": "2021-05-25"},
-    {"Station_Number": "2260700", "norm": 0.0636139293, "date": "2021-05-26"},
-    {"Station_Number": "2260700", "norm": 0.0667123663, "date": "2021-05-27"},
-    {"Station_Number": "2260700", "norm": 0.0720866466, "date": "2021-05-28"},
-    {"Station_Number": "2260700", "norm": 0.0887030436, "date": "2021-05-29"},
-    {"Station_Number": "2260700", "norm": 0.1221277763, "date": "2021-05-30"},
-    {"Station_Number": "2260700", "norm": 0.1385796545, "date": "2021-05-31"},
-    {"Station_Number": "2260700", "norm": 0.1408829175, "date": "2021-06-01"},
-    {"Station_Number": "2260700", "norm": 0.1319989032, "date": "2021-06-02"},
-    {"Station_Number": "2260700", "norm": 0.1201535509, "date": "2021-06-03"},
-    {"Station_Number": "2260700", "norm": 0.1112695366, "date": "2021-06-04"},
-    {"Station_Number": "2260700", "norm": 0.107156567, "date": "2021-06-05"},
-    {"Station_Number": "2260700", "norm": 0.1096243488, "date": "2021-06-06"},
-    {"Station_Number": "2260700", "norm": 0.1140663559, "date": "2021-06-07"},
-    {"Station_Number": "2260700", "norm": 0.117027694, "date": "2021-06-08"},
-    {"Station_Number": "2260700", "norm": 0.1190019194, "date": "2021-06-09"},
-    {"Station_Number": "2260700", "norm": 0.1224568138, "date": "2021-06-10"},
-    {"Station_Number": "2260700", "norm": 0.1288730463, "date": "2021-06-11"},
-    {"Station_Number": "2260700", "norm": 0.137428023, "date": "2021-06-12"},
-    {"Station_Number": "2260700", "norm": 0.1471346312, "date": "2021-06-13"},
-    {"Station_Number": "2260700", "norm": 0.1436797368, "date": "2021-06-14"},
-    {"Station_Number": "2260700", "norm": 0.1341376474, "date": "2021-06-15"},
-    {"Station_Number": "2260700", "norm": 0.1273923773, "date": "2021-06-16"},
-    {"Station_Number": "2260700", "norm": 0.1219632575, "date": "2021-06-17"},
-    {"Station_Number": "2260700", "norm": 0.1178502879, "date": "2021-06-18"},
-    {"Station_Number": "2260700", "norm": 0.1204825884, "date": "2021-06-19"},
-    {"Station_Number": "2260700", "norm": 0.1262407458, "date": "2021-06-20"},
-    {"Station_Number": "2260700", "norm": 0.1318343844, "date": "2021-06-21"},
-    {"Station_Number": "2260700", "norm": 0.1387441733, "date": "2021-06-22"},
-    {"Station_Number": "2260700", "norm": 0.1484507815, "date": "2021-06-23"},
-    {"Station_Number": "2260700", "norm": 0.1650671785, "date": "2021-06-24"},
-    {"Station_Number": "2260700", "norm": 0.1952563751, "date": "2021-06-25"},
-    {"Station_Number": "2260700", "norm": 0.2290375651, "date": "2021-06-26"},
-    {"Station_Number": "2260700", "norm": 0.2548395942, "date": "2021-06-27"},
-    {"Station_Number": "2260700", "norm": 0.2700575816, "date": "2021-06-28"},
-    {"Station_Number": "2260700", "norm": 0.2785028791, "date": "2021-06-29"},
-    {"Station_Number": "2260700", "norm": 0.2897449959, "date": "2021-06-30"},
-    {"Station_Number": "2260700", "norm": 0.3146970112, "date": "2021-07-01"},
-    {"Station_Number": "2260700", "norm": 0.3369893063, "date": "2021-07-02"},
-    {"Station_Number": "2260700", "norm": 0.3460378393, "date": "2021-07-03"},
-    {"Station_Number": "2260700", "norm": 0.3457636413, "date": "2021-07-04"},
-    {"Station_Number": "2260700", "norm": 0.3435700576, "date": "2021-07-05"},
-    {"Station_Number": "2260700", "norm": 0.3509734028, "date": "2021-07-06"},
-    {"Station_Number": "2260700", "norm": 0.363778448, "date": "2021-07-07"},
-    {"Station_Number": "2260700", "norm": 0.3816013162, "date": "2021-07-08"},
-    {"Station_Number": "2260700", "norm": 0.4173293118, "date": "2021-07-09"},
-    {"Station_Number": "2260700", "norm": 0.4756512202, "date": "2021-07-10"},
-    {"Station_Number": "2260700", "norm": 0.522429394, "date": "2021-07-11"},
-    {"Station_Number": "2260700", "norm": 0.5584590074, "date": "2021-07-12"},
-    {"Station_Number": "2260700", "norm": 0.5815738964, "date": "2021-07-13"},
-    {"Station_Number": "2260700", "norm": 0.5876062517, "date": "2021-07-14"},
-    {"Station_Number": "2260700", "norm": 0.5840416781, "date": "2021-07-15"},
-    {"Station_Number": "2260700", "norm": 0.5719769674, "date": "2021-07-16"},
-    {"Station_Number": "2260700", "norm": 0.5518782561, "date": "2021-07-17"},
-    {"Station_Number": "2260700", "norm": 0.5209761448, "date": "2021-07-18"},
-    {"Station_Number": "2260700", "norm": 0.4723608445, "date": "2021-07-19"},
-    {"Station_Number": "2260700", "norm": 0.4330408555, "date": "2021-07-20"},
-    {"Station_Number": "2260700", "norm": 0.4121195503, "date": "2021-07-21"},
-    {"Station_Number": "2260700", "norm": 0.3935563477, "date": "2021-07-22"},
-    {"Station_Number": "2260700", "norm": 0.3830545654, "date": "2021-07-23"},
-    {"Station_Number": "2260700", "norm": 0.3899095147, "date": "2021-07-24"},
-    {"Station_Number": "2260700", "norm": 0.4035371538, "date": "2021-07-25"},
-    {"Station_Number": "2260700", "norm": 0.4120372909, "date": "2021-07-26"},
-    {"Station_Number": "2260700", "norm": 0.4129421442, "date": "2021-07-27"},
-    {"Station_Number": "2260700", "norm": 0.4164244585, "date": "2021-07-28"},
-    {"Station_Number": "2260700", "norm": 0.4125856869, "date": "2021-07-29"},
-    {"Station_Number": "2260700", "norm": 0.3997806416, "date": "2021-07-30"},
-    {"Station_Number": "2260700", "norm": 0.3877159309, "date": "2021-07-31"},
-    {"Station_Number": "2260700", "norm": 0.3935563477, "date": "2021-08-01"},
-    {"Station_Number": "2260700", "norm": 0.4195228955, "date": "2021-08-02"},
-    {"Station_Number": "2260700", "norm": 0.4486701398, "date": "2021-08-03"},
-    {"Station_Number": "2260700", "norm": 0.4705237181, "date": "2021-08-04"},
-    {"Station_Number": "2260700", "norm": 0.4869755964, "date": "2021-08-05"},
-    {"Station_Number": "2260700", "norm": 0.5297504798, "date": "2021-08-06"},
-    {"Station_Number": "2260700", "norm": 0.6205100082, "date": "2021-08-07"},
-    {"Station_Number": "2260700", "norm": 0.7031258569, "date": "2021-08-08"},
-    {"Station_Number": "2260700", "norm": 0.713655059, "date": "2021-08-09"},
-    {"Station_Number": "2260700", "norm": 0.6992048259, "date": "2021-08-10"},
-    {"Station_Number": "2260700", "norm": 0.6726898821, "date": "2021-08-11"},
-    {"Station_Number": "2260700", "norm": 0.6235261859, "date": "2021-08-12"},
-    {"Station_Number": "2260700", "norm": 0.565944612, "date": "2021-08-13"},
-    {"Station_Number": "2260700", "norm": 0.5158486427, "date": "2021-08-14"},
-    {"Station_Number": "2260700", "norm": 0.47162051, "date": "2021-08-15"},
-    {"Station_Number": "2260700", "norm": 0.4420893885, "date": "2021-08-16"},
-    {"Station_Number": "2260700", "norm": 0.4445571703, "date": "2021-08-17"},
-    {"Station_Number": "2260700", "norm": 0.4672333425, "date": "2021-08-18"},
-    {"Station_Number": "2260700", "norm": 0.5048807239, "date": "2021-08-19"},
-    {"Station_Number": "2260700", "norm": 0.5598299973, "date": "2021-08-20"},
-    {"Station_Number": "2260700", "norm": 0.6210584042, "date": "2021-08-21"},
-    {"Station_Number": "2260700", "norm": 0.6822045517, "date": "2021-08-22"},
-    {"Station_Number": "2260700", "norm": 0.7339457088, "date": "2021-08-23"},
-    {"Station_Number": "2260700", "norm": 0.7757060598, "date": "2021-08-24"},
-    {"Station_Number": "2260700", "norm": 0.8121743899, "date": "2021-08-25"},
-    {"Station_Number": "2260700", "norm": 0.8413216342, "date": "2021-08-26"},
-    {"Station_Number": "2260700", "norm": 0.8708527557, "date": "2021-08-27"},
-    {"Station_Number": "2260700", "norm": 0.896078969, "date": "2021-08-28"},
-    {"Station_Number": "2260700", "norm": 0.9160954209, "date": "2021-08-29"},
-    {"Station_Number": "2260700", "norm": 0.9291746641, "date": "2021-08-30"},
-    {"Station_Number": "2260700", "norm": 0.9508363038, "date": "2021-08-31"},
-    {"Station_Number": "2260700", "norm": 0.9775157664, "date": "2021-09-01"},
-    {"Station_Number": "2260700", "norm": 0.9882094872, "date": "2021-09-02"},
-    {"Station_Number": "2260700", "norm": 0.9958870304, "date": "2021-09-03"},
-    {"Station_Number": "2260700", "norm": 1.0, "date": "2021-09-04"},
-    {"Station_Number": "2260700", "norm": 0.9882094872, "date": "2021-09-05"},
-    {"Station_Number": "2260700", "norm": 0.9753221826, "date": "2021-09-06"},
-    {"Station_Number": "2260700", "norm": 0.9467233342, "date": "2021-09-07"},
-    {"Station_Number": "2260700", "norm": 0.9121743899, "date": "2021-09-08"},
-    {"Station_Number": "2260700", "norm": 0.864189745, "date": "2021-09-09"},
-    {"Station_Number": "2260700", "norm": 0.820400329, "date": "2021-09-10"},
-    {"Station_Number": "2260700", "norm": 0.7687688511, "date": "2021-09-11"},
-    {"Station_Number": "2260700", "norm": 0.7299149986, "date": "2021-09-12"},
-    {"Station_Number": "2260700", "norm": 0.6822045517, "date": "2021-09-13"},
-    {"Station_Number": "2260700", "norm": 0.6289278859, "date": "2021-09-14"},
-    {"Station_Number": "2260700", "norm": 0.6078146422, "date": "2021-09-15"},
-    {"Station_Number": "2260700", "norm": 0.581217439, "date": "2021-09-16"},
-    {"Station_Number": "2260700", "norm": 0.5518782561, "date": "2021-09-17"},
-    {"Station_Number": "2260700", "norm": 0.5217164793, "date": "2021-09-18"},
-    {"Station_Number": "2260700", "norm": 0.4946531396, "date": "2021-09-19"},
-    {"Station_Number": "2260700", "norm": 0.4668768851, "date": "2021-09-20"},
-    {"Station_Number": "2260700", "norm": 0.4544282972, "date": "2021-09-21"},
-    {"Station_Number": "2260700", "norm": 0.4686865917, "date": "2021-09-22"},
-    {"Station_Number": "2260700", "norm": 0.5209761448, "date": "2021-09-23"},
-    {"Station_Number": "2260700", "norm": 0.5494927338, "date": "2021-09-24"},
-    {"Station_Number": "2260700", "norm": 0.660268714, "date": "2021-09-25"},
-    {"Station_Number": "2260700", "norm": 0.6143953935, "date": "2021-09-26"},
-    {"Station_Number": "2260700", "norm": 0.6583493282, "date": "2021-09-27"},
-    {"Station_Number": "2260700", "norm": 0.6777351248, "date": "2021-09-28"},
-    {"Station_Number": "2260700", "norm": 0.659994516, "date": "2021-09-29"},
-    {"Station_Number": "2260700", "norm": 0.6002193584, "date": "2021-09-30"},
-    {"Station_Number": "2260700", "norm": 0.5242665204, "date": "2021-10-01"},
-    {"Station_Number": "2260700", "norm": 0.4727173019, "date": "2021-10-02"},
-    {"Station_Number": "2260700", "norm": 0.4427474637, "date": "2021-10-03"},
-    {"Station_Number": "2260700", "norm": 0.4246503976, "date": "2021-10-04"},
-    {"Station_Number": "2260700", "norm": 0.386344941, "date": "2021-10-05"},
-    {"Station_Number": "2260700", "norm": 0.3502330683, "date": "2021-10-06"},
-    {"Station_Number": "2260700", "norm": 0.3243761996, "date": "2021-10-07"},
-    {"Station_Number": "2260700", "norm": 0.3107485605, "date": "2021-10-08"},
-    {"Station_Number": "2260700", "norm": 0.3059226762, "date": "2021-10-09"},
-    {"Station_Number": "2260700", "norm": 0.3022484234, "date": "2021-10-10"},
-    {"Station_Number": "2260700", "norm": 0.2991499863, "date": "2021-10-11"},
-    {"Station_Number": "2260700", "norm": 0.2991499863, "date": "2021-10-12"},
-    {"Station_Number": "2260700", "norm": 0.2968741431, "date": "2021-10-13"},
-    {"Station_Number": "2260700", "norm": 0.2931176309, "date": "2021-10-14"},
-    {"Station_Number": "2260700", "norm": 0.2897449959, "date": "2021-10-15"},
-    {"Station_Number": "2260700", "norm": 0.2961338086, "date": "2021-10-16"},
-    {"Station_Number": "2260700", "norm": 0.3176035097, "date": "2021-10-17"},
-    {"Station_Number": "2260700", "norm": 0.3537153825, "date": "2021-10-18"},
-    {"Station_Number": "2260700", "norm": 0.3582944886, "date": "2021-10-19"},
-    {"Station_Number": "2260700", "norm": 0.3635865095, "date": "2021-10-20"},
-    {"Station_Number": "2260700", "norm": 0.3096517686, "date": "2021-10-21"},
-    {"Station_Number": "2260700", "norm": 0.2785028791, "date": "2021-10-22"},
-    {"Station_Number": "2260700", "norm": 0.2747463669, "date": "2021-10-23"},
-    {"Station_Number": "2260700", "norm": 0.2807787222, "date": "2021-10-24"},
-    {"Station_Number": "2260700", "norm": 0.2912805045, "date": "2021-10-25"},
-    {"Station_Number": "2260700", "norm": 0.277570606, "date": "2021-10-26"},
-    {"Station_Number": "2260700", "norm": 0.2707704963, "date": "2021-10-27"},
-    {"Station_Number": "2260700", "norm": 0.2956676721, "date": "2021-10-28"},
-    {"Station_Number": "2260700", "norm": 0.3499588703, "date": "2021-10-29"},
-    {"Station_Number": "2260700", "norm": 0.3898272553, "date": "2021-10-30"},
-    {"Station_Number": "2260700", "norm": 0.3986838497, "date": "2021-10-31"},
-    {"Station_Number": "2260700", "norm": 0.3786673979, "date": "2021-11-01"},
-    {"Station_Number": "2260700", "norm": 0.3419248698, "date": "2021-11-02"},
-    {"Station_Number": "2260700", "norm": 0.3015355086, "date": "2021-11-03"},
-    {"Station_Number": "2260700", "norm": 0.2667123663, "date": "2021-11-04"},
-    {"Station_Number": "2260700", "norm": 0.2455717028, "date": "2021-11-05"},
-    {"Station_Number": "2260700", "norm": 0.2318343844, "date": "2021-11-06"},
-    {"Station_Number": "2260700", "norm": 0.2213874417, "date": "2021-11-07"},
-    {"Station_Number": "2260700", "norm": 0.2107211407, "date": "2021-11-08"},
-    {"Station_Number": "2260700", "norm": 0.2020839046, "date": "2021-11-09"},
-    {"Station_Number": "2260700", "norm": 0.1948450781, "date": "2021-11-10"},
-    {"Station_Number": "2260700", "norm": 0.1888127228, "date": "2021-11-11"},
-    {"Station_Number": "2260700", "norm": 0.1816013162, "date": "2021-11-12"},
-    {"Station_Number": "2260700", "norm": 0.1749383055, "date": "2021-11-13"},
-    {"Station_Number": "2260700", "norm": 0.1685494927, "date": "2021-11-14"},
-    {"Station_Number": "2260700", "norm": 0.1625171374, "date": "2021-11-15"},
-    {"Station_Number": "2260700", "norm": 0.1568412394, "date": "2021-11-16"},
-    {"Station_Number": "2260700", "norm": 0.1520701947, "date": "2021-11-17"},
-    {"Station_Number": "2260700", "norm": 0.1481217439, "date": "2021-11-18"},
-    {"Station_Number": "2260700", "norm": 0.1446668495, "date": "2021-11-19"},
-    {"Station_Number": "2260700", "norm": 0.1431861804, "date": "2021-11-20"},
-    {"Station_Number": "2260700", "norm": 0.1451604058, "date": "2021-11-21"},
-    {"Station_Number": "2260700", "norm": 0.1492733754, "date": "2021-11-22"},
-    {"Station_Number": "2260700", "norm": 0.148779819, "date": "2021-11-23"},
-    {"Station_Number": "2260700", "norm": 0.1438442556, "date": "2021-11-24"},
-    {"Station_Number": "2260700", "norm": 0.1392377296, "date": "2021-11-25"},
-    {"Station_Number": "2260700", "norm": 0.1338086098, "date": "2021-11-26"},
-    {"Station_Number": "2260700", "norm": 0.1293666027, "date": "2021-11-27"},
-    {"Station_Number": "2260700", "norm": 0.126076227, "date": "2021-11-28"},
-    {"Station_Number": "2260700", "norm": 0.1249245956, "date": "2021-11-29"},
-    {"Station_Number": "2260700", "norm": 0.1199890321, "date": "2021-11-30"},
-    {"Station_Number": "2260700", "norm": 0.1162051001, "date": "2021-12-01"},
-    {"Station_Number": "2260700", "norm": 0.1135727996, "date": "2021-12-02"},
-    {"Station_Number": "2260700", "norm": 0.1115985742, "date": "2021-12-03"},
-    {"Station_Number": "2260700", "norm": 0.1101179051, "date": "2021-12-04"},
-    {"Station_Number": "2260700", "norm": 0.1083081985, "date": "2021-12-05"},
-    {"Station_Number": "2260700", "norm": 0.1061694543, "date": "2021-12-06"},
-    {"Station_Number": "2260700", "norm": 0.1042226488, "date": "2021-12-07"},
-    {"Station_Number": "2260700", "norm": 0.1024129421, "date": "2021-12-08"},
-    {"Station_Number": "2260700", "norm": 0.1001096792, "date": "2021-12-09"},
-    {"Station_Number": "2260700", "norm": 0.0981902934, "date": "2021-12-10"},
-    {"Station_Number": "2260700", "norm": 0.0961338086, "date": "2021-12-11"},
-    {"Station_Number": "2260700", "norm": 0.0943515218, "date": "2021-12-12"},
-    {"Station_Number": "2260700", "norm": 0.0926789142, "date": "2021-12-13"},
-    {"Station_Number": "2260700", "norm": 0.0911434055, "date": "2021-12-14"},
-    {"Station_Number": "2260700", "norm": 0.0896078969, "date": "2021-12-15"},
-    {"Station_Number": "2260700", "norm": 0.0884562654, "date": "2021-12-16"},
-    {"Station_Number": "2260700", "norm": 0.0869207568, "date": "2021-12-17"},
-    {"Station_Number": "2260700", "norm": 0.0853852481, "date": "2021-12-18"},
-    {"Station_Number": "2260700", "norm": 0.0839868385, "date": "2021-12-19"},
-    {"Station_Number": "2260700", "norm": 0.0823142309, "date": "2021-12-20"},
-    {"Station_Number": "2260700", "norm": 0.0803948451, "date": "2021-12-21"},
-    {"Station_Number": "2260700", "norm": 0.0792432136, "date": "2021-12-22"},
-    {"Station_Number": "2260700", "norm": 0.0780915821, "date": "2021-12-23"},
-    {"Station_Number": "2260700", "norm": 0.0765560735, "date": "2021-12-24"},
-    {"Station_Number": "2260700", "norm": 0.0747737867, "date": "2021-12-25"},
-    {"Station_Number": "2260700", "norm": 0.0731011791, "date": "2021-12-26"},
-    {"Station_Number": "2260700", "norm": 0.0717027694, "date": "2021-12-27"},
-    {"Station_Number": "2260700", "norm": 0.0701672608, "date": "2021-12-28"},
-    {"Station_Number": "2260700", "norm": 0.0688785303, "date": "2021-12-29"},
-    {"Station_Number": "2260700", "norm": 0.0673430217, "date": "2021-12-30"},
-    {"Station_Number": "2260700", "norm": 0.0663284892, "date": "2021-12-31"},
-    {"Station_Number": "2260700", "norm": 0.0730275229, "date": "2022-01-01"},
-    {"Station_Number": "2260700", "norm": 0.0721712538, "date": "2022-01-02"},
-    {"Station_Number": "2260700", "norm": 0.0711926606, "date": "2022-01-03"},
-    {"Station_Number": "2260700", "norm": 0.0703363914, "date": "2022-01-04"},
-    {"Station_Number": "2260700", "norm": 0.0696024465, "date": "2022-01-05"},
-    {"Station_Number": "2260700", "norm": 0.0691131498, "date": "2022-01-06"},
-    {"Station_Number": "2260700", "norm": 0.0682568807, "date": "2022-01-07"},
-    {"Station_Number": "2260700", "norm": 0.066911315, "date": "2022-01-08"},
-    {"Station_Number": "2260700", "norm": 0.0656880734, "date": "2022-01-09"},
-    {"Station_Number": "2260700", "norm": 0.0647094801, "date": "2022-01-10"},
-    {"Station_Number": "2260700", "norm": 0.0639755352, "date": "2022-01-11"},
-    {"Station_Number": "2260700", "norm": 0.0632415902, "date": "2022-01-12"},
-    {"Station_Number": "2260700", "norm": 0.0621406728, "date": "2022-01-13"},
-    {"Station_Number": "2260700", "norm": 0.0610397554, "date": "2022-01-14"},
-    {"Station_Number": "2260700", "norm": 0.0603058104, "date": "2022-01-15"},
-    {"Station_Number": "2260700", "norm": 0.0595718654, "date": "2022-01-16"},
-    {"Station_Number": "2260700", "norm": 0.0590825688, "date": "2022-01-17"},
-    {"Station_Number": "2260700", "norm": 0.0587155963, "date": "2022-01-18"},
-    {"Station_Number": "2260700", "norm": 0.0579816514, "date": "2022-01-19"},
-    {"Station_Number": "2260700", "norm": 0.0572477064, "date": "2022-01-20"},
-    {"Station_Number": "2260700", "norm": 0.0568807339, "date": "2022-01-21"},
-    {"Station_Number": "2260700", "norm": 0.0565137615, "date": "2022-01-22"},
-    {"Station_Number": "2260700", "norm": 0.0566360856, "date": "2022-01-23"},
-    {"Station_Number": "2260700", "norm": 0.0576146789, "date": "2022-01-24"},
-    {"Station_Number": "2260700", "norm": 0.0590825688, "date": "2022-01-25"},
-    {"Station_Number": "2260700", "norm": 0.0598165138, "date": "2022-01-26"},
-    {"Station_Number": "2260700", "norm": 0.059204893, "date": "2022-01-27"},
-    {"Station_Number": "2260700", "norm": 0.0579816514, "date": "2022-01-28"},
-    {"Station_Number": "2260700", "norm": 0.055412844, "date": "2022-01-29"},
-    {"Station_Number": "2260700", "norm": 0.0537003058, "date": "2022-01-30"},
-    {"Station_Number": "2260700", "norm": 0.0529663609, "date": "2022-01-31"},
-    {"Station_Number": "2260700", "norm": 0.0524770642, "date": "2022-02-01"},
-    {"Station_Number": "2260700", "norm": 0.0528440367, "date": "2022-02-02"},
-    {"Station_Number": "2260700", "norm": 0.0524770642, "date": "2022-02-03"},
-    {"Station_Number": "2260700", "norm": 0.0521100917, "date": "2022-02-04"},
-    {"Station_Number": "2260700", "norm": 0.0517431193, "date": "2022-02-05"},
-    {"Station_Number": "2260700", "norm": 0.0521100917, "date": "2022-02-06"},
-    {"Station_Number": "2260700", "norm": 0.0532110092, "date": "2022-02-07"},
-    {"Station_Number": "2260700", "norm": 0.0546788991, "date": "2022-02-08"},
-    {"Station_Number": "2260700", "norm": 0.0560244648, "date": "2022-02-09"},
-    {"Station_Number": "2260700", "norm": 0.0551681957, "date": "2022-02-10"},
-    {"Station_Number": "2260700", "norm": 0.0532110092, "date": "2022-02-11"},
-    {"Station_Number": "2260700", "norm": 0.0513761468, "date": "2022-02-12"},
-    {"Station_Number": "2260700", "norm": 0.0503975535, "date": "2022-02-13"},
-    {"Station_Number": "2260700", "norm": 0.0502752294, "date": "2022-02-14"},
-    {"Station_Number": "2260700", "norm": 0.0499082569, "date": "2022-02-15"},
-    {"Station_Number": "2260700", "norm": 0.0501529052, "date": "2022-02-16"},
-    {"Station_Number": "2260700", "norm": 0.0517431193, "date": "2022-02-17"},
-    {"Station_Number": "2260700", "norm": 0.053088685, "date": "2022-02-18"},
-    {"Station_Number": "2260700", "norm": 0.0527217125, "date": "2022-02-19"},
-    {"Station_Number": "2260700", "norm": 0.0517431193, "date": "2022-02-20"},
-    {"Station_Number": "2260700", "norm": 0.0496636086, "date": "2022-02-21"},
-    {"Station_Number": "2260700", "norm": 0.047706422, "date": "2022-02-22"},
-    {"Station_Number": "2260700", "norm": 0.0462385321, "date": "2022-02-23"},
-    {"Station_Number": "2260700", "norm": 0.0447706422, "date": "2022-02-24"},
-    {"Station_Number": "2260700", "norm": 0.0435474006, "date": "2022-02-25"},
-    {"Station_Number": "2260700", "norm": 0.0425688073, "date": "2022-02-26"},
-    {"Station_Number": "2260700", "norm": 0.0417125382, "date": "2022-02-27"},
-    {"Station_Number": "2260700", "norm": 0.0408562691, "date": "2022-02-28"},
-    {"Station_Number": "2260700", "norm": 0.0401223242, "date": "2022-03-01"},
-    {"Station_Number": "2260700", "norm": 0.0393883792, "date": "2022-03-02"},
-    {"Station_Number": "2260700", "norm": 0.0396330275, "date": "2022-03-03"},
-    {"Station_Number": "2260700", "norm": 0.04, "date": "2022-03-04"},
-    {"Station_Number": "2260700", "norm": 0.0403669725, "date": "2022-03-05"},
-    {"Station_Number": "2260700", "norm": 0.0397553517, "date": "2022-03-06"},
-    {"Station_Number": "2260700", "norm": 0.0390214067, "date": "2022-03-07"},
-    {"Station_Number": "2260700", "norm": 0.0379204893, "date": "2022-03-08"},
-    {"Station_Number": "2260700", "norm": 0.0368195719, "date": "2022-03-09"},
-    {"Station_Number": "2260700", "norm": 0.0364831804, "date": "2022-03-10"},
-    {"Station_Number": "2260700", "norm": 0.03617737, "date": "2022-03-11"},
-    {"Station_Number": "2260700", "norm": 0.0360856269, "date": "2022-03-12"},
-    {"Station_Number": "2260700", "norm": 0.0357798165, "date": "2022-03-13"},
-    {"Station_Number": "2260700", "norm": 0.0360856269, "date": "2022-03-14"},
-    {"Station_Number": "2260700", "norm": 0.0357798165, "date": "2022-03-15"},
-    {"Station_Number": "2260700", "norm": 0.0354740061, "date": "2022-03-16"},
-    {"Station_Number": "2260700", "norm": 0.0357798165, "date": "2022-03-17"},
-    {"Station_Number": "2260700", "norm": 0.0363914373, "date": "2022-03-18"},
-    {"Station_Number": "2260700", "norm": 0.0377981651, "date": "2022-03-19"},
-    {"Station_Number": "2260700", "norm": 0.0391437309, "date": "2022-03-20"},
-    {"Station_Number": "2260700", "norm": 0.0398776758, "date": "2022-03-21"},
-    {"Station_Number": "2260700", "norm": 0.0403669725, "date": "2022-03-22"},
-    {"Station_Number": "2260700", "norm": 0.0414678899, "date": "2022-03-23"},
-    {"Station_Number": "2260700", "norm": 0.0431804281, "date": "2022-03-24"},
-    {"Station_Number": "2260700", "norm": 0.0469724771, "date": "2022-03-25"},
-    {"Station_Number": "2260700", "norm": 0.0497859327, "date": "2022-03-26"},
-    {"Station_Number": "2260700", "norm": 0.0480733945, "date": "2022-03-27"},
-    {"Station_Number": "2260700", "norm": 0.0497859327, "date": "2022-03-28"},
-    {"Station_Number": "2260700", "norm": 0.0462385321, "date": "2022-03-29"},
-    {"Station_Number": "2260700", "norm": 0.0464831804, "date": "2022-03-30"},
-    {"Station_Number": "2260700", "norm": 0.0468501529, "date": "2022-03-31"},
-    {"Station_Number": "2260700", "norm": 0.0468501529, "date": "2022-04-01"},
-    {"Station_Number": "2260700", "norm": 0.0462385321, "date": "2022-04-02"},
-    {"Station_Number": "2260700", "norm": 0.0459938838, "date": "2022-04-03"},
-    {"Station_Number": "2260700", "norm": 0.0481957187, "date": "2022-04-04"},
-    {"Station_Number": "2260700", "norm": 0.0525993884, "date": "2022-04-05"},
-    {"Station_Number": "2260700", "norm": 0.0582262997, "date": "2022-04-06"},
-    {"Station_Number": "2260700", "norm": 0.0622629969, "date": "2022-04-07"},
-    {"Station_Number": "2260700", "norm": 0.0604281346, "date": "2022-04-08"},
-    {"Station_Number": "2260700", "norm": 0.0557798165, "date": "2022-04-09"},
-    {"Station_Number": "2260700", "norm": 0.0565137615, "date": "2022-04-10"},
-    {"Station_Number": "2260700", "norm": 0.0665443425, "date": "2022-04-11"},
-    {"Station_Number": "2260700", "norm": 0.0863914373, "date": "2022-04-12"},
-    {"Station_Number": "2260700", "norm": 0.1203363914, "date": "2022-04-13"},
-    {"Station_Number": "2260700", "norm": 0.1455657492, "date": "2022-04-14"},
-    {"Station_Number": "2260700", "norm": 0.1508868502, "date": "2022-04-15"},
-    {"Station_Number": "2260700", "norm": 0.1431804281, "date": "2022-04-16"},
-    {"Station_Number": "2260700", "norm": 0.1288685015, "date": "2022-04-17"},
-    {"Station_Number": "2260700", "norm": 0.1150458716, "date": "2022-04-18"},
-    {"Station_Number": "2260700", "norm": 0.1055045872, "date": "2022-04-19"},
-    {"Station_Number": "2260700", "norm": 0.0990825688, "date": "2022-04-20"},
-    {"Station_Number": "2260700", "norm": 0.0926605505, "date": "2022-04-21"},
-    {"Station_Number": "2260700", "norm": 0.0902446483, "date": "2022-04-22"},
-    {"Station_Number": "2260700", "norm": 0.1060856269, "date": "2022-04-23"},
-    {"Station_Number": "2260700", "norm": 0.1470336391, "date": "2022-04-24"},
-    {"Station_Number": "2260700", "norm": 0.1749235474, "date": "2022-04-25"},
-    {"Station_Number": "2260700", "norm": 0.183088685, "date": "2022-04-26"},
-    {"Station_Number": "2260700", "norm": 0.183088685, "date": "2022-04-27"},
-    {"Station_Number": "2260700", "norm": 0.1789908257, "date": "2022-04-28"},
-    {"Station_Number": "2260700", "norm": 0.1670642202, "date": "2022-04-29"},
-    {"Station_Number": "2260700", "norm": 0.1508868502, "date": "2022-04-30"},
-    {"Station_Number": "2260700", "norm": 0.1218960245, "date": "2022-05-01"},
-    {"Station_Number": "2260700", "norm": 0.1136391437, "date": "2022-05-02"},
-    {"Station_Number": "2260700", "norm": 0.1120795107, "date": "2022-05-03"},
-    {"Station_Number": "2260700", "norm": 0.1086544343, "date": "2022-05-04"},
-    {"Station_Number": "2260700", "norm": 0.1003669725, "date": "2022-05-05"},
-    {"Station_Number": "2260700", "norm": 0.0949541284, "date": "2022-05-06"},
-    {"Station_Number": "2260700", "norm": 0.0888073394, "date": "2022-05-07"},
-    {"Station_Number": "2260700", "norm": 0.0849541284, "date": "2022-05-08"},
-    {"Station_Number": "2260700", "norm": 0.0828134557, "date": "2022-05-09"},
-    {"Station_Number": "2260700", "norm": 0.0819571865, "date": "2022-05-10"},
-    {"Station_Number": "2260700", "norm": 0.0821100917, "date": "2022-05-11"},
-    {"Station_Number": "2260700", "norm": 0.0851070336, "date": "2022-05-12"},
-    {"Station_Number": "2260700", "norm": 0.0976452599, "date": "2022-05-13"},
-    {"Station_Number": "2260700", "norm": 0.1159633028, "date": "2022-05-14"},
-    {"Station_Number": "2260700", "norm": 0.1270336391, "date": "2022-05-15"},
-    {"Station_Number": "2260700", "norm": 0.1307033639, "date": "2022-05-16"},
-    {"Station_Number": "2260700", "norm": 0.1296024465, "date": "2022-05-17"},
-    {"Station_Number": "2260700", "norm": 0.1274006116, "date": "2022-05-18"},
-    {"Station_Number": "2260700", "norm": 0.1310703364, "date": "2022-05-19"},
-    {"Station_Number": "2260700", "norm": 0.1474006116, "date": "2022-05-20"},
-    {"Station_Number": "2260700", "norm": 0.1807033639, "date": "2022-05-21"},
-    {"Station_Number": "2260700", "norm": 0.237706422, "date": "2022-05-22"},
-    {"Station_Number": "2260700", "norm": 0.2951070336, "date": "2022-05-23"},
-    {"Station_Number": "2260700", "norm": 0.342293578, "date": "2022-05-24"},
-    {"Station_Number": "2260700", "norm": 0.3909174312, "date": "2022-05-25"},
-    {"Station_Number": "2260700", "norm": 0.4106116208, "date": "2022-05-26"},
-    {"Station_Number": "2260700", "norm": 0.4214067278, "date": "2022-05-27"},
-    {"Station_Number": "2260700", "norm": 0.4174311927, "date": "2022-05-28"},
-    {"Station_Number": "2260700", "norm": 0.3996941896, "date": "2022-05-29"},
-    {"Station_Number": "2260700", "norm": 0.370030581, "date": "2022-05-30"},
-    {"Station_Number": "2260700", "norm": 0.3311926606, "date": "2022-05-31"},
-    {"Station_Number": "2260700", "norm": 0.2948318043, "date": "2022-06-01"},
-    {"Station_Number": "2260700", "norm": 0.2693883792, "date": "2022-06-02"},
-    {"Station_Number": "2260700", "norm": 0.2563302752, "date": "2022-06-03"},
-    {"Station_Number": "2260700", "norm": 0.2563302752, "date": "2022-06-04"},
-    {"Station_Number": "2260700", "norm": 0.2666360856, "date": "2022-06-05"},
-    {"Station_Number": "2260700", "norm": 0.2675535168, "date": "2022-06-06"},
-    {"Station_Number": "2260700", "norm": 0.264617737, "date": "2022-06-07"},
-    {"Station_Number": "2260700", "norm": 0.257675841, "date": "2022-06-08"},
-    {"Station_Number": "2260700", "norm": 0.2511620795, "date": "2022-06-09"},
-    {"Station_Number": "2260700", "norm": 0.2556574924, "date": "2022-06-10"},
-    {"Station_Number": "2260700", "norm": 0.2767889908, "date": "2022-06-11"},
-    {"Station_Number": "2260700", "norm": 0.3110091743, "date": "2022-06-12"},
-    {"Station_Number": "2260700", "norm": 0.3509785933, "date": "2022-06-13"},
-    {"Station_Number": "2260700", "norm": 0.3831804281, "date": "2022-06-14"},
-    {"Station_Number": "2260700", "norm": 0.4086544343, "date": "2022-06-15"},
-    {"Station_Number": "2260700", "norm": 0.4422018349, "date": "2022-06-16"},
-    {"Station_Number": "2260700", "norm": 0.483088685, "date": "2022-06-17"},
-    {"Station_Number": "2260700", "norm": 0.528440367, "date": "2022-06-18"},
-    {"Station_Number": "2260700", "norm": 0.5712538226, "date": "2022-06-19"},
-    {"Station_Number": "2260700", "norm": 0.6026605505, "date": "2022-06-20"},
-    {"Station_Number": "2260700", "norm": 0.6248623853, "date": "2022-06-21"},
-    {"Station_Number": "2260700", "norm": 0.6505504587, "date": "2022-06-22"},
-    {"Station_Number": "2260700", "norm": 0.6828746177, "date": "2022-06-23"},
-    {"Station_Number": "2260700", "norm": 0.7220183486, "date": "2022-06-24"},
-    {"Station_Number": "2260700", "norm": 0.7494495413, "date": "2022-06-25"},
-    {"Station_Number": "2260700", "norm": 0.8023547401, "date": "2022-06-26"},
-    {"Station_Number": "2260700", "norm": 0.8402752294, "date": "2022-06-27"},
-    {"Station_Number": "2260700", "norm": 0.8766666667, "date": "2022-06-28"},
-    {"Station_Number": "2260700", "norm": 0.9025382263, "date": "2022-06-29"},
-    {"Station_Number": "2260700", "norm": 0.9245565749, "date": "2022-06-30"},
-    {"Station_Number": "2260700", "norm": 0.9425076453, "date": "2022-07-01"},
-    {"Station_Number": "2260700", "norm": 0.9568807339, "date": "2022-07-02"},
-    {"Station_Number": "2260700", "norm": 0.9639143731, "date": "2022-07-03"},
-    {"Station_Number": "2260700", "norm": 0.9674923547, "date": "2022-07-04"},
-    {"Station_Number": "2260700", "norm": 0.970030581, "date": "2022-07-05"},
-    {"Station_Number": "2260700", "norm": 0.9749235474, "date": "2022-07-06"},
-    {"Station_Number": "2260700", "norm": 0.9833944954, "date": "2022-07-07"},
-    {"Station_Number": "2260700", "norm": 0.9925688073, "date": "2022-07-08"},
-    {"Station_Number": "2260700", "norm": 0.9987767584, "date": "2022-07-09"},
-    {"Station_Number": "2260700", "norm": 1.0, "date": "2022-07-10"},
-    {"Station_Number": "2260700", "norm": 0.9844036697, "date": "2022-07-11"},
-    {"Station_Number": "2260700", "norm": 0.9537308869, "date": "2022-07-12"},
-    {"Station_Number": "2260700", "norm": 0.9018348624, "date": "2022-07-13"},
-    {"Station_Number": "2260700", "norm": 0.8348623853, "date": "2022-07-14"},
-    {"Station_Number": "2260700", "norm": 0.7603363914, "date": "2022-07-15"},
-    {"Station_Number": "2260700", "norm": 0.6935779817, "date": "2022-07-16"},
-    {"Station_Number": "2260700", "norm": 0.6334250765, "date": "2022-07-17"},
-    {"Station_Number": "2260700", "norm": 0.5794189602, "date": "2022-07-18"},
-    {"Station_Number": "2260700", "norm": 0.5345565749, "date": "2022-07-19"},
-    {"Station_Number": "2260700", "norm": 0.4988685015, "date": "2022-07-20"},
-    {"Station_Number": "2260700", "norm": 0.4752293578, "date": "2022-07-21"},
-    {"Station_Number": "2260700", "norm": 0.4624770642, "date": "2022-07-22"},
-    {"Station_Number": "2260700", "norm": 0.4409785933, "date": "2022-07-23"},
-    {"Station_Number": "2260700", "norm": 0.4308868502, "date": "2022-07-24"},
-    {"Station_Number": "2260700", "norm": 0.439969419, "date": "2022-07-25"},
-    {"Station_Number": "2260700", "norm": 0.4672782875, "date": "2022-07-26"},
-    {"Station_Number": "2260700", "norm": 0.5117125382, "date": "2022-07-27"},
-    {"Station_Number": "2260700", "norm": 0.5606422018, "date": "2022-07-28"},
-    {"Station_Number": "2260700", "norm": 0.5997859327, "date": "2022-07-29"},
-    {"Station_Number": "2260700", "norm": 0.6240672783, "date": "2022-07-30"},
-    {"Station_Number": "2260700", "norm": 0.6311926606, "date": "2022-07-31"},
-    {"Station_Number": "2260700", "norm": 0.6231498471, "date": "2022-08-01"},
-    {"Station_Number": "2260700", "norm": 0.6046788991, "date": "2022-08-02"},
-    {"Station_Number": "2260700", "norm": 0.5904281346, "date": "2022-08-03"},
-    {"Station_Number": "2260700", "norm": 0.5810397554, "date": "2022-08-04"},
-    {"Station_Number": "2260700", "norm": 0.576146789, "date": "2022-08-05"},
-    {"Station_Number": "2260700", "norm": 0.5740978593, "date": "2022-08-06"},
-    {"Station_Number": "2260700", "norm": 0.569204893, "date": "2022-08-07"},
-    {"Station_Number": "2260700", "norm": 0.5684097859, "date": "2022-08-08"},
-    {"Station_Number": "2260700", "norm": 0.5704281346, "date": "2022-08-09"},
-    {"Station_Number": "2260700", "norm": 0.5863302752, "date": "2022-08-10"},
-    {"Station_Number": "2260700", "norm": 0.5948929664, "date": "2022-08-11"},
-    {"Station_Number": "2260700", "norm": 0.6091743119, "date": "2022-08-12"},
-    {"Station_Number": "2260700", "norm": 0.6266972477, "date": "2022-08-13"},
-    {"Station_Number": "2260700", "norm": 0.6414984709, "date": "2022-08-14"},
-    {"Station_Number": "2260700", "norm": 0.6397553517, "date": "2022-08-15"},
-    {"Station_Number": "2260700", "norm": 0.6179510703, "date": "2022-08-16"},
-    {"Station_Number": "2260700", "norm": 0.5944954128, "date": "2022-08-17"},
-    {"Station_Number": "2260700", "norm": 0.5810397554, "date": "2022-08-18"},
-    {"Station_Number": "2260700", "norm": 0.5724770642, "date": "2022-08-19"},
-    {"Station_Number": "2260700", "norm": 0.5606422018, "date": "2022-08-20"},
-    {"Station_Number": "2260700", "norm": 0.5488379205, "date": "2022-08-21"},
-    {"Station_Number": "2260700", "norm": 0.5337308869, "date": "2022-08-22"},
-    {"Station_Number": "2260700", "norm": 0.5227217125, "date": "2022-08-23"},
-    {"Station_Number": "2260700", "norm": 0.5137614679, "date": "2022-08-24"},
-    {"Station_Number": "2260700", "norm": 0.5048012232, "date": "2022-08-25"},
-    {"Station_Number": "2260700", "norm": 0.4899082569, "date": "2022-08-26"},
-    {"Station_Number": "2260700", "norm": 0.4865443425, "date": "2022-08-27"},
-    {"Station_Number": "2260700", "norm": 0.4820489297, "date": "2022-08-28"},
-    {"Station_Number": "2260700", "norm": 0.4758409786, "date": "2022-08-29"},
-    {"Station_Number": "2260700", "norm": 0.4614678899, "date": "2022-08-30"},
-    {"Station_Number": "2260700", "norm": 0.4494495413, "date": "2022-08-31"},
-    {"Station_Number": "2260700", "norm": 0.4474006116, "date": "2022-09-01"},
-    {"Station_Number": "2260700", "norm": 0.4533027523, "date": "2022-09-02"},
-    {"Station_Number": "2260700", "norm": 0.4675840979, "date": "2022-09-03"},
-    {"Station_Number": "2260700", "norm": 0.4902140673, "date": "2022-09-04"},
-    {"Station_Number": "2260700", "norm": 0.5149847095, "date": "2022-09-05"},
-    {"Station_Number": "2260700", "norm": 0.5321100917, "date": "2022-09-06"},
-    {"Station_Number": "2260700", "norm": 0.5512844037, "date": "2022-09-07"},
-    {"Station_Number": "2260700", "norm": 0.5688073394, "date": "2022-09-08"},
-    {"Station_Number": "2260700", "norm": 0.5948929664, "date": "2022-09-09"},
-    {"Station_Number": "2260700", "norm": 0.6148929664, "date": "2022-09-10"},
-    {"Station_Number": "2260700", "norm": 0.6473088685, "date": "2022-09-11"},
-    {"Station_Number": "2260700", "norm": 0.7140672783, "date": "2022-09-12"},
-    {"Station_Number": "2260700", "norm": 0.7724770642, "date": "2022-09-13"},
-    {"Station_Number": "2260700", "norm": 0.8077370031, "date": "2022-09-14"},
-    {"Station_Number": "2260700", "norm": 0.8278287462, "date": "2022-09-15"},
-    {"Station_Number": "2260700", "norm": 0.8354740061, "date": "2022-09-16"},
-    {"Station_Number": "2260700", "norm": 0.8279204893, "date": "2022-09-17"},
-    {"Station_Number": "2260700", "norm": 0.7988685015, "date": "2022-09-18"},
-    {"Station_Number": "2260700", "norm": 0.7470030581, "date": "2022-09-19"},
-    {"Station_Number": "2260700", "norm": 0.6788990826, "date": "2022-09-20"},
-    {"Station_Number": "2260700", "norm": 0.6143730887, "date": "2022-09-21"},
-    {"Station_Number": "2260700", "norm": 0.5745259939, "date": "2022-09-22"},
-    {"Station_Number": "2260700", "norm": 0.5594189602, "date": "2022-09-23"},
-    {"Station_Number": "2260700", "norm": 0.555351682, "date": "2022-09-24"},
-    {"Station_Number": "2260700", "norm": 0.5533027523, "date": "2022-09-25"},
-    {"Station_Number": "2260700", "norm": 0.5581957187, "date": "2022-09-26"},
-    {"Station_Number": "2260700", "norm": 0.5614678899, "date": "2022-09-27"},
-    {"Station_Number": "2260700", "norm": 0.555351682, "date": "2022-09-28"},
-    {"Station_Number": "2260700", "norm": 0.5626911315, "date": "2022-09-29"},
-    {"Station_Number": "2260700", "norm": 0.5896024465, "date": "2022-09-30"},
-    {"Station_Number": "2260700", "norm": 0.61, "date": "2022-10-01"},
-    {"Station_Number": "2260700", "norm": 0.6396636086, "date": "2022-10-02"},
-    {"Station_Number": "2260700", "norm": 0.6517737003, "date": "2022-10-03"},
-    {"Station_Number": "2260700", "norm": 0.6302752294, "date": "2022-10-04"},
-    {"Station_Number": "2260700", "norm": 0.5879816514, "date": "2022-10-05"},
-    {"Station_Number": "2260700", "norm": 0.5545259939, "date": "2022-10-06"},
-    {"Station_Number": "2260700", "norm": 0.5516819572, "date": "2022-10-07"},
-    {"Station_Number": "2260700", "norm": 0.5577981651, "date": "2022-10-08"},
-    {"Station_Number": "2260700", "norm": 0.5716513761, "date": "2022-10-09"},
-    {"Station_Number": "2260700", "norm": 0.570030581, "date": "2022-10-10"},
-    {"Station_Number": "2260700", "norm": 0.5243730887, "date": "2022-10-11"},
-    {"Station_Number": "2260700", "norm": 0.4906116208, "date": "2022-10-12"},
-    {"Station_Number": "2260700", "norm": 0.4906116208, "date": "2022-10-13"},
-    {"Station_Number": "2260700", "norm": 0.476146789, "date": "2022-10-14"},
-    {"Station_Number": "2260700", "norm": 0.4754434251, "date": "2022-10-15"},
-    {"Station_Number": "2260700", "norm": 0.4739143731, "date": "2022-10-16"},
-    {"Station_Number": "2260700", "norm": 0.4752293578, "date": "2022-10-17"},
-    {"Station_Number": "2260700", "norm": 0.4951987768, "date": "2022-10-18"},
-    {"Station_Number": "2260700", "norm": 0.5231498471, "date": "2022-10-19"},
-    {"Station_Number": "2260700", "norm": 0.542293578, "date": "2022-10-20"},
-    {"Station_Number": "2260700", "norm": 0.5504587156, "date": "2022-10-21"},
-    {"Station_Number": "2260700", "norm": 0.5476146789, "date": "2022-10-22"},
-    {"Station_Number": "2260700", "norm": 0.5259938838, "date": "2022-10-23"},
-    {"Station_Number": "2260700", "norm": 0.4888990826, "date": "2022-10-24"},
-    {"Station_Number": "2260700", "norm": 0.4457798165, "date": "2022-10-25"},
-    {"Station_Number": "2260700", "norm": 0.4233333333, "date": "2022-10-26"},
-    {"Station_Number": "2260700", "norm": 0.3939755352, "date": "2022-10-27"},
-    {"Station_Number": "2260700", "norm": 0.3685015291, "date": "2022-10-28"},
-    {"Station_Number": "2260700", "norm": 0.3654434251, "date": "2022-10-29"},
-    {"Station_Number": "2260700", "norm": 0.3871559633, "date": "2022-10-30"},
-    {"Station_Number": "2260700", "norm": 0.4242507645, "date": "2022-10-31"},
-    {"Station_Number": "2260700", "norm": 0.4503669725, "date": "2022-11-01"},
-    {"Station_Number": "2260700", "norm": 0.4749235474, "date": "2022-11-02"},
-    {"Station_Number": "2260700", "norm": 0.4822629969, "date": "2022-11-03"},
-    {"Station_Number": "2260700", "norm": 0.4663608563, "date": "2022-11-04"},
-    {"Station_Number": "2260700", "norm": 0.4255963303, "date": "2022-11-05"},
-    {"Station_Number": "2260700", "norm": 0.3758409786, "date": "2022-11-06"},
-    {"Station_Number": "2260700", "norm": 0.3327217125, "date": "2022-11-07"},
-    {"Station_Number": "2260700", "norm": 0.2985321101, "date": "2022-11-08"},
-    {"Station_Number": "2260700", "norm": 0.2744036697, "date": "2022-11-09"},
-    {"Station_Number": "2260700", "norm": 0.2588073394, "date": "2022-11-10"},
-    {"Station_Number": "2260700", "norm": 0.2471253823, "date": "2022-11-11"},
-    {"Station_Number": "2260700", "norm": 0.2374923547, "date": "2022-11-12"},
-    {"Station_Number": "2260700", "norm": 0.2300917431, "date": "2022-11-13"},
-    {"Station_Number": "2260700", "norm": 0.2226911315, "date": "2022-11-14"},
-    {"Station_Number": "2260700", "norm": 0.2164220183, "date": "2022-11-15"},
-    {"Station_Number": "2260700", "norm": 0.2105810398, "date": "2022-11-16"},
-    {"Station_Number": "2260700", "norm": 0.2043119266, "date": "2022-11-17"},
-    {"Station_Number": "2260700", "norm": 0.1981651376, "date": "2022-11-18"},
-    {"Station_Number": "2260700", "norm": 0.1920489297, "date": "2022-11-19"},
-    {"Station_Number": "2260700", "norm": 0.1843119266, "date": "2022-11-20"},
-    {"Station_Number": "2260700", "norm": 0.1779816514, "date": "2022-11-21"},
-    {"Station_Number": "2260700", "norm": 0.1718960245, "date": "2022-11-22"},
-    {"Station_Number": "2260700", "norm": 0.1679510703, "date": "2022-11-23"},
-    {"Station_Number": "2260700", "norm": 0.1642813456, "date": "2022-11-24"},
-    {"Station_Number": "2260700", "norm": 0.1609785933, "date": "2022-11-25"},
-    {"Station_Number": "2260700", "norm": 0.157675841, "date": "2022-11-26"},
-    {"Station_Number": "2260700", "norm": 0.15382263, "date": "2022-11-27"},
-    {"Station_Number": "2260700", "norm": 0.1503363914, "date": "2022-11-28"},
-    {"Station_Number": "2260700", "norm": 0.1475840979, "date": "2022-11-29"},
-    {"Station_Number": "2260700", "norm": 0.1448318043, "date": "2022-11-30"},
-    {"Station_Number": "2260700", "norm": 0.1420795107, "date": "2022-12-01"},
-    {"Station_Number": "2260700", "norm": 0.1393272171, "date": "2022-12-02"},
-    {"Station_Number": "2260700", "norm": 0.1371253823, "date": "2022-12-03"},
-    {"Station_Number": "2260700", "norm": 0.1341896024, "date": "2022-12-04"},
-    {"Station_Number": "2260700", "norm": 0.1308868502, "date": "2022-12-05"},
-    {"Station_Number": "2260700", "norm": 0.1277675841, "date": "2022-12-06"},
-    {"Station_Number": "2260700", "norm": 0.1250152905, "date": "2022-12-07"},
-    {"Station_Number": "2260700", "norm": 0.1222629969, "date": "2022-12-08"},
-    {"Station_Number": "2260700", "norm": 0.1195107034, "date": "2022-12-09"},
-    {"Station_Number": "2260700", "norm": 0.1178593272, "date": "2022-12-10"},
-    {"Station_Number": "2260700", "norm": 0.115351682, "date": "2022-12-11"},
-    {"Station_Number": "2260700", "norm": 0.1127828746, "date": "2022-12-12"},
-    {"Station_Number": "2260700", "norm": 0.1109174312, "date": "2022-12-13"},
-    {"Station_Number": "2260700", "norm": 0.1096330275, "date": "2022-12-14"},
-    {"Station_Number": "2260700", "norm": 0.1079204893, "date": "2022-12-15"},
-    {"Station_Number": "2260700", "norm": 0.1062079511, "date": "2022-12-16"},
-    {"Station_Number": "2260700", "norm": 0.1044954128, "date": "2022-12-17"},
-    {"Station_Number": "2260700", "norm": 0.1032110092, "date": "2022-12-18"},
-    {"Station_Number": "2260700", "norm": 0.1019266055, "date": "2022-12-19"},
-    {"Station_Number": "2260700", "norm": 0.1003669725, "date": "2022-12-20"},
-    {"Station_Number": "2260700", "norm": 0.0990825688, "date": "2022-12-21"},
-    {"Station_Number": "2260700", "norm": 0.0976452599, "date": "2022-12-22"},
-    {"Station_Number": "2260700", "norm": 0.0965137615, "date": "2022-12-23"},
-    {"Station_Number": "2260700", "norm": 0.0956574924, "date": "2022-12-24"},
-    {"Station_Number": "2260700", "norm": 0.0948012232, "date": "2022-12-25"},
-    {"Station_Number": "2260700", "norm": 0.0936697248, "date": "2022-12-26"},
-    {"Station_Number": "2260700", "norm": 0.0928134557, "date": "2022-12-27"},
-    {"Station_Number": "2260700", "norm": 0.0919571865, "date": "2022-12-28"},
-    {"Station_Number": "2260700", "norm": 0.090795107, "date": "2022-12-29"},
-    {"Station_Number": "2260700", "norm": 0.0893883792, "date": "2022-12-30"},
-    {"Station_Number": "2260700", "norm": 0.0885321101, "date": "2022-12-31"},
-    {"Station_Number": "2260700", "norm": 0.0728404472, "date": "2023-01-01"},
-    {"Station_Number": "2260700", "norm": 0.071875, "date": "2023-01-02"},
-    {"Station_Number": "2260700", "norm": 0.0704522358, "date": "2023-01-03"},
-    {"Station_Number": "2260700", "norm": 0.0689278455, "date": "2023-01-04"},
-    {"Station_Number": "2260700", "norm": 0.068445122, "date": "2023-01-05"},
-    {"Station_Number": "2260700", "norm": 0.0690294715, "date": "2023-01-06"},
-    {"Station_Number": "2260700", "norm": 0.0704522358, "date": "2023-01-07"},
-    {"Station_Number": "2260700", "norm": 0.0699949187, "date": "2023-01-08"},
-    {"Station_Number": "2260700", "norm": 0.0689278455, "date": "2023-01-09"},
-    {"Station_Number": "2260700", "norm": 0.0678607724, "date": "2023-01-10"},
-    {"Station_Number": "2260700", "norm": 0.0668953252, "date": "2023-01-11"},
-    {"Station_Number": "2260700", "norm": 0.065370935, "date": "2023-01-12"},
-    {"Station_Number": "2260700", "norm": 0.0638211382, "date": "2023-01-13"},
-    {"Station_Number": "2260700", "norm": 0.062398374, "date": "2023-01-14"},
-    {"Station_Number": "2260700", "norm": 0.0610010163, "date": "2023-01-15"},
-    {"Station_Number": "2260700", "norm": 0.0601626016, "date": "2023-01-16"},
-    {"Station_Number": "2260700", "norm": 0.0595528455, "date": "2023-01-17"},
-    {"Station_Number": "2260700", "norm": 0.0589430894, "date": "2023-01-18"},
-    {"Station_Number": "2260700", "norm": 0.0583333333, "date": "2023-01-19"},
-    {"Station_Number": "2260700", "norm": 0.0577235772, "date": "2023-01-20"},
-    {"Station_Number": "2260700", "norm": 0.0571138211, "date": "2023-01-21"},
-    {"Station_Number": "2260700", "norm": 0.0568089431, "date": "2023-01-22"},
-    {"Station_Number": "2260700", "norm": 0.056504065, "date": "2023-01-23"},
-    {"Station_Number": "2260700", "norm": 0.056199187, "date": "2023-01-24"},
-    {"Station_Number": "2260700", "norm": 0.0555894309, "date": "2023-01-25"},
-    {"Station_Number": "2260700", "norm": 0.0552845528, "date": "2023-01-26"},
-    {"Station_Number": "2260700", "norm": 0.0549796748, "date": "2023-01-27"},
-    {"Station_Number": "2260700", "norm": 0.0546747967, "date": "2023-01-28"},
-    {"Station_Number": "2260700", "norm": 0.0541666667, "date": "2023-01-29"},
-    {"Station_Number": "2260700", "norm": 0.0532520325, "date": "2023-01-30"},
-    {"Station_Number": "2260700", "norm": 0.0522357724, "date": "2023-01-31"},
-    {"Station_Number": "2260700", "norm": 0.0512195122, "date": "2023-02-01"},
-    {"Station_Number": "2260700", "norm": 0.0504065041, "date": "2023-02-02"},
-    {"Station_Number": "2260700", "norm": 0.049796748, "date": "2023-02-03"},
-    {"Station_Number": "2260700", "norm": 0.0493902439, "date": "2023-02-04"},
-    {"Station_Number": "2260700", "norm": 0.0488821138, "date": "2023-02-05"},
-    {"Station_Number": "2260700", "norm": 0.0482723577, "date": "2023-02-06"},
-    {"Station_Number": "2260700", "norm": 0.0476626016, "date": "2023-02-07"},
-    {"Station_Number": "2260700", "norm": 0.0473577236, "date": "2023-02-08"},
-    {"Station_Number": "2260700", "norm": 0.0470528455, "date": "2023-02-09"},
-    {"Station_Number": "2260700", "norm": 0.0467479675, "date": "2023-02-10"},
-    {"Station_Number": "2260700", "norm": 0.0461382114, "date": "2023-02-11"},
-    {"Station_Number": "2260700", "norm": 0.0455284553, "date": "2023-02-12"},
-    {"Station_Number": "2260700", "norm": 0.0446138211, "date": "2023-02-13"},
-    {"Station_Number": "2260700", "norm": 0.043699187, "date": "2023-02-14"},
-    {"Station_Number": "2260700", "norm": 0.0429878049, "date": "2023-02-15"},
-    {"Station_Number": "2260700", "norm": 0.0426829268, "date": "2023-02-16"},
-    {"Station_Number": "2260700", "norm": 0.0423780488, "date": "2023-02-17"},
-    {"Station_Number": "2260700", "norm": 0.0420731707, "date": "2023-02-18"},
-    {"Station_Number": "2260700", "norm": 0.0415650407, "date": "2023-02-19"},
-    {"Station_Number": "2260700", "norm": 0.0410569106, "date": "2023-02-20"},
-    {"Station_Number": "2260700", "norm": 0.0405487805, "date": "2023-02-21"},
-    {"Station_Number": "2260700", "norm": 0.0402439024, "date": "2023-02-22"},
-    {"Station_Number": "2260700", "norm": 0.0396341463, "date": "2023-02-23"},
-    {"Station_Number": "2260700", "norm": 0.0390243902, "date": "2023-02-24"},
-    {"Station_Number": "2260700", "norm": 0.0387195122, "date": "2023-02-25"},
-    {"Station_Number": "2260700", "norm": 0.0393292683, "date": "2023-02-26"},
-    {"Station_Number": "2260700", "norm": 0.0404471545, "date": "2023-02-27"},
-    {"Station_Number": "2260700", "norm": 0.0404471545, "date": "2023-02-28"},
-    {"Station_Number": "2260700", "norm": 0.0407520325, "date": "2023-03-01"},
-    {"Station_Number": "2260700", "norm": 0.0407520325, "date": "2023-03-02"},
-    {"Station_Number": "2260700", "norm": 0.0405487805, "date": "2023-03-03"},
-    {"Station_Number": "2260700", "norm": 0.0414634146, "date": "2023-03-04"},
-    {"Station_Number": "2260700", "norm": 0.0430894309, "date": "2023-03-05"},
-    {"Station_Number": "2260700", "norm": 0.0472560976, "date": "2023-03-06"},
-    {"Station_Number": "2260700", "norm": 0.0522357724, "date": "2023-03-07"},
-    {"Station_Number": "2260700", "norm": 0.0529471545, "date": "2023-03-08"},
-    {"Station_Number": "2260700", "norm": 0.0515243902, "date": "2023-03-09"},
-    {"Station_Number": "2260700", "norm": 0.0493902439, "date": "2023-03-10"},
-    {"Station_Number": "2260700", "norm": 0.0469512195, "date": "2023-03-11"},
-    {"Station_Number": "2260700", "norm": 0.0451219512, "date": "2023-03-12"},
-    {"Station_Number": "2260700", "norm": 0.043902439, "date": "2023-03-13"},
-    {"Station_Number": "2260700", "norm": 0.0430894309, "date": "2023-03-14"},
-    {"Station_Number": "2260700", "norm": 0.0424796748, "date": "2023-03-15"},
-    {"Station_Number": "2260700", "norm": 0.0415650407, "date": "2023-03-16"},
-    {"Station_Number": "2260700", "norm": 0.0409552846, "date": "2023-03-17"},
-    {"Station_Number": "2260700", "norm": 0.0402439024, "date": "2023-03-18"},
-    {"Station_Number": "2260700", "norm": 0.0399390244, "date": "2023-03-19"},
-    {"Station_Number": "2260700", "norm": 0.0396341463, "date": "2023-03-20"},
-    {"Station_Number": "2260700", "norm": 0.0395325203, "date": "2023-03-21"},
-    {"Station_Number": "2260700", "norm": 0.0393292683, "date": "2023-03-22"},
-    {"Station_Number": "2260700", "norm": 0.0389227642, "date": "2023-03-23"},
-    {"Station_Number": "2260700", "norm": 0.0382113821, "date": "2023-03-24"},
-    {"Station_Number": "2260700", "norm": 0.0381097561, "date": "2023-03-25"},
-    {"Station_Number": "2260700", "norm": 0.0384146341, "date": "2023-03-26"},
-    {"Station_Number": "2260700", "norm": 0.0388211382, "date": "2023-03-27"},
-    {"Station_Number": "2260700", "norm": 0.0402439024, "date": "2023-03-28"},
-    {"Station_Number": "2260700", "norm": 0.0423780488, "date": "2023-03-29"},
-    {"Station_Number": "2260700", "norm": 0.0452235772, "date": "2023-03-30"},
-    {"Station_Number": "2260700", "norm": 0.0515243902, "date": "2023-03-31"},
-    {"Station_Number": "2260700", "norm": 0.0616869919, "date": "2023-04-01"},
-    {"Station_Number": "2260700", "norm": 0.0703506098, "date": "2023-04-02"},
-    {"Station_Number": "2260700", "norm": 0.0735518293, "date": "2023-04-03"},
-    {"Station_Number": "2260700", "norm": 0.0715193089, "date": "2023-04-04"},
-    {"Station_Number": "2260700", "norm": 0.0672510163, "date": "2023-04-05"},
-    {"Station_Number": "2260700", "norm": 0.0619156504, "date": "2023-04-06"},
-    {"Station_Number": "2260700", "norm": 0.0597560976, "date": "2023-04-07"},
-    {"Station_Number": "2260700", "norm": 0.0588414634, "date": "2023-04-08"},
-    {"Station_Number": "2260700", "norm": 0.0576219512, "date": "2023-04-09"},
-    {"Station_Number": "2260700", "norm": 0.0557926829, "date": "2023-04-10"},
-    {"Station_Number": "2260700", "norm": 0.0537601626, "date": "2023-04-11"},
-    {"Station_Number": "2260700", "norm": 0.0537601626, "date": "2023-04-12"},
-    {"Station_Number": "2260700", "norm": 0.0570121951, "date": "2023-04-13"},
-    {"Station_Number": "2260700", "norm": 0.0628810976, "date": "2023-04-14"},
-    {"Station_Number": "2260700", "norm": 0.065828252, "date": "2023-04-15"},
-    {"Station_Number": "2260700", "norm": 0.0647611789, "date": "2023-04-16"},
-    {"Station_Number": "2260700", "norm": 0.0620426829, "date": "2023-04-17"},
-    {"Station_Number": "2260700", "norm": 0.0589430894, "date": "2023-04-18"},
-    {"Station_Number": "2260700", "norm": 0.056097561, "date": "2023-04-19"},
-    {"Station_Number": "2260700", "norm": 0.0533536585, "date": "2023-04-20"},
-    {"Station_Number": "2260700", "norm": 0.0509146341, "date": "2023-04-21"},
-    {"Station_Number": "2260700", "norm": 0.0487804878, "date": "2023-04-22"},
-    {"Station_Number": "2260700", "norm": 0.0467479675, "date": "2023-04-23"},
-    {"Station_Number": "2260700", "norm": 0.0452235772, "date": "2023-04-24"},
-    {"Station_Number": "2260700", "norm": 0.043597561, "date": "2023-04-25"},
-    {"Station_Number": "2260700", "norm": 0.0424796748, "date": "2023-04-26"},
-    {"Station_Number": "2260700", "norm": 0.0424796748, "date": "2023-04-27"},
-    {"Station_Number": "2260700", "norm": 0.0432926829, "date": "2023-04-28"},
-    {"Station_Number": "2260700", "norm": 0.0448170732, "date": "2023-04-29"},
-    {"Station_Number": "2260700", "norm": 0.0445121951, "date": "2023-04-30"},
-    {"Station_Number": "2260700", "norm": 0.0446138211, "date": "2023-05-01"},
-    {"Station_Number": "2260700", "norm": 0.0461382114, "date": "2023-05-02"},
-    {"Station_Number": "2260700", "norm": 0.0484756098, "date": "2023-05-03"},
-    {"Station_Number": "2260700", "norm": 0.0495934959, "date": "2023-05-04"},
-    {"Station_Number": "2260700", "norm": 0.0487804878, "date": "2023-05-05"},
-    {"Station_Number": "2260700", "norm": 0.0478658537, "date": "2023-05-06"},
-    {"Station_Number": "2260700", "norm": 0.0466463415, "date": "2023-05-07"},
-    {"Station_Number": "2260700", "norm": 0.0446138211, "date": "2023-05-08"},
-    {"Station_Number": "2260700", "norm": 0.0432926829, "date": "2023-05-09"},
-    {"Station_Number": "2260700", "norm": 0.0423780488, "date": "2023-05-10"},
-    {"Station_Number": "2260700", "norm": 0.0418699187, "date": "2023-05-11"},
-    {"Station_Number": "2260700", "norm": 0.043597561, "date": "2023-05-12"},
-    {"Station_Number": "2260700", "norm": 0.0485772358, "date": "2023-05-13"},
-    {"Station_Number": "2260700", "norm": 0.0569105691, "date": "2023-05-14"},
-    {"Station_Number": "2260700", "norm": 0.0786331301, "date": "2023-05-15"},
-    {"Station_Number": "2260700", "norm": 0.1923272358, "date": "2023-05-16"},
-    {"Station_Number": "2260700", "norm": 0.2086636179, "date": "2023-05-17"},
-    {"Station_Number": "2260700", "norm": 0.1494664634, "date": "2023-05-18"},
-    {"Station_Number": "2260700", "norm": 0.1238313008, "date": "2023-05-19"},
-    {"Station_Number": "2260700", "norm": 0.1075203252, "date": "2023-05-20"},
-    {"Station_Number": "2260700", "norm": 0.0945376016, "date": "2023-05-21"},
-    {"Station_Number": "2260700", "norm": 0.0896595528, "date": "2023-05-22"},
-    {"Station_Number": "2260700", "norm": 0.0836128049, "date": "2023-05-23"},
-    {"Station_Number": "2260700", "norm": 0.0766260163, "date": "2023-05-24"},
-    {"Station_Number": "2260700", "norm": 0.0767530488, "date": "2023-05-25"},
-    {"Station_Number": "2260700", "norm": 0.0825457317, "date": "2023-05-26"},
-    {"Station_Number": "2260700", "norm": 0.084222561, "date": "2023-05-27"},
-    {"Station_Number": "2260700", "norm": 0.0808943089, "date": "2023-05-28"},
-    {"Station_Number": "2260700", "norm": 0.0759146341, "date": "2023-05-29"},
-    {"Station_Number": "2260700", "norm": 0.0743648374, "date": "2023-05-30"},
-    {"Station_Number": "2260700", "norm": 0.0753302846, "date": "2023-05-31"},
-    {"Station_Number": "2260700", "norm": 0.0741361789, "date": "2023-06-01"},
-    {"Station_Number": "2260700", "norm": 0.071875, "date": "2023-06-02"},
-    {"Station_Number": "2260700", "norm": 0.0666666667, "date": "2023-06-03"},
-    {"Station_Number": "2260700", "norm": 0.0631097561, "date": "2023-06-04"},
-    {"Station_Number": "2260700", "norm": 0.062398374, "date": "2023-06-05"},
-    {"Station_Number": "2260700", "norm": 0.0645325203, "date": "2023-06-06"},
-    {"Station_Number": "2260700", "norm": 0.0695121951, "date": "2023-06-07"},
-    {"Station_Number": "2260700", "norm": 0.068445122, "date": "2023-06-08"},
-    {"Station_Number": "2260700", "norm": 0.0666666667, "date": "2023-06-09"},
-    {"Station_Number": "2260700", "norm": 0.0652439024, "date": "2023-06-10"},
-    {"Station_Number": "2260700", "norm": 0.0648882114, "date": "2023-06-11"},
-    {"Station_Number": "2260700", "norm": 0.065472561, "date": "2023-06-12"},
-    {"Station_Number": "2260700", "norm": 0.0659552846, "date": "2023-06-13"},
-    {"Station_Number": "2260700", "norm": 0.0652439024, "date": "2023-06-14"},
-    {"Station_Number": "2260700", "norm": 0.0645325203, "date": "2023-06-15"},
-    {"Station_Number": "2260700", "norm": 0.0655995935, "date": "2023-06-16"},
-    {"Station_Number": "2260700", "norm": 0.0689278455, "date": "2023-06-17"},
-    {"Station_Number": "2260700", "norm": 0.074847561, "date": "2023-06-18"},
-    {"Station_Number": "2260700", "norm": 0.0898119919, "date": "2023-06-19"},
-    {"Station_Number": "2260700", "norm": 0.1303861789, "date": "2023-06-20"},
-    {"Station_Number": "2260700", "norm": 0.1917174797, "date": "2023-06-21"},
-    {"Station_Number": "2260700", "norm": 0.2485772358, "date": "2023-06-22"},
-    {"Station_Number": "2260700", "norm": 0.297078252, "date": "2023-06-23"},
-    {"Station_Number": "2260700", "norm": 0.324949187, "date": "2023-06-24"},
-    {"Station_Number": "2260700", "norm": 0.3462906504, "date": "2023-06-25"},
-    {"Station_Number": "2260700", "norm": 0.353074187, "date": "2023-06-26"},
-    {"Station_Number": "2260700", "norm": 0.3571392276, "date": "2023-06-27"},
-    {"Station_Number": "2260700", "norm": 0.3587398374, "date": "2023-06-28"},
-    {"Station_Number": "2260700", "norm": 0.3671239837, "date": "2023-06-29"},
-    {"Station_Number": "2260700", "norm": 0.3869410569, "date": "2023-06-30"},
-    {"Station_Number": "2260700", "norm": 0.4114075203, "date": "2023-07-01"},
-    {"Station_Number": "2260700", "norm": 0.4322408537, "date": "2023-07-02"},
-    {"Station_Number": "2260700", "norm": 0.4376778455, "date": "2023-07-03"},
-    {"Station_Number": "2260700", "norm": 0.4237804878, "date": "2023-07-04"},
-    {"Station_Number": "2260700", "norm": 0.4023628049, "date": "2023-07-05"},
-    {"Station_Number": "2260700", "norm": 0.3804115854, "date": "2023-07-06"},
-    {"Station_Number": "2260700", "norm": 0.362804878, "date": "2023-07-07"},
-    {"Station_Number": "2260700", "norm": 0.3508638211, "date": "2023-07-08"},
-    {"Station_Number": "2260700", "norm": 0.3440802846, "date": "2023-07-09"},
-    {"Station_Number": "2260700", "norm": 0.3409552846, "date": "2023-07-10"},
-    {"Station_Number": "2260700", "norm": 0.3451981707, "date": "2023-07-11"},
-    {"Station_Number": "2260700", "norm": 0.3587398374, "date": "2023-07-12"},
-    {"Station_Number": "2260700", "norm": 0.3918445122, "date": "2023-07-13"},
-    {"Station_Number": "2260700", "norm": 0.446824187, "date": "2023-07-14"},
-    {"Station_Number": "2260700", "norm": 0.4979674797, "date": "2023-07-15"},
-    {"Station_Number": "2260700", "norm": 0.5397103659, "date": "2023-07-16"},
-    {"Station_Number": "2260700", "norm": 0.5726626016, "date": "2023-07-17"},
-    {"Station_Number": "2260700", "norm": 0.5970528455, "date": "2023-07-18"},
-    {"Station_Number": "2260700", "norm": 0.6197408537, "date": "2023-07-19"},
-    {"Station_Number": "2260700", "norm": 0.6422002033, "date": "2023-07-20"},
-    {"Station_Number": "2260700", "norm": 0.665828252, "date": "2023-07-21"},
-    {"Station_Number": "2260700", "norm": 0.6900406504, "date": "2023-07-22"},
-    {"Station_Number": "2260700", "norm": 0.7159552846, "date": "2023-07-23"},
-    {"Station_Number": "2260700", "norm": 0.7351880081, "date": "2023-07-24"},
-    {"Station_Number": "2260700", "norm": 0.7489075203, "date": "2023-07-25"},
-    {"Station_Number": "2260700", "norm": 0.7489075203, "date": "2023-07-26"},
-    {"Station_Number": "2260700", "norm": 0.7291666667, "date": "2023-07-27"},
-    {"Station_Number": "2260700", "norm": 0.6847815041, "date": "2023-07-28"},
-    {"Station_Number": "2260700", "norm": 0.6298272358, "date": "2023-07-29"},
-    {"Station_Number": "2260700", "norm": 0.5666412602, "date": "2023-07-30"},
-    {"Station_Number": "2260700", "norm": 0.5087144309, "date": "2023-07-31"},
-    {"Station_Number": "2260700", "norm": 0.471875, "date": "2023-08-01"},
-    {"Station_Number": "2260700", "norm": 0.4610518293, "date": "2023-08-02"},
-    {"Station_Number": "2260700", "norm": 0.4674796748, "date": "2023-08-03"},
-    {"Station_Number": "2260700", "norm": 0.4881351626, "date": "2023-08-04"},
-    {"Station_Number": "2260700", "norm": 0.5020325203, "date": "2023-08-05"},
-    {"Station_Number": "2260700", "norm": 0.5111788618, "date": "2023-08-06"},
-    {"Station_Number": "2260700", "norm": 0.5154979675, "date": "2023-08-07"},
-    {"Station_Number": "2260700", "norm": 0.5143038618, "date": "2023-08-08"},
-    {"Station_Number": "2260700", "norm": 0.5232977642, "date": "2023-08-09"},
-    {"Station_Number": "2260700", "norm": 0.5370934959, "date": "2023-08-10"},
-    {"Station_Number": "2260700", "norm": 0.5508130081, "date": "2023-08-11"},
-    {"Station_Number": "2260700", "norm": 0.5765497967, "date": "2023-08-12"},
-    {"Station_Number": "2260700", "norm": 0.6143292683, "date": "2023-08-13"},
-    {"Station_Number": "2260700", "norm": 0.655995935, "date": "2023-08-14"},
-    {"Station_Number": "2260700", "norm": 0.6960619919, "date": "2023-08-15"},
-    {"Station_Number": "2260700", "norm": 0.7365345528, "date": "2023-08-16"},
-    {"Station_Number": "2260700", "norm": 0.7715955285, "date": "2023-08-17"},
-    {"Station_Number": "2260700", "norm": 0.7980182927, "date": "2023-08-18"},
-    {"Station_Number": "2260700", "norm": 0.825203252, "date": "2023-08-19"},
-    {"Station_Number": "2260700", "norm": 0.8441819106, "date": "2023-08-20"},
-    {"Station_Number": "2260700", "norm": 0.8571392276, "date": "2023-08-21"},
-    {"Station_Number": "2260700", "norm": 0.8692327236, "date": "2023-08-22"},
-    {"Station_Number": "2260700", "norm": 0.8783028455, "date": "2023-08-23"},
-    {"Station_Number": "2260700", "norm": 0.8726371951, "date": "2023-08-24"},
-    {"Station_Number": "2260700", "norm": 0.8602642276, "date": "2023-08-25"},
-    {"Station_Number": "2260700", "norm": 0.8417936992, "date": "2023-08-26"},
-    {"Station_Number": "2260700", "norm": 0.8165650407, "date": "2023-08-27"},
-    {"Station_Number": "2260700", "norm": 0.7946392276, "date": "2023-08-28"},
-    {"Station_Number": "2260700", "norm": 0.7861534553, "date": "2023-08-29"},
-    {"Station_Number": "2260700", "norm": 0.7822662602, "date": "2023-08-30"},
-    {"Station_Number": "2260700", "norm": 0.7861534553, "date": "2023-08-31"},
-    {"Station_Number": "2260700", "norm": 0.7945376016, "date": "2023-09-01"},
-    {"Station_Number": "2260700", "norm": 0.8020833333, "date": "2023-09-02"},
-    {"Station_Number": "2260700", "norm": 0.8134400407, "date": "2023-09-03"},
-    {"Station_Number": "2260700", "norm": 0.8488313008, "date": "2023-09-04"},
-    {"Station_Number": "2260700", "norm": 0.9075965447, "date": "2023-09-05"},
-    {"Station_Number": "2260700", "norm": 0.9351371951, "date": "2023-09-06"},
-    {"Station_Number": "2260700", "norm": 0.9606961382, "date": "2023-09-07"},
-    {"Station_Number": "2260700", "norm": 0.9852642276, "date": "2023-09-08"},
-    {"Station_Number": "2260700", "norm": 1.0, "date": "2023-09-09"},
-    {"Station_Number": "2260700", "norm": 0.981199187, "date": "2023-09-10"},
-    {"Station_Number": "2260700", "norm": 0.9578252033, "date": "2023-09-11"},
-    {"Station_Number": "2260700", "norm": 0.9209095528, "date": "2023-09-12"},
-    {"Station_Number": "2260700", "norm": 0.8643292683, "date": "2023-09-13"},
-    {"Station_Number": "2260700", "norm": 0.8033536585, "date": "2023-09-14"},
-    {"Station_Number": "2260700", "norm": 0.7195884146, "date": "2023-09-15"},
-    {"Station_Number": "2260700", "norm": 0.6354928862, "date": "2023-09-16"},
-    {"Station_Number": "2260700", "norm": 0.5708841463, "date": "2023-09-17"},
-    {"Station_Number": "2260700", "norm": 0.5549542683, "date": "2023-09-18"},
-    {"Station_Number": "2260700", "norm": 0.5680132114, "date": "2023-09-19"},
-    {"Station_Number": "2260700", "norm": 0.5691056911, "date": "2023-09-20"},
-    {"Station_Number": "2260700", "norm": 0.5602134146, "date": "2023-09-21"},
-    {"Station_Number": "2260700", "norm": 0.547078252, "date": "2023-09-22"},
-    {"Station_Number": "2260700", "norm": 0.5304115854, "date": "2023-09-23"},
-    {"Station_Number": "2260700", "norm": 0.5192327236, "date": "2023-09-24"},
-    {"Station_Number": "2260700", "norm": 0.5165142276, "date": "2023-09-25"},
-    {"Station_Number": "2260700", "norm": 0.5202489837, "date": "2023-09-26"},
-    {"Station_Number": "2260700", "norm": 0.5068597561, "date": "2023-09-27"},
-    {"Station_Number": "2260700", "norm": 0.4915396341, "date": "2023-09-28"},
-    {"Station_Number": "2260700", "norm": 0.5247205285, "date": "2023-09-29"},
-    {"Station_Number": "2260700", "norm": 0.5564786585, "date": "2023-09-30"},
-    {"Station_Number": "2260700", "norm": 0.5753810976, "date": "2023-10-01"},
-    {"Station_Number": "2260700", "norm": 0.5668953252, "date": "2023-10-02"},
-    {"Station_Number": "2260700", "norm": 0.5579268293, "date": "2023-10-03"},
-    {"Station_Number": "2260700", "norm": 0.5445376016, "date": "2023-10-04"},
-    {"Station_Number": "2260700", "norm": 0.5166920732, "date": "2023-10-05"},
-    {"Station_Number": "2260700", "norm": 0.4759400407, "date": "2023-10-06"},
-    {"Station_Number": "2260700", "norm": 0.4430894309, "date": "2023-10-07"},
-    {"Station_Number": "2260700", "norm": 0.4204014228, "date": "2023-10-08"},
-    {"Station_Number": "2260700", "norm": 0.4034552846, "date": "2023-10-09"},
-    {"Station_Number": "2260700", "norm": 0.4066819106, "date": "2023-10-10"},
-    {"Station_Number": "2260700", "norm": 0.4149644309, "date": "2023-10-11"},
-    {"Station_Number": "2260700", "norm": 0.4308943089, "date": "2023-10-12"},
-    {"Station_Number": "2260700", "norm": 0.4424034553, "date": "2023-10-13"},
-    {"Station_Number": "2260700", "norm": 0.4454522358, "date": "2023-10-14"},
-    {"Station_Number": "2260700", "norm": 0.4569867886, "date": "2023-10-15"},
-    {"Station_Number": "2260700", "norm": 0.5010162602, "date": "2023-10-16"},
-    {"Station_Number": "2260700", "norm": 0.5474339431, "date": "2023-10-17"},
-    {"Station_Number": "2260700", "norm": 0.5761432927, "date": "2023-10-18"},
-    {"Station_Number": "2260700", "norm": 0.5830792683, "date": "2023-10-19"},
-    {"Station_Number": "2260700", "norm": 0.5699441057, "date": "2023-10-20"},
-    {"Station_Number": "2260700", "norm": 0.5441310976, "date": "2023-10-21"},
-    {"Station_Number": "2260700", "norm": 0.5038109756, "date": "2023-10-22"},
-    {"Station_Number": "2260700", "norm": 0.4569867886, "date": "2023-10-23"},
-    {"Station_Number": "2260700", "norm": 0.4042936992, "date": "2023-10-24"},
-    {"Station_Number": "2260700", "norm": 0.3636432927, "date": "2023-10-25"},
-    {"Station_Number": "2260700", "norm": 0.3392530488, "date": "2023-10-26"},
-    {"Station_Number": "2260700", "norm": 0.3155487805, "date": "2023-10-27"},
-    {"Station_Number": "2260700", "norm": 0.299796748, "date": "2023-10-28"},
-    {"Station_Number": "2260700", "norm": 0.2867632114, "date": "2023-10-29"},
-    {"Station_Number": "2260700", "norm": 0.2817581301, "date": "2023-10-30"},
-    {"Station_Number": "2260700", "norm": 0.2779471545, "date": "2023-10-31"},
-    {"Station_Number": "2260700", "norm": 0.2680386179, "date": "2023-11-01"},
-    {"Station_Number": "2260700", "norm": 0.252870935, "date": "2023-11-02"},
-    {"Station_Number": "2260700", "norm": 0.2394308943, "date": "2023-11-03"},
-    {"Station_Number": "2260700", "norm": 0.240523374, "date": "2023-11-04"},
-    {"Station_Number": "2260700", "norm": 0.234578252, "date": "2023-11-05"},
-    {"Station_Number": "2260700", "norm": 0.221976626, "date": "2023-11-06"},
-    {"Station_Number": "2260700", "norm": 0.2096036585, "date": "2023-11-07"},
-    {"Station_Number": "2260700", "norm": 0.1973069106, "date": "2023-11-08"},
-    {"Station_Number": "2260700", "norm": 0.1855691057, "date": "2023-11-09"},
-    {"Station_Number": "2260700", "norm": 0.1766260163, "date": "2023-11-10"},
-    {"Station_Number": "2260700", "norm": 0.1699186992, "date": "2023-11-11"},
-    {"Station_Number": "2260700", "norm": 0.1639481707, "date": "2023-11-12"},
-    {"Station_Number": "2260700", "norm": 0.1580284553, "date": "2023-11-13"},
-    {"Station_Number": "2260700", "norm": 0.1514227642, "date": "2023-11-14"},
-    {"Station_Number": "2260700", "norm": 0.1455030488, "date": "2023-11-15"},
-    {"Station_Number": "2260700", "norm": 0.1405995935, "date": "2023-11-16"},
-    {"Station_Number": "2260700", "norm": 0.1369410569, "date": "2023-11-17"},
-    {"Station_Number": "2260700", "norm": 0.1337398374, "date": "2023-11-18"},
-    {"Station_Number": "2260700", "norm": 0.1329776423, "date": "2023-11-19"},
-    {"Station_Number": "2260700", "norm": 0.1414380081, "date": "2023-11-20"},
-    {"Station_Number": "2260700", "norm": 0.1483739837, "date": "2023-11-21"},
-    {"Station_Number": "2260700", "norm": 0.1476880081, "date": "2023-11-22"},
-    {"Station_Number": "2260700", "norm": 0.1529471545, "date": "2023-11-23"},
-    {"Station_Number": "2260700", "norm": 0.1636178862, "date": "2023-11-24"},
-    {"Station_Number": "2260700", "norm": 0.1762449187, "date": "2023-11-25"},
-    {"Station_Number": "2260700", "norm": 0.1823932927, "date": "2023-11-26"},
-    {"Station_Number": "2260700", "norm": 0.1809197154, "date": "2023-11-27"},
-    {"Station_Number": "2260700", "norm": 0.1751270325, "date": "2023-11-28"},
-    {"Station_Number": "2260700", "norm": 0.1641260163, "date": "2023-11-29"},
-    {"Station_Number": "2260700", "norm": 0.1529471545, "date": "2023-11-30"},
-    {"Station_Number": "2260700", "norm": 0.1401676829, "date": "2023-12-01"},
-    {"Station_Number": "2260700", "norm": 0.1319105691, "date": "2023-12-02"},
-    {"Station_Number": "2260700", "norm": 0.1258130081, "date": "2023-12-03"},
-    {"Station_Number": "2260700", "norm": 0.1206300813, "date": "2023-12-04"},
-    {"Station_Number": "2260700", "norm": 0.1162093496, "date": "2023-12-05"},
-    {"Station_Number": "2260700", "norm": 0.1120934959, "date": "2023-12-06"},
-    {"Station_Number": "2260700", "norm": 0.1076727642, "date": "2023-12-07"},
-    {"Station_Number": "2260700", "norm": 0.1037093496, "date": "2023-12-08"},
-    {"Station_Number": "2260700", "norm": 0.1003556911, "date": "2023-12-09"},
-    {"Station_Number": "2260700", "norm": 0.0974593496, "date": "2023-12-10"},
-    {"Station_Number": "2260700", "norm": 0.0945376016, "date": "2023-12-11"},
-    {"Station_Number": "2260700", "norm": 0.0924034553, "date": "2023-12-12"},
-    {"Station_Number": "2260700", "norm": 0.0901422764, "date": "2023-12-13"},
-    {"Station_Number": "2260700", "norm": 0.0908536585, "date": "2023-12-14"},
-    {"Station_Number": "2260700", "norm": 0.0921493902, "date": "2023-12-15"},
-    {"Station_Number": "2260700", "norm": 0.093699187, "date": "2023-12-16"},
-    {"Station_Number": "2260700", "norm": 0.0946392276, "date": "2023-12-17"},
-    {"Station_Number": "2260700", "norm": 0.0958333333, "date": "2023-12-18"},
-    {"Station_Number": "2260700", "norm": 0.0971544715, "date": "2023-12-19"},
-    {"Station_Number": "2260700", "norm": 0.096875, "date": "2023-12-20"},
-    {"Station_Number": "2260700", "norm": 0.0933434959, "date": "2023-12-21"},
-    {"Station_Number": "2260700", "norm": 0.0892022358, "date": "2023-12-22"},
-    {"Station_Number": "2260700", "norm": 0.0860010163, "date": "2023-12-23"},
-    {"Station_Number": "2260700", "norm": 0.0833841463, "date": "2023-12-24"},
-    {"Station_Number": "2260700", "norm": 0.0808943089, "date": "2023-12-25"},
-    {"Station_Number": "2260700", "norm": 0.0787601626, "date": "2023-12-26"},
-    {"Station_Number": "2260700", "norm": 0.0763973577, "date": "2023-12-27"},
-    {"Station_Number": "2260700", "norm": 0.0737804878, "date": "2023-12-28"},
-    {"Station_Number": "2260700", "norm": 0.0716463415, "date": "2023-12-29"},
-    {"Station_Number": "2260700", "norm": 0.0702235772, "date": "2023-12-30"},
-    {"Station_Number": "2260700", "norm": 0.0685721545, "date": "2023-12-31"},
-]
@@ -0,0 +1,71 @@
+"""Assignment of the villages of the registry to their closest river station.
+
+The village registry is the one of the dashboard, see model/villages.py. Its ~6,000 villages are
+assigned in one vectorized call of StationIndex.nearest, and the resulting table is cached to disk
+under a key derived from the registry content and the stations, so that it is only recomputed when
+one of them changes.
+
+Notes:
+-   The cache directory can be set with the HYDRO_CACHE_DIR environment variable.
+-   The registry is not part of the serverless bundle (see vercel.json), the table is meant for
+    batch runs over the whole country.
+
+Example usage:
+    python -m model.hydro.villages
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from model.hydro.index import river_stations, station_index
+from model.services.utilities import write_atomic
+from model.villages import VILLAGES_PATH, read_villages
+
+HYDRO_CACHE_DIR = os.getenv(
+    "HYDRO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "microgrid-hydro-cache")
+)
+
+
+def village_station_table(path=VILLAGES_PATH, cache_dir=HYDRO_CACHE_DIR):
+    """Assigns every village of the registry to its closest river station.
+
+    Args:
+        path (str): TypeScript module exporting the villages
+        cache_dir (str): directory of the cached table
+
+    Returns:
+        dict: arrays of the village_cluster_id, station_number and distance (km) to the station
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(json.dumps(river_stations, sort_keys=True).encode())
+    cache_path = os.path.join(cache_dir, f"village-stations-{digest.hexdigest()}.npz")
+    try:
+        with np.load(cache_path) as cached:
+            return dict(cached)
+    except (FileNotFoundError, ValueError, OSError):
+        pass
+
+    villages = read_villages(path)
+    closest, distances = station_index.nearest(
+        villages["latitude"], villages["longitude"]
+    )
+    table = {
+        "village_cluster_id": villages["village_cluster_id"],
+        "station_number": station_index.station_numbers[closest],
+        "distance": distances,
+    }
+    os.makedirs(cache_dir, exist_ok=True)
+    write_atomic(cache_path, lambda f: np.savez(f, **table))
+    return table
+
+
+if __name__ == "__main__":
+    table = village_station_table()
+    stations, counts = np.unique(table["station_number"], return_counts=True)
+    print(f"{len(table['village_cluster_id'])} villages")
+    for station, count in zip(stations, counts):
+        print(f"{station}: {count} villages")
@@ -0,0 +1,102 @@
+"""On-disk cache of renewables.ninja responses.
+
+Historical MERRA-2 data of a location never changes, so the columns parsed from each response are
+stored as a .npz file named after the hash of the endpoint and its parameters (rounded coordinates,
+date range and model parameters) and served from disk afterwards. The cache is bounded in size: the
+least recently used files are evicted first, reading a file refreshes its modification time.
+
+Notes:
+-   The cache directory and its maximum size can be set with the RENEWABLES_NINJA_CACHE_DIR and
+    RENEWABLES_NINJA_CACHE_MAX_BYTES environment variables.
+-   cache_stats counts the hits and misses of the process.
+-   Responses cached as .json files by former versions are deleted by the next eviction.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from model.services.utilities import evict_least_recently_used, write_atomic
+
+RENEWABLES_NINJA_CACHE_DIR = os.getenv(
+    "RENEWABLES_NINJA_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "microgrid-renewables-ninja-cache"),
+)
+RENEWABLES_NINJA_CACHE_MAX_BYTES = int(
+    os.getenv("RENEWABLES_NINJA_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+)
+
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def response_cache_key(endpoint, params):
+    """Hashes a request.
+
+    Args:
+        endpoint (str): API endpoint, e.g. pv or demand
+        params (dict): query parameters of the request
+
+    Returns:
+        str: hexadecimal digest identifying the request
+    """
+    serialized = json.dumps({"endpoint": endpoint, "params": params}, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def load_response(key, cache_dir=RENEWABLES_NINJA_CACHE_DIR):
+    """Reads a cached response and counts the hit or miss.
+
+    Args:
+        key (str): cache key, see response_cache_key
+        cache_dir (str): directory of the cache
+
+    Returns:
+        dict: the columns of the response, or None if it is not cached
+    """
+    path = os.path.join(cache_dir, f"{key}.npz")
+    try:
+        with np.load(path) as f:
+            data = dict(f)
+    except (FileNotFoundError, ValueError, OSError):
+        cache_stats["misses"] += 1
+        return None
+    cache_stats["hits"] += 1
+    # mark the file as recently used for the eviction
+    os.utime(path)
+    return data
+
+
+def save_response(
+    key,
+    data,
+    cache_dir=RENEWABLES_NINJA_CACHE_DIR,
+    max_bytes=RENEWABLES_NINJA_CACHE_MAX_BYTES,
+):
+    """Writes a response to the cache and evicts the least recently used ones above max_bytes.
+
+    Args:
+        key (str): cache key, see response_cache_key
+        data (dict): columns of the response, arrays
+        cache_dir (str): directory of the cache
+        max_bytes (int): maximum size of the cache
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    write_atomic(os.path.join(cache_dir, f"{key}.npz"), lambda f: np.savez(f, **data))
+    evict(cache_dir, max_bytes)
+
+
+def evict(
+    cache_dir=RENEWABLES_NINJA_CACHE_DIR, max_bytes=RENEWABLES_NINJA_CACHE_MAX_BYTES
+):
+    """Removes the least recently used cached responses until the cache fits in max_bytes, and the
+    .json responses of the former format, which are never read.
+
+    Args:
+        cache_dir (str): directory of the cache
+        max_bytes (int): maximum size of the cache
+    """
+    # the .json responses of the former format are never read, all of them are removed
+    evict_least_recently_used(cache_dir, 0, ".json")
+    evict_least_recently_used(cache_dir, max_bytes, ".npz")
@@ -0,0 +1,83 @@
+"""Shared HTTP client of the service modules.
+
+A single requests.Session keeps the connections to the APIs alive between calls, so only the first
+request to a host pays for the TCP and TLS handshakes. Failed requests (connection errors, 429 and
+5xx responses) are retried with exponential backoff, honouring the Retry-After header, and every
+request has a timeout. Independent requests can be issued concurrently on the shared executor.
+
+Notes:
+-   The timeout (seconds), number of retries, backoff factor and connection pool size can be set
+    with the HTTP_TIMEOUT, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR and HTTP_POOL_SIZE environment
+    variables.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 30))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 3))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", 0.5))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 4))
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    max_retries=HTTP_MAX_RETRIES,
+    backoff_factor=HTTP_BACKOFF_FACTOR,
+    pool_size=HTTP_POOL_SIZE,
+    status_forcelist=HTTP_RETRY_STATUSES,
+):
+    """Creates a session with a pool of keep-alive connections and retries.
+
+    Args:
+        max_retries (int): number of retries of a failed request
+        backoff_factor (float): the n-th retry waits backoff_factor * 2 ** (n - 1) seconds
+        pool_size (int): number of connections kept per host
+        status_forcelist (tuple): response statuses retried
+
+    Returns:
+        requests.Session: the session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        # the caller handles the last response like any other
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+session = create_session()
+executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE)
+
+
+def get(url, params=None, headers=None, timeout=HTTP_TIMEOUT, http_session=None):
+    """Sends a GET request with the shared session.
+
+    Args:
+        url (str): URL
+        params (dict): query parameters
+        headers (dict): headers
+        timeout (float): seconds to wait for the connection and for each read
+        http_session (requests.Session): session sending the request instead of the shared one,
+            e.g. with other retries
+
+    Returns:
+        requests.Response: the response
+    """
+    return (http_session or session).get(
+        url, params=params, headers=headers, timeout=timeout
+    )
+
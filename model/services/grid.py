@@ -0,0 +1,61 @@
+"""Snapping of coordinates to the cells of the MERRA-2 reanalysis grid.
+
+renewables.ninja serves the merra2 dataset on a 0.5° (latitude) × 0.625° (longitude) grid, so every
+location of a cell gets the same weather. Snapping the coordinates to the center of their cell before
+fetching lets nearby villages share their downloads and cache entries.
+
+Example usage:
+    python -m model.services.grid
+"""
+import functools
+
+import numpy as np
+
+from model.villages import VILLAGES_PATH, read_villages
+
+MERRA2_LAT_STEP = 0.5
+MERRA2_LON_STEP = 0.625
+
+
+def snap_to_grid(lat, lon):
+    """Moves coordinates to the center of their MERRA-2 cell.
+
+    Args:
+        lat (float or np.array): latitudes
+        lon (float or np.array): longitudes
+
+    Returns:
+        tuple: latitudes and longitudes of the cell centers, floats for scalar inputs
+    """
+    cell_lat = np.round(np.asarray(lat) / MERRA2_LAT_STEP) * MERRA2_LAT_STEP
+    cell_lon = (
+        np.round((np.asarray(lon) + 180) / MERRA2_LON_STEP) * MERRA2_LON_STEP - 180
+    )
+    if cell_lat.ndim == 0:
+        return float(cell_lat), float(cell_lon)
+    return cell_lat, cell_lon
+
+
+@functools.cache
+def village_cell_table(path=VILLAGES_PATH):
+    """Maps every village of the registry to its MERRA-2 cell.
+
+    Args:
+        path (str): TypeScript module exporting the villages
+
+    Returns:
+        dict: arrays of the village_cluster_id and the latitude and longitude of the cell center
+    """
+    villages = read_villages(path)
+    cell_lat, cell_lon = snap_to_grid(villages["latitude"], villages["longitude"])
+    return {
+        "village_cluster_id": villages["village_cluster_id"],
+        "latitude": cell_lat,
+        "longitude": cell_lon,
+    }
+
+
+if __name__ == "__main__":
+    table = village_cell_table()
+    cells = np.unique(np.stack([table["latitude"], table["longitude"]]), axis=1)
+    print(f"{len(table['village_cluster_id'])} villages in {cells.shape[1]} MERRA-2 cells")
@@ -9,12 +9,24 @@ Notes:
 -   Change the parameters at the bottom of the script to suit your needs.
 -   You will notice that many variables are hardcoded. Feel free to expose them as needed.
     However, at this time I do not feel that they are needed and the defaults should suffice for our use case.
-
+-   Whole calendar years are pulled and cached on disk (see model/services/cache.py), any date range
+    within them is sliced locally, so repeated or overlapping requests make no network call.
+-   Set RENEWABLES_NINJA_SNAP_TO_GRID=1 to snap the coordinates to their MERRA-2 cell before pulling,
+    so that all the locations of a cell share their downloads (see model/services/grid.py).
+-   Requests go through the shared session of model/services/client.py (keep-alive, timeouts and
+    retries), PV output and demand can be pulled at the same time on client.executor.
+-   Set RENEWABLES_NINJA_MODE to record or replay to record the responses to fixture files or serve
+    them offline, without token (see model/services/replay.py).
+-   Bulk runs over many locations should queue their requests with model/services/scheduler.py, which
+    respects the hourly quota of the token and fills the response cache.
 
 """
 from datetime import timedelta, datetime
 import os
-import requests
+import numpy as np
+from model.services import client, replay
+from model.services.cache import load_response, response_cache_key, save_response
+from model.services.grid import snap_to_grid
 
 # >> IMPORTANT: get your own token from https://www.renewables.ninja/documentation/api <<
 # and add as an environment variable << ask chat gpt if you don't know how
@@ -23,28 +35,151 @@ API_TOKEN = os.getenv('RENEWABLES_NINJA_API_TOKEN')
 
 BASE_URL = 'https://www.renewables.ninja/api/data'
 
+# coordinates are rounded so that requests a few meters apart share their cached response,
+# far below the resolution of the merra2 dataset
+COORDINATE_DECIMALS = 3
+
+SNAP_TO_GRID = os.getenv("RENEWABLES_NINJA_SNAP_TO_GRID", "0") == "1"
+
+
+def parse_columns(data):
+    """Parses the data of a response into columns.
+
+    Args:
+        data (dict): records of the response, keyed by UTC timestamp in milliseconds (hourly data)
+            or by date (daily data)
+
+    Returns:
+        dict: "time" holds the keys as datetime64, "local_time" as datetime64[m] and the other
+            fields of the records as float arrays
+    """
+    records = list(data.values())
+    keys = list(data)
+    if keys and keys[0].isdigit():
+        time = np.array(keys, dtype=np.int64).astype("datetime64[ms]")
+    else:
+        time = np.array(keys, dtype="datetime64[D]")
+    columns = {"time": time}
+    for field in records[0] if records else ():
+        if field == "local_time":
+            columns[field] = np.array(
+                [r[field] for r in records], dtype="datetime64[m]"
+            )
+        else:
+            columns[field] = np.fromiter(
+                (r[field] for r in records), dtype=float, count=len(records)
+            )
+    return columns
+
+
+def fetch_data(endpoint, params, http_session=None):
+    """Pulls the data of an endpoint, from the response cache if it was already pulled, or from the
+    recorded fixtures in replay mode, which never uses the cache.
+
+    Args:
+        endpoint (str): API endpoint, e.g. pv or demand
+        params (dict): parameters for the API call
+        http_session (requests.Session): session of the request, the shared one of
+            model/services/client.py by default
+
+    Returns:
+        dict: columns of the data of the response, see parse_columns
+    """
+    if replay.RENEWABLES_NINJA_MODE not in replay.RENEWABLES_NINJA_MODES:
+        raise ValueError(
+            f"Unknown RENEWABLES_NINJA_MODE '{replay.RENEWABLES_NINJA_MODE}', expected one of {replay.RENEWABLES_NINJA_MODES}"
+        )
+    # replayed responses are kept out of the cache, so that fixture data is never served in live mode
+    # and every replayed request waits for the latency of the API
+    if replay.RENEWABLES_NINJA_MODE == "replay":
+        return parse_columns(replay.replay(endpoint, params))
+
+    key = response_cache_key(endpoint, params)
+    # recording bypasses the cache so that every request is recorded
+    if replay.RENEWABLES_NINJA_MODE != "record":
+        data = load_response(key)
+        if data is not None:
+            return data
+
+    # Headers for the API call, including the authorization token
+    headers = {"Authorization": f"Token {API_TOKEN}"}
+
+    # Make the GET request to the API
+    response = client.get(
+        f"{BASE_URL}/{endpoint}",
+        params=params,
+        headers=headers,
+        http_session=http_session,
+    )
+
+    # Check if the request was successful
+    if response.status_code == 200:
+        data = response.json()["data"]
+        if replay.RENEWABLES_NINJA_MODE == "record":
+            replay.record(endpoint, params, data)
+        data = parse_columns(data)
+        save_response(key, data)
+        return data
+    else:
+        # Handle errors
+        response.raise_for_status()
+
+
+def year_requests(params, start_date, end_date):
+    """Splits a date range into the requests of its calendar years.
+
+    Args:
+        params (dict): parameters for the API call, without the dates
+        start_date (str): start date in YYYY-MM-DD format
+        end_date (str): end date in YYYY-MM-DD format
+
+    Returns:
+        list: parameters of the request of every year, in order
+    """
+    return [
+        {**params, "date_from": f"{year}-01-01", "date_to": f"{year}-12-31"}
+        for year in range(int(start_date[:4]), int(end_date[:4]) + 1)
+    ]
 
-def get_heating_demand(start_date, end_date, lat, lon):
-    """Pulls daily demand data for a given location + time period.
+
+def fetch_years(endpoint, params, start_date, end_date):
+    """Pulls the calendar years covering a date range, each year is a separate cached request.
 
     Args:
+        endpoint (str): API endpoint, e.g. pv or demand
+        params (dict): parameters for the API call, without the dates
         start_date (str): start date in YYYY-MM-DD format
         end_date (str): end date in YYYY-MM-DD format
+
+    Returns:
+        dict: columns of the data of the years, concatenated in order, see parse_columns
+    """
+    years = [
+        fetch_data(endpoint, year_params)
+        for year_params in year_requests(params, start_date, end_date)
+    ]
+    return {field: np.concatenate([y[field] for y in years]) for field in years[0]}
+
+
+def demand_params(lat, lon, snap=SNAP_TO_GRID):
+    """Parameters of the demand API call of a location, without the dates.
+
+    Args:
         lat (float): latitude
         lon (float): longitude
+        snap (bool): use the center of the MERRA-2 cell of the location
 
     Returns:
-        dict: demand data
+        dict: parameters
     """
-    base_url = f"{BASE_URL}/demand"
+    if snap:
+        lat, lon = snap_to_grid(lat, lon)
 
     # Parameters for the API call
-    params = {
+    return {
         "local_time": "true",
-        "lat": lat,
-        "lon": lon,
-        "date_from": start_date,
-        "date_to": end_date,
+        "lat": round(lat, COORDINATE_DECIMALS),
+        "lon": round(lon, COORDINATE_DECIMALS),
         "dataset": "merra2",
         "heating_threshold": 14,
         "cooling_threshold": 20,
@@ -60,46 +195,26 @@ def get_heating_demand(start_date, end_date, lat, lon):
         "mean": "day",
     }
 
-    # Headers for the API call, including the authorization token
-    headers = {"Authorization": f"Token {API_TOKEN}"}
-
-    # Make the GET request to the API
-    response = requests.get(base_url, params=params, headers=headers)
 
-    # Check if the request was successful
-    if response.status_code == 200:
-        # Return the JSON data
-        data = response.json()["data"]
-        return data
-    else:
-        # Handle errors
-        response.raise_for_status()
-
-def get_pv_output(start_date, end_date, lat, lon):
-    """Pulls hourly PV output for a given location + time period.
+def pv_params(lat, lon, snap=SNAP_TO_GRID):
+    """Parameters of the PV API call of a location, without the dates.
 
     Args:
-        start_date (str): start date in YYYY-MM-DD format
-        end_date (str): end date in YYYY-MM-DD format
         lat (float): latitude
         lon (float): longitude
+        snap (bool): use the center of the MERRA-2 cell of the location
 
     Returns:
-        dict: unit PV output per hour, which assumes capacity of 1
+        dict: parameters
     """
-    base_url = f"{BASE_URL}/pv"
-
-    # add one day to each date without pandas
-    adj_start_date = (datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=-1)).strftime('%Y-%m-%d')
-    adj_end_date = (datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+    if snap:
+        lat, lon = snap_to_grid(lat, lon)
 
     # Parameters for the API call
-    params = {
+    return {
         "local_time": "true",
-        "lat": lat,
-        "lon": lon,
-        "date_from": adj_start_date,
-        "date_to": adj_end_date,
+        "lat": round(lat, COORDINATE_DECIMALS),
+        "lon": round(lon, COORDINATE_DECIMALS),
         "dataset": "merra2",
         "capacity": 1,
         "system_loss": 0.1,
@@ -109,18 +224,63 @@ def get_pv_output(start_date, end_date, lat, lon):
         "format": "json",
     }
 
-    # Headers for the API call, including the authorization token
-    headers = {"Authorization": f"Token {API_TOKEN}"}
 
-    # Make the GET request to the API
-    response = requests.get(base_url, params=params, headers=headers)
+def pv_date_range(start_date, end_date):
+    """Dates of the PV data pulled for a range of local days.
 
-    # Check if the request was successful
-    if response.status_code == 200:
-        data = response.json()["data"]
-        filtered = [(d['local_time'][:10], d['local_time'], d['electricity']) for d in data.values() if start_date <= d['local_time'][:10] <= end_date]
-        # Return the JSON data
-        return [d[2] for d in filtered]
-    else:
-        # Handle errors
-        response.raise_for_status()
\ No newline at end of file
+    Args:
+        start_date (str): start date in YYYY-MM-DD format
+        end_date (str): end date in YYYY-MM-DD format
+
+    Returns:
+        tuple: start and end dates in YYYY-MM-DD format
+    """
+    # the site is ahead of UTC (UTC+6:30), so the first local day starts on the previous UTC day and
+    # the last one ends within the end UTC day: only the start is moved, without pandas, so that a
+    # range ending on Dec 31 does not pull the next year
+    adj_start_date = (datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=-1)).strftime('%Y-%m-%d')
+    return adj_start_date, end_date
+
+
+def get_heating_demand(start_date, end_date, lat, lon, snap=SNAP_TO_GRID):
+    """Pulls daily demand data for a given location + time period.
+
+    Args:
+        start_date (str): start date in YYYY-MM-DD format
+        end_date (str): end date in YYYY-MM-DD format
+        lat (float): latitude
+        lon (float): longitude
+        snap (bool): pull the data of the center of the MERRA-2 cell of the location
+
+    Returns:
+        dict: daily demand columns, "time" holds the dates (datetime64[D]), "total_demand",
+            "heating_demand" and "cooling_demand" the demand
+    """
+    params = demand_params(lat, lon, snap)
+    data = fetch_years("demand", params, start_date, end_date)
+    in_range = (data["time"] >= np.datetime64(start_date)) & (
+        data["time"] <= np.datetime64(end_date)
+    )
+    return {field: column[in_range] for field, column in data.items()}
+
+def get_pv_output(start_date, end_date, lat, lon, snap=SNAP_TO_GRID):
+    """Pulls hourly PV output for a given location + time period.
+
+    Args:
+        start_date (str): start date in YYYY-MM-DD format
+        end_date (str): end date in YYYY-MM-DD format
+        lat (float): latitude
+        lon (float): longitude
+        snap (bool): pull the data of the center of the MERRA-2 cell of the location
+
+    Returns:
+        np.array: unit PV output per hour, which assumes capacity of 1
+    """
+    params = pv_params(lat, lon, snap)
+    adj_start_date, adj_end_date = pv_date_range(start_date, end_date)
+    data = fetch_years("pv", params, adj_start_date, adj_end_date)
+    local_days = data["local_time"].astype("datetime64[D]")
+    in_range = (local_days >= np.datetime64(start_date)) & (
+        local_days <= np.datetime64(end_date)
+    )
+    return data["electricity"][in_range]
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Record/replay stand-in for the renewables.ninja API.
+
+The RENEWABLES_NINJA_MODE environment variable selects where the service modules get their data:
+-   live (default): from the API.
+-   record: from the API, every response is also stored as a fixture file. The response cache is
+    bypassed so that all the requests are recorded.
+-   replay: from the fixture files, without network access nor API token, after waiting
+    RENEWABLES_NINJA_REPLAY_LATENCY seconds to stand in for the round-trip of the API. The response
+    cache is neither read nor written, so every request waits and fixture data never reaches the
+    cache of live runs. A request without fixture raises a FileNotFoundError.
+
+Fixtures are JSON files in RENEWABLES_NINJA_FIXTURES_DIR (model/services/fixtures by default) holding
+the endpoint, parameters and data of a response, named after the request.
+
+Example usage, recording the PV output and demand of a location for the years of a date range:
+    RENEWABLES_NINJA_API_TOKEN=... python -m model.services.replay --lat 21.98 --lon 96.1 \
+        --start-date 2022-01-01 --end-date 2023-12-31
+"""
+import argparse
+import json
+import os
+import time
+
+from model.services.cache import response_cache_key
+from model.services.utilities import write_atomic
+
+RENEWABLES_NINJA_MODES = ("live", "record", "replay")
+RENEWABLES_NINJA_MODE = os.getenv("RENEWABLES_NINJA_MODE", "live")
+RENEWABLES_NINJA_FIXTURES_DIR = os.getenv(
+    "RENEWABLES_NINJA_FIXTURES_DIR", os.path.join(os.path.dirname(__file__), "fixtures")
+)
+RENEWABLES_NINJA_REPLAY_LATENCY = float(
+    os.getenv("RENEWABLES_NINJA_REPLAY_LATENCY", 0)
+)
+
+
+def fixture_path(endpoint, params, fixtures_dir=RENEWABLES_NINJA_FIXTURES_DIR):
+    """Path of the fixture of a request.
+
+    Args:
+        endpoint (str): API endpoint, e.g. pv or demand
+        params (dict): parameters of the API call
+        fixtures_dir (str): directory of the fixtures
+
+    Returns:
+        str: path of the fixture
+    """
+    name = "_".join(
+        str(params.get(p)) for p in ("lat", "lon", "date_from", "date_to")
+    )
+    key = response_cache_key(endpoint, params)[:12]
+    return os.path.join(fixtures_dir, f"{endpoint}_{name}_{key}.json")
+
+
+def record(endpoint, params, data, fixtures_dir=RENEWABLES_NINJA_FIXTURES_DIR):
+    """Stores a response as a fixture.
+
+    Args:
+        endpoint (str): API endpoint, e.g. pv or demand
+        params (dict): parameters of the API call
+        data (dict): data of the response
+        fixtures_dir (str): directory of the fixtures
+    """
+    os.makedirs(fixtures_dir, exist_ok=True)
+    write_atomic(
+        fixture_path(endpoint, params, fixtures_dir),
+        lambda f: json.dump({"endpoint": endpoint, "params": params, "data": data}, f),
+        mode="w",
+    )
+
+
+def replay(
+    endpoint,
+    params,
+    fixtures_dir=RENEWABLES_NINJA_FIXTURES_DIR,
+    latency=RENEWABLES_NINJA_REPLAY_LATENCY,
+):
+    """Serves a recorded response.
+
+    Args:
+        endpoint (str): API endpoint, e.g. pv or demand
+        params (dict): parameters of the API call
+        fixtures_dir (str): directory of the fixtures
+        latency (float): seconds waited before answering
+
+    Returns:
+        dict: data of the response
+    """
+    time.sleep(latency)
+    path = fixture_path(endpoint, params, fixtures_dir)
+    try:
+        with open(path) as f:
+            return json.load(f)["data"]
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"No recorded {endpoint} response for {params} in {fixtures_dir}, record it with RENEWABLES_NINJA_MODE=record"
+        ) from None
+
+
+def main():
+    from model.services import renewable_ninja
+
+    parser = argparse.ArgumentParser(description="Records renewables.ninja fixtures.")
+    parser.add_argument("--lat", type=float, required=True)
+    parser.add_argument("--lon", type=float, required=True)
+    parser.add_argument("--start-date", required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end-date", required=True, help="YYYY-MM-DD")
+    args = parser.parse_args()
+
+    # this module runs as __main__, set the mode of the one imported by the service modules
+    renewable_ninja.replay.RENEWABLES_NINJA_MODE = "record"
+    renewable_ninja.get_pv_output(args.start_date, args.end_date, args.lat, args.lon)
+    renewable_ninja.get_heating_demand(
+        args.start_date, args.end_date, args.lat, args.lon
+    )
+    print(f"fixtures recorded in {renewable_ninja.replay.RENEWABLES_NINJA_FIXTURES_DIR}")
+
+
+if __name__ == "__main__":
+    main()
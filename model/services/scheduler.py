@@ -0,0 +1,307 @@
+"""Rate-limited scheduler of renewables.ninja downloads for bulk runs.
+
+renewables.ninja limits the number of requests per token and hour. The scheduler queues the yearly PV
+and demand requests of many locations, runs them no faster than a token bucket allows and stores the
+responses in the response cache (see model/services/cache.py), so that the simulations of the
+locations afterwards make no network call.
+
+-   Jobs are identified by their cache key, identical requests (e.g. villages of the same MERRA-2 cell
+    with snapping, or overlapping date ranges) are queued once.
+-   Requests already cached are completed without using the quota.
+-   The queue and the state of the bucket are persisted in a SQLite database, a run interrupted at
+    any point resumes where it stopped without exceeding the quota.
+-   The bucket starts empty, so that the first hour sends no more requests than the quota.
+-   A 429 response puts the job back in the queue and empties the bucket, other failures are retried
+    up to max_attempts times. The requests are sent with a session that does not retry 429
+    responses itself, so that every request sent goes through the bucket.
+-   A run refuses to start when the projected size of the responses of the queue exceeds the maximum
+    size of the response cache, as the first downloads would be evicted by the last ones.
+
+Notes:
+-   The quota and the burst size can be set with the RENEWABLES_NINJA_REQUESTS_PER_HOUR and
+    RENEWABLES_NINJA_BURST environment variables, the queue location with
+    RENEWABLES_NINJA_QUEUE_PATH.
+
+Example usage, downloading the weather of every village of the registry for 2022 and 2023:
+    RENEWABLES_NINJA_API_TOKEN=... python -m model.services.scheduler \
+        --start-date 2022-01-01 --end-date 2023-12-31 --snap
+"""
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+import requests
+
+from model.services import client
+from model.services.cache import RENEWABLES_NINJA_CACHE_MAX_BYTES
+from model.services.cache import load_response, response_cache_key
+from model.services.renewable_ninja import SNAP_TO_GRID, demand_params, fetch_data
+from model.services.renewable_ninja import pv_date_range, pv_params, year_requests
+
+RENEWABLES_NINJA_REQUESTS_PER_HOUR = float(
+    os.getenv("RENEWABLES_NINJA_REQUESTS_PER_HOUR", 50)
+)
+RENEWABLES_NINJA_BURST = int(os.getenv("RENEWABLES_NINJA_BURST", 5))
+RENEWABLES_NINJA_QUEUE_PATH = os.getenv(
+    "RENEWABLES_NINJA_QUEUE_PATH",
+    os.path.join(tempfile.gettempdir(), "microgrid-renewables-ninja-queue.sqlite"),
+)
+# size in bytes of the cached response of a year, about 8760 hourly PV records or 365 daily demand
+# records, used to project the size of a queue
+RESPONSE_BYTES = {"pv": 211_000, "demand": 13_000}
+
+
+class TokenBucket:
+    """Token bucket refilled at a constant rate, each request takes a token.
+
+    Args:
+        rate (float): tokens added per second
+        capacity (int): maximum number of tokens, i.e. the largest burst of requests
+        tokens (float): tokens available at updated, empty by default
+        updated (float): time of the last update, now by default
+    """
+
+    def __init__(self, rate, capacity, tokens=None, updated=None):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = 0 if tokens is None else tokens
+        self.updated = time.time() if updated is None else updated
+
+    def refill(self):
+        now = time.time()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self):
+        """Seconds until a token is available"""
+        self.refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def acquire(self):
+        """Waits for a token and takes it"""
+        time.sleep(self.wait_time())
+        self.refill()
+        self.tokens -= 1
+
+    def drain(self, seconds=0):
+        """Empties the bucket, and keeps it empty for some seconds, e.g. after a 429 response"""
+        self.refill()
+        self.tokens = -seconds * self.rate
+
+
+class FetchScheduler:
+    """Persistent queue of renewables.ninja requests run under a rate limit.
+
+    Args:
+        path (str): SQLite database of the queue
+        requests_per_hour (float): quota of the API token
+        burst (int): largest number of requests sent at once
+        max_attempts (int): attempts of a request before it is marked as failed
+    """
+
+    def __init__(
+        self,
+        path=RENEWABLES_NINJA_QUEUE_PATH,
+        requests_per_hour=RENEWABLES_NINJA_REQUESTS_PER_HOUR,
+        burst=RENEWABLES_NINJA_BURST,
+        max_attempts=3,
+    ):
+        self.max_attempts = max_attempts
+        # the bucket handles the 429 responses, the session only retries the server errors
+        self.session = client.create_session(
+            status_forcelist=tuple(s for s in client.HTTP_RETRY_STATUSES if s != 429)
+        )
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    queued REAL NOT NULL
+                )"""
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+        state = self.connection.execute(
+            "SELECT tokens, updated FROM bucket WHERE id = 0"
+        ).fetchone()
+        self.bucket = TokenBucket(requests_per_hour / 3600, burst, *(state or ()))
+
+    def save_bucket(self):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO bucket VALUES (0, ?, ?)",
+                (self.bucket.tokens, self.bucket.updated),
+            )
+
+    def enqueue(self, endpoint, params):
+        """Queues a request, unless the same one is already queued.
+
+        Args:
+            endpoint (str): API endpoint, e.g. pv or demand
+            params (dict): parameters of the API call, with the dates
+
+        Returns:
+            bool: whether the request was added
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO jobs (key, endpoint, params, queued) VALUES (?, ?, ?, ?)",
+                (
+                    response_cache_key(endpoint, params),
+                    endpoint,
+                    json.dumps(params),
+                    time.time(),
+                ),
+            )
+        return cursor.rowcount == 1
+
+    def enqueue_location(self, start_date, end_date, lat, lon, snap=SNAP_TO_GRID):
+        """Queues the PV and demand requests of a location, as pulled by get_pv_output and
+        get_heating_demand.
+
+        Args:
+            start_date (str): start date in YYYY-MM-DD format
+            end_date (str): end date in YYYY-MM-DD format
+            lat (float): latitude
+            lon (float): longitude
+            snap (bool): use the center of the MERRA-2 cell of the location, which lets nearby
+                locations share their requests
+
+        Returns:
+            int: number of requests added
+        """
+        jobs = [
+            ("pv", params)
+            for params in year_requests(
+                pv_params(lat, lon, snap), *pv_date_range(start_date, end_date)
+            )
+        ]
+        jobs += [
+            ("demand", params)
+            for params in year_requests(demand_params(lat, lon, snap), start_date, end_date)
+        ]
+        return sum(self.enqueue(endpoint, params) for endpoint, params in jobs)
+
+    def status(self):
+        """Counts the jobs of each status.
+
+        Returns:
+            dict: number of jobs by status
+        """
+        return dict(
+            self.connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        )
+
+    def projected_bytes(self):
+        """Projects the size in the response cache of the responses of the queue.
+
+        Returns:
+            int: bytes of the pending and done jobs
+        """
+        return sum(
+            RESPONSE_BYTES.get(endpoint, 0) * count
+            for endpoint, count in self.connection.execute(
+                "SELECT endpoint, COUNT(*) FROM jobs WHERE status != 'failed' GROUP BY endpoint"
+            )
+        )
+
+    def next_job(self):
+        return self.connection.execute(
+            "SELECT key, endpoint, params, attempts FROM jobs WHERE status = 'pending' ORDER BY queued LIMIT 1"
+        ).fetchone()
+
+    def complete(self, key, status, attempts, error=None):
+        with self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET status = ?, attempts = ?, error = ?, queued = ? WHERE key = ?",
+                (status, attempts, error, time.time(), key),
+            )
+
+    def run(self, verbose=False, max_bytes=RENEWABLES_NINJA_CACHE_MAX_BYTES):
+        """Runs the pending jobs under the rate limit until the queue is empty.
+
+        Args:
+            verbose (bool): print the progress
+            max_bytes (int): maximum size of the response cache
+
+        Returns:
+            dict: number of jobs by status
+        """
+        projected = self.projected_bytes()
+        if projected > max_bytes:
+            raise ValueError(
+                f"The responses of the queue need about {projected / 2**20:.0f} MiB, above the {max_bytes / 2**20:.0f} MiB of the response cache, "
+                "snap the locations to the grid or raise RENEWABLES_NINJA_CACHE_MAX_BYTES"
+            )
+        while (job := self.next_job()) is not None:
+            key, endpoint, params, attempts = job
+            # requests cached since they were queued do not use the quota
+            if load_response(key) is not None:
+                self.complete(key, "done", attempts)
+                continue
+
+            self.bucket.acquire()
+            self.save_bucket()
+            try:
+                fetch_data(endpoint, json.loads(params), self.session)
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 429:
+                    # the quota is used up, wait for it before trying again
+                    retry_after = e.response.headers.get("Retry-After", "")
+                    self.bucket.drain(
+                        float(retry_after) if retry_after.isdigit() else 0
+                    )
+                    self.save_bucket()
+                    self.complete(key, "pending", attempts)
+                    continue
+                self.fail(key, attempts + 1, e)
+                continue
+            except (requests.RequestException, ValueError) as e:
+                self.fail(key, attempts + 1, e)
+                continue
+            self.complete(key, "done", attempts + 1)
+            if verbose:
+                print(f"{endpoint} {json.loads(params)['date_from'][:4]} done, {self.status()}")
+        return self.status()
+
+    def fail(self, key, attempts, error):
+        status = "failed" if attempts >= self.max_attempts else "pending"
+        self.complete(key, status, attempts, repr(error))
+
+
+def main():
+    from model.villages import read_villages
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--start-date", required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end-date", required=True, help="YYYY-MM-DD")
+    parser.add_argument(
+        "--snap",
+        action="store_true",
+        default=SNAP_TO_GRID,
+        help="share the requests of a MERRA-2 cell, RENEWABLES_NINJA_SNAP_TO_GRID by default",
+    )
+    parser.add_argument("--queue", default=RENEWABLES_NINJA_QUEUE_PATH)
+    args = parser.parse_args()
+
+    scheduler = FetchScheduler(args.queue)
+    villages = read_villages()
+    added = sum(
+        scheduler.enqueue_location(args.start_date, args.end_date, lat, lon, args.snap)
+        for lat, lon in zip(villages["latitude"], villages["longitude"])
+    )
+    print(f"{added} requests added for {len(villages['latitude'])} villages, {scheduler.status()}")
+    print(scheduler.run(verbose=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,54 @@
 from datetime import datetime, timedelta
+import os
+import tempfile
 
 def comparable_date(date: str) -> str:
     date_obj = datetime.strptime(date, "%Y-%m-%d")
     comparable_date_obj = date_obj - timedelta(days=364)
     return comparable_date_obj.strftime("%Y-%m-%d")
+
+
+def write_atomic(path, write, mode="wb"):
+    """Writes a file through a temporary file in the same directory, so that concurrent readers never
+    see a partial file.
+
+    Args:
+        path (str): path of the file
+        write (callable): writes the content to the open temporary file
+        mode (str): mode of the temporary file, "w" to write text
+    """
+    with tempfile.NamedTemporaryFile(
+        mode, dir=os.path.dirname(path) or ".", suffix=".tmp", delete=False
+    ) as f:
+        try:
+            write(f)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    os.replace(f.name, path)
+
+
+def evict_least_recently_used(directory, max_bytes, suffix):
+    """Removes the least recently used files of a cache until it fits in max_bytes, the caches mark a
+    file as used by refreshing its modification time.
+
+    Args:
+        directory (str): directory of the cache
+        max_bytes (int): maximum size of the cache
+        suffix (str): extension of the cached files, the other files are left alone
+    """
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(suffix):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
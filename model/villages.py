@@ -0,0 +1,45 @@
+"""Village registry of the dashboard (app/data/villages.ts).
+
+The registry is shared by the hydro and service models, this module only parses it and imports
+neither of them.
+
+Notes:
+-   The registry is not part of the serverless bundle (see vercel.json), it is meant for batch runs
+    over the whole country.
+"""
+import os
+import re
+
+import numpy as np
+
+VILLAGES_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "app", "data", "villages.ts"
+)
+
+VILLAGE_PATTERN = re.compile(r"\{([^{}]*)\}")
+FIELD_PATTERN = re.compile(r"(\w+):\s*('(?:[^'\\]|\\.)*'|[^,\n]+)")
+
+
+def read_villages(path=VILLAGES_PATH):
+    """Reads the village registry.
+
+    Args:
+        path (str): TypeScript module exporting the villages
+
+    Returns:
+        dict: arrays of the village_cluster_id, name, latitude (Y_deg) and longitude (X_deg)
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    villages = [
+        dict(FIELD_PATTERN.findall(village))
+        for village in VILLAGE_PATTERN.findall(source)
+    ]
+    return {
+        "village_cluster_id": np.array(
+            [float(v["village_cluster_id"]) for v in villages]
+        ).astype(np.int64),
+        "name": np.array([v["name"].strip("'") for v in villages]),
+        "latitude": np.array([float(v["Y_deg"]) for v in villages]),
+        "longitude": np.array([float(v["X_deg"]) for v in villages]),
+    }
@@ -0,0 +1,71 @@
+"""Statistical equivalence of the vectorized BatchUseCase with the reference ramp_slim.UseCase.
+
+The two engines do not share their random draws, so their profiles are compared through their
+statistics over many users and days for fixed seeds: the mean daily energy and the percentiles of
+the load of every hour of the day.
+
+Example usage:
+    python -m pytest tests/test_ramp_batch.py
+"""
+import numpy as np
+import pytest
+
+from model.demand.definitions import appliance_usage
+from model.demand.ramp_batch import BatchUseCase, parse_appliance_specification
+from model.demand.ramp_slim import UseCase, User
+
+NUM_USERS = 50
+NUM_DAYS = 28
+DATE_START = "2023-01-02"
+
+
+def ramp_profiles(seed):
+    users = []
+    for name, definition in appliance_usage.items():
+        user = User(user_name=name, num_users=NUM_USERS)
+        user.add_appliance(name=name, **definition)
+        users.append(user)
+    settlement = UseCase(users=users, date_start=DATE_START, random_seed=seed)
+    settlement.initialize(num_days=NUM_DAYS)
+    return settlement.generate_daily_load_profiles(resolution=60).reshape(NUM_DAYS, 24)
+
+
+def batch_profiles(seed):
+    settlement = BatchUseCase(
+        appliances=[
+            dict(definition, name=name, num_users=NUM_USERS)
+            for name, definition in appliance_usage.items()
+        ],
+        date_start=DATE_START,
+        num_days=NUM_DAYS,
+        random_seed=seed,
+    )
+    return settlement.generate_daily_load_profiles(resolution=60).reshape(NUM_DAYS, 24)
+
+
+@pytest.fixture(scope="module", params=[0, 1])
+def profiles(request):
+    return ramp_profiles(request.param), batch_profiles(request.param)
+
+
+def test_mean_daily_energy(profiles):
+    ramp, batch = profiles
+    assert batch.sum(axis=1).mean() == pytest.approx(ramp.sum(axis=1).mean(), rel=0.02)
+
+
+@pytest.mark.parametrize("percentile", [10, 50, 90])
+def test_percentile_load_curves(profiles, percentile):
+    ramp, batch = profiles
+    ramp_curve = np.percentile(ramp, percentile, axis=0)
+    batch_curve = np.percentile(batch, percentile, axis=0)
+    # hourly deviation relative to the peak of the reference load
+    assert np.abs(batch_curve - ramp_curve).max() < 0.1 * ramp.max()
+
+
+@pytest.mark.parametrize("parameter", ["fixed_cycle", "pref_index"])
+def test_unsupported_appliances_are_rejected(parameter):
+    spec = dict(appliance_usage["lighting"], name="lighting", **{parameter: 1})
+    with pytest.raises(ValueError, match="not supported by the batch engine"):
+        parse_appliance_specification(spec)
+    with pytest.raises(ValueError, match="not supported by the batch engine"):
+        BatchUseCase(appliances=[spec])
@@ -0,0 +1,45 @@
+"""UseCase.generate_daily_load_profiles_parallel against the sequential generation.
+
+Example usage:
+    python -m pytest tests/test_ramp_parallel.py
+"""
+import pytest
+
+from model.demand.ramp_slim import UseCase, User
+
+NUM_DAYS = 10
+DATE_START = "2023-01-02"
+
+
+def meal_usecase():
+    """A user preferring one of two meals a day, each cooked by an appliance with its pref_index"""
+    user = User(user_name="cook", num_users=3, user_preference=2)
+    for pref_index in (1, 2):
+        user.add_appliance(
+            name=f"meal {pref_index}",
+            number=1,
+            power=1000,
+            num_windows=1,
+            func_time=60,
+            func_cycle=60,
+            window_1=[480, 1200],
+            pref_index=pref_index,
+        )
+    user.add_appliance(
+        name="light", number=2, power=10, num_windows=1, func_time=120, window_1=[1080, 1380]
+    )
+    settlement = UseCase(users=[user], date_start=DATE_START, random_seed=0)
+    settlement.initialize(num_days=NUM_DAYS)
+    return settlement
+
+
+@pytest.mark.parametrize("granularity", ["user", "appliance"])
+def test_user_preferences_are_drawn(granularity):
+    sequential = meal_usecase().generate_daily_load_profiles(flat=False)
+    parallel = meal_usecase().generate_daily_load_profiles_parallel(
+        flat=False, granularity=granularity, max_parallel_processes=2
+    )
+    # one meal of about an hour a day for each of the users
+    meals = 3 * NUM_DAYS * 60 * 1000
+    assert sequential.sum() == pytest.approx(parallel.sum(), rel=0.05)
+    assert parallel.sum() >= meals
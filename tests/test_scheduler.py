@@ -0,0 +1,155 @@
+"""Rate limiting, deduplication and retries of the renewables.ninja download scheduler.
+
+The clock of the token bucket is replaced by a fake one whose sleep only advances the time, and the
+requests are answered by a fake session, so that the tests run instantly and offline.
+
+Example usage:
+    python -m pytest tests/test_scheduler.py
+"""
+import functools
+
+import pytest
+import requests
+
+from model.services import cache, renewable_ninja, replay, scheduler
+from model.services.scheduler import FetchScheduler, TokenBucket
+
+PARAMS = {"lat": 21.98, "lon": 96.1, "date_from": "2022-01-01", "date_to": "2022-12-31"}
+DATA = {"1640995200000": {"electricity": 0.5, "local_time": "2022-01-01 06:30"}}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.slept = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return {"data": DATA}
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+class FakeSession:
+    """Answers the requests with the given responses in turn, the last one repeated"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        return self.responses[min(self.calls, len(self.responses)) - 1]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def response_cache(monkeypatch, tmp_path):
+    """Live mode with an empty response cache"""
+    cache_dir = str(tmp_path / "cache")
+    load = functools.partial(cache.load_response, cache_dir=cache_dir)
+    save = functools.partial(cache.save_response, cache_dir=cache_dir)
+    monkeypatch.setattr(replay, "RENEWABLES_NINJA_MODE", "live")
+    monkeypatch.setattr(renewable_ninja, "load_response", load)
+    monkeypatch.setattr(renewable_ninja, "save_response", save)
+    monkeypatch.setattr(scheduler, "load_response", load)
+    return cache_dir
+
+
+def fetch_scheduler(tmp_path, session, **kwargs):
+    fetch = FetchScheduler(
+        str(tmp_path / "queue.sqlite"), requests_per_hour=3600, burst=2, **kwargs
+    )
+    fetch.session = session
+    return fetch
+
+
+def test_duplicate_jobs_are_dropped(tmp_path, clock):
+    fetch = fetch_scheduler(tmp_path, FakeSession())
+    assert fetch.enqueue("pv", PARAMS)
+    assert not fetch.enqueue("pv", dict(reversed(PARAMS.items())))
+    assert fetch.enqueue("demand", PARAMS)
+    added = fetch.enqueue_location("2022-03-01", "2022-03-10", 21.98, 96.1, snap=True)
+    assert added > 0
+    assert fetch.enqueue_location("2022-03-01", "2022-03-10", 21.98, 96.1, snap=True) == 0
+    assert fetch.status() == {"pending": 2 + added}
+
+
+def test_bucket_starts_empty_and_honours_the_burst(clock):
+    bucket = TokenBucket(rate=1, capacity=3)
+    # no request goes out before the first token is earned
+    assert bucket.wait_time() == pytest.approx(1)
+
+    clock.sleep(100)
+    clock.slept = 0
+    # the tokens saved while idle are capped at the burst size
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.slept == 0
+    bucket.acquire()
+    assert clock.slept == pytest.approx(1)
+
+
+def test_rate_limited_job_is_requeued(tmp_path, clock, response_cache):
+    session = FakeSession(FakeResponse(429, {"Retry-After": "120"}), FakeResponse(200))
+    fetch = fetch_scheduler(tmp_path, session)
+    fetch.enqueue("pv", PARAMS)
+
+    assert fetch.run() == {"done": 1}
+    assert session.calls == 2
+    # one second for the first token, then the bucket stays empty for the Retry-After delay
+    assert clock.slept == pytest.approx(1 + 120 + 1)
+    assert fetch.connection.execute("SELECT attempts FROM jobs").fetchone() == (1,)
+    assert cache.load_response(
+        cache.response_cache_key("pv", PARAMS), response_cache
+    ) is not None
+
+
+def test_cached_job_uses_no_token(tmp_path, clock, response_cache):
+    cache.save_response(
+        cache.response_cache_key("pv", PARAMS),
+        renewable_ninja.parse_columns(DATA),
+        response_cache,
+    )
+    session = FakeSession(FakeResponse(200))
+    fetch = fetch_scheduler(tmp_path, session)
+    fetch.enqueue("pv", PARAMS)
+
+    assert fetch.run() == {"done": 1}
+    assert session.calls == 0
+    assert clock.slept == 0
+    assert fetch.bucket.tokens == 0
+
+
+def test_failing_job_is_marked_failed(tmp_path, clock, response_cache):
+    session = FakeSession(FakeResponse(500))
+    fetch = fetch_scheduler(tmp_path, session, max_attempts=3)
+    fetch.enqueue("pv", PARAMS)
+
+    assert fetch.run() == {"failed": 1}
+    assert session.calls == 3
+    attempts, error = fetch.connection.execute(
+        "SELECT attempts, error FROM jobs"
+    ).fetchone()
+    assert attempts == 3
+    assert "500" in error